@@ -0,0 +1,80 @@
+import math
+import os
+from collections import namedtuple
+
+import pandas as pd
+
+# -------------------------------
+# Fire Statistics
+# -------------------------------
+# The statistics of a selection's fires, as returned by TimeIndex.summary
+CellStats = namedtuple('CellStats', ['count', 'alerts', 'total', 'min', 'max', 'mean'])
+
+EMPTY_CELL = CellStats(count=0, alerts=0, total=0, min=math.nan, max=math.nan, mean=math.nan)
+
+SURFACE = 'Surface parcourue (m2)'
+
+# Home and Trends callbacks run in the browser on the client_aggregates() payload
+CLIENTSIDE_CALLBACKS = os.environ.get('CLIENTSIDE_CALLBACKS', '0') == '1'
+
+
+def _cell_stats(df, keys):
+    # Surfaces are float32 in df: accumulate in float64 so totals stay exact
+    surface = df[SURFACE].astype('float64')
+    grouped = surface.groupby(keys, observed=True, sort=True)
+    frame = grouped.agg(['size', 'sum', 'min', 'max', 'mean'])
+    frame['alerts'] = df['Alerte'].groupby(keys, observed=True, sort=True).nunique()
+    return frame
+
+
+# -------------------------------
+# Clientside Payload
+# -------------------------------
+def _number(value):
+    # Surfaces are whole square metres: "405198" is shorter than "405198.0"
+    value = round(float(value), 2)
+    return int(value) if value.is_integer() else value
+
+
+def _periods(year, month, first_year):
+    # (year, month) as months since January of the first year: one short column instead of two
+    return ((year.astype('int64') - first_year) * 12 + month.astype('int64') - 1).tolist()
+
+
+def client_aggregates(df):
+    """Return the compact, columnar aggregates behind every Home and Trends selection.
+
+    ``cells`` holds the fire count and burned surface per (month, commune),
+    commune -1 being the whole department, so the browser sums the cells of
+    any period and communes (the mean surface is total / count); ``repeats``
+    the number of fires sharing an alert with another fire of the same cell,
+    for the few cells that have any (alerts = count - repeats); ``hours`` the
+    department's fire counts per (month, hour). Months are counted from
+    January of ``first_year``. The max and min surfaces do not sum: they stay
+    on the server.
+    """
+    communes = sorted(df['Commune'].unique().astype(str))
+    commune = df['Commune'].astype(str).map({name: i for i, name in enumerate(communes)}).rename('commune')
+    year, month = df['Year'].rename('year'), df['Month'].rename('month')
+    by_commune = _cell_stats(df, [year, month, commune]).reset_index()
+    by_department = _cell_stats(df, [year, month]).reset_index()
+    by_department.insert(2, 'commune', -1)
+    cells = pd.concat([by_department, by_commune], ignore_index=True)
+    hours = df.groupby(['Year', 'Month', 'Hour']).size().reset_index(name='count')
+    first_year = int(df['Year'].min()) if len(df) else 0
+    return {
+        'communes': communes,
+        'first_year': first_year,
+        'cells': {
+            'period': _periods(cells['year'], cells['month'], first_year),
+            'commune': cells['commune'].tolist(),
+            'count': cells['size'].tolist(),
+            'total': [_number(value) for value in cells['sum']],
+        },
+        'repeats': {int(i): int(n) for i, n in (cells['size'] - cells['alerts']).items() if n},
+        'hours': {
+            'period': _periods(hours['Year'], hours['Month'], first_year),
+            'hour': hours['Hour'].tolist(),
+            'count': hours['count'].tolist(),
+        },
+    }
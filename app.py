@@ -1,130 +1,155 @@
+import calendar
+import json
+import math
+import os
+import threading
 import pandas as pd
 import numpy as np
 import dash
-from dash import dcc, html, Input, Output, State
+from dash import dcc, html, ClientsideFunction, Input, Output, State
 import plotly.express as px
-import geopandas as gpd
 import dash_bootstrap_components as dbc
-import unidecode
 import plotly.graph_objects as go
-from flask import send_from_directory
+from flask import Response, jsonify, request
+from aggregates import CLIENTSIDE_CALLBACKS, client_aggregates
+from data_loader import DEFAULT_DEPARTMENT, SNAPSHOT_FORMAT, ensure_snapshot
+from departments import DepartmentStore
+from figure_cache import FigureCache, FIGURE_CACHE_WARMUP, Uncached
+from figure_pool import FigurePool
+from hot_reload import DATA_RELOAD_INTERVAL, SnapshotWatcher, snapshot_lock
+from metrics import init_app as init_metrics, instrument, phase_timer, register_collector, start_profiler
+from payloads import BAR_CHART_MAX_BARS, BUBBLE_CHART_MAX_POINTS, FIGURE_DECIMALS, compact_figure, top_n
+from raster_tiles import RASTER_TILE_DIR, RASTER_TILE_FORMAT, build_raster_tiles, pyramid_ready, render_raster_tile
+from static_assets import StaticAssets
+from time_index import ALL_MONTHS
+from vector_tiles import TileLayer, VectorTileCache, prune_namespaces
 
 # -------------------------------
 # Load Data & Cleaning
 # -------------------------------
-# --- 1. Load CSV Data ---
-try:
-    df1 = pd.read_csv('Classeur1.csv', encoding='ISO-8859-1', delimiter=';', on_bad_lines='skip')
-except UnicodeDecodeError:
-    df1 = pd.read_csv('Classeur1.csv', encoding='latin1', delimiter=';', on_bad_lines='skip')
-
-# Extract the first two digits of 'Code INSEE' from df1 and filter for the Department '13'
-df = df1[df1['Code INSEE'].str[:2] == '13']
- 
-# Clean column names and types
-df.columns = df.columns.str.strip()
-df['Alerte'] = pd.to_datetime(df['Alerte'], errors='coerce')
-df['Code INSEE'] = df['Code INSEE'].astype(str).str.strip()
+# The cleaned CSV and the validated communes reprojected to EPSG:4326 come from
+# the columnar snapshot built by data_loader.py, one partition per department.
+# It is only rebuilt when Classeur1.csv or a shapefile change; at startup only
+# its manifest is read and partitions are memory-mapped on first use. Changes
+# made while the app runs are swapped in by the watcher at the end of this file.
+# Without GUNICORN_PRELOAD every worker runs this at import: the first to take
+# the lock builds or updates the snapshot, and the others, which re-read the
+# manifest once they hold it, find it current.
+with snapshot_lock():
+    manifest = ensure_snapshot()
+departments = DepartmentStore(manifest['departments'])
 
-# Filter CSV by year range (1973–2024) - Here all years took for the entire df
-df = df[(df['Alerte'].dt.year >= 1970) & (df['Alerte'].dt.year <= 2024)]
+# Fires (df) of the default department; its communes are read with the geometry below
+default_department = departments.get(DEFAULT_DEPARTMENT)
+df = default_department.df
 
-# Drop rows with NaN values in any column
-df = df.dropna(how='any')
+# With LAZY_GEOMETRY=1 the server starts without geopandas and the commune
+# outlines: Home and Trends never need them, and they are loaded in the
+# background the first time the Insights or QGIS Mapping page is opened
+LAZY_GEOMETRY = os.environ.get('LAZY_GEOMETRY', '0') == '1'
 
-# Drop columns that contain all NaN values
-df = df.dropna(axis=1, how='all')  
 
-# --- 2. Load Shapefile ---
+def check_communes(department):
+    """Startup checks of a department's communes against its fires."""
+    gdf = department.communes
+    df = department.df
 
-#shapefile_path = "C:/Users/Lutfi/Desktop/Forest Fire Project/Dashboard_Project/shapefile/Commune_BR_13.shp"
-shapefile_path = "shapefile/Commune_BR_13.shp"
-gdf = gpd.read_file(shapefile_path)
-gdf.columns = gdf.columns.str.strip()
-gdf['INSEE_COM'] = gdf['INSEE_COM'].astype(str).str.strip()
-gdf['NOM_DEPT'] = gdf['NOM_DEPT'].astype(str).str.strip()
+    # Check for NaN or missing values
+    missing_commune_gdf = gdf[gdf['INSEE_COM'].isnull() | (gdf['INSEE_COM'] == '')]
+    # print(missing_commune_gdf)
 
-# Check for NaN or missing values
-missing_commune_gdf = gdf[gdf['INSEE_COM'].isnull() | (gdf['INSEE_COM'] == '')]
-# print(missing_commune_gdf)
+    # Check common keys
+    common_insee = set(gdf['INSEE_COM']) & set(df['Code INSEE'])
+    # print(f"Number of common INSEE codes: {len(common_insee)}")
 
-# Ensure Code INSEE exists and clean it
-if 'Code INSEE' not in df.columns:
-    raise ValueError("'Code INSEE' column not found in CSV file.")
+    if len(common_insee) == 0:
+        raise ValueError("No common INSEE codes found between shapefile and CSV!")
 
-df['Code INSEE'] = df['Code INSEE'].astype(str).str.strip()
+    # -------------------------------
+    # Merge Shapefile and CSV
+    # -------------------------------
+    merged = gdf.merge(df, how='left', left_on='INSEE_COM', right_on='Code INSEE')
 
-# Check common keys
-common_insee = set(gdf['INSEE_COM']) & set(df['Code INSEE'])
-# print(f"Number of common INSEE codes: {len(common_insee)}")
+    # print(f"Merged GeoDataFrame has {len(merged)} rows.")
 
-if len(common_insee) == 0:
-    raise ValueError("No common INSEE codes found between shapefile and CSV!")
+    # -------------------------------
+    # Final Validation Output
+    # -------------------------------
+    # Filter the GeoDataFrame by CODE_DEPT == 13 (Bouches-du-Rhône)
+    # merged = merged[merged['CODE_DEPT'] == 13]
 
-# -------------------------------
-# Merge Shapefile and CSV
-# -------------------------------
-merged = gdf.merge(df, how='left', left_on='INSEE_COM', right_on='Code INSEE')
+    # print(merged[['INSEE_COM', 'Code INSEE', 'surf_ha']].head())
 
-# Drop rows with null geometries or missing values in important fields
-# merged = merged.dropna(subset=['surf_ha', 'geometry'])
+    # Fill missing 'Code INSEE' values with values from 'INSEE_COM'
+    merged['Code INSEE'] = merged['Code INSEE'].fillna(merged['INSEE_COM'])
 
-# Ensure 'surf_ha' is numeric
-# merged['surf_ha'] = pd.to_numeric(merged['surf_ha'], errors='coerce')
-# merged = merged.dropna(subset=['surf_ha'])
+    # Replace empty strings in 'Code INSEE' with values from 'INSEE_COM'
+    merged.loc[merged['Code INSEE'] == '', 'Code INSEE'] = merged['INSEE_COM']
 
-# print(f"Merged GeoDataFrame has {len(merged)} rows after dropping null geometries and values.")
+    # Check if 'Code INSEE' contains NaN or empty values after the replacement
+    merged_miss = merged[merged['Code INSEE'].isnull() | (merged['Code INSEE'] == '')]
+    # print(merged_miss)
+    # The merge is only used by the checks above: the callbacks read the department
+    # partitions, so it is dropped on return instead of kept alive in every worker
 
-# -------------------------------
-# Validate Geometries
-# -------------------------------
-invalid_geometries = merged[~merged.is_valid]
-if not invalid_geometries.empty:
-    print(f"Found {len(invalid_geometries)} invalid geometries. These will be ignored.")
-merged = merged[merged.is_valid]
 
-# Ensure no empty geometries
-merged = merged[~merged.geometry.is_empty]
+_geometry_thread = None
+_geometry_thread_lock = threading.Lock()
 
-if merged.empty:
-    raise ValueError("Merged GeoDataFrame is empty after filtering valid geometries!")
 
-# -------------------------------
-# Set CRS and Reproject gdf
-# -------------------------------
-if merged.crs is None:
-    merged = merged.set_crs(epsg=2154)  # Assuming original CRS
-merged = merged.to_crs(epsg=4326)
+def load_geometry():
+    """Read the default department's communes, check them and build the choropleth attributes and DFCI grid."""
+    check_communes(default_department)
+    default_department.commune_attributes  # built on first access
+    default_department.dfci_grid()
 
-# print("CRS reprojected to EPSG:4326.")
 
-# -------------------------------
-# Export to GeoJSON
-# -------------------------------
-#geojson_file_path = "C:/Users/Lutfi/Desktop/Forest Fire Project/Dashboard_Project/geojson/all_communes.geojson"
-geojson_file_path = "geojson/all_communes.geojson"
-merged.to_file(geojson_file_path, driver='GeoJSON')
+def load_geometry_in_background():
+    """Start ``load_geometry`` on a background thread, once per process."""
+    global _geometry_thread
+    with _geometry_thread_lock:
+        if _geometry_thread is None:
+            def run():
+                try:
+                    load_geometry()
+                except Exception as exc:  # the pages load it again on first use and raise there
+                    print(f"Geometry loading failed: {exc!r}")
+
+            _geometry_thread = threading.Thread(target=run, name='geometry-loader', daemon=True)
+            _geometry_thread.start()
+
+
+if not LAZY_GEOMETRY:
+    # As before: communes checked and choropleth attributes built at import, which
+    # a preloading gunicorn master then shares with its workers
+    check_communes(default_department)
+    default_department.commune_attributes
 
-# print(f"GeoJSON successfully created at {geojson_file_path}")
-# print(f"Number of features in GeoJSON: {len(merged)}")
 
 # -------------------------------
-# Final Validation Output
+# Figure Cache
 # -------------------------------
-# Filter the GeoDataFrame by CODE_DEPT == 13 (Bouches-du-Rhône)
-# merged = merged[merged['CODE_DEPT'] == 13]
+# Serialized figures keyed by (page, selection..., department), shared by all workers through
+# the disk. Each key also holds the version of the data its figure reads, so new data
+# never serves stale figures and only misses the figures it actually changes.
+# The namespace holds the payload settings and FIGURE_FORMAT, bumped whenever the
+# callbacks draw their figures differently, so entries of older code are not served
+FIGURE_FORMAT = 2
+figure_cache = FigureCache(namespace=f'snapshot-{SNAPSHOT_FORMAT}-figures-{FIGURE_FORMAT}-bars-{BAR_CHART_MAX_BARS}'
+                                     f'-bubbles-{BUBBLE_CHART_MAX_POINTS}-decimals-{FIGURE_DECIMALS}')
+
+# Threads building the figures of the Insights and Trends callbacks concurrently
+figure_pool = FigurePool()
 
-# print(merged[['INSEE_COM', 'Code INSEE', 'surf_ha']].head())
 
-# Fill missing 'Code INSEE' values with values from 'INSEE_COM'
-merged['Code INSEE'] = merged['Code INSEE'].fillna(merged['INSEE_COM'])
+def period_version(selected_years, *selections):
+    # Figures of a single year are built from that year's fires only, other periods from all of them
+    first_year, last_year = selected_years or (None, None)
+    return departments.version(selections[-1], first_year if first_year == last_year else None)
 
-# Replace empty strings in 'Code INSEE' with values from 'INSEE_COM'
-merged.loc[merged['Code INSEE'] == '', 'Code INSEE'] = merged['INSEE_COM']
 
-# Check if 'Code INSEE' contains NaN or empty values after the replacement
-merged_miss = merged[merged['Code INSEE'].isnull() | (merged['Code INSEE'] == '')]
-# print(merged_miss)
+def department_version(*selections):
+    return departments.version(selections[-1])
 
 
 # -------------------------------
@@ -135,6 +160,30 @@ merged_miss = merged[merged['Code INSEE'].isnull() | (merged['Code INSEE'] == ''
 html_file_directory = r'qgis2web_2024_11_06-12_39_04_012529'
 
 
+# -------------------------------
+# Vector Tiles
+# -------------------------------
+# The QGIS Mapping page draws the communes and the DFCI grid fire counts from
+# /tiles/<layer>/<z>/<x>/<y>.pbf instead of ~900 KB of GeoJSON inlined in scripts.
+# The DFCI cells and their counts come from the department's fires (dfci_grid.py)
+def prune_vector_tiles():
+    # Under the snapshot lock; namespaces are the departments' data versions, as below
+    with snapshot_lock():
+        prune_namespaces(departments.version(code) for code in departments.catalog)
+
+
+def commune_tiles(department):
+    # Versioned by the department's data: new fires change the DFCI counts
+    return VectorTileCache(namespace=departments.version(department.code), layers={
+        'communes': lambda: TileLayer('communes', department.communes),
+        'dfci': lambda: TileLayer('dfci', department.dfci_grid().layer(department.df)[['NOM', 'NUMPOINTS', 'geometry']]),
+    })
+
+
+vector_tiles = commune_tiles(default_department)
+prune_vector_tiles()
+
+
 # ----------------------------------------
 # ✅✅✅ Dash App Initialization ✅✅✅
 # ----------------------------------------
@@ -142,36 +191,257 @@ app = dash.Dash(__name__, external_stylesheets=['/assets/styles.css'], suppress_
 # app.title = "Forest Fire Analytical Dashboard"
 server = app.server
 
+# qgis2web bundle: content-hash ETags (304 on revalidation), gzip / brotli
+# variants computed once at startup, range requests and an in-memory LRU.
+# Under the snapshot lock, so only the first worker hashes and compresses
+html_assets = StaticAssets(html_file_directory)
+with snapshot_lock():
+    html_assets.precompress()
+
+
 @app.server.route('/html/<path:path>')
 def serve_html(path):
-    return send_from_directory(html_file_directory, path)
+    return html_assets.response(path, request)
+
+
+@app.server.route('/figure-cache/stats')
+def serve_figure_cache_stats():
+    return jsonify(figure_cache.stats())
+
+
+# Per-callback latency by phase, response sizes and call counts on /metrics
+init_metrics(app.server)
+register_collector(lambda: [
+    ('figure_cache_events_total', 'counter', "Figure cache lookups and evictions.",
+     [({'event': event}, figure_cache.stats()[event]) for event in ('memory_hits', 'disk_hits', 'misses', 'evictions')]),
+    ('figure_cache_disk_bytes', 'gauge', "Bytes used by the shared figure cache.",
+     [({}, figure_cache.stats()['disk_bytes'])]),
+    ('figure_timeouts_total', 'counter', "Figures replaced by their fallback after FIGURE_TIMEOUT_S.",
+     [({'figure': name}, count) for name, count in figure_pool.timeouts.items()]),
+])
+
+
+# Choropleth geometries, one polygon per commune: served once and referenced by
+# INSEE code, so the Insights callback only ships attribute values. ``level`` is
+# 'full' or one of the simplified outline sets stored in the snapshot
+@app.server.route('/geojson/<department>/communes-<level>.json')
+def serve_commune_geometries(department, level):
+    if department not in departments.catalog:
+        return Response(status=404)
+    try:
+        geometry_json = departments.get(department).geometry_json(level)
+    except KeyError:
+        return Response(status=404)
+    response = Response(geometry_json, mimetype='application/geo+json')
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
+
+
+@app.server.route('/tiles/<layer>/<int:z>/<int:x>/<int:y>.pbf')
+def serve_vector_tile(layer, z, x, y):
+    tile = vector_tiles.tile(layer, z, x, y)
+    if tile is None:
+        return Response(status=404)
+    response = Response(tile, mimetype='application/vnd.mapbox-vector-tile')
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
+
+
+# Climate typology overlay: tiles of the pyramid built in the background at
+# startup (or by `python raster_tiles.py`), cut from the source raster until then
+climate_tiles = StaticAssets(f'{RASTER_TILE_DIR}/climate')
+
+
+def build_climate_tiles():
+    # About a minute on a fresh checkout: one worker builds it under a lock of its own,
+    # since holding the snapshot lock would keep the others from starting
+    def run():
+        try:
+            with snapshot_lock(RASTER_TILE_DIR):
+                build_raster_tiles()
+        except Exception as exc:  # tiles keep being cut from the source raster
+            print(f"Climate tile pyramid build failed: {exc!r}")
+
+    thread = threading.Thread(target=run, name='raster-tiles', daemon=True)
+    thread.start()
+    return thread
+
+
+@app.server.route('/tiles/climate/<int:z>/<int:x>/<int:y>')
+def serve_climate_tile(z, x, y):
+    if pyramid_ready():
+        return climate_tiles.response(f'{z}/{x}/{y}.{RASTER_TILE_FORMAT}', request)
+    payload = render_raster_tile(z, x, y)
+    if payload is None:
+        return Response(status=404)
+    response = Response(payload, mimetype=f'image/{RASTER_TILE_FORMAT}')
+    response.cache_control.no_cache = True  # replaced by the pyramid's tile once it is built
+    return response
+
+
+# One point per commune for the map's feature search, which needs them all at once
+@app.server.route('/tiles/communes/search.json')
+def serve_commune_search():
+    gdf = default_department.communes
+    points = gdf[['ID_GEOFLA', 'NOM_COM', 'geometry']].assign(geometry=gdf.representative_point())
+    return Response(points.to_json(drop_id=True), mimetype='application/geo+json')
+
+
+# DFCI cells of a selection with their live fire counts, for the map and for exports:
+# /dfci/cells.json?year=2023&commune=Arles&department=13
+@figure_cache.memoize('dfci-cells', version=department_version)
+def dfci_cells(selected_year, selected_commune, selected_department=DEFAULT_DEPARTMENT):
+    department = departments.get(selected_department)
+    rows = department.selection(selected_year, selected_commune)
+    insee_codes = None
+    if selected_commune:
+        # The commune's empty cells are part of the selection too
+        insee_codes = department.df.loc[department.df['Commune'] == selected_commune, 'Code INSEE'].astype(str).unique()
+    return json.loads(department.dfci_grid().layer(rows, insee_codes).to_json(drop_id=True))
+
+
+@app.server.route('/dfci/cells.json')
+def serve_dfci_cells():
+    year = request.args.get('year', type=int)
+    commune = request.args.get('commune') or None
+    department = request.args.get('department') or DEFAULT_DEPARTMENT
+    if department not in departments.catalog:
+        return Response(status=404)
+    response = jsonify(dfci_cells(year, commune, department))
+    response.mimetype = 'application/geo+json'
+    return response
+
+
+def range_argument(name, low, high):
+    # "2015-2024" -> (2015, 2024), None when absent; ValueError outside [low, high]
+    value = request.args.get(name)
+    if not value:
+        return None
+    first, last = (int(part) for part in value.split('-', 1))
+    if not low <= first <= last <= high:
+        raise ValueError(f"{name}={value!r}")
+    return first, last
+
+
+# Kernel density overlay of the Hotspots page, rendered once per period by each worker:
+# /hotspots/13.png?years=2015-2024&months=6-9&v=<data version>
+@app.server.route('/hotspots/<department>.png')
+def serve_hotspot_overlay(department):
+    if department not in departments.catalog:
+        return Response(status=404)
+    try:
+        years = range_argument('years', 0, 9999)
+        months = range_argument('months', 1, 12)
+    except ValueError:
+        return Response(status=400)
+    png, _ = departments.get(department).hotspot_grid().image(years, months)
+    response = Response(png, mimetype='image/png')
+    # The URL names the data version, so a reload never serves an older overlay
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    return response
+
+
+def aggregate_callback(function_name, outputs, inputs):
+    """Register a Home / Trends callback on the server, or in the browser with CLIENTSIDE_CALLBACKS=1.
+
+    Clientside, ``window.dash_clientside.fires[function_name]`` (assets/clientside.js)
+    gets the aggregates held by 'aggregate-store' as an extra last argument.
+    The Python function is kept either way, for the warmup and the benchmarks.
+    """
+    if not CLIENTSIDE_CALLBACKS:
+        return app.callback(outputs, inputs)
+    app.clientside_callback(ClientsideFunction('fires', function_name), outputs,
+                            inputs + [Input('aggregate-store', 'data')])
+    return lambda callback: callback
 
 
 # --------------------------------
 #  Dash App Sidebar
 # ---------------------------------
 # --- Sidebar Components ---
+MONTH_MARKS = {1: 'Jan', 4: 'Apr', 7: 'Jul', 10: 'Oct', 12: 'Dec'}
+
+
+def year_marks(first_year, last_year):
+    # A mark every ten years from the first one, and the last year
+    marks = {year: str(year) for year in range(first_year, last_year - 4, 10)}
+    return {**marks, last_year: str(last_year)}
+
+
+def department_title(code):
+    return f"{departments.name(code).title()} Department of France"
+
+
+def about_text(code):
+    first_year, last_year = departments.get(code).year_range()
+    return (f"This dashboard visualizes forest fire data in the {departments.name(code).title()} "
+            f"department from {first_year} to {last_year}.")
+
+
 sidebar = html.Div([
     html.H1("Forest Fire Analytical Dashboard", className='sidebar-title'),
+    html.Label("Select Department", className='sidebar-label'),
+    dcc.Dropdown(
+        id='department-dropdown',
+        options=departments.options(),
+        value=DEFAULT_DEPARTMENT,
+        clearable=False,
+        className='dropdown'
+    ),
     html.Label("Select Year", className='sidebar-label'),
     dcc.Dropdown(
         id='year-dropdown',
-        options=[{'label': str(year), 'value': year} for year in df['Alerte'].dt.year.dropna().unique()],
+        options=default_department.year_options(),
         placeholder="Select a Year",
         className='dropdown'
     ),
     html.Label("Select Commune", className='sidebar-label'),
     dcc.Dropdown(
         id='commune-dropdown',
-        options=[{'label': commune, 'value': commune} for commune in df['Commune'].unique()],
+        options=default_department.commune_options(),
         placeholder="Select a Commune",
         className='dropdown'
     ),
+    # Home and Trends read the period and communes below, set from the dropdowns above
+    # and narrowed with them (e.g. June to September of 2015-2024, or several communes)
+    html.Label("Select Period", className='sidebar-label'),
+    dcc.RangeSlider(
+        id='year-range',
+        min=default_department.year_range()[0],
+        max=default_department.year_range()[1],
+        step=1,
+        value=list(default_department.year_range()),
+        marks=year_marks(*default_department.year_range()),
+        tooltip={'placement': 'bottom'},
+        className='range-slider'
+    ),
+    dcc.RangeSlider(
+        id='month-range',
+        min=1,
+        max=12,
+        step=1,
+        value=[1, 12],
+        marks=MONTH_MARKS,
+        className='range-slider'
+    ),
+    html.Label("Compare Communes", className='sidebar-label'),
+    dcc.Dropdown(
+        id='communes-dropdown',
+        options=default_department.commune_options(),
+        value=[],
+        multi=True,
+        placeholder="Select Communes",
+        className='dropdown'
+    ),
     html.Hr(className='sidebar-divider'),
     dbc.Nav([
         dbc.NavLink("🏠 Home", href='/', active='exact', className='nav-link'),
         dbc.NavLink("📊 Insights", href='/insights', active='exact', className='nav-link'),
         dbc.NavLink("📈 Temporal Trends", href='/trends', active='exact', className='nav-link'),
+        dbc.NavLink("🔥 Hotspots", href='/hotspots', active='exact', className='nav-link'),
         # dbc.NavLink("🗺️ QGIS Mapping", href='/QGIS Mapping', active='exact', className='nav-link'),
 
         dbc.NavLink("🗺️ QGIS Mapping", href='/qgis_mapping', active='exact', className='nav-link')
@@ -193,7 +463,7 @@ toggle_button = html.Button(
 # --- Hidden Sidebar ---
 hidden_sidebar = html.Div([
     html.H3("🔑 Key Information", className='hidden-sidebar-title'),
-    html.P("This dashboard visualizes forest fire data in the Bouches-du-Rhône region from 2018 to 2024."),
+    html.P(about_text(DEFAULT_DEPARTMENT), id='about-text'),
     html.P("Key insights include total fires, affected area, and time-based trends."),
     html.P("This dashboard is part of the final project for the Geovisualization course held at the University of Aix-Marseille."),
     html.P("The project aims to showcase the use of data visualization techniques in analyzing and understanding forest fire activity."),
@@ -209,7 +479,7 @@ home_layout = html.Div([
     sidebar,
     html.Div([ 
         html.Div( 
-            html.H1("Bouches-du-Rhône Department of France", className='title-text'),
+            html.H1(department_title(DEFAULT_DEPARTMENT), id='department-title', className='title-text'),
             className='title-container'
         ),
         html.Div([  
@@ -242,54 +512,89 @@ home_layout = html.Div([
 
 
 # --- Callbacks for updating data summaries and bar chart ---
-@app.callback(
+@aggregate_callback(
+    'update_data_summaries',
     [Output('max-fires', 'children'),
      Output('total-area', 'children'),
-     Output('avg-area', 'children'),
-     Output('max-area', 'children'),
-     Output('min-area', 'children')],
+     Output('avg-area', 'children')],
      
-    [Input('year-dropdown', 'value'),
-     Input('commune-dropdown', 'value')]
+    [Input('year-range', 'value'),
+     Input('month-range', 'value'),
+     Input('communes-dropdown', 'value'),
+     Input('department-dropdown', 'value')]
 )
-def update_data_summaries(selected_year, selected_commune):
-    filtered_df = df
-    if selected_year:
-        filtered_df = filtered_df[filtered_df['Alerte'].dt.year == selected_year]
-    if selected_commune:
-        filtered_df = filtered_df[filtered_df['Commune'] == selected_commune]
-
-    max_fires = filtered_df['Alerte'].nunique()
-    total_area = filtered_df['Surface parcourue (m2)'].sum() / 10000
-    avg_area = filtered_df['Surface parcourue (m2)'].mean() / 10000
+@instrument('update_data_summaries')
+def update_data_summaries(selected_years, selected_months, selected_communes, selected_department=DEFAULT_DEPARTMENT):
+    lap = phase_timer()
+    # Running totals of the time index: a few lookups per commune, whatever the period
+    stats = departments.get(selected_department).time_index.summary(selected_years, selected_months, selected_communes)
+    lap('aggregate')
+
+    max_fires = stats.alerts
+    total_area = stats.total / 10000
+    # No fires, no mean: an empty card, as in assets/clientside.js
+    avg_area = stats.mean / 10000 if stats.count else None
     # Format the values to 2 decimal places
     total_area = round(total_area, 2)
-    avg_area = round(avg_area, 2)
-    max_area = filtered_df['Surface parcourue (m2)'].max()
-    min_area = filtered_df['Surface parcourue (m2)'].min()
+    if avg_area is not None:
+        avg_area = round(avg_area, 2)
 
-    return max_fires, total_area, avg_area, max_area, min_area
+    return max_fires, total_area, avg_area
 
 
+# The extremes do not sum over the clientside aggregates: always answered by the server
 @app.callback(
+    [Output('max-area', 'children'),
+     Output('min-area', 'children')],
+    [Input('year-range', 'value'),
+     Input('month-range', 'value'),
+     Input('communes-dropdown', 'value'),
+     Input('department-dropdown', 'value')]
+)
+@instrument('update_area_extremes')
+def update_area_extremes(selected_years, selected_months, selected_communes, selected_department=DEFAULT_DEPARTMENT):
+    lap = phase_timer()
+    stats = departments.get(selected_department).time_index.summary(selected_years, selected_months, selected_communes)
+    lap('aggregate')
+    if not stats.count:
+        return None, None
+    return stats.max, stats.min
+
+
+# Shown on the bar chart of a selection without fires (also in assets/clientside.js)
+NO_FIRES_TEXT = "No fires in this selection"
+
+
+@aggregate_callback(
+    'update_bar_chart',
     Output('bar-chart', 'figure'),
-    [Input('year-dropdown', 'value'),
-     Input('commune-dropdown', 'value')]
+    [Input('year-range', 'value'),
+     Input('month-range', 'value'),
+     Input('communes-dropdown', 'value'),
+     Input('department-dropdown', 'value')]
 )
-def update_bar_chart(selected_year, selected_commune):
-    filtered_df = df
-    if selected_year:
-        filtered_df = filtered_df[filtered_df['Alerte'].dt.year == selected_year]
-    if selected_commune:
-        filtered_df = filtered_df[filtered_df['Commune'] == selected_commune]
-
-    area_by_commune = filtered_df.groupby('Commune')['Surface parcourue (m2)'].sum() / 10000
-    fig = px.bar(area_by_commune, 
-             x=area_by_commune.index,
-             y=area_by_commune.values,
-             color=area_by_commune.values,  
-             color_continuous_scale='Viridis',
-             title='Total Area Burned by Commune')
+@instrument('update_bar_chart')
+@figure_cache.memoize('home', version=period_version)
+def update_bar_chart(selected_years, selected_months, selected_communes, selected_department=DEFAULT_DEPARTMENT):
+    lap = phase_timer()
+    department = departments.get(selected_department)
+    area_by_commune = department.time_index.area_by_commune(selected_years, selected_months, selected_communes) / 10000
+    # At most BAR_CHART_MAX_BARS bars: the communes that burned least are summed into "Other"
+    area_by_commune, others = top_n(area_by_commune, BAR_CHART_MAX_BARS)
+    if len(others):
+        area_by_commune = pd.concat([area_by_commune, pd.Series({f'Other ({len(others)} communes)': others.sum()})])
+    lap('aggregate')
+    if area_by_commune.empty:
+        # px.bar cannot draw an empty Series: the same chart without bars, as the clientside callback draws it
+        fig = go.Figure(go.Bar(x=[], y=[]), layout={'title': 'Total Area Burned by Commune'})
+        fig.add_annotation(text=NO_FIRES_TEXT, showarrow=False, font={'size': 14})
+    else:
+        fig = px.bar(area_by_commune, 
+                 x=area_by_commune.index,
+                 y=area_by_commune.values,
+                 color=area_by_commune.values,  
+                 color_continuous_scale='Viridis',
+                 title='Total Area Burned by Commune')
     
     # --- Update layout for the chart ---
     fig.update_layout(
@@ -305,6 +610,8 @@ def update_bar_chart(selected_year, selected_commune):
 
     # Now using chart in dcc.Graph component
     # dcc.Graph(id='bar-chart', figure=fig, className='bar-chart')  # Matches CSS)
+    compact_figure(fig)
+    lap('figure')
     return fig
 
 
@@ -341,79 +648,34 @@ insights_layout = html.Div(
 )
 
 # --- callbacks ---
-@app.callback(
-    [Output('pie-chart', 'figure'),
-     Output('bubble-chart', 'figure'),
-     Output('choropleth-map', 'figure')],
-    [Input('year-dropdown', 'value'),
-     Input('commune-dropdown', 'value')]
-)
-def update_insights(selected_year, selected_commune):
-    filtered_df = df
-    
-    # Filter based on the year if a year is selected
-    if selected_year:
-        filtered_df = filtered_df[filtered_df['Alerte'].dt.year == selected_year]
-    
-    # Filter based on the commune if a commune is selected
-    if selected_commune:
-        filtered_df = filtered_df[filtered_df['Commune'] == selected_commune]
-    
-    # Check filtered dataframe shape
-    # print(f"Filtered DataFrame shape: {filtered_df.shape}")
-    
-    # --- Pie Chart ---
-    fire_origin_distribution = filtered_df['Origine de l\'alerte'].value_counts().reset_index()
-    fire_origin_distribution.columns = ['Origin', 'Count']
-    pie_fig = px.pie(fire_origin_distribution, names='Origin', values='Count', title="Fire Origin Distribution", hole=0.5)
-    pie_fig.update_layout(
-        template='plotly_dark',
-        margin={'t': 50, 'b': 50, 'l': 0, 'r': 50},
-        autosize=True
-    )
-    
-    # --- Bubble Chart ---
-    dfci_fire_distribution = filtered_df['Code du carreau DFCI'].value_counts().reset_index()
-    dfci_fire_distribution.columns = ['DFCI_Code', 'Fire_Count']
-    dfci_fire_distribution['Impact'] = dfci_fire_distribution['Fire_Count'] * 10
-    bubble_fig = px.scatter(dfci_fire_distribution, x='DFCI_Code', 
-                            y='Fire_Count', 
-                            size='Impact', color='Fire_Count', 
-                            title="Fire Occurrences by DFCI Code", size_max=20)
-    bubble_fig.update_layout(
-        template='plotly_dark',
-        margin={'t': 50, 'b': 50, 'l': 0, 'r': 50},
-        autosize=True
-    )
-    
-    # --- Choropleth Map ---
-    filtered_gdf = merged.copy()
+# The choropleth only depends on the commune selection: cached on its own, it is
+# shared by every year and stored even when it finished after FIGURE_TIMEOUT_S
+@figure_cache.memoize('choropleth', version=department_version)
+def insights_choropleth(selected_commune, selected_department=DEFAULT_DEPARTMENT):
+    lap = phase_timer()
+    department = departments.get(selected_department)
+    filtered_communes = department.commune_attributes
 
     # Apply the commune filter if selected
     if selected_commune:
-        filtered_gdf = filtered_gdf[filtered_gdf['Commune'] == selected_commune]
-
-    # Check filtered GeoDataFrame shape
-    # print(f"Filtered GeoDataFrame shape: {filtered_gdf.shape}")
-
-    # Calculating Population Density (Pop Density: population/area)
-    filtered_gdf['Population Intensity'] = filtered_gdf['POPULATION'] / filtered_gdf['SUPERFICIE']
-
-    # Apply logarithmic transformation to the Population Intensity for better visualization
-    filtered_gdf['Density'] = np.log1p(filtered_gdf['Population Intensity'])
+        filtered_communes = filtered_communes[filtered_communes['Commune'] == selected_commune]
+    # Full outlines when one commune fills the map, simplified ones for the whole department
+    geometry_level = department.geometry_level(selected_commune)
+    lap('filter')
 
     # Create the choropleth map with logarithmic scaling for better visual differentiation
     choropleth_fig = px.choropleth(
-        filtered_gdf,
+        filtered_communes,
         template='plotly_dark',
-        geojson=filtered_gdf.geometry.__geo_interface__,
-        locations=filtered_gdf.index,
+        geojson=f'/geojson/{department.code}/communes-{geometry_level}.json',
+        featureidkey='properties.INSEE_COM',
+        locations='INSEE_COM',
         color='Density',
         hover_name='Commune',
         hover_data=['SUPERFICIE', 'Surface parcourue (m2)', 'POPULATION', 'Population Intensity'],
         color_continuous_scale='Viridis',
-        range_color=[filtered_gdf['Density'].min(), filtered_gdf['Density'].max()],
-        title="Bouches-du-Rhône Communes & Population Intensity"
+        range_color=[filtered_communes['Density'].min(), filtered_communes['Density'].max()],
+        title=f"{department.name.title()} Communes & Population Intensity"
     )
 
     choropleth_fig.update_geos(
@@ -429,9 +691,109 @@ def update_insights(selected_year, selected_commune):
         autosize=True,
         margin={"t": 50, "b": 20, "l": 20, "r": 20}
     )
+    compact_figure(choropleth_fig)
+
+    lap('figure')
+    return choropleth_fig
+
+
+# Sent instead of the choropleth when it takes longer than FIGURE_TIMEOUT_S
+choropleth_placeholder = go.Figure(layout=dict(
+    template='plotly_dark',
+    xaxis={'visible': False},
+    yaxis={'visible': False},
+    annotations=[{'text': "The map is still being drawn: it will show on your next selection.",
+                  'showarrow': False, 'font': {'size': 14}}],
+))
+
+
+@app.callback(
+    [Output('pie-chart', 'figure'),
+     Output('bubble-chart', 'figure'),
+     Output('choropleth-map', 'figure')],
+    [Input('year-dropdown', 'value'),
+     Input('commune-dropdown', 'value'),
+     Input('department-dropdown', 'value')]
+)
+@instrument('update_insights')
+@figure_cache.memoize('insights', version=department_version)
+def update_insights(selected_year, selected_commune, selected_department=DEFAULT_DEPARTMENT):
+    lap = phase_timer()
+    department = departments.get(selected_department)
+    # Rows of the selected year and/or commune, shared with the other callbacks of this selection
+    filtered_df = department.selection(selected_year, selected_commune)
+    
+    # Check filtered dataframe shape
+    # print(f"Filtered DataFrame shape: {filtered_df.shape}")
+    lap('filter')
+    
+    # --- Pie Chart ---
+    def pie():
+        lap = phase_timer()
+        # value_counts on a categorical also lists the categories absent from the selection
+        fire_origin_distribution = filtered_df['Origine de l\'alerte'].value_counts().loc[lambda counts: counts > 0].reset_index()
+        fire_origin_distribution.columns = ['Origin', 'Count']
+        fire_origin_distribution['Origin'] = fire_origin_distribution['Origin'].astype(str)
+        lap('aggregate')
+        pie_fig = px.pie(fire_origin_distribution, names='Origin', values='Count', title="Fire Origin Distribution", hole=0.5)
+        pie_fig.update_layout(
+            template='plotly_dark',
+            margin={'t': 50, 'b': 50, 'l': 0, 'r': 50},
+            autosize=True
+        )
+        lap('figure')
+        return pie_fig
+    
+    # --- Bubble Chart ---
+    def bubble():
+        lap = phase_timer()
+        # Fires per DFCI cell, summed over the department's grid (dfci_grid.py)
+        grid = department.dfci_grid()
+        fire_counts, burned_surfaces = grid.aggregate(filtered_df)
+        with_fires = fire_counts > 0
+        dfci_fire_distribution = pd.DataFrame({
+            'DFCI_Code': grid.cells['NOM'].to_numpy()[with_fires],
+            'Fire_Count': fire_counts[with_fires],
+            'Commune': grid.cells['COMMUNE'].to_numpy()[with_fires],
+            'Surface (ha)': np.round(burned_surfaces[with_fires] / 10000, 2),
+        }).sort_values('Fire_Count', ascending=False, kind='stable')
+        dfci_fire_distribution['Impact'] = dfci_fire_distribution['Fire_Count'] * 10
+        # At most BUBBLE_CHART_MAX_POINTS bubbles: the other cells are summed in a note,
+        # since a single "Other" bubble would flatten the scale of the others
+        dfci_fire_distribution, others = top_n(dfci_fire_distribution, BUBBLE_CHART_MAX_POINTS, by='Fire_Count')
+        lap('aggregate')
+        bubble_fig = px.scatter(dfci_fire_distribution, x='DFCI_Code', 
+                                y='Fire_Count', 
+                                size='Impact', color='Fire_Count', 
+                                hover_data=['Commune', 'Surface (ha)'],
+                                title="Fire Occurrences by DFCI Code", size_max=20)
+        bubble_fig.update_layout(
+            template='plotly_dark',
+            margin={'t': 50, 'b': 50, 'l': 0, 'r': 50},
+            autosize=True
+        )
+        if len(others):
+            bubble_fig.add_annotation(
+                text=f"Other {len(others):,} cells: {others['Fire_Count'].sum():,} fires, "
+                     f"{others['Surface (ha)'].sum():,.2f} ha",
+                xref='paper', yref='paper', x=1, y=1.08, showarrow=False, font={'size': 10},
+            )
+        compact_figure(bubble_fig)
+        lap('figure')
+        return bubble_fig
+    
+    # --- Choropleth Map ---
+    # Built concurrently on the figure pool; a slow choropleth gives way to a placeholder
+    figures, degraded = figure_pool.build(
+        {'pie': pie, 'bubble': bubble,
+         'choropleth': lambda: insights_choropleth(selected_commune, department.code)},
+        fallbacks={'choropleth': choropleth_placeholder},
+    )
 
     # Return the updated figures (pie, bubble, and choropleth)
-    return pie_fig, bubble_fig, choropleth_fig
+    outputs = figures['pie'], figures['bubble'], figures['choropleth']
+    # Not cached with the placeholder: the next request picks up the finished choropleth
+    return Uncached(outputs) if degraded else outputs
 
 
 # 3. --- Trends Layout ---
@@ -465,102 +827,135 @@ trends_layout = html.Div(
 )
 
 # --- Callback for Trends ---
-@app.callback(
+@aggregate_callback(
+    'update_trends',
     [
         Output("monthly-trends-graph", "figure"),
         Output("hourly-trends-graph", "figure"),
         Output("yearly-trends-graph", "figure"),
     ],
-    [Input("year-dropdown", "value")],
+    [Input("year-range", "value"),
+     Input("month-range", "value"),
+     Input("department-dropdown", "value")],
 )
-def update_trends(selected_year):
-    # Filter data by selected year
-    filtered_df = df.copy()
-    if selected_year:
-        filtered_df = filtered_df[filtered_df["Alerte"].dt.year == selected_year]
-
-    # Group by Month
-    monthly_trend = (
-        filtered_df.groupby(filtered_df["Alerte"].dt.to_period("M"))
-        .size()
-        .reset_index(name="Fire Count")
-    )
-    monthly_trend["Alerte"] = monthly_trend["Alerte"].dt.strftime("%Y-%m")
-
-    # Group by Hour
-    hourly_trend = (
-        filtered_df.groupby(filtered_df["Alerte"].dt.hour)
-        .size()
-        .reset_index(name="Fire Count")
-    )
-    hourly_trend["Hour"] = hourly_trend["Alerte"]
-
-    # Group by Year
-    yearly_trend = (
-        filtered_df.groupby(filtered_df["Alerte"].dt.year)
-        .size()
-        .reset_index(name="Fire Count")
-    )
+@instrument('update_trends')
+@figure_cache.memoize('trends', version=period_version)
+def update_trends(selected_years, selected_months, selected_department=DEFAULT_DEPARTMENT):
+    # Fire counts of the whole department over the selected period, from the running
+    # totals of the time index instead of groupbys of its rows
+    time_index = departments.get(selected_department).time_index
 
     # --- Monthly Trend Plot ---
-    monthly_fig = px.line(
-        monthly_trend,
-        x="Alerte",
-        y="Fire Count",
-        title="Monthly Fire Alerts",
-    )
-    monthly_fig.update_layout(
-        template="plotly_dark",
-        xaxis_title="Month",
-        yaxis_title="Fire Count",
-        margin={"t": 50, "b": 50, "l": 50, "r": 50},
-        showlegend=False,
-    )
+    def monthly():
+        lap = phase_timer()
+        # Count by Month
+        monthly_trend = time_index.monthly(selected_years, selected_months).reset_index(name="Fire Count")
+        monthly_trend["Alerte"] = monthly_trend["Year"].astype(str) + "-" + monthly_trend["Month"].map("{:02d}".format)
+        lap('aggregate')
+
+        monthly_fig = px.line(
+            monthly_trend,
+            x="Alerte",
+            y="Fire Count",
+            title="Monthly Fire Alerts",
+        )
+        monthly_fig.update_layout(
+            template="plotly_dark",
+            xaxis_title="Month",
+            yaxis_title="Fire Count",
+            margin={"t": 50, "b": 50, "l": 50, "r": 50},
+            showlegend=False,
+        )
+        lap('figure')
+        return monthly_fig
 
     # --- Hourly Trend Plot ---
-    hourly_fig = px.bar(
-        hourly_trend,
-        x="Hour",
-        y="Fire Count",
-        title="Hourly Fire Alerts",
-        color="Fire Count",
-        color_discrete_sequence=px.colors.qualitative.Plotly,
-    )
-    hourly_fig.update_layout(
-        template="plotly_dark",
-        xaxis_title="Hour of the Day",
-        yaxis_title="Number of Fire Alerts",
-        margin={"t": 40, "b": 40, "l": 40, "r": 40},
-        height=210,
-        font=dict(size=10),
-        bargap=0.1,
-        coloraxis_showscale=False,
-        showlegend=False,
-    )
-    hourly_fig.update_xaxes(tickangle=0, tickfont=dict(size=8), automargin=True)
-    hourly_fig.update_yaxes(tickfont=dict(size=8), automargin=True)
-    hourly_fig.update_traces(marker=dict(line=dict(width=0.5)))
+    def hourly():
+        lap = phase_timer()
+        # Count by Hour
+        hourly_trend = time_index.hourly(selected_years, selected_months).reset_index(name="Fire Count")
+        lap('aggregate')
+
+        hourly_fig = px.bar(
+            hourly_trend,
+            x="Hour",
+            y="Fire Count",
+            title="Hourly Fire Alerts",
+            color="Fire Count",
+            color_discrete_sequence=px.colors.qualitative.Plotly,
+        )
+        hourly_fig.update_layout(
+            template="plotly_dark",
+            xaxis_title="Hour of the Day",
+            yaxis_title="Number of Fire Alerts",
+            margin={"t": 40, "b": 40, "l": 40, "r": 40},
+            height=210,
+            font=dict(size=10),
+            bargap=0.1,
+            coloraxis_showscale=False,
+            showlegend=False,
+        )
+        hourly_fig.update_xaxes(tickangle=0, tickfont=dict(size=8), automargin=True)
+        hourly_fig.update_yaxes(tickfont=dict(size=8), automargin=True)
+        hourly_fig.update_traces(marker=dict(line=dict(width=0.5)))
+        lap('figure')
+        return hourly_fig
 
     # --- Yearly Trend Plot ---
-    yearly_fig = px.bar(
-        yearly_trend,
-        x="Fire Count",
-        y="Alerte",
-        orientation="h",
-        title="Yearly Fire Alerts",
-        color="Fire Count",
-        color_continuous_scale="Cividis",
-    )
-    yearly_fig.update_layout(
-        template="plotly_dark",
-        xaxis_title="Fire Count",
-        yaxis_title="Year",
-        margin={"t": 50, "b": 50, "l": 50, "r": 50},
-        coloraxis_showscale=False,
-    )
-    yearly_fig.update_traces(showlegend=False)
-
-    return monthly_fig, hourly_fig, yearly_fig
+    def yearly():
+        lap = phase_timer()
+        # Count by Year
+        yearly_trend = time_index.yearly(selected_years, selected_months).reset_index(name="Fire Count")
+        lap('aggregate')
+
+        yearly_fig = px.bar(
+            yearly_trend,
+            x="Fire Count",
+            y="Year",
+            orientation="h",
+            title="Yearly Fire Alerts",
+            color="Fire Count",
+            color_continuous_scale="Cividis",
+        )
+        yearly_fig.update_layout(
+            template="plotly_dark",
+            xaxis_title="Fire Count",
+            yaxis_title="Year",
+            margin={"t": 50, "b": 50, "l": 50, "r": 50},
+            coloraxis_showscale=False,
+        )
+        yearly_fig.update_traces(showlegend=False)
+        lap('figure')
+        return yearly_fig
+
+    # The three figures are independent: built concurrently on the figure pool
+    figures, _ = figure_pool.build({'monthly': monthly, 'hourly': hourly, 'yearly': yearly})
+    return figures['monthly'], figures['hourly'], figures['yearly']
+
+
+# --- Aggregates for the clientside Home and Trends callbacks ---
+def _figure_skeleton(figure):
+    # The browser fills in the data: only the trace styling and layout are sent
+    trace = dict(figure['data'][0], x=[], y=[])
+    if isinstance(trace.get('marker', {}).get('color'), (list, dict)):
+        trace['marker'] = dict(trace['marker'], color=[])
+    return dict(figure, data=[trace])
+
+
+if CLIENTSIDE_CALLBACKS:
+    @app.callback(Output('aggregate-store', 'data'), Input('department-dropdown', 'value'))
+    @instrument('load_aggregates')
+    @figure_cache.memoize('aggregates', version=department_version)
+    def load_aggregates(selected_department=DEFAULT_DEPARTMENT):
+        department = departments.get(selected_department)
+        # Figures of "all years, all communes" give the clientside callbacks their styling
+        monthly_fig, hourly_fig, yearly_fig = update_trends.__wrapped__(None, None, department.code)
+        bar_fig = update_bar_chart.__wrapped__(None, None, None, department.code)
+        return dict(client_aggregates(department.df), department=department.code,
+                    max_bars=BAR_CHART_MAX_BARS, figures={
+            name: _figure_skeleton(figure) for name, figure in
+            (('bar', bar_fig), ('monthly', monthly_fig), ('hourly', hourly_fig), ('yearly', yearly_fig))
+        })
 
 
 # 4. --- QGIS Layout ---
@@ -590,11 +985,82 @@ qgis_mapping_layout = html.Div([
 })
 
 
+# 5. --- Hotspots Layout ---
+hotspots_layout = html.Div([
+    sidebar,
+    html.Div([
+        html.Div(
+            html.H1("Fire Hotspots", className='title-text'),
+            className='title-container'
+        ),
+        dcc.Graph(id='hotspot-map', className='hotspot-map')
+    ], className='main-content'),
+], className='home-layout')
+
+
+# --- Callback for Hotspots ---
+# Kernel density of the fires of the selected period (hotspots.py), drawn as an image
+# overlay served by /hotspots/<department>.png, with the busiest DFCI cells on top
+@app.callback(
+    Output('hotspot-map', 'figure'),
+    [Input('year-range', 'value'),
+     Input('month-range', 'value'),
+     Input('department-dropdown', 'value')]
+)
+@instrument('update_hotspots')
+@figure_cache.memoize('hotspots', version=department_version)
+def update_hotspots(selected_years, selected_months, selected_department=DEFAULT_DEPARTMENT):
+    lap = phase_timer()
+    department = departments.get(selected_department)
+    grid = department.hotspot_grid()
+    first_year, last_year = selected_years or department.year_range()
+    first_month, last_month = selected_months or ALL_MONTHS
+    period = (first_year, last_year), (first_month, last_month)
+    # Rendered now, so the browser's request for the overlay finds it ready
+    _, peak = grid.image(*period)
+    top, counts = grid.top_cells(*period)
+    lap('aggregate')
+
+    overlay = (f'/hotspots/{department.code}.png?years={first_year}-{last_year}'
+               f'&months={first_month}-{last_month}&v={departments.version(department.code)}')
+    bounds = grid.bounds()
+    # Zoom fitting the overlay's width into about 800 pixels
+    zoom = math.log2(360 / (bounds[1][0] - bounds[0][0]) * 800 / 256)
+    season = '' if period[1] == ALL_MONTHS else f", {calendar.month_abbr[first_month]}–{calendar.month_abbr[last_month]}"
+
+    hotspot_fig = go.Figure([
+        # Only there for its colour bar: the overlay's colours span 0 to the period's peak density
+        go.Scattermap(lat=[None], lon=[None], mode='markers', hoverinfo='skip',
+                      marker=dict(color=[0], cmin=0, cmax=peak, colorscale=grid.colorscale, showscale=True,
+                                  colorbar=dict(title='Fires / km²'))),
+        go.Scattermap(lat=grid.lat[top], lon=grid.lon[top], mode='markers',
+                      marker=dict(size=10, color='white', opacity=0.8),
+                      text=[f"DFCI {cell}: {count:,} fires" for cell, count in zip(grid.cells[top], counts)],
+                      hovertemplate='%{text}<extra></extra>'),
+    ])
+    hotspot_fig.update_layout(
+        template='plotly_dark',
+        title=f"Fire Density, {first_year}–{last_year}{season}",
+        showlegend=False,
+        margin={'t': 50, 'b': 20, 'l': 20, 'r': 20},
+        paper_bgcolor='rgba(0,0,0,0)',
+        map=dict(
+            style='carto-darkmatter',
+            center={'lon': (bounds[0][0] + bounds[1][0]) / 2, 'lat': (bounds[0][1] + bounds[2][1]) / 2},
+            zoom=zoom,
+            layers=[dict(sourcetype='image', source=overlay, coordinates=bounds)],
+        ),
+    )
+    lap('figure')
+    return hotspot_fig
+
+
 # --------------------------------
 #  Main Layout
 # --------------------------------
 app.layout = html.Div([
     dcc.Location(id='url', refresh=False),  # Tracks current pathname
+    dcc.Store(id='aggregate-store'),  # Home / Trends aggregates when CLIENTSIDE_CALLBACKS=1
     sidebar,
     toggle_button,
     hidden_sidebar,
@@ -608,6 +1074,7 @@ app.layout = html.Div([
     [Input('toggle-sidebar', 'n_clicks')],
     [State('hidden-sidebar', 'style')]
 )
+@instrument('toggle_hidden_sidebar')
 def toggle_hidden_sidebar(n_clicks, current_style):
     # Default styles
     hidden_sidebar_style = {'left': '-265px', 'transition': 'left 0.3s ease'}
@@ -624,21 +1091,148 @@ def toggle_hidden_sidebar(n_clicks, current_style):
         return hidden_sidebar_style, toggle_button_default_style, "▶️"
 
 
+@app.callback(
+    [Output('year-dropdown', 'options'),
+     Output('commune-dropdown', 'options'),
+     Output('commune-dropdown', 'value'),
+     Output('communes-dropdown', 'options')],
+    [Input('department-dropdown', 'value')]
+)
+@instrument('update_department_options')
+def update_department_options(selected_department):
+    # Communes differ between departments, so a previous commune selection is cleared
+    department = departments.get(selected_department)
+    return department.year_options(), department.commune_options(), None, department.commune_options()
+
+
+# Separate callbacks: the title is only on the Home page, the about text always in the layout
+@app.callback(Output('department-title', 'children'), [Input('department-dropdown', 'value')])
+@instrument('update_department_title')
+def update_department_title(selected_department):
+    return department_title(selected_department)
+
+
+@app.callback(Output('about-text', 'children'), [Input('department-dropdown', 'value')])
+@instrument('update_about_text')
+def update_about_text(selected_department):
+    return about_text(selected_department)
+
+
+# The period spans the department's years, or the year picked in the dropdown
+@app.callback(
+    [Output('year-range', 'min'),
+     Output('year-range', 'max'),
+     Output('year-range', 'marks'),
+     Output('year-range', 'value')],
+    [Input('year-dropdown', 'value'),
+     Input('department-dropdown', 'value')]
+)
+@instrument('update_year_range')
+def update_year_range(selected_year, selected_department):
+    first_year, last_year = departments.get(selected_department).year_range()
+    value = [selected_year, selected_year] if selected_year else [first_year, last_year]
+    return first_year, last_year, year_marks(first_year, last_year), value
+
+
+# Picking a commune in the dropdown starts the comparison from it
+@app.callback(Output('communes-dropdown', 'value'), [Input('commune-dropdown', 'value')])
+@instrument('update_compared_communes')
+def update_compared_communes(selected_commune):
+    return [selected_commune] if selected_commune else []
+
+
+# Listed again on every page load, so departments added by a data reload show up
+@app.callback(Output('department-dropdown', 'options'), [Input('url', 'pathname')])
+@instrument('update_department_list')
+def update_department_list(pathname):
+    return departments.options()
+
+
 @app.callback(Output('page-content', 'children'), [Input('url', 'pathname')])
+@instrument('display_page')
 def display_page(pathname):
     if pathname == '/':
         return home_layout
     elif pathname == '/trends':
         return trends_layout
+    elif pathname == '/hotspots':
+        return hotspots_layout
     elif pathname == '/insights':
+        load_geometry_in_background()
         return insights_layout
     
     elif pathname == '/qgis_mapping':
+        load_geometry_in_background()
         return qgis_mapping_layout
  
     return html.Div("Page not found")
 
 
+# --------------------------------
+#  Figure Cache Warmup
+# --------------------------------
+# Pre-builds the default department's "all communes" figures of every year, and
+# of the whole period, in the background (FIGURE_CACHE_WARMUP=1), and again after a data reload changed it
+def warm_figure_cache():
+    warmup_years = [None] + sorted(int(year) for year in df['Year'].unique())
+    # Keyed like the sliders' values: the whole range, or the year picked in the dropdown
+    warmup_periods = [default_department.year_range()] + [(year, year) for year in warmup_years[1:]]
+    figure_cache.warm(
+        [(update_trends, (period, ALL_MONTHS, DEFAULT_DEPARTMENT)) for period in warmup_periods]
+        + [(update_bar_chart, (period, ALL_MONTHS, (), DEFAULT_DEPARTMENT)) for period in warmup_periods]
+        + [(update_insights, (year, None, DEFAULT_DEPARTMENT)) for year in warmup_years]
+    )
+
+
+# --------------------------------
+#  Data Hot Reload
+# --------------------------------
+# A new Classeur1.csv or shapefile is turned into a new snapshot by one worker
+# and swapped into every worker on the watcher thread, without a restart
+def reload_data(new_manifest):
+    global manifest, default_department, df, vector_tiles
+    changed = departments.refresh(new_manifest['departments'])
+    if DEFAULT_DEPARTMENT in changed:
+        default_department = departments.get(DEFAULT_DEPARTMENT)
+        df = default_department.df
+        vector_tiles = commune_tiles(default_department)
+        prune_vector_tiles()
+        if FIGURE_CACHE_WARMUP:
+            warm_figure_cache()
+    manifest = new_manifest
+    print(f"Data reloaded from snapshot {new_manifest['key'][:12]}, "
+          f"changed departments: {', '.join(changed) or 'none'}")
+
+
+if DATA_RELOAD_INTERVAL > 0:
+    snapshot_watcher = SnapshotWatcher(reload_data, manifest)
+    register_collector(lambda: [
+        ('data_reloads_total', 'counter', "Snapshots swapped in without a restart.",
+         [({}, snapshot_watcher.reloads)]),
+        ('data_reload_seconds', 'gauge', "Duration of the last snapshot update and swap.",
+         [({}, snapshot_watcher.last_reload_seconds)]),
+    ])
+
+
+# --------------------------------
+#  Background Threads
+# --------------------------------
+def start_background_threads():
+    """Start the profiler, climate tile build, figure cache warmup and data watcher threads of this process."""
+    start_profiler()
+    build_climate_tiles()
+    if FIGURE_CACHE_WARMUP:
+        warm_figure_cache()
+    if DATA_RELOAD_INTERVAL > 0:
+        snapshot_watcher.start()
+
+
+# Threads do not survive a fork: when a gunicorn master preloads this module,
+# every worker starts its own from the post_fork hook of gunicorn.conf.py
+if os.environ.get('GUNICORN_PRELOADED') != '1':
+    start_background_threads()
+
+
 # --------------------------------
 #  Run the app, trying port 8060 in case of problem
 # --------------------------------
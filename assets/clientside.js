@@ -0,0 +1,155 @@
+// Clientside versions of the Home and Trends callbacks, registered when the app
+// runs with CLIENTSIDE_CALLBACKS=1. They answer every period and commune change
+// from the aggregates loaded once per department into the 'aggregate-store' dcc.Store.
+(function () {
+    // The year and month of a period, counted in months from January of first_year
+    function yearOf(aggregates, period) {
+        return aggregates.first_year + Math.floor(period / 12);
+    }
+
+    function monthOf(period) {
+        return period % 12 + 1;
+    }
+
+    // Whether a period lies in the selected year and month ranges; a missing range means "all"
+    function inPeriod(aggregates, period, years, months) {
+        var year = yearOf(aggregates, period), month = monthOf(period);
+        return (!years || (year >= years[0] && year <= years[1])) &&
+            (!months || (month >= months[0] && month <= months[1]));
+    }
+
+    // Positions of the selected communes, or {-1: true} (the whole department) when none are
+    function communeRows(aggregates, communes) {
+        var rows = {};
+        if (!communes || !communes.length) {
+            rows[-1] = true;
+        } else {
+            [].concat(communes).forEach(function (name) {
+                var position = aggregates.communes.indexOf(name);
+                if (position >= 0) {
+                    rows[position] = true;
+                }
+            });
+        }
+        return rows;
+    }
+
+    function checkPayload(aggregates, department) {
+        if (!aggregates || aggregates.department !== department) {
+            throw window.dash_clientside.PreventUpdate;
+        }
+    }
+
+    function round2(value) {
+        return Math.round(value * 100) / 100;
+    }
+
+    // At most maxCount entries, in their order: the smallest are summed into "Other",
+    // like top_n in payloads.py
+    function topN(labels, values, maxCount, noun) {
+        if (!maxCount || labels.length <= maxCount) {
+            return [labels, values];
+        }
+        var ranked = values.map(function (value, i) { return i; });
+        ranked.sort(function (a, b) { return values[b] - values[a] || a - b; });
+        var kept = {}, other = 0;
+        ranked.slice(0, maxCount - 1).forEach(function (i) { kept[i] = true; });
+        var keptLabels = [], keptValues = [];
+        for (var i = 0; i < labels.length; i++) {
+            if (kept[i]) {
+                keptLabels.push(labels[i]);
+                keptValues.push(values[i]);
+            } else {
+                other += values[i];
+            }
+        }
+        keptLabels.push('Other (' + (labels.length - maxCount + 1) + ' ' + noun + ')');
+        keptValues.push(other);
+        return [keptLabels, keptValues];
+    }
+
+    // The figures built by the server for "all years, all communes", with new data
+    function withData(figure, x, y) {
+        var copy = JSON.parse(JSON.stringify(figure));
+        copy.data[0].x = x;
+        copy.data[0].y = y;
+        return copy;
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        fires: {
+            update_data_summaries: function (years, months, communes, department, aggregates) {
+                checkPayload(aggregates, department);
+                var cells = aggregates.cells, rows = communeRows(aggregates, communes);
+                var count = 0, alerts = 0, total = 0;
+                for (var i = 0; i < cells.period.length; i++) {
+                    if (rows[cells.commune[i]] && inPeriod(aggregates, cells.period[i], years, months)) {
+                        count += cells.count[i];
+                        alerts += cells.count[i] - (aggregates.repeats[i] || 0);
+                        total += cells.total[i];
+                    }
+                }
+                if (!count) {
+                    // The server sends the NaN mean of no fires as null too
+                    return [0, 0, null];
+                }
+                return [alerts, round2(total / 10000), round2(total / count / 10000)];
+            },
+
+            update_bar_chart: function (years, months, communes, department, aggregates) {
+                checkPayload(aggregates, department);
+                var cells = aggregates.cells, selected = communes && communes.length ? communeRows(aggregates, communes) : null;
+                var byCommune = {};
+                for (var i = 0; i < cells.period.length; i++) {
+                    var position = cells.commune[i];
+                    if (position >= 0 && (!selected || selected[position]) && inPeriod(aggregates, cells.period[i], years, months)) {
+                        byCommune[position] = (byCommune[position] || 0) + cells.total[i];
+                    }
+                }
+                var positions = Object.keys(byCommune).map(Number).sort(function (a, b) { return a - b; });
+                var names = positions.map(function (position) { return aggregates.communes[position]; });
+                var burned = positions.map(function (position) { return byCommune[position] / 10000; });
+                var capped = topN(names, burned, aggregates.max_bars, 'communes');
+                names = capped[0];
+                burned = capped[1].map(round2);
+                var figure = withData(aggregates.figures.bar, names, burned);
+                figure.data[0].marker.color = burned;
+                if (!names.length) {
+                    // Like the server's chart of an empty selection
+                    figure.layout.annotations = [{text: 'No fires in this selection', showarrow: false, font: {size: 14}}];
+                }
+                return figure;
+            },
+
+            update_trends: function (years, months, department, aggregates) {
+                checkPayload(aggregates, department);
+                var cells = aggregates.cells, hours = aggregates.hours;
+                var monthLabels = [], monthCounts = [], byHour = {}, byYear = {};
+                for (var i = 0; i < cells.period.length; i++) {
+                    if (cells.commune[i] === -1 && inPeriod(aggregates, cells.period[i], years, months)) {
+                        var year = yearOf(aggregates, cells.period[i]);
+                        monthLabels.push(year + '-' + String(monthOf(cells.period[i])).padStart(2, '0'));
+                        monthCounts.push(cells.count[i]);
+                        byYear[year] = (byYear[year] || 0) + cells.count[i];
+                    }
+                }
+                for (var j = 0; j < hours.period.length; j++) {
+                    if (inPeriod(aggregates, hours.period[j], years, months)) {
+                        byHour[hours.hour[j]] = (byHour[hours.hour[j]] || 0) + hours.count[j];
+                    }
+                }
+                var hourKeys = Object.keys(byHour).map(Number).sort(function (a, b) { return a - b; });
+                var hourCounts = hourKeys.map(function (hour) { return byHour[hour]; });
+                var yearKeys = Object.keys(byYear).map(Number).sort(function (a, b) { return a - b; });
+                var yearCounts = yearKeys.map(function (y) { return byYear[y]; });
+
+                var monthly = withData(aggregates.figures.monthly, monthLabels, monthCounts);
+                var hourly = withData(aggregates.figures.hourly, hourKeys, hourCounts);
+                hourly.data[0].marker.color = hourCounts;
+                var yearly = withData(aggregates.figures.yearly, yearCounts, yearKeys);
+                yearly.data[0].marker.color = yearCounts;
+                return [monthly, hourly, yearly];
+            }
+        }
+    });
+})();
@@ -0,0 +1,23 @@
+import os
+import threading
+
+# -------------------------------
+# Atomic File Replacement
+# -------------------------------
+# Gunicorn workers and their threads write the snapshot, the caches and the
+# tiles side by side: each writer fills a temp file of its own and renames it
+# over the target, so readers never see a partial file and the last rename wins
+
+
+def replace_atomically(write, target):
+    """Call ``write(path)`` on a temp file next to ``target``, then rename it to ``target``."""
+    tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
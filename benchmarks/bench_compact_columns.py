@@ -0,0 +1,72 @@
+"""Memory and filter timings of df as parsed from the CSV versus its compact representation.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_compact_columns --scale 100
+"""
+import argparse
+import time
+
+from data_loader import compact_fire_table, load_fire_csv
+from benchmarks.synthetic import scale_fires, selection_mix
+
+
+def _best_ms(fn, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+# -------------------------------
+# Workloads (as run by the callbacks)
+# -------------------------------
+def raw_workload(df, year, commune):
+    filtered_df = df[df['Alerte'].dt.year == year]
+    filtered_df = filtered_df[filtered_df['Commune'] == commune]
+    filtered_df["Origine de l'alerte"].value_counts()
+    filtered_df['Code du carreau DFCI'].value_counts()
+    df.groupby(df['Alerte'].dt.to_period('M')).size()
+    df.groupby(df['Alerte'].dt.hour).size()
+
+
+def compact_workload(df, year, commune):
+    filtered_df = df[df['Year'] == year]
+    filtered_df = filtered_df[filtered_df['Commune'] == commune]
+    filtered_df["Origine de l'alerte"].value_counts()
+    filtered_df['Code du carreau DFCI'].value_counts()
+    df.groupby(['Year', 'Month']).size()
+    df.groupby('Hour').size()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=float, default=1, help="size of the dataset relative to df")
+    args = parser.parse_args()
+
+    raw = scale_fires(load_fire_csv(), args.scale)
+    start = time.perf_counter()
+    compact = compact_fire_table(raw)
+    print(f"{len(raw):,} fires ({args.scale:g}x), conversion took {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    # --- Memory report ---
+    raw_memory = raw.memory_usage(deep=True)
+    compact_memory = compact.memory_usage(deep=True)
+    print(f"{'column':<28}{'raw (KiB)':>14}{'compact (KiB)':>16}")
+    for column in compact_memory.index:
+        before = raw_memory.get(column)
+        before = f"{before / 1024:,.0f}" if before is not None else '-'
+        print(f"{column:<28}{before:>14}{compact_memory[column] / 1024:>16,.0f}")
+    print(f"{'total':<28}{raw_memory.sum() / 1024:>14,.0f}{compact_memory.sum() / 1024:>16,.0f}\n")
+
+    # --- Timings ---
+    year, commune = next((y, c) for y, c in selection_mix(raw, 100) if y and c)
+    print(f"selection {year} / {commune}")
+    print(f"raw workload     : {_best_ms(lambda: raw_workload(raw, year, commune)):8.1f} ms")
+    print(f"compact workload : {_best_ms(lambda: compact_workload(compact, year, commune)):8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
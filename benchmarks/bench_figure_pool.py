@@ -0,0 +1,99 @@
+"""Latency of the Insights and Trends callbacks under concurrent load, with their figures built in sequence or on the figure pool.
+
+Each FIGURE_POOL_WORKERS value is measured in a fresh process importing
+app.py with the figure cache disabled, so that every call builds its
+figures. Concurrent dropdown changes come from a thread pool, like the
+threads of one gunicorn worker. Run from the repository root:
+
+    python -m benchmarks.bench_figure_pool --pool-workers 0 2 4 --threads 1 8
+    python -m benchmarks.bench_figure_pool --scale 10 --changes 40
+
+--scale generates a synthetic export (kept in load_test/, see benchmarks/load_test.py).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from data_loader import DEFAULT_DEPARTMENT
+
+
+def measure(args):
+    """Run the bursts in this process (started by ``main`` with the environment set) and print them as JSON."""
+    import app
+    from benchmarks.synthetic import selection_mix
+
+    department = app.departments.get(args.department)
+    department.dfci_grid()  # built once per department, not part of a callback's cost
+    selections = selection_mix(department.df, args.changes)
+
+    def change(selection):
+        year, commune = selection
+        timings = {}
+        for name, call in (('insights', lambda: app.update_insights(year, commune, args.department)),
+                           ('trends', lambda: app.update_trends((year, year) if year else None, None,
+                                                                args.department))):
+            start = time.perf_counter()
+            call()
+            timings[name] = time.perf_counter() - start
+        return timings
+
+    results = []
+    for threads in args.threads:
+        change(selections[0])  # warm up the selection index and geometry
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as pool:
+            timings = list(pool.map(change, selections))
+        wall = time.perf_counter() - start
+        results.append({
+            'threads': threads, 'wall_s': wall, 'fallbacks': sum(app.figure_pool.timeouts.values()),
+            **{name: np.percentile([t[name] * 1000 for t in timings], [50, 95]).tolist()
+               for name in ('insights', 'trends')},
+        })
+    print(json.dumps(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--department', default=DEFAULT_DEPARTMENT)
+    parser.add_argument('--scale', type=float, default=1, help="size relative to Classeur1.csv (1 reads it as is)")
+    parser.add_argument('--pool-workers', type=int, nargs='+', default=[0, 2, 4], help="FIGURE_POOL_WORKERS values")
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8], help="concurrent dropdown changes")
+    parser.add_argument('--changes', type=int, default=60, help="dropdown changes per burst")
+    parser.add_argument('--timeout', type=float, default=5, help="FIGURE_TIMEOUT_S")
+    parser.add_argument('--data-dir', default='load_test')
+    parser.add_argument('--measure', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        return measure(args)
+
+    env = dict(os.environ, DATA_RELOAD_INTERVAL_S='0', FIGURE_CACHE_WARMUP='0', FIGURE_CACHE_MAX_MB='0',
+               FIGURE_CACHE_MEMORY_ENTRIES='0', FIGURE_TIMEOUT_S=str(args.timeout))
+    if args.scale != 1:
+        from benchmarks.load_test import prepare_dataset
+        env['FIRE_CSV'], env['SNAPSHOT_DIR'] = prepare_dataset(args.scale, args.data_dir)
+
+    print(f"{'pool':>5}{'threads':>8}{'burst':>10}{'insights p50':>14}{'p95':>10}{'trends p50':>12}{'p95':>10}"
+          f"{'fallbacks':>11}")
+    for workers in args.pool_workers:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_figure_pool', '--measure', '--department', args.department,
+                 '--changes', str(args.changes), '--threads', *map(str, args.threads)],
+                env=dict(env, FIGURE_POOL_WORKERS=str(workers), FIGURE_CACHE_DIR=cache_dir),
+                capture_output=True, text=True, check=True,
+            ).stdout
+        for result in json.loads(output.splitlines()[-1]):
+            print(f"{workers:>5}{result['threads']:>8}{result['wall_s'] * 1000:>8.0f}ms"
+                  f"{result['insights'][0]:>12.1f}ms{result['insights'][1]:>8.1f}ms"
+                  f"{result['trends'][0]:>10.1f}ms{result['trends'][1]:>8.1f}ms{result['fallbacks']:>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Selection latency on the national dataset: boolean masks versus the sorted FireIndex.
+
+Uses every department of Classeur1.csv (no '13' filter), optionally scaled up.
+Run from the repository root:
+
+    python -m benchmarks.bench_fire_index --scale 10
+"""
+import argparse
+import time
+
+import numpy as np
+
+from data_loader import compact_fire_table, load_fire_csv
+from fire_index import FireIndex, sort_fire_table
+from benchmarks.synthetic import scale_fires, selection_mix
+
+
+def mask_rows(df, year, commune):
+    if year:
+        df = df[df['Year'] == year]
+    if commune:
+        df = df[df['Commune'] == commune]
+    return df
+
+
+def _latencies(fn, selections):
+    timings = []
+    for year, commune in selections:
+        start = time.perf_counter()
+        fn(year, commune)
+        timings.append(time.perf_counter() - start)
+    return np.array(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=float, default=1, help="size relative to the national dataset")
+    parser.add_argument('--selections', type=int, default=200)
+    args = parser.parse_args()
+
+    fires = scale_fires(compact_fire_table(load_fire_csv(department=None)), args.scale)
+    start = time.perf_counter()
+    index = FireIndex(sort_fire_table(fires))
+    print(f"{len(fires):,} national fires ({args.scale:g}x), "
+          f"sort + index build {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    selections = selection_mix(fires, args.selections)
+    kinds = {
+        'year': [s for s in selections if s[0] and not s[1]],
+        'commune': [s for s in selections if s[1] and not s[0]],
+        'year + commune': [s for s in selections if s[0] and s[1]],
+    }
+    print(f"{'selection':<16}{'n':>5}{'mask p50':>12}{'index p50':>12}{'mask p95':>12}{'index p95':>12}")
+    for kind, subset in kinds.items():
+        if not subset:
+            continue
+        mask = _latencies(lambda y, c: mask_rows(fires, y, c), subset)
+        lookup = _latencies(index.rows, subset)
+        print(f"{kind:<16}{len(subset):>5}{np.percentile(mask, 50):>10.2f}ms{np.percentile(lookup, 50):>10.2f}ms"
+              f"{np.percentile(mask, 95):>10.2f}ms{np.percentile(lookup, 95):>10.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Home-page callback latency: full scans of df versus the TimeIndex the callbacks read.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_home_callbacks --scale 100
+"""
+import argparse
+import time
+
+import numpy as np
+
+from data_loader import load_data
+from time_index import TimeIndex
+from benchmarks.synthetic import scale_fires, selection_mix
+
+
+# -------------------------------
+# Former Implementations (full scans)
+# -------------------------------
+def _filter(df, selected_year, selected_commune):
+    if selected_year:
+        df = df[df['Alerte'].dt.year == selected_year]
+    if selected_commune:
+        df = df[df['Commune'] == selected_commune]
+    return df
+
+
+def scan_summaries(df, selected_year, selected_commune):
+    filtered_df = _filter(df, selected_year, selected_commune)
+    surface = filtered_df['Surface parcourue (m2)']
+    return filtered_df['Alerte'].nunique(), surface.sum(), surface.mean(), surface.max(), surface.min()
+
+
+def scan_area_by_commune(df, selected_year, selected_commune):
+    filtered_df = _filter(df, selected_year, selected_commune)
+    return filtered_df.groupby('Commune')['Surface parcourue (m2)'].sum()
+
+
+def _period(index, method):
+    # A dropdown (year, commune) as the period and compared communes the Home callbacks pass
+    def lookup(selected_year, selected_commune):
+        return method((selected_year, selected_year) if selected_year else None, None,
+                      [selected_commune] if selected_commune else None)
+    return lookup
+
+
+# -------------------------------
+# Benchmark
+# -------------------------------
+def _latencies(fn, selections):
+    timings = []
+    for selected_year, selected_commune in selections:
+        start = time.perf_counter()
+        fn(selected_year, selected_commune)
+        timings.append(time.perf_counter() - start)
+    return np.array(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=float, default=100, help="size of the synthetic dataset relative to df")
+    parser.add_argument('--selections', type=int, default=200)
+    args = parser.parse_args()
+
+    df, _ = load_data()
+    fires = scale_fires(df, args.scale)
+    selections = selection_mix(fires, args.selections)
+    print(f"{len(fires):,} synthetic fires ({args.scale:g}x), {len(selections)} selections")
+
+    start = time.perf_counter()
+    index = TimeIndex(fires)
+    print(f"TimeIndex build: {(time.perf_counter() - start) * 1000:.0f} ms, {len(index.communes):,} communes\n")
+
+    cases = [
+        ('update_data_summaries', lambda y, c: scan_summaries(fires, y, c), _period(index, index.summary)),
+        ('update_bar_chart', lambda y, c: scan_area_by_commune(fires, y, c), _period(index, index.area_by_commune)),
+    ]
+    print(f"{'callback (data step)':<24}{'scan p50':>12}{'scan p95':>12}{'index p50':>12}{'index p95':>12}")
+    for name, before, after in cases:
+        scan = _latencies(before, selections)
+        lookup = _latencies(after, selections)
+        print(f"{name:<24}{np.percentile(scan, 50):>10.3f}ms{np.percentile(scan, 95):>10.3f}ms"
+              f"{np.percentile(lookup, 50):>10.3f}ms{np.percentile(lookup, 95):>10.3f}ms")
+
+
+if __name__ == '__main__':
+    main()
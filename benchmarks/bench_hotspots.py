@@ -0,0 +1,91 @@
+"""Hotspot density of a period: kernel density from the selected rows versus the HotspotGrid.
+
+The grid is built once on synthetic data of --fires rows (1 M by default),
+then every period of a realistic mix is computed both ways. Run from the
+repository root:
+
+    python -m benchmarks.bench_hotspots
+    python -m benchmarks.bench_hotspots --fires 200000 --periods 50
+"""
+import argparse
+import time
+
+import numpy as np
+
+from data_loader import load_data
+from benchmarks.synthetic import period_mix, scale_fires
+from hotspots import HotspotGrid
+from time_index import ALL_MONTHS
+
+
+# -------------------------------
+# Density From the Rows
+# -------------------------------
+def scan_density(grid, df, years, months):
+    """Filter the rows of the period and blur their fires, as a grid without precomputed counts would."""
+    mask = np.ones(len(df), dtype=bool)
+    if years:
+        mask &= df['Year'].between(*years).to_numpy()
+    if months:
+        mask &= df['Month'].between(*months).to_numpy()
+    codes = df['Code du carreau DFCI'].astype(str).to_numpy()[mask]
+    cells, counts = np.unique(codes, return_counts=True)
+    per_cell = np.zeros(len(grid.cells))
+    known = np.isin(cells, grid.cells)
+    per_cell[np.searchsorted(grid.cells, cells[known])] = counts[known]
+    return grid._blur(per_cell)
+
+
+# -------------------------------
+# Benchmark
+# -------------------------------
+def _latencies(fn, periods):
+    timings = []
+    for years, months, _ in periods:
+        start = time.perf_counter()
+        fn(years, months)
+        timings.append(time.perf_counter() - start)
+    return np.array(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--fires', type=int, default=1_000_000, help="rows of the synthetic dataset")
+    parser.add_argument('--periods', type=int, default=100)
+    args = parser.parse_args()
+
+    df, _ = load_data()
+    fires = scale_fires(df, args.fires / len(df))
+    periods = period_mix(fires, args.periods)
+    print(f"{len(fires):,} synthetic fires, {len(periods)} periods")
+
+    start = time.perf_counter()
+    grid = HotspotGrid(fires)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    grid.density()  # running sums of the yearly rasters
+    print(f"HotspotGrid build: {built * 1000:.0f} ms, yearly rasters: {(time.perf_counter() - start) * 1000:.0f} ms "
+          f"({grid.width} x {grid.height} pixels, {len(grid.cells):,} DFCI cells)\n")
+
+    # grid.cells must be sorted for the scan's searchsorted, and both sides must agree
+    assert np.all(grid.cells[1:] > grid.cells[:-1])
+    for years, months, _ in periods[:10]:
+        assert np.allclose(grid.density(years, months), scan_density(grid, fires, years, months), rtol=1e-3, atol=1e-4)
+
+    whole_years = [p for p in periods if not p[1] or tuple(p[1]) == ALL_MONTHS]
+    seasons = [p for p in periods if p[1] and tuple(p[1]) != ALL_MONTHS]
+    cases = [
+        ('year ranges', whole_years, grid.density),
+        ('seasons', seasons, grid.density),
+        ('overlay PNG', periods, lambda years, months: grid.image(years, months)),
+    ]
+    print(f"{'density of':<16}{'periods':>8}{'rows p50':>12}{'rows p95':>12}{'grid p50':>12}{'grid p95':>12}")
+    for name, selection, after in cases:
+        scan = _latencies(lambda years, months: scan_density(grid, fires, years, months), selection)
+        lookup = _latencies(after, selection)
+        print(f"{name:<16}{len(selection):>8}{np.percentile(scan, 50):>10.1f}ms{np.percentile(scan, 95):>10.1f}ms"
+              f"{np.percentile(lookup, 50):>10.2f}ms{np.percentile(lookup, 95):>10.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
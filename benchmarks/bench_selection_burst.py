@@ -0,0 +1,76 @@
+"""Latency and memory of a burst of concurrent dropdown changes: per-callback filtering versus shared selections.
+
+Every dropdown change fires the Insights (year + commune) and Trends (year)
+callbacks, here run concurrently by a thread pool like the threads of one
+gunicorn worker. Run from the repository root:
+
+    python -m benchmarks.bench_selection_burst --scale 20 --changes 100 --threads 8
+"""
+import argparse
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from data_loader import DEFAULT_DEPARTMENT, ensure_snapshot, read_partition
+from departments import Department
+from benchmarks.synthetic import scale_fires, selection_mix
+
+
+def per_callback_filters(department, year, commune):
+    # What the callbacks did before: each filters on its own, Trends on a copy
+    insights = department.index.rows(year, commune)
+    trends = department.index.rows(year).copy()
+    return insights, trends
+
+
+def shared_selections(department, year, commune):
+    return department.selection(year, commune), department.selection(year)
+
+
+def burst(department, filters, changes, threads):
+    """Return (wall seconds, per-call latencies in ms, peak traced MB) of one burst."""
+    def call(selection):
+        start = time.perf_counter()
+        insights, trends = filters(department, *selection)
+        insights['Origine de l\'alerte'].value_counts()
+        trends.groupby(['Year', 'Month']).size()
+        return time.perf_counter() - start
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        latencies = list(pool.map(call, changes))
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return wall, np.array(latencies) * 1000, peak / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--department', default=DEFAULT_DEPARTMENT)
+    parser.add_argument('--scale', type=float, default=20, help="size relative to the department's fires")
+    parser.add_argument('--changes', type=int, default=100, help="dropdown changes in the burst")
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    ensure_snapshot()
+    df, communes = read_partition(args.department)
+    department = Department(args.department, scale_fires(df, args.scale), communes)
+    # Users mostly move back and forth between a few selections during a burst
+    distinct = selection_mix(department.df, max(args.changes // 4, 1))
+    changes = [distinct[i] for i in np.random.default_rng(1).integers(0, len(distinct), args.changes)]
+    print(f"{len(department.df):,} fires, {args.changes} changes over {len(distinct)} selections, "
+          f"{args.threads} threads\n")
+
+    print(f"{'filtering':<22}{'burst':>10}{'p50':>10}{'p95':>10}{'peak MB':>10}")
+    for name, filters in (('per callback + copy', per_callback_filters), ('shared selection', shared_selections)):
+        wall, latencies, peak = burst(department, filters, changes, args.threads)
+        print(f"{name:<22}{wall * 1000:>8.0f}ms{np.percentile(latencies, 50):>8.2f}ms"
+              f"{np.percentile(latencies, 95):>8.2f}ms{peak:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""Home and Trends aggregates of a period: row scans versus the cumulative TimeIndex.
+
+Each period is a year range, a month range repeated every year and a list of
+compared communes, as set with the sidebar sliders. Run from the repository root:
+
+    python -m benchmarks.bench_time_index --scale 100
+"""
+import argparse
+import time
+
+import numpy as np
+
+from data_loader import load_data
+from benchmarks.synthetic import period_mix, scale_fires
+from time_index import TimeIndex
+
+
+# -------------------------------
+# Row Scans
+# -------------------------------
+def _filter(df, years, months, communes):
+    mask = np.ones(len(df), dtype=bool)
+    if years:
+        mask &= df['Year'].between(*years).to_numpy()
+    if months:
+        mask &= df['Month'].between(*months).to_numpy()
+    if communes:
+        mask &= df['Commune'].isin(communes).to_numpy()
+    return df[mask]
+
+
+def scan_home(df, years, months, communes):
+    filtered_df = _filter(df, years, months, communes)
+    surface = filtered_df['Surface parcourue (m2)'].astype('float64')
+    summary = (len(filtered_df), surface.sum(), surface.max(), surface.min())
+    return summary, surface.groupby(filtered_df['Commune'], observed=True).sum()
+
+
+def scan_trends(df, years, months, communes):
+    filtered_df = _filter(df, years, months, None)
+    return (filtered_df.groupby(['Year', 'Month']).size(), filtered_df.groupby('Hour').size(),
+            filtered_df.groupby('Year').size())
+
+
+def index_home(index, years, months, communes):
+    stats = index.summary(years, months, communes)
+    return (stats.count, stats.total, stats.max, stats.min), index.area_by_commune(years, months, communes)
+
+
+def index_trends(index, years, months, communes):
+    return index.monthly(years, months), index.hourly(years, months), index.yearly(years, months)
+
+
+# -------------------------------
+# Benchmark
+# -------------------------------
+def _latencies(fn, periods):
+    timings = []
+    for period in periods:
+        start = time.perf_counter()
+        fn(*period)
+        timings.append(time.perf_counter() - start)
+    return np.array(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=float, default=100, help="size of the synthetic dataset relative to df")
+    parser.add_argument('--periods', type=int, default=200)
+    args = parser.parse_args()
+
+    df, _ = load_data()
+    fires = scale_fires(df, args.scale)
+    periods = period_mix(fires, args.periods)
+    print(f"{len(fires):,} synthetic fires ({args.scale:g}x), {len(periods)} periods")
+
+    start = time.perf_counter()
+    index = TimeIndex(fires)
+    print(f"TimeIndex build: {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+    # Both sides must agree before their timings mean anything
+    for period in periods[:20]:
+        (scanned, _), (indexed, _) = scan_home(fires, *period), index_home(index, *period)
+        assert scanned[0] == indexed[0] and np.isclose(scanned[1], indexed[1]), (period, scanned, indexed)
+
+    cases = [
+        ('Home (summary + bar)', lambda *p: scan_home(fires, *p), lambda *p: index_home(index, *p)),
+        ('Trends (3 series)', lambda *p: scan_trends(fires, *p), lambda *p: index_trends(index, *p)),
+    ]
+    print(f"{'aggregate':<24}{'scan p50':>12}{'scan p95':>12}{'index p50':>12}{'index p95':>12}")
+    for name, before, after in cases:
+        scan = _latencies(before, periods)
+        lookup = _latencies(after, periods)
+        print(f"{name:<24}{np.percentile(scan, 50):>10.3f}ms{np.percentile(scan, 95):>10.3f}ms"
+              f"{np.percentile(lookup, 50):>10.3f}ms{np.percentile(lookup, 95):>10.3f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Vertex count, GeoJSON size and choropleth build time of every commune outline level.
+
+Run from the repository root (after ``python data_loader.py``):
+
+    python -m benchmarks.geometry_levels
+    python -m benchmarks.geometry_levels --department 13 --repeat 5
+
+The build time covers what the browser receives for a level: the
+choropleth with its outlines inlined, built and encoded to JSON by Plotly.
+"""
+import argparse
+import json
+import time
+
+import plotly.express as px
+import plotly.io as pio
+import shapely
+
+from data_loader import DEFAULT_DEPARTMENT, GEOMETRY_LEVELS, ensure_snapshot
+from departments import DepartmentStore
+
+
+def render_seconds(department, geometry, repeat):
+    """Best time to build and serialize the department choropleth with ``geometry`` inlined."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fig = px.choropleth(department.commune_attributes, geojson=geometry, featureidkey='properties.INSEE_COM',
+                            locations='INSEE_COM', color='Density')
+        fig.update_geos(fitbounds="locations", visible=False)
+        pio.to_json(fig)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--department', default=DEFAULT_DEPARTMENT)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    department = DepartmentStore(ensure_snapshot()['departments']).get(args.department)
+    print(f"{department.name}: {department.extent_m / 1000:.0f} km across, "
+          f"default level {department.geometry_level()!r}")
+    print(f"{'level':>8} {'tolerance':>10} {'vertices':>10} {'GeoJSON KB':>11} {'build ms':>9}")
+    for level in ['full', *GEOMETRY_LEVELS]:
+        payload = department.geometry_json(level)
+        geometry = json.loads(payload)
+        vertices = sum(int(shapely.get_num_coordinates(shapely.from_geojson(json.dumps(feature['geometry']))))
+                       for feature in geometry['features'])
+        tolerance = f"{GEOMETRY_LEVELS[level]} m" if level in GEOMETRY_LEVELS else '-'
+        print(f"{level:>8} {tolerance:>10} {vertices:>10} {len(payload) / 1024:>11.1f} "
+              f"{render_seconds(department, geometry, args.repeat) * 1000:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
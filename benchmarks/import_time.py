@@ -0,0 +1,91 @@
+"""Cold start of app.py from ``python -X importtime``, checked against a startup budget.
+
+Imports app.py in a fresh process per mode, eager (the default) and lazy
+(LAZY_GEOMETRY=1), then times the first Home requests. Exits with status 1
+when the lazy import takes longer than --budget-ms or imports a module of
+the geometry stack. Run from the repository root:
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget-ms 2000 --top 12
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+# Modules a lazy start must not import: the geometry stack, and unidecode which app.py never used
+LAZY_FORBIDDEN = ('geopandas', 'pyproj', 'pyogrio', 'fiona', 'dfci_grid', 'unidecode')
+
+# Run in the child: import the app, then serve the Home page and its callbacks once
+CHILD = f"""
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter() - start
+client = app.server.test_client()
+client.get('/')
+client.get('/_dash-layout')
+app.update_data_summaries(None, None, None, app.DEFAULT_DEPARTMENT)
+app.update_bar_chart(None, None, None, app.DEFAULT_DEPARTMENT)
+print(json.dumps({{'import_s': imported, 'home_s': time.perf_counter() - start,
+                  'forbidden': [name for name in {LAZY_FORBIDDEN!r} if name in sys.modules]}}))
+"""
+
+
+def parse_importtime(stderr):
+    """Return ``{module: (self µs, cumulative µs, depth)}`` from ``-X importtime`` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        modules.setdefault(name.strip(), (int(self_us), int(cumulative_us), depth))
+    return modules
+
+
+def cold_start(lazy):
+    """Import app.py in a fresh process and return the child's timings plus the parsed import times."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        env = dict(os.environ, LAZY_GEOMETRY='1' if lazy else '0', DATA_RELOAD_INTERVAL_S='0',
+                   FIGURE_CACHE_WARMUP='0', FIGURE_CACHE_DIR=cache_dir)
+        process = subprocess.run([sys.executable, '-X', 'importtime', '-c', CHILD], env=env,
+                                 capture_output=True, text=True, check=True)
+    result = json.loads(process.stdout.splitlines()[-1])
+    result['modules'] = parse_importtime(process.stderr)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=2500, help="cumulative import time of app.py, lazy mode")
+    parser.add_argument('--top', type=int, default=8, help="slowest direct imports of app.py to list")
+    args = parser.parse_args()
+
+    runs = {'eager': cold_start(lazy=False), 'lazy': cold_start(lazy=True)}
+    print(f"{'mode':<8}{'import app':>12}{'first Home':>12}  geometry stack imported")
+    for mode, run in runs.items():
+        app_us = run['modules']['app'][1]
+        print(f"{mode:<8}{app_us / 1000:>10.0f}ms{run['home_s'] * 1000:>10.0f}ms  "
+              f"{', '.join(run['forbidden']) or 'no'}")
+
+    lazy = runs['lazy']
+    direct = sorted(((cumulative, name) for name, (_, cumulative, depth) in lazy['modules'].items() if depth == 1),
+                    reverse=True)
+    print(f"\nSlowest imports of app.py (lazy), {lazy['modules']['app'][0] / 1000:.0f} ms in app.py itself:")
+    for cumulative, name in direct[:args.top]:
+        print(f"  {name:<32}{cumulative / 1000:>8.0f}ms")
+
+    failures = []
+    if lazy['modules']['app'][1] / 1000 > args.budget_ms:
+        failures.append(f"import app took {lazy['modules']['app'][1] / 1000:.0f} ms, budget {args.budget_ms:.0f} ms")
+    if lazy['forbidden']:
+        failures.append(f"lazy start imported {', '.join(lazy['forbidden'])}")
+    print(f"\n{len(failures)} budget failure(s)" + ''.join(f"\n  {line}" for line in failures))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,310 @@
+"""Load test of the Dash callbacks: latency, throughput and worker memory under concurrent users.
+
+For every scale, a synthetic export shaped like Classeur1.csv is generated
+and snapshotted; app.py is then served by gunicorn for every worker count,
+and each callback is driven through ``/_dash-update-component`` with a
+realistic (year, commune) mix, 5 % of it without any fire. Run from the
+repository root:
+
+    python -m benchmarks.load_test --scales 10 100 1000 --workers 1 2 4
+    python -m benchmarks.load_test --scales 10 --save benchmarks/baselines/load_test.json
+    python -m benchmarks.load_test --scales 10 --compare benchmarks/baselines/load_test.json
+
+With --compare, a run whose p95 latency, throughput or worker RSS is more
+than --tolerance worse than the baseline is flagged, and the exit status is 1.
+Each run starts from an empty figure cache. Worker RSS is read from /proc
+(Linux only).
+"""
+import argparse
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+
+import numpy as np
+
+from data_loader import DEFAULT_DEPARTMENT, ensure_snapshot, read_partition
+from time_index import TimeIndex
+from benchmarks.synthetic import selection_mix, synthetic_csv
+
+# Outputs and inputs of the server-side callbacks, as registered in app.py
+CALLBACKS = {
+    'summaries': ([('max-fires', 'children'), ('total-area', 'children'), ('avg-area', 'children')],
+                  ['year-range', 'month-range', 'communes-dropdown', 'department-dropdown']),
+    'extremes': ([('max-area', 'children'), ('min-area', 'children')],
+                 ['year-range', 'month-range', 'communes-dropdown', 'department-dropdown']),
+    'bar': ([('bar-chart', 'figure')], ['year-range', 'month-range', 'communes-dropdown', 'department-dropdown']),
+    'insights': ([('pie-chart', 'figure'), ('bubble-chart', 'figure'), ('choropleth-map', 'figure')],
+                 ['year-dropdown', 'commune-dropdown', 'department-dropdown']),
+    'trends': ([('monthly-trends-graph', 'figure'), ('hourly-trends-graph', 'figure'),
+                ('yearly-trends-graph', 'figure')], ['year-range', 'month-range', 'department-dropdown']),
+}
+
+
+# -------------------------------
+# Dataset & Server
+# -------------------------------
+def prepare_dataset(scale, data_dir):
+    """Generate (once) the export ``scale`` times the size of Classeur1.csv and snapshot it."""
+    directory = os.path.join(data_dir, f'x{scale:g}')
+    csv_path = os.path.join(directory, 'Classeur1.csv')
+    if not os.path.exists(csv_path):
+        os.makedirs(directory, exist_ok=True)
+        synthetic_csv(csv_path + '.tmp', scale)
+        os.replace(csv_path + '.tmp', csv_path)
+    snapshot_dir = os.path.join(directory, 'snapshot')
+    ensure_snapshot(csv_path, directory=snapshot_dir)
+    return csv_path, snapshot_dir
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(workers, threads, csv_path, snapshot_dir, cache_dir, startup_timeout, env=None):
+    """Start gunicorn on app:server and return ``(process, base url)`` once it answers.
+
+    ``env`` adds environment variables, e.g. ``{'GUNICORN_PRELOAD': '1'}``.
+    """
+    port = _free_port()
+    env = dict(os.environ, FIRE_CSV=csv_path, SNAPSHOT_DIR=snapshot_dir, FIGURE_CACHE_DIR=cache_dir,
+               CLIENTSIDE_CALLBACKS='0', **(env or {}))
+    process = subprocess.Popen([sys.executable, '-m', 'gunicorn', 'app:server', '--workers', str(workers),
+                                '--threads', str(threads), '--bind', f'127.0.0.1:{port}', '--timeout', '600'],
+                               env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f'http://127.0.0.1:{port}'
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with status {process.returncode}")
+        try:
+            urllib.request.urlopen(url + '/', timeout=5).read()
+            return process, url
+        except (urllib.error.URLError, ConnectionError, socket.timeout):
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"gunicorn did not answer within {startup_timeout} s")
+
+
+def worker_pids(process):
+    with open(f'/proc/{process.pid}/task/{process.pid}/children') as f:
+        return [int(pid) for pid in f.read().split()]
+
+
+def worker_peak_rss_mb(process):
+    """Peak RSS (VmHWM) of every gunicorn worker of ``process``, in MB."""
+    peaks = []
+    for pid in worker_pids(process):
+        try:
+            with open(f'/proc/{pid}/status') as status:
+                for line in status:
+                    if line.startswith('VmHWM:'):
+                        peaks.append(int(line.split()[1]) / 1024)
+        except FileNotFoundError:  # a worker restarted during the run
+            pass
+    return peaks
+
+
+# -------------------------------
+# Load Generation
+# -------------------------------
+def update_request(callback, year, commune, department):
+    """Body of the ``/_dash-update-component`` request Dash sends for one dropdown change.
+
+    Home and Trends read the period sliders and the compared communes, which
+    the dropdowns set to that year (or every year) and that commune.
+    """
+    outputs, inputs = CALLBACKS[callback]
+    values = {'year-dropdown': year, 'commune-dropdown': commune, 'department-dropdown': department,
+              'year-range': [year, year] if year else None, 'month-range': [1, 12],
+              'communes-dropdown': [commune] if commune else []}
+    output_specs = [{'id': id_, 'property': prop} for id_, prop in outputs]
+    return {
+        'output': (f'{outputs[0][0]}.{outputs[0][1]}' if len(outputs) == 1
+                   else '..' + '...'.join(f'{id_}.{prop}' for id_, prop in outputs) + '..'),
+        'outputs': output_specs[0] if len(outputs) == 1 else output_specs,
+        'inputs': [{'id': id_, 'property': 'value', 'value': values[id_]} for id_ in inputs],
+        'changedPropIds': [f'{inputs[0]}.value'],
+        'state': [],
+    }
+
+
+def _empty_selections(df, limit=20):
+    # (year, commune) pairs of the dropdowns without a single fire
+    used = set(zip(df['Year'].astype(int), df['Commune'].astype(str)))
+    communes = sorted(df['Commune'].unique().astype(str))
+    return [(year, commune) for year in sorted(df['Year'].unique().astype(int).tolist())
+            for commune in communes if (year, commune) not in used][:limit]
+
+
+def request_mix(df, department, n, seed=0, empty_share=0.05):
+    """``n`` (callback, body) requests over a realistic mix of selections, ``empty_share`` of them without fires.
+
+    Selections without fires are drawn apart so that every run has some: an
+    empty bar chart used to fail with HTTP 500, which must count as an error.
+    """
+    index = TimeIndex(df)
+
+    def has_fires(year, commune):
+        return index.summary((year, year) if year else None, None, [commune] if commune else None).count > 0
+
+    mix = selection_mix(df, 4 * n, seed)
+    selections = [s for s in mix if has_fires(*s)] or [(None, None)]
+    empty = [s for s in mix if not has_fires(*s)] or _empty_selections(df)
+    rng = np.random.default_rng(seed)
+    names = list(CALLBACKS)
+    requests = []
+    for i in range(n):
+        callback = names[rng.integers(len(names))]
+        pool = empty if empty and rng.random() < empty_share else selections
+        requests.append((callback, update_request(callback, *pool[rng.integers(len(pool))], department)))
+    return requests
+
+
+def drive(url, requests, users):
+    """Send ``requests`` from ``users`` concurrent clients; return (wall seconds, latencies, errors)."""
+    latencies = defaultdict(list)
+    errors = []
+    pending = iter(requests)
+    lock = threading.Lock()
+
+    def user():
+        while True:
+            with lock:
+                item = next(pending, None)
+            if item is None:
+                return
+            callback, body = item
+            request = urllib.request.Request(url + '/_dash-update-component', data=json.dumps(body).encode(),
+                                             headers={'Content-Type': 'application/json'})
+            start = time.perf_counter()
+            try:
+                urllib.request.urlopen(request, timeout=600).read()
+            except (urllib.error.URLError, ConnectionError) as e:
+                with lock:
+                    errors.append(f"{callback}: {e}")
+                continue
+            with lock:
+                latencies[callback].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=user) for _ in range(users)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies, errors
+
+
+def _percentiles(seconds):
+    if not seconds:
+        return {'p50': None, 'p95': None, 'p99': None}
+    p50, p95, p99 = np.percentile(np.array(seconds) * 1000, [50, 95, 99])
+    return {'p50': round(p50, 2), 'p95': round(p95, 2), 'p99': round(p99, 2)}
+
+
+def run(scale, workers, args):
+    csv_path, snapshot_dir = prepare_dataset(scale, args.data_dir)
+    df, _ = read_partition(args.department, snapshot_dir)
+    requests = request_mix(df, args.department, args.warmup + args.requests, empty_share=args.empty_share)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        process, url = start_server(workers, args.threads, csv_path, snapshot_dir, cache_dir, args.startup_timeout)
+        try:
+            drive(url, requests[:args.warmup], args.users)  # every worker loads its partitions
+            wall, latencies, errors = drive(url, requests[args.warmup:], args.users)
+            rss = worker_peak_rss_mb(process)
+        finally:
+            process.terminate()
+            process.wait()
+    completed = sum(map(len, latencies.values()))
+    return {
+        'scale': scale, 'workers': workers, 'threads': args.threads, 'users': args.users, 'fires': len(df),
+        'requests': args.requests, 'errors': len(errors), 'error_samples': errors[:5],
+        'throughput': round(completed / wall, 2),
+        'latency_ms': {'all': _percentiles([s for seconds in latencies.values() for s in seconds]),
+                       **{callback: _percentiles(latencies[callback]) for callback in CALLBACKS}},
+        'rss_mb': {'max': round(max(rss, default=0), 1), 'total': round(sum(rss), 1)},
+    }
+
+
+# -------------------------------
+# Baselines
+# -------------------------------
+def _run_key(result):
+    return result['scale'], result['workers'], result['threads'], result['users']
+
+
+def regressions(results, baseline, tolerance):
+    """Describe every metric of ``results`` more than ``tolerance`` worse than the matching baseline run."""
+    previous = {_run_key(result): result for result in baseline['runs']}
+    found = []
+    for result in results:
+        before = previous.get(_run_key(result))
+        if before is None:
+            continue
+        label = "scale {}×, {} workers, {} threads, {} users".format(*_run_key(result))
+        checks = [('p95 latency', result['latency_ms']['all']['p95'], before['latency_ms']['all']['p95'], 1),
+                  ('throughput', result['throughput'], before['throughput'], -1),
+                  ('worker RSS', result['rss_mb']['max'], before['rss_mb']['max'], 1)]
+        for metric, now, then, worse in checks:
+            if now is not None and then and worse * (now - then) / then > tolerance:
+                found.append(f"{label}: {metric} {then:g} -> {now:g}")
+        if result['errors'] > before['errors']:
+            found.append(f"{label}: errors {before['errors']} -> {result['errors']}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=float, nargs='+', default=[10], help="sizes relative to Classeur1.csv")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help="gunicorn worker counts")
+    parser.add_argument('--threads', type=int, default=1, help="threads per gunicorn worker")
+    parser.add_argument('--users', type=int, default=16, help="concurrent clients")
+    parser.add_argument('--requests', type=int, default=400, help="measured requests per run")
+    parser.add_argument('--warmup', type=int, default=40, help="unmeasured requests before each run")
+    parser.add_argument('--department', default=DEFAULT_DEPARTMENT)
+    parser.add_argument('--empty-share', type=float, default=0.05, help="share of selections without fires")
+    parser.add_argument('--data-dir', default='load_test', help="where the synthetic exports are kept")
+    parser.add_argument('--startup-timeout', type=float, default=600)
+    parser.add_argument('--save', metavar='JSON', help="write the results as a baseline")
+    parser.add_argument('--compare', metavar='JSON', help="flag regressions against a saved baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="allowed relative regression (default 0.2)")
+    args = parser.parse_args()
+
+    print(f"{'scale':>7}{'fires':>12}{'workers':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'RSS MB':>9}{'errors':>8}")
+    results = []
+    for scale in args.scales:
+        for workers in args.workers:
+            result = run(scale, workers, args)
+            results.append(result)
+            latency = result['latency_ms']['all']
+            print(f"{scale:>6g}×{result['fires']:>12,}{workers:>8}{result['throughput']:>9.1f}"
+                  f"{latency['p50'] or 0:>9.1f}{latency['p95'] or 0:>9.1f}{latency['p99'] or 0:>9.1f}"
+                  f"{result['rss_mb']['max']:>9.0f}{result['errors']:>8}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.save) or '.', exist_ok=True)
+        with open(args.save, 'w') as f:
+            json.dump({'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+                       'cpus': os.cpu_count(), 'runs': results}, f, indent=2)
+        print(f"\nBaseline written to {args.save}")
+    if args.compare:
+        with open(args.compare) as f:
+            found = regressions(results, json.load(f), args.tolerance)
+        print(f"\n{len(found)} regression(s) against {args.compare}" + ''.join(f"\n  {line}" for line in found))
+        sys.exit(1 if found else 0)
+
+
+if __name__ == '__main__':
+    main()
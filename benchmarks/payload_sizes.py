@@ -0,0 +1,93 @@
+"""Serialized size of every figure-returning callback, checked against payload budgets and mark caps.
+
+Run from the repository root; exits with status 1 when a budget or a cap is
+exceeded, or when a selection without fires fails to draw:
+
+    python -m benchmarks.payload_sizes
+    BAR_CHART_MAX_BARS=20 BUBBLE_CHART_MAX_POINTS=50 python -m benchmarks.payload_sizes
+
+The bar and bubble chart budgets follow their caps (payloads.py), so any
+dataset must stay within them.
+"""
+import os
+import sys
+import tempfile
+
+import plotly.io as pio
+
+# Figures are built by the current code, not read from entries cached by an older one
+os.environ['FIGURE_CACHE_DIR'] = tempfile.mkdtemp(prefix='payload-sizes-')
+
+import app
+from benchmarks.synthetic import selection_mix
+from payloads import BAR_CHART_MAX_BARS, BUBBLE_CHART_MAX_POINTS
+
+# Maximum JSON bytes per figure, for any (year, commune) selection: the
+# plotly_dark template alone is about 7 KB, then every bar or bubble adds its
+# label, hover data and float32 / narrowed integer values
+PAYLOAD_BUDGETS = {
+    'choropleth-map': 64 * 1024,
+    'bar-chart': 10 * 1024 + 64 * BAR_CHART_MAX_BARS,
+    'bubble-chart': 10 * 1024 + 64 * BUBBLE_CHART_MAX_POINTS,
+}
+
+# Maximum marks (bars, bubbles) per figure
+MARK_CAPS = {
+    'bar-chart': BAR_CHART_MAX_BARS,
+    'bubble-chart': BUBBLE_CHART_MAX_POINTS,
+}
+
+
+def figure_payloads(selected_year, selected_commune):
+    """Return ``{output id: (serialized bytes, marks of the first trace)}`` for one selection."""
+    pie_fig, bubble_fig, choropleth_fig = app.update_insights(selected_year, selected_commune)
+    figures = {
+        'bar-chart': app.update_bar_chart((selected_year, selected_year) if selected_year else None, None,
+                                          [selected_commune] if selected_commune else None),
+        'pie-chart': pie_fig,
+        'bubble-chart': bubble_fig,
+        'choropleth-map': choropleth_fig,
+    }
+    return {output: (len(pio.to_json(fig).encode('utf-8')), len(fig['data'][0].get('x', ())))
+            for output, fig in figures.items()}
+
+
+def main():
+    mix = selection_mix(app.df, 200)
+    selections = [(None, None)] + [s for s in mix if len(app.default_department.selection(*s))][:20]
+    # Selections without fires must draw too (an empty bar chart once raised in px.bar)
+    empty = [s for s in mix if not len(app.default_department.selection(*s))][:3]
+    failed = False
+    for selection in empty:
+        try:
+            marks = figure_payloads(*selection)['bar-chart'][1]
+        except Exception as exc:
+            print(f"empty selection {selection}: {exc!r}")
+            failed = True
+            continue
+        if marks:
+            print(f"empty selection {selection}: {marks} bars")
+            failed = True
+
+    largest = {}
+    most_marks = {}
+    for selection in selections:
+        for output, (size, marks) in figure_payloads(*selection).items():
+            if size > largest.get(output, (0, None))[0]:
+                largest[output] = (size, selection)
+            most_marks[output] = max(marks, most_marks.get(output, 0))
+
+    for output, (size, selection) in sorted(largest.items()):
+        budget = PAYLOAD_BUDGETS.get(output)
+        cap = MARK_CAPS.get(output)
+        status = '' if budget is None else ('ok' if size <= budget else f'OVER BUDGET ({budget:,} B)')
+        if cap is not None and most_marks[output] > cap:
+            status += f' OVER CAP ({cap} marks)'
+        failed |= (budget is not None and size > budget) or (cap is not None and most_marks[output] > cap)
+        marks = f"{most_marks[output]:>5} marks" if cap is not None else ' ' * 11
+        print(f"{output:<16}{size:>12,} B{marks}  max at {selection}  {status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Bytes transferred by a cold and a warm load of the QGIS Mapping page.
+
+Run from the repository root:
+
+    python -m benchmarks.static_transfer
+    python -m benchmarks.static_transfer --with-raster   # also the climate raster layer
+
+A cold load has an empty browser cache. A warm load revalidates every asset
+with the ETag of the cold load, the worst case once ``max-age`` has expired.
+"""
+import argparse
+import os
+import re
+
+import app
+
+ACCEPT_ENCODING = 'gzip, deflate, br'
+RASTER = 'layers/Typologiedesclimatsfranais_3.png'
+
+
+def page_assets(with_raster=False):
+    """Return index.html and every local script and stylesheet it references."""
+    with open(os.path.join(app.html_file_directory, 'index.html'), encoding='utf-8') as f:
+        html = f.read()
+    paths = ['index.html'] + [os.path.normpath(path) for path in re.findall(r'(?:src|href)="(?!https?:|#)([^"]+)"', html)]
+    return paths + [RASTER] if with_raster else paths
+
+
+def load(client, paths, etags=None):
+    """Request every path and return ``(body bytes, {path: etag})``."""
+    transferred, seen = 0, {}
+    for path in paths:
+        headers = {'Accept-Encoding': ACCEPT_ENCODING}
+        if etags and etags.get(path):
+            headers['If-None-Match'] = etags[path]
+        response = client.get(f'/html/{path}', headers=headers)
+        transferred += len(response.get_data())
+        seen[path] = response.headers.get('ETag')
+    return transferred, seen
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--with-raster', action='store_true', help="include the 3 MB climate raster")
+    args = parser.parse_args()
+
+    paths = page_assets(args.with_raster)
+    raw = sum(os.path.getsize(os.path.join(app.html_file_directory, path)) for path in paths)
+    client = app.server.test_client()
+    cold, etags = load(client, paths)
+    warm, _ = load(client, paths, etags)
+
+    print(f"{len(paths)} assets")
+    print(f"uncompressed   {raw / 1024:10.1f} KB")
+    print(f"cold load      {cold / 1024:10.1f} KB ({cold / raw:.0%} of uncompressed)")
+    print(f"warm load      {warm / 1024:10.1f} KB (304 Not Modified bodies)")
+
+
+if __name__ == '__main__':
+    main()
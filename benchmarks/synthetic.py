@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+from data_loader import CSV_ENCODING, compact_fire_table
+
+# -------------------------------
+# Synthetic Fire Data
+# -------------------------------
+def scale_fires(df, factor, seed=0):
+    """Return a cleaned fire table ``factor`` times the size of ``df``.
+
+    Rows are resampled from ``df`` so the year/commune/DFCI mix stays realistic;
+    alert times are shifted by up to an hour and surfaces by ±50 % so that the
+    copies are not exact duplicates.
+    """
+    rng = np.random.default_rng(seed)
+    n_rows = int(len(df) * factor)
+    fires = df.iloc[rng.integers(0, len(df), n_rows)].reset_index(drop=True)
+    fires['Alerte'] = fires['Alerte'] + pd.to_timedelta(rng.integers(0, 3600, n_rows), unit='s')
+    surface = fires['Surface parcourue (m2)'] * rng.uniform(0.5, 1.5, n_rows)
+    fires['Surface parcourue (m2)'] = surface.round().astype(df['Surface parcourue (m2)'].dtype)
+    if 'Year' in fires.columns:
+        fires = compact_fire_table(fires)  # keep Year/Month/Hour in line with the shifted alerts
+    return fires
+
+
+def selection_mix(df, n, seed=0):
+    """Draw ``n`` realistic (year, commune) dropdown selections, None meaning "all"."""
+    rng = np.random.default_rng(seed)
+    years = np.sort(df['Alerte'].dt.year.unique())
+    communes = np.sort(df['Commune'].unique())
+    selections = []
+    for _ in range(n):
+        year = int(rng.choice(years)) if rng.random() < 0.7 else None
+        commune = str(rng.choice(communes)) if rng.random() < 0.5 else None
+        selections.append((year, commune))
+    return selections
+
+
+def period_mix(df, n, seed=0):
+    """Draw ``n`` realistic (years, months, communes) sidebar periods, None / [] meaning "all".
+
+    Years are a range of 1 to 15 years, months a season such as June-September
+    half of the time, and 0 to 5 communes are compared.
+    """
+    rng = np.random.default_rng(seed)
+    first_year, last_year = int(df['Year'].min()), int(df['Year'].max())
+    communes = np.sort(df['Commune'].unique().astype(str))
+    periods = []
+    for _ in range(n):
+        years = None
+        if rng.random() < 0.8:
+            start = int(rng.integers(first_year, last_year + 1))
+            years = (start, min(start + int(rng.integers(0, 15)), last_year))
+        months = None
+        if rng.random() < 0.5:
+            start = int(rng.integers(1, 13))
+            months = (start, int(rng.integers(start, 13)))
+        compared = [str(commune) for commune in rng.choice(communes, int(rng.integers(0, 6)), replace=False)]
+        periods.append((years, months, compared))
+    return periods
+
+
+def synthetic_csv(path, factor, source='Classeur1.csv', seed=0, block_rows=500_000):
+    """Write a Classeur1.csv-shaped export ``factor`` times the size of ``source`` and return its row count.
+
+    Lines are resampled like ``scale_fires`` (alert times shifted by up to an
+    hour, surfaces by ±50 %) and written block by block, so a 1000× export
+    never has to fit in memory. Malformed lines of ``source`` are left out.
+    """
+    rng = np.random.default_rng(seed)
+    raw = pd.read_csv(source, encoding=CSV_ENCODING, delimiter=';', dtype=str, keep_default_na=False,
+                      on_bad_lines='skip')
+    alerts = pd.to_datetime(raw['Alerte'], errors='coerce')
+    surfaces = pd.to_numeric(raw['Surface parcourue (m2)'], errors='coerce')
+    n_rows = int(len(raw) * factor)
+    with open(path, 'w', encoding=CSV_ENCODING, newline='') as f:
+        for start in range(0, n_rows, block_rows):
+            rows = rng.integers(0, len(raw), min(block_rows, n_rows - start))
+            block = raw.iloc[rows].reset_index(drop=True)
+            block['Numéro'] = np.arange(start, start + len(rows))
+            shifted = alerts.iloc[rows].reset_index(drop=True) + pd.to_timedelta(rng.integers(0, 3600, len(rows)), unit='s')
+            block['Alerte'] = shifted.dt.strftime('%Y-%m-%d %H:%M:%S').fillna(block['Alerte'])
+            scaled = (surfaces.iloc[rows].reset_index(drop=True) * rng.uniform(0.5, 1.5, len(rows))).round()
+            block['Surface parcourue (m2)'] = scaled.astype('Int64').astype(str).where(scaled.notna(),
+                                                                                    block['Surface parcourue (m2)'])
+            block.to_csv(f, sep=';', index=False, header=start == 0)
+    return n_rows
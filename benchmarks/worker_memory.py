@@ -0,0 +1,70 @@
+"""Per-worker memory of gunicorn: copied partitions, memory-mapped partitions, and a preloading master.
+
+Every mode serves the same synthetic export with each worker count, sends a
+few requests so every worker has built its department, then reads the
+workers' memory from /proc (Linux only). Run from the repository root:
+
+    python -m benchmarks.worker_memory --scale 100 --workers 1 2 4
+
+RSS counts every page a worker maps, shared ones included; USS only the
+pages private to it, and PSS splits shared pages between the processes
+using them. The total PSS (master included) is what the server really costs.
+"""
+import argparse
+import tempfile
+
+from data_loader import DEFAULT_DEPARTMENT, read_partition
+from benchmarks.load_test import drive, prepare_dataset, request_mix, start_server, worker_pids
+
+MODES = {
+    'copy': {'SNAPSHOT_ZERO_COPY': '0', 'GUNICORN_PRELOAD': '0'},
+    'mmap': {'SNAPSHOT_ZERO_COPY': '1', 'GUNICORN_PRELOAD': '0'},
+    'mmap + preload': {'SNAPSHOT_ZERO_COPY': '1', 'GUNICORN_PRELOAD': '1'},
+}
+
+
+def memory_mb(pid):
+    """``{'rss': ..., 'pss': ..., 'uss': ...}`` of one process, in MB."""
+    fields = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1]) / 1024
+    return {'rss': fields['Rss'], 'pss': fields['Pss'], 'uss': fields['Private_Clean'] + fields['Private_Dirty']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', type=float, default=100, help="size relative to Classeur1.csv")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--requests', type=int, default=40, help="requests sent before measuring")
+    parser.add_argument('--department', default=DEFAULT_DEPARTMENT)
+    parser.add_argument('--data-dir', default='load_test', help="where the synthetic exports are kept")
+    args = parser.parse_args()
+
+    csv_path, snapshot_dir = prepare_dataset(args.scale, args.data_dir)
+    df, _ = read_partition(args.department, snapshot_dir)
+    requests = request_mix(df, args.department, args.requests)
+    print(f"{len(df):,} fires in department {args.department} ({args.scale:g}× Classeur1.csv)\n")
+
+    print(f"{'mode':<16}{'workers':>8}{'RSS/worker':>12}{'USS/worker':>12}{'total PSS':>11}")
+    for mode, env in MODES.items():
+        for workers in args.workers:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                process, url = start_server(workers, 1, csv_path, snapshot_dir, cache_dir, 600,
+                                            env=dict(env, DATA_RELOAD_INTERVAL_S='0'))
+                try:
+                    drive(url, requests, 2 * workers)
+                    usage = [memory_mb(pid) for pid in worker_pids(process)]
+                    master = memory_mb(process.pid)
+                finally:
+                    process.terminate()
+                    process.wait()
+            print(f"{mode:<16}{workers:>8}{sum(u['rss'] for u in usage) / workers:>10.0f}MB"
+                  f"{sum(u['uss'] for u in usage) / workers:>10.0f}MB"
+                  f"{master['pss'] + sum(u['pss'] for u in usage):>9.0f}MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,659 @@
+import argparse
+import glob
+import hashlib
+import io
+import json
+import os
+import time
+import warnings
+from collections import Counter, defaultdict
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from atomic_files import replace_atomically
+from fire_index import sort_fire_table
+
+# geopandas and shapely are imported by the functions reading or writing
+# outlines, so that the fires alone are read without the geometry stack
+
+# -------------------------------
+# Source & Snapshot Paths
+# -------------------------------
+# FIRE_CSV / SNAPSHOT_DIR point a server at another export, e.g. the load-test datasets
+csv_file_path = os.environ.get('FIRE_CSV', 'Classeur1.csv')
+#shapefile_path = "C:/Users/Lutfi/Desktop/Forest Fire Project/Dashboard_Project/shapefile/Commune_BR_13.shp"
+shapefile_path = "shapefile/Commune_BR_13.shp"
+# Every commune shapefile in this directory is used; adding one for another
+# department makes that department available in the dashboard
+shapefile_directory = "shapefile"
+
+# Cleaned columns are written here as uncompressed Arrow IPC (Feather) files,
+# one partition per department, so a worker can memory-map the departments it
+# needs instead of parsing the CSV and shapefiles
+snapshot_directory = os.environ.get('SNAPSHOT_DIR', 'snapshot')
+SNAPSHOT_FIRES = 'fires.arrow'
+SNAPSHOT_COMMUNES = 'communes.arrow'
+SNAPSHOT_MANIFEST = 'manifest.json'
+SNAPSHOT_COMMUNE_LEVEL = 'communes.{}.arrow'
+# Bump whenever the cleaning steps change what the snapshot holds
+SNAPSHOT_FORMAT = 9
+
+# Simplified commune outlines for the choropleth, by tolerance in metres. The
+# communes are simplified as a coverage, so neighbours keep a shared border
+GEOMETRY_LEVELS = {'high': 25, 'medium': 100, 'low': 400}
+
+DEFAULT_DEPARTMENT = os.environ.get('DEFAULT_DEPARTMENT', '13')
+
+# Fire columns are wrapped around the memory-mapped Arrow buffers instead of being
+# copied: every worker reading a partition then shares the same page-cache pages
+SNAPSHOT_ZERO_COPY = os.environ.get('SNAPSHOT_ZERO_COPY', '1') == '1'
+
+#geojson_file_path = "C:/Users/Lutfi/Desktop/Forest Fire Project/Dashboard_Project/geojson/all_communes.geojson"
+geojson_file_path = "geojson/all_communes.geojson"
+per_fire_geojson_file_path = "geojson/all_fires.geojson"
+
+# The CSV is parsed in blocks of this size, so peak memory does not grow with the export
+CSV_CHUNK_MB = float(os.environ.get('CSV_CHUNK_MB', 32))
+# ISO-8859-1 maps every byte to a character: decoding never fails, no second read is needed
+CSV_ENCODING = 'ISO-8859-1'
+
+# String columns with few distinct values, kept as pandas categoricals
+CATEGORICAL_COLUMNS = ('Commune', 'Code INSEE', 'Département', "Origine de l'alerte", 'Code du carreau DFCI')
+
+# Every file of the shapefile that affects what gpd.read_file returns
+SHAPEFILE_PARTS = ('.shp', '.shx', '.dbf', '.prj', '.cpg')
+
+
+# -------------------------------
+# Load Data & Cleaning
+# -------------------------------
+def _iter_csv_blocks(csv_path, chunk_bytes, offset=0):
+    """Yield ``(header, block)`` byte strings, every block ending on a line boundary.
+
+    ``offset`` starts reading further into the file, after the header line.
+    """
+    with open(csv_path, 'rb') as f:
+        header = f.readline()
+        if offset:
+            f.seek(offset)
+        while True:
+            block = f.read(chunk_bytes)
+            if not block:
+                break
+            yield header, block + f.readline()
+
+
+def clean_fire_chunk(df1, department='13', stats=None):
+    """Apply the cleaning steps to one chunk of the CSV, counting the rows each step drops."""
+    stats = Counter() if stats is None else stats
+
+    # Clean column names and types
+    df1.columns = df1.columns.str.strip()
+
+    # Ensure Code INSEE exists and clean it
+    if 'Code INSEE' not in df1.columns:
+        raise ValueError("'Code INSEE' column not found in CSV file.")
+    df1['Code INSEE'] = df1['Code INSEE'].astype(str).str.strip()
+
+    # Extract the first two digits of 'Code INSEE' from df1 and filter for the Department '13'
+    df = df1[df1['Code INSEE'].str[:2] == department] if department else df1
+    stats['other_department'] += len(df1) - len(df)
+
+    df['Alerte'] = pd.to_datetime(df['Alerte'], errors='coerce')
+    unparsed = df['Alerte'].isna()
+    stats['unparsed_alert'] += int(unparsed.sum())
+
+    # Filter CSV by year range (1973–2024) - Here all years took for the entire df
+    in_range = (df['Alerte'].dt.year >= 1970) & (df['Alerte'].dt.year <= 2024)
+    stats['out_of_range'] += int((~in_range & ~unparsed).sum())
+    df = df[in_range]
+
+    # Drop rows with NaN values in any column
+    kept = df.dropna(how='any')
+    stats['missing_values'] += len(df) - len(kept)
+
+    # One malformed line read as text turns its column to text for the whole chunk:
+    # once it is dropped, give the numeric columns back the type of the other chunks
+    for column in kept.columns.difference([*CATEGORICAL_COLUMNS, 'Alerte']):
+        if not pd.api.types.is_numeric_dtype(kept[column]):
+            try:
+                kept[column] = pd.to_numeric(kept[column])
+            except (ValueError, TypeError):
+                pass
+    stats['kept'] += len(kept)
+    return kept
+
+
+def iter_fire_chunks(csv_path=csv_file_path, department='13', chunk_bytes=None, offset=0, stats=None):
+    """Stream the DFCI export and yield cleaned chunks of at most ``chunk_bytes`` of CSV each.
+
+    The categorical columns are read as strings, so a chunk without any
+    Corsican (2A/2B) code gets the same column types as the others.
+
+    Malformed lines are skipped like before, but counted in ``stats['bad_lines']``
+    together with the rows dropped by every cleaning step.
+    """
+    chunk_bytes = int((CSV_CHUNK_MB if chunk_bytes is None else chunk_bytes) * 2 ** 20)
+    stats = Counter() if stats is None else stats
+    for header, block in _iter_csv_blocks(csv_path, chunk_bytes, offset):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', pd.errors.ParserWarning)
+            df1 = pd.read_csv(io.BytesIO(header + block), encoding=CSV_ENCODING, delimiter=';',
+                              on_bad_lines='warn', dtype=dict.fromkeys(CATEGORICAL_COLUMNS, str))
+        stats['bad_lines'] += sum(str(warning.message).count('Skipping line') for warning in caught)
+        stats['rows_read'] += len(df1)
+        yield clean_fire_chunk(df1, department, stats)
+
+
+def load_fire_csv(csv_path=csv_file_path, department='13', stats=None):
+    """Read the DFCI export and return the cleaned fire records of one department.
+
+    ``department=None`` keeps the records of all of France.
+    """
+    df = pd.concat(list(iter_fire_chunks(csv_path, department, stats=stats)), ignore_index=True)
+
+    # Drop columns that contain all NaN values
+    return df.dropna(axis=1, how='all')
+
+
+def concat_fire_tables(tables):
+    """Concatenate compact fire tables, keeping their categorical columns categorical."""
+    tables = [table for table in tables if len(table)] or tables[:1]
+    for column in CATEGORICAL_COLUMNS:
+        if all(column in table.columns for table in tables):
+            categories = sorted(set().union(*(table[column].cat.categories for table in tables)))
+            tables = [table.assign(**{column: table[column].cat.set_categories(categories)}) for table in tables]
+    return pd.concat(tables, ignore_index=True)
+
+
+def compact_fire_table(df):
+    """Store the repeated strings as categoricals and precompute the alert year, month and hour.
+
+    Filters and ``value_counts`` on these columns then work on small
+    integer codes instead of Python strings and datetime accessors.
+    """
+    df = df.copy()
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    df['Year'] = df['Alerte'].dt.year.astype('int16')
+    df['Month'] = df['Alerte'].dt.month.astype('int8')
+    df['Hour'] = df['Alerte'].dt.hour.astype('int8')
+    df['Surface parcourue (m2)'] = df['Surface parcourue (m2)'].astype('float32')
+    return df
+
+
+def load_communes(path=shapefile_path):
+    """Read the commune shapefile, drop invalid/empty geometries and reproject to EPSG:4326."""
+    import geopandas as gpd
+
+    gdf = gpd.read_file(path)
+    gdf.columns = gdf.columns.str.strip()
+    gdf['INSEE_COM'] = gdf['INSEE_COM'].astype(str).str.strip()
+    gdf['NOM_DEPT'] = gdf['NOM_DEPT'].astype(str).str.strip()
+
+    # -------------------------------
+    # Validate Geometries
+    # -------------------------------
+    invalid_geometries = gdf[~gdf.is_valid]
+    if not invalid_geometries.empty:
+        print(f"Found {len(invalid_geometries)} invalid geometries. These will be ignored.")
+    gdf = gdf[gdf.is_valid]
+
+    # Ensure no empty geometries
+    gdf = gdf[~gdf.geometry.is_empty]
+
+    if gdf.empty:
+        raise ValueError("Commune GeoDataFrame is empty after filtering valid geometries!")
+
+    # -------------------------------
+    # Set CRS and Reproject gdf
+    # -------------------------------
+    if gdf.crs is None:
+        gdf = gdf.set_crs(epsg=2154)  # Assuming original CRS
+    return gdf.to_crs(epsg=4326).reset_index(drop=True)
+
+
+# -------------------------------
+# Source Fingerprint
+# -------------------------------
+def shapefile_paths(directory=shapefile_directory):
+    """List the commune shapefiles, one or more departments each."""
+    return sorted(glob.glob(os.path.join(directory, '*.shp')))
+
+
+def source_files(csv_path=csv_file_path, shp_paths=None):
+    """List every input file the snapshot is derived from."""
+    files = [csv_path]
+    for shp_path in shapefile_paths() if shp_paths is None else shp_paths:
+        base = os.path.splitext(shp_path)[0]
+        files += [base + ext for ext in SHAPEFILE_PARTS if os.path.exists(base + ext)]
+    return files
+
+
+def _file_digest(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def source_fingerprint(paths, previous=None):
+    """Hash the input files into one key.
+
+    Files whose size and mtime match ``previous`` (the ``files`` entry of an
+    existing manifest) reuse the stored digest instead of being re-read.
+    """
+    previous = previous or {}
+    files = {}
+    for path in paths:
+        stat = os.stat(path)
+        known = previous.get(path)
+        if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns:
+            digest = known['sha256']
+        else:
+            digest = _file_digest(path)
+        files[path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+
+    combined = hashlib.sha256(f"format {SNAPSHOT_FORMAT}".encode())
+    for path in sorted(files):
+        combined.update(files[path]['sha256'].encode())
+    return combined.hexdigest(), files
+
+
+# -------------------------------
+# Columnar Snapshot
+# -------------------------------
+def _read_manifest(directory):
+    try:
+        with open(os.path.join(directory, SNAPSHOT_MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def department_code(insee_codes):
+    """Department of each INSEE code: its first two characters ('13', '2A', ...)."""
+    return insee_codes.astype(str).str[:2]
+
+
+def _partition_directory(directory, department):
+    return os.path.join(directory, 'departments', department)
+
+
+def simplify_communes(communes, tolerance):
+    """Return the ``INSEE_COM`` and outline of every commune simplified by ``tolerance`` metres.
+
+    Simplification runs in Lambert-93 (EPSG:2154) and the result is returned
+    in EPSG:4326, rounded to 1e-5 degrees. When the outlines do not
+    form a valid coverage, each one is simplified on its own instead.
+    """
+    import geopandas as gpd
+    import shapely
+
+    projected = communes[['INSEE_COM', 'geometry']].to_crs(2154)
+    outlines = projected.geometry.values.to_numpy()
+    if shapely.coverage_is_valid(outlines):
+        simplified = shapely.coverage_simplify(outlines, tolerance)
+    else:
+        simplified = shapely.simplify(outlines, tolerance, preserve_topology=True)
+    outlines = projected.set_geometry(gpd.GeoSeries(simplified, index=projected.index, crs=2154)).to_crs(4326)
+    # Coordinates on a ~1 m grid, far finer than the tolerance, shorten the GeoJSON
+    return outlines.set_geometry(gpd.GeoSeries(shapely.set_precision(outlines.geometry.values.to_numpy(), 1e-5),
+                                               index=outlines.index, crs=4326))
+
+
+def _write_manifest(directory, manifest):
+    def write(p):
+        with open(p, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    # The manifest goes last so it only ever points at complete data files
+    replace_atomically(write, os.path.join(directory, SNAPSHOT_MANIFEST))
+
+
+def _write_partition_fires(directory, department, df):
+    # Chunks are compacted before they are split, so their categories span the whole
+    # export: only the department's own are kept (indexes and grids size with them)
+    df = df.assign(**{column: df[column].cat.remove_unused_categories()
+                      for column in CATEGORICAL_COLUMNS if column in df.columns})
+    partition = _partition_directory(directory, department)
+    os.makedirs(partition, exist_ok=True)
+    # One record batch: a column split in several batches cannot be read without a copy
+    replace_atomically(lambda p: df.to_feather(p, compression='uncompressed', chunksize=max(len(df), 1)),
+                        os.path.join(partition, SNAPSHOT_FIRES))
+
+
+def _digest(*parts):
+    sha = hashlib.sha1()
+    for part in parts:
+        sha.update(part if isinstance(part, bytes) else str(part).encode())
+    return sha.hexdigest()[:16]
+
+
+def year_versions(df):
+    """Content token of every alert year of a partition: it only changes when that year's rows do."""
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return {str(int(year)): _digest(hashes[positions].tobytes())
+            for year, positions in df.groupby('Year').indices.items()}
+
+
+def communes_version(communes):
+    """Content token of a department's commune attributes and outlines."""
+    import shapely
+
+    attributes = pd.util.hash_pandas_object(communes.drop(columns='geometry'), index=False).to_numpy()
+    return _digest(attributes.tobytes(), *shapely.to_wkb(communes.geometry.values.to_numpy()))
+
+
+def _versioned(entry, years, communes):
+    # The department version covers everything its partition holds
+    versions = {'communes': communes, 'years': years}
+    return dict(entry, versions=versions, version=_digest(communes, *sorted(years.items())))
+
+
+def _split_by_department(chunk):
+    """Compact a cleaned chunk and split it into ``{department: rows}``."""
+    departments = department_code(chunk['Code INSEE']).to_numpy()
+    chunk = compact_fire_table(chunk)
+    return {department: part for department, part in chunk.groupby(departments)}
+
+
+def build_snapshot(csv_path=csv_file_path, shp_paths=None, directory=snapshot_directory):
+    """Run the full CSV + shapefile pipeline and write one partition per department.
+
+    The CSV is streamed chunk by chunk and every chunk is compacted before it
+    is kept. Only departments with both fire records and commune geometries
+    sharing INSEE codes get a partition. Returns the new manifest.
+    """
+    shp_paths = shapefile_paths() if shp_paths is None else shp_paths
+    os.makedirs(directory, exist_ok=True)
+    key, files = source_fingerprint(source_files(csv_path, shp_paths), (_read_manifest(directory) or {}).get('files'))
+
+    stats = Counter()
+    fires_by_department = defaultdict(list)
+    for chunk in iter_fire_chunks(csv_path, department=None, stats=stats):
+        for department, part in _split_by_department(chunk).items():
+            fires_by_department[department].append(part)
+
+    communes = pd.concat([load_communes(path) for path in shp_paths], ignore_index=True)
+    communes_by_department = dict(list(communes.groupby(department_code(communes['INSEE_COM']))))
+
+    departments = {}
+    for department, parts in sorted(fires_by_department.items()):
+        department_communes = communes_by_department.get(department)
+        df = sort_fire_table(concat_fire_tables(parts))
+        if department_communes is None or not set(department_communes['INSEE_COM']) & set(df['Code INSEE']):
+            continue
+
+        department_communes = department_communes.reset_index(drop=True)
+        _write_partition_fires(directory, department, df)
+        replace_atomically(lambda p: department_communes.to_feather(p, compression='uncompressed'),
+                            os.path.join(_partition_directory(directory, department), SNAPSHOT_COMMUNES))
+        for level, tolerance in GEOMETRY_LEVELS.items():
+            outlines = simplify_communes(department_communes, tolerance)
+            replace_atomically(lambda p: outlines.to_feather(p, compression='uncompressed'),
+                                os.path.join(_partition_directory(directory, department), SNAPSHOT_COMMUNE_LEVEL.format(level)))
+        departments[department] = _versioned({
+            'name': str(department_communes['NOM_DEPT'].iloc[0]),
+            'rows': len(df),
+            'communes': len(department_communes),
+            'last_alert': df['Alerte'].max().isoformat(),
+        }, year_versions(df), communes_version(department_communes))
+
+    if not departments:
+        raise ValueError("No common INSEE codes found between shapefile and CSV!")
+
+    manifest = {
+        'key': key, 'format': SNAPSHOT_FORMAT, 'files': files, 'departments': departments,
+        'shapefile_departments': sorted(communes_by_department), 'ingest': dict(stats),
+    }
+    _write_manifest(directory, manifest)
+    return manifest
+
+
+def _prefix_digest(path, size):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        remaining = size
+        while remaining > 0:
+            block = f.read(min(1 << 20, remaining))
+            if not block:
+                break
+            sha.update(block)
+            remaining -= len(block)
+    return sha.hexdigest()
+
+
+def append_snapshot(manifest, csv_path=csv_file_path, shp_paths=None, directory=snapshot_directory):
+    """Add the alerts of a newer CSV export to the existing partitions.
+
+    When the new export starts with the exact bytes of the previous one, only
+    the lines after them are parsed. Otherwise the whole file is streamed and
+    only rows whose alert is later than the last one stored for their
+    department are kept. Returns the updated manifest,
+    or None when the change needs a full rebuild (a shapefile changed, or a
+    department with geometries gets its first fires).
+    """
+    if manifest.get('format') != SNAPSHOT_FORMAT:
+        return None
+    key, files = source_fingerprint(source_files(csv_path, shp_paths), manifest.get('files'))
+    previous_files = manifest.get('files', {})
+    if set(files) != set(previous_files) or any(
+            files[path]['sha256'] != previous_files[path]['sha256'] for path in files if path != csv_path):
+        return None
+
+    previous_csv = previous_files[csv_path]
+    appended_only = (files[csv_path]['size'] >= previous_csv['size']
+                     and _prefix_digest(csv_path, previous_csv['size']) == previous_csv['sha256'])
+    offset = previous_csv['size'] if appended_only else 0
+
+    departments = dict(manifest['departments'])
+    stats = Counter()
+    new_fires = defaultdict(list)
+    for chunk in iter_fire_chunks(csv_path, department=None, offset=offset, stats=stats):
+        for department, part in _split_by_department(chunk).items():
+            if department not in departments:
+                if department in manifest.get('shapefile_departments', ()):
+                    return None
+                continue
+            if not appended_only:
+                part = part[part['Alerte'] > pd.Timestamp(departments[department]['last_alert'])]
+            if len(part):
+                new_fires[department].append(part)
+
+    for department, parts in new_fires.items():
+        history = read_fires(department, directory)
+        df = sort_fire_table(concat_fire_tables([history] + parts))
+        _write_partition_fires(directory, department, df)
+        entry = dict(departments[department], rows=len(df), last_alert=df['Alerte'].max().isoformat())
+        departments[department] = _versioned(entry, year_versions(df), entry['versions']['communes'])
+        stats['appended'] += len(df) - len(history)
+
+    manifest = dict(manifest, key=key, files=files, departments=departments, ingest=dict(stats))
+    _write_manifest(directory, manifest)
+    return manifest
+
+
+def frame_from_arrow(table):
+    """Return a DataFrame of ``table`` whose columns are views of its Arrow buffers where possible.
+
+    Numeric and timestamp columns, and the codes of categoricals, are used in
+    place (read-only); columns with nulls or several chunks are converted
+    with a copy, like ``to_pandas()`` does for every column.
+    """
+    dictionaries = [name for name, column in zip(table.column_names, table.columns) if pa.types.is_dictionary(column.type)]
+    plain = table.drop_columns(dictionaries).to_pandas(split_blocks=True)
+    columns = {}
+    for name in table.column_names:
+        column = table.column(name)
+        if name not in dictionaries:
+            columns[name] = plain[name]
+        elif column.num_chunks == 1 and column.null_count == 0:
+            chunk = column.chunk(0)
+            dtype = pd.CategoricalDtype(pd.Index(chunk.dictionary.to_pandas()), ordered=chunk.type.ordered)
+            columns[name] = pd.Categorical.from_codes(chunk.indices.to_numpy(zero_copy_only=True), dtype=dtype,
+                                                      validate=False)
+        else:
+            columns[name] = column.to_pandas()
+    return pd.DataFrame(columns, copy=False)
+
+
+def read_fires(department=DEFAULT_DEPARTMENT, directory=snapshot_directory):
+    """Memory-map the fires of one department's partition."""
+    table = feather.read_table(os.path.join(_partition_directory(directory, department), SNAPSHOT_FIRES),
+                               memory_map=True)
+    return frame_from_arrow(table) if SNAPSHOT_ZERO_COPY else table.to_pandas()
+
+
+def read_communes(department=DEFAULT_DEPARTMENT, directory=snapshot_directory):
+    """Memory-map the commune outlines (EPSG:4326) of one department's partition."""
+    import geopandas as gpd
+
+    return gpd.read_feather(os.path.join(_partition_directory(directory, department), SNAPSHOT_COMMUNES),
+                            memory_map=True)
+
+
+def read_partition(department=DEFAULT_DEPARTMENT, directory=snapshot_directory):
+    """Memory-map one department's partition and return ``(df, communes)``."""
+    return read_fires(department, directory), read_communes(department, directory)
+
+
+def read_geometry_level(department, level, directory=snapshot_directory):
+    """Memory-map the simplified commune outlines of one department (a ``GEOMETRY_LEVELS`` key)."""
+    import geopandas as gpd
+
+    path = os.path.join(_partition_directory(directory, department), SNAPSHOT_COMMUNE_LEVEL.format(level))
+    return gpd.read_feather(path, memory_map=True)
+
+
+def read_manifest(directory=snapshot_directory):
+    """Return the manifest of the current snapshot, or None when there is none yet."""
+    return _read_manifest(directory)
+
+
+def ensure_snapshot(csv_path=csv_file_path, shp_paths=None, directory=snapshot_directory):
+    """Return the manifest of a snapshot matching the current sources, updating it if needed.
+
+    When only the CSV changed, its new alerts are appended to the existing
+    partitions; any other change of the source files rebuilds the snapshot.
+    """
+    manifest = _read_manifest(directory)
+    if manifest is not None:
+        key, _ = source_fingerprint(source_files(csv_path, shp_paths), manifest.get('files'))
+        if key == manifest.get('key'):
+            return manifest
+        updated = append_snapshot(manifest, csv_path, shp_paths, directory)
+        if updated is not None:
+            return updated
+    return build_snapshot(csv_path, shp_paths, directory)
+
+
+def load_data(department=DEFAULT_DEPARTMENT, csv_path=csv_file_path, shp_paths=None, directory=snapshot_directory):
+    """Return the cleaned fires and reprojected communes of one department, from the snapshot."""
+    ensure_snapshot(csv_path, shp_paths, directory)
+    try:
+        return read_partition(department, directory)
+    except (OSError, ValueError) as exc:
+        print(f"Snapshot in {directory} is unreadable ({exc}), rebuilding it.")
+        build_snapshot(csv_path, shp_paths, directory)
+        return read_partition(department, directory)
+
+
+# -------------------------------
+# GeoJSON Export
+# -------------------------------
+def commune_fire_summary(communes, df):
+    """Return one row per commune with its fire statistics as plain columns."""
+    surface = df.groupby('Code INSEE', observed=True)['Surface parcourue (m2)']
+    alerts = df.groupby('Code INSEE', observed=True)['Alerte']
+    stats = pd.DataFrame({
+        'fire_count': surface.size(),
+        'burned_m2_total': surface.sum(),
+        'burned_m2_max': surface.max(),
+        'first_alert': alerts.min().dt.strftime('%Y-%m-%d %H:%M'),
+        'last_alert': alerts.max().dt.strftime('%Y-%m-%d %H:%M'),
+    })
+    summary = communes.merge(stats, how='left', left_on='INSEE_COM', right_index=True)
+    summary['fire_count'] = summary['fire_count'].fillna(0).astype('int64')
+    summary['burned_m2_total'] = summary['burned_m2_total'].fillna(0)
+    return summary
+
+
+def export_geojson(gdf, path=geojson_file_path):
+    """Write ``gdf`` as GeoJSON unless the file already holds exactly that content.
+
+    The file is replaced atomically, so concurrent exports never leave a
+    truncated file behind. Returns True when the file was (re)written.
+    """
+    payload = gdf.to_json(drop_id=True, default=str).encode('utf-8')
+    if os.path.exists(path) and _file_digest(path) == hashlib.sha256(payload).hexdigest():
+        return False
+
+    def write(p):
+        with open(p, 'wb') as f:
+            f.write(payload)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    replace_atomically(write, path)
+    return True
+
+
+def export_geojson_artifacts(per_fire=False):
+    """Export the commune GeoJSON (one feature per commune, fire statistics as properties).
+
+    With ``per_fire`` the former layout, one commune polygon per fire row, is
+    also written to ``per_fire_geojson_file_path``.
+    """
+    df, communes = load_data()
+    written = {geojson_file_path: export_geojson(commune_fire_summary(communes, df), geojson_file_path)}
+    if per_fire:
+        per_fire_rows = communes.merge(df, how='left', left_on='INSEE_COM', right_on='Code INSEE')
+        written[per_fire_geojson_file_path] = export_geojson(per_fire_rows, per_fire_geojson_file_path)
+    return written
+
+
+# -------------------------------
+# Startup Timing Report
+# -------------------------------
+def timing_report(csv_path=csv_file_path, shp_path=shapefile_path, directory=snapshot_directory, repeat=3):
+    """Compare the CSV + shapefile pipeline with the snapshot path, best of ``repeat`` runs."""
+    def best_of(load):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            load()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    build_snapshot(csv_path, directory=directory)
+    source_time = best_of(lambda: (compact_fire_table(load_fire_csv(csv_path)), load_communes(shp_path)))
+    snapshot_time = best_of(lambda: load_data(csv_path=csv_path, directory=directory))
+
+    print(f"CSV + shapefile pipeline : {source_time * 1000:9.1f} ms")
+    print(f"Snapshot (memory-mapped) : {snapshot_time * 1000:9.1f} ms")
+    print(f"Speed-up                 : {source_time / snapshot_time:9.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the data snapshot and GeoJSON artifacts used by app.py.")
+    parser.add_argument('--report', action='store_true', help="compare startup time with and without the snapshot")
+    parser.add_argument('--update', action='store_true', help="append the new alerts of a newer CSV export if possible")
+    parser.add_argument('--geojson', action='store_true', help="export the commune GeoJSON artifact")
+    parser.add_argument('--per-fire', action='store_true', help="with --geojson, also export one feature per fire")
+    args = parser.parse_args()
+
+    if args.report:
+        timing_report()
+    elif args.geojson:
+        for path, changed in export_geojson_artifacts(per_fire=args.per_fire).items():
+            print(f"{path}: {'written' if changed else 'unchanged, skipped'}")
+    else:
+        manifest = ensure_snapshot() if args.update else build_snapshot()
+        print("Ingest: " + ", ".join(f"{name}={count}" for name, count in sorted(manifest['ingest'].items())))
+        for department, partition in sorted(manifest['departments'].items()):
+            print(f"{snapshot_directory}/departments/{department}: {partition['name']}, "
+                  f"{partition['rows']} fires, {partition['communes']} communes")
@@ -0,0 +1,273 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from data_loader import DEFAULT_DEPARTMENT, GEOMETRY_LEVELS, read_communes, read_fires, read_geometry_level
+from fire_index import FireIndex
+from time_index import TimeIndex
+
+# -------------------------------
+# Department Partition Settings
+# -------------------------------
+# Partitions are loaded on first use and the least recently used ones are
+# dropped once the loaded departments exceed this budget (the default
+# department is never dropped)
+DEPARTMENT_MEMORY_MB = float(os.environ.get('DEPARTMENT_MEMORY_MB', 512))
+
+# Filtered views kept per department: the callbacks fired by one dropdown change
+# all read the same (year, commune) selection
+SELECTION_CACHE_ENTRIES = int(os.environ.get('SELECTION_CACHE_ENTRIES', 32))
+
+# Width of the choropleth in pixels, which decides how much outline detail is visible
+CHOROPLETH_PIXELS = int(os.environ.get('CHOROPLETH_PIXELS', 700))
+
+
+def build_commune_attributes(communes, df):
+    """Return the choropleth attributes, one row per commune, without geometry."""
+    attributes = pd.DataFrame(communes.drop(columns='geometry'))
+    commune_names = df.drop_duplicates('Code INSEE').set_index('Code INSEE')['Commune'].astype(str)
+    commune_names.index = commune_names.index.astype(str)
+    burned_by_insee = df.groupby('Code INSEE', observed=True)['Surface parcourue (m2)'].sum().astype('float64')
+    burned_by_insee.index = burned_by_insee.index.astype(str)
+    attributes['Commune'] = attributes['INSEE_COM'].map(commune_names).fillna(attributes['NOM_COM'])
+    attributes['Surface parcourue (m2)'] = attributes['INSEE_COM'].map(burned_by_insee).fillna(0)
+
+    # Calculating Population Density (Pop Density: population/area)
+    attributes['Population Intensity'] = attributes['POPULATION'] / attributes['SUPERFICIE']
+
+    # Apply logarithmic transformation to the Population Intensity for better visualization
+    attributes['Density'] = np.log1p(attributes['Population Intensity'])
+    return attributes
+
+
+class Department:
+    """Everything the callbacks need for one department, built from its partition.
+
+    The fires are read up front. The commune outlines, and everything built
+    from them, are only read on first use: the Home and Trends pages never
+    need the geometry stack.
+    """
+
+    def __init__(self, code, df, communes=None, load_communes=read_communes, load_level=read_geometry_level):
+        self.code = code
+        self.index = FireIndex(df)
+        self.df = self.index.df
+        self.time_index = TimeIndex(self.df)
+        self._selections = OrderedDict()
+        self._selection_lock = threading.Lock()
+        self._load_communes = load_communes
+        self._load_level = load_level
+        self._geometry_lock = threading.RLock()
+        self._communes = None
+        self._commune_attributes = None
+        self._extent_m = None
+        self._geometry_json = {}
+        self._dfci_grid = None
+        self._hotspot_grid = None
+        self._fires_nbytes = int(self.df.memory_usage(deep=True).sum())
+        self._communes_nbytes = 0
+        if communes is not None:
+            self._set_communes(communes)
+
+    # --- Geometry, loaded on first use ---
+    def _set_communes(self, communes):
+        self._communes = communes
+        self._communes_nbytes = int(communes.memory_usage(deep=True).sum())
+
+    @property
+    def communes(self):
+        """Commune outlines in EPSG:4326, read from the partition (importing geopandas) on first use."""
+        if self._communes is None:
+            with self._geometry_lock:
+                if self._communes is None:
+                    self._set_communes(self._load_communes(self.code))
+        return self._communes
+
+    @property
+    def name(self):
+        return str(self.communes['NOM_DEPT'].iloc[0])
+
+    @property
+    def commune_attributes(self):
+        """Choropleth attributes of the communes, built on first use."""
+        if self._commune_attributes is None:
+            with self._geometry_lock:
+                if self._commune_attributes is None:
+                    self._commune_attributes = build_commune_attributes(self.communes, self.df)
+        return self._commune_attributes
+
+    @property
+    def extent_m(self):
+        if self._extent_m is None:
+            xmin, ymin, xmax, ymax = self.communes.to_crs(2154).total_bounds
+            self._extent_m = max(xmax - xmin, ymax - ymin)
+        return self._extent_m
+
+    @property
+    def nbytes(self):
+        return self._fires_nbytes + self._communes_nbytes
+
+    def selection(self, year=None, commune=None):
+        """Return the fires of a (year, commune) selection, shared by every callback asking for it.
+
+        The frame is cached and handed to concurrent callbacks as is: treat it
+        as read-only (group it, filter it, never assign to it).
+        """
+        key = (year or None, commune or None)
+        with self._selection_lock:
+            rows = self._selections.get(key)
+            if rows is not None:
+                self._selections.move_to_end(key)
+                return rows
+
+        rows = self.index.rows(*key)
+        with self._selection_lock:
+            rows = self._selections.setdefault(key, rows)
+            self._selections.move_to_end(key)
+            while len(self._selections) > SELECTION_CACHE_ENTRIES:
+                self._selections.popitem(last=False)
+        return rows
+
+    def geometry_level(self, commune=None):
+        """Pick the outline detail of a choropleth selection.
+
+        A single commune fills the map and gets the full outline. The whole
+        department gets the coarsest level that still stays under one pixel.
+        """
+        if commune:
+            return 'full'
+        pixel = self.extent_m / CHOROPLETH_PIXELS
+        fitting = [(tolerance, level) for level, tolerance in GEOMETRY_LEVELS.items() if tolerance <= pixel]
+        return max(fitting)[1] if fitting else 'full'
+
+    def geometry_json(self, level='full'):
+        """Commune polygons of one detail level keyed by INSEE code, serialized on first use."""
+        if level != 'full' and level not in GEOMETRY_LEVELS:
+            raise KeyError(f"Unknown geometry level {level!r}")
+        if level not in self._geometry_json:
+            outlines = self.communes if level == 'full' else self._load_level(self.code, level)
+            self._geometry_json[level] = outlines[['INSEE_COM', 'geometry']].to_json(drop_id=True)
+        return self._geometry_json[level]
+
+    def dfci_grid(self):
+        """DFCI cells of the department's fires joined to its communes, built on first use."""
+        if self._dfci_grid is None:
+            from dfci_grid import DfciGrid
+
+            with self._geometry_lock:
+                if self._dfci_grid is None:
+                    self._dfci_grid = DfciGrid(self.df, self.communes)
+        return self._dfci_grid
+
+    def hotspot_grid(self):
+        """Kernel density engine of the department's fires, built on first use."""
+        if self._hotspot_grid is None:
+            from hotspots import HotspotGrid
+
+            with self._geometry_lock:
+                if self._hotspot_grid is None:
+                    self._hotspot_grid = HotspotGrid(self.df)
+        return self._hotspot_grid
+
+    def year_options(self):
+        return [{'label': str(year), 'value': int(year)} for year in self.df['Year'].unique()]
+
+    def year_range(self):
+        return int(self.df['Year'].min()), int(self.df['Year'].max())
+
+    def commune_options(self):
+        return [{'label': commune, 'value': commune} for commune in self.df['Commune'].unique()]
+
+
+class DepartmentStore:
+    """Lazily loaded departments, evicted least recently used beyond a memory budget."""
+
+    def __init__(self, catalog, budget_bytes=DEPARTMENT_MEMORY_MB * 2 ** 20, pinned=DEFAULT_DEPARTMENT,
+                 load=read_fires):
+        self.catalog = catalog  # {code: {'name': ..., 'rows': ..., 'version': ..., ...}} from the manifest
+        self.budget_bytes = budget_bytes
+        self.pinned = pinned
+        self._load = load
+        self._loaded = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0  # bumped by every refresh()
+
+    def options(self):
+        return [{'label': f"{code} - {entry['name']}", 'value': code} for code, entry in sorted(self.catalog.items())]
+
+    def name(self, code=None):
+        """Name of a department, from the manifest: neither its partition nor its communes are read."""
+        return self.catalog[code or self.pinned]['name']
+
+    def get(self, code=None):
+        """Return the Department for ``code``, loading its partition on first use."""
+        code = code or self.pinned
+        if code not in self.catalog:
+            raise KeyError(f"Unknown department {code!r}")
+        with self._lock:
+            department = self._loaded.get(code)
+            if department is not None:
+                self._loaded.move_to_end(code)
+                return department
+            generation = self._generation
+
+        # Built outside the lock so one slow partition does not block the others
+        department = Department(code, self._load(code))
+        with self._lock:
+            if generation != self._generation:  # a refresh ran meanwhile: the partition may be older
+                return department
+            department = self._loaded.setdefault(code, department)
+            self._loaded.move_to_end(code)
+            self._evict()
+        return department
+
+    def version(self, code=None, year=None):
+        """Content token of a department's data, or of one alert year of it (None when it has no fires that year)."""
+        entry = self.catalog[code or self.pinned]
+        if year:
+            return entry['versions']['years'].get(str(year))
+        return entry['version']
+
+    def refresh(self, catalog):
+        """Swap in the departments of a new manifest and return the codes whose data changed.
+
+        Loaded departments that changed are rebuilt from their new partition
+        before the swap, so requests keep being served by the previous ones
+        until the new ones are ready.
+        """
+        changed = sorted(code for code in set(catalog) | set(self.catalog)
+                         if catalog.get(code, {}).get('version') != self.catalog.get(code, {}).get('version'))
+        with self._lock:
+            loaded = dict(self._loaded)
+        rebuilt = {}
+        for code in changed:
+            if code in loaded and code in catalog:
+                if catalog[code]['versions']['communes'] == self.catalog[code]['versions']['communes']:
+                    # Same outlines: keep them, when loaded, and the GeoJSON already serialized for the choropleth
+                    rebuilt[code] = Department(code, self._load(code), communes=loaded[code]._communes)
+                    rebuilt[code]._geometry_json.update(loaded[code]._geometry_json)
+                else:
+                    rebuilt[code] = Department(code, self._load(code))
+
+        with self._lock:
+            self.catalog = catalog
+            self._generation += 1
+            for code in changed:
+                if code in rebuilt:
+                    self._loaded[code] = rebuilt[code]
+                else:
+                    self._loaded.pop(code, None)
+            self._evict()
+        return changed
+
+    def _evict(self):
+        total = sum(department.nbytes for department in self._loaded.values())
+        # The most recently used department is the one being served: always keep it
+        for code in list(self._loaded)[:-1]:
+            if total <= self.budget_bytes:
+                break
+            if code != self.pinned:
+                total -= self._loaded.pop(code).nbytes
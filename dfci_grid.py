@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import shapely
+
+# -------------------------------
+# DFCI Grid Settings
+# -------------------------------
+# DFCI codes name the squares of a grid in Lambert II étendu (EPSG:27572):
+# "KD44L6" is the 100 km square K (x) D (y), its 20 km square 4 (x) 4 (y) and,
+# in that one, the 2 km square L (x) 6 (y). Cells are derived from the codes,
+# so the map never depends on a grid file exported once from QGIS
+DFCI_CRS = 27572
+DFCI_LETTERS = 'ABCDEFGHKLMN'  # I and J are not used
+DFCI_ORIGIN = (0, 1_500_000)
+CELL_SIZE = 2_000
+DFCI_CODE = r'^([A-HK-N])([A-HK-N])([02468])([02468])([A-HKL])(\d)'
+
+DFCI_COLUMN = 'Code du carreau DFCI'
+SURFACE = 'Surface parcourue (m2)'
+
+
+def dfci_cell_origins(codes):
+    """Return the lower-left corners ``(x, y)`` in EPSG:27572 of the 2 km cells of DFCI codes.
+
+    A sub-square suffix ("KD44L6.3") is ignored; malformed codes get NaN.
+    """
+    parts = pd.Series(codes, dtype='str').str.strip().str.upper().str.extract(DFCI_CODE)
+    letter = {letter: i for i, letter in enumerate(DFCI_LETTERS)}
+    valid = parts.notna().all(axis=1).to_numpy()
+    parts = parts[valid]
+    x = np.full(len(valid), np.nan)
+    y = np.full(len(valid), np.nan)
+    x[valid] = (DFCI_ORIGIN[0] + parts[0].map(letter) * 100_000 + parts[2].astype(int) * 10_000
+                + parts[4].map(letter) * CELL_SIZE)
+    y[valid] = (DFCI_ORIGIN[1] + parts[1].map(letter) * 100_000 + parts[3].astype(int) * 10_000
+                + parts[5].astype(int) * CELL_SIZE)
+    return x, y
+
+
+class DfciGrid:
+    """The 2 km DFCI cells of a department's fires, joined to the communes they overlap.
+
+    Fires are summed per cell with ``np.bincount`` over the categorical codes
+    of their DFCI column, so any (year, commune) selection of the department
+    is aggregated without grouping strings.
+    """
+
+    def __init__(self, df, communes):
+        column = df[DFCI_COLUMN]
+        categories = column.cat.categories
+        used = np.bincount(column.cat.codes.to_numpy()[column.cat.codes.to_numpy() >= 0],
+                           minlength=len(categories)) > 0
+        x, y = dfci_cell_origins(categories)
+        kept = used & ~np.isnan(x)
+        # Category code -> cell position, -1 for unused or malformed codes. The extra
+        # last slot is what a missing code (-1) indexes, so it maps to -1 as well
+        self._cell_of_category = np.full(len(categories) + 1, -1)
+        self._cell_of_category[np.flatnonzero(kept)] = np.arange(kept.sum())
+        self.cells = gpd.GeoDataFrame({'NOM': np.asarray(categories)[kept].astype(str)},
+                                      geometry=shapely.box(x[kept], y[kept], x[kept] + CELL_SIZE, y[kept] + CELL_SIZE),
+                                      crs=DFCI_CRS)
+
+        # Spatial join: every (cell, commune) pair that overlaps, found through an STRtree of the communes
+        outlines = communes.to_crs(DFCI_CRS).geometry.to_numpy()
+        cell_geometries = self.cells.geometry.to_numpy()
+        cell_index, commune_index = shapely.STRtree(outlines).query(cell_geometries, predicate='intersects')
+        overlap = shapely.area(shapely.intersection(cell_geometries[cell_index], outlines[commune_index]))
+        # The commune covering most of a cell names it
+        order = np.lexsort((-overlap, cell_index))
+        first = order[np.unique(cell_index[order], return_index=True)[1]]
+        main_commune = np.full(len(self.cells), None, dtype=object)
+        main_commune[cell_index[first]] = communes['NOM_COM'].to_numpy()[commune_index[first]]
+        self.cells['COMMUNE'] = main_commune
+        self._cell_index = cell_index
+        self._commune_insee = communes['INSEE_COM'].to_numpy()[commune_index]
+        self.cells = self.cells.to_crs(4326)
+
+    def aggregate(self, rows):
+        """Return the fire count and burned surface (m²) of ``rows`` per cell, aligned with ``cells``."""
+        cells = self._cell_of_category[rows[DFCI_COLUMN].cat.codes.to_numpy()]
+        known = cells >= 0
+        counts = np.bincount(cells[known], minlength=len(self.cells))
+        surfaces = np.bincount(cells[known], weights=rows[SURFACE].to_numpy(dtype='float64')[known],
+                               minlength=len(self.cells))
+        return counts, surfaces
+
+    def cells_of_communes(self, insee_codes):
+        """Boolean mask of the cells overlapping any of the given communes."""
+        mask = np.zeros(len(self.cells), dtype=bool)
+        mask[self._cell_index[np.isin(self._commune_insee, list(insee_codes))]] = True
+        return mask
+
+    def layer(self, rows, insee_codes=None):
+        """Cells with fires in ``rows`` as a GeoDataFrame (EPSG:4326) with ``NUMPOINTS`` and ``SURFACE_HA``.
+
+        With ``insee_codes``, the empty cells overlapping those communes are kept too.
+        """
+        counts, surfaces = self.aggregate(rows)
+        keep = counts > 0
+        if insee_codes is not None:
+            keep |= self.cells_of_communes(insee_codes)
+        return self.cells[keep].assign(NUMPOINTS=counts[keep], SURFACE_HA=np.round(surfaces[keep] / 10000, 2))
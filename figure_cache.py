@@ -0,0 +1,207 @@
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+from collections import Counter, OrderedDict
+
+from plotly.utils import PlotlyJSONEncoder
+
+from atomic_files import replace_atomically
+
+# -------------------------------
+# Figure Cache Settings
+# -------------------------------
+# Entries live on local disk so every gunicorn worker shares them, with a
+# small in-process LRU in front to skip the file read for the hottest keys
+FIGURE_CACHE_DIR = os.environ.get('FIGURE_CACHE_DIR', 'figure_cache')
+FIGURE_CACHE_MAX_MB = float(os.environ.get('FIGURE_CACHE_MAX_MB', 256))
+FIGURE_CACHE_MEMORY_ENTRIES = int(os.environ.get('FIGURE_CACHE_MEMORY_ENTRIES', 256))
+FIGURE_CACHE_WARMUP = os.environ.get('FIGURE_CACHE_WARMUP', '0') == '1'
+
+
+def _hashable(value):
+    # Dash sends the values of range sliders and multi-select dropdowns as JSON arrays
+    if isinstance(value, list):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+class Uncached:
+    """Callback outputs to send once but not cache, such as a fallback figure standing in for a slow one."""
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+
+
+class FigureCache:
+    """Size-bounded cache of serialized callback outputs, keyed by (page, year, commune).
+
+    ``namespace`` separates entries of incompatible snapshot formats; the data
+    each entry was built from is part of its key (``memoize(version=...)``),
+    so entries written for older data are never served.
+    """
+
+    def __init__(self, namespace, directory=FIGURE_CACHE_DIR, max_bytes=FIGURE_CACHE_MAX_MB * 2 ** 20,
+                 memory_entries=FIGURE_CACHE_MEMORY_ENTRIES):
+        self.namespace = namespace
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.counters = Counter()
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._disk_bytes = self._disk_usage()
+
+    # --- Storage ---
+    def _path(self, key):
+        digest = hashlib.sha1(repr((self.namespace,) + tuple(key)).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, digest + '.json')
+
+    def _remember(self, key, payload):
+        with self._lock:
+            self._memory[key] = payload
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the serialized payload stored under ``key``, or None."""
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self.counters['memory_hits'] += 1
+                return payload
+
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                payload = f.read()
+            os.utime(path)  # mtime doubles as the LRU clock shared by all workers
+        except FileNotFoundError:
+            with self._lock:
+                self.counters['misses'] += 1
+            return None
+
+        with self._lock:
+            self.counters['disk_hits'] += 1
+        self._remember(key, payload)
+        return payload
+
+    def set(self, key, payload):
+        self._remember(key, payload)
+        path = self._path(key)
+        data = payload.encode('utf-8')
+
+        def write(p):
+            with open(p, 'wb') as f:
+                f.write(data)
+
+        # Warmup, data reloads and concurrent misses rewrite existing keys: only the difference is new
+        try:
+            replaced = os.stat(path).st_size
+        except FileNotFoundError:
+            replaced = 0
+        replace_atomically(write, path)
+
+        with self._lock:
+            self._disk_bytes += len(data) - replaced
+            over_budget = self._disk_bytes > self.max_bytes
+        if over_budget:
+            self._evict()
+
+    # --- Eviction ---
+    def _entries(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.json'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _disk_usage(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        # Other workers write to the same directory: start from the real size on
+        # disk, then drop the least recently used files down to 90 % of the budget
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+                evicted += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+        with self._lock:
+            self.counters['evictions'] += evicted
+            self._disk_bytes = total
+
+    # --- Callback Integration ---
+    def memoize(self, page, version=None):
+        """Cache a callback's return value under ``(page, *arguments)``.
+
+        The outputs are stored as Plotly JSON and served back as plain dicts,
+        which Dash sends to the browser without rebuilding the figures.
+
+        ``version(*arguments)`` returns a token of the data the output is built
+        from; it is added to the key, so new data only misses the entries that
+        read it. Omitted arguments are filled with their defaults first, and
+        lists (range sliders, multi-select dropdowns) are passed on as tuples.
+        A callback returning ``Uncached(outputs)`` is answered but not stored.
+        """
+        def decorator(callback):
+            signature = inspect.signature(callback)
+
+            @functools.wraps(callback)
+            def wrapper(*args):
+                bound = signature.bind(*args)
+                bound.apply_defaults()
+                args = tuple(_hashable(arg) for arg in bound.args)
+                key = (page,) + args + ((version(*args),) if version else ())
+                payload = self.get(key)
+                if payload is None:
+                    outputs = callback(*args)
+                    if isinstance(outputs, Uncached):
+                        return json.loads(json.dumps(outputs.outputs, cls=PlotlyJSONEncoder))
+                    payload = json.dumps(outputs, cls=PlotlyJSONEncoder)
+                    self.set(key, payload)
+                return json.loads(payload)
+
+            wrapper.page = page
+            return wrapper
+        return decorator
+
+    def warm(self, jobs):
+        """Fill the cache in a background thread; ``jobs`` yields ``(memoized callback, args)``."""
+        def run():
+            for callback, args in jobs:
+                try:
+                    callback(*args)
+                except Exception as exc:  # a failing figure must not stop the warmup
+                    print(f"Figure cache warmup failed for {callback.page}{args}: {exc}")
+
+        thread = threading.Thread(target=run, name='figure-cache-warmup', daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self):
+        with self._lock:
+            return {
+                'memory_hits': self.counters['memory_hits'],
+                'disk_hits': self.counters['disk_hits'],
+                'misses': self.counters['misses'],
+                'evictions': self.counters['evictions'],
+                'memory_entries': len(self._memory),
+                'disk_bytes': self._disk_bytes,
+            }
@@ -0,0 +1,71 @@
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from metrics import bind_phases, merge_phases
+
+# -------------------------------
+# Figure Pool Settings
+# -------------------------------
+# Threads shared by every request of a worker for building the independent
+# figures of one callback concurrently (0 builds them one after another).
+# They only overlap while pandas, numpy and shapely release the GIL, so more
+# threads than CPUs does not help
+FIGURE_POOL_WORKERS = int(os.environ.get('FIGURE_POOL_WORKERS', min(4, os.cpu_count() or 1)))
+
+# Seconds a callback waits for a figure that has a fallback (the choropleth)
+# before answering with the fallback instead
+FIGURE_TIMEOUT = float(os.environ.get('FIGURE_TIMEOUT_S', 5))
+
+
+class FigurePool:
+    """Bounded thread pool building the figures of a multi-output callback concurrently.
+
+    The first figure is built on the request's own thread while the others
+    wait for a pool thread. A figure still queued when the request needs it
+    is built on the request's thread after all, so a busy pool never makes a
+    callback slower than building its figures one after another.
+    """
+
+    def __init__(self, workers=FIGURE_POOL_WORKERS, timeout=FIGURE_TIMEOUT):
+        self.workers = workers
+        self.timeout = timeout
+        self.timeouts = Counter()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix='figure') if workers > 0 else None
+
+    def build(self, builds, fallbacks=None):
+        """Run the zero-argument callables of ``builds`` (``{name: build}``) and return ``({name: result}, degraded)``.
+
+        A build named in ``fallbacks`` that is not done ``timeout`` seconds
+        after the call is replaced by its fallback and ``degraded`` is True;
+        it keeps running in the pool and its phase laps are dropped. The other
+        builds are always waited for, and their exceptions are raised here.
+        """
+        fallbacks = fallbacks or {}
+        if self._executor is None:
+            return {name: build() for name, build in builds.items()}, False
+
+        deadline = time.monotonic() + self.timeout
+        (first, first_build), *others = builds.items()
+        futures = {name: self._executor.submit(bind_phases(build)) for name, build in others}
+        results = {first: first_build()}
+        degraded = False
+        for name, future in futures.items():
+            if name not in fallbacks and future.cancel():
+                # Not picked up yet: cheaper to build it here than to wait for a pool thread
+                results[name] = builds[name]()
+                continue
+            timeout = max(deadline - time.monotonic(), 0) if name in fallbacks else None
+            try:
+                results[name], laps = future.result(timeout=timeout)
+            except FutureTimeout:  # the built-in TimeoutError only from Python 3.11
+                results[name] = fallbacks[name]
+                degraded = True
+                with self._lock:
+                    self.timeouts[name] += 1
+                continue
+            merge_phases(laps)
+        return {name: results[name] for name in builds}, degraded
@@ -0,0 +1,57 @@
+import numpy as np
+
+# -------------------------------
+# Sorted Year / Commune Index
+# -------------------------------
+# df is kept sorted by (Year, Commune), so every year and every (year, commune)
+# pair is one contiguous block of rows found with np.searchsorted. A second,
+# commune-major permutation serves "all years of one commune" selections.
+INDEX_COLUMNS = ['Year', 'Commune']
+
+
+def sort_fire_table(df):
+    """Return df ordered by (Year, Commune code), the layout FireIndex slices."""
+    return df.sort_values(INDEX_COLUMNS, kind='stable').reset_index(drop=True)
+
+
+class FireIndex:
+    """Range lookups of the fires matching a (year, commune) selection."""
+
+    def __init__(self, df):
+        year = df['Year'].to_numpy(dtype='int64')
+        code = df['Commune'].cat.codes.to_numpy(dtype='int64')
+        self._stride = len(df['Commune'].cat.categories) + 1
+        key = year * self._stride + code
+        if len(key) and np.any(key[1:] < key[:-1]):
+            df = sort_fire_table(df)
+            year = df['Year'].to_numpy(dtype='int64')
+            code = df['Commune'].cat.codes.to_numpy(dtype='int64')
+            key = year * self._stride + code
+
+        self.df = df
+        self._key = key
+        self._codes = {commune: i for i, commune in enumerate(df['Commune'].cat.categories)}
+        self._by_commune = np.argsort(code, kind='stable')  # rows stay in year order within a commune
+        self._commune_key = code[self._by_commune]
+
+    def _span(self, keys, low, high):
+        return np.searchsorted(keys, low, side='left'), np.searchsorted(keys, high, side='left')
+
+    def positions(self, year=None, commune=None):
+        """Return the row positions of a selection: a slice when contiguous, else an array."""
+        code = self._codes.get(commune, -1) if commune else None
+        if commune and code < 0:
+            return slice(0, 0)
+        if year and commune:
+            key = int(year) * self._stride + code
+            return slice(*self._span(self._key, key, key + 1))
+        if year:
+            return slice(*self._span(self._key, int(year) * self._stride, (int(year) + 1) * self._stride))
+        if commune:
+            start, stop = self._span(self._commune_key, code, code + 1)
+            return self._by_commune[start:stop]
+        return slice(0, len(self.df))
+
+    def rows(self, year=None, commune=None):
+        """Return the fires of a selection; None (or any falsy value) means "all"."""
+        return self.df.iloc[self.positions(year, commune)]
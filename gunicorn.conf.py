@@ -0,0 +1,30 @@
+"""gunicorn settings, read by ``gunicorn app:server`` when started from the repository root.
+
+GUNICORN_PRELOAD=1 imports app.py once in the master before forking the
+workers, which then share its department partitions, indexes and commune
+geometries copy-on-write instead of each building their own:
+
+    GUNICORN_PRELOAD=1 gunicorn app:server --workers 4
+
+Without it, workers still share the fire columns through the page cache,
+since partitions are memory-mapped (SNAPSHOT_ZERO_COPY).
+"""
+import gc
+import os
+
+preload_app = os.environ.get('GUNICORN_PRELOAD', '0') == '1'
+if preload_app:
+    # app.py then leaves its background threads to post_fork
+    os.environ['GUNICORN_PRELOADED'] = '1'
+
+
+def pre_fork(server, worker):
+    # Everything the preloaded app allocated is moved out of the collector's
+    # reach, so collections in a worker do not write to (and copy) those pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    if preload_app:
+        import app
+        app.start_background_threads()
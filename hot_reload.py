@@ -0,0 +1,103 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent rebuilds stay safe, they are just not deduplicated
+    fcntl = None
+
+from data_loader import csv_file_path, ensure_snapshot, read_manifest, snapshot_directory, source_files
+
+# -------------------------------
+# Hot Reload Settings
+# -------------------------------
+# Every worker polls the source files this often (seconds, 0 disables) and swaps
+# in a new snapshot when Classeur1.csv or a shapefile changes
+DATA_RELOAD_INTERVAL = float(os.environ.get('DATA_RELOAD_INTERVAL_S', 30))
+SNAPSHOT_LOCK = '.lock'
+
+
+@contextmanager
+def snapshot_lock(directory=snapshot_directory):
+    """Hold an exclusive lock on the snapshot directory, so one worker updates it while the others wait."""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, SNAPSHOT_LOCK), 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class SnapshotWatcher:
+    """Background thread that updates the snapshot when its sources change and hands the new manifest to ``apply``.
+
+    A changed source is only read once its size and mtime held still for one
+    poll, so an export being copied is not picked up half-written. The
+    update itself (``ensure_snapshot``) and ``apply`` run on this thread,
+    never on a request.
+    """
+
+    def __init__(self, apply, manifest, interval=DATA_RELOAD_INTERVAL, csv_path=csv_file_path, shp_paths=None,
+                 directory=snapshot_directory):
+        self.apply = apply
+        self.interval = interval
+        self.csv_path = csv_path
+        self.shp_paths = shp_paths
+        self.directory = directory
+        self.key = manifest['key']
+        self.reloads = 0
+        self.last_reload_seconds = 0.0
+        self._stats = self._pending = self._source_stats()
+
+    def _source_stats(self):
+        stats = {}
+        for path in source_files(self.csv_path, self.shp_paths):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:  # being replaced
+                continue
+            stats[path] = (stat.st_size, stat.st_mtime_ns)
+        return stats
+
+    def check(self):
+        """Poll once; return the manifest when a new snapshot was applied, else None."""
+        stats = self._source_stats()
+        if stats != self._stats:
+            if stats != self._pending:
+                self._pending = stats  # still changing: look again next poll
+                return None
+            start = time.perf_counter()
+            with snapshot_lock(self.directory):
+                manifest = ensure_snapshot(self.csv_path, self.shp_paths, self.directory)
+            self._stats = stats
+        else:
+            # Another worker or `python data_loader.py --update` may have updated it
+            manifest = read_manifest(self.directory)
+            start = time.perf_counter()
+        if manifest is None or manifest['key'] == self.key:
+            return None
+
+        self.apply(manifest)
+        self.key = manifest['key']
+        self.reloads += 1
+        self.last_reload_seconds = time.perf_counter() - start
+        return manifest
+
+    def start(self):
+        def run():
+            while True:
+                time.sleep(self.interval)
+                try:
+                    self.check()
+                except Exception as exc:  # keep serving the current data, retry next poll
+                    print(f"Data reload failed: {exc!r}")
+
+        thread = threading.Thread(target=run, name='snapshot-watcher', daemon=True)
+        thread.start()
+        return thread
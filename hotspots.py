@@ -0,0 +1,192 @@
+import io
+import math
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from plotly.colors import sequential, unlabel_rgb
+from pyproj import Transformer
+
+from dfci_grid import CELL_SIZE, DFCI_COLUMN, DFCI_CRS, dfci_cell_origins
+from time_index import ALL_MONTHS
+
+# -------------------------------
+# Hotspot Settings
+# -------------------------------
+# Fires are placed at the centre of their 2 km DFCI cell and spread with a
+# Gaussian kernel of HOTSPOT_BANDWIDTH_M metres (its standard deviation) on a
+# raster of HOTSPOT_PIXEL_M metre pixels in Web Mercator
+HOTSPOT_BANDWIDTH_M = float(os.environ.get('HOTSPOT_BANDWIDTH_M', 3000))
+HOTSPOT_PIXEL_M = float(os.environ.get('HOTSPOT_PIXEL_M', 500))
+
+# Rendered overlays kept per department, one per (years, months) selection
+HOTSPOT_CACHE_ENTRIES = int(os.environ.get('HOTSPOT_CACHE_ENTRIES', 64))
+
+HOTSPOT_COLORSCALE = 'YlOrRd'
+
+# Densities below this share of the selection's peak are left transparent
+_TRANSPARENT_BELOW = 0.02
+
+
+def _gaussian_matrix(size, sigma):
+    # Row i holds the kernel centred on pixel i: blurring is one matrix product per axis
+    offsets = np.arange(size)[:, None] - np.arange(size)[None, :]
+    return np.exp(-0.5 * (offsets / sigma) ** 2).astype('float32')
+
+
+def _color_table():
+    # 256 RGB entries interpolated between the colours of the Plotly colour scale
+    anchors = np.array([unlabel_rgb(color) for color in getattr(sequential, HOTSPOT_COLORSCALE)])
+    positions = np.linspace(0, 1, len(anchors))
+    levels = np.linspace(0, 1, 256)
+    return np.stack([np.interp(levels, positions, anchors[:, channel]) for channel in range(3)], axis=1).astype('uint8')
+
+
+_COLOR_TABLE = _color_table()
+
+
+class HotspotGrid:
+    """Kernel density of a department's fires over any period, from precomputed yearly rasters.
+
+    The density is linear in the fire counts, so the raster of a year range is
+    the difference of two running sums of the yearly rasters. A season
+    (months within every year) is blurred from its fire counts per DFCI cell
+    instead, which takes two matrix products.
+    Densities are in fires per km².
+    """
+
+    colorscale = HOTSPOT_COLORSCALE
+
+    def __init__(self, df, bandwidth=HOTSPOT_BANDWIDTH_M, pixel=HOTSPOT_PIXEL_M):
+        column = df[DFCI_COLUMN]
+        categories = column.cat.categories
+        x, y = dfci_cell_origins(categories)
+        codes = column.cat.codes.to_numpy()
+        used = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+        kept = used & ~np.isnan(x)
+        cell_of_category = np.full(len(categories) + 1, -1)  # the last slot is what a missing code (-1) indexes
+        cell_of_category[np.flatnonzero(kept)] = np.arange(kept.sum())
+        self.cells = np.asarray(categories)[kept].astype(str)
+
+        # Cell centres in Web Mercator, where the overlay is drawn, and in longitude / latitude
+        centre_x, centre_y = x[kept] + CELL_SIZE / 2, y[kept] + CELL_SIZE / 2
+        mercator_x, mercator_y = Transformer.from_crs(DFCI_CRS, 3857, always_xy=True).transform(centre_x, centre_y)
+        self.lon, self.lat = Transformer.from_crs(DFCI_CRS, 4326, always_xy=True).transform(centre_x, centre_y)
+        self._to_lonlat = Transformer.from_crs(3857, 4326, always_xy=True)
+
+        # Mercator stretches distances by 1 / cos(latitude): pixels and margins are scaled to stay in ground metres
+        scale = 1 / math.cos(math.radians(float(np.mean(self.lat)))) if len(self.cells) else 1
+        size = pixel * scale
+        margin = 3 * bandwidth * scale
+        if len(self.cells):
+            xmin, xmax = mercator_x.min() - margin, mercator_x.max() + margin
+            ymin, ymax = mercator_y.min() - margin, mercator_y.max() + margin
+        else:
+            xmin, xmax, ymin, ymax = 0, size, 0, size
+        self.width = max(int(math.ceil((xmax - xmin) / size)), 1)
+        self.height = max(int(math.ceil((ymax - ymin) / size)), 1)
+        self.extent = (xmin, ymax - self.height * size, xmin + self.width * size, ymax)  # row 0 is the north edge
+        columns = ((mercator_x - xmin) // size).astype('int64')
+        rows = ((ymax - mercator_y) // size).astype('int64')
+        self._pixel_of_cell = rows * self.width + columns
+
+        # Kernel normalised in km² so that a raster sums to its fire count divided by the pixel area
+        sigma = bandwidth / pixel
+        self._blur_rows = _gaussian_matrix(self.height, sigma)
+        self._blur_columns = _gaussian_matrix(self.width, sigma).T
+        self._unit = 1 / (2 * math.pi * (bandwidth / 1000) ** 2)
+
+        # Fire counts per (year, month, cell)
+        cells = cell_of_category[codes]
+        known = cells >= 0
+        self._first_year = int(df['Year'].min()) if len(df) else 0
+        years = int(df['Year'].max()) - self._first_year + 1 if len(df) else 0
+        year = df['Year'].to_numpy(dtype='int64')[known] - self._first_year
+        month = df['Month'].to_numpy(dtype='int64')[known] - 1
+        self._counts = np.bincount((year * 12 + month) * len(self.cells) + cells[known],
+                                   minlength=years * 12 * len(self.cells)).reshape(years, 12, len(self.cells))
+
+        self._yearly = None  # running sums of the yearly rasters, built on first use
+        self._lock = threading.Lock()
+        self._images = OrderedDict()
+
+    # --- Density ---
+    def _blur(self, cell_counts):
+        """Density rasters (..., height, width) of fire counts per cell (..., cells)."""
+        flat = cell_counts.reshape(-1, len(self.cells))
+        pixels = np.zeros((len(flat), self.height * self.width), dtype='float32')
+        for i, counts in enumerate(flat):
+            pixels[i] = np.bincount(self._pixel_of_cell, weights=counts, minlength=self.height * self.width)
+        pixels = pixels.reshape(cell_counts.shape[:-1] + (self.height, self.width))
+        return np.float32(self._unit) * (self._blur_rows @ pixels @ self._blur_columns)
+
+    def _year_span(self, years):
+        if not len(self._counts):
+            return 0, 0
+        first, last = years or (self._first_year, self._first_year + len(self._counts) - 1)
+        return (int(np.clip(int(first) - self._first_year, 0, len(self._counts))),
+                int(np.clip(int(last) - self._first_year + 1, 0, len(self._counts))))
+
+    def density(self, years=None, months=None):
+        """Return the density raster (fires per km², float32) of a (first, last) year and month range."""
+        low, high = self._year_span(years)
+        first_month, last_month = (int(month) for month in (months or ALL_MONTHS))
+        if (first_month, last_month) != ALL_MONTHS:
+            counts = self._counts[low:high, first_month - 1:last_month].sum(axis=(0, 1))
+            return self._blur(counts)
+        if self._yearly is None:
+            with self._lock:
+                if self._yearly is None:
+                    yearly = self._blur(self._counts.sum(axis=1))
+                    running = np.zeros((len(yearly) + 1, self.height, self.width), dtype='float32')
+                    np.cumsum(yearly, axis=0, out=running[1:])
+                    self._yearly = running
+        # Differences of float32 running sums can dip just below zero
+        return np.maximum(self._yearly[high] - self._yearly[low], 0)
+
+    def top_cells(self, years=None, months=None, n=10):
+        """Return the positions and fire counts of the ``n`` DFCI cells with the most fires of a period."""
+        low, high = self._year_span(years)
+        first_month, last_month = (int(month) for month in (months or ALL_MONTHS))
+        counts = self._counts[low:high, first_month - 1:last_month].sum(axis=(0, 1))
+        top = np.argsort(-counts, kind='stable')[:n]
+        top = top[counts[top] > 0]
+        return top, counts[top]
+
+    # --- Overlay ---
+    def bounds(self):
+        """Longitude / latitude of the overlay's corners, clockwise from the north-west one."""
+        xmin, ymin, xmax, ymax = self.extent
+        lon, lat = self._to_lonlat.transform([xmin, xmax, xmax, xmin], [ymax, ymax, ymin, ymin])
+        return [[float(x), float(y)] for x, y in zip(lon, lat)]
+
+    def image(self, years=None, months=None):
+        """Return the PNG overlay of a period and its peak density, rendered once per selection."""
+        from PIL import Image  # only the overlay needs Pillow
+
+        key = (tuple(years) if years else None, tuple(months) if months else None)
+        with self._lock:
+            cached = self._images.get(key)
+            if cached is not None:
+                self._images.move_to_end(key)
+                return cached
+
+        density = self.density(years, months)
+        peak = float(density.max()) if density.size else 0.0
+        share = density / peak if peak > 0 else np.zeros_like(density)
+        rgba = np.empty(density.shape + (4,), dtype='uint8')
+        rgba[..., :3] = _COLOR_TABLE[np.round(share * 255).astype('uint8')]
+        # Opacity grows with the density, so the basemap shows through the outskirts
+        rgba[..., 3] = np.where(share < _TRANSPARENT_BELOW, 0, np.round(np.sqrt(share) * 220)).astype('uint8')
+        buffer = io.BytesIO()
+        # Fastest zlib level: about three times quicker than the default, for a 25 % larger file
+        Image.fromarray(rgba, 'RGBA').save(buffer, 'PNG', compress_level=1)
+        result = buffer.getvalue(), peak
+
+        with self._lock:
+            self._images[key] = result
+            self._images.move_to_end(key)
+            while len(self._images) > HOTSPOT_CACHE_ENTRIES:
+                self._images.popitem(last=False)
+        return result
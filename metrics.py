@@ -0,0 +1,264 @@
+import bisect
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+# -------------------------------
+# Instrumentation Settings
+# -------------------------------
+# Metrics are kept per process: with several gunicorn workers each scrape of
+# /metrics reports the worker that answered it
+CALLBACK_PROFILER = os.environ.get('CALLBACK_PROFILER', '0') == '1'
+PROFILER_INTERVAL = float(os.environ.get('PROFILER_INTERVAL_MS', 5)) / 1000
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+BYTES_BUCKETS = (1_000, 4_000, 16_000, 64_000, 256_000, 1_000_000, 4_000_000, 16_000_000)
+
+
+class Histogram:
+    """Cumulative Prometheus histogram for one set of label values."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def samples(self):
+        cumulative = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            cumulative += count
+            yield bound, cumulative
+
+
+_lock = threading.Lock()
+_current = threading.local()
+_durations = defaultdict(lambda: Histogram(DURATION_BUCKETS))  # (callback, phase) -> Histogram
+_response_bytes = defaultdict(lambda: Histogram(BYTES_BUCKETS))  # callback -> Histogram
+_calls = Counter()
+_errors = Counter()
+_collectors = []
+
+
+def _observe_duration(callback, phase_name, seconds):
+    with _lock:
+        _durations[(callback, phase_name)].observe(seconds)
+
+
+# -------------------------------
+# Callback Instrumentation
+# -------------------------------
+def instrument(callback_name):
+    """Record call count, errors and total wall time of a Dash callback.
+
+    The name is also remembered for the current request, so that the
+    ``phase_timer`` laps inside the callback and the response hook can
+    attribute their measurements to it.
+    """
+    def decorator(callback):
+        @functools.wraps(callback)
+        def wrapper(*args, **kwargs):
+            _current.callback = callback_name
+            _current.callback_seconds = 0.0
+            _current.phases = phases = Counter()
+            start = time.perf_counter()
+            try:
+                return callback(*args, **kwargs)
+            except Exception:
+                with _lock:
+                    _errors[callback_name] += 1
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                _current.callback_seconds = elapsed
+                _current.phases = None
+                with _lock:
+                    _calls[callback_name] += 1
+                    _durations[(callback_name, 'total')].observe(elapsed)
+                    for phase_name, seconds in phases.items():
+                        _durations[(callback_name, phase_name)].observe(seconds)
+        return wrapper
+    return decorator
+
+
+def phase_timer():
+    """Return a ``lap(phase)`` function for timing consecutive blocks of the running callback.
+
+    Each call adds the time since the previous lap (or since creation) to
+    ``phase``: ``filter``, ``aggregate`` or ``figure``. The totals are recorded
+    once the callback returns, so a phase may be lapped several times per call.
+    """
+    phases = getattr(_current, 'phases', None)
+    last = [time.perf_counter()]
+
+    def lap(phase_name):
+        now = time.perf_counter()
+        if phases is not None:
+            phases[phase_name] += now - last[0]
+        last[0] = now
+
+    return lap
+
+
+def bind_phases(function):
+    """Wrap ``function`` to run on another thread with ``phase_timer`` laps of its own.
+
+    The wrapper returns ``(result, laps)``, so threads never update the
+    callback's phases; ``merge_phases(laps)`` adds them once the result is
+    used. Laps of figures built concurrently add up, so a phase may then
+    exceed the callback's wall time.
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        _current.phases = laps = Counter()
+        try:
+            return function(*args, **kwargs), laps
+        finally:
+            _current.phases = None
+    return wrapper
+
+
+def merge_phases(laps):
+    """Add the laps of a ``bind_phases`` build to the callback running on this thread."""
+    phases = getattr(_current, 'phases', None)
+    if phases is not None:
+        phases.update(laps)
+
+
+def init_app(server):
+    """Time Dash's own serialization and record response sizes of ``/_dash-update-component``."""
+    from flask import request
+
+    @server.before_request
+    def start_timer():
+        _current.callback = None
+        _current.request_start = time.perf_counter()
+
+    @server.after_request
+    def record_response(response):
+        callback = getattr(_current, 'callback', None)
+        if callback is not None and request.path.endswith('/_dash-update-component'):
+            # Everything Dash does after the callback returns is mostly JSON encoding
+            total = time.perf_counter() - _current.request_start
+            _observe_duration(callback, 'serialize', max(total - _current.callback_seconds, 0.0))
+            if not response.direct_passthrough:
+                with _lock:
+                    _response_bytes[callback].observe(len(response.get_data()))
+        return response
+
+    @server.route('/metrics')
+    def serve_metrics():
+        return render(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
+    if CALLBACK_PROFILER:
+        @server.route('/metrics/profile')
+        def serve_profile():
+            return _profiler.collapsed(), 200, {'Content-Type': 'text/plain; charset=utf-8'}
+
+
+def start_profiler():
+    """Start the sampling profiler thread of this process (CALLBACK_PROFILER=1)."""
+    if CALLBACK_PROFILER:
+        _profiler.start()
+
+
+def register_collector(collect):
+    """Add a callable returning ``[(name, type, help, [(labels dict, value), ...]), ...]`` to /metrics."""
+    _collectors.append(collect)
+
+
+# -------------------------------
+# Prometheus Text Format
+# -------------------------------
+def _labels(**labels):
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels.items()) + '}'
+
+
+def _histogram_lines(name, histogram, labels):
+    for bound, cumulative in histogram.samples():
+        yield f"{name}_bucket{_labels(**labels, le=bound)} {cumulative}"
+    yield f"{name}_sum{_labels(**labels)} {histogram.sum}"
+    yield f"{name}_count{_labels(**labels)} {sum(histogram.counts)}"
+
+
+def render():
+    lines = []
+    with _lock:
+        lines += ["# HELP dash_callback_calls_total Dash callback invocations.",
+                  "# TYPE dash_callback_calls_total counter"]
+        lines += [f"dash_callback_calls_total{_labels(callback=name)} {count}" for name, count in sorted(_calls.items())]
+        lines += ["# HELP dash_callback_errors_total Dash callback invocations that raised.",
+                  "# TYPE dash_callback_errors_total counter"]
+        lines += [f"dash_callback_errors_total{_labels(callback=name)} {count}" for name, count in sorted(_errors.items())]
+
+        lines += ["# HELP dash_callback_duration_seconds Callback wall time by phase.",
+                  "# TYPE dash_callback_duration_seconds histogram"]
+        for (name, phase_name), histogram in sorted(_durations.items()):
+            lines += _histogram_lines('dash_callback_duration_seconds', histogram, {'callback': name, 'phase': phase_name})
+
+        lines += ["# HELP dash_callback_response_bytes Size of the _dash-update-component response body.",
+                  "# TYPE dash_callback_response_bytes histogram"]
+        for name, histogram in sorted(_response_bytes.items()):
+            lines += _histogram_lines('dash_callback_response_bytes', histogram, {'callback': name})
+
+    for collect in _collectors:
+        for name, metric_type, help_text, samples in collect():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+            lines += [f"{name}{_labels(**labels) if labels else ''} {value}" for labels, value in samples]
+    return '\n'.join(lines) + '\n'
+
+
+# -------------------------------
+# Sampling Profiler
+# -------------------------------
+class SamplingProfiler:
+    """Sample the stacks of threads running an instrumented callback.
+
+    ``collapsed()`` returns one ``frame;frame;frame count`` line per distinct
+    stack, the input format of flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.stacks = Counter()
+
+    def start(self):
+        thread = threading.Thread(target=self._run, name='callback-profiler', daemon=True)
+        thread.start()
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while True:
+            time.sleep(self.interval)
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or not self._in_callback(frame):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                with _lock:
+                    self.stacks[';'.join(reversed(stack))] += 1
+
+    @staticmethod
+    def _in_callback(frame):
+        # Only stacks that pass through an instrument() wrapper are interesting
+        while frame is not None:
+            if frame.f_code.co_name == 'wrapper' and frame.f_code.co_filename == __file__:
+                return True
+            frame = frame.f_back
+        return False
+
+    def collapsed(self):
+        with _lock:
+            return '\n'.join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + '\n'
+
+
+_profiler = SamplingProfiler(PROFILER_INTERVAL)
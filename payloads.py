@@ -0,0 +1,53 @@
+import os
+
+import numpy as np
+
+# -------------------------------
+# Payload Caps
+# -------------------------------
+# Marks per chart whatever the size of the selection: beyond the cap, the
+# smallest communes / DFCI cells are summed into a single "Other" entry
+BAR_CHART_MAX_BARS = int(os.environ.get('BAR_CHART_MAX_BARS', 50))
+BUBBLE_CHART_MAX_POINTS = int(os.environ.get('BUBBLE_CHART_MAX_POINTS', 200))
+
+# Decimals kept in the float arrays of a figure, which are then sent as float32
+FIGURE_DECIMALS = int(os.environ.get('FIGURE_DECIMALS', 2))
+
+
+def top_n(data, n, by=None):
+    """Split ``data`` into at most ``n - 1`` largest rows and the others, or all of it and nothing when it has ``n`` rows or fewer.
+
+    Rows are ranked by the column ``by``, or by the values of a Series. The
+    kept rows stay in their original order, leaving one slot of the cap for
+    an "Other" entry summing the rest.
+    """
+    if len(data) <= n:
+        return data, data.iloc[:0]
+    values = (data if by is None else data[by]).to_numpy()
+    keep = np.zeros(len(values), dtype=bool)
+    keep[np.argsort(-values, kind='stable')[:max(n - 1, 0)]] = True
+    return data[keep], data[~keep]
+
+
+def _trimmed(values, decimals):
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+        return np.round(values, decimals).astype('float32')
+    return values
+
+
+def compact_figure(fig, decimals=FIGURE_DECIMALS):
+    """Round the float arrays of every trace to ``decimals`` and store them as float32, in place.
+
+    Plotly serializes numeric arrays as base64 ("bdata"): float32 halves
+    them, and integer arrays are already narrowed to their smallest type.
+    """
+    for trace in fig.data:
+        for name in ('x', 'y', 'z'):
+            if name in trace:
+                trace[name] = _trimmed(trace[name], decimals)
+        marker = getattr(trace, 'marker', None)
+        if marker is not None:
+            for name in ('color', 'size'):
+                if name in marker:
+                    marker[name] = _trimmed(marker[name], decimals)
+    return fig
@@ -1 +0,0 @@
-var json_COMMUNE_BR_unique_2 = {"type":"FeatureCollection","name":"COMMUNE_BR_unique_2","crs":{"type":"name","properties":{"name":"urn:ogc:def:crs:OGC:1.3:CRS84"}},"features":[{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000000990","CODE_COM":"088","INSEE_COM":"13088","NOM_COM":"LE ROVE","STATUT":"Commune simple","X_CHF_LIEU":882468.0,"Y_CHF_LIEU":6254831.0,"X_CENTROID":882718.0,"Y_CENTROID":6254489.0,"Z_MOYEN":149.0,"SUPERFICIE":"2312","POPULATION":"4557","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.273748874,43.347362518],[5.273748874,43.3473119854],[5.2716176041,43.345635721],[5.2703975055,43.3446524722],[5.267917156,43.3433198319],[5.267917156,43.343471528],[5.267083169,43.343471528],[5.267083169,43.343193055],[5.266805171,43.343193055],[5.266805171,43.342918395],[5.266527176,43.342918395],[5.266527176,43.3425729733],[5.2661206771,43.3423545479],[5.2640406089,43.3412513758],[5.26375103,43.341251374],[5.26375103,43.341526032],[5.262889863,43.341526032],[5.2620821,43.341526032],[5.2620821,43.341251374],[5.261528969,43.341251374],[5.261528969,43.34067154],[5.261528969,43.340415955],[5.261118412,43.340415955],[5.260972023,43.340415955],[5.260972023,43.340324401],[5.260972023,43.3396237912],[5.2608976682,43.3395843511],[5.260694027,43.339584351],[5.260694027,43.3394763328],[5.2576422114,43.3378574517],[5.255971908,43.337228663],[5.255971908,43.337360382],[5.255693913,43.337360382],[5.255693913,43.337638855],[5.25557232,43.337638855],[5.254859924,43.337638855],[5.254859924,43.337409974],[5.254705906,43.337360382],[5.254583836,43.337360382],[5.254583836,43.336807251],[5.25430584,43.336807251],[5.25430584,43.3366014296],[5.2541128692,43.3365287783],[5.253749847,43.336528778],[5.253749847,43.3363921033],[5.253471851,43.3362874387],[5.253471851,43.336528778],[5.253193856,43.336528778],[5.253193856,43.336250305],[5.25291586,43.336250305],[5.25291586,43.3360781067],[5.2511544087,43.335414887],[5.250971794,43.335414886],[5.250971794,43.3353461266],[5.2504249732,43.335140228],[5.250418186,43.335140228],[5.250418186,43.3351376724],[5.2496854322,43.3348617563],[5.249306201,43.334861755],[5.249306201,43.3347189551],[5.2489459069,43.3345832828],[5.248470784,43.334583282],[5.248470784,43.3344043678],[5.2482064013,43.334304809],[5.248192787,43.334304809],[5.248192787,43.3342996823],[5.2466980035,43.3337367716],[5.2451146298,43.333194734],[5.244861125,43.333194732],[5.244861125,43.3331079484],[5.2435329413,43.3326532402],[5.240695,43.331745996],[5.240695,43.331806184],[5.239861011,43.331806184],[5.239861011,43.3316288895],[5.2382054732,43.3314389066],[5.2371710712,43.3317230962],[5.2371034396,43.3317910915],[5.2347186055,43.3371816066],[5.234251788,43.3388471646],[5.2334130831,43.3419891283],[5.2333086187,43.3424115645],[5.2333882663,43.3429075955],[5.2335163361,43.3436348154],[5.2340353267,43.3440128784],[5.2349949681,43.344465531],[5.2353209806,43.3445730887],[5.2355530611,43.3446114902],[5.2360561181,43.3443878018],[5.2347978641,43.3521318633],[5.2306500194,43.3602118537],[5.2261506781,43.3693771082],[5.2216326415,43.3718908844],[5.2169456029,43.3763059736],[5.2163792761,43.377010553],[5.2158977587,43.3777070933],[5.2155925616,43.3784009221],[5.2147808302,43.3802966842],[5.2142836959,43.3814867244],[5.2142760748,43.3818981695],[5.2149510471,43.3818348596],[5.2199591263,43.3815711573],[5.224224743,43.381508779],[5.2261685771,43.3815525123],[5.2265401196,43.3815880685],[5.2284221447,43.3819156269],[5.2343584638,43.3839828979],[5.241956289,43.3868452424],[5.2431744863,43.3880862882],[5.2435925853,43.3884601186],[5.2452085973,43.3895524995],[5.2498712152,43.3921493683],[5.2510679125,43.3925807868],[5.252466056,43.3929558014],[5.2534090177,43.3930837756],[5.2574617631,43.3929840353],[5.2579593881,43.3929592567],[5.2586154475,43.3928204704],[5.2690440596,43.390974275],[5.2713076616,43.3911680023],[5.2722590639,43.3913217354],[5.2754227116,43.388745175],[5.2764303598,43.3865144871],[5.2768103885,43.3855146945],[5.2774588637,43.3838459539],[5.2787911926,43.3804699203],[5.2789955808,43.379897719],[5.2808062272,43.378042484],[5.283977027,43.3750830276],[5.2826249697,43.3715700836],[5.2788367594,43.3675918763],[5.2780521632,43.3642856485],[5.279723982,43.3608979943],[5.2817710611,43.3567446205],[5.2822802425,43.3538755424],[5.2822491901,43.3536521027],[5.2810865542,43.353070039],[5.2756621822,43.3488167038],[5.2738131261,43.3473625181],[5.273748874,43.347362518]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000001102","CODE_COM":"065","INSEE_COM":"13065","NOM_COM":"MOURIES","STATUT":"Commune simple","X_CHF_LIEU":850887.0,"Y_CHF_LIEU":6289582.0,"X_CENTROID":852167.0,"Y_CENTROID":6289980.0,"Z_MOYEN":88.0,"SUPERFICIE":"3836","POPULATION":"3448","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8234706395,43.6798964696],[4.8238551188,43.6809493862],[4.8260694513,43.6846654669],[4.8293516481,43.689962972],[4.831782539,43.6907312263],[4.8341714028,43.6914632339],[4.8367500347,43.6918832652],[4.8409943052,43.6923326697],[4.8463541126,43.694523516],[4.8507408005,43.6969916847],[4.854044505,43.7028606201],[4.8573459141,43.7078726539],[4.861162385,43.7118389135],[4.8628953215,43.7131953928],[4.8699331703,43.7165247346],[4.8762299047,43.7194433772],[4.8770331812,43.7197184575],[4.877894346,43.7200555397],[4.8810414524,43.7228832976],[4.8819984803,43.7243222082],[4.8824773571,43.725146516],[4.8837328577,43.7299961224],[4.8836364107,43.731591866],[4.8834384146,43.7333459852],[4.8833515483,43.7334600004],[4.8845510121,43.7339225996],[4.8851500623,43.7342083623],[4.8853086723,43.7343505323],[4.8854142869,43.7344666167],[4.88551421,43.7346737099],[4.8855723289,43.7348176197],[4.8902623683,43.7377921489],[4.8958501388,43.7401558928],[4.9095629805,43.7392807982],[4.9163329381,43.7378035931],[4.9174674719,43.7375027847],[4.9182414479,43.7366304454],[4.9225078458,43.7310384167],[4.9242885932,43.7269978721],[4.9254700719,43.7242622585],[4.9295675518,43.712195821],[4.9273588909,43.7081440074],[4.925238457,43.7046405624],[4.9241708953,43.692807046],[4.9245750954,43.6918044005],[4.9264012345,43.6866829966],[4.9266473922,43.6862204946],[4.9294647635,43.6790563083],[4.929055518,43.6713579966],[4.9147820253,43.6701025991],[4.9082907103,43.6701383818],[4.9026685095,43.6706563138],[4.90235841,43.6706905404],[4.9013281762,43.6708084629],[4.8994123629,43.6710318515],[4.8969759109,43.6718223298],[4.8957123858,43.672235889],[4.893149709,43.6733750062],[4.889916824,43.6746877214],[4.8886401211,43.6751563304],[4.8868594887,43.6757623766],[4.8854734041,43.6762247446],[4.8779640322,43.6785526135],[4.8765074709,43.678722661],[4.8729304917,43.6789382194],[4.8701673678,43.6782522073],[4.8680961262,43.6779412736],[4.8668772641,43.6779468981],[4.8650858416,43.6780784358],[4.8581763315,43.6787817266],[4.8457230731,43.6803672325],[4.8320312561,43.6800073477],[4.8292094226,43.6797983197],[4.8252081565,43.6798205273],[4.8234706395,43.6798964696]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000001201","CODE_COM":"117","INSEE_COM":"13117","NOM_COM":"VITROLLES","STATUT":"Commune simple","X_CHF_LIEU":882170.0,"Y_CHF_LIEU":6263578.0,"X_CENTROID":883191.0,"Y_CENTROID":6264444.0,"Z_MOYEN":112.0,"SUPERFICIE":"3676","POPULATION":"34493","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3010000126,43.4461122912],[5.3014597262,43.4456228016],[5.3018012943,43.4451754223],[5.310046929,43.4336431449],[5.3107281842,43.4318168302],[5.3108224141,43.4315493078],[5.3097058553,43.4316694267],[5.3006202182,43.4326953159],[5.299575701,43.4327030948],[5.2971879623,43.4319806266],[5.2962735058,43.4312241848],[5.2950544253,43.4296416588],[5.2949160761,43.4294240817],[5.2948574925,43.4282030767],[5.2948415581,43.4268128631],[5.290033713,43.4197287937],[5.2860291424,43.4200627062],[5.2809749977,43.4200540712],[5.2782144027,43.419655868],[5.2760097583,43.419171211],[5.2749386619,43.4188751089],[5.274475211,43.4188641429],[5.2738141984,43.4185405161],[5.2678914286,43.4183866046],[5.2618474954,43.4190755159],[5.2480450847,43.4212664339],[5.2391382575,43.4230286688],[5.2390144051,43.42308253],[5.2387082956,43.4235298637],[5.2322250431,43.4328726147],[5.2292975425,43.437447387],[5.2267808778,43.4413197269],[5.2232945783,43.4461605372],[5.2222392379,43.4474926202],[5.2205920387,43.4491104316],[5.2204716076,43.4491588008],[5.2205414696,43.4493364737],[5.2272433424,43.4567087533],[5.2301377569,43.4650780444],[5.2299938203,43.4658910393],[5.2295037222,43.4674329862],[5.227988403,43.4718896383],[5.2241155118,43.4786033811],[5.2234187295,43.4791225989],[5.2237688446,43.4791631198],[5.2283380822,43.4789027852],[5.2307051072,43.4786191919],[5.2368019171,43.4777546246],[5.2378840875,43.47755048],[5.239115348,43.4772712414],[5.2429669824,43.4751593065],[5.2471905545,43.4752662413],[5.2524563538,43.4770533572],[5.2558112945,43.479681955],[5.2564750676,43.4803755839],[5.2573444816,43.4813637463],[5.2576641622,43.4827368764],[5.2579568284,43.4833275194],[5.258970863,43.4838734317],[5.2716540399,43.4856749606],[5.2711413294,43.4848063403],[5.2710662447,43.4840635614],[5.2712140323,43.482516859],[5.2717922586,43.4815407779],[5.2733971442,43.4832406543],[5.2757019822,43.4852579448],[5.279138448,43.4850084444],[5.2794547702,43.4848181807],[5.280187949,43.4841988189],[5.2810469698,43.4833868905],[5.2812130295,43.4827434501],[5.2812310156,43.4821688303],[5.2811763834,43.4817577504],[5.2814977571,43.4806988126],[5.2817407164,43.4800312523],[5.2823163593,43.4788706541],[5.2855303868,43.476300764],[5.2861182133,43.4761020556],[5.2871052574,43.4765249655],[5.2893374864,43.4754409725],[5.290131994,43.4729850208],[5.290177493,43.472669038],[5.2902209091,43.4721766873],[5.2902486963,43.4705784927],[5.2886629074,43.4693312045],[5.28760765,43.4671600414],[5.2903660985,43.4638777814],[5.29090314,43.4632453923],[5.2918686343,43.4625742387],[5.2939017034,43.4612216443],[5.2961663019,43.459047756],[5.2979056427,43.456163117],[5.2983413351,43.4495673033],[5.2989790741,43.4480290913],[5.2995786779,43.4473917337],[5.3010000126,43.4461122912]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000001235","CODE_COM":"015","INSEE_COM":"13015","NOM_COM":"BOUC-BEL-AIR","STATUT":"Commune simple","X_CHF_LIEU":895470.0,"Y_CHF_LIEU":6264687.0,"X_CENTROID":895622.0,"Y_CENTROID":6263938.0,"Z_MOYEN":219.0,"SUPERFICIE":"2191","POPULATION":"13963","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3792888519,43.4146364034],[5.3782984584,43.4159164343],[5.3753699869,43.4193019099],[5.3748676404,43.4200248708],[5.3759031226,43.4205808941],[5.3838629737,43.4254472084],[5.3907593906,43.432685641],[5.3908413888,43.432786439],[5.3917493649,43.4348707579],[5.3921594219,43.4364449288],[5.3923087406,43.4372435957],[5.3925038766,43.4385497925],[5.3922207946,43.4397621431],[5.390382024,43.443161811],[5.3883112018,43.4543657597],[5.3876306493,43.4610071794],[5.3875381005,43.4619030047],[5.3885659636,43.463741737],[5.393427084,43.4648046068],[5.4030940648,43.4695862176],[5.4095381015,43.4703882539],[5.422182469,43.4710929314],[5.4372536276,43.4714256598],[5.4417897012,43.4715188881],[5.4425845569,43.470969912],[5.4438778403,43.470109955],[5.4462104198,43.4686972641],[5.4475672085,43.4668349045],[5.4486748312,43.465217588],[5.4486768971,43.4602462389],[5.447607617,43.4566078646],[5.4451770726,43.4476554283],[5.44501872,43.4474177758],[5.4434636509,43.4467561833],[5.4426722459,43.4463311818],[5.4394617448,43.4441235794],[5.4374596099,43.4429364168],[5.4362054846,43.4422004487],[5.4337981862,43.4409809298],[5.4316436394,43.439923104],[5.4308304128,43.4395327153],[5.4295941625,43.4390113957],[5.4250094842,43.437820702],[5.4182339948,43.4357525662],[5.4177244403,43.4354426117],[5.4166239434,43.4346489966],[5.4164786883,43.433807963],[5.4171898606,43.4312448743],[5.4188632777,43.427924037],[5.4193029284,43.4265731051],[5.4194787372,43.425497189],[5.4163907035,43.4215986136],[5.4132024755,43.4210126534],[5.4052338426,43.4202367572],[5.3933136931,43.4166890896],[5.3927216809,43.4164969587],[5.3921996127,43.416264577],[5.3900563835,43.415675561],[5.3861965494,43.4146293138],[5.3833379674,43.4147111692],[5.3810848201,43.4150127518],[5.380003703,43.4148448074],[5.3792888519,43.4146364034]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000001256","CODE_COM":"005","INSEE_COM":"13005","NOM_COM":"AUBAGNE","STATUT":"Commune simple","X_CHF_LIEU":908730.0,"Y_CHF_LIEU":6246913.0,"X_CENTROID":908602.0,"Y_CENTROID":6247830.0,"Z_MOYEN":193.0,"SUPERFICIE":"5484","POPULATION":"45303","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5472076601,43.2466294689],[5.5449206442,43.2465006953],[5.5403117035,43.2461205257],[5.5348666895,43.2456796923],[5.5299790654,43.2452858274],[5.5246466265,43.2448814445],[5.5216901138,43.2447264342],[5.5196413481,43.2443269687],[5.5182167188,43.2495684251],[5.5148536682,43.2601190927],[5.5130526963,43.263440595],[5.5146558694,43.2672489752],[5.5144448048,43.2676903884],[5.5157349236,43.2681004496],[5.5170056387,43.2684605481],[5.5189933487,43.2679786126],[5.5215738185,43.2676466046],[5.5242206865,43.267650484],[5.5295929344,43.2679037112],[5.5309733461,43.2679829764],[5.5323296985,43.2684398909],[5.5319596243,43.2696329755],[5.5314487165,43.2714341657],[5.5309467006,43.2734106488],[5.5306797989,43.2744861137],[5.530547662,43.2750679158],[5.5304314796,43.2756484444],[5.5303371611,43.276390463],[5.5302560762,43.2770691711],[5.5303403863,43.2775028025],[5.5308268408,43.2792968347],[5.530653072,43.2809794322],[5.5305324973,43.2820496747],[5.5302765697,43.2833201913],[5.5285662779,43.2836770359],[5.5253386706,43.2826941044],[5.5229521202,43.2819263468],[5.521928791,43.2817378349],[5.5204489632,43.2819559691],[5.5186967836,43.2865157952],[5.5185774102,43.2869136842],[5.518417083,43.2880100396],[5.5185283097,43.2892026685],[5.5214352099,43.291918634],[5.5228619362,43.293240765],[5.5245904379,43.2941931216],[5.5253180975,43.2942931228],[5.5257282647,43.2942898372],[5.5286462118,43.2958110419],[5.5320775896,43.2982732738],[5.5322789027,43.2986483688],[5.5324977612,43.2992264588],[5.5324865692,43.2995327308],[5.5285530037,43.3048963044],[5.525662636,43.3122568476],[5.5227025149,43.3202372929],[5.5228128155,43.3207576422],[5.5239267666,43.3209728533],[5.5248377866,43.3212548954],[5.5258831657,43.3217615017],[5.5270254847,43.322651051],[5.5291060201,43.3244681939],[5.5316258248,43.3265153307],[5.5354781141,43.3293925269],[5.5406384664,43.3330408245],[5.5422083779,43.3338580808],[5.546034831,43.335401661],[5.5478806727,43.3357632133],[5.5484615986,43.3358224293],[5.5494001447,43.3359659181],[5.5532488684,43.3362234395],[5.5646525487,43.3352299372],[5.5714689148,43.3338484705],[5.5754217645,43.3328219284],[5.576735573,43.3324504036],[5.57940624,43.331623472],[5.5845834621,43.3298617214],[5.5896691505,43.3281550143],[5.5951933533,43.326418637],[5.5987285063,43.3254993597],[5.5998585374,43.3252147722],[5.6005391164,43.325051693],[5.6010402937,43.3249838327],[5.601806707,43.3248924863],[5.6066167338,43.3242797879],[5.6096354923,43.323833435],[5.6096421736,43.3226469763],[5.6098001573,43.3197926331],[5.6100574658,43.3167909862],[5.6102791918,43.3137118984],[5.6102826913,43.3129998606],[5.6096552079,43.3071447887],[5.6083401691,43.3009895181],[5.6080099784,43.2995474942],[5.6078092877,43.2906157048],[5.6089328052,43.2847841692],[5.6127681093,43.2769547011],[5.615342134,43.2701250067],[5.6126208463,43.269706639],[5.6106522674,43.2693996198],[5.606578008,43.2685574752],[5.6047295801,43.2681547472],[5.6035510197,43.2673389299],[5.5973668413,43.2647913253],[5.5903137635,43.2646843939],[5.5896992546,43.2649322359],[5.5878119904,43.2660466989],[5.5866218359,43.266806027],[5.5865785882,43.2670500697],[5.584922977,43.2689392564],[5.5794474909,43.2700232741],[5.572743959,43.2682939936],[5.5699220324,43.2673207452],[5.5669848638,43.265554549],[5.565283851,43.2644420397],[5.5638752204,43.2634503683],[5.5633509134,43.2628202023],[5.5607001866,43.2603117435],[5.5577730419,43.2586458852],[5.5551662027,43.25745208],[5.5492850952,43.2560313531],[5.5444335504,43.2546076622],[5.5468468831,43.2480788745],[5.5472076601,43.2466294689]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000001543","CODE_COM":"098","INSEE_COM":"13098","NOM_COM":"SAINT-MITRE-LES-REMPARTS","STATUT":"Commune simple","X_CHF_LIEU":863080.0,"Y_CHF_LIEU":6263849.0,"X_CENTROID":863270.0,"Y_CENTROID":6264281.0,"Z_MOYEN":52.0,"SUPERFICIE":"2115","POPULATION":"5870","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.021424457,43.4328831779],[5.0207191551,43.4334057092],[5.0178244137,43.4365366031],[5.0148035142,43.4380138528],[5.0059654752,43.4400596551],[4.9974079467,43.4421625536],[4.9876050077,43.4444145143],[4.9847950667,43.4450230927],[4.9828011102,43.4453691825],[4.9808248838,43.445298235],[4.9807502282,43.4454975884],[4.9805150174,43.4457691725],[4.9769552935,43.4573418543],[4.9795916792,43.46477148],[4.9770540391,43.4720372943],[4.9761118484,43.4739264012],[4.9759012893,43.4741282318],[4.9770528402,43.4747336123],[4.9840357966,43.4774769353],[4.9870494137,43.478174116],[4.9896934997,43.4776549351],[4.9929738908,43.4748866637],[4.9961381632,43.471737044],[4.9966432447,43.4710869634],[4.9975870738,43.4701192066],[4.9985988679,43.4693301823],[4.9992589188,43.4689094242],[5.0028885548,43.468036044],[5.0035637465,43.4680865634],[5.0051418379,43.4682328759],[5.0058559197,43.4683708588],[5.0059218407,43.4687728257],[5.0060048639,43.4696649604],[5.0070822026,43.469624318],[5.0178344378,43.4693211939],[5.0235963419,43.4697042654],[5.0304816448,43.4701937912],[5.0354486857,43.4705281241],[5.0366703661,43.4705852748],[5.0379847941,43.470644268],[5.0406190762,43.4702185155],[5.0413605119,43.4699750595],[5.0438354961,43.4687890432],[5.0481333613,43.466711757],[5.0489136627,43.4662434186],[5.0502288426,43.4653554666],[5.0508586897,43.4646883642],[5.0518847548,43.4635601674],[5.0529647796,43.4611412679],[5.0549690681,43.4538881622],[5.055239816,43.4515430937],[5.0552500444,43.4497897519],[5.0551607289,43.4485692837],[5.054872657,43.4464184165],[5.0541796166,43.4432339677],[5.0542403549,43.4429979244],[5.0533104268,43.4429669537],[5.0530635667,43.4429716318],[5.0406108936,43.4395926336],[5.0263904961,43.4347198969],[5.0218461617,43.4330759972],[5.021424457,43.4328831779]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000001814","CODE_COM":"109","INSEE_COM":"13109","NOM_COM":"LE THOLONET","STATUT":"Commune simple","X_CHF_LIEU":903072.0,"Y_CHF_LIEU":6272418.0,"X_CENTROID":902544.0,"Y_CENTROID":6271760.0,"Z_MOYEN":237.0,"SUPERFICIE":"1085","POPULATION":"2313","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.525889025,43.5380112041],[5.5272111427,43.5373214824],[5.5280628964,43.5363195381],[5.5269675101,43.531278824],[5.5313543566,43.5259915134],[5.5271946906,43.5212023364],[5.5273216747,43.5186059755],[5.5279727901,43.5156652409],[5.5288746777,43.5143767749],[5.5292969126,43.5141904957],[5.5323259749,43.5128982828],[5.534156113,43.5121038931],[5.5342408788,43.5113898767],[5.5343284755,43.5097027098],[5.5342480037,43.5095326577],[5.5323202123,43.5057807776],[5.5316897445,43.5054777389],[5.5315746232,43.5055875462],[5.5302793148,43.5054080376],[5.5286771325,43.5051681573],[5.5197525622,43.506196837],[5.512860159,43.5071525034],[5.5007054066,43.5079987556],[5.4881265989,43.509083807],[5.4816760315,43.5122408112],[5.4807794293,43.5126438877],[5.4795040648,43.512553331],[5.4794687076,43.5134821968],[5.4781996816,43.5193306979],[5.4767841034,43.5203234961],[5.4766531751,43.5204714106],[5.4765866328,43.5206781656],[5.4764124113,43.5222034084],[5.4763717064,43.5226652183],[5.476892413,43.5237533237],[5.4772915908,43.5243752201],[5.4779961039,43.5249343315],[5.4792295792,43.5257964076],[5.4804763735,43.5264790345],[5.4814683621,43.5268470188],[5.4823277548,43.5271523166],[5.4826765582,43.526463812],[5.4875184278,43.5258299025],[5.4929364473,43.5261880213],[5.5039367918,43.5291068797],[5.5055359596,43.5306263579],[5.5062517178,43.5320303003],[5.5063004335,43.5322110102],[5.5063007086,43.532274016],[5.5082569397,43.5344864498],[5.5102907334,43.5362901799],[5.5165011782,43.5378755661],[5.5173745109,43.538038945],[5.5190279551,43.5382994323],[5.5256002945,43.5381142449],[5.525889025,43.5380112041]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000001855","CODE_COM":"208","INSEE_COM":"13208","NOM_COM":"MARSEILLE-8E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":893498.0,"Y_CHF_LIEU":6244145.0,"X_CENTROID":893370.0,"Y_CENTROID":6244428.0,"Z_MOYEN":96.0,"SUPERFICIE":"2075","POPULATION":"79010","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.380139,43.209862],[5.379861,43.209862],[5.379861,43.21014],[5.378749,43.21014],[5.378749,43.209862],[5.375973,43.209862],[5.375973,43.209583],[5.375695,43.209583],[5.375695,43.2095052598],[5.3710927696,43.2081880849],[5.3700257829,43.20775977],[5.3680157751,43.2075249241],[5.3645717325,43.2071495907],[5.3636491662,43.2071221067],[5.361528,43.2075000162],[5.361528,43.207638],[5.36125,43.207638],[5.36125,43.207916],[5.360972,43.207916],[5.360972,43.208195],[5.360694,43.208195],[5.360694,43.208393],[5.360694,43.208473],[5.36042,43.208473],[5.359862,43.208473],[5.359862,43.208195],[5.35875,43.208195],[5.35875,43.2079948776],[5.3567558865,43.2083500516],[5.3554215316,43.2086932494],[5.3548795392,43.2088877577],[5.3529790247,43.2098597102],[5.351805,43.2102800052],[5.351805,43.210415],[5.3514278985,43.2104150018],[5.350139,43.2108763929],[5.350139,43.210972],[5.3498719122,43.2109720004],[5.349583,43.2110754191],[5.349583,43.21125],[5.3490952713,43.2112500033],[5.347639,43.2117712616],[5.347639,43.211807],[5.3475391522,43.2118070001],[5.347361,43.2118707657],[5.347361,43.212082],[5.3467708223,43.2120820037],[5.345609773,43.2124975558],[5.3433270186,43.2140922745],[5.3425610087,43.2162578697],[5.3428958156,43.217083],[5.342896,43.217083],[5.343473,43.217083],[5.343473,43.216805],[5.345139,43.216805],[5.345139,43.217918],[5.344861,43.217918],[5.344861,43.218193],[5.344583,43.218193],[5.344583,43.221191],[5.344583,43.221240693],[5.3446706661,43.2214567099],[5.3451239021,43.2230720978],[5.3454168577,43.223751],[5.345417,43.223751],[5.345417,43.2237513298],[5.34565549,43.224304],[5.345695,43.224304],[5.345695,43.2243955585],[5.3457758867,43.2245830002],[5.346251,43.224583],[5.346251,43.2256839716],[5.3463696606,43.225958935],[5.346947852,43.2270850001],[5.347083,43.227085],[5.347083,43.2273482029],[5.3470890575,43.22736],[5.347361,43.22736],[5.347361,43.227638],[5.347917,43.227638],[5.347917,43.2289723753],[5.3483543738,43.2298241001],[5.3489674778,43.2306458827],[5.3498255789,43.2315901186],[5.3505471774,43.2320820005],[5.350695,43.232082],[5.350695,43.232182763],[5.3509564831,43.2323610004],[5.351249,43.232361],[5.351249,43.2325207573],[5.3514849568,43.232639],[5.351527,43.232639],[5.351527,43.2326600686],[5.351895111,43.2328445343],[5.3534489294,43.2331607419],[5.3549168263,43.2330297422],[5.3566666831,43.233564808],[5.3575575975,43.234133005],[5.3584531024,43.2347829878],[5.3592323604,43.2355695928],[5.3604013506,43.23764],[5.360418,43.23764],[5.360418,43.2376694868],[5.3605566274,43.2379150001],[5.360694,43.237915],[5.360694,43.2380806897],[5.3608563419,43.2381940001],[5.360972,43.238194],[5.360972,43.238274726],[5.3669067685,43.2424165548],[5.3725248187,43.2450776507],[5.3728425115,43.2454190003],[5.372917,43.245419],[5.372917,43.2454990349],[5.3730975253,43.2456930001],[5.373195,43.245693],[5.373195,43.2458095255],[5.3744275885,43.247920553],[5.374583,43.247921],[5.374583,43.2481867112],[5.3745884238,43.248196],[5.374733,43.248196],[5.374861,43.248196],[5.374861,43.248474],[5.3747378695,43.2484740001],[5.3760469741,43.2551569122],[5.3760820887,43.2558301965],[5.3755716157,43.2579150031],[5.376509,43.257915],[5.376805,43.257915],[5.376805,43.257637],[5.377361,43.257637],[5.377361,43.256805],[5.377639,43.256805],[5.377639,43.255974],[5.378195,43.255974],[5.378195,43.255695],[5.378473,43.255695],[5.378473,43.255417],[5.378749,43.255417],[5.378749,43.25486],[5.380695,43.25486],[5.380695,43.255138],[5.381527,43.255138],[5.381527,43.257084],[5.381249,43.257084],[5.381249,43.259304],[5.380971,43.259304],[5.380971,43.260418],[5.380695,43.260418],[5.380695,43.260971],[5.380417,43.260971],[5.380417,43.261528],[5.379583,43.261528],[5.379583,43.26125],[5.379305,43.26125],[5.379305,43.260971],[5.379027,43.260971],[5.379027,43.260418],[5.378195,43.260418],[5.378195,43.260693],[5.377917,43.260693],[5.377917,43.260971],[5.376055,43.260971],[5.375139,43.260971],[5.375139,43.26125],[5.374861,43.26125],[5.374861,43.261528],[5.374583,43.261528],[5.374583,43.261806],[5.374305,43.261806],[5.374305,43.262085],[5.373751,43.262085],[5.373751,43.262924],[5.373751,43.263474],[5.373473,43.263474],[5.373473,43.264862],[5.373195,43.264862],[5.373195,43.265694],[5.372917,43.265694],[5.372917,43.266251],[5.372639,43.266251],[5.372639,43.266529],[5.372361,43.266529],[5.372361,43.266804],[5.372083,43.266804],[5.372083,43.267082],[5.371805,43.267082],[5.371805,43.267361],[5.370973,43.267361],[5.370973,43.267639],[5.369582,43.267639],[5.369582,43.267918],[5.369307,43.267918],[5.369307,43.268196],[5.369029,43.268196],[5.369029,43.268471],[5.368751,43.268471],[5.368751,43.268559],[5.368751,43.2685943894],[5.3709990514,43.269873968],[5.3726532686,43.2720650295],[5.3741322458,43.2772369779],[5.3738600876,43.2790338737],[5.3738174488,43.2791950031],[5.3740368664,43.2793485747],[5.3782418796,43.2803279487],[5.3819843613,43.2811400682],[5.3862604663,43.2820743718],[5.3869159549,43.2832685465],[5.3885585079,43.2831611513],[5.3887390906,43.2831490595],[5.3991057647,43.2775654691],[5.3998320649,43.274624452],[5.3991152999,43.2744189805],[5.3992183467,43.2730469481],[5.4009636917,43.2700607959],[5.4000124907,43.2688075889],[5.3987388589,43.2682401051],[5.3952499739,43.2677676481],[5.3939307976,43.2678814871],[5.3991113329,43.258718399],[5.3990165589,43.2552250933],[5.3945566735,43.253380182],[5.3946626976,43.2519892132],[5.3948230975,43.2513448948],[5.3952891051,43.2507369957],[5.3969750536,43.249088685],[5.3971335157,43.2479836353],[5.396926346,43.2474122698],[5.3948265258,43.2450794111],[5.3925477286,43.2432949488],[5.3912781882,43.2380872375],[5.3915112689,43.2359888273],[5.3908644327,43.2341906883],[5.3895499831,43.2330327798],[5.3851208245,43.2322694898],[5.3806237392,43.2277674288],[5.3822630547,43.2232361491],[5.383387636,43.2234705016],[5.3836254926,43.223389656],[5.3815338698,43.2095879102],[5.3809535474,43.2096268125],[5.380139,43.2096099033],[5.380139,43.209862]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000001894","CODE_COM":"127","INSEE_COM":"83127","NOM_COM":"SIGNES","STATUT":"Commune simple","X_CHF_LIEU":932420.0,"Y_CHF_LIEU":6247786.0,"X_CENTROID":931591.0,"Y_CENTROID":6246912.0,"Z_MOYEN":558.0,"SUPERFICIE":"13337","POPULATION":"2732","CODE_ARR":"2","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.760929585,43.267345429],[5.7609265389,43.2673447249],[5.7608584947,43.2691084854],[5.7621979479,43.2775580449],[5.760929585,43.267345429]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000002114","CODE_COM":"089","INSEE_COM":"13089","NOM_COM":"SAINT-ANDIOL","STATUT":"Commune simple","X_CHF_LIEU":856402.0,"Y_CHF_LIEU":6305994.0,"X_CENTROID":857080.0,"Y_CENTROID":6304703.0,"Z_MOYEN":55.0,"SUPERFICIE":"1612","POPULATION":"3299","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9318756299,43.8534123455],[4.9322194232,43.8526167977],[4.9337648091,43.8494315806],[4.9341190092,43.8490184199],[4.9353477696,43.8487193717],[4.9380200143,43.8484387832],[4.9465695196,43.8476132221],[4.9529448187,43.8471581019],[4.9587375065,43.8472351785],[4.9610916812,43.8471145649],[4.9698540627,43.8452256218],[4.9722934428,43.8433964691],[4.9739958846,43.8420207923],[4.9758263408,43.8401773729],[4.9899912519,43.8376918834],[4.9918214671,43.8383219146],[4.9910516821,43.8337900155],[4.9908376174,43.830286796],[4.9903045053,43.8239052223],[4.9900947449,43.8234157512],[4.9897101966,43.8231554151],[4.9747780479,43.8202087375],[4.9727178681,43.8199894812],[4.9624980315,43.8195086792],[4.9497284981,43.818989731],[4.9467443325,43.8187577003],[4.9396552414,43.8179793782],[4.9359219122,43.8170609516],[4.93350689,43.8163026619],[4.9312965278,43.8154920863],[4.9234231935,43.813332267],[4.9207308554,43.8128567422],[4.9161031325,43.812418785],[4.9085078796,43.8120047178],[4.9077214594,43.8182385448],[4.9073594907,43.8208778343],[4.9072463838,43.8216611492],[4.9096551901,43.8226469697],[4.9129212157,43.823610503],[4.9149983462,43.824228461],[4.917826264,43.8252841597],[4.9208266703,43.8264375678],[4.930556292,43.8295000503],[4.9276990149,43.8356240364],[4.9315714471,43.8400374844],[4.9334826145,43.8437393525],[4.9332653407,43.8444858497],[4.9316985483,43.8469611902],[4.9311274493,43.8474709008],[4.9266648843,43.8507256379],[4.9261211417,43.8510530028],[4.9253989815,43.8516229615],[4.9262081413,43.8517518061],[4.927605376,43.8522771368],[4.9286131735,43.8526887113],[4.9318756299,43.8534123455]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000002183","CODE_COM":"003","INSEE_COM":"30003","NOM_COM":"AIGUES-MORTES","STATUT":"Commune simple","X_CHF_LIEU":796368.0,"Y_CHF_LIEU":6274912.0,"X_CENTROID":796379.0,"Y_CENTROID":6272954.0,"Z_MOYEN":1.0,"SUPERFICIE":"5776","POPULATION":"8450","CODE_ARR":"2","CODE_DEPT":"30","NOM_DEPT":"GARD","CODE_REG":"76","NOM_REG":"LANGUEDOC-ROUSSILLON-MIDI-PYRENEES"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.237933159,43.497081757],[4.2379400085,43.4970865192],[4.2379380192,43.4970799463],[4.23793397,43.4970798509],[4.237933159,43.497081757]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000002352","CODE_COM":"012","INSEE_COM":"13012","NOM_COM":"BEAURECUEIL","STATUT":"Commune simple","X_CHF_LIEU":905799.0,"Y_CHF_LIEU":6271256.0,"X_CENTROID":905717.0,"Y_CENTROID":6272538.0,"Z_MOYEN":311.0,"SUPERFICIE":"1006","POPULATION":"539","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.525889025,43.5380112041],[5.5260505425,43.5380542536],[5.5331721672,43.5381195725],[5.5396766212,43.5375192282],[5.5508300302,43.5371747747],[5.5596326718,43.5386148337],[5.5610641386,43.5387205867],[5.5613436342,43.5386059655],[5.5698881715,43.5370599269],[5.5704374564,43.5367255437],[5.5702368476,43.5363351079],[5.5651285487,43.5275449561],[5.5585281791,43.5236850758],[5.5572947364,43.5195994078],[5.5561640057,43.5149271032],[5.5561640043,43.5144545079],[5.5562532669,43.5129581036],[5.5562866153,43.5124289117],[5.5566852841,43.5107703851],[5.558115592,43.5076715489],[5.5601355693,43.5051537946],[5.5609418562,43.5048476004],[5.5618699017,43.5044710103],[5.5620522446,43.5042614621],[5.5598623648,43.5030466303],[5.554837027,43.5004421198],[5.5523136768,43.4992016961],[5.5519734816,43.4990593747],[5.5502394479,43.49994273],[5.5491126016,43.5004652195],[5.5468709616,43.5014765732],[5.5444991323,43.5024819326],[5.5421822171,43.5034445438],[5.5409547329,43.5038756881],[5.5397432331,43.5041093069],[5.5383616872,43.5042730786],[5.5369328353,43.5044019325],[5.5353739714,43.5045833164],[5.5325086409,43.50508955],[5.5320134091,43.5052172355],[5.5319415892,43.5052432169],[5.5316897445,43.5054777389],[5.5323202123,43.5057807776],[5.5342480037,43.5095326577],[5.5343284755,43.5097027098],[5.5342408788,43.5113898767],[5.534156113,43.5121038931],[5.5323259749,43.5128982828],[5.5292969126,43.5141904957],[5.5288746777,43.5143767749],[5.5279727901,43.5156652409],[5.5273216747,43.5186059755],[5.5271946906,43.5212023364],[5.5313543566,43.5259915134],[5.5269675101,43.531278824],[5.5280628964,43.5363195381],[5.5272111427,43.5373214824],[5.525889025,43.5380112041]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000002757","CODE_COM":"095","INSEE_COM":"13095","NOM_COM":"SAINT-MARC-JAUMEGARDE","STATUT":"Commune simple","X_CHF_LIEU":904017.0,"Y_CHF_LIEU":6275317.0,"X_CENTROID":903650.0,"Y_CENTROID":6276681.0,"Z_MOYEN":412.0,"SUPERFICIE":"2330","POPULATION":"1159","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.525889025,43.5380112041],[5.5256002945,43.5381142449],[5.5190279551,43.5382994323],[5.5173745109,43.538038945],[5.5165011782,43.5378755661],[5.5102907334,43.5362901799],[5.5082569397,43.5344864498],[5.5063007086,43.532274016],[5.5063004335,43.5322110102],[5.5034808468,43.5323274177],[5.4957873624,43.5330627747],[5.4908314285,43.5336465532],[5.4877384697,43.5335950925],[5.4828001799,43.5333589448],[5.4802834696,43.5339296014],[5.4798661791,43.5340939684],[5.4795484314,43.5344432937],[5.4792387725,43.5352380156],[5.4794299683,43.5360554992],[5.4824707273,43.5395623448],[5.4865363242,43.54292232],[5.48802177,43.5442754419],[5.4892594492,43.5454496939],[5.4890418263,43.5459677864],[5.4886103532,43.5474053634],[5.4891770186,43.5490576977],[5.490663752,43.5526036064],[5.4913112596,43.5539201151],[5.4918839498,43.5547099316],[5.4939074329,43.5561010507],[5.4955087824,43.5576881806],[5.4971728004,43.5593764704],[5.4984081498,43.5614238801],[5.4985187069,43.561688692],[5.4980020762,43.56216238],[5.4974660819,43.562504183],[5.4967964599,43.5627338326],[5.4956034864,43.5630556282],[5.4939701348,43.5646387935],[5.4933127886,43.5660923988],[5.4939582924,43.566645592],[5.4942221519,43.5671337354],[5.5053627874,43.5762617737],[5.5084333063,43.5773044297],[5.5161890084,43.5790982271],[5.5202197734,43.5798635443],[5.5211828738,43.5799978225],[5.5226521014,43.5801806487],[5.5229992514,43.5802184937],[5.5240005402,43.5801790193],[5.5262159042,43.5802643321],[5.5286302055,43.5804520927],[5.5312332202,43.5806786112],[5.533423606,43.5810668324],[5.534666309,43.5813060952],[5.5349475411,43.5813931524],[5.5363414574,43.5816351676],[5.5371140908,43.5816891347],[5.5393533585,43.581752918],[5.5443000031,43.5817127407],[5.5565629333,43.5799519393],[5.5571461423,43.5798121745],[5.5576638962,43.5796208353],[5.5577773098,43.5788592756],[5.5581476666,43.5773894892],[5.5583139087,43.5766743969],[5.5585607333,43.5749617611],[5.5578212706,43.5732336582],[5.5575620084,43.5726393199],[5.557247374,43.5720525871],[5.5550674292,43.5698650739],[5.5560140092,43.5650707511],[5.5564543001,43.5640881525],[5.5564202248,43.5638233922],[5.5561368172,43.5626021764],[5.5539050782,43.5620794723],[5.5516835737,43.5617860364],[5.5501574402,43.5615959489],[5.5459052849,43.561318577],[5.5424415991,43.5594454143],[5.541714841,43.5590510414],[5.537947409,43.5568526828],[5.5366008798,43.5542240678],[5.5388007904,43.5524145399],[5.54360326,43.5527530923],[5.5465762064,43.5523052906],[5.5488725741,43.5506697281],[5.5509754299,43.5481636691],[5.5526417759,43.5467552803],[5.5555596264,43.5450779465],[5.5608577407,43.5435820386],[5.5612703901,43.5433724548],[5.5611176212,43.5395313039],[5.5610641386,43.5387205867],[5.5596326718,43.5386148337],[5.5508300302,43.5371747747],[5.5396766212,43.5375192282],[5.5331721672,43.5381195725],[5.5260505425,43.5380542536],[5.525889025,43.5380112041]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000002813","CODE_COM":"096","INSEE_COM":"13096","NOM_COM":"SAINTES-MARIES-DE-LA-MER","STATUT":"Commune simple","X_CHF_LIEU":815628.0,"Y_CHF_LIEU":6262453.0,"X_CENTROID":818140.0,"Y_CENTROID":6268704.0,"Z_MOYEN":1.0,"SUPERFICIE":"37241","POPULATION":"2593","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.593472957,43.407917023],[4.593194961,43.407917023],[4.593194961,43.409862519],[4.5929458854,43.409862519],[4.5929514696,43.4099391177],[4.592916966,43.4100774252],[4.592916966,43.411251069],[4.59263897,43.411251069],[4.59263897,43.412361144],[4.592360972,43.412361144],[4.592360972,43.413749694],[4.592082977,43.413749694],[4.592082977,43.414859771],[4.591804981,43.414859771],[4.591804981,43.415416717],[4.591528893,43.415416717],[4.591528893,43.416248321],[4.591250897,43.416248321],[4.591250897,43.41708374],[4.5909729,43.41708374],[4.5909729,43.417640686],[4.590694904,43.417640686],[4.590694904,43.41847229],[4.590416908,43.41847229],[4.590416908,43.419029236],[4.590138913,43.419029236],[4.590138913,43.419582367],[4.589859962,43.419582367],[4.589859962,43.420139313],[4.589581967,43.420139313],[4.589581967,43.420696259],[4.589303971,43.420696259],[4.589303971,43.42124939],[4.589028836,43.42124939],[4.589028836,43.421806336],[4.58875084,43.421806336],[4.58875084,43.422359467],[4.58847189,43.422359467],[4.58847189,43.42263794],[4.588193894,43.42263794],[4.588193894,43.423194885],[4.587915897,43.423194885],[4.587915897,43.423473358],[4.587637901,43.423473358],[4.587637901,43.42402649],[4.587359905,43.42402649],[4.587359905,43.424304961],[4.5871035123,43.424304961],[4.58708191,43.4243396824],[4.58708191,43.424861908],[4.58680582,43.424861908],[4.58680582,43.425415038],[4.586527824,43.425415038],[4.586527824,43.425693512],[4.586249828,43.425693512],[4.586249828,43.426250458],[4.585971833,43.426250458],[4.585971833,43.426528931],[4.585693837,43.426528931],[4.585693837,43.426807404],[4.585415839,43.426807404],[4.585415839,43.427082062],[4.585137844,43.427082062],[4.585137844,43.427360535],[4.584862233,43.427360535],[4.584862233,43.427639008],[4.5845946742,43.427639008],[4.584584235,43.42765095],[4.584584235,43.427917481],[4.5843512424,43.427917481],[4.584305762,43.4279695079],[4.584305762,43.428195954],[4.5841078079,43.4281959541],[4.584027767,43.4282875149],[4.584027767,43.428470612],[4.5838677056,43.4284706121],[4.583749771,43.4286055188],[4.583749771,43.428749085],[4.5836242655,43.4287490851],[4.583471775,43.4289235186],[4.583471775,43.429027558],[4.5833808227,43.4290275581],[4.58319378,43.4292415131],[4.58319378,43.429306031],[4.5831373771,43.4293060311],[4.582915782,43.4295595069],[4.582915782,43.429584504],[4.5828939287,43.429584504],[4.582362176,43.4301927482],[4.582362176,43.430324556],[4.582360744,43.430416108],[4.582166902,43.4304161081],[4.582084178,43.4305107295],[4.582084178,43.430583953],[4.582028866,43.430648804],[4.5819114068,43.4306729502],[4.581806183,43.4307639953],[4.581806183,43.430870056],[4.581806183,43.430973054],[4.581700802,43.430973054],[4.5815645653,43.430973054],[4.581528187,43.43100453],[4.581528187,43.43115616],[4.581528187,43.431251527],[4.581411839,43.431251527],[4.581250191,43.431251527],[4.581250191,43.431407929],[4.581250191,43.431526185],[4.581111908,43.431526185],[4.580972194,43.431526185],[4.580972194,43.431674957],[4.580972194,43.431804658],[4.580799103,43.431804658],[4.580694198,43.431804658],[4.580694198,43.431941987],[4.580694198,43.432083131],[4.580547809,43.432083131],[4.580416202,43.432083131],[4.580416202,43.432209014],[4.580416202,43.432361604],[4.58026123,43.432361604],[4.580138207,43.43239212],[4.580138207,43.432479859],[4.580138207,43.432640077],[4.579970837,43.432640077],[4.579862119,43.432640077],[4.579862119,43.432746887],[4.579862119,43.43291855],[4.579699994,43.43291855],[4.579584121,43.43291855],[4.579584121,43.433013917],[4.579584121,43.433193208],[4.579412938,43.433193208],[4.57934904,43.433246613],[4.579306125,43.433471681],[4.579121112,43.433471681],[4.57902813,43.433471681],[4.57902813,43.433750154],[4.578820228,43.433750154],[4.57861042,43.433750154],[4.578472137,43.433750154],[4.578472137,43.433872222],[4.578472137,43.434028627],[4.578297138,43.434028627],[4.578194141,43.434028627],[4.578194141,43.434120179],[4.578194141,43.434307098],[4.577983856,43.434307098],[4.5776636906,43.434307098],[4.577640057,43.4343271672],[4.577640057,43.434581758],[4.5773402458,43.4345817584],[4.5772043636,43.4346971446],[4.577084064,43.4347760959],[4.577084064,43.434860231],[4.576955865,43.4348602311],[4.576806068,43.4349585402],[4.576806068,43.435138702],[4.5765315466,43.4351387024],[4.576249122,43.4353240493],[4.576249122,43.435417175],[4.5761072195,43.4354171751],[4.575971127,43.4355064874],[4.575971127,43.435695648],[4.5756828849,43.4356956484],[4.575417996,43.4358694819],[4.575417996,43.435974121],[4.5752585434,43.4359741219],[4.5731686446,43.4373455526],[4.5698623841,43.4392246792],[4.5682083803,43.4401124765],[4.5631566309,43.442711322],[4.562100633,43.443252957],[4.5563758153,43.4456443238],[4.5549165863,43.4462132751],[4.5530882918,43.4467910962],[4.5490827866,43.4480191213],[4.5464241125,43.4488156592],[4.5434869672,43.4496394938],[4.5347167282,43.4516366168],[4.5221998763,43.4538305865],[4.5163610321,43.4547150932],[4.512639046,43.455059576],[4.512639046,43.455139161],[4.5117787852,43.4551391774],[4.5087114986,43.4554229413],[4.505129333,43.4557040059],[4.503193856,43.4558507886],[4.503193856,43.455970765],[4.5014340144,43.4559707755],[4.500137806,43.4560512439],[4.500137806,43.456249238],[4.497362138,43.456249238],[4.497362138,43.456527711],[4.4924532422,43.4565279773],[4.4923577569,43.4565338975],[4.4823777134,43.4567968343],[4.47708416,43.456886746],[4.47708416,43.457084655],[4.4681439455,43.4570850195],[4.4652664495,43.4571509959],[4.4630016968,43.4570848951],[4.45930481,43.457084655],[4.45930481,43.4569671323],[4.4579307306,43.4569205853],[4.4561346416,43.4568062392],[4.452360154,43.456806184],[4.452360154,43.4565590748],[4.451944614,43.4565277182],[4.448194027,43.456527711],[4.448194027,43.456249238],[4.447638035,43.456249238],[4.447638035,43.4559893101],[4.44753859,43.4559707652],[4.44708395,43.455970765],[4.44708395,43.4558859809],[4.4460658316,43.4556961074],[4.445971965,43.455696107],[4.445971965,43.4556786013],[4.4445728324,43.4554176519],[4.44180584,43.455417634],[4.44180584,43.455139161],[4.441248894,43.455139161],[4.441248894,43.454860688],[4.440692902,43.454860688],[4.440692902,43.454582215],[4.440139771,43.454582215],[4.440139771,43.4543793044],[4.4399045653,43.4543037423],[4.439582825,43.454303742],[4.439582825,43.454200379],[4.439049644,43.4540290847],[4.438748836,43.454029084],[4.438748836,43.453932443],[4.4382477241,43.4537714463],[4.4381988554,43.453750611],[4.438195228,43.453750611],[4.438195228,43.4537490645],[4.4340355365,43.4519754373],[4.4337051512,43.4515266423],[4.433473109,43.451526642],[4.433473109,43.451248169],[4.432917118,43.451248169],[4.432917118,43.4510801667],[4.4199927944,43.4490280159],[4.419861794,43.449028015],[4.419861794,43.449306488],[4.418471814,43.449306488],[4.418471814,43.449584961],[4.409861088,43.449584961],[4.409861088,43.449306488],[4.409027099,43.449306488],[4.409027099,43.449028015],[4.40819502,43.449028015],[4.40819502,43.448749542],[4.407361031,43.448749542],[4.407361031,43.448471069],[4.406805039,43.448471069],[4.406805039,43.4482187769],[4.4062151329,43.4481925974],[4.405694962,43.448192596],[4.405694962,43.4481695101],[4.4045865202,43.4481203044],[4.399027825,43.4491148284],[4.399027825,43.449306488],[4.398749827,43.449306488],[4.398749827,43.449584961],[4.398471832,43.449584961],[4.398471832,43.449859619],[4.398193836,43.449859619],[4.398193836,43.450138092],[4.39791584,43.450138092],[4.39791584,43.450416565],[4.393472195,43.450416565],[4.393472195,43.450695038],[4.391806127,43.450695038],[4.391806127,43.450973511],[4.390140056,43.450973511],[4.390140056,43.451248169],[4.38847208,43.451248169],[4.38847208,43.451526642],[4.387084008,43.451526642],[4.387084008,43.451805115],[4.385416985,43.451805115],[4.385416985,43.452083588],[4.383749009,43.452083588],[4.383749009,43.452362061],[4.380807805,43.4523620625],[4.380694866,43.4523702903],[4.380694866,43.452640534],[4.3769842389,43.4526405487],[4.374860763,43.4527951508],[4.374860763,43.452915192],[4.3726440138,43.4529151921],[4.372638226,43.4529154974],[4.372638226,43.453193665],[4.365436076,43.453193665],[4.3614348451,43.4531937197],[4.3597051791,43.4532592215],[4.358470917,43.453336131],[4.358470917,43.453472138],[4.3562875424,43.4534721468],[4.355416774,43.4535263798],[4.355416774,43.453750611],[4.354670047,43.453750611],[4.352361203,43.453750611],[4.352361203,43.453868867],[4.352361203,43.454029084],[4.349305153,43.454029084],[4.349305153,43.454303742],[4.346251012,43.454303742],[4.346251012,43.454582215],[4.34236002,43.454582215],[4.34236002,43.454860688],[4.338749886,43.454860688],[4.338749886,43.455139161],[4.332640172,43.455139161],[4.332640172,43.455417634],[4.328473091,43.455417634],[4.328473091,43.455696107],[4.3222441088,43.4556961595],[4.3215375668,43.455730697],[4.320416927,43.4557889513],[4.320416927,43.455970765],[4.316917653,43.455970779],[4.315137864,43.4560632158],[4.315137864,43.456249238],[4.3120999518,43.4562492694],[4.309862137,43.4563890817],[4.309862137,43.456527711],[4.307641427,43.4565277792],[4.303721728,43.4567724766],[4.29595709,43.4570338577],[4.2909936603,43.4571236843],[4.2887735079,43.4571555048],[4.2750072826,43.4577088279],[4.267361163,43.4580888468],[4.267361163,43.458194732],[4.267082215,43.458194732],[4.267082215,43.4581027004],[4.2611215371,43.4583985584],[4.2527044584,43.4588911723],[4.243056178,43.4595187289],[4.240396754,43.4596913614],[4.2360554974,43.459947905],[4.2329268558,43.4599574439],[4.230280885,43.4601836617],[4.2302811457,43.4601863887],[4.23028326,43.460186005],[4.230287675,43.4602547],[4.2306150959,43.4636800316],[4.2308238371,43.468595809],[4.2313920184,43.4774324547],[4.2335312509,43.4839336265],[4.2336552358,43.4843034571],[4.239356518,43.493736267],[4.2379362271,43.4970745461],[4.2379380192,43.4970799463],[4.2379400085,43.4970865192],[4.244232654,43.501461029],[4.2458664946,43.5018912531],[4.2461417071,43.5019322677],[4.2464058659,43.5020332739],[4.2694426882,43.5080959116],[4.2714168955,43.5080699602],[4.2732653857,43.5084163068],[4.2758878892,43.5090999535],[4.2776487168,43.5096155245],[4.2832144837,43.511548344],[4.2932134119,43.514098504],[4.2958457067,43.5145359063],[4.297689816,43.5153291113],[4.3002441908,43.5170181083],[4.3023179755,43.5185004578],[4.3029405749,43.5190079561],[4.3145267481,43.5245727669],[4.315529102,43.5245598646],[4.3166407833,43.5246111696],[4.3197813831,43.5252901901],[4.3204919294,43.5254822103],[4.3219366281,43.5262465833],[4.3238871017,43.5276517568],[4.323807067,43.5288477275],[4.3227085569,43.5304466514],[4.3157865174,43.5357694451],[4.3100303833,43.5449401954],[4.3107513549,43.5472992421],[4.3121655516,43.5498061321],[4.3146463135,43.5527394109],[4.3162057318,43.5540946588],[4.3184247618,43.5571380597],[4.3185216477,43.5573159557],[4.3185233462,43.5573152676],[4.32209158,43.551742553],[4.3214441262,43.5512418317],[4.3209394007,43.551021733],[4.3199623853,43.5505539926],[4.3185452365,43.5497217491],[4.3169701405,43.5486358451],[4.3163111802,43.5480076392],[4.3159945166,43.5476317395],[4.3156972356,43.5466976936],[4.3156645261,43.545971907],[4.3160785905,43.5448762636],[4.3164310144,43.5443302778],[4.3169083837,43.5439465485],[4.3179485781,43.5431303538],[4.3188417982,43.5425948896],[4.3215690964,43.5410202679],[4.3251227744,43.5394021966],[4.330574087,43.5361986172],[4.3319282881,43.5356564927],[4.3329974661,43.535465195],[4.3341326002,43.5354512466],[4.3382980885,43.5370295936],[4.3396476967,43.5376716361],[4.342286158,43.5389456257],[4.3443245597,43.5401037076],[4.3459319429,43.5412282484],[4.348482132,43.542266846],[4.3536462416,43.5473899776],[4.356923496,43.5471818092],[4.3594119351,43.5469958968],[4.3619444568,43.5469479532],[4.3636746794,43.5470297147],[4.3651362956,43.5471571208],[4.3672515519,43.547665918],[4.3687323715,43.5480269994],[4.3794380894,43.552066875],[4.3806768784,43.5525424563],[4.3816554206,43.5529997395],[4.3825742558,43.5535459622],[4.3841271787,43.5547832967],[4.3848812471,43.5556267606],[4.3859254465,43.5570064419],[4.3868962063,43.5593380298],[4.3893382649,43.5609759993],[4.3894919226,43.5610100679],[4.3952343823,43.5610979511],[4.396705155,43.5607629699],[4.4006531173,43.5595665622],[4.4020451112,43.5593596203],[4.4038328651,43.5592456308],[4.4055746137,43.5595272552],[4.4064011063,43.5598261112],[4.4093533628,43.5611268529],[4.4106828183,43.5620004719],[4.4138689883,43.5646001906],[4.4149581151,43.5656586676],[4.4157987589,43.5666762808],[4.4164633571,43.5679310561],[4.4167554217,43.5691843908],[4.4167763636,43.5700831074],[4.4165883371,43.5713409075],[4.4160361365,43.5719852324],[4.4153195296,43.5725381088],[4.4144297087,43.572843067],[4.4138938228,43.5728950401],[4.4120450555,43.5729604905],[4.4093607422,43.5727398209],[4.40691948,43.574054718],[4.425405026,43.584774018],[4.4397727752,43.5839578972],[4.4433120956,43.5831448473],[4.4445447015,43.5830312709],[4.447018021,43.5830280441],[4.4488888726,43.5834332573],[4.4491646084,43.5826358626],[4.4526971856,43.5783618218],[4.456697997,43.5729034223],[4.4581131378,43.5710684322],[4.460013431,43.568604173],[4.4607729206,43.5674204916],[4.4623087504,43.5626087713],[4.4642623563,43.5615736598],[4.467386682,43.5601087449],[4.4772793043,43.5555084102],[4.4859961541,43.5556873078],[4.4899199995,43.5566477102],[4.4933305932,43.560230141],[4.4942666781,43.5612503472],[4.495206287,43.5624045832],[4.4967761755,43.5647110006],[4.5008228875,43.5706719125],[4.5039371649,43.5729019958],[4.5043563453,43.5741614639],[4.5043945702,43.5751949325],[4.503877753,43.5797997464],[4.5038425978,43.5803950768],[4.5043433997,43.580421438],[4.5118299429,43.5804578673],[4.5126863749,43.5802155634],[4.5240814546,43.5748160319],[4.5298478316,43.5716869347],[4.5380635675,43.5711695143],[4.5492035612,43.572704802],[4.5498814866,43.5726456327],[4.5582882364,43.5706840809],[4.5589538908,43.5703109583],[4.5684422942,43.5672378752],[4.5774190496,43.5656229629],[4.5797172003,43.5655751521],[4.587464184,43.5660525131],[4.5901622536,43.5667698696],[4.5949903642,43.5684665107],[4.5964949197,43.5689843564],[4.5998609462,43.5696781552],[4.602868191,43.5700198755],[4.6064229842,43.5702004257],[4.6095798381,43.5707989284],[4.6164598205,43.57231841],[4.6231668941,43.5735754659],[4.6235491328,43.5735670519],[4.6237864518,43.5732926223],[4.62483176,43.5700786114],[4.6248477343,43.5670572915],[4.624678642,43.5659367049],[4.6239556048,43.5617709391],[4.6237986611,43.5606411748],[4.6238283978,43.5599423849],[4.6245458704,43.5576584318],[4.6250469284,43.5562992416],[4.6267336098,43.5533321205],[4.6296088706,43.5476518686],[4.6299507487,43.5469249975],[4.6329098715,43.5433465278],[4.6354944163,43.5412233966],[4.6374282794,43.5401485304],[4.6416070394,43.5377222138],[4.64232976,43.53725682],[4.6431025374,43.5362066162],[4.6431740572,43.5349015518],[4.6426791071,43.5333386896],[4.641699239,43.530517884],[4.6370645137,43.5240446479],[4.6339282515,43.5197858661],[4.6338588836,43.5196078295],[4.6333167936,43.5150246805],[4.6332649196,43.5139392794],[4.6334410263,43.5119568447],[4.6337837736,43.5105739356],[4.6352822445,43.5067474831],[4.6358296066,43.5057799387],[4.6374946636,43.5043815715],[4.641392676,43.5016094642],[4.642225212,43.4981241667],[4.6416426313,43.4944767228],[4.6421270968,43.4917481186],[4.6424111668,43.4903129924],[4.6442917468,43.485322512],[4.6371040341,43.480948054],[4.6335541147,43.4788355855],[4.6264351602,43.4749552604],[4.6212072713,43.470799664],[4.6206205534,43.4693155515],[4.6203243332,43.4680988564],[4.6204201034,43.4655345995],[4.6202214214,43.459184519],[4.6199175939,43.4589236008],[4.6198413955,43.4586304845],[4.6198400978,43.4553388091],[4.6212935503,43.4481371025],[4.6212230403,43.4479140932],[4.6205957882,43.4476571183],[4.6160954131,43.4462152731],[4.6155419368,43.4397445944],[4.6157840972,43.4386935589],[4.616001157,43.4367052564],[4.6157334352,43.4312174908],[4.6158562145,43.4307531398],[4.6188671663,43.4239764691],[4.619778695,43.4188157671],[4.6190313735,43.4169120901],[4.6159281939,43.4154665086],[4.6122076938,43.4138779618],[4.609877735,43.4126600567],[4.6062203939,43.4106240591],[4.6001114095,43.407363543],[4.5983391976,43.4064341021],[4.5977882532,43.4061938814],[4.5950211396,43.4064137391],[4.593472957,43.4066605764],[4.593472957,43.407917023]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000003856","CODE_COM":"025","INSEE_COM":"13025","NOM_COM":"CHATEAUNEUF-LE-ROUGE","STATUT":"Commune simple","X_CHF_LIEU":907917.0,"Y_CHF_LIEU":6268998.0,"X_CENTROID":907906.0,"Y_CENTROID":6269134.0,"Z_MOYEN":247.0,"SUPERFICIE":"1321","POPULATION":"2150","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5326975628,43.4829196063],[5.5329294246,43.4837207259],[5.5337372247,43.4898184042],[5.5356499738,43.4990399434],[5.5361984902,43.5014656623],[5.5369328353,43.5044019325],[5.5383616872,43.5042730786],[5.5397432331,43.5041093069],[5.5409547329,43.5038756881],[5.5421822171,43.5034445438],[5.5444991323,43.5024819326],[5.5468709616,43.5014765732],[5.5491126016,43.5004652195],[5.5502394479,43.49994273],[5.5519734816,43.4990593747],[5.5523136768,43.4992016961],[5.554837027,43.5004421198],[5.5598623648,43.5030466303],[5.5620522446,43.5042614621],[5.5623196423,43.504101214],[5.5634611423,43.5034369106],[5.5643533144,43.5030332413],[5.5657899503,43.5026373874],[5.5679322484,43.5023976398],[5.5688738264,43.5022979229],[5.5704491685,43.502184077],[5.5816214074,43.501916871],[5.5965712515,43.5020262191],[5.6000853111,43.5021787666],[5.6007601497,43.5021157735],[5.6014884509,43.5005022669],[5.6026475559,43.4972346729],[5.6048633993,43.4903319451],[5.6045032282,43.4863950976],[5.6010909718,43.4826251571],[5.5978381738,43.4818263868],[5.5925614611,43.4811569615],[5.5836559936,43.4763196379],[5.5837166615,43.4760193364],[5.5833082995,43.4760092661],[5.5766359317,43.4782987753],[5.5764936527,43.4784614866],[5.5760821921,43.4785756852],[5.5713577983,43.4798220669],[5.5688751395,43.4802824038],[5.5630775302,43.4807545025],[5.5553071001,43.4804806715],[5.5464634424,43.4815664342],[5.5378906237,43.4826055215],[5.53454331,43.4829214754],[5.5326975628,43.4829196063]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000004003","CODE_COM":"336","INSEE_COM":"30336","NOM_COM":"VALLABREGUES","STATUT":"Commune simple","X_CHF_LIEU":830862.0,"Y_CHF_LIEU":6307339.0,"X_CENTROID":831069.0,"Y_CENTROID":6307071.0,"Z_MOYEN":11.0,"SUPERFICIE":"1419","POPULATION":"1365","CODE_ARR":"2","CODE_DEPT":"30","NOM_DEPT":"GARD","CODE_REG":"76","NOM_REG":"LANGUEDOC-ROUSSILLON-MIDI-PYRENEES"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.642970086,43.832115173],[4.6429769681,43.8321195596],[4.6429722341,43.8321108712],[4.642970086,43.832115173]]],[[[4.666674614,43.847217561],[4.661577701,43.852436066],[4.6509879735,43.8521872903],[4.6518465451,43.8523704087],[4.6586664103,43.853223756],[4.660159401,43.8532361523],[4.6624930219,43.8525570377],[4.6640271562,43.851804559],[4.6652949732,43.8508779019],[4.6658817236,43.8500561436],[4.6660787223,43.8487929804],[4.6666783617,43.84722033],[4.6667891499,43.8461151034],[4.6662999037,43.8447769154],[4.6659089575,43.8443355328],[4.665014394,43.8437254162],[4.663113911,43.8428218974],[4.6599017754,43.8417573934],[4.6574524633,43.8411348612],[4.6570188939,43.8410673748],[4.666674614,43.847217561]]],[[[4.643417835,43.85200882],[4.6450233582,43.8547326989],[4.6463355135,43.8526004274],[4.6469561492,43.8520923033],[4.643417835,43.85200882]]],[[[4.641909599,43.867477418],[4.6419133438,43.8674791228],[4.6419145399,43.8674765726],[4.6419151007,43.8674674225],[4.641909599,43.867477418]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000004384","CODE_COM":"087","INSEE_COM":"83087","NOM_COM":"NANS-LES-PINS","STATUT":"Commune simple","X_CHF_LIEU":925570.0,"Y_CHF_LIEU":6256352.0,"X_CENTROID":925687.0,"Y_CENTROID":6257997.0,"Z_MOYEN":446.0,"SUPERFICIE":"4895","POPULATION":"4166","CODE_ARR":"3","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.786164283,43.413909912],[5.778915406,43.410072327],[5.7783311255,43.409899482],[5.7804052993,43.4109057443],[5.7856380257,43.4137554093],[5.7863221615,43.4143691919],[5.786164283,43.413909912]]],[[[5.749995708,43.401512146],[5.7499887121,43.4015139237],[5.7499918755,43.4015140198],[5.7500127012,43.401517179],[5.749995708,43.401512146]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000004504","CODE_COM":"032","INSEE_COM":"13032","NOM_COM":"EGUILLES","STATUT":"Commune simple","X_CHF_LIEU":890214.0,"Y_CHF_LIEU":6277236.0,"X_CENTROID":888529.0,"Y_CENTROID":6277322.0,"Z_MOYEN":231.0,"SUPERFICIE":"3414","POPULATION":"7510","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2785080103,43.5748817192],[5.2773958167,43.5751210822],[5.2749136127,43.5754368526],[5.2726003582,43.5756113113],[5.2690072538,43.5750428703],[5.2561889085,43.5811049388],[5.2558460691,43.5814235028],[5.2558046458,43.5822281703],[5.2556464969,43.5827724277],[5.2534866847,43.5903944959],[5.2542131697,43.5920851568],[5.2658245093,43.5906058641],[5.2682240384,43.5903739513],[5.2783764634,43.5895007486],[5.2869220535,43.5896118813],[5.3005634871,43.5914778072],[5.3128560285,43.5908269643],[5.3140772605,43.5914445539],[5.3177351214,43.593639426],[5.3227026723,43.5948007169],[5.3278459935,43.5955574511],[5.3328053559,43.5930962476],[5.3345,43.5928014917],[5.3360273226,43.592504007],[5.341532982,43.59163922],[5.344982459,43.5901632543],[5.3484134247,43.5897218552],[5.3534334952,43.5895888822],[5.3571788783,43.5891160861],[5.3580983053,43.588917895],[5.3583859412,43.5886244986],[5.3596453721,43.5871181816],[5.3611503912,43.5855930083],[5.3631532612,43.5842514152],[5.3635690351,43.5840938405],[5.3639901049,43.5840648715],[5.3655637381,43.5842088345],[5.3663751534,43.5842766708],[5.3668862792,43.584239427],[5.3672319563,43.5840338572],[5.3674691789,43.5838108473],[5.3673720151,43.5834366995],[5.3671625616,43.5833422482],[5.3667892623,43.583538518],[5.3665059203,43.5836041035],[5.3658630312,43.583538898],[5.3650701902,43.5831402959],[5.3633262366,43.5821673891],[5.3627257343,43.5815071404],[5.3620097887,43.5801175747],[5.362378536,43.578998763],[5.3656684502,43.5771970405],[5.3688916884,43.5759745696],[5.3711576468,43.5748998328],[5.3756684224,43.5714679576],[5.3774256846,43.5696264846],[5.3822361231,43.5647538271],[5.3825859765,43.5629530484],[5.3819726923,43.5609114657],[5.379267879,43.5581893303],[5.3758734956,43.5550978735],[5.3749536827,43.5538362009],[5.3745951355,43.5531869424],[5.3755295593,43.5512725976],[5.3763990556,43.5502130004],[5.3781010196,43.5475905187],[5.3780998699,43.5472340888],[5.3778913139,43.5454851892],[5.3777806284,43.544784607],[5.3773842696,43.5444170335],[5.3730654817,43.5414213983],[5.3700575545,43.5376480753],[5.3639819996,43.5401038407],[5.3579702896,43.5399682026],[5.3584679246,43.5358159068],[5.3576617007,43.5355561895],[5.3566210396,43.5352817556],[5.355203617,43.5352630247],[5.3491473361,43.5353250039],[5.349201193,43.5366416164],[5.3484960434,43.5363112339],[5.3484141448,43.5364264218],[5.347202913,43.5376992987],[5.3432089884,43.5428866144],[5.3416735144,43.5479577604],[5.3391494591,43.5524957273],[5.3256454485,43.5552351629],[5.3160641309,43.5590873352],[5.3084872425,43.5630418589],[5.3064361481,43.5649208122],[5.3054606373,43.5658128552],[5.3043970102,43.5665150328],[5.3027687554,43.5673686972],[5.3019499263,43.5676633012],[5.2878958505,43.5717643046],[5.2841646086,43.5731669484],[5.2795896219,43.5745583752],[5.2785080103,43.5748817192]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000004758","CODE_COM":"067","INSEE_COM":"13067","NOM_COM":"ORGON","STATUT":"Commune simple","X_CHF_LIEU":864109.0,"Y_CHF_LIEU":6301258.0,"X_CENTROID":863822.0,"Y_CENTROID":6298929.0,"Z_MOYEN":137.0,"SUPERFICIE":"3478","POPULATION":"3114","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.042624474,43.806503296],[5.042624868,43.8065020976],[5.0431353292,43.8039277558],[5.0431968105,43.8026222342],[5.0430535352,43.8009082673],[5.0432228916,43.7989696975],[5.0436368201,43.7959463255],[5.0440726493,43.7944060436],[5.0447469039,43.792896395],[5.0454440762,43.7918895133],[5.0463475613,43.7910578893],[5.0480853494,43.7897550904],[5.049651466,43.7887264465],[5.0514850036,43.7878799829],[5.0566739955,43.7857711703],[5.0653976139,43.7823232106],[5.0820122525,43.7756418135],[5.0867590359,43.7737322135],[5.0906626661,43.7721143156],[5.0884535967,43.7713164795],[5.0772588672,43.7672195653],[5.0755528398,43.7665877551],[5.0691142981,43.7645795338],[5.0628307799,43.7639299627],[5.062264061,43.7639550961],[5.0617561653,43.7639926158],[5.0607791539,43.7641443287],[5.0599500931,43.7644381622],[5.0555338048,43.7651445039],[5.049636827,43.7642213299],[5.0431442039,43.7595859456],[5.0367183837,43.755715892],[5.0279591482,43.7531149678],[5.0265318845,43.7534889936],[5.0246296396,43.7534253559],[5.0225159962,43.7528966324],[5.0183227455,43.7506178329],[5.0180441115,43.7499703891],[5.0169833465,43.7498910242],[4.9980842096,43.7487928802],[4.9977141462,43.748969796],[4.9976261166,43.7509301194],[4.9971380427,43.7526718457],[4.9962363551,43.7548748257],[4.995485406,43.7558112349],[4.9920900312,43.7607305728],[4.9895391066,43.7648404594],[4.9873395544,43.7698503322],[4.9858964546,43.7726500126],[4.9837823693,43.7763449456],[4.9816918111,43.7795434283],[4.9798316957,43.7813658498],[4.9769470075,43.7840673814],[4.974565625,43.785879365],[4.9721631073,43.7876232664],[4.9707144921,43.7887827697],[4.9682634622,43.7908209125],[4.9682085288,43.7909578283],[4.9839684158,43.7947831039],[4.9888124043,43.7958884371],[4.992273265,43.7968829252],[5.000848802,43.7997035972],[5.0082348484,43.8029227103],[5.0165121319,43.8049204218],[5.0221321469,43.8083135157],[5.0247583646,43.8102361707],[5.0264628363,43.811610589],[5.0345087511,43.8194877256],[5.0353475901,43.820140913],[5.0353578238,43.8201330322],[5.042624474,43.806503296]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000004774","CODE_COM":"205","INSEE_COM":"13205","NOM_COM":"MARSEILLE-5E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":894762.0,"Y_CHF_LIEU":6247235.0,"X_CENTROID":894715.0,"Y_CENTROID":6246769.0,"Z_MOYEN":35.0,"SUPERFICIE":"219","POPULATION":"47000","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3890791885,43.3003094128],[5.3890516929,43.2989024552],[5.3911804734,43.298802279],[5.391982942,43.2989879168],[5.395432576,43.2994200029],[5.3978811432,43.2981795315],[5.4002168995,43.2965995167],[5.4056186819,43.2960978206],[5.4078089094,43.2959671471],[5.4087493061,43.2956491972],[5.4087783937,43.2954901521],[5.413400069,43.2941639648],[5.4149671557,43.292542288],[5.4149182178,43.2916973989],[5.410216673,43.2915494679],[5.4070711719,43.2906917004],[5.4059863441,43.2903810676],[5.4027026787,43.2867660308],[5.3972936432,43.2855317124],[5.3944251088,43.2848933395],[5.3925434097,43.2847307283],[5.3919457421,43.28475566],[5.390717695,43.2848782348],[5.3891524021,43.2881302445],[5.3890522909,43.2931776987],[5.3872375993,43.2938063831],[5.3855598581,43.2942916178],[5.3863634386,43.2959946263],[5.3887546691,43.3002094883],[5.3890791885,43.3003094128]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000004992","CODE_COM":"011","INSEE_COM":"30011","NOM_COM":"LES ANGLES","STATUT":"Commune simple","X_CHF_LIEU":841792.0,"Y_CHF_LIEU":6318865.0,"X_CENTROID":839527.0,"Y_CENTROID":6318182.0,"Z_MOYEN":66.0,"SUPERFICIE":"1693","POPULATION":"8362","CODE_ARR":"2","CODE_DEPT":"30","NOM_DEPT":"GARD","CODE_REG":"76","NOM_REG":"LANGUEDOC-ROUSSILLON-MIDI-PYRENEES"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.739061356,43.924068452],[4.7390639137,43.9240681247],[4.7390596941,43.9240621925],[4.7402111566,43.9217160173],[4.7400992241,43.9196789207],[4.7377476035,43.9179880415],[4.7355084026,43.9165086683],[4.7355078866,43.9165116124],[4.739061356,43.924068452]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000005272","CODE_COM":"133","INSEE_COM":"30133","NOM_COM":"LE GRAU-DU-ROI","STATUT":"Commune simple","X_CHF_LIEU":791896.0,"Y_CHF_LIEU":6271556.0,"X_CENTROID":795570.0,"Y_CENTROID":6266866.0,"Z_MOYEN":1.0,"SUPERFICIE":"5795","POPULATION":"8421","CODE_ARR":"2","CODE_DEPT":"30","NOM_DEPT":"GARD","CODE_REG":"76","NOM_REG":"LANGUEDOC-ROUSSILLON-MIDI-PYRENEES"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.229757786,43.460281372],[4.2302811457,43.4601863887],[4.230280885,43.4601836617],[4.2299126582,43.460235529],[4.229757786,43.4602598311],[4.229757786,43.460281372]]],[[[4.2308238371,43.468595809],[4.2306150959,43.4636800316],[4.230287675,43.4602547],[4.2308238371,43.468595809]]],[[[4.231616973,43.480930329],[4.2336552358,43.4843034571],[4.2335312509,43.4839336265],[4.2313920184,43.4774324547],[4.231616973,43.480930329]]],[[[4.23793397,43.4970798509],[4.2379380192,43.4970799463],[4.2379362271,43.4970745461],[4.23793397,43.4970798509]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000005389","CODE_COM":"046","INSEE_COM":"13046","NOM_COM":"GREASQUE","STATUT":"Commune simple","X_CHF_LIEU":905657.0,"Y_CHF_LIEU":6262363.0,"X_CENTROID":906231.0,"Y_CENTROID":6262038.0,"Z_MOYEN":330.0,"SUPERFICIE":"622","POPULATION":"4059","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5587187501,43.4339914085],[5.5591299004,43.4334047119],[5.5599162148,43.4321448523],[5.5609427543,43.4283193441],[5.5610695761,43.4274783273],[5.5597226629,43.423798055],[5.5611966432,43.4180708334],[5.5631365282,43.4153533777],[5.5623305951,43.4116738686],[5.56149558,43.41016793],[5.5610752676,43.4093515676],[5.5601363218,43.4086716848],[5.5595700941,43.4079604812],[5.5594444399,43.4075503],[5.5585170363,43.408350817],[5.5572866035,43.4100009896],[5.5565516426,43.4109382621],[5.5562590593,43.4112170045],[5.5535682896,43.4129610092],[5.5478927358,43.4153692943],[5.5475312484,43.4155155168],[5.5403968104,43.4161601898],[5.5370880009,43.4164213878],[5.5344810339,43.4164698356],[5.5332384367,43.4165448178],[5.5337853383,43.4168227574],[5.5345969386,43.4172790216],[5.5352727799,43.417960786],[5.5357255074,43.4185109547],[5.5360499524,43.4190641264],[5.5369276115,43.4232299959],[5.5368771904,43.4239629705],[5.5365207735,43.4247022126],[5.5362694939,43.42519326],[5.5359907366,43.4255373312],[5.5348823277,43.4264759976],[5.5345131878,43.4267591723],[5.5340816165,43.4269708971],[5.5301856627,43.4323177647],[5.5293492092,43.4396993862],[5.5294763799,43.4401473784],[5.5297610124,43.4401029267],[5.5329849391,43.4393975037],[5.537346993,43.4392360098],[5.5380341723,43.4392163111],[5.5391585009,43.4392214671],[5.5402941225,43.4393424629],[5.5434810008,43.4397861558],[5.5445950247,43.4400048281],[5.5494823979,43.4408530534],[5.5529128305,43.4400449579],[5.5583309886,43.4343543188],[5.5587187501,43.4339914085]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000005525","CODE_COM":"093","INSEE_COM":"83093","NOM_COM":"PLAN-D'AUPS-SAINTE-BAUME","STATUT":"Commune simple","X_CHF_LIEU":920472.0,"Y_CHF_LIEU":6251660.0,"X_CENTROID":922201.0,"Y_CENTROID":6252487.0,"Z_MOYEN":720.0,"SUPERFICIE":"2467","POPULATION":"1955","CODE_ARR":"3","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7015987962,43.3523033183],[5.7025859114,43.3533006402],[5.7036095516,43.3539921747],[5.7015987962,43.3523033183]]],[[[5.6892922123,43.334525136],[5.6890671734,43.3352148332],[5.6891449366,43.3353561612],[5.6892922123,43.334525136]]],[[[5.6702027969,43.3195923503],[5.6697605258,43.3196003366],[5.6691717559,43.3194098415],[5.6691657856,43.3194087847],[5.6689941174,43.3199279931],[5.6691142869,43.3199673307],[5.6744878471,43.3203507472],[5.6702027969,43.3195923503]]],[[[5.6691670433,43.3194083167],[5.6691660469,43.3194079944],[5.6691659294,43.3194083498],[5.6691670433,43.3194083167]]],[[[5.681720734,43.319034576],[5.6826590156,43.3184232618],[5.6796226171,43.3190971416],[5.681720734,43.319034576]]],[[[5.691040516,43.312961579],[5.6910653514,43.3129646578],[5.6910426285,43.3129582843],[5.691038382,43.3129629698],[5.691040516,43.312961579]]],[[[5.726601124,43.31736374],[5.7266035508,43.3173601316],[5.7265973172,43.3173590442],[5.7265425047,43.3173564935],[5.726601124,43.31736374]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006123","CODE_COM":"113","INSEE_COM":"13113","NOM_COM":"VENELLES","STATUT":"Commune simple","X_CHF_LIEU":900489.0,"Y_CHF_LIEU":6280838.0,"X_CENTROID":901190.0,"Y_CENTROID":6280869.0,"Z_MOYEN":350.0,"SUPERFICIE":"2052","POPULATION":"8347","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4766633327,43.6234780042],[5.4769732514,43.6232224789],[5.4804957774,43.6203451364],[5.4868098825,43.615902251],[5.4917710158,43.6125360854],[5.4986544604,43.6105370364],[5.500095854,43.6101221809],[5.5021646544,43.6096910564],[5.5051785751,43.6091714846],[5.5067542655,43.6089965024],[5.5076332978,43.6087844675],[5.5084827142,43.6084902886],[5.511213139,43.6071857965],[5.513514359,43.604203248],[5.5173480808,43.5991974564],[5.5188625735,43.597212467],[5.5206620061,43.5948364505],[5.5225731462,43.5922156512],[5.5245093569,43.5901685751],[5.5265264815,43.5881339851],[5.5282079458,43.5866355997],[5.5316451202,43.5840925279],[5.5334302332,43.5830120444],[5.5349475411,43.5813931524],[5.534666309,43.5813060952],[5.533423606,43.5810668324],[5.5312332202,43.5806786112],[5.5286302055,43.5804520927],[5.5262159042,43.5802643321],[5.5240005402,43.5801790193],[5.5229992514,43.5802184937],[5.5226521014,43.5801806487],[5.5211828738,43.5799978225],[5.5202197734,43.5798635443],[5.5161890084,43.5790982271],[5.5084333063,43.5773044297],[5.5053627874,43.5762617737],[5.4942221519,43.5671337354],[5.4939582924,43.566645592],[5.4925715301,43.5672679678],[5.4884931879,43.5698298565],[5.4866991573,43.5709709988],[5.4844208466,43.5722240153],[5.4813573768,43.5725587312],[5.4755449271,43.572943473],[5.4686996899,43.5733540913],[5.4660456373,43.5743163941],[5.4638871672,43.5768454135],[5.465011139,43.5866391859],[5.4640197047,43.5916406665],[5.4639016732,43.5959579942],[5.4638684162,43.5975196954],[5.464142743,43.6008496193],[5.4634200223,43.6096925236],[5.4633372671,43.6120061356],[5.4637927523,43.6136395902],[5.4666736972,43.6160948128],[5.4754540302,43.6226494509],[5.4766633327,43.6234780042]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006142","CODE_COM":"104","INSEE_COM":"83104","NOM_COM":"RIANS","STATUT":"Commune simple","X_CHF_LIEU":922615.0,"Y_CHF_LIEU":6282547.0,"X_CENTROID":921077.0,"Y_CENTROID":6282954.0,"Z_MOYEN":415.0,"SUPERFICIE":"9707","POPULATION":"4313","CODE_ARR":"3","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.799205779,43.659927368],[5.772551704,43.6604130448],[5.777197294,43.6606050023],[5.7934961846,43.6607420548],[5.7959104875,43.6607097057],[5.7978194917,43.6605138358],[5.7987876057,43.660123369],[5.7992066245,43.6599306162],[5.799205779,43.659927368]]],[[[5.7320063162,43.6525480533],[5.7371941271,43.6543114293],[5.741015212,43.6555683619],[5.744802151,43.6567819108],[5.7507768372,43.6574538131],[5.7686441175,43.6602514272],[5.7692061358,43.6602746809],[5.7320063162,43.6525480533]]],[[[5.7063918241,43.6419857436],[5.7069297689,43.642009154],[5.7071732385,43.6419129946],[5.7063918241,43.6419857436]]],[[[5.6817178819,43.6122210347],[5.682141289,43.6137357488],[5.6854965351,43.6185990769],[5.6864264495,43.6197807541],[5.6817178819,43.6122210347]]],[[[5.6881417953,43.5913256134],[5.6862158248,43.5944580584],[5.6843024851,43.5979354399],[5.6829174125,43.601216985],[5.6822026784,43.6034970527],[5.6816910029,43.6055371302],[5.6811443416,43.6101691004],[5.6811461189,43.6101754591],[5.6881417953,43.5913256134]]],[[[5.656919479,43.575279236],[5.6689504741,43.5649528813],[5.6634549118,43.5689784904],[5.6578516414,43.5724116581],[5.6560255947,43.5739966868],[5.6559638229,43.5773975718],[5.6561663895,43.5776806992],[5.658598065,43.5780199978],[5.6701317329,43.5803594361],[5.6817799844,43.5825589056],[5.6821183144,43.5826234087],[5.656919479,43.575279236]]],[[[5.669314862,43.564640045],[5.6693239353,43.5646395199],[5.6693124451,43.5646376166],[5.6693065344,43.5646471945],[5.669314862,43.564640045]]],[[[5.691687583,43.563343049],[5.692863233,43.5627860358],[5.692198177,43.5629308831],[5.6902319151,43.5631623871],[5.6871966119,43.5633014914],[5.6804563226,43.5639947333],[5.691687583,43.563343049]]],[[[5.725073815,43.551273346],[5.7250712666,43.5512676562],[5.7250711407,43.551267674],[5.7250591555,43.5512732171],[5.725073815,43.551273346]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006287","CODE_COM":"006","INSEE_COM":"13006","NOM_COM":"AUREILLE","STATUT":"Commune simple","X_CHF_LIEU":856907.0,"Y_CHF_LIEU":6291815.0,"X_CENTROID":856753.0,"Y_CENTROID":6291263.0,"Z_MOYEN":138.0,"SUPERFICIE":"2160","POPULATION":"1550","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9174674719,43.7375027847],[4.9220413641,43.7369981881],[4.9282225092,43.7362264164],[4.9397525639,43.7332528565],[4.9515596589,43.7292640635],[4.9524292863,43.7289217287],[4.9535246397,43.7283197035],[4.9534995718,43.7260572618],[4.9543287489,43.7251134603],[4.9586768166,43.7212737333],[4.9609839058,43.720944159],[4.9646814016,43.720373421],[4.9643886313,43.7165064149],[4.9642615831,43.7113195666],[4.9637399125,43.7074693158],[4.9642140013,43.7046866317],[4.9642861204,43.7019418101],[4.9641959891,43.7000010136],[4.964216841,43.6947845496],[4.9642965928,43.692479756],[4.9645072335,43.683068152],[4.9644826236,43.6755501389],[4.9645873254,43.6721657192],[4.9655352042,43.6682755256],[4.9660412627,43.6628586806],[4.9652362358,43.6605699263],[4.9622813973,43.6605575815],[4.9590349298,43.6616251041],[4.9496194359,43.6648572785],[4.9340396175,43.6701236845],[4.9324367001,43.6776363288],[4.9304478541,43.6875851589],[4.9281261676,43.6869665685],[4.9264012345,43.6866829966],[4.9245750954,43.6918044005],[4.9241708953,43.692807046],[4.925238457,43.7046405624],[4.9273588909,43.7081440074],[4.9295675518,43.712195821],[4.9254700719,43.7242622585],[4.9242885932,43.7269978721],[4.9225078458,43.7310384167],[4.9182414479,43.7366304454],[4.9174674719,43.7375027847]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006356","CODE_COM":"116","INSEE_COM":"13116","NOM_COM":"VERQUIERES","STATUT":"Commune simple","X_CHF_LIEU":854285.0,"Y_CHF_LIEU":6306428.0,"X_CENTROID":854318.0,"Y_CENTROID":6306356.0,"Z_MOYEN":48.0,"SUPERFICIE":"461","POPULATION":"795","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9253989815,43.8516229615],[4.9261211417,43.8510530028],[4.9266648843,43.8507256379],[4.9311274493,43.8474709008],[4.9316985483,43.8469611902],[4.9332653407,43.8444858497],[4.9334826145,43.8437393525],[4.9315714471,43.8400374844],[4.9276990149,43.8356240364],[4.930556292,43.8295000503],[4.9208266703,43.8264375678],[4.917826264,43.8252841597],[4.9149983462,43.824228461],[4.9129212157,43.823610503],[4.9126970064,43.8241554323],[4.9098017982,43.8290814491],[4.9081330814,43.836640531],[4.9050798787,43.8441697937],[4.9048922086,43.8467853645],[4.9059631385,43.8471213256],[4.9073492332,43.8475084771],[4.9079021855,43.8476410346],[4.9133773035,43.848823385],[4.9169721998,43.8495695299],[4.9200634227,43.8498716356],[4.9244406815,43.851128569],[4.9253989815,43.8516229615]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006567","CODE_COM":"027","INSEE_COM":"13027","NOM_COM":"CHATEAURENARD","STATUT":"Commune simple","X_CHF_LIEU":849069.0,"Y_CHF_LIEU":6311029.0,"X_CENTROID":848274.0,"Y_CENTROID":6311346.0,"Z_MOYEN":33.0,"SUPERFICIE":"3488","POPULATION":"15780","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8109914126,43.9142747148],[4.8132369164,43.9139468801],[4.8201027816,43.9129981985],[4.8217298558,43.9128288399],[4.8292596086,43.9124383199],[4.840645754,43.911920386],[4.8547976178,43.9107939305],[4.8566178547,43.9101631974],[4.8812663239,43.9015893767],[4.8813359132,43.9015605109],[4.8809755954,43.8998446481],[4.8801601808,43.8938733197],[4.8795232008,43.8820495365],[4.8789316011,43.8708407785],[4.8809039098,43.8621147122],[4.8818612087,43.8600170076],[4.8808957158,43.8595988728],[4.8798649608,43.8592763722],[4.8759286134,43.8589318441],[4.8735530401,43.8588736437],[4.859331033,43.8599063755],[4.8492958493,43.8605828138],[4.8454576372,43.8604992721],[4.8421636278,43.860277686],[4.836741925,43.8595031343],[4.8345342609,43.8591712105],[4.8307338443,43.85812785],[4.8262957017,43.856782683],[4.8227768151,43.8559755803],[4.8180618741,43.8551459966],[4.8159727003,43.8548540353],[4.811859972,43.8544543351],[4.8105798576,43.8543333631],[4.8060208162,43.8540965757],[4.8050729131,43.8541743732],[4.8036314529,43.854261223],[4.8027766246,43.854174535],[4.8017710087,43.8537635773],[4.7985873811,43.8526828243],[4.7959643912,43.8522597603],[4.7936234262,43.8519832219],[4.7885128323,43.85160175],[4.7881266476,43.8520599519],[4.7879449859,43.8528928608],[4.7878125187,43.858159976],[4.7880042421,43.8592775163],[4.7890781465,43.8604391055],[4.7909751595,43.8613063322],[4.7931596948,43.8621760039],[4.7981009892,43.8662776942],[4.8008810122,43.8730415268],[4.8011545018,43.8734276819],[4.8021643587,43.8773141003],[4.8020282812,43.8779707636],[4.801343436,43.8794178248],[4.801059322,43.879800581],[4.801199389,43.8799801022],[4.8018487871,43.8806039977],[4.8030930005,43.8816195379],[4.8081200434,43.884697758],[4.8120074908,43.8868729115],[4.8148129385,43.8886356463],[4.8168813754,43.8900757189],[4.8170002595,43.8904086039],[4.8183833425,43.8960035543],[4.8174579845,43.8979840441],[4.8162122699,43.9006188839],[4.8151271453,43.9029044739],[4.811234116,43.912205856],[4.8109762104,43.9142759196],[4.8109914126,43.9142747148]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006592","CODE_COM":"051","INSEE_COM":"13051","NOM_COM":"LANCON-PROVENCE","STATUT":"Commune simple","X_CHF_LIEU":871872.0,"Y_CHF_LIEU":6279360.0,"X_CENTROID":875778.0,"Y_CENTROID":6277836.0,"Z_MOYEN":108.0,"SUPERFICIE":"6917","POPULATION":"8671","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1767911254,43.5397889358],[5.1655520474,43.5402550192],[5.1647439664,43.5401856358],[5.162540975,43.539379899],[5.1592809646,43.5380677211],[5.1566145244,43.5360191064],[5.1490626983,43.5320160756],[5.1447519273,43.5300744521],[5.1338308552,43.5247679932],[5.1226015364,43.5232142909],[5.1217224398,43.5229218731],[5.1216714168,43.5231478811],[5.1212289499,43.5244633923],[5.1191238617,43.5296977734],[5.1165513501,43.5355190738],[5.1144211685,43.5399600346],[5.1116765435,43.5453660725],[5.108734663,43.5522888756],[5.1075741468,43.5550943871],[5.1058238895,43.5597753521],[5.1055108057,43.5606877843],[5.1052359383,43.5616975815],[5.1044043274,43.565313948],[5.1026348796,43.5722238166],[5.1019736606,43.5746532969],[5.1007593733,43.5783787751],[5.102785507,43.5876553079],[5.1025129145,43.5880899213],[5.101270411,43.5898682152],[5.0968880244,43.5934605085],[5.0912706112,43.5950215318],[5.0895211543,43.5951695099],[5.0891848812,43.5958996394],[5.0892756525,43.5965558494],[5.0897015178,43.5967213722],[5.0952181826,43.5984323614],[5.0960900433,43.5988718818],[5.0966452974,43.5991878952],[5.1055179916,43.6004690131],[5.1152585624,43.6029044343],[5.1230946642,43.6059684989],[5.1280520788,43.610148759],[5.129602352,43.6115990438],[5.1303438489,43.6145863391],[5.1302173588,43.6182855359],[5.1300555057,43.621066428],[5.1299710135,43.6221275072],[5.1317994413,43.6224840994],[5.133026193,43.6225869418],[5.1349454528,43.6220541937],[5.1374637825,43.6209407618],[5.1400172323,43.6190776904],[5.1399887239,43.6184796814],[5.1398579048,43.6161356839],[5.1392985055,43.6151880885],[5.1387459926,43.6135940821],[5.139012304,43.613460125],[5.1423294594,43.6125189698],[5.1428822572,43.6124270593],[5.1462081274,43.612119285],[5.1470626335,43.6120456956],[5.1603413807,43.6109894819],[5.1638423085,43.6107289899],[5.1728670609,43.6084759202],[5.1856366712,43.6046868321],[5.1952520076,43.6014370691],[5.19635102,43.6010908132],[5.1999858962,43.5998849162],[5.2028048589,43.5989807806],[5.2046563631,43.5984292529],[5.2065765785,43.5979906118],[5.2101509155,43.5975704987],[5.2204601679,43.5967310613],[5.2299184707,43.5957046862],[5.237246177,43.5947708947],[5.2465630859,43.5934057245],[5.2538133384,43.5921843673],[5.2542131697,43.5920851568],[5.2534866847,43.5903944959],[5.2556464969,43.5827724277],[5.2558046458,43.5822281703],[5.2558460691,43.5814235028],[5.2539398555,43.5808402032],[5.2513612789,43.5800340824],[5.2506262849,43.5789412749],[5.2383488654,43.5722750004],[5.2344463929,43.570931414],[5.2315549771,43.5698927536],[5.2272585159,43.5672878716],[5.2261820473,43.5665025598],[5.2256379604,43.5665812228],[5.2229945189,43.5672051458],[5.2186914667,43.5690258606],[5.2167393045,43.5699883388],[5.2141731398,43.5717553924],[5.2085777167,43.5723401077],[5.2037841233,43.5722079852],[5.1945555358,43.5709592578],[5.1878610613,43.5694093941],[5.1835876195,43.5680381827],[5.1809716711,43.5664337049],[5.1804516353,43.5659085996],[5.1768637853,43.5621714468],[5.1768541228,43.5592400759],[5.1768768847,43.55595613],[5.1770064955,43.5533361052],[5.177054617,43.5478491832],[5.1767911254,43.5397889358]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006660","CODE_COM":"014","INSEE_COM":"84014","NOM_COM":"BEAUMONT-DE-PERTUIS","STATUT":"Commune simple","X_CHF_LIEU":916597.0,"Y_CHF_LIEU":6296848.0,"X_CENTROID":917223.0,"Y_CENTROID":6297495.0,"Z_MOYEN":384.0,"SUPERFICIE":"5393","POPULATION":"1120","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.712026119,43.690643311],[5.73062589,43.7092868422],[5.7303804627,43.7090260869],[5.728477846,43.7068931249],[5.7222317282,43.6996477048],[5.7188791961,43.695191042],[5.7173547125,43.6935292642],[5.7161828206,43.6925762465],[5.7152757255,43.6919209272],[5.7141246226,43.6913266112],[5.7115259101,43.690373125],[5.710202997,43.690000937],[5.7086424531,43.6898246243],[5.7052262695,43.6899222427],[5.7010427861,43.6904565695],[5.6864893798,43.6921944918],[5.6828407763,43.6928238625],[5.712026119,43.690643311]]],[[[5.753640793,43.7246157716],[5.7526592348,43.7235965598],[5.7497060392,43.7208908273],[5.7482873065,43.7199911668],[5.7474584623,43.7196123254],[5.7449382445,43.7189628201],[5.7435605941,43.7187364497],[5.7413635941,43.7183020088],[5.7411128319,43.7182089505],[5.753640793,43.7246157716]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006664","CODE_COM":"018","INSEE_COM":"13018","NOM_COM":"CABANNES","STATUT":"Commune simple","X_CHF_LIEU":856849.0,"Y_CHF_LIEU":6308784.0,"X_CENTROID":856979.0,"Y_CENTROID":6309013.0,"Z_MOYEN":51.0,"SUPERFICIE":"1545","POPULATION":"4372","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9319883629,43.8838145233],[4.93599121,43.8821346969],[4.9438121855,43.8788801024],[4.9458230474,43.8780682989],[4.9486898908,43.8772150717],[4.9549399247,43.8752424092],[4.969653129,43.869743347],[4.9904791279,43.851608704],[4.9907756318,43.8513182029],[4.9914935206,43.8507154706],[4.9923927717,43.8497493425],[4.9960851929,43.846061249],[4.9972911248,43.8451994266],[4.9976454139,43.8448616845],[4.9976450115,43.8448534377],[4.9949834698,43.8424365155],[4.9920645208,43.8398000901],[4.9918214671,43.8383219146],[4.9899912519,43.8376918834],[4.9758263408,43.8401773729],[4.9739958846,43.8420207923],[4.9722934428,43.8433964691],[4.9698540627,43.8452256218],[4.9610916812,43.8471145649],[4.9587375065,43.8472351785],[4.9529448187,43.8471581019],[4.9465695196,43.8476132221],[4.9380200143,43.8484387832],[4.9353477696,43.8487193717],[4.9341190092,43.8490184199],[4.9337648091,43.8494315806],[4.9322194232,43.8526167977],[4.9318756299,43.8534123455],[4.9313815136,43.8544716067],[4.9306260563,43.8559333717],[4.9298155012,43.8563176872],[4.9287914866,43.8567543804],[4.9248505268,43.8618163962],[4.9213198577,43.8665568847],[4.9210391664,43.8672378665],[4.9209821322,43.8677987866],[4.9218191851,43.8681954336],[4.9233935106,43.8689067505],[4.925005729,43.8695597651],[4.9288577567,43.8710229704],[4.9333336345,43.8723822746],[4.9344126148,43.8762429911],[4.9349279117,43.8792207073],[4.9350039836,43.8797027645],[4.9308923324,43.8840911274],[4.9304982868,43.8843636558],[4.9305338375,43.8843575222],[4.9319883629,43.8838145233]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006764","CODE_COM":"091","INSEE_COM":"13091","NOM_COM":"SAINT-CANNAT","STATUT":"Commune simple","X_CHF_LIEU":885506.0,"Y_CHF_LIEU":6282960.0,"X_CENTROID":886944.0,"Y_CENTROID":6282632.0,"Z_MOYEN":239.0,"SUPERFICIE":"3683","POPULATION":"5388","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3345,43.5928014917],[5.3328053559,43.5930962476],[5.3278459935,43.5955574511],[5.3227026723,43.5948007169],[5.3177351214,43.593639426],[5.3140772605,43.5914445539],[5.3128560285,43.5908269643],[5.3005634871,43.5914778072],[5.2869220535,43.5896118813],[5.2783764634,43.5895007486],[5.2682240384,43.5903739513],[5.2658245093,43.5906058641],[5.2542131697,43.5920851568],[5.2545536175,43.5933427675],[5.2553753126,43.597548209],[5.2552615561,43.6001681496],[5.2549802537,43.601929246],[5.254935824,43.6037295334],[5.2550346204,43.6044466891],[5.2565134038,43.6079679154],[5.257459365,43.6097503375],[5.2582441367,43.6105837585],[5.2590356695,43.6111478926],[5.2597130155,43.6112031172],[5.2637102376,43.6137321154],[5.2640054617,43.6142435459],[5.2651105126,43.6165320826],[5.2652854764,43.6172917577],[5.2675685619,43.6227980443],[5.2707320768,43.6299665075],[5.2730081396,43.6321747182],[5.2766007022,43.6346046643],[5.2822542167,43.6374890366],[5.2845441685,43.6384095057],[5.2855480311,43.6388114791],[5.2937353247,43.6418337114],[5.2984765886,43.6420522203],[5.2994110754,43.6419874479],[5.3001039951,43.6418026554],[5.3134561107,43.6389132948],[5.3174665523,43.6381041212],[5.3196813041,43.6377940259],[5.3319248276,43.6327412892],[5.341916871,43.6291714704],[5.3478928756,43.6270585307],[5.3493915173,43.6265544479],[5.3548134529,43.6254766013],[5.3607133715,43.6243349871],[5.3639587043,43.6246038042],[5.3653357241,43.6248510958],[5.3667306525,43.6218690251],[5.3674751024,43.6201217591],[5.3641888438,43.6148570555],[5.3591301289,43.6063631695],[5.3504011715,43.6002143205],[5.3445618711,43.5995096673],[5.3423106228,43.5987048855],[5.3382768537,43.5958275794],[5.3345,43.5928014917]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006905","CODE_COM":"045","INSEE_COM":"13045","NOM_COM":"GRAVESON","STATUT":"Commune simple","X_CHF_LIEU":842602.0,"Y_CHF_LIEU":6307397.0,"X_CENTROID":841821.0,"Y_CENTROID":6308131.0,"Z_MOYEN":24.0,"SUPERFICIE":"2381","POPULATION":"4479","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7815081141,43.8911573976],[4.783219894,43.8907279775],[4.7908340421,43.8849008063],[4.7994256817,43.878903961],[4.8004893411,43.8793662055],[4.801059322,43.879800581],[4.801343436,43.8794178248],[4.8020282812,43.8779707636],[4.8021643587,43.8773141003],[4.8011545018,43.8734276819],[4.8008810122,43.8730415268],[4.7981009892,43.8662776942],[4.7931596948,43.8621760039],[4.7909751595,43.8613063322],[4.7890781465,43.8604391055],[4.7880042421,43.8592775163],[4.7878125187,43.858159976],[4.7879449859,43.8528928608],[4.7881266476,43.8520599519],[4.7885128323,43.85160175],[4.7936234262,43.8519832219],[4.7959643912,43.8522597603],[4.7985873811,43.8526828243],[4.8017710087,43.8537635773],[4.8027766246,43.854174535],[4.8036314529,43.854261223],[4.8050729131,43.8541743732],[4.805090208,43.8507454265],[4.8048782605,43.8461230888],[4.8039506551,43.8461699376],[4.8027688827,43.8465576327],[4.802051208,43.8465568886],[4.8015130542,43.8468061155],[4.7908936045,43.8474751497],[4.7897546664,43.8474470343],[4.7888802981,43.8464541195],[4.7879074382,43.8450154442],[4.7755442567,43.8401937295],[4.7674235736,43.8313918441],[4.7577603188,43.8252660705],[4.7568784806,43.8249715404],[4.7544251608,43.8239885037],[4.7533268736,43.8232428685],[4.7524150312,43.8225761375],[4.751911988,43.8221044584],[4.7513895764,43.8214872696],[4.7505322762,43.8198394229],[4.7500917031,43.818280296],[4.7501612896,43.8174672765],[4.749515695,43.8173723241],[4.7418669408,43.8168449042],[4.73446283,43.8180250668],[4.73322147,43.818493061],[4.7323917049,43.8193757538],[4.7320308482,43.8198567446],[4.7342608044,43.8223884182],[4.7363842813,43.8256238381],[4.7384078721,43.8294098907],[4.7415562884,43.8365984234],[4.7417072045,43.837225199],[4.7417284424,43.8394724672],[4.7417382552,43.8411816463],[4.7415270148,43.842085144],[4.7404498785,43.8448162146],[4.7393542116,43.8468193699],[4.7384764755,43.8480980403],[4.7364751862,43.8510427289],[4.7344070204,43.8568310588],[4.734467306,43.8577104293],[4.7369386076,43.8578988493],[4.7459903891,43.863247908],[4.7497815946,43.8661855449],[4.7538336021,43.8693781118],[4.7564581645,43.8711730955],[4.7672819072,43.877155375],[4.7718894401,43.8810683502],[4.7794372147,43.8883322612],[4.7813400256,43.8906371463],[4.7815081141,43.8911573976]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000006967","CODE_COM":"007","INSEE_COM":"84007","NOM_COM":"AVIGNON","STATUT":"Préfecture de département","X_CHF_LIEU":845151.0,"Y_CHF_LIEU":6318280.0,"X_CENTROID":846031.0,"Y_CENTROID":6315344.0,"Z_MOYEN":25.0,"SUPERFICIE":"6491","POPULATION":"90305","CODE_ARR":"2","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7396518038,43.9239928938],[4.7390596941,43.9240621925],[4.7390639137,43.9240681247],[4.7396518038,43.9239928938]]],[[[4.773596287,43.919643402],[4.7752918635,43.9194002206],[4.7735950563,43.9196361331],[4.7731475935,43.9197009686],[4.773596287,43.919643402]]],[[[4.840645754,43.911920386],[4.8292596086,43.9124383199],[4.8217298558,43.9128288399],[4.8201027816,43.9129981985],[4.8132369164,43.9139468801],[4.8109914126,43.9142747148],[4.840645754,43.911920386]]],[[[4.85480547,43.910793305],[4.8566178547,43.9101631974],[4.8547976178,43.9107939305],[4.85480547,43.910793305]]],[[[4.881334781,43.901565553],[4.8813501364,43.9015556825],[4.8813359132,43.9015605109],[4.8812663239,43.9015893767],[4.881334781,43.901565553]]],[[[4.9029430425,43.8876702015],[4.9023179459,43.887928969],[4.9004975065,43.8892433696],[4.9029430425,43.8876702015]]],[[[4.921965283,43.8867589684],[4.9092180022,43.8862367662],[4.9081621079,43.8862615306],[4.9033554016,43.8874994965],[4.9029470682,43.887668535],[4.921965283,43.8867589684]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000007318","CODE_COM":"114","INSEE_COM":"13114","NOM_COM":"VENTABREN","STATUT":"Commune simple","X_CHF_LIEU":885369.0,"Y_CHF_LIEU":6273791.0,"X_CENTROID":886286.0,"Y_CENTROID":6274801.0,"Z_MOYEN":168.0,"SUPERFICIE":"2637","POPULATION":"4857","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3484960434,43.5363112339],[5.3483227975,43.5361592624],[5.3453260594,43.5334913131],[5.3411977348,43.5276397063],[5.3402606639,43.5262890515],[5.3401080441,43.525791881],[5.339260748,43.5227866809],[5.3370923939,43.5207208612],[5.3299255326,43.5181873154],[5.3279242244,43.5178198361],[5.3256271166,43.5174469613],[5.3250794777,43.5173623902],[5.3200498406,43.5175006854],[5.3137298042,43.5170776144],[5.3091621264,43.5160615281],[5.3041851339,43.5154436899],[5.294559473,43.5189825759],[5.2941617594,43.5195850491],[5.2938343994,43.5208034975],[5.2866729162,43.5265577722],[5.2785055833,43.5345919376],[5.2781043779,43.5348325869],[5.274725287,43.5367621793],[5.2706220225,43.5374052796],[5.2651654818,43.5381835923],[5.2648262157,43.5381771725],[5.264838295,43.5383893429],[5.2617371993,43.5414873448],[5.2609368259,43.5417749522],[5.2605660838,43.5419752964],[5.2615864785,43.5461745948],[5.261883154,43.54651225],[5.2640782809,43.5480785583],[5.2661825532,43.5494406],[5.2686823293,43.5507871371],[5.2695480328,43.5511794858],[5.2709236912,43.5516673719],[5.2774516662,43.5523487879],[5.2832836626,43.5517699021],[5.284400098,43.5525511087],[5.2840361536,43.5541042589],[5.2835642356,43.5557748951],[5.2825464358,43.5578494605],[5.2796529248,43.5639959411],[5.2793183172,43.5645160335],[5.2777451244,43.5659226307],[5.2741676886,43.5677042507],[5.273549639,43.5699773904],[5.2771294475,43.5733066221],[5.2776877599,43.5739294972],[5.2785080103,43.5748817192],[5.2795896219,43.5745583752],[5.2841646086,43.5731669484],[5.2878958505,43.5717643046],[5.3019499263,43.5676633012],[5.3027687554,43.5673686972],[5.3043970102,43.5665150328],[5.3054606373,43.5658128552],[5.3064361481,43.5649208122],[5.3084872425,43.5630418589],[5.3160641309,43.5590873352],[5.3256454485,43.5552351629],[5.3391494591,43.5524957273],[5.3416735144,43.5479577604],[5.3432089884,43.5428866144],[5.347202913,43.5376992987],[5.3484141448,43.5364264218],[5.3484960434,43.5363112339]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000007328","CODE_COM":"085","INSEE_COM":"13085","NOM_COM":"ROQUEFORT-LA-BEDOULE","STATUT":"Commune simple","X_CHF_LIEU":910504.0,"Y_CHF_LIEU":6242147.0,"X_CENTROID":914086.0,"Y_CENTROID":6242907.0,"Z_MOYEN":352.0,"SUPERFICIE":"3098","POPULATION":"5321","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.704507827,43.241657257],[5.7044859189,43.2416511087],[5.7035411928,43.2415222685],[5.6960309582,43.2392778568],[5.6858834906,43.2364284037],[5.6839089702,43.2360546985],[5.6832409619,43.2358255926],[5.6824259812,43.2354572395],[5.682416439,43.235454559],[5.6824160493,43.2354527504],[5.6824123258,43.2354510675],[5.6816612796,43.235395023],[5.6743025258,43.2349718411],[5.6682941411,43.2350251115],[5.6602979755,43.235857875],[5.6566878292,43.2364534934],[5.6554773148,43.2366578813],[5.6538948706,43.2369659022],[5.6522023826,43.2373441053],[5.649405241,43.2379816031],[5.6451987611,43.2392961869],[5.6348456351,43.2411027925],[5.6218825425,43.2399693321],[5.6121083078,43.2392693332],[5.6042439522,43.2387123063],[5.5999785888,43.2384416039],[5.594329614,43.2363085745],[5.5943316347,43.2363535263],[5.5902737049,43.2388890812],[5.5882476802,43.2400743791],[5.5864468987,43.2389808253],[5.5836495236,43.2371271947],[5.5805851057,43.2352159821],[5.5769531165,43.2332696401],[5.5766920415,43.2334873714],[5.5752309955,43.2350603312],[5.5746999001,43.2365651975],[5.568660288,43.2406186594],[5.5588251647,43.2449417895],[5.5554838114,43.2479981204],[5.5547889664,43.2486274629],[5.5555594875,43.2488450306],[5.5592277263,43.25010456],[5.5641796909,43.251820399],[5.5714234854,43.2545317859],[5.5782906852,43.2579762135],[5.5856513071,43.2651570176],[5.5861261231,43.2658035682],[5.5866218359,43.266806027],[5.5878119904,43.2660466989],[5.5896992546,43.2649322359],[5.5903137635,43.2646843939],[5.5973668413,43.2647913253],[5.6035510197,43.2673389299],[5.6047295801,43.2681547472],[5.606578008,43.2685574752],[5.6106522674,43.2693996198],[5.6126208463,43.269706639],[5.615342134,43.2701250067],[5.6167428773,43.270267491],[5.6175014986,43.270292313],[5.628393576,43.2702411407],[5.629805146,43.2701338808],[5.6386005023,43.2689437421],[5.6554739972,43.2673520735],[5.655843757,43.2673042802],[5.6569539247,43.2670465642],[5.6579434113,43.2670033187],[5.6666458326,43.262917686],[5.6745135313,43.256843992],[5.6818800081,43.2546712875],[5.6868040852,43.2531313019],[5.693511108,43.2508310849],[5.6962169663,43.249869801],[5.6973140387,43.2494742794],[5.698948536,43.2483281691],[5.7004398124,43.2473854278],[5.7007703339,43.2472655543],[5.7012217448,43.2471543955],[5.704507827,43.241657257]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000007858","CODE_COM":"118","INSEE_COM":"13118","NOM_COM":"COUDOUX","STATUT":"Commune simple","X_CHF_LIEU":881712.0,"Y_CHF_LIEU":6275787.0,"X_CENTROID":882210.0,"Y_CENTROID":6276194.0,"Z_MOYEN":151.0,"SUPERFICIE":"1266","POPULATION":"3529","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2558460691,43.5814235028],[5.2561889085,43.5811049388],[5.2690072538,43.5750428703],[5.2726003582,43.5756113113],[5.2749136127,43.5754368526],[5.2773958167,43.5751210822],[5.2785080103,43.5748817192],[5.2776877599,43.5739294972],[5.2771294475,43.5733066221],[5.273549639,43.5699773904],[5.2741676886,43.5677042507],[5.2777451244,43.5659226307],[5.2793183172,43.5645160335],[5.2796529248,43.5639959411],[5.2825464358,43.5578494605],[5.2835642356,43.5557748951],[5.2840361536,43.5541042589],[5.284400098,43.5525511087],[5.2832836626,43.5517699021],[5.2774516662,43.5523487879],[5.2709236912,43.5516673719],[5.2695480328,43.5511794858],[5.2686823293,43.5507871371],[5.2661825532,43.5494406],[5.2640782809,43.5480785583],[5.261883154,43.54651225],[5.2615864785,43.5461745948],[5.2605660838,43.5419752964],[5.2609368259,43.5417749522],[5.2617371993,43.5414873448],[5.264838295,43.5383893429],[5.2648262157,43.5381771725],[5.2643371916,43.5379812563],[5.2598817331,43.5380741376],[5.2604156455,43.5395994778],[5.257606884,43.5420206974],[5.2569123859,43.5423582775],[5.2510949575,43.5443945078],[5.2412434699,43.5462824805],[5.2338948362,43.5471540632],[5.2335727471,43.5473677133],[5.2332117481,43.5492536329],[5.2322897744,43.5529449787],[5.2300496049,43.5584213016],[5.2269142323,43.5646675407],[5.2261820473,43.5665025598],[5.2272585159,43.5672878716],[5.2315549771,43.5698927536],[5.2344463929,43.570931414],[5.2383488654,43.5722750004],[5.2506262849,43.5789412749],[5.2513612789,43.5800340824],[5.2539398555,43.5808402032],[5.2558460691,43.5814235028]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000007903","CODE_COM":"048","INSEE_COM":"13048","NOM_COM":"JOUQUES","STATUT":"Commune simple","X_CHF_LIEU":912792.0,"Y_CHF_LIEU":6285542.0,"X_CENTROID":914052.0,"Y_CENTROID":6285613.0,"Z_MOYEN":369.0,"SUPERFICIE":"8026","POPULATION":"4267","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6238336518,43.6661409335],[5.6238507967,43.6661450942],[5.6275457062,43.6669093575],[5.6374544383,43.6703157128],[5.6398130049,43.6714546835],[5.641422273,43.67198944],[5.642072542,43.6725457425],[5.6442819355,43.6736125039],[5.6477480084,43.6757960631],[5.6518102803,43.679732313],[5.6617688277,43.6874137122],[5.6703914989,43.6918282756],[5.6738802656,43.6934542061],[5.682821273,43.692825317],[5.6828222587,43.6928252435],[5.6826542687,43.6920667539],[5.6826304277,43.6915577498],[5.6828750182,43.6913491414],[5.6889672654,43.6864593251],[5.691928976,43.684905909],[5.6952051311,43.6842116449],[5.6974323027,43.6834523668],[5.7000704909,43.6824127371],[5.7017556394,43.6804486627],[5.702893266,43.6790032612],[5.70440243,43.6763898733],[5.7079833939,43.6715550801],[5.7120188031,43.6663243925],[5.7176394526,43.6593640153],[5.718927556,43.6576310795],[5.7196512992,43.6549560963],[5.7191423973,43.652802631],[5.7187990481,43.6508710093],[5.7189775995,43.6498384178],[5.718973159,43.649837494],[5.709944249,43.641654969],[5.7071732385,43.6419129946],[5.7069297689,43.642009154],[5.7063918241,43.6419857436],[5.700600624,43.642524719],[5.6864264495,43.6197807541],[5.6854965351,43.6185990769],[5.682141289,43.6137357488],[5.6817178819,43.6122210347],[5.680883884,43.610881806],[5.6811461189,43.6101754591],[5.6811443416,43.6101691004],[5.6816910029,43.6055371302],[5.6822026784,43.6034970527],[5.6829174125,43.601216985],[5.6843024851,43.5979354399],[5.6862158248,43.5944580584],[5.6881417953,43.5913256134],[5.689607143,43.58737564],[5.687576771,43.584213257],[5.6821183144,43.5826234087],[5.6817799844,43.5825589056],[5.6701317329,43.5803594361],[5.658598065,43.5780199978],[5.6561663895,43.5776806992],[5.6559638229,43.5773975718],[5.6560255947,43.5739966868],[5.6578516414,43.5724116581],[5.6634549118,43.5689784904],[5.6689504741,43.5649528813],[5.6693065344,43.5646471945],[5.6693124451,43.5646376166],[5.6685116736,43.5645096635],[5.6627197957,43.5647158119],[5.6588868244,43.5662123609],[5.6474903092,43.5699676751],[5.6436335918,43.5741361981],[5.6379355951,43.5791271526],[5.630876298,43.5814329294],[5.6272240471,43.5872424648],[5.6170650992,43.5911634991],[5.6144583042,43.5939180432],[5.613947937,43.5942976316],[5.6136296319,43.5948148358],[5.6094196239,43.5989041924],[5.6050251109,43.6044814299],[5.6028366539,43.6092728455],[5.6038010492,43.6127220371],[5.6040159707,43.6169643241],[5.6037497192,43.6213892061],[5.6038226164,43.6271428738],[5.6045891185,43.6349586766],[5.6057195197,43.6442845708],[5.6061135338,43.646161215],[5.607520161,43.656887702],[5.6069890847,43.6584336316],[5.6069435191,43.6586859052],[5.6069459105,43.6586886088],[5.6238336518,43.6661409335]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000008222","CODE_COM":"150","INSEE_COM":"83150","NOM_COM":"VINON-SUR-VERDON","STATUT":"Commune simple","X_CHF_LIEU":926573.0,"Y_CHF_LIEU":6295780.0,"X_CENTROID":925748.0,"Y_CENTROID":6295840.0,"Z_MOYEN":325.0,"SUPERFICIE":"3609","POPULATION":"4198","CODE_ARR":"3","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.753650665,43.724620819],[5.772453785,43.722183227],[5.784077168,43.716365814],[5.783936482,43.7146172795],[5.7788150789,43.7184155027],[5.7677160316,43.7225087949],[5.7669205453,43.7226181605],[5.7567744805,43.7240263291],[5.7536473947,43.7246191469],[5.753650665,43.724620819]]],[[[5.783261777,43.706230164],[5.788631916,43.696720124],[5.8132414299,43.689054827],[5.8129458011,43.6891076658],[5.8097048255,43.6898415134],[5.8091536591,43.6901654828],[5.8033655387,43.691642882],[5.7968912167,43.6926180906],[5.7936396099,43.6923531989],[5.7928455221,43.6925581684],[5.7924885368,43.6927951303],[5.7917832368,43.6934471038],[5.7893436276,43.6958416801],[5.7872665169,43.698090055],[5.7839137108,43.7023347803],[5.7831876764,43.7036625165],[5.7822752013,43.7062114384],[5.782192688,43.7068888388],[5.7832509438,43.7092027835],[5.7835480056,43.7097885059],[5.783261777,43.706230164]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000008701","CODE_COM":"039","INSEE_COM":"13039","NOM_COM":"FOS-SUR-MER","STATUT":"Commune simple","X_CHF_LIEU":857361.0,"Y_CHF_LIEU":6263649.0,"X_CENTROID":854348.0,"Y_CENTROID":6264172.0,"Z_MOYEN":7.0,"SUPERFICIE":"8864","POPULATION":"15814","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.968750954,43.425693512],[4.9686326516,43.4256935121],[4.968472957,43.4257639556],[4.968472957,43.425971985],[4.968194961,43.425971985],[4.968194961,43.426250458],[4.967916965,43.426250458],[4.967916965,43.426528931],[4.967082977,43.426528931],[4.967082977,43.426250458],[4.9669882929,43.4262504585],[4.9655096543,43.4265578572],[4.9627754925,43.4270520018],[4.9591279959,43.427559],[4.958749771,43.4276278757],[4.958749771,43.427639008],[4.9586886354,43.4276390085],[4.9542831006,43.4284411561],[4.9498628424,43.4291777616],[4.9494334708,43.4292241866],[4.949305058,43.4292180917],[4.949305058,43.429306031],[4.947638988,43.429306031],[4.947638988,43.429584504],[4.944304944,43.429584504],[4.944304944,43.429306031],[4.944026946,43.429306031],[4.944026946,43.428941221],[4.943793434,43.4289106741],[4.9436267159,43.4270820621],[4.943472862,43.427082062],[4.943472862,43.426528931],[4.943194867,43.426528931],[4.943194867,43.4263763363],[4.9427347754,43.4262504612],[4.941250801,43.426250458],[4.941250801,43.426528931],[4.9396561263,43.4265289336],[4.9409171675,43.4266647402],[4.9416982945,43.4263582652],[4.9431215823,43.4267863043],[4.9431705476,43.4283458969],[4.9429009033,43.4287709992],[4.9412164998,43.4282540432],[4.9410416741,43.4278666085],[4.9414623208,43.4268664527],[4.939307212,43.4266403725],[4.939307212,43.426807404],[4.938751221,43.426807404],[4.938751221,43.427917481],[4.939029217,43.427917481],[4.939029217,43.428329286],[4.9396420533,43.4285072285],[4.9403565564,43.4292998656],[4.9403149247,43.4297496744],[4.9398573412,43.4305345062],[4.939029217,43.4313145461],[4.939029217,43.431526185],[4.9388045257,43.4315261862],[4.9387801893,43.431549109],[4.9378685165,43.4318318001],[4.934306145,43.4326311687],[4.934306145,43.432640077],[4.9342664413,43.4326400771],[4.933472156,43.4328182894],[4.933472156,43.43291855],[4.9329623384,43.432918557],[4.9313769513,43.4331572323],[4.9303716624,43.4329185556],[4.9299798,43.43291855],[4.928940774,43.43291855],[4.927639961,43.43291855],[4.927639961,43.432640077],[4.923748971,43.432640077],[4.923748971,43.432361604],[4.922916889,43.432361604],[4.922916889,43.432083131],[4.9220829,43.432083131],[4.9220829,43.431804658],[4.921248913,43.431804658],[4.921248913,43.431526185],[4.920138836,43.431526185],[4.920138836,43.431251527],[4.919304848,43.431251527],[4.919304848,43.430973054],[4.918472766,43.430973054],[4.918472766,43.430694581],[4.917638779,43.430694581],[4.917638779,43.430416108],[4.917082786,43.430416108],[4.917082786,43.430137635],[4.916526795,43.430137635],[4.916526795,43.429862977],[4.915973186,43.429862977],[4.915973186,43.429584504],[4.915139198,43.429584504],[4.915139198,43.429306031],[4.914583206,43.429306031],[4.914583206,43.4290371522],[4.914554561,43.4290275581],[4.914029121,43.429027558],[4.914029121,43.4288515702],[4.9137581746,43.4287608196],[4.913473129,43.428749085],[4.913473129,43.4286653455],[4.9133314402,43.4286178874],[4.9130035735,43.4284706121],[4.912937164,43.428470612],[4.91263914,43.428470612],[4.91263914,43.4283069093],[4.912392136,43.4281959544],[4.912082194,43.428195954],[4.912082194,43.4280567261],[4.9117722189,43.4279174813],[4.911529063,43.427917481],[4.911529063,43.4278082516],[4.9113171035,43.427713035],[4.9111955645,43.4276390088],[4.910694122,43.427639008],[4.910694122,43.427360535],[4.91013813,43.427360535],[4.91013813,43.427082062],[4.909860135,43.427082062],[4.909860135,43.426872254],[4.909860135,43.426528931],[4.909584045,43.426528931],[4.909582137,43.425971985],[4.909306049,43.425971985],[4.909306049,43.425415038],[4.909173013,43.425415038],[4.909028053,43.425415038],[4.909028053,43.424861908],[4.908750058,43.424861908],[4.908750058,43.424304961],[4.908472062,43.424304961],[4.908472062,43.423473358],[4.908194065,43.423473358],[4.908194065,43.422916413],[4.907916069,43.422916413],[4.907916069,43.422359467],[4.907638073,43.422359467],[4.907638073,43.421527863],[4.907360078,43.421527863],[4.907360078,43.420970917],[4.907083988,43.420970917],[4.907083988,43.420696259],[4.906805992,43.420696259],[4.906805992,43.420417786],[4.906527996,43.420417786],[4.906527996,43.420139313],[4.906250001,43.420139313],[4.906250001,43.41986084],[4.905694007,43.41986084],[4.905694007,43.419582367],[4.905138016,43.419582367],[4.905138016,43.419303894],[4.904305935,43.419303894],[4.904305935,43.419029236],[4.903749943,43.419029236],[4.903749943,43.418750763],[4.90319395,43.418750763],[4.90319395,43.41847229],[4.902639866,43.41847229],[4.902639866,43.418193817],[4.902083873,43.418193817],[4.902083873,43.417915344],[4.901527882,43.417915344],[4.901527882,43.417640686],[4.900971889,43.417640686],[4.900971889,43.4174619864],[4.9006528467,43.4173622133],[4.900417805,43.417362213],[4.900417805,43.4172887087],[4.8999241875,43.4171343374],[4.8998905029,43.4170837401],[4.899861812,43.41708374],[4.899861812,43.4170406438],[4.8994877501,43.4164787619],[4.899583816,43.4161818974],[4.899583816,43.41569519],[4.8997413131,43.4156951901],[4.8998462221,43.4153709894],[4.899861812,43.4153375693],[4.899861812,43.415138244],[4.8999547935,43.4151382441],[4.9009275948,43.4130527568],[4.9012424691,43.4118224601],[4.900971889,43.4120517638],[4.900971889,43.412361144],[4.900693893,43.412361144],[4.900693893,43.41291809],[4.900417805,43.41291809],[4.900417805,43.413192748],[4.8996283396,43.4131927492],[4.8989319045,43.414224348],[4.899558517,43.4144338355],[4.8980014341,43.4168539836],[4.8974301183,43.4169368868],[4.8967984949,43.4168052691],[4.896248817,43.416805267],[4.896248817,43.4166907238],[4.8954621817,43.4165267942],[4.895417213,43.416526794],[4.895417213,43.4165157964],[4.8947258107,43.4162483215],[4.894583224,43.416248321],[4.894583224,43.4161931597],[4.8940821173,43.4159992969],[4.8940201026,43.4159736644],[4.893473149,43.415973663],[4.893473149,43.4157475902],[4.893346377,43.4156951904],[4.89263916,43.41569519],[4.89263916,43.415416717],[4.892083167,43.415416717],[4.892083167,43.415138244],[4.891527176,43.415138244],[4.891527176,43.414859771],[4.891251088,43.414859771],[4.891251088,43.414585113],[4.890695095,43.414585113],[4.890695095,43.41430664],[4.890139103,43.41430664],[4.890139103,43.414028167],[4.889861108,43.414028167],[4.889861108,43.413749694],[4.88958311,43.413749694],[4.88958311,43.413471221],[4.889305114,43.413471221],[4.889305114,43.413192748],[4.889027119,43.413192748],[4.889027119,43.41291809],[4.888751031,43.41291809],[4.888751031,43.412639617],[4.888473033,43.412639617],[4.888473033,43.4122250535],[4.8884059575,43.41216315],[4.888473033,43.4119979825],[4.888473033,43.4118042],[4.8885894121,43.4118042001],[4.888751031,43.4116126006],[4.888751031,43.41152954],[4.8888210942,43.4115295401],[4.889027119,43.4112852942],[4.889027119,43.410972596],[4.8892907994,43.410972596],[4.889305114,43.4109531414],[4.889305114,43.410694123],[4.8894956979,43.4106941231],[4.88958311,43.4105753224],[4.88958311,43.410503387],[4.88958311,43.41041565],[4.8897005943,43.4104156501],[4.889861108,43.4101974951],[4.889861108,43.409862519],[4.8901075735,43.409862519],[4.890139103,43.4098196663],[4.890139103,43.409584046],[4.8903124632,43.4095840461],[4.890417099,43.4094418306],[4.890417099,43.409305573],[4.8905173507,43.4093055731],[4.890695095,43.4090639893],[4.890695095,43.4090271],[4.890722236,43.4090271],[4.89097309,43.4086861439],[4.89097309,43.408473969],[4.8911291931,43.4084739691],[4.8912091806,43.4083652496],[4.891251088,43.4083115897],[4.891251088,43.408195496],[4.8913417545,43.4081954961],[4.891527176,43.4079580722],[4.891527176,43.407917023],[4.8915592341,43.407917023],[4.891805171,43.4076021078],[4.891805171,43.407360077],[4.8919941859,43.4073600771],[4.892083167,43.4072461372],[4.892083167,43.407081604],[4.8922116582,43.4070816041],[4.892361165,43.406890159],[4.892361165,43.406806946],[4.8924261488,43.4068069461],[4.8925037964,43.4067075166],[4.89263916,43.4065277117],[4.89263916,43.40625],[4.8928482294,43.4062500001],[4.892917156,43.4061584426],[4.892917156,43.405693054],[4.893195152,43.405693054],[4.893195152,43.405418396],[4.893473149,43.405418396],[4.893473149,43.40486145],[4.893751145,43.40486145],[4.893751145,43.404582977],[4.8929947874,43.4045829792],[4.892361165,43.4051639486],[4.892361165,43.405418396],[4.892083652,43.405418396],[4.892083167,43.4054188407],[4.892083167,43.405971527],[4.891805171,43.405971527],[4.891805171,43.406528473],[4.891527176,43.406528473],[4.891527176,43.407081604],[4.891251088,43.407081604],[4.891251088,43.407360077],[4.89097309,43.407360077],[4.89097309,43.40763855],[4.890695095,43.40763855],[4.890695095,43.407917023],[4.890417099,43.407917023],[4.890417099,43.408473969],[4.890139103,43.408473969],[4.890139103,43.408748627],[4.889861108,43.408748627],[4.889861108,43.4090271],[4.88958311,43.4090271],[4.88958311,43.409305573],[4.889305114,43.409305573],[4.889305114,43.409584046],[4.889027119,43.409584046],[4.889027119,43.409862519],[4.888751031,43.409862519],[4.888751031,43.41041565],[4.888473033,43.41041565],[4.888473033,43.410694123],[4.888195037,43.410694123],[4.888195037,43.410972596],[4.8879863253,43.4109725961],[4.887917042,43.4110671163],[4.887917042,43.411251069],[4.8877822038,43.4112510691],[4.887639046,43.4114463704],[4.887639046,43.41152954],[4.8875780815,43.4115295401],[4.887083053,43.4122048633],[4.887083053,43.412361144],[4.8869684935,43.4123611441],[4.886805057,43.4125841007],[4.886805057,43.412639617],[4.886764361,43.412639617],[4.8865877346,43.4128805643],[4.8874445341,43.415782215],[4.8884354444,43.4169744107],[4.8890803568,43.4183058204],[4.8888434832,43.4201393131],[4.889027119,43.420139313],[4.889027119,43.4204138699],[4.8896049859,43.4209709185],[4.890695095,43.420970917],[4.890695095,43.42124939],[4.89097309,43.42124939],[4.89097309,43.421806336],[4.891251088,43.421806336],[4.891251088,43.422084809],[4.891527176,43.422084809],[4.891527176,43.422359467],[4.891805171,43.422359467],[4.891805171,43.422916413],[4.892083167,43.422916413],[4.892083167,43.423194885],[4.892361165,43.423194885],[4.892361165,43.423473358],[4.892917156,43.423473358],[4.892917156,43.423751831],[4.893751145,43.423751831],[4.893751145,43.42402649],[4.894305229,43.42402649],[4.894305229,43.424304961],[4.894861222,43.424304961],[4.894861222,43.424583435],[4.895139218,43.424583435],[4.895139218,43.425140381],[4.895417213,43.425140381],[4.895417213,43.4254676755],[4.8961982762,43.4259719864],[4.89680481,43.425971985],[4.89680481,43.426250458],[4.897640228,43.426250458],[4.897640228,43.426528931],[4.898748874,43.426528931],[4.898748874,43.426807404],[4.899583816,43.426807404],[4.899583816,43.427082062],[4.900417805,43.427082062],[4.900417805,43.427360535],[4.901527882,43.427360535],[4.901527882,43.427639008],[4.902361871,43.427639008],[4.902361871,43.4278452387],[4.9026971174,43.4279174816],[4.903062821,43.427917481],[4.90319395,43.427982331],[4.90319395,43.4280738224],[4.9034231736,43.4281959542],[4.903616428,43.428195954],[4.904027939,43.428195954],[4.904027939,43.428470612],[4.904861928,43.428470612],[4.904861928,43.428749085],[4.905138016,43.428749085],[4.905138016,43.4291589089],[4.9052355901,43.4293060311],[4.905416012,43.429306031],[4.905416012,43.429578069],[4.9055228386,43.4297391394],[4.905416012,43.4297997073],[4.905416012,43.429862977],[4.9053044194,43.4298629771],[4.905138016,43.4299573226],[4.905138016,43.430137635],[4.904305935,43.430137635],[4.904305935,43.4301277927],[4.9041837004,43.4301307534],[4.9023845094,43.4299040894],[4.9022816343,43.4298629788],[4.902083873,43.429862977],[4.902083873,43.4297839498],[4.9015847934,43.4295845061],[4.900693893,43.429584504],[4.900693893,43.429306031],[4.900139809,43.429306031],[4.900139809,43.429027558],[4.89930582,43.429027558],[4.89930582,43.428749085],[4.899027825,43.428749085],[4.899027825,43.428600674],[4.8985630243,43.4284706229],[4.893473149,43.428470612],[4.893473149,43.4282937204],[4.8923660812,43.4282356461],[4.8916671508,43.4276390083],[4.891527176,43.427639008],[4.891527176,43.4275567702],[4.8884674857,43.4265659564],[4.8879205769,43.425971985],[4.887917042,43.425971985],[4.887917042,43.4259681459],[4.887664173,43.425693512],[4.887639046,43.425693512],[4.887639046,43.4256662221],[4.8874077713,43.4254150381],[4.88736105,43.425415038],[4.88736105,43.4253642944],[4.8871548869,43.4251403811],[4.887083053,43.425140381],[4.887083053,43.4250623619],[4.886898492,43.4248619081],[4.886805057,43.424861908],[4.886805057,43.4247604266],[4.8861987918,43.4241019404],[4.8860243812,43.423751831],[4.885972976,43.423751831],[4.885972976,43.4236486401],[4.8859011617,43.4235044794],[4.88569498,43.423473358],[4.88569498,43.423194885],[4.885416985,43.423194885],[4.885416985,43.42263794],[4.885138034,43.42263794],[4.885138034,43.422359467],[4.884860038,43.422359467],[4.884860038,43.422084809],[4.884582043,43.422084809],[4.884582043,43.421806336],[4.884306908,43.421806336],[4.884306908,43.421527863],[4.884028912,43.421527863],[4.884028912,43.420970917],[4.883749962,43.420970917],[4.883749962,43.420417786],[4.883471966,43.420417786],[4.883471966,43.41986084],[4.88333559,43.41986084],[4.88319397,43.41986084],[4.88319397,43.419582367],[4.8818870893,43.4195823675],[4.881805898,43.4196822801],[4.881805898,43.41986084],[4.8816607952,43.4198608401],[4.88157435,43.4199672169],[4.8815279,43.4200385186],[4.8815279,43.420417786],[4.8812808219,43.420417786],[4.881249904,43.4204652449],[4.881249904,43.420970917],[4.880971909,43.420970917],[4.880971909,43.421527863],[4.880693913,43.421527863],[4.880693913,43.422359467],[4.880415917,43.422359467],[4.880415917,43.422916413],[4.88013792,43.422916413],[4.88013792,43.423473358],[4.879861832,43.423473358],[4.879859924,43.423751831],[4.879583836,43.423751831],[4.879583836,43.424304961],[4.87930584,43.424304961],[4.87930584,43.424583435],[4.879027843,43.424583435],[4.879027843,43.424861908],[4.878749847,43.424861908],[4.878749847,43.425415038],[4.878471852,43.425415038],[4.878471852,43.425693512],[4.877915858,43.425693512],[4.877915858,43.425971985],[4.8757912137,43.425971986],[4.875693799,43.4260103703],[4.875693799,43.426250458],[4.875415801,43.426250458],[4.875415801,43.426528931],[4.8752171279,43.4265289311],[4.87514019,43.4266601881],[4.87514019,43.426807404],[4.8750538971,43.4268074041],[4.8728770423,43.4305208597],[4.8731272394,43.4315685269],[4.8723579658,43.4327454082],[4.8701426705,43.4323616062],[4.869861126,43.432361604],[4.869861126,43.4323128247],[4.869305134,43.432216489],[4.869305134,43.432361604],[4.869027139,43.432361604],[4.869027139,43.4321807569],[4.8682478675,43.4321585348],[4.8674100872,43.4323313636],[4.8670686675,43.4328834927],[4.866249084,43.4346427641],[4.866249084,43.43542862],[4.866249084,43.438751221],[4.865971088,43.438751221],[4.865971088,43.440139771],[4.865695,43.440139771],[4.865695,43.440418244],[4.865971088,43.440418244],[4.865971088,43.440692902],[4.866249084,43.440692902],[4.866249084,43.440971375],[4.865971088,43.440971375],[4.865971088,43.441249848],[4.865695,43.441249848],[4.865695,43.441528321],[4.865417005,43.441528321],[4.865417005,43.441806794],[4.865695,43.441806794],[4.865695,43.442638398],[4.865417005,43.442638398],[4.865417005,43.443195344],[4.864861011,43.443195344],[4.864861011,43.443748475],[4.864583016,43.443748475],[4.864583016,43.444026948],[4.86430502,43.444026948],[4.86430502,43.444305421],[4.86402893,43.444305421],[4.86402893,43.444862367],[4.863750934,43.444862367],[4.863750934,43.445415498],[4.863472939,43.445415498],[4.863472939,43.445693971],[4.8633325021,43.4456939711],[4.8632197914,43.4460047751],[4.863194943,43.4460445437],[4.863194943,43.446529388],[4.862916945,43.446529388],[4.862916945,43.446804048],[4.8627203776,43.4468040481],[4.86263895,43.4469343643],[4.86263895,43.447360992],[4.8623723706,43.447360992],[4.862360954,43.4473792627],[4.862360954,43.447639465],[4.8621983636,43.4476394651],[4.8620971712,43.4478014077],[4.862082959,43.4478238079],[4.862082959,43.447917938],[4.8620232363,43.4479179381],[4.8609489633,43.449611068],[4.8612050026,43.4505380857],[4.8618867279,43.4512976049],[4.8622038632,43.4514784388],[4.8620957878,43.4518411636],[4.860972882,43.4537446909],[4.860972882,43.453750611],[4.8609693896,43.453750611],[4.8608322494,43.453983079],[4.860694886,43.4539533086],[4.860694886,43.454029084],[4.859028816,43.454029084],[4.859028816,43.453750611],[4.858472824,43.453750611],[4.858472824,43.453472138],[4.857637883,43.453472138],[4.857637883,43.453193665],[4.857081889,43.453193665],[4.857081889,43.452915192],[4.856527806,43.452915192],[4.856527806,43.4527057775],[4.8563134454,43.4526405343],[4.855971812,43.452640534],[4.855971812,43.4525365531],[4.8539144844,43.4519103439],[4.8532209055,43.4516999278],[4.8517372977,43.4512481693],[4.850972175,43.451248169],[4.850972175,43.451526642],[4.850140094,43.451526642],[4.850138187,43.451805115],[4.849306107,43.451805115],[4.849306107,43.451248169],[4.849584103,43.451248169],[4.849584103,43.450973511],[4.849862098,43.450973511],[4.849862098,43.450695038],[4.8503182203,43.4506950382],[4.850416184,43.4505460375],[4.850416184,43.450416565],[4.8505013079,43.4504165651],[4.85208416,43.4480089507],[4.85208416,43.447917938],[4.8521439921,43.4479179381],[4.852362156,43.4475860791],[4.852362156,43.447360992],[4.8525101265,43.4473609921],[4.852637768,43.4471668272],[4.852637768,43.446804048],[4.8528762519,43.446804048],[4.852915764,43.4467439421],[4.852915764,43.446529388],[4.8530568057,43.4465293881],[4.853194237,43.4463203245],[4.853194237,43.446250915],[4.8532398642,43.446250915],[4.853559549,43.4457645958],[4.8538625179,43.4456226259],[4.856527806,43.4435575312],[4.856527806,43.443473817],[4.8566358448,43.4434738171],[4.856803894,43.4433436031],[4.856803894,43.443195344],[4.8569952301,43.4431953441],[4.8581702355,43.4422848538],[4.858472824,43.4419644217],[4.858472824,43.441806794],[4.8586216723,43.4418067943],[4.8591255755,43.4412731629],[4.859303951,43.4409828334],[4.859303951,43.440692902],[4.8594820799,43.4406929021],[4.859582901,43.4405287994],[4.859582901,43.440139771],[4.8598219089,43.440139771],[4.859860897,43.4400763104],[4.859860897,43.439861298],[4.8599929927,43.4398612981],[4.860138893,43.4396238138],[4.860138893,43.439582825],[4.8601640747,43.439582825],[4.860416888,43.4391713112],[4.860416888,43.438377381],[4.860416888,43.438194275],[4.860539914,43.438194275],[4.860694886,43.438194275],[4.860694886,43.437961579],[4.860694886,43.437637329],[4.860913754,43.437637329],[4.860972882,43.437549592],[4.860972882,43.436805725],[4.861250877,43.436805725],[4.861250877,43.436527252],[4.861528873,43.436527252],[4.861528873,43.435974121],[4.861804963,43.435970306],[4.861804963,43.435138702],[4.862082959,43.435138702],[4.862082959,43.434860231],[4.862360954,43.434860231],[4.862360954,43.434581758],[4.86296606,43.434581758],[4.8632667444,43.4345817583],[4.863472939,43.4342469118],[4.863472939,43.434028627],[4.8636073548,43.4340286271],[4.863750934,43.4337954594],[4.863750934,43.43341446],[4.863750934,43.433193208],[4.863898276,43.433193208],[4.86402893,43.433193208],[4.86402893,43.432998658],[4.86402893,43.432640077],[4.864269734,43.432640077],[4.86430502,43.432361604],[4.864456655,43.432361604],[4.864583016,43.432361604],[4.864583016,43.432174683],[4.864583016,43.431804658],[4.86483097,43.431804658],[4.864861011,43.430973054],[4.865139007,43.430973054],[4.865139007,43.430694581],[4.865417005,43.430694581],[4.865417005,43.430137635],[4.865695,43.430137635],[4.865695,43.429862977],[4.865971088,43.429862977],[4.865971088,43.429306031],[4.866249084,43.429306031],[4.866249084,43.428470612],[4.86652708,43.428470612],[4.86652708,43.427917481],[4.866805077,43.427917481],[4.866805077,43.427639008],[4.867083073,43.427639008],[4.867083073,43.427360535],[4.867361068,43.427360535],[4.867361068,43.427082062],[4.867639064,43.427082062],[4.867639064,43.426528931],[4.867917062,43.426528931],[4.867917062,43.425971985],[4.868195057,43.425971985],[4.868195057,43.425415038],[4.868471145,43.425415038],[4.868471145,43.425140381],[4.868749141,43.425140381],[4.868749141,43.424583435],[4.869027139,43.424583435],[4.869027139,43.42402649],[4.869305134,43.42402649],[4.869305134,43.423751831],[4.86958313,43.423751831],[4.86958313,43.423194885],[4.869861126,43.423194885],[4.869861126,43.422916413],[4.870139121,43.422916413],[4.870139121,43.422359467],[4.870418072,43.422359467],[4.870418072,43.421806336],[4.870696067,43.421806336],[4.870696067,43.42124939],[4.870971203,43.42124939],[4.870971203,43.420970917],[4.871249198,43.420970917],[4.871249198,43.420417786],[4.871527196,43.420417786],[4.871527196,43.420139313],[4.87208414,43.420139313],[4.87208414,43.41986084],[4.872362138,43.41986084],[4.872362138,43.419582367],[4.8725605592,43.4195823673],[4.8731188662,43.4187189327],[4.8739239379,43.4173965514],[4.874028206,43.4171841739],[4.874028206,43.415973663],[4.874306201,43.415973663],[4.874306201,43.41569519],[4.874584197,43.41569519],[4.874584197,43.415416717],[4.874862195,43.415416717],[4.874862195,43.414028167],[4.87514019,43.414028167],[4.87514019,43.413749694],[4.875415801,43.413749694],[4.875415801,43.413192748],[4.875987672,43.4131927487],[4.87624979,43.4126587716],[4.87624979,43.412639617],[4.8762591925,43.412639617],[4.876527786,43.4120924371],[4.876527786,43.4118042],[4.8766692704,43.4118042001],[4.876805783,43.4115260889],[4.876805783,43.411251069],[4.8769407768,43.4112510691],[4.877083779,43.4109597311],[4.877083779,43.4104431425],[4.8769977753,43.4104156501],[4.876805783,43.41041565],[4.876805783,43.4103542764],[4.8761266544,43.4101371775],[4.875971794,43.410137177],[4.875971794,43.410087672],[4.8752674956,43.4098625194],[4.87514019,43.409862519],[4.87514019,43.4098218212],[4.8743964396,43.4095840484],[4.87368822,43.409584046],[4.873472215,43.409584046],[4.873472215,43.409446717],[4.873472215,43.409305573],[4.87325573,43.409305573],[4.872362138,43.409305573],[4.872362138,43.4090271],[4.87208414,43.4090271],[4.87208414,43.4088447744],[4.8717834271,43.4087486274],[4.871527196,43.408748627],[4.871527196,43.4085934887],[4.8713844049,43.4084739691],[4.871249198,43.408473969],[4.871249198,43.408360797],[4.871051714,43.4081954961],[4.870971203,43.408195496],[4.870971203,43.4081281052],[4.8707190275,43.407917023],[4.870696067,43.407917023],[4.870696067,43.407897804],[4.8703968922,43.4076473784],[4.870139121,43.40763855],[4.870139121,43.4074316075],[4.8700536676,43.4073600771],[4.869861126,43.407360077],[4.869861126,43.4071989055],[4.8697480253,43.4071042313],[4.86958313,43.407081604],[4.86958313,43.4069662001],[4.8693928826,43.4068069461],[4.869305134,43.406806946],[4.869305134,43.4067334922],[4.869060218,43.4065284731],[4.868941785,43.406528473],[4.868749141,43.406528473],[4.868749141,43.406402588],[4.868749141,43.4062680679],[4.8687275575,43.40625],[4.868471145,43.40625],[4.868471145,43.4060353523],[4.8683949016,43.4059715271],[4.868195057,43.405971527],[4.868195057,43.4058042314],[4.8680622502,43.4056930543],[4.867639064,43.405693054],[4.867639064,43.405418396],[4.867361068,43.405418396],[4.867361068,43.405139923],[4.867083073,43.405139923],[4.867083073,43.4048733334],[4.8670688783,43.40486145],[4.866805077,43.40486145],[4.866805077,43.4046763425],[4.8659683198,43.4046428516],[4.865958213,43.40486145],[4.8655777355,43.4048614503],[4.865417005,43.4050267407],[4.865417005,43.405139923],[4.8653069443,43.4051399231],[4.865139007,43.4053126227],[4.865139007,43.405418396],[4.8650361496,43.4054183962],[4.8642537317,43.4062229811],[4.859028816,43.4094781769],[4.859028816,43.409584046],[4.8588588689,43.4095840461],[4.8587500071,43.4096518616],[4.858747482,43.409862519],[4.858472824,43.409862519],[4.858472824,43.410053253],[4.858472824,43.410137177],[4.858351231,43.410137177],[4.858194829,43.410137177],[4.858194829,43.410243988],[4.858194829,43.41041565],[4.857949735,43.41041565],[4.8575238949,43.4104156503],[4.857359887,43.4105178141],[4.857359887,43.410823822],[4.857359887,43.410972596],[4.85714674,43.410972596],[4.8566297939,43.4109725962],[4.856527806,43.4110361246],[4.856527806,43.411251069],[4.8561827317,43.4112510698],[4.855693817,43.411555608],[4.855693817,43.4118042],[4.855415821,43.4118042],[4.855415821,43.412082673],[4.8548476296,43.4120826737],[4.854584217,43.4122467425],[4.854584217,43.412361144],[4.8544005438,43.4123611441],[4.854306222,43.4124198924],[4.854306222,43.412639617],[4.8539534454,43.4126396178],[4.853194237,43.4131124779],[4.853194237,43.413192748],[4.8530653556,43.4131927483],[4.8526400493,43.4134576362],[4.852637768,43.4134642824],[4.852637768,43.413471221],[4.8526353863,43.413471221],[4.8519403019,43.4154961611],[4.8500497516,43.417129382],[4.8478644064,43.4178128132],[4.8460656325,43.4178101924],[4.842236872,43.4202232054],[4.830315399,43.4277369485],[4.830138207,43.4278152323],[4.830138207,43.427917481],[4.8299067696,43.427917481],[4.829860211,43.4279380505],[4.829860211,43.428749085],[4.829582213,43.428749085],[4.829582213,43.429306031],[4.828750134,43.429306031],[4.828750134,43.428749085],[4.828472138,43.428749085],[4.828472138,43.4277403066],[4.828401096,43.4276828874],[4.827676196,43.4270820641],[4.826806068,43.427082062],[4.826806068,43.426807404],[4.826340676,43.426807404],[4.825972081,43.426807404],[4.825972081,43.426528931],[4.825416088,43.426528931],[4.825416088,43.426250458],[4.825138092,43.426250458],[4.825138092,43.425971985],[4.824862004,43.425971985],[4.824862004,43.425693512],[4.824584007,43.425693512],[4.824584007,43.425140381],[4.824306011,43.425140381],[4.824306011,43.424625396],[4.824584007,43.424583435],[4.824584007,43.4245189534],[4.8244333766,43.4243940881],[4.8243661658,43.4242602365],[4.824862004,43.4239900199],[4.824862004,43.423473358],[4.825694084,43.423473358],[4.825694084,43.423194885],[4.8262199553,43.4231948851],[4.826250077,43.4231771423],[4.826250077,43.422916413],[4.8266927104,43.4229164132],[4.826806068,43.4228496403],[4.826806068,43.422359467],[4.827638149,43.422359467],[4.827638149,43.421806336],[4.828194141,43.421806336],[4.828194141,43.421527863],[4.828472138,43.421527863],[4.828472138,43.42124939],[4.828750134,43.42124939],[4.828750134,43.420970917],[4.82902813,43.420970917],[4.82902813,43.42124939],[4.829306125,43.42124939],[4.829306125,43.420970917],[4.829860211,43.420970917],[4.829860211,43.420696259],[4.830138207,43.420696259],[4.830138207,43.420417786],[4.8309342105,43.4204177882],[4.831807137,43.419903509],[4.831807137,43.41986084],[4.8318795611,43.4198608401],[4.832081795,43.4197416926],[4.832081795,43.419029236],[4.832361221,43.419029236],[4.832361221,43.418750763],[4.832917214,43.418750763],[4.832917214,43.41847229],[4.83319521,43.41847229],[4.83319521,43.418193817],[4.833473205,43.418193817],[4.833473205,43.417915344],[4.833751201,43.417915344],[4.833751201,43.417640686],[4.834029197,43.417640686],[4.834029197,43.417362213],[4.834582805,43.417362213],[4.834582805,43.41708374],[4.835138798,43.41708374],[4.835138798,43.416805267],[4.83569479,43.416805267],[4.83569479,43.416526794],[4.836248875,43.416526794],[4.836248875,43.416248321],[4.836804867,43.416248321],[4.836804867,43.415973663],[4.837082862,43.415973663],[4.837082862,43.41569519],[4.837638856,43.41569519],[4.837638856,43.415416717],[4.838194847,43.415416717],[4.838194847,43.415138244],[4.838472842,43.415138244],[4.838472842,43.414859771],[4.839026928,43.414859771],[4.839026928,43.414585113],[4.839304924,43.414585113],[4.839304924,43.41430664],[4.839582919,43.41430664],[4.839582919,43.414028167],[4.840416908,43.414028167],[4.840416908,43.413749694],[4.8409729,43.413749694],[4.8409729,43.413471221],[4.841804981,43.413471221],[4.841804981,43.413192748],[4.8425244545,43.4131927484],[4.84263897,43.4131176773],[4.84263897,43.41291809],[4.8429434224,43.4129180907],[4.850138187,43.4082008541],[4.850138187,43.408195496],[4.8501463581,43.408195496],[4.850972175,43.4076539713],[4.850972175,43.40763855],[4.8509956917,43.4076385501],[4.858194829,43.4029170634],[4.858194829,43.402915954],[4.8581965204,43.402915954],[4.859028816,43.402370021],[4.859028816,43.402362823],[4.8590397894,43.402362823],[4.859303951,43.4021895462],[4.859303951,43.401805877],[4.859028816,43.401805877],[4.859028816,43.401527404],[4.85875082,43.401527404],[4.85875082,43.401248931],[4.858472824,43.401248931],[4.858472824,43.4009583771],[4.856423755,43.4004902473],[4.855501179,43.3997420608],[4.85401829,43.3986858051],[4.8532738955,43.3984870773],[4.8497499266,43.3999277579],[4.8451020266,43.4020021],[4.8445219052,43.402385435],[4.8433886181,43.4030310525],[4.84263897,43.4034538509],[4.84263897,43.4034729],[4.8426051941,43.4034729001],[4.841804981,43.4039242039],[4.841804981,43.404026031],[4.8416244266,43.4040260311],[4.8416101406,43.404034088],[4.8416087173,43.4040260311],[4.841526985,43.404026031],[4.841526985,43.404304504],[4.840416908,43.404304504],[4.840416908,43.40486145],[4.840138913,43.40486145],[4.840138913,43.405139923],[4.839582919,43.405139923],[4.839582919,43.405418396],[4.838129,43.405418],[4.8376427528,43.405418],[4.835451665,43.4064423513],[4.831844225,43.4082753055],[4.8271592932,43.411051403],[4.8255252657,43.4120328365],[4.8242604023,43.4136415453],[4.8189973786,43.4185795486],[4.8146432094,43.419088133],[4.8168970322,43.4229846536],[4.8174931066,43.423915037],[4.8185965505,43.4255847096],[4.8263569766,43.4326802951],[4.8313054912,43.436460925],[4.8325418368,43.4373201231],[4.8345360922,43.439483936],[4.8351636278,43.4401860326],[4.8372143524,43.4426809132],[4.8409736517,43.4478464773],[4.8412732772,43.451804601],[4.8391279645,43.4523935781],[4.8366371821,43.4533060372],[4.8297551123,43.4559737082],[4.8294614555,43.4562954353],[4.8292669071,43.4603546357],[4.8372474705,43.4622021672],[4.8381375429,43.462566842],[4.8525971089,43.4656593745],[4.8543235966,43.4663623921],[4.8556413081,43.4673765578],[4.8621240249,43.4743847442],[4.8652647172,43.478214875],[4.8686129197,43.4824085324],[4.8714184994,43.4879532923],[4.8723440617,43.4897678048],[4.8738625736,43.4926304077],[4.8763928404,43.494520648],[4.8766469861,43.4946944405],[4.881547794,43.4979600466],[4.8829257794,43.4983996072],[4.8995427296,43.5037210855],[4.9155972964,43.5088061339],[4.9173345146,43.508989633],[4.9286709458,43.5106525],[4.9307042726,43.5090467692],[4.9331569757,43.5070096383],[4.935357058,43.5051128559],[4.939825446,43.5012288396],[4.941610883,43.499477042],[4.9434175686,43.4976987353],[4.9528257133,43.4883158234],[4.9584318726,43.4810770696],[4.9610670414,43.4770974909],[4.9655125405,43.4737780146],[4.9676061319,43.4737841326],[4.9754587507,43.4739086059],[4.9759012893,43.4741282318],[4.9761118484,43.4739264012],[4.9770540391,43.4720372943],[4.9795916792,43.46477148],[4.9769552935,43.4573418543],[4.9805150174,43.4457691725],[4.9807502282,43.4454975884],[4.9808248838,43.445298235],[4.981205659,43.4450572867],[4.9811926627,43.44478754],[4.980090316,43.4349389027],[4.9778230695,43.4298047725],[4.9750777691,43.4235013286],[4.9745539637,43.4229529213],[4.973860323,43.422384209],[4.9722177805,43.4218669729],[4.9703592884,43.4244170037],[4.9699971613,43.4248753561],[4.9692211216,43.4254339262],[4.968750954,43.425641327],[4.968750954,43.425693512]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000008849","CODE_COM":"211","INSEE_COM":"13211","NOM_COM":"MARSEILLE-11E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":898326.0,"Y_CHF_LIEU":6247347.0,"X_CENTROID":901660.0,"Y_CENTROID":6247180.0,"Z_MOYEN":154.0,"SUPERFICIE":"3350","POPULATION":"56544","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.518417083,43.2880100396],[5.5177731106,43.288103348],[5.5146345872,43.2883168349],[5.5126542346,43.2878534952],[5.5052506705,43.2831662511],[5.5046838335,43.28143248],[5.5052703331,43.2768414588],[5.5058112086,43.2749164096],[5.5060860188,43.2743241338],[5.5100699222,43.2695804357],[5.5133589496,43.2679541592],[5.5144448048,43.2676903884],[5.5146558694,43.2672489752],[5.5130526963,43.263440595],[5.5118108884,43.2633452811],[5.51084085,43.2634389348],[5.5084037694,43.2638933577],[5.5041493723,43.2657479639],[5.4988915477,43.2677012162],[5.4961399893,43.2684650301],[5.4922520782,43.2673875123],[5.49001097,43.2662260098],[5.4863880969,43.2639766951],[5.4856671871,43.2635081948],[5.4848753575,43.2623078335],[5.4850679465,43.2606609302],[5.4859093876,43.2589549968],[5.4861759766,43.2577689826],[5.4837019175,43.2555894539],[5.483234798,43.2552357037],[5.4824824282,43.2549200083],[5.4800859741,43.2544251815],[5.4778688258,43.2540332859],[5.4739849529,43.2535355445],[5.4729928969,43.2534574693],[5.4724493613,43.2534447152],[5.4706780095,43.2536850487],[5.4649815818,43.2543057046],[5.4624485005,43.2542689948],[5.4594773249,43.2548154849],[5.4522386946,43.2567881293],[5.4522390628,43.2574630985],[5.4537471804,43.2578329324],[5.4569346969,43.2588053352],[5.4593265496,43.2599730625],[5.4582969203,43.2627720261],[5.4560857145,43.2640273973],[5.4543206875,43.265206887],[5.4540853077,43.2654057299],[5.4539864036,43.265830966],[5.4538009326,43.2666820579],[5.4536232274,43.267513174],[5.454054121,43.2706650124],[5.4533344556,43.2728854118],[5.4511240308,43.2741127631],[5.4465892229,43.2753684327],[5.4459566002,43.2757283501],[5.4444373312,43.276761715],[5.4436145996,43.2803685558],[5.4434309169,43.2818189841],[5.4417828845,43.2837147093],[5.4398876179,43.2849815029],[5.4355223635,43.2851726837],[5.429429,43.2858390471],[5.4270190729,43.2870037816],[5.4257585386,43.28893105],[5.4257970662,43.290139763],[5.4263406825,43.2899124622],[5.4328261645,43.2947039795],[5.4412937799,43.2954994186],[5.4418489169,43.2947587822],[5.442258571,43.2947144255],[5.4477626311,43.2964294892],[5.4483625272,43.2967155991],[5.4523207164,43.298898351],[5.4575754,43.3014240971],[5.4577506704,43.3014597117],[5.4606909828,43.3016925104],[5.4627617743,43.3014455435],[5.4674231625,43.3007461224],[5.4686986495,43.3001724919],[5.4697760328,43.2996924739],[5.4706840472,43.2996888203],[5.4736894762,43.2998027747],[5.4761543504,43.3000406329],[5.4766746032,43.3001322132],[5.4769640188,43.300357783],[5.4770628486,43.3005643201],[5.4765018141,43.3073263641],[5.4725781479,43.312075563],[5.4721422214,43.3124581397],[5.4715324928,43.3134728998],[5.4711774873,43.3145646358],[5.47316868,43.314865607],[5.4736240238,43.3149064899],[5.4743798501,43.3148549919],[5.4751016476,43.314728666],[5.4761745256,43.3145402931],[5.479689879,43.3141690081],[5.4894566847,43.3152801676],[5.5050541711,43.3177513535],[5.5125530605,43.3209326624],[5.5150075369,43.3215002187],[5.5218239703,43.321091226],[5.5222005392,43.3210482401],[5.5228128155,43.3207576422],[5.5227025149,43.3202372929],[5.525662636,43.3122568476],[5.5285530037,43.3048963044],[5.5324865692,43.2995327308],[5.5324977612,43.2992264588],[5.5322789027,43.2986483688],[5.5320775896,43.2982732738],[5.5286462118,43.2958110419],[5.5257282647,43.2942898372],[5.5253180975,43.2942931228],[5.5245904379,43.2941931216],[5.5228619362,43.293240765],[5.5214352099,43.291918634],[5.5185283097,43.2892026685],[5.518417083,43.2880100396]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000009025","CODE_COM":"084","INSEE_COM":"13084","NOM_COM":"LA ROQUE-D'ANTHERON","STATUT":"Commune simple","X_CHF_LIEU":886237.0,"Y_CHF_LIEU":6293367.0,"X_CENTROID":885925.0,"Y_CENTROID":6293837.0,"Z_MOYEN":192.0,"SUPERFICIE":"2544","POPULATION":"5425","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3144503706,43.7366697961],[5.3161509233,43.7359773471],[5.324013139,43.7305502177],[5.3247024522,43.7299910552],[5.3258537914,43.7292399747],[5.3259140626,43.7292378115],[5.325915813,43.729236603],[5.3259176557,43.7292355191],[5.3260318449,43.7291002352],[5.3271692828,43.7283134282],[5.3361813573,43.7223066854],[5.3388380184,43.7207039339],[5.341017535,43.7196992312],[5.3431466521,43.7189206269],[5.3436965564,43.7187701511],[5.3440094367,43.7185905687],[5.3478676555,43.7170904408],[5.3546082677,43.7145799046],[5.3668464565,43.7102723764],[5.370534661,43.7091892343],[5.3688856832,43.7073373512],[5.3679335861,43.7065505643],[5.3672118088,43.7067418138],[5.3555075597,43.7062405079],[5.35462612,43.7064126235],[5.3538904226,43.7065680759],[5.3506390343,43.7077447402],[5.3501010046,43.7085746684],[5.3462228991,43.7094226444],[5.3423630979,43.7098712859],[5.3323399053,43.7089387846],[5.3284846675,43.7085244225],[5.3233673083,43.7068837753],[5.3219119171,43.7063387003],[5.3146768135,43.7005550336],[5.3097928398,43.6956896713],[5.2998458164,43.6909834875],[5.2979692872,43.6905316325],[5.2966879071,43.6904731729],[5.2942421856,43.6899639545],[5.2860135088,43.6915486866],[5.2799970699,43.6942089935],[5.2777831617,43.6952860913],[5.2760998731,43.6966049991],[5.2755528125,43.6977938993],[5.275318142,43.6988826445],[5.2753799591,43.7020626532],[5.2744263466,43.7096694877],[5.269653301,43.7182112583],[5.2690323101,43.719422382],[5.2688744059,43.7198226653],[5.2685849335,43.7203796263],[5.263217573,43.7286283499],[5.26248572,43.7300875019],[5.2622702048,43.7309480822],[5.2623028922,43.7340054268],[5.2625956109,43.739965974],[5.2627823152,43.7414222476],[5.2629290891,43.7418684064],[5.2636894058,43.7433856757],[5.2641052004,43.7442286391],[5.2647796255,43.7440759797],[5.2721938485,43.7420400516],[5.2752691891,43.74128266],[5.2817585075,43.7405752189],[5.2863884463,43.7401351069],[5.2865176291,43.740123225],[5.3144503706,43.7366697961]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000009275","CODE_COM":"001","INSEE_COM":"13001","NOM_COM":"AIX-EN-PROVENCE","STATUT":"Sous-préfecture","X_CHF_LIEU":897741.0,"Y_CHF_LIEU":6272912.0,"X_CENTROID":891986.0,"Y_CENTROID":6269761.0,"Z_MOYEN":246.0,"SUPERFICIE":"18759","POPULATION":"141545","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4112618042,43.6226723542],[5.4114748877,43.6228773716],[5.4128671103,43.6234225929],[5.4134019272,43.6235871549],[5.4153912185,43.6230082363],[5.4168515529,43.622463552],[5.4185459848,43.6217407991],[5.4233197131,43.6213427756],[5.4292618027,43.6209427318],[5.4343817826,43.6206769095],[5.4386188119,43.6213281704],[5.4468139304,43.622591475],[5.4495850974,43.6205692809],[5.4537785786,43.6160861386],[5.4623282537,43.6146783266],[5.4637927523,43.6136395902],[5.4633372671,43.6120061356],[5.4634200223,43.6096925236],[5.464142743,43.6008496193],[5.4638684162,43.5975196954],[5.4639016732,43.5959579942],[5.4640197047,43.5916406665],[5.465011139,43.5866391859],[5.4638871672,43.5768454135],[5.4660456373,43.5743163941],[5.4686996899,43.5733540913],[5.4755449271,43.572943473],[5.4813573768,43.5725587312],[5.4844208466,43.5722240153],[5.4866991573,43.5709709988],[5.4884931879,43.5698298565],[5.4925715301,43.5672679678],[5.4939582924,43.566645592],[5.4933127886,43.5660923988],[5.4939701348,43.5646387935],[5.4956034864,43.5630556282],[5.4967964599,43.5627338326],[5.4974660819,43.562504183],[5.4980020762,43.56216238],[5.4985187069,43.561688692],[5.4984081498,43.5614238801],[5.4971728004,43.5593764704],[5.4955087824,43.5576881806],[5.4939074329,43.5561010507],[5.4918839498,43.5547099316],[5.4913112596,43.5539201151],[5.490663752,43.5526036064],[5.4891770186,43.5490576977],[5.4886103532,43.5474053634],[5.4890418263,43.5459677864],[5.4892594492,43.5454496939],[5.48802177,43.5442754419],[5.4865363242,43.54292232],[5.4824707273,43.5395623448],[5.4794299683,43.5360554992],[5.4792387725,43.5352380156],[5.4795484314,43.5344432937],[5.4798661791,43.5340939684],[5.4802834696,43.5339296014],[5.4828001799,43.5333589448],[5.4877384697,43.5335950925],[5.4908314285,43.5336465532],[5.4957873624,43.5330627747],[5.5034808468,43.5323274177],[5.5063004335,43.5322110102],[5.5062517178,43.5320303003],[5.5055359596,43.5306263579],[5.5039367918,43.5291068797],[5.4929364473,43.5261880213],[5.4875184278,43.5258299025],[5.4826765582,43.526463812],[5.4823277548,43.5271523166],[5.4814683621,43.5268470188],[5.4804763735,43.5264790345],[5.4792295792,43.5257964076],[5.4779961039,43.5249343315],[5.4772915908,43.5243752201],[5.476892413,43.5237533237],[5.4763717064,43.5226652183],[5.4764124113,43.5222034084],[5.4765866328,43.5206781656],[5.4766531751,43.5204714106],[5.4767841034,43.5203234961],[5.4781996816,43.5193306979],[5.4794687076,43.5134821968],[5.4795040648,43.512553331],[5.4788415388,43.5123335353],[5.4733433172,43.5112285528],[5.468958961,43.5099062151],[5.4644583758,43.5033610183],[5.4638065996,43.5022344502],[5.4637503041,43.5009215253],[5.4637929415,43.4998394897],[5.4653555942,43.4970936573],[5.4690384389,43.4897403597],[5.4691492221,43.4890096286],[5.4685480755,43.4890602232],[5.4680721741,43.4890620565],[5.4672982231,43.4886872144],[5.4668900617,43.4884525665],[5.4648055008,43.48720919],[5.4610302085,43.4830292484],[5.4578280478,43.4794626926],[5.4533413146,43.4769791825],[5.4485914386,43.4750406148],[5.4420368949,43.4729156949],[5.4417897012,43.4715188881],[5.4372536276,43.4714256598],[5.422182469,43.4710929314],[5.4095381015,43.4703882539],[5.4030940648,43.4695862176],[5.393427084,43.4648046068],[5.3885659636,43.463741737],[5.3875381005,43.4619030047],[5.3870200367,43.4623122555],[5.3848856417,43.4639425003],[5.3777983018,43.4686832737],[5.3743872752,43.4703557092],[5.3712980557,43.4715349477],[5.3698952227,43.4718023523],[5.3662908932,43.472631772],[5.3657008632,43.4727697635],[5.3649899884,43.4734252381],[5.3633465081,43.4755069823],[5.3625798655,43.4774534836],[5.3622198824,43.4780175838],[5.3609593353,43.4795571955],[5.3603127336,43.4800654253],[5.3596229097,43.480484583],[5.3583140025,43.4809991139],[5.3577608448,43.4811947644],[5.3488413968,43.4825296984],[5.3438252946,43.4834402399],[5.3408604457,43.4850947504],[5.3393856761,43.4873416966],[5.3359288332,43.488579143],[5.3336123027,43.4884922149],[5.3305267888,43.4874892819],[5.3219696127,43.4827737494],[5.3199280248,43.479232452],[5.3198941879,43.4776283424],[5.3199770512,43.4771702314],[5.3210193839,43.4751902577],[5.3227782291,43.4721643407],[5.324603064,43.4692773935],[5.3252675546,43.4683207661],[5.3277712079,43.4643814229],[5.3288260396,43.4626918352],[5.3293562232,43.4618091755],[5.329336551,43.461323562],[5.3287879944,43.4609897257],[5.3274033494,43.4602391144],[5.3188916128,43.4556548575],[5.3174283615,43.4549706136],[5.3139516794,43.4535283148],[5.3092972303,43.4518256997],[5.3084329674,43.4514390916],[5.3028753434,43.4481209582],[5.3023647638,43.4477411877],[5.3020413287,43.447469045],[5.3014377721,43.4465251157],[5.3010000126,43.4461122912],[5.2995786779,43.4473917337],[5.2989790741,43.4480290913],[5.2983413351,43.4495673033],[5.2979056427,43.456163117],[5.2961663019,43.459047756],[5.2939017034,43.4612216443],[5.2918686343,43.4625742387],[5.29090314,43.4632453923],[5.2903660985,43.4638777814],[5.28760765,43.4671600414],[5.2886629074,43.4693312045],[5.2902486963,43.4705784927],[5.2902209091,43.4721766873],[5.290177493,43.472669038],[5.290131994,43.4729850208],[5.2893374864,43.4754409725],[5.2871052574,43.4765249655],[5.2861182133,43.4761020556],[5.2855303868,43.476300764],[5.2823163593,43.4788706541],[5.2817407164,43.4800312523],[5.2814977571,43.4806988126],[5.2811763834,43.4817577504],[5.2812310156,43.4821688303],[5.2812130295,43.4827434501],[5.2810469698,43.4833868905],[5.280187949,43.4841988189],[5.2794547702,43.4848181807],[5.279138448,43.4850084444],[5.2757019822,43.4852579448],[5.2733971442,43.4832406543],[5.2717922586,43.4815407779],[5.2712140323,43.482516859],[5.2710662447,43.4840635614],[5.2711413294,43.4848063403],[5.2716540399,43.4856749606],[5.2718644126,43.486212391],[5.2719095379,43.4869161958],[5.2718667453,43.4875849406],[5.2714559955,43.489859912],[5.2713168484,43.4904055671],[5.2705261977,43.4921718571],[5.2700307101,43.4932740138],[5.2696133277,43.4944447393],[5.2695768711,43.4954625804],[5.2695534031,43.4977798521],[5.2695742876,43.4983086568],[5.2697010353,43.4985751253],[5.2748364427,43.4998068268],[5.2779994141,43.5012759585],[5.2815925545,43.5034848187],[5.2873958922,43.508989884],[5.2929037727,43.5178168631],[5.2931781358,43.5185860423],[5.2935792086,43.518997006],[5.2941617594,43.5195850491],[5.294559473,43.5189825759],[5.3041851339,43.5154436899],[5.3091621264,43.5160615281],[5.3137298042,43.5170776144],[5.3200498406,43.5175006854],[5.3250794777,43.5173623902],[5.3256271166,43.5174469613],[5.3279242244,43.5178198361],[5.3299255326,43.5181873154],[5.3370923939,43.5207208612],[5.339260748,43.5227866809],[5.3401080441,43.525791881],[5.3402606639,43.5262890515],[5.3411977348,43.5276397063],[5.3453260594,43.5334913131],[5.3483227975,43.5361592624],[5.3484960434,43.5363112339],[5.349201193,43.5366416164],[5.3491473361,43.5353250039],[5.355203617,43.5352630247],[5.3566210396,43.5352817556],[5.3576617007,43.5355561895],[5.3584679246,43.5358159068],[5.3579702896,43.5399682026],[5.3639819996,43.5401038407],[5.3700575545,43.5376480753],[5.3730654817,43.5414213983],[5.3773842696,43.5444170335],[5.3777806284,43.544784607],[5.3778913139,43.5454851892],[5.3780998699,43.5472340888],[5.3781010196,43.5475905187],[5.3763990556,43.5502130004],[5.3755295593,43.5512725976],[5.3745951355,43.5531869424],[5.3749536827,43.5538362009],[5.3758734956,43.5550978735],[5.379267879,43.5581893303],[5.3819726923,43.5609114657],[5.3825859765,43.5629530484],[5.3822361231,43.5647538271],[5.3774256846,43.5696264846],[5.3756684224,43.5714679576],[5.3711576468,43.5748998328],[5.3688916884,43.5759745696],[5.3656684502,43.5771970405],[5.362378536,43.578998763],[5.3620097887,43.5801175747],[5.3627257343,43.5815071404],[5.3633262366,43.5821673891],[5.3650701902,43.5831402959],[5.3658630312,43.583538898],[5.3665059203,43.5836041035],[5.3667892623,43.583538518],[5.3671625616,43.5833422482],[5.3673720151,43.5834366995],[5.3674691789,43.5838108473],[5.3672319563,43.5840338572],[5.3668862792,43.584239427],[5.3663751534,43.5842766708],[5.3655637381,43.5842088345],[5.3639901049,43.5840648715],[5.3635690351,43.5840938405],[5.3631532612,43.5842514152],[5.3611503912,43.5855930083],[5.3596453721,43.5871181816],[5.3583859412,43.5886244986],[5.3580983053,43.588917895],[5.3571788783,43.5891160861],[5.3534334952,43.5895888822],[5.3484134247,43.5897218552],[5.344982459,43.5901632543],[5.341532982,43.59163922],[5.3360273226,43.592504007],[5.3345,43.5928014917],[5.3382768537,43.5958275794],[5.3423106228,43.5987048855],[5.3445618711,43.5995096673],[5.3504011715,43.6002143205],[5.3591301289,43.6063631695],[5.3641888438,43.6148570555],[5.3674751024,43.6201217591],[5.3667306525,43.6218690251],[5.3653357241,43.6248510958],[5.3662789638,43.6248863717],[5.3703082264,43.6252918589],[5.3783905526,43.6256562754],[5.3849698076,43.6255732904],[5.3872369446,43.6252903596],[5.3892612476,43.6250091198],[5.3904521286,43.6246822653],[5.4086256516,43.622543579],[5.4089874316,43.6226012734],[5.410783479,43.6226721651],[5.4112618042,43.6226723542]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000009299","CODE_COM":"090","INSEE_COM":"13090","NOM_COM":"SAINT-ANTONIN-SUR-BAYON","STATUT":"Commune simple","X_CHF_LIEU":908860.0,"Y_CHF_LIEU":6272209.0,"X_CENTROID":910058.0,"Y_CENTROID":6272523.0,"Z_MOYEN":476.0,"SUPERFICIE":"1758","POPULATION":"128","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5620522446,43.5042614621],[5.5618699017,43.5044710103],[5.5609418562,43.5048476004],[5.5601355693,43.5051537946],[5.558115592,43.5076715489],[5.5566852841,43.5107703851],[5.5562866153,43.5124289117],[5.5562532669,43.5129581036],[5.5561640043,43.5144545079],[5.5561640057,43.5149271032],[5.5572947364,43.5195994078],[5.5585281791,43.5236850758],[5.5651285487,43.5275449561],[5.5702368476,43.5363351079],[5.5704374564,43.5367255437],[5.5707996765,43.5365522252],[5.5712802108,43.5363130875],[5.5717082782,43.5360076762],[5.5721759402,43.5355365877],[5.5735402021,43.5339504899],[5.5747995672,43.5320409922],[5.5752751154,43.5317470424],[5.5763683863,43.5314879341],[5.5841552656,43.5304304414],[5.5878944721,43.5299407205],[5.5905119443,43.5297090129],[5.6014647709,43.5300518631],[5.6086743543,43.530516092],[5.6156750197,43.5317419625],[5.6180552863,43.5318708936],[5.6185373887,43.5316711135],[5.6187254448,43.5311552518],[5.6199216488,43.5278135803],[5.6220499783,43.5258420027],[5.623246337,43.5248669546],[5.6248389568,43.5243612188],[5.6256448213,43.5242363912],[5.6261658273,43.5242129766],[5.6269031354,43.5241852218],[5.6279647882,43.5242432273],[5.6314646343,43.5240530579],[5.6342085179,43.5235111464],[5.6349547843,43.5233552884],[5.6355536166,43.5231408924],[5.6362494008,43.5228287138],[5.6367842812,43.5224880343],[5.6374829285,43.5217535763],[5.63780665,43.5210714424],[5.6380302315,43.5203908429],[5.6378603733,43.5194128386],[5.636582517,43.5159096686],[5.6340955853,43.5135224214],[5.6319918401,43.5122591895],[5.6299127704,43.5111546586],[5.6287176527,43.5106885193],[5.6282393704,43.5103724361],[5.6274482989,43.5096264297],[5.6251564206,43.5081371817],[5.6239961016,43.5074829094],[5.6210075996,43.5062264821],[5.6180090401,43.5050449361],[5.6135368977,43.5039546484],[5.602303781,43.5023677014],[5.6007601497,43.5021157735],[5.6000853111,43.5021787666],[5.5965712515,43.5020262191],[5.5816214074,43.501916871],[5.5704491685,43.502184077],[5.5688738264,43.5022979229],[5.5679322484,43.5023976398],[5.5657899503,43.5026373874],[5.5643533144,43.5030332413],[5.5634611423,43.5034369106],[5.5623196423,43.504101214],[5.5620522446,43.5042614621]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000009364","CODE_COM":"099","INSEE_COM":"13099","NOM_COM":"SAINT-PAUL-LES-DURANCE","STATUT":"Commune simple","X_CHF_LIEU":918332.0,"Y_CHF_LIEU":6291273.0,"X_CENTROID":922842.0,"Y_CENTROID":6291889.0,"Z_MOYEN":324.0,"SUPERFICIE":"4587","POPULATION":"937","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6828407763,43.6928238625],[5.6864893798,43.6921944918],[5.7010427861,43.6904565695],[5.7052262695,43.6899222427],[5.7086424531,43.6898246243],[5.710202997,43.690000937],[5.7115259101,43.690373125],[5.7141246226,43.6913266112],[5.7152757255,43.6919209272],[5.7161828206,43.6925762465],[5.7173547125,43.6935292642],[5.7188791961,43.695191042],[5.7222317282,43.6996477048],[5.728477846,43.7068931249],[5.7303804627,43.7090260869],[5.73062589,43.7092868422],[5.737882613,43.716556549],[5.7411128319,43.7182089505],[5.7413635941,43.7183020088],[5.7435605941,43.7187364497],[5.7449382445,43.7189628201],[5.7474584623,43.7196123254],[5.7482873065,43.7199911668],[5.7497060392,43.7208908273],[5.7526592348,43.7235965598],[5.753640793,43.7246157716],[5.7536473947,43.7246191469],[5.7567744805,43.7240263291],[5.7669205453,43.7226181605],[5.7677160316,43.7225087949],[5.7788150789,43.7184155027],[5.783936482,43.7146172795],[5.7835480056,43.7097885059],[5.7832509438,43.7092027835],[5.782192688,43.7068888388],[5.7822752013,43.7062114384],[5.7831876764,43.7036625165],[5.7839137108,43.7023347803],[5.7872665169,43.698090055],[5.7893436276,43.6958416801],[5.7917832368,43.6934471038],[5.7924885368,43.6927951303],[5.7928455221,43.6925581684],[5.7936396099,43.6923531989],[5.7968912167,43.6926180906],[5.8033655387,43.691642882],[5.8091536591,43.6901654828],[5.8097048255,43.6898415134],[5.8129458011,43.6891076658],[5.8132414299,43.689054827],[5.813248634,43.689052582],[5.804581643,43.68057251],[5.8030676054,43.6747595943],[5.8011497267,43.6713792902],[5.7990586793,43.660518854],[5.7992074571,43.6599338146],[5.7992066245,43.6599306162],[5.7987876057,43.660123369],[5.7978194917,43.6605138358],[5.7959104875,43.6607097057],[5.7934961846,43.6607420548],[5.777197294,43.6606050023],[5.772551704,43.6604130448],[5.770087719,43.660457612],[5.7692061358,43.6602746809],[5.7686441175,43.6602514272],[5.7507768372,43.6574538131],[5.744802151,43.6567819108],[5.741015212,43.6555683619],[5.7371941271,43.6543114293],[5.7320063162,43.6525480533],[5.7189775995,43.6498384178],[5.7187990481,43.6508710093],[5.7191423973,43.652802631],[5.7196512992,43.6549560963],[5.718927556,43.6576310795],[5.7176394526,43.6593640153],[5.7120188031,43.6663243925],[5.7079833939,43.6715550801],[5.70440243,43.6763898733],[5.702893266,43.6790032612],[5.7017556394,43.6804486627],[5.7000704909,43.6824127371],[5.6974323027,43.6834523668],[5.6952051311,43.6842116449],[5.691928976,43.684905909],[5.6889672654,43.6864593251],[5.6828750182,43.6913491414],[5.6826304277,43.6915577498],[5.6826542687,43.6920667539],[5.6828222587,43.6928252435],[5.6828407763,43.6928238625]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000009489","CODE_COM":"012","INSEE_COM":"30012","NOM_COM":"ARAMON","STATUT":"Commune simple","X_CHF_LIEU":835061.0,"Y_CHF_LIEU":6311672.0,"X_CENTROID":835266.0,"Y_CENTROID":6313063.0,"Z_MOYEN":43.0,"SUPERFICIE":"3123","POPULATION":"3933","CODE_ARR":"2","CODE_DEPT":"30","NOM_DEPT":"GARD","CODE_REG":"76","NOM_REG":"LANGUEDOC-ROUSSILLON-MIDI-PYRENEES"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6552051115,43.8735286542],[4.6544733169,43.8728946366],[4.6515941299,43.8707032487],[4.650481069,43.8698604746],[4.6496860715,43.8695178485],[4.6485959205,43.8691652741],[4.6460495383,43.8686213359],[4.6422925426,43.8676419065],[4.6419145399,43.8674765726],[4.6419133438,43.8674791228],[4.6552051115,43.8735286542]]],[[[4.662424088,43.870830535],[4.6653370033,43.8737965064],[4.665501412,43.8719977994],[4.6649341141,43.8716167022],[4.6637647465,43.8709414413],[4.6624214384,43.8708295941],[4.6624076502,43.8708761687],[4.662424088,43.870830535]]],[[[4.693608284,43.885219574],[4.7093177748,43.8980121341],[4.7093257818,43.898013869],[4.7092758837,43.8975114676],[4.7088027061,43.8967582499],[4.7081716203,43.8960939154],[4.7074943865,43.895550919],[4.6989903975,43.8889154161],[4.6972271723,43.8875485272],[4.696042334,43.8867118103],[4.694330209,43.8855943228],[4.6933272856,43.8849716879],[4.690546281,43.883898624],[4.6887814437,43.8833066493],[4.6868270854,43.8827013733],[4.6852480796,43.8822468919],[4.6819900845,43.8812334837],[4.693608284,43.885219574]]],[[[4.722586155,43.905982972],[4.7270890124,43.9096516748],[4.7267754324,43.9093080834],[4.725960615,43.9084262077],[4.7248549539,43.9072716729],[4.7233684642,43.9059557103],[4.7222181474,43.905215928],[4.7204402104,43.9043465009],[4.7170240076,43.9029825314],[4.7134911805,43.9017922178],[4.7084493405,43.9005074952],[4.7079675877,43.9003938054],[4.722586155,43.905982972]]],[[[4.735506057,43.916507721],[4.7355078866,43.9165116124],[4.7355084026,43.9165086683],[4.7351839833,43.9162005659],[4.734787117,43.9159222019],[4.735506057,43.916507721]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000009579","CODE_COM":"108","INSEE_COM":"13108","NOM_COM":"TARASCON","STATUT":"Commune simple","X_CHF_LIEU":833546.0,"Y_CHF_LIEU":6302084.0,"X_CENTROID":835508.0,"Y_CENTROID":6302245.0,"Z_MOYEN":13.0,"SUPERFICIE":"7432","POPULATION":"13941","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.628118038,43.757713317],[4.643325137,43.7748281772],[4.6434520258,43.774932343],[4.6461678771,43.7772810162],[4.6489534158,43.7797122804],[4.6512435848,43.7822751977],[4.6519426416,43.7840692428],[4.6529127541,43.7891795432],[4.6540140333,43.7975731474],[4.6547525632,43.8023107609],[4.6548263115,43.8064050175],[4.6543943703,43.8088324085],[4.654428958,43.809158325],[4.6542850429,43.8094467662],[4.6542351375,43.8097272012],[4.652276721,43.8168378849],[4.651632288,43.8181104738],[4.648393934,43.8221162741],[4.6475978747,43.8228461275],[4.6429722341,43.8321108712],[4.6429769681,43.8321195596],[4.6570188939,43.8410673748],[4.6574524633,43.8411348612],[4.6599017754,43.8417573934],[4.663113911,43.8428218974],[4.665014394,43.8437254162],[4.6659089575,43.8443355328],[4.6662999037,43.8447769154],[4.6667891499,43.8461151034],[4.6666783617,43.84722033],[4.6671793845,43.8474692055],[4.6675527935,43.8475643106],[4.6681081813,43.8475450183],[4.6688330681,43.8473674113],[4.6703988765,43.8471103182],[4.6726312186,43.8468501857],[4.6867134484,43.84497985],[4.6872507899,43.8449400362],[4.6916274996,43.844777741],[4.694096516,43.8448717421],[4.6968626821,43.8451716926],[4.6981609965,43.8453774184],[4.7041680303,43.8478778818],[4.7165751964,43.8519571417],[4.7211432913,43.8535071975],[4.7207692426,43.8589705725],[4.7209222116,43.8603318565],[4.7216784656,43.8611534472],[4.7227492834,43.8621743973],[4.7237026856,43.863013566],[4.7256254956,43.8643540779],[4.7267750066,43.8650929062],[4.7281692664,43.8657369339],[4.7286979598,43.8659400915],[4.7287830035,43.865543585],[4.7296095895,43.864490831],[4.730215398,43.8641184728],[4.733158799,43.8598069274],[4.734467306,43.8577104293],[4.7344070204,43.8568310588],[4.7364751862,43.8510427289],[4.7384764755,43.8480980403],[4.7393542116,43.8468193699],[4.7404498785,43.8448162146],[4.7415270148,43.842085144],[4.7417382552,43.8411816463],[4.7417284424,43.8394724672],[4.7417072045,43.837225199],[4.7415562884,43.8365984234],[4.7384078721,43.8294098907],[4.7363842813,43.8256238381],[4.7342608044,43.8223884182],[4.7320308482,43.8198567446],[4.7317189855,43.8195340579],[4.7306559993,43.8185455125],[4.7288602954,43.8178260094],[4.7188278933,43.817354547],[4.7155711587,43.8157865499],[4.7133644539,43.8134134745],[4.713026699,43.808778763],[4.7122928143,43.8033230994],[4.7119740992,43.8009383522],[4.7119435288,43.7960153224],[4.7085524961,43.7896553957],[4.7053977787,43.7861125653],[4.701732405,43.7815524408],[4.7011040403,43.7781770514],[4.7013469557,43.7749419784],[4.7022177695,43.77460975],[4.7033262641,43.7738750648],[4.7042060436,43.773260956],[4.7052235398,43.7716419995],[4.7054178102,43.7710755111],[4.7057580479,43.7699891938],[4.7071109241,43.7650445975],[4.7065633051,43.7589263943],[4.7070298656,43.7588308769],[4.7125241435,43.757849966],[4.7173470995,43.7570566761],[4.7263346653,43.7555167901],[4.7310003424,43.7547496854],[4.7329163996,43.7543411869],[4.7333911877,43.754150917],[4.7309326161,43.7521000495],[4.7296150506,43.7514792305],[4.7282156691,43.7506562789],[4.7262391647,43.7493870245],[4.7247421484,43.7477105143],[4.7222034972,43.7448353761],[4.720273842,43.7425113084],[4.7186727778,43.7399624118],[4.7152223679,43.7348081751],[4.7065078417,43.7328317766],[4.6960609862,43.7324819828],[4.6828899777,43.7296900988],[4.6797690259,43.7286114383],[4.6793633455,43.7292945306],[4.6788453123,43.7299982551],[4.6746307596,43.7336228421],[4.6666285702,43.7372126003],[4.653413892,43.7421761986],[4.6462640344,43.7438460999],[4.6428256953,43.7448169695],[4.6405975332,43.7464742412],[4.6416949493,43.7490678403],[4.6420497846,43.7501839511],[4.6420323312,43.7512633728],[4.6414355802,43.7537043024],[4.6394583483,43.7603197615],[4.6382147063,43.7602565668],[4.6357830845,43.7599483885],[4.6349623935,43.7596060889],[4.6341325498,43.7590299071],[4.6331611018,43.7580166176],[4.6326532381,43.7577128133],[4.6313425098,43.7575155392],[4.6298383032,43.7574570522],[4.6281160064,43.7577090928],[4.628118038,43.757713317]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000010029","CODE_COM":"115","INSEE_COM":"13115","NOM_COM":"VERNEGUES","STATUT":"Commune simple","X_CHF_LIEU":875088.0,"Y_CHF_LIEU":6289834.0,"X_CENTROID":876100.0,"Y_CENTROID":6290043.0,"Z_MOYEN":247.0,"SUPERFICIE":"1594","POPULATION":"1586","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2261496991,43.707010286],[5.2262707025,43.7069628013],[5.2267363908,43.7063654515],[5.2274369699,43.7052672895],[5.2286882122,43.7029831046],[5.2282083433,43.7027363795],[5.2225261959,43.6989512],[5.214450476,43.6930828783],[5.2118774002,43.6909604032],[5.212889077,43.6896921911],[5.2147777798,43.6884250217],[5.2175864208,43.6866025673],[5.2211170904,43.6844034299],[5.2225898011,43.6840285835],[5.2237906774,43.6838411092],[5.2247907767,43.6826360332],[5.2227624431,43.6789832033],[5.2223515071,43.678589225],[5.2215214045,43.6780363762],[5.2205663057,43.6775220802],[5.219484211,43.6769626592],[5.2110549234,43.6757588912],[5.2063776082,43.6746521603],[5.1981223956,43.6701457002],[5.1951218453,43.6670179617],[5.191082305,43.6640137105],[5.1866034754,43.6618985017],[5.1848305517,43.6617397068],[5.1830051045,43.6614712198],[5.1823699407,43.6612670343],[5.181323288,43.6617183048],[5.181302886,43.6620292641],[5.1813307604,43.6640972401],[5.1813089344,43.6644685383],[5.1810676095,43.6649369543],[5.1808435039,43.6653366134],[5.1778036568,43.669365383],[5.1758230214,43.6712530324],[5.1720591714,43.6722311167],[5.1648680669,43.6740136624],[5.1560631368,43.6763921204],[5.1544007112,43.6772351928],[5.1508795651,43.6806012142],[5.1502945493,43.6833879354],[5.1497409052,43.6889293986],[5.1501250849,43.6901424124],[5.1505046103,43.6901736174],[5.1609994062,43.6950101386],[5.1627902751,43.6958162025],[5.167885179,43.6969534275],[5.1700378287,43.6971526589],[5.1733833062,43.6971695989],[5.1776412751,43.6971042652],[5.1788327576,43.6964962046],[5.1859485069,43.6954713111],[5.1902764094,43.6954535845],[5.195054782,43.6968632697],[5.1949715585,43.6989650476],[5.1947647597,43.699979212],[5.1941622954,43.7014505421],[5.1956413575,43.7014846193],[5.1966299892,43.7002161254],[5.1980447783,43.6997077622],[5.2001990966,43.6989431822],[5.2044493268,43.6975771066],[5.2082396123,43.6972869049],[5.208916739,43.6972794613],[5.2098457892,43.6979168238],[5.2111708925,43.6988818969],[5.2157072088,43.7025442623],[5.2199899041,43.7057309355],[5.2261496991,43.707010286]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000010030","CODE_COM":"037","INSEE_COM":"13037","NOM_COM":"LA FARE-LES-OLIVIERS","STATUT":"Commune simple","X_CHF_LIEU":877401.0,"Y_CHF_LIEU":6274980.0,"X_CENTROID":878152.0,"Y_CENTROID":6275514.0,"Z_MOYEN":102.0,"SUPERFICIE":"1421","POPULATION":"7980","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1767911254,43.5397889358],[5.177054617,43.5478491832],[5.1770064955,43.5533361052],[5.1768768847,43.55595613],[5.1768541228,43.5592400759],[5.1768637853,43.5621714468],[5.1804516353,43.5659085996],[5.1809716711,43.5664337049],[5.1835876195,43.5680381827],[5.1878610613,43.5694093941],[5.1945555358,43.5709592578],[5.2037841233,43.5722079852],[5.2085777167,43.5723401077],[5.2141731398,43.5717553924],[5.2167393045,43.5699883388],[5.2186914667,43.5690258606],[5.2229945189,43.5672051458],[5.2256379604,43.5665812228],[5.2261820473,43.5665025598],[5.2269142323,43.5646675407],[5.2300496049,43.5584213016],[5.2322897744,43.5529449787],[5.2332117481,43.5492536329],[5.2335727471,43.5473677133],[5.2326720189,43.5472440325],[5.2234477666,43.5473325917],[5.2183119419,43.542261302],[5.2064566438,43.5399332682],[5.202111791,43.5367839539],[5.2015024476,43.5353796025],[5.201576488,43.5351809843],[5.1991155511,43.5349176623],[5.1896391416,43.5382361484],[5.1874853885,43.5393479702],[5.1767911254,43.5397889358]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000010140","CODE_COM":"032","INSEE_COM":"30032","NOM_COM":"BEAUCAIRE","STATUT":"Commune simple","X_CHF_LIEU":832249.0,"Y_CHF_LIEU":6302302.0,"X_CENTROID":828084.0,"Y_CENTROID":6300112.0,"Z_MOYEN":13.0,"SUPERFICIE":"8644","POPULATION":"16036","CODE_ARR":"2","CODE_DEPT":"30","NOM_DEPT":"GARD","CODE_REG":"76","NOM_REG":"LANGUEDOC-ROUSSILLON-MIDI-PYRENEES"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6281035415,43.7576831752],[4.6276851912,43.7563695863],[4.6272505425,43.7544904798],[4.6256674841,43.749074243],[4.6238552137,43.7453265005],[4.622717119,43.7432373696],[4.6197452942,43.738902027],[4.6176940066,43.7360307109],[4.6281035415,43.7576831752]]],[[[4.651798248,43.784358978],[4.6543943703,43.8088324085],[4.6548263115,43.8064050175],[4.6547525632,43.8023107609],[4.6540140333,43.7975731474],[4.6529127541,43.7891795432],[4.6519426416,43.7840692428],[4.6512435848,43.7822751977],[4.6489534158,43.7797122804],[4.6461678771,43.7772810162],[4.6434520258,43.774932343],[4.643325137,43.7748281772],[4.651798248,43.784358978]]],[[[4.6475978747,43.8228461275],[4.648393934,43.8221162741],[4.651632288,43.8181104738],[4.652276721,43.8168378849],[4.6542351375,43.8097272012],[4.6542850429,43.8094467662],[4.6475978747,43.8228461275]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000010230","CODE_COM":"095","INSEE_COM":"84095","NOM_COM":"PUYVERT","STATUT":"Commune simple","X_CHF_LIEU":888699.0,"Y_CHF_LIEU":6298360.0,"X_CENTROID":888353.0,"Y_CENTROID":6298005.0,"Z_MOYEN":208.0,"SUPERFICIE":"1001","POPULATION":"793","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.343698979,43.718772888],[5.3436990223,43.7187728726],[5.3436965564,43.7187701511],[5.3431466521,43.7189206269],[5.341017535,43.7196992312],[5.3388380184,43.7207039339],[5.3361813573,43.7223066854],[5.3271692828,43.7283134282],[5.3260318449,43.7291002352],[5.3259176557,43.7292355191],[5.343698979,43.718772888]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000010377","CODE_COM":"058","INSEE_COM":"13058","NOM_COM":"MAUSSANE-LES-ALPILLES","STATUT":"Commune simple","X_CHF_LIEU":845388.0,"Y_CHF_LIEU":6293066.0,"X_CENTROID":847800.0,"Y_CENTROID":6292932.0,"Z_MOYEN":85.0,"SUPERFICIE":"3164","POPULATION":"2222","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.797425459,43.7301969062],[4.7983336274,43.7305788425],[4.7986302405,43.7305379397],[4.8069564431,43.7291597622],[4.8127246552,43.7292078856],[4.8178415,43.7290685638],[4.8269266161,43.7290496999],[4.8320003741,43.7292326651],[4.8397126007,43.7320287977],[4.8406117812,43.7326616635],[4.8413384673,43.7332182321],[4.8423266531,43.7342627208],[4.8425241356,43.7351531684],[4.8425705864,43.7356321305],[4.8423556746,43.7399472065],[4.8406995638,43.741645787],[4.838485423,43.7432133505],[4.8366187139,43.7436174888],[4.8346284284,43.7444665226],[4.8325283956,43.7462327618],[4.8317997934,43.7490713171],[4.8321361691,43.7523258084],[4.83246956,43.7526550359],[4.8325357622,43.7532488867],[4.8328264625,43.7532529962],[4.8435826219,43.7531029622],[4.8445891588,43.75308682],[4.848640315,43.7527201996],[4.8521409787,43.7521890708],[4.8568968524,43.7500090484],[4.8570009227,43.7498488558],[4.8569778984,43.7485269982],[4.8568734075,43.7463397337],[4.8594609203,43.7416393666],[4.8639982804,43.7375878565],[4.8655434233,43.7366225926],[4.8677001227,43.7354550972],[4.8711039807,43.7348097918],[4.8749664189,43.7341447816],[4.8811404133,43.7332614998],[4.8818989668,43.7332267887],[4.882461092,43.7332962799],[4.8833515483,43.7334600004],[4.8834384146,43.7333459852],[4.8836364107,43.731591866],[4.8837328577,43.7299961224],[4.8824773571,43.725146516],[4.8819984803,43.7243222082],[4.8810414524,43.7228832976],[4.877894346,43.7200555397],[4.8770331812,43.7197184575],[4.8762299047,43.7194433772],[4.8699331703,43.7165247346],[4.8628953215,43.7131953928],[4.861162385,43.7118389135],[4.8573459141,43.7078726539],[4.854044505,43.7028606201],[4.8507408005,43.6969916847],[4.8463541126,43.694523516],[4.8409943052,43.6923326697],[4.8367500347,43.6918832652],[4.8341714028,43.6914632339],[4.831782539,43.6907312263],[4.8293516481,43.689962972],[4.8260694513,43.6846654669],[4.8238551188,43.6809493862],[4.8234706395,43.6798964696],[4.8196630073,43.6795336053],[4.8180982735,43.6795048657],[4.8043772095,43.6793427067],[4.7926279722,43.6809212297],[4.7921490842,43.6811532314],[4.7925075629,43.6820275695],[4.7962426267,43.6909160507],[4.8000092593,43.6992720187],[4.7997442122,43.7003123697],[4.7984109667,43.7027348689],[4.796383731,43.7063334902],[4.7963131403,43.7089880379],[4.7966417624,43.7176043393],[4.7969530788,43.7278411078],[4.7970039238,43.728670137],[4.797425459,43.7301969062]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000010576","CODE_COM":"101","INSEE_COM":"13101","NOM_COM":"SAINT-SAVOURNIN","STATUT":"Commune simple","X_CHF_LIEU":904789.0,"Y_CHF_LIEU":6259652.0,"X_CENTROID":905156.0,"Y_CENTROID":6259369.0,"Z_MOYEN":440.0,"SUPERFICIE":"592","POPULATION":"3241","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5332384367,43.4165448178],[5.5344810339,43.4164698356],[5.5370880009,43.4164213878],[5.5403968104,43.4161601898],[5.5475312484,43.4155155168],[5.5478927358,43.4153692943],[5.5535682896,43.4129610092],[5.5562590593,43.4112170045],[5.5565516426,43.4109382621],[5.5572866035,43.4100009896],[5.5585170363,43.408350817],[5.5594444399,43.4075503],[5.5597111438,43.4071623471],[5.5571045542,43.4054039178],[5.5559252118,43.4050627214],[5.5547603417,43.405380951],[5.5500371137,43.4047443146],[5.5424485049,43.4032936023],[5.5346317743,43.4004939609],[5.5226109537,43.395371483],[5.5068983247,43.389143401],[5.5058254107,43.3886804022],[5.5044556372,43.3880883507],[5.5046630509,43.3885722944],[5.5084658199,43.3969342161],[5.514625592,43.404288163],[5.5198950578,43.4093195995],[5.5228759321,43.4121188052],[5.5278881053,43.4164322237],[5.5293618305,43.4165589291],[5.5324350681,43.4165276046],[5.5332384367,43.4165448178]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000010911","CODE_COM":"002","INSEE_COM":"13002","NOM_COM":"ALLAUCH","STATUT":"Commune simple","X_CHF_LIEU":901368.0,"Y_CHF_LIEU":6251706.0,"X_CENTROID":904314.0,"Y_CENTROID":6254123.0,"Z_MOYEN":351.0,"SUPERFICIE":"5037","POPULATION":"21276","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4549631656,43.3357217999],[5.4557125796,43.336091796],[5.4664581343,43.3397434866],[5.4715268115,43.3458515242],[5.4747703146,43.3506762855],[5.4752692986,43.3535918126],[5.4741273178,43.3560075596],[5.4731106607,43.3594194854],[5.472476182,43.3626849668],[5.4729331107,43.3678966287],[5.4742800953,43.3735766946],[5.4774146554,43.3791258605],[5.4802272282,43.3838326876],[5.4803105304,43.3848496557],[5.4798128872,43.3854155013],[5.480750183,43.3850861981],[5.4835780565,43.3844416983],[5.4860114925,43.3844380337],[5.48962563,43.3847410873],[5.4942872126,43.3852926088],[5.49754718,43.3861625088],[5.5013096777,43.3873195268],[5.5044556372,43.3880883507],[5.5057607731,43.3873371794],[5.5145378795,43.3835755991],[5.5271430848,43.3874358892],[5.5345268162,43.3883271397],[5.5432827243,43.3903242781],[5.5446709309,43.3907921033],[5.5450020104,43.3903243702],[5.5452548474,43.3901528073],[5.5471626317,43.3889738071],[5.5479751921,43.3885379372],[5.5502934987,43.3873789186],[5.5522444829,43.3862600152],[5.5533137263,43.3852410898],[5.5557616764,43.382393015],[5.5576749757,43.3795152184],[5.5600849852,43.3729100653],[5.5609871026,43.3686691039],[5.5622108873,43.3640910972],[5.5635492063,43.3594023641],[5.5653370347,43.3570566753],[5.5656900408,43.35667387],[5.5653085774,43.3562238758],[5.5634725628,43.3549919882],[5.5626640677,43.3545080011],[5.555322871,43.3472884709],[5.5481067247,43.3395642446],[5.548355603,43.3374126335],[5.5484615986,43.3358224293],[5.5478806727,43.3357632133],[5.546034831,43.335401661],[5.5422083779,43.3338580808],[5.5406384664,43.3330408245],[5.5354781141,43.3293925269],[5.5316258248,43.3265153307],[5.5291060201,43.3244681939],[5.5270254847,43.322651051],[5.5258831657,43.3217615017],[5.5248377866,43.3212548954],[5.5239267666,43.3209728533],[5.5228128155,43.3207576422],[5.5222005392,43.3210482401],[5.5218239703,43.321091226],[5.5150075369,43.3215002187],[5.5125530605,43.3209326624],[5.5050541711,43.3177513535],[5.4894566847,43.3152801676],[5.479689879,43.3141690081],[5.4761745256,43.3145402931],[5.4751016476,43.314728666],[5.4749371507,43.3153183444],[5.474652286,43.3156596727],[5.4744056917,43.3158876219],[5.4701760311,43.3196411277],[5.4672441024,43.3223910371],[5.4666359538,43.3230151276],[5.466357314,43.3233022908],[5.457495888,43.3324574826],[5.4558235867,43.3343279245],[5.4550038894,43.3355489705],[5.4549631656,43.3357217999]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000011253","CODE_COM":"093","INSEE_COM":"13093","NOM_COM":"SAINT-ESTEVE-JANSON","STATUT":"Commune simple","X_CHF_LIEU":893058.0,"Y_CHF_LIEU":6290437.0,"X_CENTROID":892722.0,"Y_CENTROID":6291320.0,"Z_MOYEN":193.0,"SUPERFICIE":"680","POPULATION":"357","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3785960586,43.7059814115],[5.3873199645,43.7023846786],[5.3881280263,43.7021823974],[5.3881814017,43.7021656603],[5.4127025623,43.6929173733],[5.4127138029,43.6929103446],[5.4114095601,43.6901629243],[5.4102357497,43.6879473466],[5.4065465258,43.6810729224],[5.4048690023,43.6789341693],[5.404337322,43.6783535732],[5.3994761165,43.676571351],[5.3963251423,43.6761132904],[5.3956207955,43.6771847709],[5.3949045058,43.678000846],[5.3938726156,43.6791605474],[5.3934227808,43.6795269365],[5.3918565573,43.680605652],[5.3815516804,43.6878364196],[5.3761512939,43.6906119822],[5.3714655096,43.6914515139],[5.3708351265,43.6916579019],[5.3700004097,43.6936124749],[5.3687817399,43.6975946135],[5.3682758449,43.7004233427],[5.368549626,43.7046430672],[5.368339149,43.7059448836],[5.3679335861,43.7065505643],[5.3688856832,43.7073373512],[5.370534661,43.7091892343],[5.3705412965,43.7091878209],[5.3785960586,43.7059814115]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000011705","CODE_COM":"212","INSEE_COM":"13212","NOM_COM":"MARSEILLE-12E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":898326.0,"Y_CHF_LIEU":6247347.0,"X_CENTROID":898153.0,"Y_CENTROID":6249091.0,"Z_MOYEN":122.0,"SUPERFICIE":"1405","POPULATION":"60437","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4087493061,43.2956491972],[5.4090972934,43.2959861337],[5.4091860334,43.2962226509],[5.4087489457,43.2974986694],[5.4096432095,43.303889333],[5.4098009123,43.3100795495],[5.4092168027,43.3122633523],[5.4103688554,43.3149376557],[5.4105321621,43.3149817142],[5.4114986604,43.3148386596],[5.4137941033,43.3160852274],[5.4153620517,43.3183821055],[5.4177684959,43.3198304179],[5.4243019514,43.3217730235],[5.4286720181,43.3230924579],[5.43606698,43.3237289032],[5.4377407496,43.3231970724],[5.4410883403,43.3212054189],[5.4439308937,43.3200413872],[5.4473731669,43.3199113187],[5.4512879182,43.3195292251],[5.4542728311,43.3191096003],[5.4595177028,43.3179805907],[5.4630830354,43.3203006663],[5.4638991731,43.3217158],[5.4658178268,43.3226791811],[5.4666359538,43.3230151276],[5.4672441024,43.3223910371],[5.4701760311,43.3196411277],[5.4744056917,43.3158876219],[5.474652286,43.3156596727],[5.4749371507,43.3153183444],[5.4751016476,43.314728666],[5.4743798501,43.3148549919],[5.4736240238,43.3149064899],[5.47316868,43.314865607],[5.4711774873,43.3145646358],[5.4715324928,43.3134728998],[5.4721422214,43.3124581397],[5.4725781479,43.312075563],[5.4765018141,43.3073263641],[5.4770628486,43.3005643201],[5.4769640188,43.300357783],[5.4766746032,43.3001322132],[5.4761543504,43.3000406329],[5.4736894762,43.2998027747],[5.4706840472,43.2996888203],[5.4697760328,43.2996924739],[5.4686986495,43.3001724919],[5.4674231625,43.3007461224],[5.4627617743,43.3014455435],[5.4606909828,43.3016925104],[5.4577506704,43.3014597117],[5.4575754,43.3014240971],[5.4523207164,43.298898351],[5.4483625272,43.2967155991],[5.4477626311,43.2964294892],[5.442258571,43.2947144255],[5.4418489169,43.2947587822],[5.4412937799,43.2954994186],[5.4328261645,43.2947039795],[5.4263406825,43.2899124622],[5.4257970662,43.290139763],[5.4248577061,43.2904488408],[5.4237918894,43.2906221493],[5.4226054589,43.2906226544],[5.416543776,43.2914441646],[5.4149182178,43.2916973989],[5.4149671557,43.292542288],[5.413400069,43.2941639648],[5.4087783937,43.2954901521],[5.4087493061,43.2956491972]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000011871","CODE_COM":"105","INSEE_COM":"13105","NOM_COM":"SENAS","STATUT":"Commune simple","X_CHF_LIEU":867437.0,"Y_CHF_LIEU":6296150.0,"X_CENTROID":867962.0,"Y_CENTROID":6296178.0,"Z_MOYEN":108.0,"SUPERFICIE":"3068","POPULATION":"6888","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.09066391,43.7721138],[5.123783589,43.758750916],[5.123784935,43.758750382],[5.123784797,43.7587482507],[5.1238677054,43.7566321021],[5.1245409531,43.7464334286],[5.1252368061,43.7382210529],[5.1255135113,43.736010229],[5.1255405618,43.7324927337],[5.125329144,43.7294398879],[5.1253559139,43.729325044],[5.1256540824,43.7216426096],[5.1228727586,43.7160564802],[5.1177273524,43.708842053],[5.1165912546,43.7082529513],[5.1159337237,43.7085924932],[5.1098656081,43.7136062366],[5.1074349232,43.7157083812],[5.1050360217,43.7187811237],[5.1040007994,43.7203647099],[5.1036068009,43.7213291911],[5.1032701275,43.7216921591],[5.1029536632,43.7219296137],[5.1022486753,43.7223690056],[5.1015498164,43.7227389624],[5.1000083718,43.7235203418],[5.0987026524,43.7241306256],[5.0981559332,43.7243518015],[5.0973225683,43.7246091031],[5.0940109031,43.7248447881],[5.090166674,43.7251131027],[5.0880882295,43.7252664105],[5.0844503069,43.7260886599],[5.0820293372,43.72672279],[5.0793226643,43.7275576561],[5.0785459993,43.7278074279],[5.072350876,43.7261999487],[5.0666475967,43.723972489],[5.0664131886,43.7223611762],[5.0649315951,43.7212011005],[5.0631802234,43.7215421599],[5.0620201723,43.7234148389],[5.0614692529,43.7248673066],[5.0595252387,43.7298630124],[5.0592452759,43.7305002125],[5.0532664083,43.7369906927],[5.0470002744,43.7439921328],[5.0451108876,43.7460178716],[5.0327962647,43.7504296492],[5.0201625218,43.7511661175],[5.0189590577,43.7503512964],[5.0180441115,43.7499703891],[5.0183227455,43.7506178329],[5.0225159962,43.7528966324],[5.0246296396,43.7534253559],[5.0265318845,43.7534889936],[5.0279591482,43.7531149678],[5.0367183837,43.755715892],[5.0431442039,43.7595859456],[5.049636827,43.7642213299],[5.0555338048,43.7651445039],[5.0599500931,43.7644381622],[5.0607791539,43.7641443287],[5.0617561653,43.7639926158],[5.062264061,43.7639550961],[5.0628307799,43.7639299627],[5.0691142981,43.7645795338],[5.0755528398,43.7665877551],[5.0772588672,43.7672195653],[5.0884535967,43.7713164795],[5.0906626661,43.7721143156],[5.09066391,43.7721138]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000011914","CODE_COM":"119","INSEE_COM":"13119","NOM_COM":"CARNOUX-EN-PROVENCE","STATUT":"Commune simple","X_CHF_LIEU":908324.0,"Y_CHF_LIEU":6243064.0,"X_CENTROID":908828.0,"Y_CENTROID":6243523.0,"Z_MOYEN":268.0,"SUPERFICIE":"371","POPULATION":"6754","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5866218359,43.266806027],[5.5861261231,43.2658035682],[5.5856513071,43.2651570176],[5.5782906852,43.2579762135],[5.5714234854,43.2545317859],[5.5641796909,43.251820399],[5.5592277263,43.25010456],[5.5555594875,43.2488450306],[5.5547889664,43.2486274629],[5.5528985026,43.2479746728],[5.5513129753,43.2473119466],[5.5506768244,43.2470695758],[5.549184721,43.246848312],[5.5472076601,43.2466294689],[5.5468468831,43.2480788745],[5.5444335504,43.2546076622],[5.5492850952,43.2560313531],[5.5551662027,43.25745208],[5.5577730419,43.2586458852],[5.5607001866,43.2603117435],[5.5633509134,43.2628202023],[5.5638752204,43.2634503683],[5.565283851,43.2644420397],[5.5669848638,43.265554549],[5.5699220324,43.2673207452],[5.572743959,43.2682939936],[5.5794474909,43.2700232741],[5.584922977,43.2689392564],[5.5865785882,43.2670500697],[5.5866218359,43.266806027]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000012805","CODE_COM":"215","INSEE_COM":"13215","NOM_COM":"MARSEILLE-15E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":891876.0,"Y_CHF_LIEU":6251113.0,"X_CENTROID":891249.0,"Y_CENTROID":6255692.0,"Z_MOYEN":137.0,"SUPERFICIE":"1664","POPULATION":"80668","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.344861031,43.337360382],[5.3446121459,43.337360382],[5.344583035,43.3373956524],[5.344583035,43.337638855],[5.3443823031,43.3376388551],[5.344305038,43.3377324673],[5.344305038,43.337917328],[5.3441524576,43.3379173283],[5.3431794462,43.3390961624],[5.3397291607,43.3392113599],[5.3387884218,43.3392434074],[5.3375478729,43.339514124],[5.3380513573,43.3397975369],[5.3395486917,43.3399595546],[5.3408762374,43.3400091282],[5.3434025451,43.3398824197],[5.3481008921,43.3420709966],[5.347007124,43.3440081233],[5.3455143537,43.3460816926],[5.3452214724,43.3466118405],[5.345235814,43.3474791254],[5.3459981176,43.3488764895],[5.3464554552,43.3492652685],[5.3487984435,43.3501981166],[5.3518754717,43.3511950595],[5.3511253192,43.3539977712],[5.3492094747,43.3568600018],[5.3470927555,43.3609118657],[5.3452896579,43.363433184],[5.3429191403,43.3654438574],[5.3395649423,43.3668700471],[5.3335138244,43.369697136],[5.3330605576,43.3699283117],[5.3322755103,43.3714410477],[5.3326134571,43.3719260678],[5.3330965301,43.3725519597],[5.3338553831,43.373224103],[5.3368512902,43.3755732787],[5.3405392479,43.3767895976],[5.3450914993,43.375198821],[5.3503613754,43.3752356946],[5.3531408092,43.3774010371],[5.3527188383,43.377944823],[5.3524400957,43.3783099902],[5.3508254393,43.38122334],[5.3504301827,43.3822111477],[5.3503727418,43.382496802],[5.3504271988,43.382772826],[5.3513191219,43.3831899631],[5.3546107586,43.3845926408],[5.3685198095,43.3896425361],[5.3701066822,43.389667203],[5.3709792696,43.3894887869],[5.3729019961,43.3888589311],[5.3751789622,43.3880817625],[5.3776077758,43.3856937497],[5.3779349315,43.3853085486],[5.3783478331,43.3845794499],[5.3783811851,43.3843114074],[5.3769013412,43.3786260265],[5.3756948228,43.3720823336],[5.3814518243,43.3702097403],[5.391432294,43.3719840858],[5.3916295889,43.3720706283],[5.39219731,43.3722830863],[5.3927198742,43.3723588355],[5.394181556,43.3722617029],[5.3945695705,43.372157714],[5.3955949951,43.3713015899],[5.3960700465,43.3708878585],[5.3979100409,43.3691514437],[5.3982895796,43.3686372159],[5.3984059086,43.3681423218],[5.3980100154,43.3679377898],[5.3951917929,43.3667095735],[5.3947977933,43.3666093916],[5.3926028321,43.3665724485],[5.3923369829,43.3666764296],[5.3891691391,43.3654611917],[5.3864034466,43.3637662847],[5.3806910521,43.3590590352],[5.3800182398,43.3584483278],[5.3783395495,43.3563288115],[5.3769965399,43.354450303],[5.376371601,43.3519782039],[5.3778160211,43.3503993464],[5.3782646799,43.3466589499],[5.3782749001,43.344516711],[5.3778705578,43.342428591],[5.3773432898,43.3410064772],[5.375528768,43.3400338455],[5.3733597728,43.3395243649],[5.3697861797,43.3379008308],[5.3674751319,43.3361514538],[5.3673375028,43.3312710989],[5.3686342033,43.3270649438],[5.371420397,43.3215247419],[5.3715768681,43.3200849312],[5.3715913821,43.3199883144],[5.3700236136,43.3194224027],[5.3690337917,43.3168728424],[5.3691311364,43.316722212],[5.3684234028,43.3165064234],[5.3661670457,43.3192800788],[5.3630873925,43.3236556593],[5.360377339,43.3272841995],[5.3579686116,43.3300295154],[5.354987447,43.333736735],[5.3528609078,43.3351924074],[5.3505089226,43.336050844],[5.3455143299,43.336267283],[5.344861031,43.3370588341],[5.344861031,43.337360382]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000012955","CODE_COM":"057","INSEE_COM":"13057","NOM_COM":"MAS-BLANC-DES-ALPILLES","STATUT":"Commune simple","X_CHF_LIEU":841434.0,"Y_CHF_LIEU":6300468.0,"X_CENTROID":841839.0,"Y_CENTROID":6300538.0,"Z_MOYEN":24.0,"SUPERFICIE":"157","POPULATION":"508","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7728549781,43.7823735306],[4.7693868985,43.7819906507],[4.7668879321,43.7816090535],[4.7653786797,43.7814138915],[4.7612441892,43.7810505499],[4.7590544087,43.7812263364],[4.7580731131,43.7832115819],[4.756653119,43.7859230702],[4.7554641305,43.7878666382],[4.7548130198,43.7891606646],[4.7544606285,43.7899863282],[4.7544905451,43.7904755005],[4.7548065182,43.79089256],[4.7553360232,43.7911819661],[4.7615516824,43.7940610172],[4.7647093048,43.7953546926],[4.7675471047,43.7962268165],[4.7677938511,43.7959680848],[4.7687686837,43.7933356634],[4.7695803118,43.790250434],[4.7712467665,43.7849217625],[4.7728549781,43.7823735306]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000013100","CODE_COM":"207","INSEE_COM":"13207","NOM_COM":"MARSEILLE-7E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":893448.0,"Y_CHF_LIEU":6247311.0,"X_CENTROID":891997.0,"Y_CENTROID":6246061.0,"Z_MOYEN":43.0,"SUPERFICIE":"585","POPULATION":"35262","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.368751,43.268749],[5.3676148752,43.2687490014],[5.3673730696,43.2689077502],[5.3624690232,43.2718238498],[5.360972,43.273412598],[5.360972,43.273472],[5.3609160255,43.2734720001],[5.3594567267,43.2750206063],[5.3567712734,43.276849424],[5.3542945439,43.278303746],[5.352639,43.279002737],[5.352639,43.279026],[5.3525839005,43.279026],[5.3520799496,43.2792387655],[5.352079,43.279305],[5.3519230615,43.2793050021],[5.3501883536,43.2800373532],[5.3484435388,43.2801733867],[5.3473980369,43.2804525921],[5.3465843125,43.2807672514],[5.3461019543,43.2809613161],[5.3457474788,43.2812407975],[5.345458156,43.2816079584],[5.3454825935,43.2820574032],[5.3456836221,43.2823662221],[5.3473186836,43.2837490013],[5.348473,43.283749],[5.348473,43.284306],[5.348751,43.284306],[5.348751,43.284863],[5.3486360039,43.2848630001],[5.3502228882,43.28620488],[5.3520659154,43.288140183],[5.3526194833,43.2890280004],[5.352917,43.289028],[5.352917,43.289307],[5.353471,43.289307],[5.353471,43.289585],[5.353749,43.289585],[5.353749,43.28986],[5.354027,43.28986],[5.354027,43.290417],[5.353749,43.290417],[5.353749,43.290695],[5.3536589333,43.2906950002],[5.3540828463,43.2913748134],[5.3563494,43.2933557286],[5.3597974529,43.2937349733],[5.3613052966,43.2927669751],[5.3647526869,43.2926492954],[5.3660136165,43.2927224922],[5.3688621946,43.2930839724],[5.371019519,43.2935928418],[5.3721422747,43.2909654985],[5.372010952,43.2908279864],[5.3703654664,43.2883522917],[5.3701047516,43.2877640346],[5.3700151811,43.2869335336],[5.3701194985,43.2863543697],[5.3707911956,43.2845937088],[5.3716333635,43.2825161176],[5.3721550374,43.2813329183],[5.3729331811,43.279617609],[5.3732845726,43.2793264041],[5.3738174488,43.2791950031],[5.3738600876,43.2790338737],[5.3741322458,43.2772369779],[5.3726532686,43.2720650295],[5.3709990514,43.269873968],[5.368751,43.2685943894],[5.368751,43.268749]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000013423","CODE_COM":"050","INSEE_COM":"13050","NOM_COM":"LAMBESC","STATUT":"Commune simple","X_CHF_LIEU":882499.0,"Y_CHF_LIEU":6286477.0,"X_CENTROID":881692.0,"Y_CENTROID":6288325.0,"Z_MOYEN":233.0,"SUPERFICIE":"6516","POPULATION":"9335","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1811287842,43.6576175511],[5.1811788218,43.6589649614],[5.1817186919,43.6604447687],[5.1823699407,43.6612670343],[5.1830051045,43.6614712198],[5.1848305517,43.6617397068],[5.1866034754,43.6618985017],[5.191082305,43.6640137105],[5.1951218453,43.6670179617],[5.1981223956,43.6701457002],[5.2063776082,43.6746521603],[5.2110549234,43.6757588912],[5.219484211,43.6769626592],[5.2205663057,43.6775220802],[5.2215214045,43.6780363762],[5.2223515071,43.678589225],[5.2227624431,43.6789832033],[5.2247907767,43.6826360332],[5.2237906774,43.6838411092],[5.2225898011,43.6840285835],[5.2211170904,43.6844034299],[5.2175864208,43.6866025673],[5.2147777798,43.6884250217],[5.212889077,43.6896921911],[5.2118774002,43.6909604032],[5.214450476,43.6930828783],[5.2225261959,43.6989512],[5.2282083433,43.7027363795],[5.2286882122,43.7029831046],[5.2291261288,43.703108262],[5.2316205164,43.7014611054],[5.2338897462,43.6994845449],[5.2338906149,43.6988706014],[5.233978532,43.6985798373],[5.2346178386,43.6974117735],[5.2352996635,43.6967298317],[5.2367173615,43.6955439607],[5.2390425689,43.6938037894],[5.241036033,43.6940201977],[5.2457080247,43.6950905017],[5.2511109663,43.6974552624],[5.2546788317,43.7014160414],[5.2561387137,43.7060640898],[5.2591620931,43.7095382396],[5.2624047801,43.712899738],[5.2635582374,43.7137606521],[5.2661377352,43.715938577],[5.2682407146,43.7188969568],[5.2688744059,43.7198226653],[5.2690323101,43.719422382],[5.269653301,43.7182112583],[5.2744263466,43.7096694877],[5.2753799591,43.7020626532],[5.275318142,43.6988826445],[5.2755528125,43.6977938993],[5.2760998731,43.6966049991],[5.2777831617,43.6952860913],[5.2799970699,43.6942089935],[5.2860135088,43.6915486866],[5.2942421856,43.6899639545],[5.2966879071,43.6904731729],[5.2979692872,43.6905316325],[5.2981902202,43.6900705641],[5.2996080059,43.6892007168],[5.3021573682,43.6857134353],[5.3034480133,43.6796187843],[5.3034630925,43.6754280616],[5.304249879,43.6695493495],[5.3058849587,43.6634006139],[5.307629327,43.6548631682],[5.3088990396,43.6524354274],[5.3108520023,43.6490920724],[5.3133180929,43.6461518487],[5.3170392045,43.6398280659],[5.3174665523,43.6381041212],[5.3134561107,43.6389132948],[5.3001039951,43.6418026554],[5.2994110754,43.6419874479],[5.2984765886,43.6420522203],[5.2937353247,43.6418337114],[5.2855480311,43.6388114791],[5.2845441685,43.6384095057],[5.2822542167,43.6374890366],[5.2766007022,43.6346046643],[5.2730081396,43.6321747182],[5.2707320768,43.6299665075],[5.2675685619,43.6227980443],[5.2652854764,43.6172917577],[5.2651105126,43.6165320826],[5.2640054617,43.6142435459],[5.2637102376,43.6137321154],[5.2597130155,43.6112031172],[5.2590356695,43.6111478926],[5.2585875782,43.6112202184],[5.2553078902,43.6089083865],[5.2526007156,43.6074784286],[5.2444727184,43.6083523608],[5.2408054084,43.6129368297],[5.2382863413,43.6207353235],[5.2356742046,43.6268317329],[5.2341782371,43.6291461567],[5.2332559802,43.6304118092],[5.2314240386,43.6327916092],[5.2305749583,43.6336794771],[5.2283713542,43.6353989461],[5.2270319843,43.6363976531],[5.2189600504,43.6426450123],[5.2155402751,43.6451793636],[5.214491126,43.6452952561],[5.2104434301,43.6450886898],[5.1992717088,43.643612213],[5.1910950447,43.6423263105],[5.1907201506,43.6422465532],[5.1898235404,43.6419099656],[5.1887998083,43.6412626836],[5.1872844812,43.6399447846],[5.183094102,43.6410227706],[5.1827009749,43.6414402257],[5.1835016504,43.6417977009],[5.1830479018,43.6444316059],[5.1818242686,43.6522423575],[5.1812358186,43.6567161619],[5.1811287842,43.6576175511]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000013562","CODE_COM":"073","INSEE_COM":"13073","NOM_COM":"PEYPIN","STATUT":"Commune simple","X_CHF_LIEU":908989.0,"Y_CHF_LIEU":6257480.0,"X_CENTROID":908487.0,"Y_CENTROID":6257535.0,"Z_MOYEN":339.0,"SUPERFICIE":"1329","POPULATION":"5431","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.587573269,43.3666243022],[5.58636669,43.3659105741],[5.5760854134,43.3617868278],[5.5755656928,43.3617235947],[5.5748126201,43.3614903962],[5.5719924683,43.3605493833],[5.5705459144,43.3598411947],[5.5688503211,43.3589417837],[5.5678830434,43.3583571926],[5.5656900408,43.35667387],[5.5653370347,43.3570566753],[5.5635492063,43.3594023641],[5.5622108873,43.3640910972],[5.5609871026,43.3686691039],[5.5600849852,43.3729100653],[5.5576749757,43.3795152184],[5.5557616764,43.382393015],[5.5533137263,43.3852410898],[5.5522444829,43.3862600152],[5.5502934987,43.3873789186],[5.5479751921,43.3885379372],[5.5471626317,43.3889738071],[5.5452548474,43.3901528073],[5.5450020104,43.3903243702],[5.5446709309,43.3907921033],[5.54490332,43.390939656],[5.5478745414,43.3932631161],[5.5503002067,43.3951916134],[5.5536516832,43.3983133667],[5.5555641052,43.4001278538],[5.5551021255,43.4023179171],[5.5546567998,43.4038271062],[5.5544137646,43.4040533673],[5.5548317361,43.4047365883],[5.5559252118,43.4050627214],[5.5571045542,43.4054039178],[5.5597111438,43.4071623471],[5.5594444399,43.4075503],[5.5595700941,43.4079604812],[5.5601363218,43.4086716848],[5.5610752676,43.4093515676],[5.56149558,43.41016793],[5.5618354853,43.4096216193],[5.5646003966,43.40647507],[5.565821807,43.4060410791],[5.5686545065,43.4053348272],[5.5778757951,43.4033298181],[5.5814717078,43.404865246],[5.5817840228,43.4050297213],[5.5819252299,43.4041595393],[5.5819917432,43.403770902],[5.5821928915,43.4026409568],[5.585425113,43.3965735356],[5.5905270626,43.3921904128],[5.5947055686,43.3915151531],[5.5951810103,43.3914110428],[5.5943531354,43.3901311243],[5.5929681682,43.3864837539],[5.593527095,43.3854667382],[5.59391604,43.3836905012],[5.5931810463,43.3815379538],[5.5909548147,43.3762734556],[5.5881444582,43.372168742],[5.5871536452,43.3703832391],[5.587573269,43.3666243022]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000013811","CODE_COM":"206","INSEE_COM":"13206","NOM_COM":"MARSEILLE-6E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":893498.0,"Y_CHF_LIEU":6244145.0,"X_CENTROID":893429.0,"Y_CENTROID":6246251.0,"Z_MOYEN":37.0,"SUPERFICIE":"206","POPULATION":"42252","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3721422747,43.2909654985],[5.3818755901,43.2933001165],[5.3823154562,43.2934794147],[5.3843149781,43.2948167753],[5.3855598581,43.2942916178],[5.3872375993,43.2938063831],[5.3890522909,43.2931776987],[5.3891524021,43.2881302445],[5.390717695,43.2848782348],[5.3919457421,43.28475566],[5.391942647,43.2845325364],[5.3908270875,43.2830002821],[5.3887390906,43.2831490595],[5.3885585079,43.2831611513],[5.3869159549,43.2832685465],[5.3862604663,43.2820743718],[5.3819843613,43.2811400682],[5.3782418796,43.2803279487],[5.3740368664,43.2793485747],[5.3738174488,43.2791950031],[5.3732845726,43.2793264041],[5.3729331811,43.279617609],[5.3721550374,43.2813329183],[5.3716333635,43.2825161176],[5.3707911956,43.2845937088],[5.3701194985,43.2863543697],[5.3700151811,43.2869335336],[5.3701047516,43.2877640346],[5.3703654664,43.2883522917],[5.372010952,43.2908279864],[5.3721422747,43.2909654985]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000014003","CODE_COM":"070","INSEE_COM":"13070","NOM_COM":"LA PENNE-SUR-HUVEAUNE","STATUT":"Commune simple","X_CHF_LIEU":904305.0,"Y_CHF_LIEU":6245626.0,"X_CENTROID":904488.0,"Y_CENTROID":6245474.0,"Z_MOYEN":128.0,"SUPERFICIE":"365","POPULATION":"6264","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5144448048,43.2676903884],[5.5133589496,43.2679541592],[5.5100699222,43.2695804357],[5.5060860188,43.2743241338],[5.5058112086,43.2749164096],[5.5052703331,43.2768414588],[5.5046838335,43.28143248],[5.5052506705,43.2831662511],[5.5126542346,43.2878534952],[5.5146345872,43.2883168349],[5.5177731106,43.288103348],[5.518417083,43.2880100396],[5.5185774102,43.2869136842],[5.5186967836,43.2865157952],[5.5204489632,43.2819559691],[5.521928791,43.2817378349],[5.5229521202,43.2819263468],[5.5253386706,43.2826941044],[5.5285662779,43.2836770359],[5.5302765697,43.2833201913],[5.5305324973,43.2820496747],[5.530653072,43.2809794322],[5.5308268408,43.2792968347],[5.5303403863,43.2775028025],[5.5302560762,43.2770691711],[5.5303371611,43.276390463],[5.5304314796,43.2756484444],[5.530547662,43.2750679158],[5.5306797989,43.2744861137],[5.5309467006,43.2734106488],[5.5314487165,43.2714341657],[5.5319596243,43.2696329755],[5.5323296985,43.2684398909],[5.5309733461,43.2679829764],[5.5295929344,43.2679037112],[5.5242206865,43.267650484],[5.5215738185,43.2676466046],[5.5189933487,43.2679786126],[5.5170056387,43.2684605481],[5.5157349236,43.2681004496],[5.5144448048,43.2676903884]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000014318","CODE_COM":"201","INSEE_COM":"13201","NOM_COM":"MARSEILLE-1ER-ARRONDISSEMENT","STATUT":"Préfecture de région","X_CHF_LIEU":893448.0,"Y_CHF_LIEU":6247311.0,"X_CENTROID":893415.0,"Y_CENTROID":6247461.0,"Z_MOYEN":30.0,"SUPERFICIE":"178","POPULATION":"38733","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3721422747,43.2909654985],[5.371019519,43.2935928418],[5.3734847445,43.2941876042],[5.373819985,43.2945195292],[5.3736165356,43.2949946818],[5.3744240506,43.2952757329],[5.3749701971,43.3013259443],[5.3750228714,43.3015875793],[5.376286093,43.3016813104],[5.3810495133,43.3040271164],[5.390500823,43.3093947963],[5.3917915938,43.3087812534],[5.3926543287,43.3069117917],[5.3944460669,43.3020428068],[5.3890791885,43.3003094128],[5.3887546691,43.3002094883],[5.3863634386,43.2959946263],[5.3855598581,43.2942916178],[5.3843149781,43.2948167753],[5.3823154562,43.2934794147],[5.3818755901,43.2933001165],[5.3721422747,43.2909654985]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000014772","CODE_COM":"066","INSEE_COM":"13066","NOM_COM":"NOVES","STATUT":"Commune simple","X_CHF_LIEU":852823.0,"Y_CHF_LIEU":6310485.0,"X_CENTROID":852890.0,"Y_CENTROID":6309151.0,"Z_MOYEN":53.0,"SUPERFICIE":"2650","POPULATION":"5459","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9004975065,43.8892433696],[4.9023179459,43.887928969],[4.9029430425,43.8876702015],[4.902945518,43.887668609],[4.9029470682,43.887668535],[4.9033554016,43.8874994965],[4.9081621079,43.8862615306],[4.9092180022,43.8862367662],[4.921965283,43.8867589684],[4.922008514,43.886756897],[4.9304847826,43.8843741222],[4.9304982868,43.8843636558],[4.9308923324,43.8840911274],[4.9350039836,43.8797027645],[4.9349279117,43.8792207073],[4.9344126148,43.8762429911],[4.9333336345,43.8723822746],[4.9288577567,43.8710229704],[4.925005729,43.8695597651],[4.9233935106,43.8689067505],[4.9218191851,43.8681954336],[4.9209821322,43.8677987866],[4.9210391664,43.8672378665],[4.9213198577,43.8665568847],[4.9248505268,43.8618163962],[4.9287914866,43.8567543804],[4.9298155012,43.8563176872],[4.9306260563,43.8559333717],[4.9313815136,43.8544716067],[4.9318756299,43.8534123455],[4.9286131735,43.8526887113],[4.927605376,43.8522771368],[4.9262081413,43.8517518061],[4.9253989815,43.8516229615],[4.9244406815,43.851128569],[4.9200634227,43.8498716356],[4.9169721998,43.8495695299],[4.9133773035,43.848823385],[4.9079021855,43.8476410346],[4.9073492332,43.8475084771],[4.9059631385,43.8471213256],[4.9048922086,43.8467853645],[4.9050798787,43.8441697937],[4.9081330814,43.836640531],[4.9098017982,43.8290814491],[4.9126970064,43.8241554323],[4.9129212157,43.823610503],[4.9096551901,43.8226469697],[4.9072463838,43.8216611492],[4.9073594907,43.8208778343],[4.9077214594,43.8182385448],[4.9012751348,43.818786819],[4.8958142955,43.8191771559],[4.8901245521,43.8197152107],[4.8816575863,43.8209400356],[4.880292493,43.8212417306],[4.8792602372,43.8217600095],[4.8745384009,43.8247937765],[4.8721997307,43.8266918641],[4.8687210725,43.829741832],[4.8685388772,43.8298358692],[4.8686729597,43.8300577094],[4.8724086581,43.8347014381],[4.8732613907,43.8357156729],[4.874572963,43.8372585104],[4.8766687512,43.8396925042],[4.8783010695,43.8414530247],[4.8789296486,43.8423009521],[4.8809366707,43.8450874704],[4.8818080155,43.8465064031],[4.8826060106,43.8504542628],[4.8831728267,43.8536877841],[4.8832010157,43.8543165155],[4.8833337124,43.8598133667],[4.8831699682,43.8602428745],[4.8830231073,43.86035433],[4.8826799328,43.860360252],[4.8818612087,43.8600170076],[4.8809039098,43.8621147122],[4.8789316011,43.8708407785],[4.8795232008,43.8820495365],[4.8801601808,43.8938733197],[4.8809755954,43.8998446481],[4.8813359132,43.9015605109],[4.8813501364,43.9015556825],[4.9004975065,43.8892433696]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000014957","CODE_COM":"066","INSEE_COM":"83066","NOM_COM":"GINASSERVIS","STATUT":"Commune simple","X_CHF_LIEU":929788.0,"Y_CHF_LIEU":6289915.0,"X_CENTROID":929039.0,"Y_CENTROID":6288836.0,"Z_MOYEN":388.0,"SUPERFICIE":"3820","POPULATION":"1562","CODE_ARR":"3","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7992074571,43.6599338146],[5.7990586793,43.660518854],[5.8011497267,43.6713792902],[5.8030676054,43.6747595943],[5.7992074571,43.6599338146]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000014968","CODE_COM":"075","INSEE_COM":"13075","NOM_COM":"PLAN-DE-CUQUES","STATUT":"Commune simple","X_CHF_LIEU":899793.0,"Y_CHF_LIEU":6252871.0,"X_CENTROID":899991.0,"Y_CENTROID":6255198.0,"Z_MOYEN":267.0,"SUPERFICIE":"851","POPULATION":"10689","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4475015298,43.3869700512],[5.4507385451,43.3879543743],[5.4557568587,43.3888009966],[5.45891249,43.3890875789],[5.472019885,43.3909977834],[5.4753929067,43.3914553394],[5.4763368205,43.3907892977],[5.4785355632,43.3883384828],[5.479235332,43.3872495727],[5.479174572,43.3863544954],[5.4798128872,43.3854155013],[5.4803105304,43.3848496557],[5.4802272282,43.3838326876],[5.4774146554,43.3791258605],[5.4742800953,43.3735766946],[5.4729331107,43.3678966287],[5.472476182,43.3626849668],[5.4731106607,43.3594194854],[5.4741273178,43.3560075596],[5.4752692986,43.3535918126],[5.4747703146,43.3506762855],[5.4715268115,43.3458515242],[5.4664581343,43.3397434866],[5.4557125796,43.336091796],[5.4549631656,43.3357217999],[5.4521726795,43.3369056431],[5.4504530789,43.3388886772],[5.4508225961,43.3407343601],[5.4514214516,43.3436800836],[5.4518727245,43.3450982032],[5.452771127,43.3468796979],[5.453176741,43.3475428239],[5.4575033953,43.3525523154],[5.4586144653,43.3537034191],[5.4608914422,43.3557847406],[5.4619094339,43.3566886217],[5.4636625944,43.3590050254],[5.4642465744,43.3604011964],[5.4632870472,43.3627991712],[5.4610404239,43.3674414452],[5.4597153602,43.3697505033],[5.4583292938,43.372049232],[5.4565198318,43.3744907647],[5.453690377,43.3783360833],[5.4504182494,43.3832129183],[5.4480364336,43.3863441144],[5.4475015298,43.3869700512]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000015138","CODE_COM":"029","INSEE_COM":"13029","NOM_COM":"CORNILLON-CONFOUX","STATUT":"Commune simple","X_CHF_LIEU":867423.0,"Y_CHF_LIEU":6275916.0,"X_CENTROID":867547.0,"Y_CENTROID":6277786.0,"Z_MOYEN":71.0,"SUPERFICIE":"1487","POPULATION":"1350","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0626277691,43.5584517833],[5.0626927986,43.5593316919],[5.0625892269,43.5598592865],[5.058760744,43.5687173237],[5.0530148806,43.5751948825],[5.0474516984,43.5833239],[5.0474537624,43.5856028047],[5.047297202,43.587773996],[5.0469220296,43.5887117284],[5.0440294592,43.5920496218],[5.04367684,43.5922668713],[5.0431217005,43.5928479535],[5.0430040398,43.5933343994],[5.0431140668,43.593468239],[5.046847379,43.5942908129],[5.0498011417,43.5938804864],[5.0580196361,43.5922048696],[5.0622677931,43.5921530955],[5.068133279,43.593751699],[5.0708699636,43.5950856645],[5.0739601365,43.5959510791],[5.0749570937,43.5962254627],[5.0792931785,43.5973612461],[5.0810146478,43.5976343054],[5.0827901906,43.5978270944],[5.0862441833,43.5981640465],[5.0868147388,43.5980171754],[5.0880157969,43.5977033702],[5.0891676429,43.5966506347],[5.0892756525,43.5965558494],[5.0891848812,43.5958996394],[5.0895211543,43.5951695099],[5.0912706112,43.5950215318],[5.0968880244,43.5934605085],[5.101270411,43.5898682152],[5.1025129145,43.5880899213],[5.102785507,43.5876553079],[5.1007593733,43.5783787751],[5.1019736606,43.5746532969],[5.1026348796,43.5722238166],[5.1044043274,43.565313948],[5.1052359383,43.5616975815],[5.1055108057,43.5606877843],[5.1058238895,43.5597753521],[5.1075741468,43.5550943871],[5.1054218277,43.5546843278],[5.1034606109,43.5543551286],[5.0998493755,43.5588200173],[5.097576682,43.5614858206],[5.096617422,43.5627725321],[5.0945463629,43.5656467933],[5.0937940657,43.5665028598],[5.0931172944,43.5672242563],[5.090865432,43.5691541715],[5.0900412748,43.5698072823],[5.0840130789,43.5688259861],[5.0797475363,43.5658223873],[5.0795267897,43.5634531737],[5.0784310667,43.560914409],[5.0773649911,43.559260721],[5.076793371,43.5588549354],[5.0765118105,43.5587010129],[5.0761448799,43.5586162262],[5.0718498067,43.5577109342],[5.0652427081,43.5564174663],[5.0643905646,43.5562950687],[5.0631475541,43.5573492514],[5.0626277691,43.5584517833]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000015174","CODE_COM":"013","INSEE_COM":"13013","NOM_COM":"BELCODENE","STATUT":"Commune simple","X_CHF_LIEU":909712.0,"Y_CHF_LIEU":6262013.0,"X_CENTROID":909230.0,"Y_CENTROID":6261913.0,"Z_MOYEN":371.0,"SUPERFICIE":"1312","POPULATION":"1861","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5587187501,43.4339914085],[5.5595500615,43.4341310904],[5.5643171712,43.4340327387],[5.568004556,43.4350372411],[5.5696564621,43.4354895384],[5.5795757752,43.4385590777],[5.5838908405,43.440433848],[5.5874655971,43.4427069024],[5.5901102183,43.4414105023],[5.5959289541,43.439362907],[5.6010683142,43.4354671032],[5.6034111572,43.4330569343],[5.6045769734,43.4318524156],[5.6049181619,43.4311222937],[5.6051372549,43.4304509168],[5.605815156,43.4278565959],[5.6079154541,43.4215509543],[5.6106803334,43.4133560856],[5.61046238,43.4118995212],[5.6084714339,43.4105522973],[5.6016393379,43.4078641689],[5.5936188299,43.4062131462],[5.5885731656,43.4056669131],[5.5862401732,43.4055651482],[5.5817396879,43.4053899261],[5.5817840228,43.4050297213],[5.5814717078,43.404865246],[5.5778757951,43.4033298181],[5.5686545065,43.4053348272],[5.565821807,43.4060410791],[5.5646003966,43.40647507],[5.5618354853,43.4096216193],[5.56149558,43.41016793],[5.5623305951,43.4116738686],[5.5631365282,43.4153533777],[5.5611966432,43.4180708334],[5.5597226629,43.423798055],[5.5610695761,43.4274783273],[5.5609427543,43.4283193441],[5.5599162148,43.4321448523],[5.5591299004,43.4334047119],[5.5587187501,43.4339914085]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000015197","CODE_COM":"009","INSEE_COM":"13009","NOM_COM":"LA BARBEN","STATUT":"Commune simple","X_CHF_LIEU":875678.0,"Y_CHF_LIEU":6283636.0,"X_CENTROID":877969.0,"Y_CENTROID":6282913.0,"Z_MOYEN":152.0,"SUPERFICIE":"2297","POPULATION":"761","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.19635102,43.6010908132],[5.1968417263,43.602293343],[5.1973071557,43.6049050631],[5.1971091562,43.608629249],[5.1958131802,43.611406211],[5.194656338,43.6128688754],[5.1939858914,43.613478295],[5.1911847074,43.6158427294],[5.1863437281,43.6179736161],[5.1820861172,43.6192617594],[5.1757712151,43.6213245422],[5.1658840211,43.6246769684],[5.1657785801,43.6254612722],[5.1657024307,43.6283008647],[5.1709102403,43.6313986958],[5.1732193894,43.6319007227],[5.1765279079,43.6323826929],[5.1777057683,43.6327236499],[5.1789561342,43.6331459526],[5.1803236275,43.6336496037],[5.180767792,43.6339233328],[5.181121526,43.6341979749],[5.1813849246,43.6345086339],[5.1815260969,43.6378281787],[5.182237692,43.6411218789],[5.1827009749,43.6414402257],[5.183094102,43.6410227706],[5.1872844812,43.6399447846],[5.1887998083,43.6412626836],[5.1898235404,43.6419099656],[5.1907201506,43.6422465532],[5.1910950447,43.6423263105],[5.1992717088,43.643612213],[5.2104434301,43.6450886898],[5.214491126,43.6452952561],[5.2155402751,43.6451793636],[5.2189600504,43.6426450123],[5.2270319843,43.6363976531],[5.2283713542,43.6353989461],[5.2305749583,43.6336794771],[5.2314240386,43.6327916092],[5.2332559802,43.6304118092],[5.2341782371,43.6291461567],[5.2356742046,43.6268317329],[5.2382863413,43.6207353235],[5.2408054084,43.6129368297],[5.2444727184,43.6083523608],[5.2526007156,43.6074784286],[5.2553078902,43.6089083865],[5.2585875782,43.6112202184],[5.2590356695,43.6111478926],[5.2582441367,43.6105837585],[5.257459365,43.6097503375],[5.2565134038,43.6079679154],[5.2550346204,43.6044466891],[5.254935824,43.6037295334],[5.2549802537,43.601929246],[5.2552615561,43.6001681496],[5.2553753126,43.597548209],[5.2545536175,43.5933427675],[5.2542131697,43.5920851568],[5.2538133384,43.5921843673],[5.2465630859,43.5934057245],[5.237246177,43.5947708947],[5.2299184707,43.5957046862],[5.2204601679,43.5967310613],[5.2101509155,43.5975704987],[5.2065765785,43.5979906118],[5.2046563631,43.5984292529],[5.2028048589,43.5989807806],[5.1999858962,43.5998849162],[5.19635102,43.6010908132]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000015344","CODE_COM":"044","INSEE_COM":"13044","NOM_COM":"GRANS","STATUT":"Commune simple","X_CHF_LIEU":866583.0,"Y_CHF_LIEU":6281010.0,"X_CENTROID":864910.0,"Y_CENTROID":6282210.0,"Z_MOYEN":66.0,"SUPERFICIE":"2768","POPULATION":"4362","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0892756525,43.5965558494],[5.0891676429,43.5966506347],[5.0880157969,43.5977033702],[5.0868147388,43.5980171754],[5.0862441833,43.5981640465],[5.0827901906,43.5978270944],[5.0810146478,43.5976343054],[5.0792931785,43.5973612461],[5.0749570937,43.5962254627],[5.0739601365,43.5959510791],[5.0708699636,43.5950856645],[5.068133279,43.593751699],[5.0622677931,43.5921530955],[5.0580196361,43.5922048696],[5.0498011417,43.5938804864],[5.046847379,43.5942908129],[5.0431140668,43.593468239],[5.0430040398,43.5933343994],[5.0431217005,43.5928479535],[5.04367684,43.5922668713],[5.0429495741,43.5922220489],[5.0342479309,43.5951962517],[5.0311217648,43.5973878936],[5.0300956491,43.5981037218],[5.0235327282,43.6020280268],[5.0190814065,43.6043510999],[5.0178406034,43.6049573928],[5.0135457299,43.6059983434],[5.0112579926,43.6065285522],[5.0075318618,43.6054579946],[5.0052866811,43.6069584531],[5.0029497851,43.60853166],[4.9986327501,43.6114400441],[4.9937309806,43.6147523112],[4.989579072,43.6174475869],[4.9885950414,43.6180443384],[4.9888567998,43.6180188464],[4.9896673227,43.6181345173],[4.9916111862,43.6186713464],[5.0036336155,43.6227193484],[5.0092113702,43.6268169945],[5.0122308862,43.6291796262],[5.0122962728,43.6396589151],[5.0125480436,43.6429476523],[5.0139371697,43.6424106793],[5.0191527121,43.6406532761],[5.0290209282,43.637333633],[5.0330522069,43.6359297833],[5.0346701863,43.6354260639],[5.0386670087,43.6342107654],[5.0499705917,43.6311016831],[5.0569019783,43.629806013],[5.0635948386,43.6285360275],[5.0762567312,43.6263902765],[5.0810785679,43.6254825655],[5.0846331599,43.623598952],[5.0868710045,43.6212193621],[5.0897519816,43.614155897],[5.0916423262,43.6118765053],[5.0921973177,43.6110278388],[5.0946231,43.605709298],[5.0953266154,43.6016048545],[5.0951466273,43.6004409207],[5.0952522712,43.6000779506],[5.0960900433,43.5988718818],[5.0952181826,43.5984323614],[5.0897015178,43.5967213722],[5.0892756525,43.5965558494]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000015365","CODE_COM":"022","INSEE_COM":"13022","NOM_COM":"CASSIS","STATUT":"Commune simple","X_CHF_LIEU":906261.0,"Y_CHF_LIEU":6238451.0,"X_CENTROID":907353.0,"Y_CENTROID":6239234.0,"Z_MOYEN":172.0,"SUPERFICIE":"2618","POPULATION":"7446","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.555629,43.188473],[5.555443,43.188473],[5.5553090051,43.1884730005],[5.5553039985,43.1884750304],[5.5538218257,43.1894181865],[5.552916,43.1901456178],[5.552916,43.190418],[5.552638,43.190418],[5.552638,43.190693],[5.5522343572,43.1906930003],[5.552163665,43.1907497677],[5.552084,43.1908255494],[5.552084,43.190971],[5.5519310949,43.1909710003],[5.550972,43.1918833178],[5.550972,43.192081],[5.5507609849,43.1920840363],[5.550694,43.1921477522],[5.550694,43.192684],[5.550694,43.192917],[5.550422,43.192921],[5.550416,43.193195],[5.55012,43.193195],[5.5496645984,43.1931950002],[5.5495877631,43.1932774623],[5.549584,43.1932822937],[5.549584,43.193474],[5.5494346834,43.1934740001],[5.549306,43.1936392146],[5.549306,43.193748],[5.5492398318,43.1937480001],[5.549028,43.1941019572],[5.549028,43.194305],[5.5489064842,43.1943050001],[5.54875,43.19456647],[5.54875,43.194584],[5.5487395086,43.194584],[5.548472,43.1950309748],[5.548472,43.195415],[5.5482421623,43.1954150001],[5.548194,43.1954954716],[5.548194,43.196251],[5.5479200099,43.196251],[5.547918,43.1962624609],[5.547918,43.196804],[5.548194,43.196804],[5.548194,43.197361],[5.548472,43.197361],[5.548472,43.197639],[5.547918,43.197639],[5.547918,43.197918],[5.54764,43.197918],[5.54764,43.198471],[5.5475306645,43.1984710001],[5.5475303243,43.1984729396],[5.5476332669,43.200025645],[5.5477916187,43.2009380693],[5.5489298934,43.2042068605],[5.5497627757,43.2067421928],[5.5499085143,43.2073678278],[5.5492076359,43.2080179659],[5.5486703121,43.2083042487],[5.5457795451,43.2096000427],[5.544862,43.2097896624],[5.544862,43.209862],[5.5445119523,43.2098620008],[5.54377385,43.2100145275],[5.5392459758,43.2105999467],[5.5380516254,43.2123433826],[5.5376158466,43.2135703889],[5.5380000257,43.2138286458],[5.5380039779,43.2139185499],[5.5372362853,43.2144810829],[5.5369302938,43.2144900762],[5.536148962,43.2142663481],[5.5338694728,43.2136062163],[5.5332437055,43.2134220138],[5.532040623,43.2127833714],[5.5316313955,43.2123600003],[5.531529,43.21236],[5.5315278439,43.2122528687],[5.5313626863,43.2120820001],[5.531251,43.212082],[5.531251,43.2119853334],[5.5298811626,43.2109287881],[5.5281797351,43.2096970121],[5.5275439834,43.2093114207],[5.5270487792,43.2090260016],[5.526806,43.209026],[5.526806,43.20888607],[5.5265733928,43.208752],[5.526528,43.208752],[5.526528,43.2087258365],[5.5239594646,43.2072453105],[5.5193014916,43.2047631791],[5.5183673236,43.204304005],[5.51764,43.204304],[5.51764,43.204029],[5.517084,43.204029],[5.517084,43.203751],[5.516527,43.203751],[5.516527,43.2033993815],[5.5161091988,43.2031940003],[5.515971,43.203194],[5.515971,43.2031260643],[5.5157637992,43.2030242076],[5.5153262838,43.2028931147],[5.514889119,43.2029959998],[5.5142268174,43.2032400222],[5.5141110598,43.2033786123],[5.5141569969,43.2040381083],[5.5143549457,43.2044591744],[5.5163502559,43.2060649815],[5.518395875,43.2074958903],[5.5190961892,43.2079250238],[5.5195495479,43.2083617194],[5.5202973085,43.2096519],[5.5194768924,43.2092624754],[5.5172452561,43.207799924],[5.5136527633,43.2050875031],[5.5134247942,43.2045820007],[5.512989,43.204582],[5.512917041,43.204582215],[5.512917041,43.204410552],[5.512917041,43.204303742],[5.512639046,43.204303742],[5.512639001,43.203746684],[5.512639001,43.2028394999],[5.5124980948,43.2025270282],[5.5107538747,43.1991082176],[5.5101907008,43.1978964908],[5.5103116542,43.1988962197],[5.5114734591,43.2043966852],[5.5127130424,43.2072971808],[5.5147317161,43.2092687616],[5.5161269271,43.2111603531],[5.5174203401,43.2134241907],[5.5176323156,43.214137416],[5.5178913713,43.2154786176],[5.5177338092,43.2159286755],[5.5167301747,43.2171526362],[5.5120296985,43.2215945715],[5.507665473,43.2261724849],[5.5065996074,43.2278711814],[5.5063912128,43.2296759587],[5.5064726593,43.2301060533],[5.5070802548,43.2331851463],[5.5084099461,43.2343548235],[5.5090143471,43.2348087653],[5.5098041679,43.2350540995],[5.5148956871,43.2350382117],[5.5184170483,43.2380511535],[5.5199318932,43.2412260429],[5.5192762916,43.2416895335],[5.5194694808,43.2435767918],[5.5196413481,43.2443269687],[5.5216901138,43.2447264342],[5.5246466265,43.2448814445],[5.5299790654,43.2452858274],[5.5348666895,43.2456796923],[5.5403117035,43.2461205257],[5.5449206442,43.2465006953],[5.5472076601,43.2466294689],[5.549184721,43.246848312],[5.5506768244,43.2470695758],[5.5513129753,43.2473119466],[5.5528985026,43.2479746728],[5.5547889664,43.2486274629],[5.5554838114,43.2479981204],[5.5588251647,43.2449417895],[5.568660288,43.2406186594],[5.5746999001,43.2365651975],[5.5752309955,43.2350603312],[5.5766920415,43.2334873714],[5.5769531165,43.2332696401],[5.5805851057,43.2352159821],[5.5836495236,43.2371271947],[5.5864468987,43.2389808253],[5.5882476802,43.2400743791],[5.5902737049,43.2388890812],[5.5943316347,43.2363535263],[5.594329614,43.2363085745],[5.5920979542,43.2364746799],[5.5890669755,43.2346286005],[5.587811489,43.2293864938],[5.5878681679,43.2287839354],[5.5882707413,43.2266178869],[5.5891844436,43.2242964811],[5.5898670549,43.2231074096],[5.5907940356,43.2215506707],[5.5913878458,43.2206328205],[5.5924648568,43.218801568],[5.5916255852,43.2180612298],[5.5823544833,43.208625703],[5.5761842326,43.2047106775],[5.5748312398,43.204634974],[5.5741634808,43.20450331],[5.5726037057,43.2039834237],[5.5667200254,43.2012859269],[5.5653733497,43.2004917804],[5.5635354931,43.1986914249],[5.5626886499,43.1978484732],[5.5623465228,43.1970133297],[5.5620650477,43.1961587464],[5.5606530106,43.1939972547],[5.5591865295,43.191964837],[5.5586611818,43.1913509248],[5.5580045868,43.1906060286],[5.5568961414,43.1894614582],[5.5559919528,43.1886792222],[5.5556860448,43.1884730001],[5.555629,43.188473]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000015374","CODE_COM":"038","INSEE_COM":"84038","NOM_COM":"CHEVAL-BLANC","STATUT":"Commune simple","X_CHF_LIEU":866031.0,"Y_CHF_LIEU":6302365.0,"X_CENTROID":870710.0,"Y_CENTROID":6301444.0,"Z_MOYEN":288.0,"SUPERFICIE":"5853","POPULATION":"4113","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.048139095,43.789726257],[5.0867590359,43.7737322135],[5.0820122525,43.7756418135],[5.0653976139,43.7823232106],[5.0566739955,43.7857711703],[5.0514850036,43.7878799829],[5.049651466,43.7887264465],[5.0480853494,43.7897550904],[5.0463475613,43.7910578893],[5.0454440762,43.7918895133],[5.0447469039,43.792896395],[5.0440726493,43.7944060436],[5.0436368201,43.7959463255],[5.0432228916,43.7989696975],[5.0430535352,43.8009082673],[5.0431968105,43.8026222342],[5.0431353292,43.8039277558],[5.042624868,43.8065020976],[5.048139095,43.789726257]]],[[[5.1237983338,43.7587450658],[5.123784797,43.7587482507],[5.123784935,43.758750382],[5.1237983338,43.7587450658]]],[[[5.1387875458,43.7527962539],[5.1387814791,43.7527935195],[5.1329856529,43.7550568282],[5.1292830407,43.7565687144],[5.1387875458,43.7527962539]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000016056","CODE_COM":"097","INSEE_COM":"83097","NOM_COM":"POURRIERES","STATUT":"Commune simple","X_CHF_LIEU":921134.0,"Y_CHF_LIEU":6271031.0,"X_CENTROID":921424.0,"Y_CENTROID":6270137.0,"Z_MOYEN":415.0,"SUPERFICIE":"5718","POPULATION":"4754","CODE_ARR":"3","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.717834949,43.535106659],[5.7175547025,43.5324380954],[5.7174687938,43.5343254384],[5.7178587079,43.538171472],[5.7203611839,43.5440279736],[5.7228183963,43.5481624789],[5.7246167567,43.5509000697],[5.7250711407,43.551267674],[5.7250712666,43.5512676562],[5.717834949,43.535106659]]],[[[5.7148308852,43.5064886604],[5.7137705054,43.5082532624],[5.7128740369,43.5121350142],[5.7153898449,43.5159007818],[5.7160003816,43.5176331139],[5.7148308852,43.5064886604]]],[[[5.6988255765,43.4821714539],[5.6988051887,43.4821727629],[5.6988068624,43.4821766487],[5.6988255765,43.4821714539]]],[[[5.7249014508,43.4687084534],[5.7142304481,43.4748190297],[5.7145914556,43.4759540245],[5.7249014508,43.4687084534]]],[[[5.748126118,43.4389225316],[5.7445096264,43.4434131237],[5.7373667994,43.4528236831],[5.7355356852,43.4558805248],[5.748126118,43.4389225316]]],[[[5.77399969,43.421569825],[5.7878099906,43.4204145353],[5.7865129181,43.4204997495],[5.7862628575,43.4204620739],[5.7833587361,43.4198363994],[5.7808356254,43.419682475],[5.7794911702,43.4198961347],[5.7771662906,43.420420292],[5.774740261,43.4211270313],[5.770391658,43.4233043405],[5.7681439508,43.4245896985],[5.7661118767,43.4260403498],[5.77399969,43.421569825]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000016142","CODE_COM":"120","INSEE_COM":"83120","NOM_COM":"SAINT-ZACHARIE","STATUT":"Commune simple","X_CHF_LIEU":919398.0,"Y_CHF_LIEU":6257647.0,"X_CENTROID":920118.0,"Y_CENTROID":6257176.0,"Z_MOYEN":388.0,"SUPERFICIE":"2720","POPULATION":"5086","CODE_ARR":"3","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7499352426,43.4015275104],[5.7499918755,43.4015140198],[5.7499887121,43.4015139237],[5.7499352426,43.4015275104]]],[[[5.722596169,43.408470154],[5.7171018497,43.4083339101],[5.7211967176,43.4084843861],[5.7244316233,43.4088747218],[5.7321039241,43.4070745617],[5.740073254,43.4045209819],[5.7484566092,43.4019032216],[5.722596169,43.408470154]]],[[[5.703262806,43.407989502],[5.684464436,43.3998888359],[5.6892201585,43.4020064768],[5.6964739844,43.4071090895],[5.6981458173,43.4075850317],[5.7012799529,43.4080694816],[5.7037208447,43.4080009294],[5.703262806,43.407989502]]],[[[5.689275265,43.389785766],[5.694175243,43.365524292],[5.6960930738,43.3631881892],[5.6945703861,43.3643985],[5.6934040103,43.3675537142],[5.6932024878,43.3682572368],[5.6911849766,43.3779686339],[5.6900222838,43.3851743963],[5.6878766968,43.3917708847],[5.6866377329,43.3930204493],[5.6857028204,43.3942795587],[5.6846526784,43.3959537877],[5.682960486,43.3986592953],[5.6827924547,43.3991594444],[5.6827924944,43.3991594602],[5.689275265,43.389785766]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000016632","CODE_COM":"068","INSEE_COM":"13068","NOM_COM":"PARADOU","STATUT":"Commune simple","X_CHF_LIEU":844102.0,"Y_CHF_LIEU":6292987.0,"X_CENTROID":843058.0,"Y_CENTROID":6291807.0,"Z_MOYEN":27.0,"SUPERFICIE":"1586","POPULATION":"1750","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.797425459,43.7301969062],[4.7970039238,43.728670137],[4.7969530788,43.7278411078],[4.7966417624,43.7176043393],[4.7963131403,43.7089880379],[4.796383731,43.7063334902],[4.7984109667,43.7027348689],[4.7997442122,43.7003123697],[4.8000092593,43.6992720187],[4.7962426267,43.6909160507],[4.7925075629,43.6820275695],[4.7921490842,43.6811532314],[4.7899410347,43.6822075361],[4.7856640767,43.6830977647],[4.7824939388,43.6834512688],[4.7812519283,43.6831142948],[4.7806554491,43.6831960632],[4.7774806794,43.6840409198],[4.7755312585,43.6844480712],[4.7683945725,43.6877306605],[4.7588861507,43.6934182562],[4.7586283381,43.6958489435],[4.7588266259,43.6982668623],[4.7588710674,43.7025017698],[4.7585526422,43.7037678853],[4.7582034572,43.7043153575],[4.7574697632,43.7048258363],[4.755460831,43.7071641896],[4.7539569159,43.7099947983],[4.7532269155,43.7117643632],[4.7518812931,43.7154366497],[4.7514965257,43.7165697112],[4.7513194561,43.7182457646],[4.751410473,43.7192334628],[4.7517365885,43.719630541],[4.7525627743,43.720106874],[4.7537034308,43.7203963235],[4.7550189677,43.7206820419],[4.7570237522,43.7211852372],[4.7579054016,43.721525627],[4.7623445469,43.7238633164],[4.7626006045,43.7240373833],[4.7633729425,43.7246945227],[4.7658236523,43.7269328624],[4.766615158,43.728047804],[4.7668237714,43.7290965966],[4.7670315776,43.7290734225],[4.7712838813,43.7289917218],[4.7747197237,43.7302795715],[4.7764703633,43.7322959813],[4.7769821426,43.7327079632],[4.7803860121,43.732876474],[4.7898361205,43.7329618547],[4.797425459,43.7301969062]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000016924","CODE_COM":"053","INSEE_COM":"13053","NOM_COM":"MALLEMORT","STATUT":"Commune simple","X_CHF_LIEU":875611.0,"Y_CHF_LIEU":6294848.0,"X_CENTROID":875451.0,"Y_CENTROID":6294904.0,"Z_MOYEN":121.0,"SUPERFICIE":"2860","POPULATION":"6063","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1292830407,43.7565687144],[5.1329856529,43.7550568282],[5.1387814791,43.7527935195],[5.1404956797,43.7520747999],[5.1621908959,43.7434346921],[5.1665903655,43.741604479],[5.1733167415,43.7388049705],[5.1869788426,43.7353240258],[5.1879758806,43.73509965],[5.1906605168,43.7358918451],[5.2027566029,43.7394483832],[5.2363608254,43.7474668301],[5.2363786823,43.7474662521],[5.2372689542,43.7474382869],[5.2455524275,43.7471352185],[5.2419116549,43.7438101375],[5.2389772548,43.7409790363],[5.2314834123,43.7336728692],[5.2278531008,43.7306370218],[5.2239622999,43.7284588769],[5.2237745304,43.7284186031],[5.2234979985,43.7227053037],[5.2237412448,43.7201797911],[5.2241424512,43.7168327795],[5.2253646866,43.7098646317],[5.2259939121,43.7075994943],[5.2261496991,43.707010286],[5.2199899041,43.7057309355],[5.2157072088,43.7025442623],[5.2111708925,43.6988818969],[5.2098457892,43.6979168238],[5.208916739,43.6972794613],[5.2082396123,43.6972869049],[5.2044493268,43.6975771066],[5.2001990966,43.6989431822],[5.1980447783,43.6997077622],[5.1966299892,43.7002161254],[5.1956413575,43.7014846193],[5.1941622954,43.7014505421],[5.1933627642,43.7024748552],[5.1891661724,43.7067208661],[5.1845436532,43.7105854891],[5.1800007481,43.7137866892],[5.1706178574,43.7170087137],[5.161756299,43.7204563083],[5.1501695246,43.7246069578],[5.1394359305,43.726818623],[5.1261277748,43.7292847675],[5.125329144,43.7294398879],[5.1255405618,43.7324927337],[5.1255135113,43.736010229],[5.1252368061,43.7382210529],[5.1245409531,43.7464334286],[5.1238677054,43.7566321021],[5.123784797,43.7587482507],[5.1237983338,43.7587450658],[5.1292830407,43.7565687144]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000016975","CODE_COM":"030","INSEE_COM":"13030","NOM_COM":"CUGES-LES-PINS","STATUT":"Commune simple","X_CHF_LIEU":919316.0,"Y_CHF_LIEU":6245652.0,"X_CENTROID":920475.0,"Y_CENTROID":6246837.0,"Z_MOYEN":437.0,"SUPERFICIE":"3972","POPULATION":"4947","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7265425047,43.3173564935],[5.7265973172,43.3173590442],[5.7289585063,43.3135153816],[5.7330599764,43.307758139],[5.736998559,43.301898956],[5.7474681498,43.2919652616],[5.7491790443,43.2899628095],[5.7498397694,43.2892709179],[5.7560077074,43.284881474],[5.7580191185,43.2836843141],[5.7594143058,43.2833084495],[5.7623353329,43.282592999],[5.7627617557,43.2823729134],[5.7627938966,43.2823552849],[5.7621979479,43.2775580449],[5.7608584947,43.2691084854],[5.7609265389,43.2673447249],[5.7609007451,43.2673387625],[5.7600090504,43.2672390972],[5.7509245589,43.2654177497],[5.7420367669,43.2630578127],[5.7415112262,43.2628546636],[5.738250733,43.26210022],[5.7305684846,43.2590020786],[5.7231573602,43.2570549486],[5.7208212008,43.2564009764],[5.7136126787,43.2535824311],[5.709366147,43.2507620555],[5.705735734,43.2490457652],[5.702477444,43.2476659417],[5.70121956,43.24715805],[5.7012217448,43.2471543955],[5.7007703339,43.2472655543],[5.7004398124,43.2473854278],[5.698948536,43.2483281691],[5.6973140387,43.2494742794],[5.6962169663,43.249869801],[5.693511108,43.2508310849],[5.6868040852,43.2531313019],[5.6818800081,43.2546712875],[5.6745135313,43.256843992],[5.6666458326,43.262917686],[5.6579434113,43.2670033187],[5.6569539247,43.2670465642],[5.6569997764,43.2676943744],[5.6570689438,43.2682066033],[5.6636641544,43.2779592199],[5.6673623064,43.2823278003],[5.668360014,43.2834417498],[5.6705472674,43.2852868558],[5.6713003444,43.2856921729],[5.6749065955,43.2886407012],[5.6779067931,43.292487123],[5.6779807046,43.2972089124],[5.6780969451,43.2980665104],[5.6789809543,43.2992957154],[5.683774947,43.3004899946],[5.6888008977,43.3016854973],[5.6946508104,43.3031284596],[5.6951101553,43.3034635416],[5.6957588255,43.3058704168],[5.6953927075,43.3104817402],[5.6934676713,43.311490131],[5.6917082771,43.3124835608],[5.6910426285,43.3129582843],[5.6910653514,43.3129646578],[5.7265425047,43.3173564935]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000017445","CODE_COM":"071","INSEE_COM":"13071","NOM_COM":"LES PENNES-MIRABEAU","STATUT":"Commune simple","X_CHF_LIEU":887127.0,"Y_CHF_LIEU":6259499.0,"X_CENTROID":887136.0,"Y_CENTROID":6258862.0,"Z_MOYEN":177.0,"SUPERFICIE":"3372","POPULATION":"20018","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3322755103,43.3714410477],[5.3312344469,43.3717811838],[5.3271640792,43.372353901],[5.3269489743,43.3723126265],[5.3252089847,43.3716606242],[5.3245941273,43.3713435324],[5.31831174,43.3744924246],[5.311469822,43.3790263059],[5.3040291319,43.3848127053],[5.3031140729,43.38593739],[5.3022277638,43.386979555],[5.2979569545,43.3887470249],[5.2975666776,43.388893911],[5.2969987954,43.3889815642],[5.2948814924,43.3878456655],[5.2897269162,43.3850550159],[5.2810995417,43.3802763924],[5.280931752,43.3802457289],[5.2787911926,43.3804699203],[5.2774588637,43.3838459539],[5.2768103885,43.3855146945],[5.2764303598,43.3865144871],[5.2754227116,43.388745175],[5.2722590639,43.3913217354],[5.2713076616,43.3911680023],[5.2711610979,43.3924580795],[5.2697021093,43.3955198888],[5.2682114141,43.3977183419],[5.2661204124,43.4004729461],[5.2656684624,43.4006876064],[5.2652195118,43.4009472024],[5.2650800628,43.4010734207],[5.2659821057,43.40181955],[5.2674048814,43.4026861695],[5.2698069267,43.4038436493],[5.2707956195,43.4043116226],[5.2728916661,43.4087199998],[5.2744776111,43.4162072341],[5.2749386619,43.4188751089],[5.2760097583,43.419171211],[5.2782144027,43.419655868],[5.2809749977,43.4200540712],[5.2860291424,43.4200627062],[5.290033713,43.4197287937],[5.2948415581,43.4268128631],[5.2948574925,43.4282030767],[5.2949160761,43.4294240817],[5.2950544253,43.4296416588],[5.2962735058,43.4312241848],[5.2971879623,43.4319806266],[5.299575701,43.4327030948],[5.3006202182,43.4326953159],[5.3097058553,43.4316694267],[5.3108224141,43.4315493078],[5.3116950868,43.4314145817],[5.321195365,43.4293492215],[5.3297305317,43.4260032167],[5.3312474376,43.4251002344],[5.3356535376,43.422607587],[5.337478778,43.4218823747],[5.3441791075,43.4192822289],[5.3576872363,43.4188575788],[5.3658314126,43.4187312671],[5.3732160686,43.4197991604],[5.3748676404,43.4200248708],[5.3753699869,43.4193019099],[5.3782984584,43.4159164343],[5.3792888519,43.4146364034],[5.3783591654,43.4141887993],[5.3768573009,43.4135485369],[5.3741986265,43.4125493036],[5.3647948033,43.4099424394],[5.3606334663,43.4090485958],[5.3542884182,43.4087286231],[5.3478175906,43.4088034244],[5.3465735291,43.4081760654],[5.3459972798,43.4078798398],[5.3449638841,43.4058168417],[5.343693599,43.4026636264],[5.3429893746,43.400798702],[5.3443786082,43.3951155393],[5.3450943697,43.3929318695],[5.3466381089,43.3898077245],[5.3485831001,43.3849981119],[5.3490999777,43.3832093509],[5.3498541783,43.3825197625],[5.3503727418,43.382496802],[5.3504301827,43.3822111477],[5.3508254393,43.38122334],[5.3524400957,43.3783099902],[5.3527188383,43.377944823],[5.3531408092,43.3774010371],[5.3503613754,43.3752356946],[5.3450914993,43.375198821],[5.3405392479,43.3767895976],[5.3368512902,43.3755732787],[5.3338553831,43.373224103],[5.3330965301,43.3725519597],[5.3326134571,43.3719260678],[5.3322755103,43.3714410477]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000017540","CODE_COM":"062","INSEE_COM":"13062","NOM_COM":"MIMET","STATUT":"Commune simple","X_CHF_LIEU":902989.0,"Y_CHF_LIEU":6260382.0,"X_CENTROID":902534.0,"Y_CENTROID":6260589.0,"Z_MOYEN":459.0,"SUPERFICIE":"1888","POPULATION":"4563","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4798128872,43.3854155013],[5.479174572,43.3863544954],[5.479235332,43.3872495727],[5.4785355632,43.3883384828],[5.4763368205,43.3907892977],[5.4753929067,43.3914553394],[5.4752040794,43.3918286867],[5.4751682735,43.3959905419],[5.4751931059,43.3979458367],[5.4759171857,43.4037023765],[5.4791057483,43.408428648],[5.4784932351,43.4109476063],[5.4771437477,43.4132989091],[5.4742914086,43.4159932768],[5.4726690604,43.4173462621],[5.4711164139,43.4182250862],[5.4691624601,43.4193065572],[5.4674673183,43.4216737221],[5.4637447796,43.427022195],[5.4635178077,43.4276340192],[5.4632859624,43.4284205717],[5.464345576,43.4300634388],[5.4661238601,43.4288204393],[5.466907525,43.4294407592],[5.4773539226,43.4310295226],[5.4849878813,43.430886151],[5.4924712606,43.4307169027],[5.493419794,43.4304034372],[5.4947864109,43.4299624205],[5.4990072267,43.4286121711],[5.500013923,43.4283882153],[5.5022421255,43.4279389131],[5.5053427534,43.4282110744],[5.5066242413,43.4283704461],[5.5169052746,43.4296838082],[5.5214509944,43.4314467151],[5.5254331923,43.4351938383],[5.5288711451,43.4389967504],[5.5291384632,43.4395980922],[5.5294763799,43.4401473784],[5.5293492092,43.4396993862],[5.5301856627,43.4323177647],[5.5340816165,43.4269708971],[5.5345131878,43.4267591723],[5.5348823277,43.4264759976],[5.5359907366,43.4255373312],[5.5362694939,43.42519326],[5.5365207735,43.4247022126],[5.5368771904,43.4239629705],[5.5369276115,43.4232299959],[5.5360499524,43.4190641264],[5.5357255074,43.4185109547],[5.5352727799,43.417960786],[5.5345969386,43.4172790216],[5.5337853383,43.4168227574],[5.5332384367,43.4165448178],[5.5324350681,43.4165276046],[5.5293618305,43.4165589291],[5.5278881053,43.4164322237],[5.5228759321,43.4121188052],[5.5198950578,43.4093195995],[5.514625592,43.404288163],[5.5084658199,43.3969342161],[5.5046630509,43.3885722944],[5.5044556372,43.3880883507],[5.5013096777,43.3873195268],[5.49754718,43.3861625088],[5.4942872126,43.3852926088],[5.48962563,43.3847410873],[5.4860114925,43.3844380337],[5.4835780565,43.3844416983],[5.480750183,43.3850861981],[5.4798128872,43.3854155013]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000018504","CODE_COM":"036","INSEE_COM":"13036","NOM_COM":"EYRAGUES","STATUT":"Commune simple","X_CHF_LIEU":848060.0,"Y_CHF_LIEU":6306402.0,"X_CENTROID":848036.0,"Y_CENTROID":6306717.0,"Z_MOYEN":45.0,"SUPERFICIE":"2080","POPULATION":"4189","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8050729131,43.8541743732],[4.8060208162,43.8540965757],[4.8105798576,43.8543333631],[4.811859972,43.8544543351],[4.8159727003,43.8548540353],[4.8180618741,43.8551459966],[4.8227768151,43.8559755803],[4.8262957017,43.856782683],[4.8307338443,43.85812785],[4.8345342609,43.8591712105],[4.836741925,43.8595031343],[4.8421636278,43.860277686],[4.8454576372,43.8604992721],[4.8492958493,43.8605828138],[4.859331033,43.8599063755],[4.8735530401,43.8588736437],[4.8759286134,43.8589318441],[4.8798649608,43.8592763722],[4.8808957158,43.8595988728],[4.8818612087,43.8600170076],[4.8826799328,43.860360252],[4.8830231073,43.86035433],[4.8831699682,43.8602428745],[4.8833337124,43.8598133667],[4.8832010157,43.8543165155],[4.8831728267,43.8536877841],[4.8826060106,43.8504542628],[4.8818080155,43.8465064031],[4.8809366707,43.8450874704],[4.8789296486,43.8423009521],[4.8783010695,43.8414530247],[4.8766687512,43.8396925042],[4.874572963,43.8372585104],[4.8732613907,43.8357156729],[4.8724086581,43.8347014381],[4.8686729597,43.8300577094],[4.8685388772,43.8298358692],[4.8679980803,43.8288495669],[4.8550455579,43.825056013],[4.8516826257,43.8243723515],[4.8411900475,43.8236651817],[4.8286689358,43.8240127008],[4.8192075988,43.8253807379],[4.8164890752,43.8257122994],[4.8163375999,43.8245842531],[4.8159131804,43.8248046536],[4.8152511891,43.8258049235],[4.8149230987,43.8268275372],[4.8148787905,43.8272333356],[4.8148699199,43.8277762652],[4.8150319448,43.8288456309],[4.8146726881,43.8344873741],[4.8126931122,43.8382927811],[4.8118787301,43.8392001529],[4.8087501847,43.8388974228],[4.8046889066,43.8417425285],[4.8021210932,43.8450263917],[4.802051208,43.8465568886],[4.8027688827,43.8465576327],[4.8039506551,43.8461699376],[4.8048782605,43.8461230888],[4.805090208,43.8507454265],[4.8050729131,43.8541743732]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000018560","CODE_COM":"033","INSEE_COM":"13033","NOM_COM":"ENSUES-LA-REDONNE","STATUT":"Commune simple","X_CHF_LIEU":878758.0,"Y_CHF_LIEU":6253240.0,"X_CENTROID":877636.0,"Y_CENTROID":6253568.0,"Z_MOYEN":132.0,"SUPERFICIE":"2611","POPULATION":"5365","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.219583034,43.328750611],[5.219757557,43.328750611],[5.219861031,43.328750611],[5.219861031,43.329303742],[5.220139027,43.329303742],[5.220139027,43.329582215],[5.219861031,43.329582215],[5.219861031,43.330139161],[5.219305038,43.330139161],[5.219305038,43.330417634],[5.217916965,43.330417634],[5.217916965,43.330139161],[5.21763897,43.330139161],[5.21763897,43.329860688],[5.217360974,43.329860688],[5.217360974,43.329303742],[5.217082976,43.329303742],[5.217082976,43.329582215],[5.214582919,43.329582215],[5.214582919,43.329303742],[5.214304924,43.329303742],[5.214304924,43.3292127793],[5.211528778,43.3295498905],[5.211528778,43.329582215],[5.2112625468,43.3295822154],[5.210972785,43.3296173964],[5.210972785,43.329689025],[5.210972785,43.329860688],[5.209582805,43.329860688],[5.209582805,43.3297875075],[5.207637786,43.33006362],[5.207637786,43.330139161],[5.2071056065,43.3301391611],[5.207081795,43.3301425409],[5.207081795,43.330417634],[5.2051436188,43.330417634],[5.2024809857,43.3307954914],[5.201250077,43.3306569667],[5.201250077,43.330696107],[5.199862004,43.330696107],[5.199862004,43.330875396],[5.199862004,43.331249238],[5.199306011,43.331249238],[5.199306011,43.331527711],[5.198750019,43.331527711],[5.198750019,43.332084655],[5.198194026,43.332084655],[5.198194026,43.332359315],[5.197916031,43.332359315],[5.197916031,43.332084655],[5.197639942,43.332084655],[5.197639942,43.331806184],[5.197361947,43.331806184],[5.197361947,43.331249238],[5.197083949,43.331249238],[5.197083949,43.331172942],[5.197083949,43.330696107],[5.197361947,43.330696107],[5.197361947,43.330261232],[5.197361947,43.3302193059],[5.195438657,43.3300027599],[5.1852903947,43.3320162779],[5.1847719869,43.3324875181],[5.1856975676,43.3336180306],[5.1855290221,43.3361628537],[5.1839350902,43.3365262289],[5.1732515189,43.3432488667],[5.1668973784,43.3503895624],[5.1539601506,43.358476503],[5.1483029186,43.3620537565],[5.139668126,43.3643253192],[5.1387180188,43.3644826941],[5.1389418127,43.3651613256],[5.1395234136,43.367236793],[5.1400086806,43.3687768998],[5.1403402478,43.369433601],[5.1409303011,43.3699087988],[5.1416006689,43.3699891281],[5.1489542055,43.368964097],[5.1512688069,43.3686112241],[5.1523828703,43.368383882],[5.1536359008,43.3681123649],[5.1557683683,43.3675749305],[5.1582587552,43.3669448199],[5.1615087706,43.3660798919],[5.1636412575,43.3654811033],[5.1682492533,43.3642243276],[5.1735127112,43.3628875916],[5.17449825,43.3627894936],[5.1754362647,43.3628048361],[5.1811375626,43.3642433746],[5.1850743659,43.3661150476],[5.1844135308,43.3693439377],[5.1852738231,43.3727698137],[5.1864464863,43.3753542173],[5.1879216403,43.3783959828],[5.1897980575,43.3808563407],[5.1918895398,43.3817013732],[5.1943470904,43.3822752546],[5.195498567,43.3825407936],[5.1965079844,43.3800201956],[5.1995903843,43.3744389875],[5.2006322313,43.3765849285],[5.2018703938,43.3781193909],[5.206466457,43.3805376069],[5.2094495164,43.3812984265],[5.2119396869,43.3817533489],[5.212785343,43.3818611594],[5.2132989074,43.3819001571],[5.2142760748,43.3818981695],[5.2142836959,43.3814867244],[5.2147808302,43.3802966842],[5.2155925616,43.3784009221],[5.2158977587,43.3777070933],[5.2163792761,43.377010553],[5.2169456029,43.3763059736],[5.2216326415,43.3718908844],[5.2261506781,43.3693771082],[5.2306500194,43.3602118537],[5.2347978641,43.3521318633],[5.2360561181,43.3443878018],[5.2355530611,43.3446114902],[5.2353209806,43.3445730887],[5.2349949681,43.344465531],[5.2340353267,43.3440128784],[5.2335163361,43.3436348154],[5.2333882663,43.3429075955],[5.2333086187,43.3424115645],[5.2334130831,43.3419891283],[5.234251788,43.3388471646],[5.2347186055,43.3371816066],[5.2371034396,43.3317910915],[5.2371710712,43.3317230962],[5.2369689851,43.3315985839],[5.2332790633,43.3304833189],[5.2300915155,43.3295717597],[5.2276236339,43.3288738723],[5.2254128592,43.3283839257],[5.2240976171,43.328194999],[5.2227442124,43.3282309266],[5.2213339498,43.3283588994],[5.219583034,43.3285716441],[5.219583034,43.328750611]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000019231","CODE_COM":"049","INSEE_COM":"13049","NOM_COM":"LAMANON","STATUT":"Commune simple","X_CHF_LIEU":868193.0,"Y_CHF_LIEU":6291427.0,"X_CENTROID":868275.0,"Y_CENTROID":6292308.0,"Z_MOYEN":148.0,"SUPERFICIE":"1946","POPULATION":"1977","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0727589355,43.6838173049],[5.0720344247,43.684533205],[5.0711682309,43.6858593825],[5.0709399488,43.6862696853],[5.0677261913,43.6934202179],[5.0624953719,43.6996367831],[5.0611591739,43.7032914345],[5.0601225085,43.7098964512],[5.0543514403,43.7156475996],[5.0542004365,43.7165235841],[5.0538202195,43.718898126],[5.0536811813,43.7214922549],[5.0538348253,43.7238378274],[5.0572136242,43.7229125878],[5.0624775054,43.7216391905],[5.0631802234,43.7215421599],[5.0649315951,43.7212011005],[5.0664131886,43.7223611762],[5.0666475967,43.723972489],[5.072350876,43.7261999487],[5.0785459993,43.7278074279],[5.0793226643,43.7275576561],[5.0820293372,43.72672279],[5.0844503069,43.7260886599],[5.0880882295,43.7252664105],[5.090166674,43.7251131027],[5.0940109031,43.7248447881],[5.0973225683,43.7246091031],[5.0981559332,43.7243518015],[5.0987026524,43.7241306256],[5.1000083718,43.7235203418],[5.1015498164,43.7227389624],[5.1022486753,43.7223690056],[5.1029536632,43.7219296137],[5.1032701275,43.7216921591],[5.1036068009,43.7213291911],[5.1040007994,43.7203647099],[5.1050360217,43.7187811237],[5.1074349232,43.7157083812],[5.1098656081,43.7136062366],[5.1159337237,43.7085924932],[5.1165912546,43.7082529513],[5.1168211007,43.7080927542],[5.1172239068,43.7078112718],[5.1178851867,43.7073051207],[5.1203738434,43.705347435],[5.1219116554,43.7026800148],[5.123179282,43.6998234148],[5.1228956113,43.6986974619],[5.1219938582,43.6980336393],[5.1217670331,43.6971352143],[5.1216210556,43.696443147],[5.1214644855,43.6927853055],[5.1219019217,43.6916002857],[5.1225021673,43.6914283513],[5.1260413301,43.6905581179],[5.1208828571,43.688702792],[5.117644796,43.6871132116],[5.115788649,43.685085308],[5.1143077379,43.6867685561],[5.1133908651,43.6878053297],[5.1131004164,43.6880693118],[5.098981221,43.6844333604],[5.0965701521,43.6846418795],[5.0946740599,43.6847891226],[5.0909855049,43.6850689152],[5.0808855714,43.6853525942],[5.0798318224,43.6853340402],[5.0740829284,43.6843465465],[5.0727589355,43.6838173049]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000019295","CODE_COM":"076","INSEE_COM":"13076","NOM_COM":"PLAN-D'ORGON","STATUT":"Commune simple","X_CHF_LIEU":861044.0,"Y_CHF_LIEU":6303357.0,"X_CENTROID":861524.0,"Y_CENTROID":6304460.0,"Z_MOYEN":71.0,"SUPERFICIE":"1500","POPULATION":"3137","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.998592246,43.8443471961],[4.9995310236,43.8437278439],[5.0039884125,43.8407402095],[5.0113477644,43.8368266222],[5.0201648411,43.8322103895],[5.0239843927,43.8302275524],[5.0260040626,43.8293222603],[5.0277259355,43.8285777528],[5.0353446575,43.8201507993],[5.0353475901,43.820140913],[5.0345087511,43.8194877256],[5.0264628363,43.811610589],[5.0247583646,43.8102361707],[5.0221321469,43.8083135157],[5.0165121319,43.8049204218],[5.0082348484,43.8029227103],[5.000848802,43.7997035972],[4.992273265,43.7968829252],[4.9888124043,43.7958884371],[4.9839684158,43.7947831039],[4.9682085288,43.7909578283],[4.9680843444,43.7909600711],[4.96681314,43.7919353864],[4.9668174758,43.7920253238],[4.9714034626,43.7945313216],[4.9777078149,43.7979493419],[4.9810159324,43.7996670912],[4.9837523797,43.8010935953],[4.9844574957,43.8015713514],[4.9838876731,43.8026646261],[4.9765111408,43.8144558267],[4.9728852657,43.8195804736],[4.9727178681,43.8199894812],[4.9747780479,43.8202087375],[4.9897101966,43.8231554151],[4.9900947449,43.8234157512],[4.9903045053,43.8239052223],[4.9908376174,43.830286796],[4.9910516821,43.8337900155],[4.9918214671,43.8383219146],[4.9920645208,43.8398000901],[4.9949834698,43.8424365155],[4.9976450115,43.8448534377],[4.9976568301,43.8448531642],[4.998592246,43.8443471961]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000019451","CODE_COM":"020","INSEE_COM":"13020","NOM_COM":"CADOLIVE","STATUT":"Commune simple","X_CHF_LIEU":906520.0,"Y_CHF_LIEU":6258458.0,"X_CENTROID":905644.0,"Y_CENTROID":6258468.0,"Z_MOYEN":448.0,"SUPERFICIE":"422","POPULATION":"2123","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5559252118,43.4050627214],[5.5548317361,43.4047365883],[5.5544137646,43.4040533673],[5.5546567998,43.4038271062],[5.5551021255,43.4023179171],[5.5555641052,43.4001278538],[5.5536516832,43.3983133667],[5.5503002067,43.3951916134],[5.5478745414,43.3932631161],[5.54490332,43.390939656],[5.5446709309,43.3907921033],[5.5432827243,43.3903242781],[5.5345268162,43.3883271397],[5.5271430848,43.3874358892],[5.5145378795,43.3835755991],[5.5057607731,43.3873371794],[5.5044556372,43.3880883507],[5.5058254107,43.3886804022],[5.5068983247,43.389143401],[5.5226109537,43.395371483],[5.5346317743,43.4004939609],[5.5424485049,43.4032936023],[5.5500371137,43.4047443146],[5.5547603417,43.405380951],[5.5559252118,43.4050627214]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000019582","CODE_COM":"213","INSEE_COM":"13213","NOM_COM":"MARSEILLE-13E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":893047.0,"Y_CHF_LIEU":6252491.0,"X_CENTROID":897304.0,"Y_CENTROID":6252869.0,"Z_MOYEN":192.0,"SUPERFICIE":"2800","POPULATION":"90555","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4105321621,43.3149817142],[5.4099229081,43.3150906971],[5.4052402239,43.315794379],[5.3990916532,43.3169659926],[5.3976877982,43.3169971368],[5.3936400283,43.3164640391],[5.3935634697,43.3184790159],[5.3969000168,43.3207279806],[5.4015223603,43.3263151984],[5.4061004676,43.3311166418],[5.4072708492,43.3333388104],[5.4088829598,43.3367166465],[5.4106926141,43.3415399909],[5.4136568012,43.3475390976],[5.4160607474,43.3528108587],[5.4147381053,43.355888775],[5.4126077008,43.3600638289],[5.41355022,43.3628040952],[5.413820604,43.3637808963],[5.4139056803,43.3660461775],[5.4139054277,43.3683358672],[5.4135288333,43.3708598647],[5.413547214,43.375978866],[5.4147469088,43.3777827836],[5.4153866211,43.378766653],[5.4158288666,43.3789844921],[5.4169923415,43.3795696421],[5.4237347897,43.3829749298],[5.4245750667,43.3834124328],[5.4262387212,43.3834462541],[5.4342129804,43.3868899055],[5.4403022295,43.3873018197],[5.4471970356,43.3869778364],[5.4475015298,43.3869700512],[5.4480364336,43.3863441144],[5.4504182494,43.3832129183],[5.453690377,43.3783360833],[5.4565198318,43.3744907647],[5.4583292938,43.372049232],[5.4597153602,43.3697505033],[5.4610404239,43.3674414452],[5.4632870472,43.3627991712],[5.4642465744,43.3604011964],[5.4636625944,43.3590050254],[5.4619094339,43.3566886217],[5.4608914422,43.3557847406],[5.4586144653,43.3537034191],[5.4575033953,43.3525523154],[5.453176741,43.3475428239],[5.452771127,43.3468796979],[5.4518727245,43.3450982032],[5.4514214516,43.3436800836],[5.4508225961,43.3407343601],[5.4504530789,43.3388886772],[5.4521726795,43.3369056431],[5.4549631656,43.3357217999],[5.4550038894,43.3355489705],[5.4558235867,43.3343279245],[5.457495888,43.3324574826],[5.466357314,43.3233022908],[5.4666359538,43.3230151276],[5.4658178268,43.3226791811],[5.4638991731,43.3217158],[5.4630830354,43.3203006663],[5.4595177028,43.3179805907],[5.4542728311,43.3191096003],[5.4512879182,43.3195292251],[5.4473731669,43.3199113187],[5.4439308937,43.3200413872],[5.4410883403,43.3212054189],[5.4377407496,43.3231970724],[5.43606698,43.3237289032],[5.4286720181,43.3230924579],[5.4243019514,43.3217730235],[5.4177684959,43.3198304179],[5.4153620517,43.3183821055],[5.4137941033,43.3160852274],[5.4114986604,43.3148386596],[5.4105321621,43.3149817142]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000019739","CODE_COM":"086","INSEE_COM":"13086","NOM_COM":"ROQUEVAIRE","STATUT":"Commune simple","X_CHF_LIEU":911260.0,"Y_CHF_LIEU":6253505.0,"X_CENTROID":910388.0,"Y_CENTROID":6252103.0,"Z_MOYEN":310.0,"SUPERFICIE":"2399","POPULATION":"8776","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6095881876,43.3662134604],[5.6098195619,43.366064763],[5.6128478077,43.3627341989],[5.6198441973,43.3544946848],[5.6288908787,43.3449582716],[5.6303334563,43.3431671098],[5.6327918371,43.3406950353],[5.6358489246,43.338483742],[5.6448921121,43.334542846],[5.6496988437,43.3276015534],[5.6499115961,43.3271606948],[5.6499657398,43.3270243541],[5.6487519029,43.3253475254],[5.6474890477,43.3238366036],[5.6468365051,43.3231577129],[5.6457006164,43.3235509512],[5.6362214013,43.3267077806],[5.6285732316,43.3247256896],[5.6189072977,43.3227937701],[5.615551838,43.3233160363],[5.6112395977,43.3237830033],[5.6096354923,43.323833435],[5.6066167338,43.3242797879],[5.601806707,43.3248924863],[5.6010402937,43.3249838327],[5.6005391164,43.325051693],[5.5998585374,43.3252147722],[5.5987285063,43.3254993597],[5.5951933533,43.326418637],[5.5896691505,43.3281550143],[5.5845834621,43.3298617214],[5.57940624,43.331623472],[5.576735573,43.3324504036],[5.5754217645,43.3328219284],[5.5714689148,43.3338484705],[5.5646525487,43.3352299372],[5.5532488684,43.3362234395],[5.5494001447,43.3359659181],[5.5484615986,43.3358224293],[5.548355603,43.3374126335],[5.5481067247,43.3395642446],[5.555322871,43.3472884709],[5.5626640677,43.3545080011],[5.5634725628,43.3549919882],[5.5653085774,43.3562238758],[5.5656900408,43.35667387],[5.5678830434,43.3583571926],[5.5688503211,43.3589417837],[5.5705459144,43.3598411947],[5.5719924683,43.3605493833],[5.5748126201,43.3614903962],[5.5755656928,43.3617235947],[5.5760854134,43.3617868278],[5.58636669,43.3659105741],[5.587573269,43.3666243022],[5.5892605051,43.3672437074],[5.5954869761,43.3681674372],[5.5971639248,43.3682001045],[5.6008019285,43.3682180277],[5.6029707223,43.3682135782],[5.6062885784,43.3667187447],[5.6075987894,43.3662002192],[5.6095881876,43.3662134604]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000019741","CODE_COM":"061","INSEE_COM":"13061","NOM_COM":"SAINT-PIERRE-DE-MEZOARGUES","STATUT":"Commune simple","X_CHF_LIEU":832567.0,"Y_CHF_LIEU":6308049.0,"X_CENTROID":833018.0,"Y_CENTROID":6308522.0,"Z_MOYEN":11.0,"SUPERFICIE":"434","POPULATION":"227","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6469561492,43.8520923033],[4.6463355135,43.8526004274],[4.6450233582,43.8547326989],[4.647040367,43.858154296],[4.6419151007,43.8674674225],[4.6419145399,43.8674765726],[4.6422925426,43.8676419065],[4.6460495383,43.8686213359],[4.6485959205,43.8691652741],[4.6496860715,43.8695178485],[4.650481069,43.8698604746],[4.6515941299,43.8707032487],[4.6544733169,43.8728946366],[4.6552051115,43.8735286542],[4.656837463,43.874271394],[4.66129589,43.873962402],[4.6624076502,43.8708761687],[4.6624214384,43.8708295941],[4.6630806404,43.8688554862],[4.663226076,43.8685517293],[4.6660447967,43.8635823776],[4.6692950107,43.8608377505],[4.6719271581,43.8557297927],[4.670532897,43.8528428796],[4.6686710006,43.8488874768],[4.6681081813,43.8475450183],[4.6675527935,43.8475643106],[4.6671793845,43.8474692055],[4.6666783617,43.84722033],[4.6660787223,43.8487929804],[4.6658817236,43.8500561436],[4.6652949732,43.8508779019],[4.6640271562,43.851804559],[4.6624930219,43.8525570377],[4.660159401,43.8532361523],[4.6586664103,43.853223756],[4.6518465451,43.8523704087],[4.6509879735,43.8521872903],[4.6469561492,43.8520923033]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000019856","CODE_COM":"052","INSEE_COM":"13052","NOM_COM":"MAILLANE","STATUT":"Commune simple","X_CHF_LIEU":843341.0,"Y_CHF_LIEU":6305361.0,"X_CENTROID":843943.0,"Y_CENTROID":6304610.0,"Z_MOYEN":11.0,"SUPERFICIE":"1691","POPULATION":"2465","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.802051208,43.8465568886],[4.8021210932,43.8450263917],[4.8046889066,43.8417425285],[4.8087501847,43.8388974228],[4.8118787301,43.8392001529],[4.8126931122,43.8382927811],[4.8146726881,43.8344873741],[4.8150319448,43.8288456309],[4.8148699199,43.8277762652],[4.8148787905,43.8272333356],[4.8149230987,43.8268275372],[4.8152511891,43.8258049235],[4.8159131804,43.8248046536],[4.8163375999,43.8245842531],[4.8162186743,43.8237761131],[4.8160007745,43.8230614354],[4.8139589578,43.8185830598],[4.8131351674,43.8171070467],[4.8121956186,43.8161739307],[4.8110719007,43.815116049],[4.8070483759,43.8126489544],[4.8029020737,43.8104159832],[4.7985804315,43.8086439172],[4.7921880033,43.8080885056],[4.7811633222,43.8058550799],[4.7701938908,43.8022460911],[4.7655053163,43.7992824655],[4.7645058859,43.7984678505],[4.7641765806,43.799032147],[4.7600086872,43.8039637033],[4.7591226942,43.8050185299],[4.7581077944,43.8063283591],[4.7573542747,43.8075304534],[4.7556652182,43.8104461216],[4.7541950405,43.8132898363],[4.7524832179,43.8166495826],[4.7511748624,43.8175221114],[4.7501612896,43.8174672765],[4.7500917031,43.818280296],[4.7505322762,43.8198394229],[4.7513895764,43.8214872696],[4.751911988,43.8221044584],[4.7524150312,43.8225761375],[4.7533268736,43.8232428685],[4.7544251608,43.8239885037],[4.7568784806,43.8249715404],[4.7577603188,43.8252660705],[4.7674235736,43.8313918441],[4.7755442567,43.8401937295],[4.7879074382,43.8450154442],[4.7888802981,43.8464541195],[4.7897546664,43.8474470343],[4.7908936045,43.8474751497],[4.8015130542,43.8468061155],[4.802051208,43.8465568886]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000019993","CODE_COM":"021","INSEE_COM":"13021","NOM_COM":"CARRY-LE-ROUET","STATUT":"Commune simple","X_CHF_LIEU":874611.0,"Y_CHF_LIEU":6250471.0,"X_CENTROID":874982.0,"Y_CENTROID":6251155.0,"Z_MOYEN":83.0,"SUPERFICIE":"1003","POPULATION":"6053","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.177360057,43.333751678],[5.175971985,43.333751678],[5.175971985,43.334026336],[5.175693989,43.334026336],[5.175693989,43.334304809],[5.174027919,43.334304809],[5.174027919,43.334026336],[5.173749923,43.334026336],[5.173749923,43.333751678],[5.173471928,43.333751678],[5.173471928,43.333194732],[5.173749923,43.333194732],[5.173749923,43.332916259],[5.173471928,43.332916259],[5.173471928,43.332637788],[5.172915936,43.332637788],[5.172915936,43.332359315],[5.172361851,43.332359315],[5.172361851,43.332084655],[5.172083855,43.332084655],[5.172083855,43.331806184],[5.171805859,43.331806184],[5.171805859,43.331527711],[5.171527862,43.331527711],[5.171527862,43.331249238],[5.1717286712,43.3312492381],[5.1709938328,43.3308472454],[5.1704419891,43.3296479205],[5.1695362399,43.3287724692],[5.1687642486,43.328109411],[5.1683252239,43.32794093],[5.16680479,43.327696923],[5.16680479,43.327915192],[5.165887355,43.327915192],[5.165692806,43.327915192],[5.165692806,43.327640534],[5.165417195,43.327640534],[5.165417195,43.3274742144],[5.1647184678,43.3273620614],[5.164583206,43.327362061],[5.164583206,43.32734035],[5.1644769022,43.3273232865],[5.16263914,43.3272979818],[5.16263914,43.327362061],[5.161527158,43.327362061],[5.161527158,43.32755661],[5.161527158,43.327915192],[5.161251068,43.327915192],[5.161251068,43.328193665],[5.160973072,43.328193665],[5.160973072,43.327915192],[5.159583092,43.327915192],[5.159583092,43.327404023],[5.159583092,43.3272645154],[5.1583020682,43.3272514255],[5.156528949,43.3271148398],[5.156528949,43.327163697],[5.156528949,43.327362061],[5.156250953,43.327362061],[5.156250953,43.327640534],[5.15486002,43.327640534],[5.15486002,43.327915192],[5.154582023,43.327915192],[5.154582023,43.328193665],[5.154304027,43.328193665],[5.154304027,43.328472138],[5.154028892,43.328472138],[5.154028892,43.328193665],[5.153750896,43.328193665],[5.153750896,43.327915192],[5.152637959,43.327915192],[5.152637959,43.328193665],[5.152359963,43.328193665],[5.152359963,43.328472138],[5.151805877,43.328472138],[5.151805877,43.328193665],[5.151527882,43.328193665],[5.151527882,43.327362061],[5.151805877,43.327362061],[5.151805877,43.327083588],[5.152084828,43.327083588],[5.152084828,43.326812745],[5.152359963,43.326805115],[5.152359963,43.3267935804],[5.1503776873,43.3266407699],[5.1482109691,43.3264183604],[5.148193836,43.3264193182],[5.148193836,43.326526642],[5.147987366,43.326526642],[5.1462738945,43.3265266422],[5.146249772,43.3265279904],[5.146249772,43.326805115],[5.14375019,43.326805115],[5.14375019,43.327362061],[5.143472194,43.327362061],[5.143472194,43.327476501],[5.143472194,43.327640534],[5.143194199,43.327640534],[5.143194199,43.327915192],[5.142916203,43.327915192],[5.142916203,43.328193665],[5.142084122,43.328193665],[5.142084122,43.329029084],[5.141806126,43.329029084],[5.141806126,43.329303742],[5.140971184,43.329303742],[5.140971184,43.329029084],[5.140140056,43.329029084],[5.140140056,43.328750611],[5.13986206,43.328750611],[5.13986206,43.328235627],[5.13986206,43.327640534],[5.139583112,43.327640534],[5.139583112,43.327362061],[5.1391689035,43.3273620611],[5.139027119,43.3273803032],[5.139027119,43.327640534],[5.13831377,43.327674866],[5.138195037,43.327682496],[5.138195037,43.327915192],[5.137537003,43.327964782],[5.13736105,43.327976227],[5.13736105,43.328193665],[5.136805057,43.328193665],[5.136805057,43.328472138],[5.136527061,43.328472138],[5.136527061,43.328750611],[5.13569498,43.328750611],[5.13569498,43.329029084],[5.1351793419,43.3290290841],[5.1351529152,43.3290831666],[5.135188103,43.329219818],[5.135191441,43.329299927],[5.1351331402,43.3293006002],[5.1346799543,43.3299476146],[5.1345473337,43.3311264229],[5.1345995301,43.3325688597],[5.1347646446,43.341119346],[5.1347833006,43.3415230435],[5.1353465443,43.3429473048],[5.1367728925,43.3444031145],[5.1375069903,43.3448799703],[5.1379788962,43.3451361224],[5.1389864236,43.3456039643],[5.1397416046,43.3501669708],[5.137312365,43.3592116309],[5.1365863063,43.3624477482],[5.1363481113,43.362843025],[5.1358160679,43.3633304963],[5.1314946021,43.3662460209],[5.1338907226,43.3663292855],[5.1361921782,43.3650905532],[5.1384604089,43.3644877857],[5.1387180188,43.3644826941],[5.139668126,43.3643253192],[5.1483029186,43.3620537565],[5.1539601506,43.358476503],[5.1668973784,43.3503895624],[5.1732515189,43.3432488667],[5.1839350902,43.3365262289],[5.1855290221,43.3361628537],[5.1856975676,43.3336180306],[5.1847719869,43.3324875181],[5.1835779276,43.3322416547],[5.1774744273,43.3336165258],[5.177360057,43.3335801542],[5.177360057,43.333751678]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000020517","CODE_COM":"003","INSEE_COM":"13003","NOM_COM":"ALLEINS","STATUT":"Commune simple","X_CHF_LIEU":874262.0,"Y_CHF_LIEU":6291801.0,"X_CENTROID":873591.0,"Y_CENTROID":6292610.0,"Z_MOYEN":156.0,"SUPERFICIE":"1687","POPULATION":"2443","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1260413301,43.6905581179],[5.1225021673,43.6914283513],[5.1219019217,43.6916002857],[5.1214644855,43.6927853055],[5.1216210556,43.696443147],[5.1217670331,43.6971352143],[5.1219938582,43.6980336393],[5.1228956113,43.6986974619],[5.123179282,43.6998234148],[5.1219116554,43.7026800148],[5.1203738434,43.705347435],[5.1178851867,43.7073051207],[5.1172239068,43.7078112718],[5.1168211007,43.7080927542],[5.1165912546,43.7082529513],[5.1177273524,43.708842053],[5.1228727586,43.7160564802],[5.1256540824,43.7216426096],[5.1253559139,43.729325044],[5.125329144,43.7294398879],[5.1261277748,43.7292847675],[5.1394359305,43.726818623],[5.1501695246,43.7246069578],[5.161756299,43.7204563083],[5.1706178574,43.7170087137],[5.1800007481,43.7137866892],[5.1845436532,43.7105854891],[5.1891661724,43.7067208661],[5.1933627642,43.7024748552],[5.1941622954,43.7014505421],[5.1947647597,43.699979212],[5.1949715585,43.6989650476],[5.195054782,43.6968632697],[5.1902764094,43.6954535845],[5.1859485069,43.6954713111],[5.1788327576,43.6964962046],[5.1776412751,43.6971042652],[5.1733833062,43.6971695989],[5.1700378287,43.6971526589],[5.167885179,43.6969534275],[5.1627902751,43.6958162025],[5.1609994062,43.6950101386],[5.1505046103,43.6901736174],[5.1501250849,43.6901424124],[5.147909869,43.6901510647],[5.1448711892,43.6913254028],[5.1354460904,43.6928673342],[5.1267066808,43.6906702338],[5.1260413301,43.6905581179]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000021041","CODE_COM":"341","INSEE_COM":"30341","NOM_COM":"VAUVERT","STATUT":"Commune simple","X_CHF_LIEU":802897.0,"Y_CHF_LIEU":6289082.0,"X_CENTROID":805127.0,"Y_CENTROID":6282885.0,"Z_MOYEN":15.0,"SUPERFICIE":"11052","POPULATION":"11195","CODE_ARR":"2","CODE_DEPT":"30","NOM_DEPT":"GARD","CODE_REG":"76","NOM_REG":"LANGUEDOC-ROUSSILLON-MIDI-PYRENEES"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3185233462,43.5573152676],[4.3185216477,43.5573159557],[4.3185222909,43.5573169155],[4.3185233462,43.5573152676]]],[[[4.315768719,43.546852111],[4.31734085,43.543655396],[4.332422257,43.53572464],[4.3459319429,43.5412282484],[4.3443245597,43.5401037076],[4.342286158,43.5389456257],[4.3396476967,43.5376716361],[4.3382980885,43.5370295936],[4.3341326002,43.5354512466],[4.3329974661,43.535465195],[4.3319282881,43.5356564927],[4.330574087,43.5361986172],[4.3251227744,43.5394021966],[4.3215690964,43.5410202679],[4.3188417982,43.5425948896],[4.3179485781,43.5431303538],[4.3169083837,43.5439465485],[4.3164310144,43.5443302778],[4.3160785905,43.5448762636],[4.3156645261,43.545971907],[4.3156972356,43.5466976936],[4.3159945166,43.5476317395],[4.3163111802,43.5480076392],[4.3169701405,43.5486358451],[4.3185452365,43.5497217491],[4.3199623853,43.5505539926],[4.3209394007,43.551021733],[4.3214441262,43.5512418317],[4.315768719,43.546852111]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000021138","CODE_COM":"210","INSEE_COM":"13210","NOM_COM":"MARSEILLE-10E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":896240.0,"Y_CHF_LIEU":6243950.0,"X_CENTROID":897434.0,"Y_CENTROID":6245565.0,"Z_MOYEN":87.0,"SUPERFICIE":"1075","POPULATION":"55315","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3919457421,43.28475566],[5.3925434097,43.2847307283],[5.3944251088,43.2848933395],[5.3972936432,43.2855317124],[5.4027026787,43.2867660308],[5.4059863441,43.2903810676],[5.4070711719,43.2906917004],[5.410216673,43.2915494679],[5.4149182178,43.2916973989],[5.416543776,43.2914441646],[5.4226054589,43.2906226544],[5.4237918894,43.2906221493],[5.4248577061,43.2904488408],[5.4257970662,43.290139763],[5.4257585386,43.28893105],[5.4270190729,43.2870037816],[5.429429,43.2858390471],[5.4355223635,43.2851726837],[5.4398876179,43.2849815029],[5.4417828845,43.2837147093],[5.4434309169,43.2818189841],[5.4436145996,43.2803685558],[5.4444373312,43.276761715],[5.4459566002,43.2757283501],[5.4465892229,43.2753684327],[5.4511240308,43.2741127631],[5.4533344556,43.2728854118],[5.454054121,43.2706650124],[5.4536232274,43.267513174],[5.4538009326,43.2666820579],[5.4539864036,43.265830966],[5.4540853077,43.2654057299],[5.4543206875,43.265206887],[5.4560857145,43.2640273973],[5.4582969203,43.2627720261],[5.4593265496,43.2599730625],[5.4569346969,43.2588053352],[5.4537471804,43.2578329324],[5.4522390628,43.2574630985],[5.4500372797,43.258155647],[5.4496571862,43.2581939677],[5.4467079705,43.2577847359],[5.4410589211,43.258433643],[5.4366015276,43.2595152577],[5.4314292496,43.2604093889],[5.4304065345,43.2626445222],[5.4297657912,43.2652958411],[5.4297852162,43.265581594],[5.4269515621,43.2664606687],[5.4229511525,43.2672128506],[5.4173529693,43.2680447482],[5.4146227223,43.269371163],[5.4129520742,43.2712993211],[5.4110202931,43.2737894617],[5.4101090785,43.2756223289],[5.4074258233,43.2755786585],[5.4038974246,43.2755006322],[5.3998320649,43.274624452],[5.3991057647,43.2775654691],[5.3887390906,43.2831490595],[5.3908270875,43.2830002821],[5.391942647,43.2845325364],[5.3919457421,43.28475566]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000021167","CODE_COM":"019","INSEE_COM":"13019","NOM_COM":"CABRIES","STATUT":"Commune simple","X_CHF_LIEU":892702.0,"Y_CHF_LIEU":6263125.0,"X_CENTROID":890136.0,"Y_CENTROID":6262851.0,"Z_MOYEN":181.0,"SUPERFICIE":"3668","POPULATION":"9251","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3748676404,43.4200248708],[5.3732160686,43.4197991604],[5.3658314126,43.4187312671],[5.3576872363,43.4188575788],[5.3441791075,43.4192822289],[5.337478778,43.4218823747],[5.3356535376,43.422607587],[5.3312474376,43.4251002344],[5.3297305317,43.4260032167],[5.321195365,43.4293492215],[5.3116950868,43.4314145817],[5.3108224141,43.4315493078],[5.3107281842,43.4318168302],[5.310046929,43.4336431449],[5.3018012943,43.4451754223],[5.3014597262,43.4456228016],[5.3010000126,43.4461122912],[5.3014377721,43.4465251157],[5.3020413287,43.447469045],[5.3023647638,43.4477411877],[5.3028753434,43.4481209582],[5.3084329674,43.4514390916],[5.3092972303,43.4518256997],[5.3139516794,43.4535283148],[5.3174283615,43.4549706136],[5.3188916128,43.4556548575],[5.3274033494,43.4602391144],[5.3287879944,43.4609897257],[5.329336551,43.461323562],[5.3293562232,43.4618091755],[5.3288260396,43.4626918352],[5.3277712079,43.4643814229],[5.3252675546,43.4683207661],[5.324603064,43.4692773935],[5.3227782291,43.4721643407],[5.3210193839,43.4751902577],[5.3199770512,43.4771702314],[5.3198941879,43.4776283424],[5.3199280248,43.479232452],[5.3219696127,43.4827737494],[5.3305267888,43.4874892819],[5.3336123027,43.4884922149],[5.3359288332,43.488579143],[5.3393856761,43.4873416966],[5.3408604457,43.4850947504],[5.3438252946,43.4834402399],[5.3488413968,43.4825296984],[5.3577608448,43.4811947644],[5.3583140025,43.4809991139],[5.3596229097,43.480484583],[5.3603127336,43.4800654253],[5.3609593353,43.4795571955],[5.3622198824,43.4780175838],[5.3625798655,43.4774534836],[5.3633465081,43.4755069823],[5.3649899884,43.4734252381],[5.3657008632,43.4727697635],[5.3662908932,43.472631772],[5.3698952227,43.4718023523],[5.3712980557,43.4715349477],[5.3743872752,43.4703557092],[5.3777983018,43.4686832737],[5.3848856417,43.4639425003],[5.3870200367,43.4623122555],[5.3875381005,43.4619030047],[5.3876306493,43.4610071794],[5.3883112018,43.4543657597],[5.390382024,43.443161811],[5.3922207946,43.4397621431],[5.3925038766,43.4385497925],[5.3923087406,43.4372435957],[5.3921594219,43.4364449288],[5.3917493649,43.4348707579],[5.3908413888,43.432786439],[5.3907593906,43.432685641],[5.3838629737,43.4254472084],[5.3759031226,43.4205808941],[5.3748676404,43.4200248708]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000021229","CODE_COM":"107","INSEE_COM":"13107","NOM_COM":"SIMIANE-COLLONGUE","STATUT":"Commune simple","X_CHF_LIEU":897025.0,"Y_CHF_LIEU":6262131.0,"X_CENTROID":897354.0,"Y_CENTROID":6259039.0,"Z_MOYEN":371.0,"SUPERFICIE":"3019","POPULATION":"5483","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4475015298,43.3869700512],[5.4471970356,43.3869778364],[5.4403022295,43.3873018197],[5.4342129804,43.3868899055],[5.4262387212,43.3834462541],[5.4245750667,43.3834124328],[5.4252513458,43.3841749222],[5.4250197598,43.3843898227],[5.424287931,43.3847698372],[5.4177131525,43.3876260494],[5.4069245795,43.3942379303],[5.3970805871,43.4008260032],[5.3959246955,43.4024743808],[5.3948666131,43.404012577],[5.3945448025,43.405119558],[5.3933062567,43.4115823274],[5.3927216809,43.4164969587],[5.3933136931,43.4166890896],[5.4052338426,43.4202367572],[5.4132024755,43.4210126534],[5.4163907035,43.4215986136],[5.4194787372,43.425497189],[5.4193029284,43.4265731051],[5.4188632777,43.427924037],[5.4171898606,43.4312448743],[5.4164786883,43.433807963],[5.4166239434,43.4346489966],[5.4177244403,43.4354426117],[5.4182339948,43.4357525662],[5.4250094842,43.437820702],[5.4295941625,43.4390113957],[5.4308304128,43.4395327153],[5.4316436394,43.439923104],[5.4337981862,43.4409809298],[5.4362054846,43.4422004487],[5.4374596099,43.4429364168],[5.4394617448,43.4441235794],[5.4426722459,43.4463311818],[5.4434636509,43.4467561833],[5.44501872,43.4474177758],[5.4453041131,43.4471566072],[5.4486793502,43.4436194997],[5.4556113628,43.4349530883],[5.4638568467,43.430331084],[5.464345576,43.4300634388],[5.4632859624,43.4284205717],[5.4635178077,43.4276340192],[5.4637447796,43.427022195],[5.4674673183,43.4216737221],[5.4691624601,43.4193065572],[5.4711164139,43.4182250862],[5.4726690604,43.4173462621],[5.4742914086,43.4159932768],[5.4771437477,43.4132989091],[5.4784932351,43.4109476063],[5.4791057483,43.408428648],[5.4759171857,43.4037023765],[5.4751931059,43.3979458367],[5.4751682735,43.3959905419],[5.4752040794,43.3918286867],[5.4753929067,43.3914553394],[5.472019885,43.3909977834],[5.45891249,43.3890875789],[5.4557568587,43.3888009966],[5.4507385451,43.3879543743],[5.4475015298,43.3869700512]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000021448","CODE_COM":"204","INSEE_COM":"13204","NOM_COM":"MARSEILLE-4E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":894762.0,"Y_CHF_LIEU":6247235.0,"X_CENTROID":894953.0,"Y_CENTROID":6248462.0,"Z_MOYEN":56.0,"SUPERFICIE":"289","POPULATION":"47982","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3890791885,43.3003094128],[5.3944460669,43.3020428068],[5.3926543287,43.3069117917],[5.3917915938,43.3087812534],[5.390500823,43.3093947963],[5.3915309252,43.309894903],[5.3919307622,43.3102343509],[5.3927555359,43.3118738739],[5.3932190058,43.3136860909],[5.3931841692,43.3164093319],[5.3936400283,43.3164640391],[5.3976877982,43.3169971368],[5.3990916532,43.3169659926],[5.4052402239,43.315794379],[5.4099229081,43.3150906971],[5.4105321621,43.3149817142],[5.4103688554,43.3149376557],[5.4092168027,43.3122633523],[5.4098009123,43.3100795495],[5.4096432095,43.303889333],[5.4087489457,43.2974986694],[5.4091860334,43.2962226509],[5.4090972934,43.2959861337],[5.4087493061,43.2956491972],[5.4078089094,43.2959671471],[5.4056186819,43.2960978206],[5.4002168995,43.2965995167],[5.3978811432,43.2981795315],[5.395432576,43.2994200029],[5.391982942,43.2989879168],[5.3911804734,43.298802279],[5.3890516929,43.2989024552],[5.3890791885,43.3003094128]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000021669","CODE_COM":"103","INSEE_COM":"13103","NOM_COM":"SALON-DE-PROVENCE","STATUT":"Commune simple","X_CHF_LIEU":869255.0,"Y_CHF_LIEU":6284634.0,"X_CENTROID":867190.0,"Y_CENTROID":6285655.0,"Z_MOYEN":101.0,"SUPERFICIE":"7057","POPULATION":"44263","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0727589355,43.6838173049],[5.0740829284,43.6843465465],[5.0798318224,43.6853340402],[5.0808855714,43.6853525942],[5.0909855049,43.6850689152],[5.0946740599,43.6847891226],[5.0965701521,43.6846418795],[5.098981221,43.6844333604],[5.1131004164,43.6880693118],[5.1133908651,43.6878053297],[5.1143077379,43.6867685561],[5.115788649,43.685085308],[5.1164373277,43.6845470085],[5.1176810528,43.6834633407],[5.1221326399,43.6784735356],[5.1300672368,43.6707212869],[5.1310314862,43.6698400684],[5.1333793868,43.6680207716],[5.135796824,43.6669732727],[5.1382569041,43.6663398425],[5.1414385962,43.6656732456],[5.1417573186,43.6653096153],[5.1427408686,43.6638905304],[5.143227075,43.6631320373],[5.1439601874,43.6615828577],[5.1438062112,43.6596542089],[5.1436179426,43.659360877],[5.1419216867,43.6570674662],[5.1398868681,43.6545016594],[5.1392195558,43.6539279079],[5.138805459,43.6535616018],[5.1361066558,43.6507018532],[5.1307119381,43.6455384048],[5.1291013687,43.6444925177],[5.1285224431,43.6440564959],[5.1278080946,43.6412072091],[5.1288329834,43.6377658048],[5.1301960276,43.6337894036],[5.131672559,43.6301708106],[5.1311519144,43.6268317148],[5.1296658691,43.6235529538],[5.1299710135,43.6221275072],[5.1300555057,43.621066428],[5.1302173588,43.6182855359],[5.1303438489,43.6145863391],[5.129602352,43.6115990438],[5.1280520788,43.610148759],[5.1230946642,43.6059684989],[5.1152585624,43.6029044343],[5.1055179916,43.6004690131],[5.0966452974,43.5991878952],[5.0960900433,43.5988718818],[5.0952522712,43.6000779506],[5.0951466273,43.6004409207],[5.0953266154,43.6016048545],[5.0946231,43.605709298],[5.0921973177,43.6110278388],[5.0916423262,43.6118765053],[5.0897519816,43.614155897],[5.0868710045,43.6212193621],[5.0846331599,43.623598952],[5.0810785679,43.6254825655],[5.0762567312,43.6263902765],[5.0635948386,43.6285360275],[5.0569019783,43.629806013],[5.0499705917,43.6311016831],[5.0386670087,43.6342107654],[5.0346701863,43.6354260639],[5.0330522069,43.6359297833],[5.0290209282,43.637333633],[5.0191527121,43.6406532761],[5.0139371697,43.6424106793],[5.0125480436,43.6429476523],[5.0122962728,43.6396589151],[5.0122308862,43.6291796262],[5.0092113702,43.6268169945],[5.0036336155,43.6227193484],[4.9916111862,43.6186713464],[4.9896673227,43.6181345173],[4.9888567998,43.6180188464],[4.9885950414,43.6180443384],[4.9884882628,43.6180732942],[4.9874622305,43.6186384017],[4.9850465156,43.6201811579],[4.9814838044,43.6223811229],[4.9708418288,43.6283881293],[4.9683627749,43.6296625394],[4.9541324695,43.6390000377],[4.9542088438,43.639313687],[4.9552057404,43.6408177696],[4.9611264152,43.6486515254],[4.9684088307,43.6578978119],[4.9687951649,43.6583174552],[4.9702759233,43.6577190842],[4.9803573329,43.654200244],[4.9859750123,43.6522193119],[4.9890222674,43.6511555179],[4.9981280417,43.6480173819],[4.9986825724,43.6479594845],[4.9993033517,43.6479885739],[5.0016980645,43.6488742948],[5.0160283424,43.6544375821],[5.0266341287,43.6586895844],[5.0320352948,43.6615771112],[5.0382666839,43.66499249],[5.0404282448,43.6661526937],[5.0447418136,43.6683021392],[5.0483484493,43.6698841687],[5.0517754651,43.6713272553],[5.0579049384,43.6738442813],[5.0601883038,43.6749568026],[5.0689481736,43.6806449063],[5.0704233022,43.6816870849],[5.0718429556,43.6828743216],[5.0726243998,43.6836641467],[5.0727589355,43.6838173049]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000021804","CODE_COM":"080","INSEE_COM":"13080","NOM_COM":"LE PUY-SAINTE-REPARADE","STATUT":"Commune simple","X_CHF_LIEU":896609.0,"Y_CHF_LIEU":6287959.0,"X_CENTROID":897025.0,"Y_CENTROID":6287375.0,"Z_MOYEN":256.0,"SUPERFICIE":"4488","POPULATION":"5389","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4129237527,43.6928305847],[5.4138631894,43.6922159689],[5.4258053187,43.6865776839],[5.4375892591,43.6817068082],[5.4392420964,43.6811080027],[5.4442411229,43.6799460938],[5.445294173,43.6800898693],[5.4453179886,43.6800883956],[5.4729120174,43.6720636124],[5.4747186578,43.671452623],[5.4773820841,43.6707627795],[5.4880654138,43.6676528478],[5.488084383,43.6676429609],[5.4878089466,43.6665833649],[5.4873667079,43.6636235563],[5.4866765205,43.6593208539],[5.4857054172,43.6546851933],[5.4854767315,43.6539864317],[5.4846240226,43.6533361426],[5.4821937051,43.6453444237],[5.4830145757,43.6419146831],[5.483094091,43.6414609489],[5.4826525973,43.6355601079],[5.4802054103,43.6289596976],[5.4768634436,43.6238074251],[5.4766633327,43.6234780042],[5.4754540302,43.6226494509],[5.4666736972,43.6160948128],[5.4637927523,43.6136395902],[5.4623282537,43.6146783266],[5.4537785786,43.6160861386],[5.4495850974,43.6205692809],[5.4468139304,43.622591475],[5.4386188119,43.6213281704],[5.4343817826,43.6206769095],[5.4292618027,43.6209427318],[5.4233197131,43.6213427756],[5.4185459848,43.6217407991],[5.4168515529,43.622463552],[5.4153912185,43.6230082363],[5.4134019272,43.6235871549],[5.4128671103,43.6234225929],[5.4114748877,43.6228773716],[5.4112618042,43.6226723542],[5.4068696289,43.6267918114],[5.4059681431,43.6279010144],[5.4006488212,43.6391109232],[5.3986686782,43.640547255],[5.3939247729,43.6477265477],[5.393396984,43.648803114],[5.3927978672,43.6503097469],[5.3963775214,43.6560741676],[5.3984150184,43.65943115],[5.3979636285,43.662600865],[5.3958738829,43.6663009139],[5.3961814942,43.6727379159],[5.3966833013,43.6751871694],[5.3966210217,43.6753883916],[5.3963251423,43.6761132904],[5.3994761165,43.676571351],[5.404337322,43.6783535732],[5.4048690023,43.6789341693],[5.4065465258,43.6810729224],[5.4102357497,43.6879473466],[5.4114095601,43.6901629243],[5.4127138029,43.6929103446],[5.4127188943,43.6929111332],[5.4129237527,43.6928305847]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000021893","CODE_COM":"089","INSEE_COM":"84089","NOM_COM":"PERTUIS","STATUT":"Commune simple","X_CHF_LIEU":901795.0,"Y_CHF_LIEU":6291535.0,"X_CENTROID":903340.0,"Y_CENTROID":6290063.0,"Z_MOYEN":240.0,"SUPERFICIE":"5923","POPULATION":"19498","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4453179886,43.6800883956],[5.445294173,43.6800898693],[5.4452961909,43.680094731],[5.4453179886,43.6800883956]]],[[[5.4773820841,43.6707627795],[5.4747186578,43.671452623],[5.4729120174,43.6720636124],[5.4773820841,43.6707627795]]],[[[5.488080978,43.667648316],[5.488125684,43.6676394587],[5.488084383,43.6676429609],[5.4880654138,43.6676528478],[5.488080978,43.667648316]]],[[[5.530508041,43.659233093],[5.5350845844,43.6593563128],[5.5326879328,43.6589798874],[5.5314503583,43.6590069086],[5.5281770624,43.659695925],[5.530508041,43.659233093]]],[[[5.549825668,43.659751892],[5.5498484856,43.6597540343],[5.5498207247,43.6597497844],[5.5498115881,43.6597515151],[5.549825668,43.659751892]]],[[[5.573623181,43.661983491],[5.5752704456,43.6618207999],[5.5726780236,43.6618949619],[5.573623181,43.661983491]]],[[[5.606943607,43.658687592],[5.6069459105,43.6586886088],[5.6069435191,43.6586859052],[5.6033983895,43.6589347055],[5.5953952849,43.6595671885],[5.5943634133,43.659755668],[5.5922154565,43.6601457357],[5.606943607,43.658687592]]],[[[5.623849142,43.666147767],[5.6238507967,43.6661450942],[5.6238336518,43.6661409335],[5.623849142,43.666147767]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000022204","CODE_COM":"276","INSEE_COM":"30276","NOM_COM":"SAINT-LAURENT-D'AIGOUZE","STATUT":"Commune simple","X_CHF_LIEU":796497.0,"Y_CHF_LIEU":6282427.0,"X_CENTROID":801083.0,"Y_CENTROID":6277036.0,"Z_MOYEN":1.0,"SUPERFICIE":"8968","POPULATION":"3374","CODE_ARR":"2","CODE_DEPT":"30","NOM_DEPT":"GARD","CODE_REG":"76","NOM_REG":"LANGUEDOC-ROUSSILLON-MIDI-PYRENEES"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2464058659,43.5020332739],[4.2461417071,43.5019322677],[4.2458664946,43.5018912531],[4.2464058659,43.5020332739]]],[[[4.293263912,43.514358521],[4.3029405749,43.5190079561],[4.3023179755,43.5185004578],[4.3002441908,43.5170181083],[4.297689816,43.5153291113],[4.2958457067,43.5145359063],[4.2932134119,43.514098504],[4.2832144837,43.511548344],[4.2776487168,43.5096155245],[4.2758878892,43.5090999535],[4.2732653857,43.5084163068],[4.2714168955,43.5080699602],[4.2694426882,43.5080959116],[4.293263912,43.514358521]]],[[[4.320893764,43.527629853],[4.3157865174,43.5357694451],[4.3227085569,43.5304466514],[4.323807067,43.5288477275],[4.3238871017,43.5276517568],[4.3219366281,43.5262465833],[4.3204919294,43.5254822103],[4.3197813831,43.5252901901],[4.3166407833,43.5246111696],[4.315529102,43.5245598646],[4.3145267481,43.5245727669],[4.320893764,43.527629853]]],[[[4.309186935,43.546283722],[4.3121655516,43.5498061321],[4.3107513549,43.5472992421],[4.3100303833,43.5449401954],[4.309186935,43.546283722]]],[[[4.318520545,43.557319642],[4.3185222909,43.5573169155],[4.3185216477,43.5573159557],[4.3184247618,43.5571380597],[4.3162057318,43.5540946588],[4.3146463135,43.5527394109],[4.318520545,43.557319642]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000022522","CODE_COM":"014","INSEE_COM":"13014","NOM_COM":"BERRE-L'ETANG","STATUT":"Commune simple","X_CHF_LIEU":875469.0,"Y_CHF_LIEU":6266474.0,"X_CENTROID":874311.0,"Y_CENTROID":6269479.0,"Z_MOYEN":14.0,"SUPERFICIE":"4397","POPULATION":"13937","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1180718273,43.5132116163],[5.1192644979,43.5130245148],[5.1218327074,43.5155934083],[5.1219374401,43.5158172686],[5.1218645887,43.5179634803],[5.1216335621,43.5198121759],[5.1217224398,43.5229218731],[5.1226015364,43.5232142909],[5.1338308552,43.5247679932],[5.1447519273,43.5300744521],[5.1490626983,43.5320160756],[5.1566145244,43.5360191064],[5.1592809646,43.5380677211],[5.162540975,43.539379899],[5.1647439664,43.5401856358],[5.1655520474,43.5402550192],[5.1767911254,43.5397889358],[5.1874853885,43.5393479702],[5.1896391416,43.5382361484],[5.1991155511,43.5349176623],[5.201576488,43.5351809843],[5.2017852812,43.533914846],[5.2065882444,43.5245852535],[5.2064595019,43.524614874],[5.2061805447,43.5237285803],[5.2059106673,43.5227241934],[5.2050825879,43.5189067517],[5.2047042465,43.5157840242],[5.203893485,43.513799665],[5.2030065614,43.5126980081],[5.2003010233,43.5096072247],[5.1962681594,43.5060752458],[5.194951254,43.5042306983],[5.1944381076,43.5025471879],[5.1954092779,43.4998426856],[5.1961260195,43.4986680111],[5.1980273945,43.4967879909],[5.1993154355,43.4955864135],[5.2008314054,43.4943333923],[5.2014300258,43.4935976035],[5.2027922081,43.4911731177],[5.2023176828,43.4909199438],[5.2004369642,43.4900049808],[5.1957440808,43.4881542279],[5.1926087051,43.4872024341],[5.1908429898,43.4864757951],[5.1881331896,43.484749345],[5.1852485092,43.4819949189],[5.1824609658,43.4793500755],[5.1819450834,43.4789140448],[5.1806119061,43.4781758445],[5.1781551946,43.4772064017],[5.1740551613,43.4754616523],[5.1725263671,43.4745130753],[5.1704861364,43.4732084108],[5.1651054168,43.4717670815],[5.1645972827,43.4714658229],[5.1634516911,43.4707758785],[5.1615151273,43.4690639783],[5.1608034232,43.4684085559],[5.1600514492,43.4669439177],[5.1577827361,43.4634871532],[5.153844588,43.4599843462],[5.1537102693,43.4597629133],[5.1541824521,43.4590758218],[5.1546036028,43.4588406472],[5.1550343766,43.4588293819],[5.1574436958,43.4601152592],[5.159612865,43.461550774],[5.159575547,43.4607874076],[5.1550490677,43.4566168696],[5.1526039367,43.4566132666],[5.1496876212,43.4570266591],[5.1453184625,43.4585694497],[5.1434045492,43.4600581297],[5.1428274068,43.4608831484],[5.1429077553,43.4625087724],[5.1426422084,43.4636390324],[5.1416049612,43.4651499474],[5.1386988815,43.4678452573],[5.1365725009,43.4700472174],[5.1321152675,43.4738493274],[5.1298130044,43.4771877305],[5.1271300847,43.4810015646],[5.1260797006,43.482243489],[5.123114322,43.4861536683],[5.1225137845,43.4894396911],[5.1223640408,43.4901716377],[5.122141457,43.490671905],[5.1212279938,43.4924493178],[5.1203931169,43.4943142895],[5.1195241863,43.4970340433],[5.1192460224,43.4976712959],[5.1185598867,43.4988124318],[5.1175076911,43.5002874208],[5.1156424401,43.5025837866],[5.1143456087,43.5041013191],[5.1138049795,43.5044295665],[5.1135686679,43.5046609786],[5.1133777224,43.5057897324],[5.1133260039,43.5072748848],[5.1139217336,43.510258571],[5.1159888044,43.5114864087],[5.1170621261,43.5119541821],[5.1180718273,43.5132116163]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000022862","CODE_COM":"043","INSEE_COM":"13043","NOM_COM":"GIGNAC-LA-NERTHE","STATUT":"Commune simple","X_CHF_LIEU":881216.0,"Y_CHF_LIEU":6257470.0,"X_CENTROID":879983.0,"Y_CENTROID":6257052.0,"Z_MOYEN":52.0,"SUPERFICIE":"859","POPULATION":"9099","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.195498567,43.3825407936],[5.1954656721,43.3836844242],[5.1953888783,43.3858450153],[5.1960848491,43.3925420138],[5.1968974735,43.393106911],[5.1987714333,43.3939292442],[5.2070105287,43.3955048497],[5.2175021231,43.3968771262],[5.2287626106,43.3980111733],[5.2436895359,43.3986424372],[5.259730861,43.4011771028],[5.2624543413,43.4017250268],[5.2639060481,43.4020105824],[5.2642439828,43.4017839141],[5.2650800628,43.4010734207],[5.2652195118,43.4009472024],[5.2656684624,43.4006876064],[5.2661204124,43.4004729461],[5.2682114141,43.3977183419],[5.2697021093,43.3955198888],[5.2711610979,43.3924580795],[5.2713076616,43.3911680023],[5.2690440596,43.390974275],[5.2586154475,43.3928204704],[5.2579593881,43.3929592567],[5.2574617631,43.3929840353],[5.2534090177,43.3930837756],[5.252466056,43.3929558014],[5.2510679125,43.3925807868],[5.2498712152,43.3921493683],[5.2452085973,43.3895524995],[5.2435925853,43.3884601186],[5.2431744863,43.3880862882],[5.241956289,43.3868452424],[5.2343584638,43.3839828979],[5.2284221447,43.3819156269],[5.2265401196,43.3815880685],[5.2261685771,43.3815525123],[5.224224743,43.381508779],[5.2199591263,43.3815711573],[5.2149510471,43.3818348596],[5.2142760748,43.3818981695],[5.2132989074,43.3819001571],[5.212785343,43.3818611594],[5.2119396869,43.3817533489],[5.2094495164,43.3812984265],[5.206466457,43.3805376069],[5.2018703938,43.3781193909],[5.2006322313,43.3765849285],[5.1995903843,43.3744389875],[5.1965079844,43.3800201956],[5.195498567,43.3825407936]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000023576","CODE_COM":"034","INSEE_COM":"13034","NOM_COM":"EYGALIERES","STATUT":"Commune simple","X_CHF_LIEU":857047.0,"Y_CHF_LIEU":6297703.0,"X_CENTROID":857232.0,"Y_CENTROID":6298472.0,"Z_MOYEN":144.0,"SUPERFICIE":"3402","POPULATION":"1769","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9682085288,43.7909578283],[4.9682634622,43.7908209125],[4.9707144921,43.7887827697],[4.9721631073,43.7876232664],[4.974565625,43.785879365],[4.9769470075,43.7840673814],[4.9798316957,43.7813658498],[4.9816918111,43.7795434283],[4.9837823693,43.7763449456],[4.9858964546,43.7726500126],[4.9873395544,43.7698503322],[4.9895391066,43.7648404594],[4.9920900312,43.7607305728],[4.995485406,43.7558112349],[4.9962363551,43.7548748257],[4.9971380427,43.7526718457],[4.9976261166,43.7509301194],[4.9977141462,43.748969796],[4.9968818229,43.748282951],[4.9883674633,43.7452801597],[4.9773257602,43.7401803359],[4.971665977,43.7371613233],[4.9639810192,43.7329166114],[4.9542908845,43.7288766253],[4.9535246397,43.7283197035],[4.9524292863,43.7289217287],[4.9515596589,43.7292640635],[4.9397525639,43.7332528565],[4.9282225092,43.7362264164],[4.9220413641,43.7369981881],[4.9174674719,43.7375027847],[4.91827839,43.7390663987],[4.9188866153,43.7469514953],[4.922850227,43.7526513553],[4.9240789185,43.7545892237],[4.9245769077,43.7554022385],[4.9247132855,43.7568724327],[4.9236323458,43.7591103382],[4.917017169,43.7683542526],[4.9150819547,43.7775192264],[4.9140672612,43.7849154735],[4.9239536222,43.7911224839],[4.9234792239,43.7929779555],[4.9241761188,43.7991757718],[4.9247627865,43.7991042033],[4.934165992,43.7955504786],[4.9398000234,43.791472585],[4.9455832642,43.786873247],[4.9538163828,43.7878241281],[4.958783725,43.7887935351],[4.9625524842,43.7897366025],[4.9654800911,43.7912933199],[4.96681314,43.7919353864],[4.9680843444,43.7909600711],[4.9682085288,43.7909578283]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000023723","CODE_COM":"026","INSEE_COM":"13026","NOM_COM":"CHATEAUNEUF-LES-MARTIGUES","STATUT":"Commune simple","X_CHF_LIEU":875437.0,"Y_CHF_LIEU":6256181.0,"X_CENTROID":874164.0,"Y_CENTROID":6257335.0,"Z_MOYEN":69.0,"SUPERFICIE":"3276","POPULATION":"13792","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1719195253,43.4186393572],[5.172041167,43.4185910183],[5.1855775384,43.4055100645],[5.1858102466,43.4052344721],[5.1865960671,43.4009328919],[5.1871221298,43.3991205063],[5.1877740522,43.3973406756],[5.1887583379,43.3958313164],[5.1895174081,43.3949564882],[5.1908208564,43.3936638495],[5.1912366886,43.3933377413],[5.1916635416,43.3932364026],[5.1933900563,43.3932356332],[5.1938384564,43.3934407415],[5.1951738563,43.3935072679],[5.1958350457,43.3928197746],[5.1960848491,43.3925420138],[5.1953888783,43.3858450153],[5.1954656721,43.3836844242],[5.195498567,43.3825407936],[5.1943470904,43.3822752546],[5.1918895398,43.3817013732],[5.1897980575,43.3808563407],[5.1879216403,43.3783959828],[5.1864464863,43.3753542173],[5.1852738231,43.3727698137],[5.1844135308,43.3693439377],[5.1850743659,43.3661150476],[5.1811375626,43.3642433746],[5.1754362647,43.3628048361],[5.17449825,43.3627894936],[5.1735127112,43.3628875916],[5.1682492533,43.3642243276],[5.1636412575,43.3654811033],[5.1615087706,43.3660798919],[5.1582587552,43.3669448199],[5.1557683683,43.3675749305],[5.1536359008,43.3681123649],[5.1523828703,43.368383882],[5.1512688069,43.3686112241],[5.1489542055,43.368964097],[5.1416006689,43.3699891281],[5.1409303011,43.3699087988],[5.1403402478,43.369433601],[5.1400086806,43.3687768998],[5.1395234136,43.367236793],[5.1389418127,43.3651613256],[5.1387180188,43.3644826941],[5.1384604089,43.3644877857],[5.1361921782,43.3650905532],[5.1338907226,43.3663292855],[5.1314946021,43.3662460209],[5.1295059667,43.3659737971],[5.1156032851,43.3631597388],[5.1089035779,43.3623617999],[5.1035393277,43.3624275243],[5.1029845013,43.3623321179],[5.1027054381,43.3630331863],[5.1007156285,43.36711792],[5.1013514517,43.3722720891],[5.102563061,43.3773790945],[5.1024504672,43.3873049399],[5.1030289677,43.3898999461],[5.1012226369,43.3938632964],[5.0979926817,43.3990358568],[5.0963870243,43.4014095348],[5.1028589699,43.4027464541],[5.110707877,43.4041272566],[5.1123175912,43.404265957],[5.116345026,43.4043952019],[5.1191159509,43.4043239063],[5.12158172,43.4040443285],[5.1216481035,43.4028649776],[5.1217905214,43.4020072236],[5.1223764737,43.4013621665],[5.1235238771,43.4006133997],[5.1249208395,43.4001729091],[5.125776539,43.4000157172],[5.1293490498,43.3999320136],[5.1357199141,43.400090014],[5.137266272,43.4001854936],[5.1399137097,43.4011141611],[5.1443957759,43.4032457012],[5.1539322994,43.4078343606],[5.157534521,43.4095841965],[5.1602259548,43.4110065006],[5.1645842221,43.4137112092],[5.165379427,43.4142074011],[5.168466536,43.416158892],[5.1708965725,43.4179020785],[5.1713501383,43.4183393791],[5.1719195253,43.4186393572]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000024084","CODE_COM":"112","INSEE_COM":"13112","NOM_COM":"VELAUX","STATUT":"Commune simple","X_CHF_LIEU":882263.0,"Y_CHF_LIEU":6271883.0,"X_CENTROID":881893.0,"Y_CENTROID":6272092.0,"Z_MOYEN":106.0,"SUPERFICIE":"2515","POPULATION":"8930","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2335727471,43.5473677133],[5.2338948362,43.5471540632],[5.2412434699,43.5462824805],[5.2510949575,43.5443945078],[5.2569123859,43.5423582775],[5.257606884,43.5420206974],[5.2604156455,43.5395994778],[5.2598817331,43.5380741376],[5.2643371916,43.5379812563],[5.2648262157,43.5381771725],[5.2651654818,43.5381835923],[5.2706220225,43.5374052796],[5.274725287,43.5367621793],[5.2781043779,43.5348325869],[5.2785055833,43.5345919376],[5.2866729162,43.5265577722],[5.2938343994,43.5208034975],[5.2941617594,43.5195850491],[5.2935792086,43.518997006],[5.2931781358,43.5185860423],[5.2929037727,43.5178168631],[5.2873958922,43.508989884],[5.2815925545,43.5034848187],[5.2779994141,43.5012759585],[5.2748364427,43.4998068268],[5.2697010353,43.4985751253],[5.2695742876,43.4983086568],[5.2695534031,43.4977798521],[5.2695768711,43.4954625804],[5.2646288872,43.4977819991],[5.2549449341,43.5021817198],[5.2425476107,43.5072127411],[5.2396691002,43.5077276556],[5.2372914016,43.5085291854],[5.2348925631,43.5095201119],[5.2329683054,43.5104418105],[5.2290310639,43.5124255372],[5.2252468748,43.5145040858],[5.223532048,43.5155086238],[5.2169462038,43.5198656372],[5.2068895176,43.5244423151],[5.2064595019,43.524614874],[5.2065882444,43.5245852535],[5.2017852812,43.533914846],[5.201576488,43.5351809843],[5.2015024476,43.5353796025],[5.202111791,43.5367839539],[5.2064566438,43.5399332682],[5.2183119419,43.542261302],[5.2234477666,43.5473325917],[5.2326720189,43.5472440325],[5.2335727471,43.5473677133]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000024164","CODE_COM":"010","INSEE_COM":"13010","NOM_COM":"BARBENTANE","STATUT":"Commune simple","X_CHF_LIEU":840424.0,"Y_CHF_LIEU":6312709.0,"X_CENTROID":840442.0,"Y_CENTROID":6312175.0,"Z_MOYEN":47.0,"SUPERFICIE":"2734","POPULATION":"3956","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.709324838,43.898017884],[4.704637051,43.897361756],[4.705445766,43.899429322],[4.7079675877,43.9003938054],[4.7084493405,43.9005074952],[4.7134911805,43.9017922178],[4.7170240076,43.9029825314],[4.7204402104,43.9043465009],[4.7222181474,43.905215928],[4.7233684642,43.9059557103],[4.7248549539,43.9072716729],[4.725960615,43.9084262077],[4.7267754324,43.9093080834],[4.7270890124,43.9096516748],[4.734787117,43.9159222019],[4.7351839833,43.9162005659],[4.7355084026,43.9165086683],[4.7377476035,43.9179880415],[4.7400992241,43.9196789207],[4.7402111566,43.9217160173],[4.7390596941,43.9240621925],[4.7396518038,43.9239928938],[4.7731475935,43.9197009686],[4.7735950563,43.9196361331],[4.7731140322,43.9167399794],[4.7735724634,43.914621629],[4.7813590065,43.9120707316],[4.7827924336,43.9119582234],[4.7837788597,43.911886305],[4.7886749527,43.9123247241],[4.7915304687,43.9127307062],[4.7926164135,43.9123780205],[4.7928625085,43.9118482776],[4.7913695627,43.9081199474],[4.7896041953,43.9045518032],[4.7885725387,43.902659444],[4.7859043309,43.8978773148],[4.7848094353,43.8959850659],[4.78256216,43.8932627764],[4.7820826026,43.8927341081],[4.7817217291,43.892059475],[4.7815081141,43.8911573976],[4.7813400256,43.8906371463],[4.7794372147,43.8883322612],[4.7718894401,43.8810683502],[4.7672819072,43.877155375],[4.7564581645,43.8711730955],[4.7538336021,43.8693781118],[4.7497815946,43.8661855449],[4.7459903891,43.863247908],[4.7369386076,43.8578988493],[4.734467306,43.8577104293],[4.733158799,43.8598069274],[4.730215398,43.8641184728],[4.7296095895,43.864490831],[4.7287830035,43.865543585],[4.7286979598,43.8659400915],[4.7283753568,43.8662980546],[4.7288437586,43.8749499596],[4.7278491773,43.8808202298],[4.7262367054,43.8809150541],[4.7242073239,43.8811334594],[4.7226580818,43.8814270634],[4.7198855369,43.8820117699],[4.7156033252,43.8864484475],[4.7153269806,43.8871098947],[4.7141055106,43.8905343262],[4.7133271575,43.8932163761],[4.7131222789,43.8941458418],[4.7126191906,43.8963383919],[4.7118022496,43.898693389],[4.711184166,43.8990046275],[4.7093257818,43.898013869],[4.7093177748,43.8980121341],[4.709324838,43.898017884]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000024475","CODE_COM":"035","INSEE_COM":"13035","NOM_COM":"EYGUIERES","STATUT":"Commune simple","X_CHF_LIEU":863756.0,"Y_CHF_LIEU":6290590.0,"X_CENTROID":862836.0,"Y_CENTROID":6291828.0,"Z_MOYEN":158.0,"SUPERFICIE":"6879","POPULATION":"6724","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0727589355,43.6838173049],[5.0726243998,43.6836641467],[5.0718429556,43.6828743216],[5.0704233022,43.6816870849],[5.0689481736,43.6806449063],[5.0601883038,43.6749568026],[5.0579049384,43.6738442813],[5.0517754651,43.6713272553],[5.0483484493,43.6698841687],[5.0447418136,43.6683021392],[5.0404282448,43.6661526937],[5.0382666839,43.66499249],[5.0320352948,43.6615771112],[5.0266341287,43.6586895844],[5.0160283424,43.6544375821],[5.0016980645,43.6488742948],[4.9993033517,43.6479885739],[4.9986825724,43.6479594845],[4.9981280417,43.6480173819],[4.9890222674,43.6511555179],[4.9859750123,43.6522193119],[4.9803573329,43.654200244],[4.9702759233,43.6577190842],[4.9687951649,43.6583174552],[4.972996136,43.66392083],[4.9752068123,43.6667627728],[4.9774607985,43.6700269344],[4.9805718726,43.6759802349],[4.9811828861,43.677260742],[4.9827141689,43.6809790389],[4.9828491192,43.6825490492],[4.9827851525,43.6838544575],[4.9819800036,43.6867170438],[4.9817575881,43.6873511659],[4.9805158703,43.6947393151],[4.9795848007,43.7006069477],[4.9794761192,43.7017700641],[4.9793781492,43.7034586501],[4.9792819765,43.7051994116],[4.9791807551,43.7070455797],[4.979990829,43.7106654993],[4.9801881675,43.7175207916],[4.9676681701,43.7200332344],[4.9646814016,43.720373421],[4.9609839058,43.720944159],[4.9586768166,43.7212737333],[4.9543287489,43.7251134603],[4.9534995718,43.7260572618],[4.9535246397,43.7283197035],[4.9542908845,43.7288766253],[4.9639810192,43.7329166114],[4.971665977,43.7371613233],[4.9773257602,43.7401803359],[4.9883674633,43.7452801597],[4.9968818229,43.748282951],[4.9977141462,43.748969796],[4.9980842096,43.7487928802],[5.0169833465,43.7498910242],[5.0180441115,43.7499703891],[5.0189590577,43.7503512964],[5.0201625218,43.7511661175],[5.0327962647,43.7504296492],[5.0451108876,43.7460178716],[5.0470002744,43.7439921328],[5.0532664083,43.7369906927],[5.0592452759,43.7305002125],[5.0595252387,43.7298630124],[5.0614692529,43.7248673066],[5.0620201723,43.7234148389],[5.0631802234,43.7215421599],[5.0624775054,43.7216391905],[5.0572136242,43.7229125878],[5.0538348253,43.7238378274],[5.0536811813,43.7214922549],[5.0538202195,43.718898126],[5.0542004365,43.7165235841],[5.0543514403,43.7156475996],[5.0601225085,43.7098964512],[5.0611591739,43.7032914345],[5.0624953719,43.6996367831],[5.0677261913,43.6934202179],[5.0709399488,43.6862696853],[5.0711682309,43.6858593825],[5.0720344247,43.684533205],[5.0727589355,43.6838173049]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000024485","CODE_COM":"074","INSEE_COM":"84074","NOM_COM":"MERINDOL","STATUT":"Commune simple","X_CHF_LIEU":877439.0,"Y_CHF_LIEU":6297679.0,"X_CENTROID":876556.0,"Y_CENTROID":6297417.0,"Z_MOYEN":222.0,"SUPERFICIE":"2708","POPULATION":"1999","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.138787747,43.752796174],[5.186262132,43.735507966],[5.2027566029,43.7394483832],[5.1906605168,43.7358918451],[5.1879758806,43.73509965],[5.1869788426,43.7353240258],[5.1733167415,43.7388049705],[5.1665903655,43.741604479],[5.1621908959,43.7434346921],[5.1404956797,43.7520747999],[5.1387814791,43.7527935195],[5.1387875458,43.7527962539],[5.138787747,43.752796174]]],[[[5.236377715,43.747470857],[5.2363784158,43.7474708314],[5.2363786823,43.7474662521],[5.2363608254,43.7474668301],[5.236377715,43.747470857]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000024984","CODE_COM":"203","INSEE_COM":"13203","NOM_COM":"MARSEILLE-3E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":891993.0,"Y_CHF_LIEU":6247255.0,"X_CENTROID":893005.0,"Y_CENTROID":6248894.0,"Z_MOYEN":26.0,"SUPERFICIE":"255","POPULATION":"45337","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3715768681,43.3200849312],[5.3755437064,43.3211363287],[5.3760939461,43.3209982392],[5.3769559452,43.3205886967],[5.3785004532,43.3192443466],[5.3822410265,43.3167581213],[5.3879397835,43.3149566178],[5.3927073758,43.3162956868],[5.3931841692,43.3164093319],[5.3932190058,43.3136860909],[5.3927555359,43.3118738739],[5.3919307622,43.3102343509],[5.3915309252,43.309894903],[5.390500823,43.3093947963],[5.3810495133,43.3040271164],[5.376286093,43.3016813104],[5.3750228714,43.3015875793],[5.3739699832,43.3015144132],[5.3744386493,43.3019433057],[5.3745014031,43.3023001169],[5.3679976102,43.3137627075],[5.3705681223,43.314529854],[5.3691311364,43.316722212],[5.3690337917,43.3168728424],[5.3700236136,43.3194224027],[5.3715913821,43.3199883144],[5.3715768681,43.3200849312]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000025010","CODE_COM":"041","INSEE_COM":"13041","NOM_COM":"GARDANNE","STATUT":"Commune simple","X_CHF_LIEU":900475.0,"Y_CHF_LIEU":6264839.0,"X_CENTROID":901127.0,"Y_CENTROID":6264064.0,"Z_MOYEN":257.0,"SUPERFICIE":"2718","POPULATION":"19844","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4691492221,43.4890096286],[5.4693383422,43.4888937048],[5.4719039314,43.4881808425],[5.4772123012,43.4867400822],[5.4813640474,43.4824532079],[5.4825739926,43.4808727756],[5.4826642794,43.4805304577],[5.4825753617,43.4782713624],[5.4820332529,43.4734743844],[5.4816044137,43.4724733605],[5.4821250758,43.470534267],[5.4846035716,43.4690867826],[5.4891979343,43.4665591195],[5.4961121296,43.4633918671],[5.4961443102,43.4632507062],[5.4963173339,43.4629379774],[5.4970258476,43.462720026],[5.508458481,43.4556240215],[5.5201462394,43.4482670132],[5.5226713639,43.4466861347],[5.5258380796,43.4444709534],[5.5282759706,43.4416435027],[5.5292095961,43.4405415607],[5.5294763799,43.4401473784],[5.5291384632,43.4395980922],[5.5288711451,43.4389967504],[5.5254331923,43.4351938383],[5.5214509944,43.4314467151],[5.5169052746,43.4296838082],[5.5066242413,43.4283704461],[5.5053427534,43.4282110744],[5.5022421255,43.4279389131],[5.500013923,43.4283882153],[5.4990072267,43.4286121711],[5.4947864109,43.4299624205],[5.493419794,43.4304034372],[5.4924712606,43.4307169027],[5.4849878813,43.430886151],[5.4773539226,43.4310295226],[5.466907525,43.4294407592],[5.4661238601,43.4288204393],[5.464345576,43.4300634388],[5.4638568467,43.430331084],[5.4556113628,43.4349530883],[5.4486793502,43.4436194997],[5.4453041131,43.4471566072],[5.44501872,43.4474177758],[5.4451770726,43.4476554283],[5.447607617,43.4566078646],[5.4486768971,43.4602462389],[5.4486748312,43.465217588],[5.4475672085,43.4668349045],[5.4462104198,43.4686972641],[5.4438778403,43.470109955],[5.4425845569,43.470969912],[5.4417897012,43.4715188881],[5.4420368949,43.4729156949],[5.4485914386,43.4750406148],[5.4533413146,43.4769791825],[5.4578280478,43.4794626926],[5.4610302085,43.4830292484],[5.4648055008,43.48720919],[5.4668900617,43.4884525665],[5.4672982231,43.4886872144],[5.4680721741,43.4890620565],[5.4685480755,43.4890602232],[5.4691492221,43.4890096286]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000025028","CODE_COM":"027","INSEE_COM":"83027","NOM_COM":"LA CADIERE-D'AZUR","STATUT":"Commune simple","X_CHF_LIEU":924093.0,"Y_CHF_LIEU":6236879.0,"X_CENTROID":921158.0,"Y_CENTROID":6237772.0,"Z_MOYEN":171.0,"SUPERFICIE":"3767","POPULATION":"5487","CODE_ARR":"2","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6960309582,43.2392778568],[5.7035411928,43.2415222685],[5.7044859189,43.2416511087],[5.6960309582,43.2392778568]]],[[[5.6824259812,43.2354572395],[5.6832409619,43.2358255926],[5.6839089702,43.2360546985],[5.6858834906,43.2364284037],[5.6824259812,43.2354572395]]],[[[5.6824148128,43.2354470112],[5.6824123258,43.2354510675],[5.6824160493,43.2354527504],[5.6824148128,43.2354470112]]],[[[5.6783838234,43.216731767],[5.6779885854,43.2197824217],[5.6792492233,43.224485288],[5.6804236151,43.2284927773],[5.6814275632,43.2308644778],[5.6783838234,43.216731767]]],[[[5.675955773,43.19064331],[5.6759551102,43.1906414628],[5.6759146096,43.1909973546],[5.6761325705,43.1928342604],[5.6761858091,43.1931154779],[5.675955773,43.19064331]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000025040","CODE_COM":"092","INSEE_COM":"13092","NOM_COM":"SAINT-CHAMAS","STATUT":"Commune simple","X_CHF_LIEU":864476.0,"Y_CHF_LIEU":6274491.0,"X_CENTROID":867457.0,"Y_CENTROID":6274014.0,"Z_MOYEN":59.0,"SUPERFICIE":"2688","POPULATION":"8069","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0626277691,43.5584517833],[5.0631475541,43.5573492514],[5.0643905646,43.5562950687],[5.0652427081,43.5564174663],[5.0718498067,43.5577109342],[5.0761448799,43.5586162262],[5.0765118105,43.5587010129],[5.076793371,43.5588549354],[5.0773649911,43.559260721],[5.0784310667,43.560914409],[5.0795267897,43.5634531737],[5.0797475363,43.5658223873],[5.0840130789,43.5688259861],[5.0900412748,43.5698072823],[5.090865432,43.5691541715],[5.0931172944,43.5672242563],[5.0937940657,43.5665028598],[5.0945463629,43.5656467933],[5.096617422,43.5627725321],[5.097576682,43.5614858206],[5.0998493755,43.5588200173],[5.1034606109,43.5543551286],[5.1054218277,43.5546843278],[5.1075741468,43.5550943871],[5.108734663,43.5522888756],[5.1116765435,43.5453660725],[5.1144211685,43.5399600346],[5.1165513501,43.5355190738],[5.1191238617,43.5296977734],[5.1212289499,43.5244633923],[5.1216714168,43.5231478811],[5.1217224398,43.5229218731],[5.1216335621,43.5198121759],[5.1218645887,43.5179634803],[5.1219374401,43.5158172686],[5.1218327074,43.5155934083],[5.1192644979,43.5130245148],[5.1180718273,43.5132116163],[5.118136243,43.5149924247],[5.118209249,43.5180124165],[5.1173710092,43.5198324538],[5.1171362728,43.5201079462],[5.1143971423,43.5224717626],[5.1137447561,43.5230280983],[5.1102379118,43.524872141],[5.1086615061,43.5254968164],[5.1065010592,43.5258132965],[5.1050885732,43.5259847178],[5.1026812481,43.5260458004],[5.0893141543,43.5255156095],[5.0765837549,43.5264053374],[5.0667203022,43.5274333973],[5.0643299415,43.5278308138],[5.0586958833,43.5278739612],[5.0584471117,43.52783548],[5.0565073076,43.527344851],[5.0555622567,43.5269640496],[5.0500881934,43.5235854437],[5.0464349022,43.5221387865],[5.0450803416,43.5231399477],[5.0431724822,43.5252783353],[5.0388009632,43.5313681969],[5.0322512284,43.5397685648],[5.0309517809,43.5468247943],[5.0251116456,43.5530406145],[5.0219939855,43.5561561391],[5.0228562373,43.5567088945],[5.0233729457,43.5568675705],[5.0270106716,43.5575476315],[5.0338276958,43.5597242166],[5.0362873183,43.5633304658],[5.0381896753,43.5662235028],[5.0382161849,43.5676324724],[5.038228698,43.5680894597],[5.0389370336,43.5686206865],[5.0390800745,43.5687098047],[5.0402692605,43.5689430771],[5.0408137907,43.569009347],[5.0454334735,43.5692887334],[5.0456980018,43.5691046403],[5.0472512302,43.5661817158],[5.0491606221,43.5631854466],[5.0514164159,43.561333756],[5.0539620304,43.5598725539],[5.0559840183,43.5595867657],[5.0620812144,43.5585683723],[5.0626277691,43.5584517833]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000025407","CODE_COM":"059","INSEE_COM":"13059","NOM_COM":"MEYRARGUES","STATUT":"Commune simple","X_CHF_LIEU":904061.0,"Y_CHF_LIEU":6285110.0,"X_CENTROID":902675.0,"Y_CENTROID":6284305.0,"Z_MOYEN":317.0,"SUPERFICIE":"4177","POPULATION":"3743","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5281770624,43.659695925],[5.5314503583,43.6590069086],[5.5326879328,43.6589798874],[5.5350845844,43.6593563128],[5.5498115881,43.6597515151],[5.5498207247,43.6597497844],[5.5482638772,43.6554695],[5.5464370145,43.6502970738],[5.5447258188,43.6449859958],[5.5435917665,43.6393769316],[5.5413941072,43.634598484],[5.5396466306,43.6313012075],[5.5413086169,43.6274128943],[5.5461023927,43.6192920901],[5.5476122414,43.6126660253],[5.5488878963,43.6099776955],[5.5520344068,43.6055682737],[5.55647375,43.6026884524],[5.5606529228,43.6008444503],[5.5647820047,43.5993543597],[5.5731608457,43.5959855357],[5.5811195956,43.5922479342],[5.5821812034,43.5915079072],[5.5857789515,43.5907039117],[5.5870043422,43.590466772],[5.5876547181,43.5903873598],[5.5876504816,43.5899913547],[5.5875025853,43.5897878233],[5.5854315374,43.5887937719],[5.5832419364,43.5880257627],[5.5729125925,43.5842361414],[5.5674701474,43.5822242153],[5.5583021857,43.5793834428],[5.5576638962,43.5796208353],[5.5571461423,43.5798121745],[5.5565629333,43.5799519393],[5.5443000031,43.5817127407],[5.5393533585,43.581752918],[5.5371140908,43.5816891347],[5.5363414574,43.5816351676],[5.5349475411,43.5813931524],[5.5334302332,43.5830120444],[5.5316451202,43.5840925279],[5.5282079458,43.5866355997],[5.5265264815,43.5881339851],[5.5245093569,43.5901685751],[5.5225731462,43.5922156512],[5.5206620061,43.5948364505],[5.5188625735,43.597212467],[5.5173480808,43.5991974564],[5.513514359,43.604203248],[5.511213139,43.6071857965],[5.5084827142,43.6084902886],[5.5076332978,43.6087844675],[5.5067542655,43.6089965024],[5.5051785751,43.6091714846],[5.5021646544,43.6096910564],[5.500095854,43.6101221809],[5.4986544604,43.6105370364],[5.4917710158,43.6125360854],[5.4868098825,43.615902251],[5.4804957774,43.6203451364],[5.4769732514,43.6232224789],[5.4766633327,43.6234780042],[5.4768634436,43.6238074251],[5.4802054103,43.6289596976],[5.4826525973,43.6355601079],[5.483094091,43.6414609489],[5.4830145757,43.6419146831],[5.4821937051,43.6453444237],[5.4846240226,43.6533361426],[5.4854767315,43.6539864317],[5.4857054172,43.6546851933],[5.4866765205,43.6593208539],[5.4873667079,43.6636235563],[5.4878089466,43.6665833649],[5.488084383,43.6676429609],[5.488125684,43.6676394587],[5.5281770624,43.659695925]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000025548","CODE_COM":"102","INSEE_COM":"13102","NOM_COM":"SAINT-VICTORET","STATUT":"Commune simple","X_CHF_LIEU":880927.0,"Y_CHF_LIEU":6260527.0,"X_CENTROID":882555.0,"Y_CENTROID":6259871.0,"Z_MOYEN":48.0,"SUPERFICIE":"469","POPULATION":"6567","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2749386619,43.4188751089],[5.2744776111,43.4162072341],[5.2728916661,43.4087199998],[5.2707956195,43.4043116226],[5.2698069267,43.4038436493],[5.2674048814,43.4026861695],[5.2659821057,43.40181955],[5.2650800628,43.4010734207],[5.2642439828,43.4017839141],[5.2639060481,43.4020105824],[5.2633385632,43.4024580502],[5.259709477,43.405065572],[5.2550234762,43.4084950936],[5.2486062557,43.4103808611],[5.2446609937,43.4114320234],[5.241609545,43.4116941363],[5.2338007131,43.4131164105],[5.2293860755,43.4162124985],[5.228047589,43.4175162512],[5.2264871434,43.420169159],[5.2288109186,43.4211581688],[5.2338312026,43.4225847526],[5.2354606122,43.4229534376],[5.2369911296,43.4230964384],[5.2382296668,43.4231293506],[5.2390144051,43.42308253],[5.2391382575,43.4230286688],[5.2480450847,43.4212664339],[5.2618474954,43.4190755159],[5.2678914286,43.4183866046],[5.2738141984,43.4185405161],[5.274475211,43.4188641429],[5.2749386619,43.4188751089]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000025809","CODE_COM":"035","INSEE_COM":"83035","NOM_COM":"LE CASTELLET","STATUT":"Commune simple","X_CHF_LIEU":925773.0,"Y_CHF_LIEU":6237705.0,"X_CENTROID":925467.0,"Y_CENTROID":6239663.0,"Z_MOYEN":264.0,"SUPERFICIE":"4533","POPULATION":"4088","CODE_ARR":"2","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7415112262,43.2628546636],[5.7420367669,43.2630578127],[5.7509245589,43.2654177497],[5.7600090504,43.2672390972],[5.7609007451,43.2673387625],[5.7415112262,43.2628546636]]],[[[5.702477444,43.2476659417],[5.705735734,43.2490457652],[5.709366147,43.2507620555],[5.7136126787,43.2535824311],[5.7208212008,43.2564009764],[5.7231573602,43.2570549486],[5.7305684846,43.2590020786],[5.702477444,43.2476659417]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000026014","CODE_COM":"063","INSEE_COM":"13063","NOM_COM":"MIRAMAS","STATUT":"Commune simple","X_CHF_LIEU":861690.0,"Y_CHF_LIEU":6277852.0,"X_CENTROID":862777.0,"Y_CENTROID":6278604.0,"Z_MOYEN":52.0,"SUPERFICIE":"2576","POPULATION":"25002","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0219939855,43.5561561391],[5.0209819766,43.5562001861],[5.0168926208,43.5562573432],[5.0144469318,43.5555440322],[5.0131734086,43.5560707745],[5.0115664086,43.5563345733],[5.0098719931,43.5566116669],[5.0096959267,43.5562486153],[5.0094964409,43.5557113917],[5.0089944537,43.5533194122],[5.008754297,43.5526803385],[5.0084108566,43.5522015802],[5.0074289908,43.5514070213],[5.0063251817,43.5509819182],[5.0048539089,43.550593293],[5.0025270233,43.5502591384],[5.0017446051,43.5524138245],[5.0015204739,43.554362009],[5.0030397681,43.5571537645],[5.0044442668,43.5595246133],[5.0063268363,43.5621494247],[5.0011021921,43.5687422808],[4.9962672593,43.5727284282],[4.9929865872,43.5794957591],[4.9931037125,43.5797312194],[4.9833964596,43.5878724824],[4.9782812699,43.591964652],[4.9671498185,43.6009143204],[4.9672175384,43.6010472006],[4.9690089346,43.6014953696],[4.97445145,43.6020131188],[4.9793598443,43.6028418465],[4.9800886351,43.6030364767],[4.9802195365,43.6036353234],[4.9804133372,43.6051591749],[4.980420696,43.6079915011],[4.980142558,43.6124932362],[4.9798091029,43.6138862972],[4.9783795888,43.6163298841],[4.9833212553,43.6172595652],[4.9885950414,43.6180443384],[4.989579072,43.6174475869],[4.9937309806,43.6147523112],[4.9986327501,43.6114400441],[5.0029497851,43.60853166],[5.0052866811,43.6069584531],[5.0075318618,43.6054579946],[5.0112579926,43.6065285522],[5.0135457299,43.6059983434],[5.0178406034,43.6049573928],[5.0190814065,43.6043510999],[5.0235327282,43.6020280268],[5.0300956491,43.5981037218],[5.0311217648,43.5973878936],[5.0342479309,43.5951962517],[5.0429495741,43.5922220489],[5.04367684,43.5922668713],[5.0440294592,43.5920496218],[5.0469220296,43.5887117284],[5.047297202,43.587773996],[5.0474537624,43.5856028047],[5.0474516984,43.5833239],[5.0530148806,43.5751948825],[5.058760744,43.5687173237],[5.0625892269,43.5598592865],[5.0626927986,43.5593316919],[5.0626277691,43.5584517833],[5.0620812144,43.5585683723],[5.0559840183,43.5595867657],[5.0539620304,43.5598725539],[5.0514164159,43.561333756],[5.0491606221,43.5631854466],[5.0472512302,43.5661817158],[5.0456980018,43.5691046403],[5.0454334735,43.5692887334],[5.0408137907,43.569009347],[5.0402692605,43.5689430771],[5.0390800745,43.5687098047],[5.0389370336,43.5686206865],[5.038228698,43.5680894597],[5.0382161849,43.5676324724],[5.0381896753,43.5662235028],[5.0362873183,43.5633304658],[5.0338276958,43.5597242166],[5.0270106716,43.5575476315],[5.0233729457,43.5568675705],[5.0228562373,43.5567088945],[5.0219939855,43.5561561391]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000026258","CODE_COM":"074","INSEE_COM":"13074","NOM_COM":"PEYROLLES-EN-PROVENCE","STATUT":"Commune simple","X_CHF_LIEU":908590.0,"Y_CHF_LIEU":6286358.0,"X_CENTROID":907611.0,"Y_CENTROID":6284690.0,"Z_MOYEN":318.0,"SUPERFICIE":"3505","POPULATION":"4956","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5726780236,43.6618949619],[5.5752704456,43.6618207999],[5.5922154565,43.6601457357],[5.5943634133,43.659755668],[5.5953952849,43.6595671885],[5.6033983895,43.6589347055],[5.6069435191,43.6586859052],[5.6069890847,43.6584336316],[5.607520161,43.656887702],[5.6061135338,43.646161215],[5.6057195197,43.6442845708],[5.6045891185,43.6349586766],[5.6038226164,43.6271428738],[5.6037497192,43.6213892061],[5.6040159707,43.6169643241],[5.6038010492,43.6127220371],[5.6028366539,43.6092728455],[5.6050251109,43.6044814299],[5.6094196239,43.5989041924],[5.6136296319,43.5948148358],[5.613947937,43.5942976316],[5.6057356071,43.5924415096],[5.5901599225,43.5905707026],[5.5876547181,43.5903873598],[5.5870043422,43.590466772],[5.5857789515,43.5907039117],[5.5821812034,43.5915079072],[5.5811195956,43.5922479342],[5.5731608457,43.5959855357],[5.5647820047,43.5993543597],[5.5606529228,43.6008444503],[5.55647375,43.6026884524],[5.5520344068,43.6055682737],[5.5488878963,43.6099776955],[5.5476122414,43.6126660253],[5.5461023927,43.6192920901],[5.5413086169,43.6274128943],[5.5396466306,43.6313012075],[5.5413941072,43.634598484],[5.5435917665,43.6393769316],[5.5447258188,43.6449859958],[5.5464370145,43.6502970738],[5.5482638772,43.6554695],[5.5498207247,43.6597497844],[5.5498484856,43.6597540343],[5.5726780236,43.6618949619]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000026308","CODE_COM":"024","INSEE_COM":"13024","NOM_COM":"CHARLEVAL","STATUT":"Commune simple","X_CHF_LIEU":880982.0,"Y_CHF_LIEU":6293653.0,"X_CENTROID":880953.0,"Y_CENTROID":6294202.0,"Z_MOYEN":164.0,"SUPERFICIE":"1437","POPULATION":"2532","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.24555397,43.747135162],[5.264085184,43.7442349581],[5.2641052004,43.7442286391],[5.2636894058,43.7433856757],[5.2629290891,43.7418684064],[5.2627823152,43.7414222476],[5.2625956109,43.739965974],[5.2623028922,43.7340054268],[5.2622702048,43.7309480822],[5.26248572,43.7300875019],[5.263217573,43.7286283499],[5.2685849335,43.7203796263],[5.2688744059,43.7198226653],[5.2682407146,43.7188969568],[5.2661377352,43.715938577],[5.2635582374,43.7137606521],[5.2624047801,43.712899738],[5.2591620931,43.7095382396],[5.2561387137,43.7060640898],[5.2546788317,43.7014160414],[5.2511109663,43.6974552624],[5.2457080247,43.6950905017],[5.241036033,43.6940201977],[5.2390425689,43.6938037894],[5.2367173615,43.6955439607],[5.2352996635,43.6967298317],[5.2346178386,43.6974117735],[5.233978532,43.6985798373],[5.2338906149,43.6988706014],[5.2338897462,43.6994845449],[5.2316205164,43.7014611054],[5.2291261288,43.703108262],[5.2286882122,43.7029831046],[5.2274369699,43.7052672895],[5.2267363908,43.7063654515],[5.2262707025,43.7069628013],[5.2261496991,43.707010286],[5.2259939121,43.7075994943],[5.2253646866,43.7098646317],[5.2241424512,43.7168327795],[5.2237412448,43.7201797911],[5.2234979985,43.7227053037],[5.2237745304,43.7284186031],[5.2239622999,43.7284588769],[5.2278531008,43.7306370218],[5.2314834123,43.7336728692],[5.2389772548,43.7409790363],[5.2419116549,43.7438101375],[5.2455524275,43.7471352185],[5.24555397,43.747135162]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000026397","CODE_COM":"147","INSEE_COM":"84147","NOM_COM":"VILLELAURE","STATUT":"Commune simple","X_CHF_LIEU":896176.0,"Y_CHF_LIEU":6293203.0,"X_CENTROID":895625.0,"Y_CENTROID":6293129.0,"Z_MOYEN":203.0,"SUPERFICIE":"1806","POPULATION":"3284","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3881814017,43.7021656603],[5.3881280263,43.7021823974],[5.388129437,43.7021852501],[5.3881814017,43.7021656603]]],[[[5.412714004,43.692913056],[5.4127188943,43.6929111332],[5.4127138029,43.6929103446],[5.4127025623,43.6929173733],[5.412714004,43.692913056]]],[[[5.44529295,43.680095673],[5.4452961909,43.680094731],[5.445294173,43.6800898693],[5.4442411229,43.6799460938],[5.4392420964,43.6811080027],[5.4375892591,43.6817068082],[5.4258053187,43.6865776839],[5.4138631894,43.6922159689],[5.4129237527,43.6928305847],[5.44529295,43.680095673]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000026547","CODE_COM":"078","INSEE_COM":"13078","NOM_COM":"PORT-SAINT-LOUIS-DU-RHONE","STATUT":"Commune simple","X_CHF_LIEU":846279.0,"Y_CHF_LIEU":6255926.0,"X_CENTROID":843998.0,"Y_CENTROID":6260071.0,"Z_MOYEN":1.0,"SUPERFICIE":"8328","POPULATION":"8565","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.853194237,43.398471833],[4.852637768,43.398471833],[4.852637768,43.3982968911],[4.8503617974,43.3980383512],[4.8496771214,43.3984684948],[4.850013507,43.398836198],[4.8451020266,43.4020021],[4.8497499266,43.3999277579],[4.8532738955,43.3984870773],[4.853194237,43.3984615802],[4.853194237,43.398471833]]],[[[4.837639,43.405418],[4.837639,43.40514],[4.836805,43.40514],[4.836805,43.404861],[4.836527,43.404861],[4.836527,43.404026],[4.836249,43.404026],[4.836249,43.403751],[4.835973,43.403751],[4.835973,43.403473],[4.835695,43.403473],[4.835695,43.402637],[4.835973,43.402637],[4.835973,43.402084],[4.836249,43.402084],[4.836249,43.401806],[4.836527,43.401806],[4.836527,43.401527],[4.836249,43.401527],[4.836249,43.399582],[4.835973,43.399582],[4.835973,43.3981502756],[4.8358563366,43.3980396165],[4.8359031215,43.3974943979],[4.836527,43.3975461331],[4.836527,43.397362],[4.836805,43.397362],[4.836805,43.397251],[4.836805,43.397083],[4.837083,43.397083],[4.837083,43.396805],[4.837361,43.396805],[4.837361,43.396526],[4.8375791126,43.3965260001],[4.837639,43.3964177713],[4.837639,43.396252],[4.8377307274,43.3962520001],[4.837917,43.3959153624],[4.837917,43.395416],[4.8381933091,43.395416],[4.838195,43.3954129442],[4.838195,43.394859],[4.838473,43.394859],[4.838473,43.394028],[4.838749,43.394028],[4.838749,43.393749],[4.839027,43.393749],[4.839027,43.393471],[4.839861,43.393471],[4.839861,43.393749],[4.840139,43.393749],[4.840139,43.394306],[4.840417,43.394306],[4.840417,43.3945826242],[4.8411815097,43.3946079472],[4.8427797823,43.3943449867],[4.844584,43.3938005414],[4.844584,43.393749],[4.8447029656,43.3937490001],[4.844862,43.3936468071],[4.844862,43.393471],[4.8451355918,43.393471],[4.84514,43.3934681673],[4.84514,43.393196],[4.845415,43.393196],[4.845415,43.392918],[4.845693,43.392918],[4.845693,43.392639],[4.84625,43.392639],[4.84625,43.392361],[4.8468629149,43.3923610006],[4.847084,43.3922189236],[4.847084,43.392082],[4.8472970615,43.3920820017],[4.8475527874,43.3919176606],[4.8486503145,43.3915884673],[4.8502444104,43.3927733677],[4.8520434649,43.3931925441],[4.852916,43.3926613015],[4.852916,43.392361],[4.8531512007,43.392361],[4.853194,43.3922198684],[4.853194,43.392105],[4.853194,43.391529],[4.853239124,43.391529],[4.8529103044,43.3909100211],[4.8515252969,43.3902030189],[4.8518576298,43.3895251275],[4.8538450776,43.3888234031],[4.8594534629,43.3893050026],[4.859583,43.389305],[4.859583,43.3893161226],[4.8717953472,43.3903637657],[4.8718279259,43.3900374455],[4.8541108703,43.3886091802],[4.8546766006,43.3881950032],[4.85375,43.388195],[4.85375,43.387917],[4.853472,43.387917],[4.853472,43.387638],[4.853194,43.387638],[4.853194,43.38736],[4.852916,43.38736],[4.852916,43.386806],[4.852638,43.386806],[4.852638,43.386528],[4.852362,43.386528],[4.852362,43.38625],[4.852084,43.38625],[4.852084,43.385971],[4.851974,43.385971],[4.851528,43.385971],[4.851528,43.385693],[4.850694,43.385693],[4.850694,43.385418],[4.850416,43.385418],[4.850416,43.385139],[4.850138,43.385139],[4.850138,43.384583],[4.849862,43.384583],[4.849862,43.384304],[4.849584,43.384304],[4.849584,43.384029],[4.849306,43.384029],[4.849306,43.383472],[4.849028,43.383472],[4.849028,43.3827718156],[4.8490088267,43.382637],[4.84875,43.382637],[4.84875,43.381527],[4.848472,43.381527],[4.848472,43.381012],[4.848314,43.381004],[4.84764,43.380974],[4.84764,43.381248],[4.847362,43.381248],[4.847362,43.381527],[4.847084,43.381527],[4.847084,43.381805],[4.846806,43.381805],[4.846806,43.382084],[4.845693,43.382084],[4.845693,43.381805],[4.844862,43.381805],[4.844862,43.381248],[4.844584,43.381248],[4.844584,43.380695],[4.844862,43.380695],[4.844862,43.380417],[4.84606,43.380417],[4.84625,43.380417],[4.84625,43.380138],[4.848472,43.380138],[4.848472,43.37986],[4.849028,43.37986],[4.849028,43.379581],[4.8491775904,43.3795810003],[4.8488069091,43.3790577827],[4.8473829189,43.3784710035],[4.846795482,43.3784710023],[4.8454310252,43.3785025861],[4.8451319085,43.3784710027],[4.844584,43.378471],[4.844584,43.3784131474],[4.8443157144,43.3783848172],[4.843381298,43.3781370752],[4.8430607732,43.377874374],[4.8428871115,43.3776400008],[4.842361,43.37764],[4.842361,43.377361],[4.842083,43.377361],[4.842083,43.3769507151],[4.8419083986,43.3768672462],[4.8416166986,43.3768040026],[4.840417,43.376804],[4.840417,43.376663621],[4.839305,43.3766012716],[4.839305,43.376804],[4.838473,43.376804],[4.838473,43.376554614],[4.8380174898,43.3765290668],[4.836527,43.376526],[4.836527,43.3763761628],[4.8344683763,43.3761324389],[4.8313216308,43.3760615489],[4.8289107176,43.3758926489],[4.8286586395,43.3757628292],[4.82871477,43.3756269019],[4.8289558128,43.37548695],[4.8303558094,43.3750943399],[4.8309093099,43.3750822781],[4.833473,43.375096533],[4.833473,43.374863],[4.834861,43.374863],[4.834861,43.375137],[4.836249,43.375137],[4.836249,43.3752831008],[4.8374574632,43.3753987382],[4.838195,43.3754538155],[4.838195,43.375431],[4.838195,43.375137],[4.838473,43.375137],[4.838473,43.374863],[4.839305,43.374863],[4.839305,43.375137],[4.839583,43.375145],[4.839583,43.375416],[4.840417,43.375416],[4.840417,43.3756197177],[4.8411881524,43.3756772837],[4.8413370297,43.3756940008],[4.841527,43.375694],[4.841527,43.3757153318],[4.8423643077,43.3758093455],[4.842639,43.375780338],[4.842639,43.375694],[4.842917,43.375694],[4.842917,43.375137],[4.843196,43.375137],[4.843196,43.374863],[4.844027,43.374863],[4.844027,43.374584],[4.844305,43.374584],[4.844305,43.374306],[4.8446152278,43.3743060004],[4.8455052901,43.3732749086],[4.8465726552,43.3724774212],[4.8475530159,43.3728908235],[4.8484479456,43.3734700008],[4.84875,43.37347],[4.84875,43.373299],[4.84875,43.373196],[4.849261,43.373196],[4.849862,43.373196],[4.849862,43.37347],[4.850138,43.373474],[4.85014,43.374027],[4.850416,43.374027],[4.850416,43.374584],[4.850694,43.374584],[4.850694,43.3748952213],[4.8514565161,43.3753248377],[4.8523300471,43.375060628],[4.8539058783,43.3730458438],[4.854028,43.3729428608],[4.854028,43.372917],[4.8540586667,43.372917],[4.854306,43.3727084267],[4.854306,43.37236],[4.854584,43.37236],[4.854584,43.37212],[4.854584,43.371529],[4.85486,43.371529],[4.85486,43.37125],[4.8560353822,43.3712500012],[4.8561419894,43.3711600938],[4.85625,43.3711266792],[4.85625,43.370972],[4.8567499827,43.3709720008],[4.8569334159,43.3709152517],[4.857082,43.3707289784],[4.857082,43.370693],[4.8571106987,43.370693],[4.8574384728,43.3702820789],[4.8577425994,43.3692708113],[4.8576910663,43.3679407993],[4.8582480122,43.3675406968],[4.858473,43.3674518058],[4.858473,43.367363],[4.8586977703,43.3673630001],[4.858751,43.3673419691],[4.858751,43.367085],[4.859583,43.367085],[4.859583,43.367321804],[4.8596433894,43.3673630001],[4.859861,43.367363],[4.859861,43.3678736301],[4.8600100088,43.3683625955],[4.8599857948,43.3692169819],[4.859925265,43.3695830001],[4.860139,43.369583],[4.860139,43.3700320717],[4.8605766376,43.3700571966],[4.8610599445,43.3698212204],[4.8620703915,43.3689885618],[4.8625946163,43.3683019427],[4.863195,43.3674197204],[4.863195,43.367363],[4.8632335995,43.367363],[4.863473,43.3670112086],[4.863473,43.366528],[4.863751,43.366528],[4.863751,43.366249],[4.8639613885,43.3662490001],[4.864029,43.3661427107],[4.864029,43.365971],[4.8641382259,43.3659710001],[4.8642818744,43.3657451729],[4.864305,43.3657148451],[4.864305,43.365696],[4.8643193697,43.3656960001],[4.8646309108,43.3652874282],[4.8648943224,43.3649661374],[4.8656044369,43.3649943907],[4.8657963725,43.365170154],[4.8659496673,43.366528],[4.865971,43.366528],[4.865971,43.366716955],[4.8659987547,43.3669627908],[4.866020944,43.3674573333],[4.865971,43.3675174927],[4.865971,43.367638],[4.8658709552,43.3676380001],[4.865695,43.3678499427],[4.865695,43.367916],[4.8656401587,43.3679160001],[4.865417,43.3681847972],[4.865417,43.368195],[4.8654085295,43.368195],[4.8652599899,43.3683739159],[4.864861,43.3687534411],[4.864861,43.369305],[4.865139,43.369305],[4.865139,43.3696820063],[4.865436203,43.3698538559],[4.865695,43.3698338804],[4.865695,43.369583],[4.866213,43.369583],[4.866249,43.369305],[4.866527,43.369305],[4.866527,43.369026],[4.866941,43.369026],[4.867083,43.369026],[4.867083,43.368919],[4.867083,43.368752],[4.8673,43.368752],[4.867361,43.368706],[4.867361,43.368473],[4.8676637691,43.368473],[4.868195,43.3676613373],[4.868195,43.367638],[4.8682102739,43.367638],[4.8682452696,43.3675845296],[4.868471,43.3673446422],[4.868471,43.367085],[4.8687153169,43.367085],[4.868749,43.3670492039],[4.868749,43.366806],[4.868977846,43.3668060001],[4.869027,43.3667537618],[4.869027,43.366528],[4.8692394311,43.3665280001],[4.869305,43.3664583161],[4.869305,43.366249],[4.8695019541,43.3662490001],[4.869583,43.3661628667],[4.869583,43.365971],[4.869763533,43.3659710001],[4.869845351,43.3658840452],[4.869861,43.3658647415],[4.869861,43.365417],[4.870139,43.365417],[4.870139,43.364861],[4.870418,43.364861],[4.870418,43.364307],[4.870696,43.364307],[4.870696,43.364029],[4.870842011,43.3640290003],[4.8709259042,43.363836176],[4.8726994027,43.3618608942],[4.8732219735,43.3611292596],[4.873472,43.36098305],[4.873472,43.360695],[4.87375,43.360695],[4.87375,43.359859],[4.874028,43.359859],[4.874028,43.359306],[4.874306,43.359306],[4.874306,43.358749],[4.874028,43.358749],[4.874028,43.358196],[4.874306,43.358196],[4.874306,43.357918],[4.874584,43.357918],[4.874584,43.357639],[4.87514,43.357639],[4.87514,43.357361],[4.875416,43.357361],[4.875416,43.357082],[4.875694,43.357082],[4.875694,43.356804],[4.875972,43.356804],[4.875972,43.356529],[4.876596,43.356529],[4.876806,43.356529],[4.876806,43.357361],[4.876528,43.357361],[4.876528,43.357918],[4.876806,43.357918],[4.876806,43.358471],[4.87625,43.358471],[4.87625,43.358749],[4.875972,43.358749],[4.875972,43.359306],[4.875694,43.359306],[4.875694,43.359859],[4.875416,43.359859],[4.875416,43.3603109164],[4.8759500196,43.3601434406],[4.8782768489,43.359526262],[4.8790710234,43.3585037277],[4.8794691743,43.3572505047],[4.8801222668,43.3568945111],[4.8817413939,43.3560987818],[4.8822329359,43.3562510003],[4.88236,43.356251],[4.88236,43.355972],[4.882916,43.355972],[4.882916,43.355694],[4.883313,43.355728],[4.883472,43.355743],[4.883472,43.355972],[4.88375,43.355972],[4.88375,43.356251],[4.88486,43.356251],[4.88486,43.356529],[4.885138,43.356529],[4.885138,43.357082],[4.885417,43.357082],[4.885417,43.357639],[4.885138,43.357639],[4.885138,43.358196],[4.88486,43.358196],[4.88486,43.358749],[4.884582,43.358749],[4.884582,43.359028],[4.8843967568,43.3590280001],[4.884307,43.3592966565],[4.884307,43.359306],[4.8843038784,43.359306],[4.8840322224,43.3601190938],[4.8833975865,43.3610776993],[4.8829549074,43.3622120343],[4.8828721354,43.3631133399],[4.882959306,43.3637048345],[4.8834347687,43.3640290001],[4.883472,43.364029],[4.883472,43.3640543837],[4.8835320245,43.3640953073],[4.8842815422,43.3643477188],[4.8848950611,43.3642884407],[4.885138,43.3641529972],[4.885138,43.36375],[4.885417,43.36375],[4.885417,43.363194],[4.886251,43.363194],[4.886251,43.363472],[4.888195,43.363472],[4.888195,43.363194],[4.888751,43.363194],[4.888751,43.36264],[4.889027,43.36264],[4.889027,43.362083],[4.889305,43.362083],[4.889305,43.361576],[4.889305,43.360973],[4.889583,43.360973],[4.889583,43.360138],[4.890417,43.360138],[4.890417,43.360416],[4.890973,43.360416],[4.890973,43.360695],[4.891251,43.360695],[4.891251,43.360973],[4.891805,43.360973],[4.891805,43.361252],[4.892083,43.361252],[4.892083,43.361526],[4.892639,43.361526],[4.892639,43.361805],[4.892361,43.361805],[4.892361,43.362362],[4.891805,43.362362],[4.891805,43.36264],[4.891527,43.36264],[4.891527,43.363018],[4.891527,43.363472],[4.892225,43.363472],[4.893473,43.363472],[4.893473,43.36375],[4.893751,43.36375],[4.893751,43.364029],[4.894305,43.364029],[4.894305,43.364307],[4.896249,43.364307],[4.896249,43.364582],[4.896527,43.364582],[4.896527,43.364861],[4.896805,43.364861],[4.896805,43.365139],[4.897083,43.365139],[4.897083,43.365417],[4.89764,43.365417],[4.89764,43.365696],[4.897918,43.365696],[4.897918,43.365971],[4.898471,43.365971],[4.898471,43.366249],[4.898749,43.366249],[4.898749,43.366528],[4.899306,43.366528],[4.899306,43.366806],[4.899584,43.366806],[4.899584,43.367085],[4.90014,43.367085],[4.90014,43.367363],[4.900418,43.367363],[4.900418,43.367638],[4.900972,43.367638],[4.900972,43.367916],[4.90125,43.367916],[4.90125,43.368195],[4.901806,43.368195],[4.901806,43.368473],[4.902084,43.368473],[4.902084,43.369026],[4.901806,43.369026],[4.901806,43.369694],[4.901806,43.370415],[4.90264,43.370419],[4.90264,43.370693],[4.903194,43.370693],[4.903194,43.370972],[4.903774,43.370972],[4.904028,43.370972],[4.904028,43.371136],[4.904028,43.371529],[4.904306,43.371529],[4.904306,43.371319],[4.905138,43.37125],[4.905138,43.371857],[4.905138,43.372082],[4.905416,43.372082],[4.905416,43.372639],[4.905972,43.372639],[4.905972,43.372917],[4.906528,43.372917],[4.906528,43.373196],[4.906806,43.373196],[4.906806,43.37347],[4.90736,43.373474],[4.90736,43.3737399842],[4.9073803217,43.3737490001],[4.907916,43.373749],[4.907916,43.374027],[4.908472,43.374027],[4.908472,43.374306],[4.908908,43.374306],[4.909028,43.374306],[4.909028,43.374382],[4.909028,43.374584],[4.909337,43.374584],[4.909584,43.374584],[4.909584,43.374744],[4.909584,43.374863],[4.909766,43.374863],[4.90986,43.374924],[4.90986,43.375137],[4.910138,43.375137],[4.910138,43.375694],[4.910416,43.375694],[4.910416,43.376251],[4.910694,43.376251],[4.910694,43.377083],[4.910972,43.377083],[4.910972,43.37764],[4.911219,43.37764],[4.911529,43.37764],[4.911529,43.377918],[4.912082,43.377918],[4.912082,43.37653],[4.911807,43.376526],[4.911807,43.37619],[4.911807,43.375416],[4.911529,43.375416],[4.911529,43.374584],[4.911251,43.374584],[4.911251,43.374027],[4.910972,43.374027],[4.910972,43.373749],[4.910694,43.373749],[4.910694,43.373474],[4.910138,43.373474],[4.910138,43.373196],[4.909584,43.373196],[4.909582,43.372639],[4.909028,43.372639],[4.909028,43.37236],[4.90875,43.37236],[4.90875,43.372082],[4.908472,43.372082],[4.908472,43.371807],[4.90803,43.371807],[4.907916,43.371807],[4.907916,43.371704],[4.907916,43.371529],[4.907638,43.371529],[4.907638,43.37125],[4.90736,43.37125],[4.90736,43.370972],[4.907125,43.370972],[4.906806,43.370972],[4.906806,43.370693],[4.906528,43.370693],[4.906528,43.370419],[4.905972,43.370419],[4.905972,43.37014],[4.905694,43.37014],[4.905694,43.369862],[4.905416,43.369862],[4.905416,43.369583],[4.904862,43.369583],[4.904862,43.369305],[4.904584,43.369305],[4.904584,43.369026],[4.904306,43.369026],[4.904306,43.368752],[4.90375,43.368752],[4.90375,43.368473],[4.903472,43.368473],[4.903472,43.368195],[4.903194,43.368195],[4.903194,43.367916],[4.90264,43.367916],[4.90264,43.367638],[4.902362,43.367638],[4.902362,43.367363],[4.901806,43.367363],[4.901806,43.367085],[4.901528,43.367085],[4.901528,43.366806],[4.900972,43.366806],[4.900972,43.366528],[4.900694,43.366528],[4.900694,43.366249],[4.90014,43.366249],[4.90014,43.365971],[4.899862,43.365971],[4.899862,43.365696],[4.899306,43.365696],[4.899306,43.365417],[4.899028,43.365417],[4.899028,43.365139],[4.898471,43.365139],[4.898471,43.364861],[4.898193,43.364861],[4.898193,43.364582],[4.897918,43.364582],[4.897918,43.364307],[4.89764,43.364307],[4.89764,43.364029],[4.897083,43.364029],[4.897083,43.36375],[4.896805,43.36375],[4.896805,43.363472],[4.896527,43.363472],[4.896527,43.363194],[4.896249,43.363194],[4.896249,43.362915],[4.895693,43.362915],[4.895693,43.36264],[4.895417,43.36264],[4.895417,43.362362],[4.895139,43.362362],[4.895139,43.362083],[4.894861,43.362083],[4.894861,43.361805],[4.894305,43.361805],[4.894305,43.361526],[4.894027,43.361526],[4.894027,43.361252],[4.893751,43.361252],[4.893751,43.360973],[4.893473,43.360973],[4.893473,43.3607688349],[4.8933573938,43.3606950002],[4.892917,43.360695],[4.892917,43.360416],[4.892639,43.360416],[4.892639,43.3602361738],[4.8925223921,43.3601616972],[4.8924925255,43.3601380001],[4.892361,43.360138],[4.892361,43.3600336435],[4.8921408905,43.3598590003],[4.891805,43.359859],[4.891805,43.3595924893],[4.8917955612,43.359585],[4.891527,43.359585],[4.891527,43.3593719086],[4.8914439356,43.3593060002],[4.890973,43.359306],[4.890973,43.359028],[4.890695,43.359028],[4.890695,43.358749],[4.890139,43.358749],[4.890139,43.358471],[4.889583,43.358471],[4.889583,43.358196],[4.889305,43.358196],[4.889305,43.357918],[4.888751,43.357918],[4.888751,43.357639],[4.888473,43.357639],[4.888473,43.357361],[4.887917,43.357361],[4.887917,43.357151],[4.887639,43.357082],[4.887639,43.356804],[4.887083,43.356804],[4.887083,43.356529],[4.886805,43.356529],[4.886805,43.356251],[4.886529,43.356251],[4.886526,43.355972],[4.885973,43.355972],[4.885973,43.355694],[4.885695,43.355694],[4.885695,43.355415],[4.885417,43.355415],[4.885417,43.355141],[4.88486,43.355141],[4.88486,43.354862],[4.884582,43.354862],[4.884582,43.354584],[4.88375,43.354584],[4.88375,43.354305],[4.882916,43.354305],[4.882916,43.354027],[4.882084,43.354027],[4.882084,43.353748],[4.88125,43.353748],[4.88125,43.353474],[4.880694,43.353474],[4.880694,43.353195],[4.87986,43.353195],[4.87986,43.352917],[4.879306,43.352917],[4.879306,43.352638],[4.87875,43.352638],[4.87875,43.35236],[4.878194,43.35236],[4.878194,43.352085],[4.877638,43.352085],[4.877638,43.351807],[4.877084,43.351807],[4.877084,43.351528],[4.876528,43.351528],[4.876528,43.351807],[4.87625,43.351807],[4.87625,43.352085],[4.875416,43.352085],[4.875416,43.353748],[4.875694,43.353748],[4.875694,43.354584],[4.872918,43.354584],[4.872918,43.354862],[4.872084,43.354862],[4.872084,43.355141],[4.871249,43.355141],[4.871249,43.355415],[4.870418,43.355415],[4.870418,43.355694],[4.869583,43.355694],[4.869583,43.355415],[4.869027,43.355415],[4.869027,43.355141],[4.868471,43.355141],[4.868471,43.354862],[4.867361,43.354862],[4.867361,43.355141],[4.866805,43.355141],[4.866805,43.355415],[4.865971,43.355415],[4.865971,43.355694],[4.865417,43.355694],[4.865417,43.355972],[4.865139,43.355972],[4.865139,43.356251],[4.864583,43.356251],[4.864583,43.356529],[4.862639,43.356529],[4.862639,43.356251],[4.862083,43.356251],[4.862083,43.355972],[4.861805,43.355972],[4.861805,43.355694],[4.861251,43.355694],[4.861251,43.355415],[4.860973,43.355415],[4.860973,43.353195],[4.861805,43.353195],[4.861805,43.352917],[4.862361,43.352917],[4.862361,43.351807],[4.862917,43.351807],[4.862917,43.351528],[4.863195,43.351528],[4.863195,43.35125],[4.863751,43.35125],[4.863751,43.350971],[4.864029,43.350971],[4.864029,43.350693],[4.864305,43.350693],[4.864305,43.350418],[4.866805,43.350418],[4.866805,43.350693],[4.867361,43.350693],[4.867361,43.350971],[4.870139,43.350971],[4.870139,43.352085],[4.870696,43.352085],[4.870696,43.35236],[4.870971,43.35236],[4.870971,43.352638],[4.873194,43.352638],[4.873194,43.35236],[4.87375,43.35236],[4.87375,43.352085],[4.874028,43.352085],[4.874028,43.351807],[4.874584,43.351807],[4.874584,43.351528],[4.87514,43.351528],[4.87514,43.35125],[4.875694,43.35125],[4.875694,43.350971],[4.875972,43.350971],[4.875972,43.350693],[4.875694,43.350693],[4.875694,43.35014],[4.875416,43.35014],[4.875416,43.349861],[4.87375,43.349861],[4.87375,43.349583],[4.87264,43.349583],[4.87264,43.349304],[4.871527,43.349304],[4.871527,43.34903],[4.870139,43.34903],[4.870139,43.347916],[4.869861,43.347916],[4.869861,43.347363],[4.869583,43.347363],[4.869583,43.347084],[4.869027,43.347084],[4.869027,43.346806],[4.868749,43.346806],[4.868749,43.346527],[4.868195,43.346527],[4.868195,43.346249],[4.867639,43.346249],[4.867639,43.345974],[4.867361,43.345974],[4.867361,43.345695],[4.866805,43.345695],[4.866805,43.345417],[4.866527,43.345417],[4.866527,43.34486],[4.866249,43.34486],[4.866249,43.344582],[4.865971,43.344582],[4.865971,43.344028],[4.865695,43.344028],[4.865695,43.34375],[4.865417,43.34375],[4.865417,43.343193],[4.865139,43.343193],[4.865139,43.342918],[4.864861,43.342918],[4.864861,43.34264],[4.864305,43.34264],[4.864305,43.342361],[4.864029,43.342361],[4.864029,43.342083],[4.863751,43.342083],[4.863751,43.341805],[4.863195,43.341805],[4.863195,43.341526],[4.862917,43.341526],[4.862917,43.341251],[4.862361,43.341251],[4.862361,43.340973],[4.861805,43.340973],[4.861805,43.340694],[4.861251,43.340694],[4.861251,43.340416],[4.860973,43.340416],[4.860973,43.340137],[4.860695,43.340137],[4.860695,43.339863],[4.860417,43.339863],[4.860417,43.339584],[4.860139,43.339584],[4.860139,43.339306],[4.859861,43.339306],[4.859861,43.339027],[4.859583,43.339027],[4.859583,43.338749],[4.859304,43.338749],[4.859304,43.33847],[4.859029,43.33847],[4.859029,43.338196],[4.858751,43.338196],[4.858751,43.337917],[4.858473,43.337917],[4.858473,43.337639],[4.858195,43.337639],[4.858195,43.33736],[4.857916,43.33736],[4.857916,43.337082],[4.857638,43.337082],[4.857638,43.336529],[4.85736,43.336529],[4.85736,43.33625],[4.857082,43.33625],[4.857082,43.335972],[4.856804,43.335972],[4.856804,43.335415],[4.856528,43.335415],[4.856528,43.33514],[4.85625,43.33514],[4.85625,43.334862],[4.855416,43.334862],[4.855416,43.334583],[4.854584,43.334583],[4.854584,43.334305],[4.853472,43.334305],[4.853472,43.334026],[4.850416,43.334026],[4.850416,43.334305],[4.849862,43.334305],[4.849862,43.334583],[4.850416,43.334583],[4.850416,43.334862],[4.852638,43.334862],[4.852638,43.33514],[4.852916,43.33514],[4.852916,43.33625],[4.852638,43.33625],[4.852638,43.336529],[4.849306,43.336529],[4.849306,43.33625],[4.84764,43.33625],[4.84764,43.336529],[4.847084,43.336529],[4.847084,43.336807],[4.846528,43.336807],[4.846528,43.337082],[4.845972,43.337082],[4.845972,43.33736],[4.845415,43.33736],[4.845415,43.337639],[4.84514,43.337639],[4.84514,43.337917],[4.844584,43.337917],[4.844584,43.338196],[4.844305,43.338196],[4.844305,43.338749],[4.844027,43.338749],[4.844027,43.339306],[4.843749,43.339306],[4.843749,43.339863],[4.843474,43.339863],[4.843471,43.341526],[4.842917,43.341526],[4.842917,43.341805],[4.842083,43.341805],[4.842083,43.341526],[4.841527,43.341526],[4.841527,43.341251],[4.840973,43.341251],[4.840973,43.340973],[4.840417,43.340973],[4.840417,43.340694],[4.839861,43.340694],[4.839861,43.340416],[4.839305,43.340416],[4.839305,43.340137],[4.838749,43.340137],[4.838749,43.339863],[4.838195,43.339863],[4.838195,43.339584],[4.837639,43.339584],[4.837638856,43.339416504],[4.837638856,43.339305878],[4.837082862,43.339305878],[4.837082862,43.339027405],[4.837066798,43.3390274051],[4.8349763713,43.3429841416],[4.8345117815,43.3443075868],[4.8342738609,43.3454706155],[4.8341248469,43.3469866746],[4.8341739314,43.3481412393],[4.8347534594,43.3504647054],[4.8348838333,43.3520804148],[4.8348808098,43.3542697912],[4.8346690693,43.3572239823],[4.834482702,43.3591942128],[4.8342818832,43.3608659401],[4.8339905844,43.3624465178],[4.8335982617,43.3643410572],[4.8332966767,43.3656383569],[4.8331206022,43.3661128633],[4.8326169825,43.3671472276],[4.8321807417,43.3678187075],[4.8318152686,43.3681947351],[4.8314717582,43.3684858035],[4.831150241,43.368692812],[4.826631405,43.3702269463],[4.8219575854,43.3721333395],[4.819524321,43.3735933484],[4.813780831,43.376921138],[4.8102837895,43.3789710679],[4.8050517948,43.3822376424],[4.7979573366,43.3866480382],[4.7951242924,43.3879089655],[4.7902251774,43.390068769],[4.7822352197,43.3938009375],[4.7773079959,43.3971601263],[4.7722352946,43.4001417297],[4.7682664778,43.4025147625],[4.7656055969,43.404002462],[4.7634176967,43.4050603585],[4.7612703416,43.4058727882],[4.7585809632,43.4068829498],[4.7572289739,43.407392623],[4.7539495089,43.408728094],[4.7524734388,43.4107595854],[4.7507191652,43.4133471729],[4.7489063843,43.4156801173],[4.7471847105,43.4175625297],[4.7414911364,43.4229823412],[4.7402213533,43.4241455827],[4.7397371224,43.424381928],[4.7367015027,43.4260693031],[4.7350359159,43.4272964206],[4.7343545721,43.4278355553],[4.734066907,43.4284916669],[4.7337612449,43.4294522224],[4.7337582926,43.4309523559],[4.73438637,43.4341746477],[4.7362378749,43.4375465224],[4.7378611755,43.4404702982],[4.7384504316,43.4414570124],[4.7403850237,43.4445386464],[4.7417828483,43.4464473365],[4.7427691163,43.4476922176],[4.7431172253,43.4480933668],[4.7457590647,43.4523631009],[4.7469412428,43.4545208853],[4.7486337079,43.4581417552],[4.7517783725,43.4616122649],[4.755997816,43.4657951112],[4.7616535386,43.4715068209],[4.7649377578,43.4747236647],[4.7696077572,43.4771006919],[4.7705460837,43.4773940416],[4.7796569291,43.4795342499],[4.7836763509,43.4792729152],[4.7844710255,43.4790753553],[4.7851972762,43.4787439287],[4.7920122866,43.4744081864],[4.7921357661,43.4744052453],[4.7937361847,43.4757178521],[4.797044263,43.4780109543],[4.8027037162,43.4787053279],[4.8041796024,43.4785583878],[4.8047069093,43.478428122],[4.8056673071,43.4778829768],[4.8060958934,43.4772854893],[4.8062460203,43.4767538345],[4.8063600138,43.475937507],[4.8067298336,43.4752402056],[4.8070368517,43.4746681389],[4.8079705121,43.4731182091],[4.8087392161,43.4723359553],[4.81071845,43.4707172567],[4.8124298633,43.4696213529],[4.8144221957,43.4685414181],[4.8148862354,43.4683284685],[4.8199198528,43.4719535443],[4.8228113543,43.4741763671],[4.8246457516,43.4730269019],[4.831842239,43.4674744957],[4.8326070825,43.4669324135],[4.8381375429,43.462566842],[4.8372474705,43.4622021672],[4.8292669071,43.4603546357],[4.8294614555,43.4562954353],[4.8297551123,43.4559737082],[4.8366371821,43.4533060372],[4.8391279645,43.4523935781],[4.8412732772,43.451804601],[4.8409736517,43.4478464773],[4.8372143524,43.4426809132],[4.8351636278,43.4401860326],[4.8345360922,43.439483936],[4.8325418368,43.4373201231],[4.8313054912,43.436460925],[4.8263569766,43.4326802951],[4.8185965505,43.4255847096],[4.8174931066,43.423915037],[4.8168970322,43.4229846536],[4.8146432094,43.419088133],[4.8189973786,43.4185795486],[4.8242604023,43.4136415453],[4.8255252657,43.4120328365],[4.8271592932,43.411051403],[4.831844225,43.4082753055],[4.835451665,43.4064423513],[4.8376427528,43.405418],[4.837639,43.405418]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000026850","CODE_COM":"111","INSEE_COM":"13111","NOM_COM":"VAUVENARGUES","STATUT":"Commune simple","X_CHF_LIEU":910359.0,"Y_CHF_LIEU":6276367.0,"X_CENTROID":911692.0,"Y_CENTROID":6275733.0,"Z_MOYEN":547.0,"SUPERFICIE":"5435","POPULATION":"1040","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6804563226,43.5639947333],[5.6871966119,43.5633014914],[5.6902319151,43.5631623871],[5.692198177,43.5629308831],[5.692863233,43.5627860358],[5.7066868152,43.556234788],[5.7060394138,43.5562119088],[5.7038789167,43.5555464441],[5.693793127,43.550857528],[5.6929916508,43.5503687746],[5.6924520347,43.5500265629],[5.6912378254,43.5489970808],[5.6905888246,43.5482218503],[5.6898904639,43.5473173037],[5.6856838525,43.5451267554],[5.6806222406,43.5433568905],[5.66892148,43.5396959548],[5.6654500788,43.538678495],[5.6635406889,43.5385993509],[5.6614639536,43.5388609669],[5.6540431506,43.53916337],[5.6483937293,43.5393176148],[5.6451133306,43.5390258391],[5.6287482237,43.5364411146],[5.6233017754,43.5355340818],[5.6220024369,43.5349632433],[5.6199312675,43.533638644],[5.6187476526,43.5322934889],[5.6185373887,43.5316711135],[5.6180552863,43.5318708936],[5.6156750197,43.5317419625],[5.6086743543,43.530516092],[5.6014647709,43.5300518631],[5.5905119443,43.5297090129],[5.5878944721,43.5299407205],[5.5841552656,43.5304304414],[5.5763683863,43.5314879341],[5.5752751154,43.5317470424],[5.5747995672,43.5320409922],[5.5735402021,43.5339504899],[5.5721759402,43.5355365877],[5.5717082782,43.5360076762],[5.5712802108,43.5363130875],[5.5707996765,43.5365522252],[5.5704374564,43.5367255437],[5.5698881715,43.5370599269],[5.5613436342,43.5386059655],[5.5610641386,43.5387205867],[5.5611176212,43.5395313039],[5.5612703901,43.5433724548],[5.5608577407,43.5435820386],[5.5555596264,43.5450779465],[5.5526417759,43.5467552803],[5.5509754299,43.5481636691],[5.5488725741,43.5506697281],[5.5465762064,43.5523052906],[5.54360326,43.5527530923],[5.5388007904,43.5524145399],[5.5366008798,43.5542240678],[5.537947409,43.5568526828],[5.541714841,43.5590510414],[5.5424415991,43.5594454143],[5.5459052849,43.561318577],[5.5501574402,43.5615959489],[5.5516835737,43.5617860364],[5.5539050782,43.5620794723],[5.5561368172,43.5626021764],[5.5564202248,43.5638233922],[5.5564543001,43.5640881525],[5.5560140092,43.5650707511],[5.5550674292,43.5698650739],[5.557247374,43.5720525871],[5.5575620084,43.5726393199],[5.5578212706,43.5732336582],[5.5585607333,43.5749617611],[5.5583139087,43.5766743969],[5.5581476666,43.5773894892],[5.5577773098,43.5788592756],[5.5576638962,43.5796208353],[5.5583021857,43.5793834428],[5.5674701474,43.5822242153],[5.5729125925,43.5842361414],[5.5832419364,43.5880257627],[5.5854315374,43.5887937719],[5.5875025853,43.5897878233],[5.5876504816,43.5899913547],[5.5876547181,43.5903873598],[5.5901599225,43.5905707026],[5.6057356071,43.5924415096],[5.613947937,43.5942976316],[5.6144583042,43.5939180432],[5.6170650992,43.5911634991],[5.6272240471,43.5872424648],[5.630876298,43.5814329294],[5.6379355951,43.5791271526],[5.6436335918,43.5741361981],[5.6474903092,43.5699676751],[5.6588868244,43.5662123609],[5.6627197957,43.5647158119],[5.6685116736,43.5645096635],[5.6693124451,43.5646376166],[5.6693239353,43.5646395199],[5.6804563226,43.5639947333]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000026924","CODE_COM":"047","INSEE_COM":"13047","NOM_COM":"ISTRES","STATUT":"Sous-préfecture","X_CHF_LIEU":860855.0,"Y_CHF_LIEU":6270361.0,"X_CENTROID":859892.0,"Y_CENTROID":6274869.0,"Z_MOYEN":33.0,"SUPERFICIE":"11442","POPULATION":"42937","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9286709458,43.5106525],[4.9291591322,43.5103873255],[4.9288506506,43.5106646042],[4.9245176885,43.5134666936],[4.9168274863,43.5185509245],[4.9142927602,43.5201625418],[4.9126099534,43.521214597],[4.9048404957,43.5262462678],[4.9032168814,43.527228738],[4.8932100596,43.5336712581],[4.8906238098,43.5352607159],[4.8802938052,43.5414394675],[4.8801758104,43.5415765091],[4.8822398876,43.5435152943],[4.8862373873,43.5472069353],[4.8896946278,43.5526646378],[4.8900058592,43.558510979],[4.888666901,43.5620496682],[4.8875303294,43.5645588294],[4.8837396425,43.574413976],[4.882877564,43.5772666423],[4.8826667562,43.5783503042],[4.8847057133,43.5869082256],[4.8849390731,43.5879814908],[4.8854847446,43.5891384366],[4.8875280513,43.5919316939],[4.8921622795,43.5959677478],[4.8937701269,43.5973320605],[4.896192528,43.5992086501],[4.8976008326,43.6002631869],[4.903425063,43.6045858254],[4.9105629553,43.609200099],[4.9124822411,43.6105928859],[4.9128058836,43.6109004007],[4.9151802601,43.6127864512],[4.9183793076,43.6151016177],[4.9196501105,43.6158361075],[4.9208475282,43.6163018687],[4.932356315,43.6186971428],[4.9358654551,43.619377223],[4.9400535179,43.6202745853],[4.9438631876,43.6223954259],[4.9446246051,43.6227814261],[4.9448118317,43.6228221782],[4.9481630348,43.6186948254],[4.9490995193,43.6172334534],[4.9507579055,43.6142704372],[4.9516767516,43.6124403424],[4.9521099552,43.6124298601],[4.9730596761,43.6152754428],[4.97679871,43.6158231222],[4.9783795888,43.6163298841],[4.9798091029,43.6138862972],[4.980142558,43.6124932362],[4.980420696,43.6079915011],[4.9804133372,43.6051591749],[4.9802195365,43.6036353234],[4.9800886351,43.6030364767],[4.9793598443,43.6028418465],[4.97445145,43.6020131188],[4.9690089346,43.6014953696],[4.9672175384,43.6010472006],[4.9671498185,43.6009143204],[4.9782812699,43.591964652],[4.9833964596,43.5878724824],[4.9931037125,43.5797312194],[4.9929865872,43.5794957591],[4.9962672593,43.5727284282],[5.0011021921,43.5687422808],[5.0063268363,43.5621494247],[5.0044442668,43.5595246133],[5.0030397681,43.5571537645],[5.0015204739,43.554362009],[5.0017446051,43.5524138245],[5.0025270233,43.5502591384],[5.0048539089,43.550593293],[5.0063251817,43.5509819182],[5.0074289908,43.5514070213],[5.0084108566,43.5522015802],[5.008754297,43.5526803385],[5.0089944537,43.5533194122],[5.0094964409,43.5557113917],[5.0096959267,43.5562486153],[5.0098719931,43.5566116669],[5.0115664086,43.5563345733],[5.0131734086,43.5560707745],[5.0144469318,43.5555440322],[5.014443776,43.5554540879],[5.0140006841,43.5552409027],[5.0132835978,43.5544486799],[5.0128477895,43.5530662199],[5.0124780653,43.5513090241],[5.0122049007,43.5455269359],[5.0137543594,43.5348806739],[5.0154635062,43.5297188602],[5.0126582035,43.5239343671],[5.0081193319,43.5197353462],[5.0037681228,43.5145507941],[5.0024501091,43.5127841349],[5.0008938759,43.5098914628],[4.9988753355,43.5034082292],[4.9985487475,43.4981061109],[5.000249843,43.4939132097],[5.0029037494,43.4867408517],[5.0015713684,43.4790760389],[5.0010671582,43.4788639527],[5.0008597999,43.4783745933],[5.0006584068,43.4767070568],[5.0005915933,43.4750001397],[5.0008578981,43.4740943518],[5.00132404,43.4734980648],[5.0033189925,43.4711338873],[5.0046372428,43.4701339473],[5.0060048639,43.4696649604],[5.0059218407,43.4687728257],[5.0058559197,43.4683708588],[5.0051418379,43.4682328759],[5.0035637465,43.4680865634],[5.0028885548,43.468036044],[4.9992589188,43.4689094242],[4.9985988679,43.4693301823],[4.9975870738,43.4701192066],[4.9966432447,43.4710869634],[4.9961381632,43.471737044],[4.9929738908,43.4748866637],[4.9896934997,43.4776549351],[4.9870494137,43.478174116],[4.9840357966,43.4774769353],[4.9770528402,43.4747336123],[4.9759012893,43.4741282318],[4.9754587507,43.4739086059],[4.9676061319,43.4737841326],[4.9655125405,43.4737780146],[4.9610670414,43.4770974909],[4.9584318726,43.4810770696],[4.9528257133,43.4883158234],[4.9434175686,43.4976987353],[4.941610883,43.499477042],[4.939825446,43.5012288396],[4.935357058,43.5051128559],[4.9331569757,43.5070096383],[4.9307042726,43.5090467692],[4.9286709458,43.5106525]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000026960","CODE_COM":"083","INSEE_COM":"13083","NOM_COM":"ROGNONAS","STATUT":"Commune simple","X_CHF_LIEU":844987.0,"Y_CHF_LIEU":6312977.0,"X_CENTROID":844749.0,"Y_CENTROID":6312993.0,"Z_MOYEN":20.0,"SUPERFICIE":"840","POPULATION":"4030","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.810973644,43.914276123],[4.8109762104,43.9142759196],[4.811234116,43.912205856],[4.8151271453,43.9029044739],[4.8162122699,43.9006188839],[4.8174579845,43.8979840441],[4.8183833425,43.8960035543],[4.8170002595,43.8904086039],[4.8168813754,43.8900757189],[4.8148129385,43.8886356463],[4.8120074908,43.8868729115],[4.8081200434,43.884697758],[4.8030930005,43.8816195379],[4.8018487871,43.8806039977],[4.801199389,43.8799801022],[4.801059322,43.879800581],[4.8004893411,43.8793662055],[4.7994256817,43.878903961],[4.7908340421,43.8849008063],[4.783219894,43.8907279775],[4.7815081141,43.8911573976],[4.7817217291,43.892059475],[4.7820826026,43.8927341081],[4.78256216,43.8932627764],[4.7848094353,43.8959850659],[4.7859043309,43.8978773148],[4.7885725387,43.902659444],[4.7896041953,43.9045518032],[4.7913695627,43.9081199474],[4.7928625085,43.9118482776],[4.7926164135,43.9123780205],[4.7915304687,43.9127307062],[4.7886749527,43.9123247241],[4.7837788597,43.911886305],[4.7827924336,43.9119582234],[4.7813590065,43.9120707316],[4.7735724634,43.914621629],[4.7731140322,43.9167399794],[4.7735950563,43.9196361331],[4.7752918635,43.9194002206],[4.810973644,43.914276123]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000027086","CODE_COM":"007","INSEE_COM":"13007","NOM_COM":"AURIOL","STATUT":"Commune simple","X_CHF_LIEU":913342.0,"Y_CHF_LIEU":6255799.0,"X_CENTROID":915041.0,"Y_CENTROID":6255400.0,"Z_MOYEN":375.0,"SUPERFICIE":"4464","POPULATION":"11325","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.682787896,43.399166108],[5.6827907744,43.3991619467],[5.6827924547,43.3991594444],[5.682960486,43.3986592953],[5.6846526784,43.3959537877],[5.6857028204,43.3942795587],[5.6866377329,43.3930204493],[5.6878766968,43.3917708847],[5.6900222838,43.3851743963],[5.6911849766,43.3779686339],[5.6932024878,43.3682572368],[5.6934040103,43.3675537142],[5.6945703861,43.3643985],[5.6960930738,43.3631881892],[5.703628063,43.354007722],[5.7036095516,43.3539921747],[5.7025859114,43.3533006402],[5.7015987962,43.3523033183],[5.688144685,43.340999603],[5.6891449366,43.3353561612],[5.6890671734,43.3352148332],[5.6892922123,43.334525136],[5.689950467,43.330810548],[5.682960987,43.321849823],[5.6744878471,43.3203507472],[5.6691142869,43.3199673307],[5.6689941174,43.3199279931],[5.6691657856,43.3194087847],[5.669163703,43.319408416],[5.6691659294,43.3194083498],[5.6691660469,43.3194079944],[5.6670605237,43.3185301636],[5.6621037965,43.3184273147],[5.657924499,43.318875784],[5.6473715933,43.3232121182],[5.6468365051,43.3231577129],[5.6474890477,43.3238366036],[5.6487519029,43.3253475254],[5.6499657398,43.3270243541],[5.6499115961,43.3271606948],[5.6496988437,43.3276015534],[5.6448921121,43.334542846],[5.6358489246,43.338483742],[5.6327918371,43.3406950353],[5.6303334563,43.3431671098],[5.6288908787,43.3449582716],[5.6198441973,43.3544946848],[5.6128478077,43.3627341989],[5.6098195619,43.366064763],[5.6095881876,43.3662134604],[5.6093545102,43.3664747258],[5.6081222927,43.3686061791],[5.6072832354,43.3709207691],[5.6083980265,43.3763278522],[5.6083094176,43.3764965084],[5.6090307634,43.3767572527],[5.6100604218,43.3775038173],[5.6173040779,43.383234519],[5.6189621688,43.3865590532],[5.6185665815,43.3870060837],[5.6185003797,43.3879384107],[5.6187719687,43.3895133541],[5.6193709102,43.3904970973],[5.6201815637,43.3910607563],[5.6213915272,43.3916921505],[5.6224734087,43.3920854017],[5.6248090635,43.3927425872],[5.6251759085,43.3927480926],[5.62668417,43.3923946566],[5.6275165499,43.3921341195],[5.628695304,43.3916743372],[5.6291255224,43.3914730608],[5.6335022839,43.3891784458],[5.6368540478,43.3876863375],[5.6385129674,43.3870428216],[5.6447410189,43.3867791921],[5.6488681504,43.3867511704],[5.651533734,43.3868785261],[5.6533172621,43.3876035305],[5.6595487311,43.3936912448],[5.6652306093,43.3984653769],[5.6697219006,43.3994564833],[5.6704121632,43.4000191536],[5.6712893525,43.4002468525],[5.6775787627,43.4016973402],[5.6792956821,43.4019024022],[5.6803406111,43.4017541141],[5.6811050853,43.4015218466],[5.6813736928,43.4012721519],[5.6827879612,43.3991661361],[5.682787896,43.399166108]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000027247","CODE_COM":"004","INSEE_COM":"13004","NOM_COM":"ARLES","STATUT":"Sous-préfecture","X_CHF_LIEU":831364.0,"Y_CHF_LIEU":6287792.0,"X_CENTROID":835506.0,"Y_CENTROID":6272734.0,"Z_MOYEN":4.0,"SUPERFICIE":"75780","POPULATION":"52566","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.836248875,43.339027405],[4.836248875,43.338748932],[4.83569479,43.338748932],[4.83569479,43.338470459],[4.835138798,43.338470459],[4.835138798,43.338195801],[4.834582805,43.338195801],[4.834582805,43.337917328],[4.834029197,43.337917328],[4.834029197,43.337638855],[4.833473205,43.337638855],[4.833473205,43.337360382],[4.832917214,43.337360382],[4.832917214,43.337081909],[4.832361221,43.337081909],[4.832361221,43.336807251],[4.831807137,43.336807251],[4.831807137,43.336528778],[4.830694198,43.336528778],[4.830694198,43.336250305],[4.830973148,43.336250305],[4.830973148,43.335693359],[4.831251144,43.335693359],[4.831251144,43.335140228],[4.83152914,43.335140228],[4.83152914,43.334583282],[4.831807137,43.334583282],[4.831807137,43.334304809],[4.832081795,43.334304809],[4.832081795,43.334026336],[4.832361221,43.334026336],[4.832361221,43.333751678],[4.832639217,43.333751678],[4.832639217,43.333473205],[4.832917214,43.333473205],[4.832917214,43.333194732],[4.83319521,43.333194732],[4.83319521,43.332916259],[4.833473205,43.332916259],[4.833473205,43.332637788],[4.835972785,43.332637788],[4.835972785,43.332359315],[4.836804867,43.332359315],[4.836804867,43.332084655],[4.837916851,43.332084655],[4.837916851,43.331806184],[4.838748933,43.331806184],[4.838748933,43.331527711],[4.840694904,43.331527711],[4.840694904,43.331249238],[4.8409729,43.331249238],[4.8409729,43.330970765],[4.84124899,43.330970765],[4.84124899,43.3308856694],[4.8412136914,43.3308698366],[4.8373103513,43.330227153],[4.83319521,43.329883077],[4.83319521,43.329971313],[4.83319521,43.330139161],[4.832917214,43.330139161],[4.832917214,43.330417634],[4.832639217,43.330417634],[4.832639217,43.330696107],[4.832361221,43.330696107],[4.832361221,43.330970765],[4.831807137,43.330970765],[4.831807137,43.331249238],[4.83152914,43.331249238],[4.83152914,43.331527711],[4.831251144,43.331527711],[4.831251144,43.331806184],[4.830694198,43.331806184],[4.830694198,43.332084655],[4.830416202,43.332084655],[4.830416202,43.332359315],[4.829860211,43.332359315],[4.829860211,43.332637788],[4.829582213,43.332637788],[4.829582213,43.332916259],[4.82902813,43.332916259],[4.82902813,43.333194732],[4.828750134,43.333194732],[4.828750134,43.333473205],[4.828194141,43.333473205],[4.828194141,43.333751678],[4.827916145,43.333751678],[4.827916145,43.334026336],[4.827360154,43.334026336],[4.827360154,43.334304809],[4.827084064,43.334304809],[4.827082156,43.334583282],[4.826528072,43.334583282],[4.826528072,43.334861755],[4.825972081,43.334861755],[4.825972081,43.335140228],[4.825416088,43.335140228],[4.825416088,43.335414886],[4.824584007,43.335414886],[4.824584007,43.335693359],[4.824028015,43.335693359],[4.824028015,43.335971832],[4.823472022,43.335971832],[4.823472022,43.336250305],[4.8224614437,43.3362503081],[4.821805954,43.3365162543],[4.821805954,43.336528778],[4.8217750853,43.3365287782],[4.8213124549,43.3367164732],[4.815970898,43.3386932762],[4.815970898,43.338748932],[4.8158204925,43.3387489325],[4.815138816,43.3390011773],[4.815138816,43.339027405],[4.8150679356,43.3390274053],[4.81460058,43.3392003395],[4.812725759,43.3398760547],[4.8106962757,43.3405354297],[4.8019643202,43.3431467819],[4.797820852,43.3442235353],[4.794027805,43.3450919401],[4.794027805,43.345138549],[4.7938242019,43.3451385499],[4.792918205,43.3453459492],[4.792918205,43.345417022],[4.7925775746,43.3454170237],[4.791528225,43.3456257688],[4.791528225,43.345695495],[4.7911776941,43.3456954967],[4.790140152,43.3459018777],[4.790140152,43.345973968],[4.7897777091,43.3459739697],[4.788749217,43.3461785354],[4.788749217,43.346248626],[4.7883968018,43.3462486277],[4.787361145,43.3464546032],[4.787361145,43.346527099],[4.7869966096,43.3465271007],[4.785971165,43.3467310301],[4.785971165,43.346805572],[4.7855654089,43.3468055738],[4.784583092,43.3469763086],[4.784583092,43.347084045],[4.7839631924,43.3470840472],[4.7833568018,43.3471894341],[4.783195019,43.3472108624],[4.783195019,43.347362518],[4.7820499592,43.3473625193],[4.781805039,43.347394956],[4.781805039,43.347637176],[4.7799759375,43.3476371793],[4.779582978,43.3476892137],[4.779582978,43.347915649],[4.7778727913,43.3479156531],[4.777359963,43.3479835491],[4.777359963,43.348194122],[4.7757693329,43.3481941246],[4.775415897,43.3482409108],[4.775415897,43.348472595],[4.774130345,43.348472595],[4.7732507304,43.3484725952],[4.773193836,43.3484784006],[4.773193836,43.348751068],[4.772966862,43.348751068],[4.770971774,43.348751068],[4.770971774,43.349029541],[4.7677910572,43.3490295473],[4.767362118,43.3490732921],[4.767362118,43.349304199],[4.7651252503,43.3493042062],[4.763749123,43.3494614648],[4.763749123,43.349582672],[4.7626882524,43.3495826845],[4.7595949251,43.3499360794],[4.757916927,43.350026619],[4.757916927,43.350139618],[4.7558219276,43.3501396219],[4.75541687,43.3501614657],[4.75541687,43.350418091],[4.753194809,43.350418091],[4.753194809,43.350692749],[4.749307156,43.350692749],[4.749307156,43.3504276987],[4.7493041991,43.3504278014],[4.7427384852,43.3505976534],[4.7378727842,43.3506750243],[4.7308753127,43.3506756258],[4.7194371514,43.3504099122],[4.7186664437,43.3503663701],[4.7177423514,43.3503063619],[4.715935247,43.3498680363],[4.7125952512,43.349004952],[4.7057078087,43.3477991418],[4.70513916,43.3478421985],[4.70513916,43.347915649],[4.7045246725,43.3479156496],[4.704305173,43.347943908],[4.704305173,43.348194122],[4.703473091,43.348194122],[4.703473091,43.348472595],[4.702083111,43.348472595],[4.702083111,43.3482299496],[4.6991390214,43.3486088619],[4.6922115971,43.3482126514],[4.6868707178,43.3474664425],[4.6846949519,43.3469739621],[4.6838240088,43.3467463745],[4.6744382481,43.3464691498],[4.670137882,43.3464493935],[4.670137882,43.346527099],[4.669307233,43.346527099],[4.669303895,43.346805572],[4.668749809,43.346805572],[4.668749809,43.347084045],[4.667637825,43.347084045],[4.667637825,43.346805572],[4.667081833,43.346805572],[4.667081833,43.346633912],[4.667081833,43.346527099],[4.666250229,43.346527099],[4.666250229,43.3464313862],[4.6617842756,43.3464105278],[4.6546352694,43.3475512758],[4.6500520991,43.348616452],[4.6461849123,43.3495013785],[4.6380886588,43.3510018556],[4.6356108416,43.3512813886],[4.6329161286,43.351505452],[4.632915973,43.351528168],[4.632642861,43.3515281701],[4.6321726567,43.351567259],[4.630971909,43.3516600678],[4.630971909,43.351806641],[4.6292427644,43.3518066427],[4.62902689,43.3518305965],[4.62902689,43.352085114],[4.627082824,43.352085114],[4.627082824,43.352359772],[4.625139236,43.352359772],[4.625139236,43.352638245],[4.623473168,43.352638245],[4.623473168,43.352916718],[4.621527194,43.352916718],[4.621527194,43.353195191],[4.619861126,43.353195191],[4.619861126,43.353473664],[4.618195058,43.353473664],[4.618195058,43.353748322],[4.615972996,43.353748322],[4.615972996,43.354026795],[4.614027977,43.354026795],[4.614027977,43.354305268],[4.611805916,43.354305268],[4.611805916,43.354583741],[4.60986185,43.354583741],[4.609859944,43.354862212],[4.607915878,43.354862212],[4.607915878,43.355140685],[4.60624981,43.355140685],[4.60624981,43.355415345],[4.604306222,43.355415345],[4.604306222,43.355693816],[4.602918147,43.355693816],[4.602918147,43.355972289],[4.601527214,43.355972289],[4.601527214,43.356250762],[4.600139141,43.356250762],[4.600139141,43.356529235],[4.598749161,43.356529235],[4.598749161,43.356803893],[4.597639084,43.356803893],[4.597639084,43.357082366],[4.5965271,43.357082366],[4.5965271,43.357360839],[4.595695018,43.357360839],[4.595695018,43.357639312],[4.594583034,43.357639312],[4.594583034,43.357917785],[4.593472957,43.357917785],[4.593472957,43.358196259],[4.592360972,43.358196259],[4.592360972,43.358470916],[4.591528893,43.358470916],[4.591528893,43.358749389],[4.590416908,43.358749389],[4.590416908,43.359027862],[4.589303971,43.359027862],[4.589303971,43.359306336],[4.58847189,43.359306336],[4.58847189,43.359584809],[4.587637901,43.359584809],[4.587637901,43.359859466],[4.58680582,43.359859466],[4.58680582,43.360137939],[4.585971833,43.360137939],[4.585971833,43.360416413],[4.585137844,43.360424043],[4.585137844,43.360694886],[4.584561824,43.360694886],[4.5842670083,43.3606948863],[4.5841791922,43.360730538],[4.5840058631,43.3608042183],[4.583971977,43.360973359],[4.583607963,43.3609733597],[4.58319378,43.36114942],[4.58319378,43.361251832],[4.5829528509,43.3612518327],[4.582362176,43.3615029092],[4.582362176,43.361526489],[4.5823067018,43.3615264892],[4.5819496885,43.3616782409],[4.5789366985,43.3630197429],[4.576249122,43.364266394],[4.576249122,43.364307405],[4.5761607042,43.3643074052],[4.575695991,43.3645229528],[4.575695991,43.364582063],[4.5755685496,43.3645820633],[4.5753417459,43.3646872597],[4.57514,43.3647822582],[4.57514,43.364860536],[4.5749737623,43.3648605361],[4.57486105,43.3649136097],[4.57486105,43.365139009],[4.5743823644,43.3651390092],[4.574305058,43.3651754102],[4.574305058,43.365417482],[4.5737909543,43.3654174821],[4.573749065,43.365437206],[4.573749065,43.365695953],[4.573471069,43.365695953],[4.573471069,43.365970613],[4.573389531,43.365970613],[4.572916984,43.365970613],[4.572916984,43.366249086],[4.572799683,43.366249086],[4.572360992,43.366249086],[4.572360992,43.366455078],[4.572360992,43.366527557],[4.572210313,43.366527557],[4.571805001,43.366527557],[4.571805001,43.366718293],[4.571805001,43.36680603],[4.571620465,43.36680603],[4.571527004,43.366851807],[4.571527004,43.367084503],[4.57097292,43.367111206],[4.57097292,43.367362976],[4.570416927,43.367374421],[4.570416927,43.367637634],[4.569860935,43.367637634],[4.569860935,43.367916107],[4.569304944,43.367916107],[4.569304944,43.36819458],[4.569026946,43.36819458],[4.569026946,43.368473053],[4.568472863,43.368473053],[4.568472863,43.368751526],[4.567916869,43.368751526],[4.567916869,43.369026184],[4.5673728713,43.369026184],[4.567360878,43.3690343342],[4.567360878,43.369304657],[4.567008019,43.369304657],[4.5669630836,43.369304657],[4.5667985697,43.369416452],[4.566789151,43.36958313],[4.5665532893,43.3695831303],[4.566250801,43.3697886818],[4.566250801,43.369861603],[4.5661434896,43.3698616031],[4.565972805,43.3699775878],[4.565972805,43.370140076],[4.5657336831,43.3701400764],[4.565416812,43.3703553949],[4.565416812,43.370418549],[4.565323871,43.3704185492],[4.562917232,43.3720538083],[4.562917232,43.372081757],[4.5628760975,43.372081757],[4.5627978196,43.3721349427],[4.562637807,43.3722788862],[4.562637807,43.37236023],[4.5625473817,43.3723602302],[4.5607544794,43.3739730114],[4.5591362034,43.3757518321],[4.5581918903,43.3768667787],[4.5562250393,43.3799948693],[4.5556106084,43.3828227646],[4.5561660984,43.3853918039],[4.5572509483,43.3879165662],[4.557360172,43.387916566],[4.557360172,43.3881707491],[4.5573706096,43.388195039],[4.557638168,43.388195039],[4.557638168,43.38847351],[4.558194161,43.38847351],[4.558194161,43.38874817],[4.558750152,43.38874817],[4.558750152,43.389026643],[4.559306145,43.389026643],[4.559306145,43.389305116],[4.559582234,43.389305116],[4.559582234,43.389583587],[4.560138225,43.389583587],[4.560138225,43.38986206],[4.560694218,43.38986206],[4.560694218,43.390140533],[4.560972214,43.390140533],[4.560972214,43.390415191],[4.56152916,43.390415191],[4.56152916,43.390693664],[4.561807155,43.390693664],[4.561807155,43.390972137],[4.562081813,43.390972137],[4.562081813,43.39125061],[4.562637807,43.39125061],[4.562637807,43.391529083],[4.562917232,43.391529083],[4.562917232,43.391803741],[4.563751221,43.391803741],[4.563751221,43.392082214],[4.564860821,43.392082214],[4.564860821,43.392360687],[4.56569481,43.392360687],[4.56569481,43.39263916],[4.566804887,43.39263916],[4.566804887,43.392917633],[4.567638874,43.392917633],[4.567638874,43.393196106],[4.5677833403,43.3931961066],[4.5680320865,43.3925962735],[4.5735916278,43.3935773845],[4.5800515532,43.3965263381],[4.580416202,43.396526337],[4.580416202,43.3966927798],[4.5806616475,43.3968048107],[4.581250191,43.39680481],[4.581250191,43.3970734409],[4.5812717546,43.3970832831],[4.582084178,43.397083283],[4.582084178,43.397361756],[4.582637787,43.397361756],[4.582637787,43.397640229],[4.583471775,43.397640229],[4.583471775,43.397914887],[4.584305762,43.397914887],[4.584305762,43.39819336],[4.584862233,43.39819336],[4.584862233,43.398471833],[4.585693837,43.398471833],[4.585693837,43.398750306],[4.585971833,43.398750306],[4.585971833,43.399028779],[4.586527824,43.399028779],[4.586527824,43.399307252],[4.58680582,43.399307252],[4.58680582,43.39958191],[4.587359905,43.39958191],[4.587359905,43.399860383],[4.587637901,43.399860383],[4.587637901,43.400138856],[4.588193894,43.400138856],[4.588193894,43.400417327],[4.58847189,43.400417327],[4.58847189,43.4006958],[4.589028836,43.4006958],[4.589028836,43.40097046],[4.589303971,43.40097046],[4.589303971,43.401248931],[4.589859962,43.401248931],[4.589859962,43.401527404],[4.590138913,43.401527404],[4.590138913,43.401805877],[4.590694904,43.401805877],[4.590694904,43.40208435],[4.5909729,43.40208435],[4.5909729,43.402362823],[4.591528893,43.402362823],[4.591528893,43.402637481],[4.591804981,43.402637481],[4.591804981,43.402915954],[4.592082977,43.402915954],[4.592082977,43.403194427],[4.592360972,43.403194427],[4.592360972,43.403339386],[4.592360972,43.4034729],[4.59263897,43.403484345],[4.59263897,43.403751373],[4.592916966,43.403751373],[4.592916966,43.404026031],[4.593194961,43.404026031],[4.593194961,43.404304504],[4.593472957,43.404304504],[4.593472957,43.4058514459],[4.5942943035,43.4062390791],[4.5950211396,43.4064137391],[4.5977882532,43.4061938814],[4.5983391976,43.4064341021],[4.6001114095,43.407363543],[4.6062203939,43.4106240591],[4.609877735,43.4126600567],[4.6122076938,43.4138779618],[4.6159281939,43.4154665086],[4.6190313735,43.4169120901],[4.619778695,43.4188157671],[4.6188671663,43.4239764691],[4.6158562145,43.4307531398],[4.6157334352,43.4312174908],[4.616001157,43.4367052564],[4.6157840972,43.4386935589],[4.6155419368,43.4397445944],[4.6160954131,43.4462152731],[4.6205957882,43.4476571183],[4.6212230403,43.4479140932],[4.6212935503,43.4481371025],[4.6198400978,43.4553388091],[4.6198413955,43.4586304845],[4.6199175939,43.4589236008],[4.6202214214,43.459184519],[4.6204201034,43.4655345995],[4.6203243332,43.4680988564],[4.6206205534,43.4693155515],[4.6212072713,43.470799664],[4.6264351602,43.4749552604],[4.6335541147,43.4788355855],[4.6371040341,43.480948054],[4.6442917468,43.485322512],[4.6424111668,43.4903129924],[4.6421270968,43.4917481186],[4.6416426313,43.4944767228],[4.642225212,43.4981241667],[4.641392676,43.5016094642],[4.6374946636,43.5043815715],[4.6358296066,43.5057799387],[4.6352822445,43.5067474831],[4.6337837736,43.5105739356],[4.6334410263,43.5119568447],[4.6332649196,43.5139392794],[4.6333167936,43.5150246805],[4.6338588836,43.5196078295],[4.6339282515,43.5197858661],[4.6370645137,43.5240446479],[4.641699239,43.530517884],[4.6426791071,43.5333386896],[4.6431740572,43.5349015518],[4.6431025374,43.5362066162],[4.64232976,43.53725682],[4.6416070394,43.5377222138],[4.6374282794,43.5401485304],[4.6354944163,43.5412233966],[4.6329098715,43.5433465278],[4.6299507487,43.5469249975],[4.6296088706,43.5476518686],[4.6267336098,43.5533321205],[4.6250469284,43.5562992416],[4.6245458704,43.5576584318],[4.6238283978,43.5599423849],[4.6237986611,43.5606411748],[4.6239556048,43.5617709391],[4.624678642,43.5659367049],[4.6248477343,43.5670572915],[4.62483176,43.5700786114],[4.6237864518,43.5732926223],[4.6235491328,43.5735670519],[4.6231668941,43.5735754659],[4.6164598205,43.57231841],[4.6095798381,43.5707989284],[4.6064229842,43.5702004257],[4.602868191,43.5700198755],[4.5998609462,43.5696781552],[4.5964949197,43.5689843564],[4.5949903642,43.5684665107],[4.5901622536,43.5667698696],[4.587464184,43.5660525131],[4.5797172003,43.5655751521],[4.5774190496,43.5656229629],[4.5684422942,43.5672378752],[4.5589538908,43.5703109583],[4.5582882364,43.5706840809],[4.5498814866,43.5726456327],[4.5492035612,43.572704802],[4.5380635675,43.5711695143],[4.5298478316,43.5716869347],[4.5240814546,43.5748160319],[4.5126863749,43.5802155634],[4.5118299429,43.5804578673],[4.5043433997,43.580421438],[4.5038425978,43.5803950768],[4.503877753,43.5797997464],[4.5043945702,43.5751949325],[4.5043563453,43.5741614639],[4.5039371649,43.5729019958],[4.5008228875,43.5706719125],[4.4967761755,43.5647110006],[4.495206287,43.5624045832],[4.4942666781,43.5612503472],[4.4933305932,43.560230141],[4.4899199995,43.5566477102],[4.4859961541,43.5556873078],[4.4772793043,43.5555084102],[4.467386682,43.5601087449],[4.4642623563,43.5615736598],[4.4623087504,43.5626087713],[4.4607729206,43.5674204916],[4.460013431,43.568604173],[4.4581131378,43.5710684322],[4.456697997,43.5729034223],[4.4526971856,43.5783618218],[4.4491646084,43.5826358626],[4.4488888726,43.5834332573],[4.4502525333,43.5835581424],[4.452269018,43.5842376246],[4.4554851372,43.5858926995],[4.4581419737,43.5875038981],[4.4606813332,43.5892606012],[4.4617753203,43.5904085704],[4.4618769683,43.5905584596],[4.4738117133,43.6035706951],[4.4741415574,43.6038581232],[4.4747364906,43.6048894612],[4.4752917547,43.6064963874],[4.4753260075,43.6073949476],[4.4752352404,43.6082961057],[4.4747160008,43.6092957728],[4.4742492134,43.6100238482],[4.4732320195,43.611311941],[4.4725176148,43.6120451662],[4.4710757465,43.6131977047],[4.4696132001,43.6141255217],[4.4678487913,43.6149242074],[4.4668068635,43.615205555],[4.4643976033,43.6152983434],[4.4638988525,43.6152177702],[4.462215891,43.6148912567],[4.4607599802,43.614335784],[4.4590517282,43.6132826839],[4.448009968,43.61026764],[4.438525201,43.611354829],[4.428526878,43.619182588],[4.42692089,43.62583542],[4.4275613382,43.62683792],[4.42781577,43.6271421909],[4.428455879,43.6277232332],[4.4318250938,43.6301312103],[4.4323388569,43.6306608002],[4.4336410607,43.6323975995],[4.4343018585,43.6335533951],[4.4357290286,43.637356576],[4.4363593973,43.6393218092],[4.4373268831,43.6421193021],[4.451532841,43.664333344],[4.4667798791,43.6692786662],[4.4684327692,43.6693828063],[4.4704891362,43.6697024102],[4.4734904243,43.6704618604],[4.4754954502,43.6710961538],[4.4767641975,43.6718808043],[4.4774684111,43.6725048169],[4.4779293615,43.6732149277],[4.4784009255,43.6742398811],[4.4785019407,43.6752716705],[4.4784371776,43.6768465947],[4.4780969777,43.6780310767],[4.4770175041,43.6802646467],[4.4764700179,43.6867405935],[4.4764703052,43.6867412548],[4.4863483435,43.6987645739],[4.4863488233,43.6987648085],[4.486351537,43.69876846],[4.486420631,43.698852539],[4.500286103,43.702056884],[4.506813049,43.7021904],[4.5111901575,43.7022794141],[4.5159563283,43.7022920401],[4.5243901803,43.7021310306],[4.5260092193,43.7023225384],[4.5270119872,43.7026171707],[4.5280271019,43.7032347187],[4.5291071164,43.7040653885],[4.537796975,43.70703888],[4.5497125062,43.7028590365],[4.5507127047,43.7023423329],[4.5527787964,43.7013111733],[4.55559986,43.7002187846],[4.5581119984,43.6994934454],[4.5605842965,43.6989927189],[4.563356799,43.6985848234],[4.5677468758,43.6983146646],[4.5682427531,43.6983006156],[4.578783511,43.696968078],[4.5848468507,43.6937640944],[4.5851256984,43.6933783841],[4.5868015269,43.6915458545],[4.5891453423,43.6896981454],[4.5912127084,43.6883962295],[4.5930346527,43.6874596678],[4.5946273251,43.687021436],[4.5973466832,43.6865153447],[4.6019080944,43.685934378],[4.6040747084,43.6858889553],[4.605829921,43.686077263],[4.6080813606,43.6866236103],[4.608984349,43.6868637991],[4.622166634,43.687068939],[4.6225871781,43.6871650731],[4.6238690667,43.6864782137],[4.6246661533,43.6858525091],[4.6274533995,43.6869610604],[4.6279719345,43.6884491167],[4.6276618121,43.6905426785],[4.6264207095,43.6934421718],[4.6254218161,43.6957017279],[4.624127017,43.6978090916],[4.6232570286,43.6991513932],[4.6214375085,43.7012215522],[4.6196564892,43.7030346042],[4.6188967119,43.7038131368],[4.614312648,43.710720062],[4.612276078,43.724754333],[4.6176940066,43.7360307109],[4.6197452942,43.738902027],[4.622717119,43.7432373696],[4.6238552137,43.7453265005],[4.6256674841,43.749074243],[4.6272505425,43.7544904798],[4.6276851912,43.7563695863],[4.6281035415,43.7576831752],[4.6281160064,43.7577090928],[4.6298383032,43.7574570522],[4.6313425098,43.7575155392],[4.6326532381,43.7577128133],[4.6331611018,43.7580166176],[4.6341325498,43.7590299071],[4.6349623935,43.7596060889],[4.6357830845,43.7599483885],[4.6382147063,43.7602565668],[4.6394583483,43.7603197615],[4.6414355802,43.7537043024],[4.6420323312,43.7512633728],[4.6420497846,43.7501839511],[4.6416949493,43.7490678403],[4.6405975332,43.7464742412],[4.6428256953,43.7448169695],[4.6462640344,43.7438460999],[4.653413892,43.7421761986],[4.6666285702,43.7372126003],[4.6746307596,43.7336228421],[4.6788453123,43.7299982551],[4.6793633455,43.7292945306],[4.6797690259,43.7286114383],[4.67951576,43.728482139],[4.6777557211,43.7278864453],[4.6755901408,43.7271727603],[4.6745623541,43.7267862547],[4.6733073907,43.7262700255],[4.6722528072,43.7257723055],[4.6682972829,43.7237223985],[4.667343269,43.7232230919],[4.6662160383,43.7225707222],[4.6654947237,43.7221344413],[4.6594144483,43.7182185385],[4.6572183493,43.7164294279],[4.6518876604,43.712477421],[4.6523332428,43.7118370374],[4.6540491552,43.7107597412],[4.6597001946,43.7073553098],[4.6612169595,43.707847885],[4.6662628953,43.708572675],[4.6663972982,43.708501315],[4.6678493682,43.7074935397],[4.6691256125,43.7060312268],[4.6690351498,43.7034378324],[4.6689999164,43.702654449],[4.668480616,43.7012664708],[4.6675275224,43.6999337413],[4.6673116655,43.6995500381],[4.667003238,43.6978609176],[4.6693983553,43.6957235442],[4.6702967828,43.6956503553],[4.6738943954,43.6954069665],[4.6766904041,43.6953243175],[4.6816802657,43.6950988094],[4.6844063095,43.6949576413],[4.6857937202,43.6954419702],[4.6888249127,43.6968152106],[4.6897323268,43.6973411408],[4.690963343,43.6997097975],[4.6915257521,43.7006910909],[4.6927113824,43.70109927],[4.6963070065,43.7021620222],[4.6975729725,43.7020135766],[4.7003868284,43.701602432],[4.7029601747,43.7011562767],[4.7052082488,43.7007448586],[4.708521994,43.70012766],[4.7169869072,43.6980791494],[4.739735706,43.695841235],[4.7463526645,43.6951997132],[4.7555309855,43.6952455273],[4.7568908922,43.6955403939],[4.7586283381,43.6958489435],[4.7588861507,43.6934182562],[4.7683945725,43.6877306605],[4.7755312585,43.6844480712],[4.7774806794,43.6840409198],[4.7775355413,43.682851067],[4.7720828156,43.6748855807],[4.768372337,43.6681246158],[4.7664154351,43.661555606],[4.765397312,43.651443276],[4.7652728654,43.6493743514],[4.7651408703,43.6416255513],[4.7651833158,43.6394216289],[4.7553417171,43.6319516201],[4.751244235,43.6271702961],[4.7511758575,43.6226587954],[4.7517509021,43.6199882325],[4.7535486498,43.6155375551],[4.7553526858,43.6140135357],[4.7579127806,43.6116186628],[4.7594650065,43.6100095498],[4.7603951532,43.6085949943],[4.7609037776,43.6074509617],[4.7612625143,43.6054192657],[4.7614079029,43.5997874754],[4.7603140419,43.5940038989],[4.7606928353,43.5928700805],[4.7612002101,43.5916900775],[4.7620601663,43.5900975618],[4.7653649629,43.5843038221],[4.7660578983,43.5831648831],[4.7672442702,43.5819693131],[4.7707119431,43.5788790046],[4.7748911338,43.5752315734],[4.7755696843,43.5750377855],[4.7770030667,43.5752753318],[4.7788241079,43.5756388066],[4.7791911759,43.5755400954],[4.7938082023,43.5636989179],[4.7985131215,43.5600067871],[4.8002868429,43.5585167332],[4.8021191028,43.5567655868],[4.8065446998,43.552528763],[4.8090177601,43.5496850719],[4.8143325859,43.5433946851],[4.8145661821,43.5430739918],[4.8152176379,43.5424304222],[4.8258393366,43.5342731544],[4.8262582543,43.5339484181],[4.8341712802,43.5277861039],[4.8489681273,43.516068558],[4.8561529307,43.5103265267],[4.8590721581,43.5078754518],[4.8595606948,43.5074593977],[4.8620640146,43.5054221515],[4.8763928404,43.494520648],[4.8738625736,43.4926304077],[4.8723440617,43.4897678048],[4.8714184994,43.4879532923],[4.8686129197,43.4824085324],[4.8652647172,43.478214875],[4.8621240249,43.4743847442],[4.8556413081,43.4673765578],[4.8543235966,43.4663623921],[4.8525971089,43.4656593745],[4.8381375429,43.462566842],[4.8326070825,43.4669324135],[4.831842239,43.4674744957],[4.8246457516,43.4730269019],[4.8228113543,43.4741763671],[4.8199198528,43.4719535443],[4.8148862354,43.4683284685],[4.8144221957,43.4685414181],[4.8124298633,43.4696213529],[4.81071845,43.4707172567],[4.8087392161,43.4723359553],[4.8079705121,43.4731182091],[4.8070368517,43.4746681389],[4.8067298336,43.4752402056],[4.8063600138,43.475937507],[4.8062460203,43.4767538345],[4.8060958934,43.4772854893],[4.8056673071,43.4778829768],[4.8047069093,43.478428122],[4.8041796024,43.4785583878],[4.8027037162,43.4787053279],[4.797044263,43.4780109543],[4.7937361847,43.4757178521],[4.7921357661,43.4744052453],[4.7920122866,43.4744081864],[4.7851972762,43.4787439287],[4.7844710255,43.4790753553],[4.7836763509,43.4792729152],[4.7796569291,43.4795342499],[4.7705460837,43.4773940416],[4.7696077572,43.4771006919],[4.7649377578,43.4747236647],[4.7616535386,43.4715068209],[4.755997816,43.4657951112],[4.7517783725,43.4616122649],[4.7486337079,43.4581417552],[4.7469412428,43.4545208853],[4.7457590647,43.4523631009],[4.7431172253,43.4480933668],[4.7427691163,43.4476922176],[4.7417828483,43.4464473365],[4.7403850237,43.4445386464],[4.7384504316,43.4414570124],[4.7378611755,43.4404702982],[4.7362378749,43.4375465224],[4.73438637,43.4341746477],[4.7337582926,43.4309523559],[4.7337612449,43.4294522224],[4.734066907,43.4284916669],[4.7343545721,43.4278355553],[4.7350359159,43.4272964206],[4.7367015027,43.4260693031],[4.7397371224,43.424381928],[4.7402213533,43.4241455827],[4.7414911364,43.4229823412],[4.7471847105,43.4175625297],[4.7489063843,43.4156801173],[4.7507191652,43.4133471729],[4.7524734388,43.4107595854],[4.7539495089,43.408728094],[4.7572289739,43.407392623],[4.7585809632,43.4068829498],[4.7612703416,43.4058727882],[4.7634176967,43.4050603585],[4.7656055969,43.404002462],[4.7682664778,43.4025147625],[4.7722352946,43.4001417297],[4.7773079959,43.3971601263],[4.7822352197,43.3938009375],[4.7902251774,43.390068769],[4.7951242924,43.3879089655],[4.7979573366,43.3866480382],[4.8050517948,43.3822376424],[4.8102837895,43.3789710679],[4.813780831,43.376921138],[4.819524321,43.3735933484],[4.8219575854,43.3721333395],[4.826631405,43.3702269463],[4.831150241,43.368692812],[4.8314717582,43.3684858035],[4.8318152686,43.3681947351],[4.8321807417,43.3678187075],[4.8326169825,43.3671472276],[4.8331206022,43.3661128633],[4.8332966767,43.3656383569],[4.8335982617,43.3643410572],[4.8339905844,43.3624465178],[4.8342818832,43.3608659401],[4.834482702,43.3591942128],[4.8346690693,43.3572239823],[4.8348808098,43.3542697912],[4.8348838333,43.3520804148],[4.8347534594,43.3504647054],[4.8341739314,43.3481412393],[4.8341248469,43.3469866746],[4.8342738609,43.3454706155],[4.8345117815,43.3443075868],[4.8349763713,43.3429841416],[4.837066798,43.3390274051],[4.836248875,43.339027405]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000027656","CODE_COM":"100","INSEE_COM":"13100","NOM_COM":"SAINT-REMY-DE-PROVENCE","STATUT":"Commune simple","X_CHF_LIEU":847445.0,"Y_CHF_LIEU":6300650.0,"X_CENTROID":848748.0,"Y_CENTROID":6300526.0,"Z_MOYEN":103.0,"SUPERFICIE":"8993","POPULATION":"9798","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8833515483,43.7334600004],[4.882461092,43.7332962799],[4.8818989668,43.7332267887],[4.8811404133,43.7332614998],[4.8749664189,43.7341447816],[4.8711039807,43.7348097918],[4.8677001227,43.7354550972],[4.8655434233,43.7366225926],[4.8639982804,43.7375878565],[4.8594609203,43.7416393666],[4.8568734075,43.7463397337],[4.8569778984,43.7485269982],[4.8570009227,43.7498488558],[4.8568968524,43.7500090484],[4.8521409787,43.7521890708],[4.848640315,43.7527201996],[4.8445891588,43.75308682],[4.8435826219,43.7531029622],[4.8328264625,43.7532529962],[4.8325357622,43.7532488867],[4.8316905793,43.7533792167],[4.830452353,43.7537222687],[4.8264121894,43.7550610306],[4.8152539548,43.7585581195],[4.8116377987,43.7598172514],[4.8081522891,43.7610497906],[4.8059425594,43.761864131],[4.8041438979,43.7625618069],[4.8028686939,43.7631220769],[4.8023669011,43.7633572047],[4.8017149592,43.7637937349],[4.8007225602,43.7646202306],[4.7866434648,43.7657332398],[4.7851861785,43.7645654077],[4.783165721,43.7631781548],[4.7798329729,43.7612020564],[4.7703215272,43.76020674],[4.7702854405,43.7621713153],[4.7704536263,43.7674061977],[4.7707404686,43.7700928078],[4.7712699597,43.7737151754],[4.7716677471,43.7761713672],[4.7720682548,43.7780325536],[4.7728613423,43.7816569481],[4.7728549781,43.7823735306],[4.7712467665,43.7849217625],[4.7695803118,43.790250434],[4.7687686837,43.7933356634],[4.7677938511,43.7959680848],[4.7675471047,43.7962268165],[4.767335847,43.7964678702],[4.7658151811,43.7974853337],[4.7646220299,43.7982850489],[4.7645058859,43.7984678505],[4.7655053163,43.7992824655],[4.7701938908,43.8022460911],[4.7811633222,43.8058550799],[4.7921880033,43.8080885056],[4.7985804315,43.8086439172],[4.8029020737,43.8104159832],[4.8070483759,43.8126489544],[4.8110719007,43.815116049],[4.8121956186,43.8161739307],[4.8131351674,43.8171070467],[4.8139589578,43.8185830598],[4.8160007745,43.8230614354],[4.8162186743,43.8237761131],[4.8163375999,43.8245842531],[4.8164890752,43.8257122994],[4.8192075988,43.8253807379],[4.8286689358,43.8240127008],[4.8411900475,43.8236651817],[4.8516826257,43.8243723515],[4.8550455579,43.825056013],[4.8679980803,43.8288495669],[4.8685388772,43.8298358692],[4.8687210725,43.829741832],[4.8721997307,43.8266918641],[4.8745384009,43.8247937765],[4.8792602372,43.8217600095],[4.880292493,43.8212417306],[4.8816575863,43.8209400356],[4.8901245521,43.8197152107],[4.8958142955,43.8191771559],[4.9012751348,43.818786819],[4.9077214594,43.8182385448],[4.9085078796,43.8120047178],[4.909614981,43.8032457743],[4.9097291683,43.8030178368],[4.9100353931,43.8029206563],[4.9226402366,43.7996619507],[4.9241761188,43.7991757718],[4.9234792239,43.7929779555],[4.9239536222,43.7911224839],[4.9140672612,43.7849154735],[4.9150819547,43.7775192264],[4.917017169,43.7683542526],[4.9236323458,43.7591103382],[4.9247132855,43.7568724327],[4.9245769077,43.7554022385],[4.9240789185,43.7545892237],[4.922850227,43.7526513553],[4.9188866153,43.7469514953],[4.91827839,43.7390663987],[4.9174674719,43.7375027847],[4.9163329381,43.7378035931],[4.9095629805,43.7392807982],[4.8958501388,43.7401558928],[4.8902623683,43.7377921489],[4.8855723289,43.7348176197],[4.88551421,43.7346737099],[4.8854142869,43.7344666167],[4.8853086723,43.7343505323],[4.8851500623,43.7342083623],[4.8845510121,43.7339225996],[4.8833515483,43.7334600004]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000027781","CODE_COM":"081","INSEE_COM":"13081","NOM_COM":"ROGNAC","STATUT":"Commune simple","X_CHF_LIEU":880620.0,"Y_CHF_LIEU":6267966.0,"X_CENTROID":880011.0,"Y_CENTROID":6269594.0,"Z_MOYEN":68.0,"SUPERFICIE":"1764","POPULATION":"11700","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2695768711,43.4954625804],[5.2696133277,43.4944447393],[5.2700307101,43.4932740138],[5.2705261977,43.4921718571],[5.2713168484,43.4904055671],[5.2714559955,43.489859912],[5.2718667453,43.4875849406],[5.2719095379,43.4869161958],[5.2718644126,43.486212391],[5.2716540399,43.4856749606],[5.258970863,43.4838734317],[5.2579568284,43.4833275194],[5.2576641622,43.4827368764],[5.2573444816,43.4813637463],[5.2564750676,43.4803755839],[5.2558112945,43.479681955],[5.2524563538,43.4770533572],[5.2471905545,43.4752662413],[5.2429669824,43.4751593065],[5.239115348,43.4772712414],[5.2378840875,43.47755048],[5.2368019171,43.4777546246],[5.2307051072,43.4786191919],[5.2283380822,43.4789027852],[5.2237688446,43.4791631198],[5.2234187295,43.4791225989],[5.2234724258,43.4792007015],[5.2236535715,43.4793463932],[5.2225521041,43.4834650859],[5.2200885568,43.4861841997],[5.2175169995,43.488096324],[5.2088790406,43.4911950967],[5.2034466444,43.491249825],[5.2027922081,43.4911731177],[5.2014300258,43.4935976035],[5.2008314054,43.4943333923],[5.1993154355,43.4955864135],[5.1980273945,43.4967879909],[5.1961260195,43.4986680111],[5.1954092779,43.4998426856],[5.1944381076,43.5025471879],[5.194951254,43.5042306983],[5.1962681594,43.5060752458],[5.2003010233,43.5096072247],[5.2030065614,43.5126980081],[5.203893485,43.513799665],[5.2047042465,43.5157840242],[5.2050825879,43.5189067517],[5.2059106673,43.5227241934],[5.2061805447,43.5237285803],[5.2064595019,43.524614874],[5.2068895176,43.5244423151],[5.2169462038,43.5198656372],[5.223532048,43.5155086238],[5.2252468748,43.5145040858],[5.2290310639,43.5124255372],[5.2329683054,43.5104418105],[5.2348925631,43.5095201119],[5.2372914016,43.5085291854],[5.2396691002,43.5077276556],[5.2425476107,43.5072127411],[5.2549449341,43.5021817198],[5.2646288872,43.4977819991],[5.2695768711,43.4954625804]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000028605","CODE_COM":"209","INSEE_COM":"13209","NOM_COM":"MARSEILLE-9E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":896240.0,"Y_CHF_LIEU":6243950.0,"X_CENTROID":898863.0,"Y_CENTROID":6240816.0,"Z_MOYEN":180.0,"SUPERFICIE":"6358","POPULATION":"74234","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.50847292,43.200550079],[5.50847292,43.200695038],[5.508194923,43.200695038],[5.508194923,43.200416565],[5.507916927,43.200416565],[5.507916927,43.200138092],[5.507638931,43.200138092],[5.507638931,43.1989814653],[5.5056419392,43.1988922709],[5.50541687,43.1988132393],[5.50541687,43.199028015],[5.505694865,43.199028015],[5.505694865,43.199306488],[5.504581928,43.199306488],[5.504581928,43.198749542],[5.504860879,43.198749542],[5.504860879,43.1986180039],[5.5036494454,43.1981925963],[5.503472806,43.198192596],[5.503472806,43.1981305659],[5.5028673323,43.1979179386],[5.502637862,43.197917938],[5.502637862,43.1978332029],[5.5022011645,43.1976394658],[5.501805783,43.197639465],[5.5018045775,43.1974635207],[5.5015734766,43.197360992],[5.501527785,43.197360992],[5.501527785,43.1973407207],[5.5002885069,43.1967908957],[5.4998648787,43.1968934062],[5.4981153102,43.1977087808],[5.4969328037,43.1985533023],[5.4955570973,43.2000232409],[5.4946653966,43.201137294],[5.494306087,43.201306383],[5.494306087,43.202083588],[5.49486208,43.202083588],[5.49486208,43.202915192],[5.493194102,43.202915192],[5.493194102,43.203193665],[5.492916107,43.203193665],[5.492916107,43.203472138],[5.492640019,43.203472138],[5.492640019,43.203750611],[5.492084027,43.203750611],[5.492084027,43.203472138],[5.491528034,43.203472138],[5.491528034,43.203193665],[5.491250038,43.203193665],[5.491250038,43.202652276],[5.490139961,43.2030084306],[5.490139961,43.203193665],[5.489861966,43.203193665],[5.489861966,43.2030976195],[5.48930502,43.2032763009],[5.48930502,43.203472138],[5.489861966,43.203472138],[5.489861966,43.204029084],[5.489027024,43.204029084],[5.489027024,43.2033654871],[5.487916947,43.2037216102],[5.487916947,43.203750611],[5.4878265455,43.2037506112],[5.487360954,43.2038999721],[5.487360954,43.204029084],[5.4869584738,43.2040290848],[5.4865704179,43.2041535684],[5.484582901,43.2042591181],[5.484582901,43.204582215],[5.484304905,43.204582215],[5.484304905,43.204860688],[5.483748912,43.204860688],[5.483748912,43.205139161],[5.484304905,43.205139161],[5.484304905,43.205417634],[5.483748912,43.205417634],[5.483748912,43.205696107],[5.483472824,43.205696107],[5.483472824,43.205970765],[5.482360839,43.205970765],[5.482360839,43.205696107],[5.482638835,43.205696107],[5.482638835,43.205139161],[5.482916833,43.205139161],[5.482916833,43.2043475684],[5.481804848,43.2044065884],[5.481804848,43.204582215],[5.481248855,43.204582215],[5.481248855,43.204441071],[5.481248855,43.2044360941],[5.4793580728,43.2045364133],[5.476807117,43.2047536317],[5.476807117,43.204860688],[5.476251126,43.204860688],[5.476251126,43.205139161],[5.475138188,43.205139161],[5.475138188,43.205417634],[5.474306107,43.205417634],[5.474306107,43.2053922915],[5.473750114,43.2055683131],[5.473750114,43.205696107],[5.4734610007,43.2056961081],[5.471250056,43.206930469],[5.471250056,43.20697403],[5.471250056,43.207084655],[5.4709738711,43.207084655],[5.470972061,43.2070856655],[5.470972061,43.207637786],[5.470694065,43.207637786],[5.470694065,43.207916259],[5.47041607,43.207916259],[5.47041607,43.207637786],[5.4699749058,43.2076423358],[5.469305993,43.208015751],[5.469305993,43.208473205],[5.4684865127,43.2084732071],[5.4680369147,43.2087241793],[5.4612254973,43.209839978],[5.460138798,43.2100048997],[5.460138798,43.210140228],[5.459860802,43.210140228],[5.459860802,43.2100470876],[5.459582805,43.2100892748],[5.459582805,43.210140228],[5.4592470345,43.2101402283],[5.459026813,43.2101736466],[5.459026813,43.210414886],[5.458473205,43.210414886],[5.458473205,43.21061325],[5.458473205,43.210693359],[5.458195209,43.210693359],[5.458195209,43.210971832],[5.457083225,43.210971832],[5.457083225,43.21050644],[5.457083225,43.2104329668],[5.456251144,43.2104973332],[5.456251144,43.210693359],[5.455973148,43.210693359],[5.455973148,43.210971832],[5.455695152,43.210971832],[5.455695152,43.211250305],[5.455417157,43.211250305],[5.455417157,43.210971832],[5.455139161,43.210971832],[5.455139161,43.2105833414],[5.4543967528,43.2106407577],[5.4480513075,43.2103664159],[5.4461877784,43.2102313856],[5.4469705154,43.2074211462],[5.448010457,43.2067622076],[5.448750019,43.2063587171],[5.448750019,43.206249238],[5.4489073143,43.2062728986],[5.4491756163,43.2061265148],[5.4495039448,43.2045279827],[5.446249962,43.2046758],[5.446249962,43.204860688],[5.445971967,43.204860688],[5.445971967,43.205139161],[5.445693969,43.205139161],[5.445693969,43.204860688],[5.445137978,43.204860688],[5.445137978,43.2047479064],[5.441568709,43.2052756754],[5.440971852,43.2054102642],[5.440971852,43.205417634],[5.4409391682,43.2054176341],[5.440139771,43.2055978884],[5.440139771,43.205696107],[5.4397041742,43.2056961072],[5.439583778,43.2057232539],[5.439583778,43.205970765],[5.439027786,43.205970765],[5.439027786,43.206249238],[5.4372508707,43.2062492417],[5.436806202,43.2063494919],[5.436806202,43.206527711],[5.4360156618,43.2065277132],[5.43541813,43.2066624177],[5.43541813,43.206806182],[5.434861183,43.206806182],[5.434861183,43.2067905149],[5.4324992034,43.2073712478],[5.432361126,43.2074414363],[5.432361126,43.207637786],[5.432083131,43.207637786],[5.432083131,43.207916259],[5.431677819,43.207916259],[5.431527137,43.207942963],[5.431527137,43.208194732],[5.430973054,43.208194732],[5.430973054,43.208473205],[5.43041706,43.208473205],[5.43041706,43.208751678],[5.429305076,43.208751678],[5.429305076,43.209026336],[5.429028988,43.209026336],[5.42902708,43.209304809],[5.428472997,43.209304809],[5.428472997,43.209583282],[5.4266058767,43.2095832875],[5.4230255551,43.2108160117],[5.4209047215,43.2105288356],[5.4205871303,43.210348775],[5.4203207252,43.2099515835],[5.4203038849,43.2096378874],[5.4210726511,43.2090761887],[5.4219559991,43.2086361026],[5.4241817595,43.2072335395],[5.4258739634,43.2061057035],[5.4262461297,43.2056230764],[5.4276174135,43.2034477176],[5.4276124048,43.203357838],[5.4268801917,43.2034688003],[5.425972939,43.203701323],[5.425972939,43.203750611],[5.4257806189,43.2037506121],[5.4256485097,43.2037844697],[5.42451129,43.2042113926],[5.424304009,43.2042895558],[5.424304009,43.204303742],[5.4242663884,43.204303742],[5.424028873,43.2043933054],[5.424028873,43.204494476],[5.424028873,43.204582215],[5.423750878,43.204582215],[5.423750878,43.204860688],[5.4227893739,43.2048606882],[5.4227044253,43.2048927193],[5.421527864,43.2053711068],[5.421527864,43.205417634],[5.4214000438,43.205423077],[5.420137881,43.2059362447],[5.420137881,43.205970765],[5.4200529737,43.2059707653],[5.419027804,43.2063875581],[5.419027804,43.206527711],[5.4186830654,43.2065277114],[5.418193817,43.2067266121],[5.418193817,43.206806182],[5.4179935709,43.2068080199],[5.4176700011,43.2069395621],[5.417362213,43.2070625289],[5.417362213,43.207084655],[5.4173068302,43.2070846552],[5.4116705288,43.2093362077],[5.411250115,43.2095358425],[5.411250115,43.209861755],[5.410563757,43.2098617555],[5.410418033,43.2099309506],[5.410418033,43.210140228],[5.4099772914,43.2101402288],[5.409584046,43.2103269515],[5.409584046,43.210414886],[5.4093988504,43.2104148861],[5.409305096,43.2104594023],[5.409305096,43.210693359],[5.4090271,43.210693359],[5.4090271,43.210971832],[5.408749103,43.210971832],[5.408749103,43.211250305],[5.408471107,43.211250305],[5.408471107,43.211528778],[5.408195972,43.211528778],[5.408195972,43.211250305],[5.407917023,43.211250305],[5.407917023,43.211528778],[5.4068747279,43.211528785],[5.404304982,43.2124813046],[5.404304982,43.212638855],[5.4038799102,43.2126388558],[5.4034729,43.2127897101],[5.4034729,43.212917328],[5.401250839,43.212917328],[5.401250839,43.2127282184],[5.3949789568,43.2124463757],[5.391056726,43.2121229825],[5.3904393172,43.2118072514],[5.390140056,43.211807251],[5.3901390049,43.2116536748],[5.3898947768,43.211528778],[5.38986206,43.211528778],[5.38986206,43.2115120468],[5.389350249,43.2112503058],[5.389028073,43.211250305],[5.389028073,43.2110322542],[5.3889675242,43.2109912597],[5.3889255477,43.2109718321],[5.388750076,43.210971832],[5.388750076,43.2108906197],[5.3883238693,43.2106933593],[5.388194084,43.210693359],[5.388194084,43.2106332903],[5.3873920906,43.2102620953],[5.3866874113,43.2101402289],[5.386528016,43.210140228],[5.386528016,43.2101126626],[5.3862756053,43.2100690093],[5.3850362471,43.2098795274],[5.3818724902,43.2095651385],[5.3815338698,43.2095879102],[5.3836254926,43.223389656],[5.383387636,43.2234705016],[5.3822630547,43.2232361491],[5.3806237392,43.2277674288],[5.3851208245,43.2322694898],[5.3895499831,43.2330327798],[5.3908644327,43.2341906883],[5.3915112689,43.2359888273],[5.3912781882,43.2380872375],[5.3925477286,43.2432949488],[5.3948265258,43.2450794111],[5.396926346,43.2474122698],[5.3971335157,43.2479836353],[5.3969750536,43.249088685],[5.3952891051,43.2507369957],[5.3948230975,43.2513448948],[5.3946626976,43.2519892132],[5.3945566735,43.253380182],[5.3990165589,43.2552250933],[5.3991113329,43.258718399],[5.3939307976,43.2678814871],[5.3952499739,43.2677676481],[5.3987388589,43.2682401051],[5.4000124907,43.2688075889],[5.4009636917,43.2700607959],[5.3992183467,43.2730469481],[5.3991152999,43.2744189805],[5.3998320649,43.274624452],[5.4038974246,43.2755006322],[5.4074258233,43.2755786585],[5.4101090785,43.2756223289],[5.4110202931,43.2737894617],[5.4129520742,43.2712993211],[5.4146227223,43.269371163],[5.4173529693,43.2680447482],[5.4229511525,43.2672128506],[5.4269515621,43.2664606687],[5.4297852162,43.265581594],[5.4297657912,43.2652958411],[5.4304065345,43.2626445222],[5.4314292496,43.2604093889],[5.4366015276,43.2595152577],[5.4410589211,43.258433643],[5.4467079705,43.2577847359],[5.4496571862,43.2581939677],[5.4500372797,43.258155647],[5.4522390628,43.2574630985],[5.4522386946,43.2567881293],[5.4594773249,43.2548154849],[5.4624485005,43.2542689948],[5.4649815818,43.2543057046],[5.4706780095,43.2536850487],[5.4724493613,43.2534447152],[5.4729928969,43.2534574693],[5.4739849529,43.2535355445],[5.4778688258,43.2540332859],[5.4800859741,43.2544251815],[5.4824824282,43.2549200083],[5.483234798,43.2552357037],[5.4837019175,43.2555894539],[5.4861759766,43.2577689826],[5.4859093876,43.2589549968],[5.4850679465,43.2606609302],[5.4848753575,43.2623078335],[5.4856671871,43.2635081948],[5.4863880969,43.2639766951],[5.49001097,43.2662260098],[5.4922520782,43.2673875123],[5.4961399893,43.2684650301],[5.4988915477,43.2677012162],[5.5041493723,43.2657479639],[5.5084037694,43.2638933577],[5.51084085,43.2634389348],[5.5118108884,43.2633452811],[5.5130526963,43.263440595],[5.5148536682,43.2601190927],[5.5182167188,43.2495684251],[5.5196413481,43.2443269687],[5.5194694808,43.2435767918],[5.5192762916,43.2416895335],[5.5199318932,43.2412260429],[5.5184170483,43.2380511535],[5.5148956871,43.2350382117],[5.5098041679,43.2350540995],[5.5090143471,43.2348087653],[5.5084099461,43.2343548235],[5.5070802548,43.2331851463],[5.5064726593,43.2301060533],[5.5063912128,43.2296759587],[5.5065996074,43.2278711814],[5.507665473,43.2261724849],[5.5120296985,43.2215945715],[5.5167301747,43.2171526362],[5.5177338092,43.2159286755],[5.5178913713,43.2154786176],[5.5176323156,43.214137416],[5.5174203401,43.2134241907],[5.5161269271,43.2111603531],[5.5147317161,43.2092687616],[5.5127130424,43.2072971808],[5.5114734591,43.2043966852],[5.5103116542,43.1988962197],[5.5101907008,43.1978964908],[5.5100611679,43.1976898164],[5.5096804033,43.1974763868],[5.509375222,43.1975302824],[5.5092063386,43.1978050944],[5.5087700569,43.1990319698],[5.50847292,43.1990187039],[5.50847292,43.200550079]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000029119","CODE_COM":"056","INSEE_COM":"13056","NOM_COM":"MARTIGUES","STATUT":"Commune simple","X_CHF_LIEU":865920.0,"Y_CHF_LIEU":6258384.0,"X_CENTROID":865751.0,"Y_CENTROID":6256832.0,"Z_MOYEN":52.0,"SUPERFICIE":"7448","POPULATION":"47904","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.088192939,43.333194732],[5.088192939,43.332916259],[5.087917804,43.332916259],[5.087917804,43.3324531299],[5.0876566084,43.3324161489],[5.0856319349,43.3305303241],[5.0852002799,43.3301391611],[5.085138798,43.330139161],[5.085138798,43.3300834461],[5.0841267407,43.329166297],[5.0820895218,43.3280527695],[5.0815876357,43.3278770526],[5.080417157,43.3279763989],[5.080417157,43.329029084],[5.080139159,43.329029084],[5.080139159,43.329303742],[5.079861164,43.329303742],[5.079861164,43.329860688],[5.079583168,43.329860688],[5.079583168,43.330139161],[5.078751087,43.330139161],[5.078751087,43.329860688],[5.078473091,43.329860688],[5.078473091,43.329303742],[5.078751087,43.329303742],[5.078751087,43.329029084],[5.079305172,43.329029084],[5.079305172,43.328750611],[5.079027177,43.328750611],[5.079027177,43.328472138],[5.078473091,43.328472138],[5.078473091,43.328357698],[5.078473091,43.328193665],[5.078195095,43.328193665],[5.078195095,43.3281649642],[5.0770492278,43.3282621848],[5.0756472958,43.3281936657],[5.0730483513,43.3281936734],[5.072360039,43.3282871001],[5.072360039,43.328472138],[5.072084904,43.328472138],[5.072084904,43.328750611],[5.071249962,43.328750611],[5.071249962,43.329029084],[5.071527958,43.329029084],[5.071527958,43.329303742],[5.071249962,43.329303742],[5.071249962,43.329582215],[5.070693969,43.329582215],[5.070693969,43.329860688],[5.070971967,43.329860688],[5.070971967,43.330101014],[5.070971967,43.331249238],[5.070693969,43.331249238],[5.070693969,43.331527711],[5.069859982,43.331527711],[5.069859982,43.331806184],[5.069027901,43.331806184],[5.069027901,43.331527711],[5.068749905,43.331527711],[5.068749905,43.331249238],[5.0673325524,43.3312492415],[5.0670125796,43.3313863543],[5.066805839,43.3313717204],[5.066805839,43.331527711],[5.065693855,43.331527711],[5.065693855,43.3312930032],[5.0627982236,43.3310879671],[5.0626847814,43.3309707664],[5.062084198,43.330970765],[5.062084198,43.330696107],[5.061806202,43.330696107],[5.061806202,43.330417634],[5.061528207,43.330417634],[5.061528207,43.3297758398],[5.0600538676,43.3282525228],[5.0575403056,43.3268051162],[5.057361127,43.326805115],[5.057361127,43.327083588],[5.056805133,43.327083588],[5.056805133,43.327373504],[5.056805133,43.327640534],[5.056527138,43.327640534],[5.056527138,43.327915192],[5.056249142,43.327915192],[5.056249142,43.328193665],[5.055417061,43.328193665],[5.055417061,43.328472138],[5.055139065,43.328472138],[5.055139065,43.328193665],[5.054861069,43.328193665],[5.054861069,43.327915192],[5.055139065,43.327915192],[5.055139065,43.327640534],[5.055417061,43.327640534],[5.055417061,43.327362061],[5.055695056,43.327362061],[5.055695056,43.327083588],[5.05589199,43.327083588],[5.055971146,43.327083588],[5.055971146,43.326805115],[5.056249142,43.326805115],[5.056249142,43.3260615638],[5.0555823141,43.3256775391],[5.0539558219,43.3243064886],[5.0525625633,43.3243064912],[5.0523781431,43.3243111796],[5.0521950121,43.3243605495],[5.052083015,43.3243993843],[5.052083015,43.324584961],[5.051805019,43.324584961],[5.051805019,43.324859619],[5.0508775482,43.324859621],[5.050416946,43.3251179669],[5.050416946,43.325416565],[5.050138951,43.325416565],[5.050138951,43.325695038],[5.049582957,43.325695038],[5.049582957,43.325973511],[5.049304962,43.325973511],[5.049304962,43.326248169],[5.0488238971,43.3262481698],[5.04847288,43.3267203522],[5.04847288,43.3268508846],[5.0492292553,43.3276500899],[5.050120227,43.328750611],[5.050138951,43.328750611],[5.050138951,43.3287737382],[5.0503019686,43.3289750909],[5.0515704056,43.3309487918],[5.0515776715,43.3310836377],[5.051528931,43.3311154626],[5.051528931,43.331806184],[5.051250935,43.331806184],[5.051250935,43.332084655],[5.050972938,43.332084655],[5.050972938,43.332359315],[5.050694942,43.332359315],[5.050694942,43.332637788],[5.049860955,43.332637788],[5.049860955,43.332916259],[5.049304962,43.332916259],[5.049304962,43.332637788],[5.049028874,43.332637788],[5.049028874,43.332359315],[5.048750878,43.332359315],[5.048750878,43.3318291817],[5.0485828831,43.3318333255],[5.0485222033,43.3318061841],[5.04847288,43.331806184],[5.04847288,43.3317841222],[5.0483937302,43.3317487191],[5.0448432994,43.3295220921],[5.0440684096,43.3290290843],[5.043749809,43.329029084],[5.043749809,43.329151155],[5.043749809,43.329860688],[5.043471813,43.329860688],[5.043471813,43.330139161],[5.043193818,43.330184936],[5.043193818,43.330417634],[5.043471813,43.330417634],[5.043471813,43.330696107],[5.043749809,43.330696107],[5.043749809,43.331249238],[5.043471813,43.331249238],[5.043471813,43.331527711],[5.042915822,43.331527711],[5.042915822,43.331249238],[5.042637824,43.331249238],[5.042637824,43.330970765],[5.042362214,43.330970765],[5.042362214,43.330696107],[5.042084216,43.330696107],[5.042084216,43.330417634],[5.04180622,43.330417634],[5.04180622,43.330261232],[5.04180622,43.329597473],[5.041528225,43.329582215],[5.041528225,43.328472138],[5.04180622,43.328472138],[5.04180622,43.328193665],[5.041528225,43.328193665],[5.041528225,43.327915192],[5.040972234,43.327915192],[5.040972234,43.328193665],[5.040137767,43.328193665],[5.040137767,43.328472138],[5.039584159,43.328472138],[5.039584159,43.328750611],[5.039306163,43.328750611],[5.039306163,43.329029084],[5.039028168,43.329029084],[5.039028168,43.329303742],[5.038194179,43.329303742],[5.038194179,43.329582215],[5.037916183,43.329582215],[5.037916183,43.329860688],[5.037084102,43.329860688],[5.037084102,43.330139161],[5.0362754765,43.3301391611],[5.036250115,43.3301568868],[5.036250115,43.330417634],[5.0358770395,43.3304176343],[5.035694122,43.3305454766],[5.035694122,43.330600738],[5.035694122,43.330696107],[5.0354785965,43.3306961076],[5.034584045,43.3313212981],[5.034584045,43.331806184],[5.034306049,43.331806184],[5.034306049,43.332176209],[5.034306049,43.332916259],[5.034028053,43.332916259],[5.034028053,43.333194732],[5.033471107,43.333194732],[5.033471107,43.332916259],[5.033110143,43.332916259],[5.0323485243,43.3329162609],[5.0307418125,43.3343313406],[5.0293416332,43.3359846198],[5.0276871019,43.3377344389],[5.0273323179,43.3380578507],[5.0261149522,43.3383587281],[5.0248903377,43.3385238442],[5.024582863,43.3386575108],[5.024582863,43.338748932],[5.0243725624,43.3387489326],[5.023750782,43.3390192288],[5.023750782,43.339027405],[5.0237319733,43.339027405],[5.0236832777,43.3390485734],[5.0224845541,43.3400221776],[5.022360802,43.3401271639],[5.022360802,43.340137482],[5.0223486396,43.340137482],[5.022082806,43.3403630027],[5.022082806,43.340415955],[5.0220203877,43.3404159551],[5.021807193,43.3405968173],[5.021807193,43.340972901],[5.021529198,43.340972901],[5.021529198,43.341251374],[5.021251202,43.341251374],[5.021251202,43.341526032],[5.020973206,43.341526032],[5.020973206,43.341804505],[5.020417213,43.341804505],[5.020417213,43.342082978],[5.020139217,43.342082978],[5.020139217,43.342361451],[5.0197270011,43.3423614526],[5.0190482281,43.342937227],[5.018560849,43.3445816051],[5.018751145,43.344581605],[5.018751145,43.344860076],[5.0184783099,43.344860076],[5.018472194,43.3448807098],[5.018472194,43.345138549],[5.0183957694,43.3451385491],[5.0181481431,43.345973968],[5.018194199,43.345973968],[5.018194199,43.3468250685],[5.019283094,43.3473625201],[5.019609928,43.347362518],[5.019859792,43.347362518],[5.019859792,43.347084045],[5.020139217,43.347084045],[5.020139217,43.346805572],[5.021397114,43.346805572],[5.021807193,43.346805572],[5.021807193,43.346527099],[5.022082806,43.346527099],[5.022082806,43.346248626],[5.022360802,43.346248626],[5.022360802,43.345973968],[5.022916793,43.345973968],[5.022916793,43.345695495],[5.02402687,43.345695495],[5.02402687,43.345417022],[5.024582863,43.345417022],[5.024582863,43.345695495],[5.024860859,43.345695495],[5.024860859,43.346248626],[5.024582863,43.346248626],[5.024582863,43.347084045],[5.024304868,43.347084045],[5.024304868,43.347362518],[5.023750782,43.347362518],[5.023750782,43.347637176],[5.022638797,43.347637176],[5.022638797,43.347915649],[5.022082806,43.347915649],[5.022082806,43.34803009],[5.022082806,43.348194122],[5.021807193,43.348194122],[5.021807193,43.348472595],[5.0215322765,43.348472595],[5.0218595838,43.3486341288],[5.0236025143,43.3520851159],[5.024362088,43.352085114],[5.02541685,43.352085114],[5.02541685,43.352359772],[5.025694848,43.352359772],[5.025694848,43.352916718],[5.02541685,43.352916718],[5.02541685,43.353473664],[5.025138854,43.353473664],[5.025138854,43.354305268],[5.024860859,43.354305268],[5.024860859,43.354583741],[5.024582863,43.354583741],[5.024582863,43.355140685],[5.0243141313,43.355140685],[5.024304868,43.35536168],[5.024304868,43.355415345],[5.0243026185,43.355415345],[5.0242965902,43.3555591619],[5.0220851353,43.3559739757],[5.018751145,43.3566235626],[5.018751145,43.356803893],[5.018472194,43.356803893],[5.018472194,43.357082366],[5.017916203,43.357082366],[5.017916203,43.357360839],[5.017764091,43.357360839],[5.01736021,43.357360839],[5.01736021,43.357082366],[5.017082214,43.357082366],[5.017082214,43.3570120017],[5.016806126,43.3577043186],[5.016806126,43.357917785],[5.017082214,43.357917785],[5.017082214,43.358196259],[5.016806126,43.358196259],[5.016806126,43.358470916],[5.016528131,43.358470916],[5.016528131,43.359027862],[5.016806126,43.359027862],[5.016806126,43.359306336],[5.016528131,43.359306336],[5.016528131,43.359584809],[5.016250133,43.359584809],[5.016250133,43.359859466],[5.0159466345,43.3598594664],[5.0157479021,43.3603577583],[5.0132223978,43.3632979624],[5.012916089,43.3635222181],[5.012916089,43.364028932],[5.012639999,43.364028932],[5.012639999,43.364307405],[5.012362003,43.364307405],[5.012362003,43.364582063],[5.012084007,43.364582063],[5.012084007,43.365695953],[5.011806012,43.365695953],[5.011806012,43.36708069],[5.011806012,43.368473053],[5.011528014,43.368473053],[5.011528014,43.369304657],[5.011250019,43.369304657],[5.011250019,43.369861603],[5.010972023,43.369861603],[5.010972023,43.370140076],[5.009305955,43.370140076],[5.009305955,43.370418549],[5.008927383,43.3704185493],[5.0088827292,43.3704617599],[5.008749961,43.3705828078],[5.008749961,43.370693207],[5.0086288717,43.3706932071],[5.008471966,43.3708362601],[5.008471966,43.371250153],[5.00819397,43.371250153],[5.00819397,43.371528626],[5.00791788,43.371528626],[5.007915975,43.371807099],[5.007639884,43.371807099],[5.007639884,43.372081757],[5.007361889,43.372081757],[5.007361889,43.37236023],[5.007083893,43.37236023],[5.007083893,43.372638703],[5.006805898,43.372638703],[5.006805898,43.372917176],[5.0065279,43.372917176],[5.0065279,43.373195649],[5.006161213,43.373195649],[5.0057600095,43.3731956507],[5.004072678,43.3740308808],[5.0001976646,43.3771163575],[4.999582767,43.378201625],[4.999582767,43.379306793],[4.998956568,43.3793067944],[4.9983632341,43.380353919],[4.9968881555,43.383357147],[4.9963508141,43.3837306231],[4.9952116346,43.3844328606],[4.9934503297,43.3851285469],[4.993195057,43.3853931761],[4.993195057,43.385417939],[4.993473053,43.385417939],[4.993473053,43.38597107],[4.9926375742,43.3859710818],[4.9904920824,43.3881950391],[4.990694045,43.388195039],[4.990694045,43.38874817],[4.99041605,43.38874817],[4.99041605,43.389305116],[4.9895879115,43.389305116],[4.989583968,43.3893101142],[4.989583968,43.389583587],[4.9893681961,43.3895835873],[4.988193988,43.3910717477],[4.988193988,43.391529083],[4.987915993,43.391529083],[4.987915993,43.3920218228],[4.9891788046,43.3931326623],[4.991253051,43.394911461],[4.9927627039,43.3952787471],[4.9945830044,43.393997039],[4.9948971684,43.3941244381],[4.9957866758,43.3946866909],[5.0002351772,43.397553631],[5.0009357701,43.3980392418],[5.0010677938,43.3982158863],[5.0003615362,43.3989524753],[4.9974340723,43.401228433],[4.996805191,43.4018785022],[4.996805191,43.40208435],[4.997083187,43.40208435],[4.997083187,43.40228653],[4.997083187,43.403194427],[4.99597311,43.403194427],[4.99597311,43.4034671799],[4.9975363428,43.4034286607],[5.0042931747,43.4034063869],[5.0047270825,43.4034613489],[5.0059725633,43.4089539477],[5.0053667827,43.4143476656],[5.0041821392,43.4169137122],[5.0039978407,43.4184281158],[5.0039833573,43.4202102599],[5.0042592084,43.4226358904],[5.0050539079,43.425139216],[5.0067166283,43.428206028],[5.0082107826,43.4296578469],[5.0100922279,43.4313418481],[5.0140298145,43.431294809],[5.0203636388,43.4305612967],[5.0228269754,43.4309419012],[5.021424457,43.4328831779],[5.0218461617,43.4330759972],[5.0263904961,43.4347198969],[5.0406108936,43.4395926336],[5.0530635667,43.4429716318],[5.0533104268,43.4429669537],[5.0542403549,43.4429979244],[5.0541215121,43.442021913],[5.0545427638,43.4407791709],[5.0552172462,43.4388467507],[5.0573490083,43.4328053291],[5.0601887267,43.4258225636],[5.0611076259,43.4231403073],[5.0610458016,43.4215521611],[5.0608668385,43.4197268581],[5.0607144736,43.4184716217],[5.0600160977,43.4167587985],[5.0593289419,43.4150133623],[5.0584854923,43.4128317205],[5.0583383323,43.4123413458],[5.0580213222,43.4095521334],[5.0595684339,43.4039745557],[5.0598573184,43.4035622858],[5.0608111041,43.4028637792],[5.0626179554,43.4019645279],[5.0637794887,43.4014852228],[5.0671944325,43.4006884212],[5.0703896716,43.4002025931],[5.073954655,43.3999777713],[5.0816622175,43.3997002594],[5.0838364192,43.3997889263],[5.0863078733,43.3999060201],[5.0927056003,43.4006051016],[5.0941363395,43.4008834211],[5.094143714,43.4010182712],[5.0952677492,43.4013133074],[5.0963870243,43.4014095348],[5.0979926817,43.3990358568],[5.1012226369,43.3938632964],[5.1030289677,43.3898999461],[5.1024504672,43.3873049399],[5.102563061,43.3773790945],[5.1013514517,43.3722720891],[5.1007156285,43.36711792],[5.1027054381,43.3630331863],[5.1029845013,43.3623321179],[5.1030349625,43.3616534913],[5.1039520316,43.3579567611],[5.104375288,43.3545531138],[5.1017525418,43.347905091],[5.0985902875,43.3439294634],[5.0961580781,43.3422163946],[5.0931768332,43.339470907],[5.088818818,43.3348225492],[5.0885136736,43.3344648807],[5.088228284,43.3339718444],[5.0883542939,43.3331947321],[5.088192939,43.333194732]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000029218","CODE_COM":"035","INSEE_COM":"84035","NOM_COM":"CAVAILLON","STATUT":"Commune simple","X_CHF_LIEU":863851.0,"Y_CHF_LIEU":6306292.0,"X_CENTROID":863835.0,"Y_CENTROID":6308142.0,"Z_MOYEN":70.0,"SUPERFICIE":"4592","POPULATION":"25636","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.991499901,43.850719453],[4.9972911248,43.8451994266],[4.9960851929,43.846061249],[4.9923927717,43.8497493425],[4.9914935206,43.8507154706],[4.9914914098,43.8507268503],[4.991499901,43.850719453]]],[[[4.997651101,43.844856263],[4.9976568301,43.8448531642],[4.9976450115,43.8448534377],[4.9976454139,43.8448616845],[4.997651101,43.844856263]]],[[[5.027721405,43.828582763],[5.0277259355,43.8285777528],[5.0260040626,43.8293222603],[5.0239843927,43.8302275524],[5.0201648411,43.8322103895],[5.0113477644,43.8368266222],[5.0039884125,43.8407402095],[4.9995310236,43.8437278439],[4.998592246,43.8443471961],[5.027721405,43.828582763]]],[[[5.03535366,43.82014084],[5.0353578238,43.8201330322],[5.0353475901,43.820140913],[5.0353446575,43.8201507993],[5.03535366,43.82014084]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000029424","CODE_COM":"038","INSEE_COM":"13038","NOM_COM":"FONTVIEILLE","STATUT":"Commune simple","X_CHF_LIEU":837715.0,"Y_CHF_LIEU":6293478.0,"X_CENTROID":839609.0,"Y_CENTROID":6293526.0,"Z_MOYEN":50.0,"SUPERFICIE":"4030","POPULATION":"3636","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7333911877,43.754150917],[4.7346774677,43.7553338374],[4.735715151,43.7560976709],[4.7389596687,43.7582556069],[4.7501447317,43.7599189306],[4.7626236042,43.7611083482],[4.7691310695,43.7607049266],[4.7703215272,43.76020674],[4.7704020164,43.7595168662],[4.7707041937,43.7572023364],[4.7718079218,43.7518603969],[4.773897521,43.74800914],[4.7724794575,43.7425120512],[4.770779559,43.7379277252],[4.7676465869,43.7323495876],[4.7672561964,43.7310022218],[4.7668237714,43.7290965966],[4.766615158,43.728047804],[4.7658236523,43.7269328624],[4.7633729425,43.7246945227],[4.7626006045,43.7240373833],[4.7623445469,43.7238633164],[4.7579054016,43.721525627],[4.7570237522,43.7211852372],[4.7550189677,43.7206820419],[4.7537034308,43.7203963235],[4.7525627743,43.720106874],[4.7517365885,43.719630541],[4.751410473,43.7192334628],[4.7513194561,43.7182457646],[4.7514965257,43.7165697112],[4.7518812931,43.7154366497],[4.7532269155,43.7117643632],[4.7539569159,43.7099947983],[4.755460831,43.7071641896],[4.7574697632,43.7048258363],[4.7582034572,43.7043153575],[4.7585526422,43.7037678853],[4.7588710674,43.7025017698],[4.7588266259,43.6982668623],[4.7586283381,43.6958489435],[4.7568908922,43.6955403939],[4.7555309855,43.6952455273],[4.7463526645,43.6951997132],[4.739735706,43.695841235],[4.7169869072,43.6980791494],[4.708521994,43.70012766],[4.7052082488,43.7007448586],[4.7029601747,43.7011562767],[4.7003868284,43.701602432],[4.6975729725,43.7020135766],[4.6963070065,43.7021620222],[4.6927113824,43.70109927],[4.6915257521,43.7006910909],[4.690963343,43.6997097975],[4.6897323268,43.6973411408],[4.6888249127,43.6968152106],[4.6857937202,43.6954419702],[4.6844063095,43.6949576413],[4.6816802657,43.6950988094],[4.6766904041,43.6953243175],[4.6738943954,43.6954069665],[4.6702967828,43.6956503553],[4.6693983553,43.6957235442],[4.667003238,43.6978609176],[4.6673116655,43.6995500381],[4.6675275224,43.6999337413],[4.668480616,43.7012664708],[4.6689999164,43.702654449],[4.6690351498,43.7034378324],[4.6691256125,43.7060312268],[4.6678493682,43.7074935397],[4.6663972982,43.708501315],[4.6662628953,43.708572675],[4.6612169595,43.707847885],[4.6597001946,43.7073553098],[4.6540491552,43.7107597412],[4.6523332428,43.7118370374],[4.6518876604,43.712477421],[4.6572183493,43.7164294279],[4.6594144483,43.7182185385],[4.6654947237,43.7221344413],[4.6662160383,43.7225707222],[4.667343269,43.7232230919],[4.6682972829,43.7237223985],[4.6722528072,43.7257723055],[4.6733073907,43.7262700255],[4.6745623541,43.7267862547],[4.6755901408,43.7271727603],[4.6777557211,43.7278864453],[4.67951576,43.728482139],[4.6797690259,43.7286114383],[4.6828899777,43.7296900988],[4.6960609862,43.7324819828],[4.7065078417,43.7328317766],[4.7152223679,43.7348081751],[4.7186727778,43.7399624118],[4.720273842,43.7425113084],[4.7222034972,43.7448353761],[4.7247421484,43.7477105143],[4.7262391647,43.7493870245],[4.7282156691,43.7506562789],[4.7296150506,43.7514792305],[4.7309326161,43.7521000495],[4.7333911877,43.754150917]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000029443","CODE_COM":"097","INSEE_COM":"13097","NOM_COM":"SAINT-MARTIN-DE-CRAU","STATUT":"Commune simple","X_CHF_LIEU":846291.0,"Y_CHF_LIEU":6283987.0,"X_CENTROID":848239.0,"Y_CENTROID":6282220.0,"Z_MOYEN":35.0,"SUPERFICIE":"21512","POPULATION":"12737","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9286709458,43.5106525],[4.9173345146,43.508989633],[4.9155972964,43.5088061339],[4.8995427296,43.5037210855],[4.8829257794,43.4983996072],[4.881547794,43.4979600466],[4.8766469861,43.4946944405],[4.8763928404,43.494520648],[4.8620640146,43.5054221515],[4.8595606948,43.5074593977],[4.8590721581,43.5078754518],[4.8561529307,43.5103265267],[4.8489681273,43.516068558],[4.8341712802,43.5277861039],[4.8262582543,43.5339484181],[4.8258393366,43.5342731544],[4.8152176379,43.5424304222],[4.8145661821,43.5430739918],[4.8143325859,43.5433946851],[4.8090177601,43.5496850719],[4.8065446998,43.552528763],[4.8021191028,43.5567655868],[4.8002868429,43.5585167332],[4.7985131215,43.5600067871],[4.7938082023,43.5636989179],[4.7791911759,43.5755400954],[4.7788241079,43.5756388066],[4.7770030667,43.5752753318],[4.7755696843,43.5750377855],[4.7748911338,43.5752315734],[4.7707119431,43.5788790046],[4.7672442702,43.5819693131],[4.7660578983,43.5831648831],[4.7653649629,43.5843038221],[4.7620601663,43.5900975618],[4.7612002101,43.5916900775],[4.7606928353,43.5928700805],[4.7603140419,43.5940038989],[4.7614079029,43.5997874754],[4.7612625143,43.6054192657],[4.7609037776,43.6074509617],[4.7603951532,43.6085949943],[4.7594650065,43.6100095498],[4.7579127806,43.6116186628],[4.7553526858,43.6140135357],[4.7535486498,43.6155375551],[4.7517509021,43.6199882325],[4.7511758575,43.6226587954],[4.751244235,43.6271702961],[4.7553417171,43.6319516201],[4.7651833158,43.6394216289],[4.7651408703,43.6416255513],[4.7652728654,43.6493743514],[4.765397312,43.651443276],[4.7664154351,43.661555606],[4.768372337,43.6681246158],[4.7720828156,43.6748855807],[4.7775355413,43.682851067],[4.7774806794,43.6840409198],[4.7806554491,43.6831960632],[4.7812519283,43.6831142948],[4.7824939388,43.6834512688],[4.7856640767,43.6830977647],[4.7899410347,43.6822075361],[4.7921490842,43.6811532314],[4.7926279722,43.6809212297],[4.8043772095,43.6793427067],[4.8180982735,43.6795048657],[4.8196630073,43.6795336053],[4.8234706395,43.6798964696],[4.8252081565,43.6798205273],[4.8292094226,43.6797983197],[4.8320312561,43.6800073477],[4.8457230731,43.6803672325],[4.8581763315,43.6787817266],[4.8650858416,43.6780784358],[4.8668772641,43.6779468981],[4.8680961262,43.6779412736],[4.8701673678,43.6782522073],[4.8729304917,43.6789382194],[4.8765074709,43.678722661],[4.8779640322,43.6785526135],[4.8854734041,43.6762247446],[4.8868594887,43.6757623766],[4.8886401211,43.6751563304],[4.889916824,43.6746877214],[4.893149709,43.6733750062],[4.8957123858,43.672235889],[4.8969759109,43.6718223298],[4.8994123629,43.6710318515],[4.9013281762,43.6708084629],[4.90235841,43.6706905404],[4.9026685095,43.6706563138],[4.9082907103,43.6701383818],[4.9147820253,43.6701025991],[4.929055518,43.6713579966],[4.9294647635,43.6790563083],[4.9266473922,43.6862204946],[4.9264012345,43.6866829966],[4.9281261676,43.6869665685],[4.9304478541,43.6875851589],[4.9324367001,43.6776363288],[4.9340396175,43.6701236845],[4.9496194359,43.6648572785],[4.9590349298,43.6616251041],[4.9622813973,43.6605575815],[4.9652362358,43.6605699263],[4.9660412627,43.6628586806],[4.9655352042,43.6682755256],[4.9645873254,43.6721657192],[4.9644826236,43.6755501389],[4.9645072335,43.683068152],[4.9642965928,43.692479756],[4.964216841,43.6947845496],[4.9641959891,43.7000010136],[4.9642861204,43.7019418101],[4.9642140013,43.7046866317],[4.9637399125,43.7074693158],[4.9642615831,43.7113195666],[4.9643886313,43.7165064149],[4.9646814016,43.720373421],[4.9676681701,43.7200332344],[4.9801881675,43.7175207916],[4.979990829,43.7106654993],[4.9791807551,43.7070455797],[4.9792819765,43.7051994116],[4.9793781492,43.7034586501],[4.9794761192,43.7017700641],[4.9795848007,43.7006069477],[4.9805158703,43.6947393151],[4.9817575881,43.6873511659],[4.9819800036,43.6867170438],[4.9827851525,43.6838544575],[4.9828491192,43.6825490492],[4.9827141689,43.6809790389],[4.9811828861,43.677260742],[4.9805718726,43.6759802349],[4.9774607985,43.6700269344],[4.9752068123,43.6667627728],[4.972996136,43.66392083],[4.9687951649,43.6583174552],[4.9684088307,43.6578978119],[4.9611264152,43.6486515254],[4.9552057404,43.6408177696],[4.9542088438,43.639313687],[4.9541324695,43.6390000377],[4.9683627749,43.6296625394],[4.9708418288,43.6283881293],[4.9814838044,43.6223811229],[4.9850465156,43.6201811579],[4.9874622305,43.6186384017],[4.9884882628,43.6180732942],[4.9885950414,43.6180443384],[4.9833212553,43.6172595652],[4.9783795888,43.6163298841],[4.97679871,43.6158231222],[4.9730596761,43.6152754428],[4.9521099552,43.6124298601],[4.9516767516,43.6124403424],[4.9507579055,43.6142704372],[4.9490995193,43.6172334534],[4.9481630348,43.6186948254],[4.9448118317,43.6228221782],[4.9446246051,43.6227814261],[4.9438631876,43.6223954259],[4.9400535179,43.6202745853],[4.9358654551,43.619377223],[4.932356315,43.6186971428],[4.9208475282,43.6163018687],[4.9196501105,43.6158361075],[4.9183793076,43.6151016177],[4.9151802601,43.6127864512],[4.9128058836,43.6109004007],[4.9124822411,43.6105928859],[4.9105629553,43.609200099],[4.903425063,43.6045858254],[4.8976008326,43.6002631869],[4.896192528,43.5992086501],[4.8937701269,43.5973320605],[4.8921622795,43.5959677478],[4.8875280513,43.5919316939],[4.8854847446,43.5891384366],[4.8849390731,43.5879814908],[4.8847057133,43.5869082256],[4.8826667562,43.5783503042],[4.882877564,43.5772666423],[4.8837396425,43.574413976],[4.8875303294,43.5645588294],[4.888666901,43.5620496682],[4.8900058592,43.558510979],[4.8896946278,43.5526646378],[4.8862373873,43.5472069353],[4.8822398876,43.5435152943],[4.8801758104,43.5415765091],[4.8802938052,43.5414394675],[4.8906238098,43.5352607159],[4.8932100596,43.5336712581],[4.9032168814,43.527228738],[4.9048404957,43.5262462678],[4.9126099534,43.521214597],[4.9142927602,43.5201625418],[4.9168274863,43.5185509245],[4.9245176885,43.5134666936],[4.9288506506,43.5106646042],[4.9291591322,43.5103873255],[4.9286709458,43.5106525]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000029519","CODE_COM":"202","INSEE_COM":"13202","NOM_COM":"MARSEILLE-2E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":891993.0,"Y_CHF_LIEU":6247255.0,"X_CENTROID":891767.0,"Y_CENTROID":6249368.0,"Z_MOYEN":9.0,"SUPERFICIE":"327","POPULATION":"23995","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.362084,43.297085],[5.36236,43.297085],[5.36236,43.297359],[5.362638,43.297359],[5.362638,43.297638],[5.362715,43.297638],[5.362905,43.297592],[5.362916,43.298195],[5.362638001,43.298195],[5.362638001,43.298473],[5.362083999,43.298473],[5.362083999,43.298752],[5.362359999,43.298752],[5.362359999,43.299305001],[5.362638001,43.299305001],[5.362638001,43.299583],[5.362359999,43.299583],[5.362359999,43.299862],[5.362083999,43.299862],[5.362083999,43.30014],[5.361270999,43.30014],[5.3611414305,43.3001400001],[5.3629864899,43.3019530927],[5.3622421848,43.3051102627],[5.3636240763,43.3095819991],[5.363750001,43.309581999],[5.363750001,43.309989451],[5.3644147193,43.31214017],[5.363800115,43.3123903051],[5.361937002,43.3140239894],[5.361311746,43.3177455647],[5.3621409648,43.3209259875],[5.3620502254,43.3219602513],[5.360971999,43.3231679258],[5.360971999,43.323471],[5.3607014023,43.323471],[5.360694,43.3234792907],[5.360694,43.32375],[5.3604522969,43.32375],[5.360418,43.3237884126],[5.360418,43.324027999],[5.3602040822,43.3240279993],[5.3586745654,43.3257409805],[5.3580420049,43.3256467791],[5.3573785186,43.3250978559],[5.3562456505,43.3226259948],[5.3556316787,43.3222919799],[5.3553070598,43.3226389991],[5.355418,43.322638999],[5.355418,43.322918001],[5.355971001,43.322918001],[5.355971001,43.323193001],[5.356249,43.323193001],[5.356249,43.323536],[5.356249,43.32375],[5.356068,43.32375],[5.355971001,43.32375],[5.355971001,43.323864],[5.355971001,43.324027999],[5.355834,43.324027999],[5.35514,43.324027999],[5.35514,43.32375],[5.3543268353,43.3237500001],[5.3532882311,43.325006059],[5.34979945,43.3294774539],[5.3501569834,43.3315333518],[5.3525237391,43.3328228711],[5.351249,43.3344750629],[5.351249,43.334582999],[5.3511657192,43.3345829996],[5.3510717213,43.3347048257],[5.342917001,43.3350913315],[5.342917001,43.33514],[5.3427325906,43.3351400001],[5.342637999,43.3352447019],[5.342637999,43.335415],[5.3424841441,43.3354150001],[5.34236,43.3355524114],[5.34236,43.335693],[5.3422329843,43.3356930003],[5.341595123,43.3363990125],[5.3455143299,43.336267283],[5.3505089226,43.336050844],[5.3528609078,43.3351924074],[5.354987447,43.333736735],[5.3579686116,43.3300295154],[5.360377339,43.3272841995],[5.3630873925,43.3236556593],[5.3661670457,43.3192800788],[5.3684234028,43.3165064234],[5.3691311364,43.316722212],[5.3705681223,43.314529854],[5.3679976102,43.3137627075],[5.3745014031,43.3023001169],[5.3744386493,43.3019433057],[5.3739699832,43.3015144132],[5.3750228714,43.3015875793],[5.3749701971,43.3013259443],[5.3744240506,43.2952757329],[5.3736165356,43.2949946818],[5.3732726048,43.2957987081],[5.3726606751,43.2960488363],[5.3715560034,43.2959722863],[5.3693490568,43.2958173],[5.3663428825,43.2954619797],[5.3624706588,43.2964016639],[5.362084,43.2965783507],[5.362084,43.297085]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000029522","CODE_COM":"072","INSEE_COM":"13072","NOM_COM":"PEYNIER","STATUT":"Commune simple","X_CHF_LIEU":913878.0,"Y_CHF_LIEU":6264455.0,"X_CENTROID":912028.0,"Y_CENTROID":6263853.0,"Z_MOYEN":322.0,"SUPERFICIE":"2481","POPULATION":"3099","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6530708847,43.4638594129],[5.6532376934,43.463510558],[5.6519926958,43.4588915884],[5.6488269604,43.4496161803],[5.6484928451,43.448719674],[5.6483672645,43.4456171493],[5.6483828178,43.4419305725],[5.6486407512,43.436479155],[5.649159052,43.4310501946],[5.6497393032,43.4276387925],[5.6506385541,43.4254699069],[5.6506801216,43.4243616946],[5.6492102074,43.4184827403],[5.6474984474,43.4152309494],[5.6423867342,43.4080070174],[5.641788248,43.4072610013],[5.6397520139,43.4048856866],[5.639070183,43.4040975842],[5.6373638039,43.405979054],[5.6313043308,43.4085982801],[5.6295407415,43.4092361197],[5.6277849679,43.4098296335],[5.6270538024,43.4099868985],[5.6111515266,43.4117127784],[5.61046238,43.4118995212],[5.6106803334,43.4133560856],[5.6079154541,43.4215509543],[5.605815156,43.4278565959],[5.6051372549,43.4304509168],[5.6049181619,43.4311222937],[5.6045769734,43.4318524156],[5.6034111572,43.4330569343],[5.6010683142,43.4354671032],[5.5959289541,43.439362907],[5.5901102183,43.4414105023],[5.5874655971,43.4427069024],[5.5893361353,43.4463330132],[5.5897937206,43.4472213254],[5.5900232906,43.4506454143],[5.5900928895,43.4511208314],[5.5911731233,43.4525820562],[5.598974766,43.4560840455],[5.6040747473,43.4583569291],[5.611024207,43.4631955249],[5.6112530358,43.4635536794],[5.611488397,43.4641916289],[5.6170590436,43.4686589275],[5.6206266178,43.4700283046],[5.6248900465,43.4679285358],[5.6306256941,43.466894686],[5.6328891899,43.4667983104],[5.6366935502,43.4666950153],[5.6413674198,43.4679512777],[5.6418078148,43.4685247624],[5.6422190579,43.468759587],[5.6428733357,43.4689038665],[5.6458307583,43.4690864586],[5.6490730449,43.4684230338],[5.6514220344,43.4666687383],[5.6525529222,43.4651422541],[5.6524754775,43.4645887352],[5.6527266522,43.4641396958],[5.6530708847,43.4638594129]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000029556","CODE_COM":"023","INSEE_COM":"13023","NOM_COM":"CEYRESTE","STATUT":"Commune simple","X_CHF_LIEU":913796.0,"Y_CHF_LIEU":6238481.0,"X_CENTROID":914087.0,"Y_CENTROID":6239645.0,"Z_MOYEN":276.0,"SUPERFICIE":"2314","POPULATION":"4282","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6814275632,43.2308644778],[5.6804236151,43.2284927773],[5.6792492233,43.224485288],[5.6779885854,43.2197824217],[5.6783838234,43.216731767],[5.678382991,43.216727901],[5.6783826197,43.2167239116],[5.6769301294,43.2151627508],[5.6739768838,43.2120561906],[5.6696601182,43.2072615776],[5.6686234328,43.2065276089],[5.6677868436,43.2062359909],[5.664189412,43.2052790589],[5.6633648963,43.2051149114],[5.6614405989,43.2047933877],[5.6585094748,43.2045155417],[5.6566156417,43.2046143863],[5.6562255044,43.2046383912],[5.6536920496,43.2058113365],[5.650077776,43.2079125777],[5.64568617,43.207501937],[5.6415095792,43.2052813495],[5.6401596574,43.2034729847],[5.6386233528,43.2016223659],[5.63788624,43.2009986907],[5.6368054384,43.2012537086],[5.6328743314,43.2041027986],[5.6298348041,43.2066267175],[5.6293942698,43.2074897523],[5.623115306,43.2086181667],[5.6147728589,43.2098583297],[5.6080539126,43.2125346076],[5.6041768151,43.2163011159],[5.6035682324,43.2166676977],[5.6023981992,43.2170820154],[5.6013902202,43.2173790148],[5.5979748033,43.2183225793],[5.5960905208,43.2187819178],[5.5954531311,43.218892647],[5.5935532842,43.2188420179],[5.5928174937,43.218789497],[5.5924648568,43.218801568],[5.5913878458,43.2206328205],[5.5907940356,43.2215506707],[5.5898670549,43.2231074096],[5.5891844436,43.2242964811],[5.5882707413,43.2266178869],[5.5878681679,43.2287839354],[5.587811489,43.2293864938],[5.5890669755,43.2346286005],[5.5920979542,43.2364746799],[5.594329614,43.2363085745],[5.5999785888,43.2384416039],[5.6042439522,43.2387123063],[5.6121083078,43.2392693332],[5.6218825425,43.2399693321],[5.6348456351,43.2411027925],[5.6451987611,43.2392961869],[5.649405241,43.2379816031],[5.6522023826,43.2373441053],[5.6538948706,43.2369659022],[5.6554773148,43.2366578813],[5.6566878292,43.2364534934],[5.6602979755,43.235857875],[5.6682941411,43.2350251115],[5.6743025258,43.2349718411],[5.6816612796,43.235395023],[5.6824123258,43.2354510675],[5.6824148128,43.2354470112],[5.6814275632,43.2308644778]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000029867","CODE_COM":"087","INSEE_COM":"13087","NOM_COM":"ROUSSET","STATUT":"Commune simple","X_CHF_LIEU":912183.0,"Y_CHF_LIEU":6268313.0,"X_CENTROID":912025.0,"Y_CENTROID":6267845.0,"Z_MOYEN":250.0,"SUPERFICIE":"1954","POPULATION":"4646","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6530708847,43.4638594129],[5.6527266522,43.4641396958],[5.6524754775,43.4645887352],[5.6525529222,43.4651422541],[5.6514220344,43.4666687383],[5.6490730449,43.4684230338],[5.6458307583,43.4690864586],[5.6428733357,43.4689038665],[5.6422190579,43.468759587],[5.6418078148,43.4685247624],[5.6413674198,43.4679512777],[5.6366935502,43.4666950153],[5.6328891899,43.4667983104],[5.6306256941,43.466894686],[5.6248900465,43.4679285358],[5.6206266178,43.4700283046],[5.6170590436,43.4686589275],[5.611488397,43.4641916289],[5.6112530358,43.4635536794],[5.6078508108,43.4652163024],[5.6064376449,43.465939829],[5.6038563392,43.4672324108],[5.6020217137,43.4681217329],[5.5981802573,43.4699224133],[5.5968316557,43.4704660303],[5.5959535571,43.4705905856],[5.5951112289,43.4706314618],[5.5947852526,43.4705564512],[5.5948338455,43.469332861],[5.5947422887,43.4674960139],[5.5930250717,43.4659222196],[5.5883683588,43.4690805925],[5.5863193592,43.4705958757],[5.5854941615,43.4712375779],[5.5853691511,43.4722505447],[5.5852851621,43.4733237448],[5.5852741013,43.4735175443],[5.5851403122,43.4746378416],[5.5849554812,43.4755028091],[5.5848866712,43.475649377],[5.5847259162,43.4758953555],[5.5841348393,43.476055276],[5.5837166615,43.4760193364],[5.5836559936,43.4763196379],[5.5925614611,43.4811569615],[5.5978381738,43.4818263868],[5.6010909718,43.4826251571],[5.6045032282,43.4863950976],[5.6048633993,43.4903319451],[5.6026475559,43.4972346729],[5.6014884509,43.5005022669],[5.6007601497,43.5021157735],[5.602303781,43.5023677014],[5.6135368977,43.5039546484],[5.6180090401,43.5050449361],[5.6210075996,43.5062264821],[5.6239961016,43.5074829094],[5.6251564206,43.5081371817],[5.6274482989,43.5096264297],[5.6282393704,43.5103724361],[5.6291651918,43.509332763],[5.6323505349,43.5076162178],[5.6394427011,43.5026979458],[5.6506405255,43.4939223529],[5.6539819812,43.4910931877],[5.654311754,43.49071063],[5.654724652,43.4902540195],[5.6560827618,43.4880980771],[5.6580241035,43.4814196184],[5.6579037928,43.4707444559],[5.6531359173,43.46390283],[5.6530708847,43.4638594129]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000030004","CODE_COM":"117","INSEE_COM":"30117","NOM_COM":"FOURQUES","STATUT":"Commune simple","X_CHF_LIEU":829853.0,"Y_CHF_LIEU":6289556.0,"X_CENTROID":824163.0,"Y_CENTROID":6291679.0,"Z_MOYEN":2.0,"SUPERFICIE":"3836","POPULATION":"2875","CODE_ARR":"2","CODE_DEPT":"30","NOM_DEPT":"GARD","CODE_REG":"76","NOM_REG":"LANGUEDOC-ROUSSILLON-MIDI-PYRENEES"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.524687766,43.702552795],[4.5291071164,43.7040653885],[4.5280271019,43.7032347187],[4.5270119872,43.7026171707],[4.5260092193,43.7023225384],[4.5243901803,43.7021310306],[4.5159563283,43.7022920401],[4.5111901575,43.7022794141],[4.524687766,43.702552795]]],[[[4.559585571,43.699394227],[4.5682427531,43.6983006156],[4.5677468758,43.6983146646],[4.563356799,43.6985848234],[4.5605842965,43.6989927189],[4.5581119984,43.6994934454],[4.55559986,43.7002187846],[4.5527787964,43.7013111733],[4.5507127047,43.7023423329],[4.5497125062,43.7028590365],[4.559585571,43.699394227]]],[[[4.598219872,43.686695099],[4.608984349,43.6868637991],[4.6080813606,43.6866236103],[4.605829921,43.686077263],[4.6040747084,43.6858889553],[4.6019080944,43.685934378],[4.5973466832,43.6865153447],[4.5946273251,43.687021436],[4.5930346527,43.6874596678],[4.5912127084,43.6883962295],[4.5891453423,43.6896981454],[4.5868015269,43.6915458545],[4.5851256984,43.6933783841],[4.5848468507,43.6937640944],[4.598219872,43.686695099]]],[[[4.626822949,43.688133239],[4.626948358,43.691677093],[4.6188967119,43.7038131368],[4.6196564892,43.7030346042],[4.6214375085,43.7012215522],[4.6232570286,43.6991513932],[4.624127017,43.6978090916],[4.6254218161,43.6957017279],[4.6264207095,43.6934421718],[4.6276618121,43.6905426785],[4.6279719345,43.6884491167],[4.6274533995,43.6869610604],[4.6246661533,43.6858525091],[4.6238690667,43.6864782137],[4.6225871781,43.6871650731],[4.626822949,43.688133239]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000030015","CODE_COM":"008","INSEE_COM":"13008","NOM_COM":"AURONS","STATUT":"Commune simple","X_CHF_LIEU":874057.0,"Y_CHF_LIEU":6287481.0,"X_CENTROID":873020.0,"Y_CENTROID":6288532.0,"Z_MOYEN":243.0,"SUPERFICIE":"1255","POPULATION":"531","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1501250849,43.6901424124],[5.1497409052,43.6889293986],[5.1502945493,43.6833879354],[5.1508795651,43.6806012142],[5.1544007112,43.6772351928],[5.1560631368,43.6763921204],[5.1648680669,43.6740136624],[5.1720591714,43.6722311167],[5.1758230214,43.6712530324],[5.1778036568,43.669365383],[5.1808435039,43.6653366134],[5.1810676095,43.6649369543],[5.1813089344,43.6644685383],[5.1813307604,43.6640972401],[5.181302886,43.6620292641],[5.181323288,43.6617183048],[5.1823699407,43.6612670343],[5.1817186919,43.6604447687],[5.1811788218,43.6589649614],[5.1811287842,43.6576175511],[5.180601238,43.6577640538],[5.1670935233,43.6540275987],[5.1640427588,43.6527525634],[5.1587395347,43.6517049208],[5.1543349961,43.6509470644],[5.1512312107,43.6511867484],[5.1445600392,43.652232174],[5.1433572068,43.6525214309],[5.1409625962,43.6531644957],[5.1392195558,43.6539279079],[5.1398868681,43.6545016594],[5.1419216867,43.6570674662],[5.1436179426,43.659360877],[5.1438062112,43.6596542089],[5.1439601874,43.6615828577],[5.143227075,43.6631320373],[5.1427408686,43.6638905304],[5.1417573186,43.6653096153],[5.1414385962,43.6656732456],[5.1382569041,43.6663398425],[5.135796824,43.6669732727],[5.1333793868,43.6680207716],[5.1310314862,43.6698400684],[5.1300672368,43.6707212869],[5.1221326399,43.6784735356],[5.1176810528,43.6834633407],[5.1164373277,43.6845470085],[5.115788649,43.685085308],[5.117644796,43.6871132116],[5.1208828571,43.688702792],[5.1260413301,43.6905581179],[5.1267066808,43.6906702338],[5.1354460904,43.6928673342],[5.1448711892,43.6913254028],[5.147909869,43.6901510647],[5.1501250849,43.6901424124]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000030145","CODE_COM":"104","INSEE_COM":"13104","NOM_COM":"SAUSSET-LES-PINS","STATUT":"Commune simple","X_CHF_LIEU":871524.0,"Y_CHF_LIEU":6250421.0,"X_CENTROID":871979.0,"Y_CENTROID":6252312.0,"Z_MOYEN":77.0,"SUPERFICIE":"1229","POPULATION":"7655","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.134860993,43.329303742],[5.134860993,43.329223633],[5.134860993,43.3292021051],[5.13414406,43.329158167],[5.127637862,43.3286023073],[5.127637862,43.328750611],[5.127081871,43.328750611],[5.127081871,43.329029084],[5.126529218,43.329029084],[5.126529218,43.328750611],[5.12625122,43.328750611],[5.12625122,43.3285262985],[5.1250339942,43.3284721452],[5.12375021,43.328472138],[5.12375021,43.328750611],[5.122916221,43.328750611],[5.122916221,43.328472138],[5.122362137,43.328472138],[5.122362137,43.3283532283],[5.1201193162,43.3282533553],[5.119584083,43.3282646663],[5.119584083,43.328472138],[5.118750096,43.328472138],[5.118750096,43.328750611],[5.115139962,43.328750611],[5.115139962,43.329029084],[5.111526965,43.329029084],[5.111526965,43.3289923125],[5.11041689,43.3291786144],[5.11041689,43.329303742],[5.109860897,43.329303742],[5.109860897,43.3292629065],[5.10736084,43.3292124675],[5.10736084,43.329303742],[5.107082844,43.329303742],[5.107082844,43.329582215],[5.104582787,43.329582215],[5.104582787,43.329860688],[5.103473187,43.329860688],[5.103473187,43.329582215],[5.102639198,43.329582215],[5.102639198,43.329303742],[5.099860191,43.329303742],[5.099860191,43.329029084],[5.0994885464,43.3290290843],[5.095694065,43.3292240219],[5.095694065,43.329303742],[5.09541607,43.329303742],[5.09541607,43.329582215],[5.09525013,43.32958603],[5.095138072,43.329589843],[5.095138072,43.329956055],[5.095138072,43.330139161],[5.094860076,43.330139161],[5.094860076,43.330696107],[5.094583988,43.330696107],[5.094583988,43.330970765],[5.094305993,43.330970765],[5.094305993,43.331249238],[5.094027995,43.331249238],[5.094027995,43.331527711],[5.093749999,43.331527711],[5.093749999,43.331249238],[5.093194008,43.331249238],[5.093194008,43.331527711],[5.092916013,43.331527711],[5.092916013,43.331806184],[5.092639922,43.331806184],[5.092639922,43.332084655],[5.092490196,43.332084655],[5.092083931,43.332084655],[5.092083931,43.332359315],[5.091669082,43.332359315],[5.090693951,43.332359315],[5.090693951,43.332637788],[5.089305878,43.332637788],[5.089305878,43.332916259],[5.08885479,43.332916259],[5.08847189,43.332916259],[5.08847189,43.333194732],[5.0883542939,43.3331947321],[5.088228284,43.3339718444],[5.0885136736,43.3344648807],[5.088818818,43.3348225492],[5.0931768332,43.339470907],[5.0961580781,43.3422163946],[5.0985902875,43.3439294634],[5.1017525418,43.347905091],[5.104375288,43.3545531138],[5.1039520316,43.3579567611],[5.1030349625,43.3616534913],[5.1029845013,43.3623321179],[5.1035393277,43.3624275243],[5.1089035779,43.3623617999],[5.1156032851,43.3631597388],[5.1295059667,43.3659737971],[5.1314946021,43.3662460209],[5.1358160679,43.3633304963],[5.1363481113,43.362843025],[5.1365863063,43.3624477482],[5.137312365,43.3592116309],[5.1397416046,43.3501669708],[5.1389864236,43.3456039643],[5.1379788962,43.3451361224],[5.1375069903,43.3448799703],[5.1367728925,43.3444031145],[5.1353465443,43.3429473048],[5.1347833006,43.3415230435],[5.1347646446,43.341119346],[5.1345995301,43.3325688597],[5.1345473337,43.3311264229],[5.1346799543,43.3299476146],[5.1351331402,43.3293006002],[5.134860993,43.329303742]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000030250","CODE_COM":"028","INSEE_COM":"13028","NOM_COM":"LA CIOTAT","STATUT":"Commune simple","X_CHF_LIEU":912164.0,"Y_CHF_LIEU":6234263.0,"X_CENTROID":912949.0,"Y_CENTROID":6236126.0,"Z_MOYEN":96.0,"SUPERFICIE":"3224","POPULATION":"34655","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.67701542,43.202029476],[5.6761858091,43.1931154779],[5.6761325705,43.1928342604],[5.6759146096,43.1909973546],[5.6759551102,43.1906414628],[5.672322115,43.180514247],[5.6718758447,43.1792702387],[5.6718543193,43.1792750399],[5.670959949,43.179584504],[5.6704686726,43.1795846539],[5.668195,43.1805236562],[5.668195,43.180695],[5.667917,43.180695],[5.667917,43.180973],[5.667639,43.180973],[5.667639,43.181252],[5.667361,43.181252],[5.667361,43.181526],[5.667083,43.181526],[5.667083,43.181805],[5.665973,43.181805],[5.665973,43.181526],[5.6657677453,43.1815260005],[5.6645486121,43.1820294129],[5.6575685783,43.1842599011],[5.6559669136,43.185455842],[5.6525593242,43.1873144778],[5.651527,43.1875604563],[5.651527,43.187637],[5.6512057494,43.1876370003],[5.650971,43.1876929331],[5.650971,43.187916],[5.6500347454,43.1879160044],[5.649027,43.1881560981],[5.649027,43.188194],[5.6488679077,43.1881940005],[5.6487645796,43.1882186174],[5.6424988513,43.1890994798],[5.6383239998,43.1891737665],[5.6334138199,43.1884162562],[5.6241633171,43.1869821132],[5.6232989901,43.1868060014],[5.623193,43.186806],[5.623193,43.1867844048],[5.6231689437,43.186779503],[5.6216583662,43.1861511399],[5.6203037204,43.1854170007],[5.620139,43.185417],[5.620139,43.1853277294],[5.6197907673,43.1851390008],[5.619305,43.185139],[5.619305,43.1848757298],[5.6192759769,43.18486],[5.619027,43.18486],[5.619027,43.1847250603],[5.6187630422,43.184582],[5.618751,43.184582],[5.618751,43.1845754733],[5.6181077216,43.1842268224],[5.6172174636,43.1837147399],[5.6131891098,43.1803853023],[5.6119676831,43.1789110332],[5.6115582117,43.1782045709],[5.610230927,43.175202002],[5.609838957,43.1736842419],[5.6109777566,43.1710485733],[5.6134887769,43.1706727617],[5.6137310795,43.1706200912],[5.6146613731,43.1694680818],[5.6146454833,43.1691984771],[5.6118031254,43.1667582541],[5.6097402472,43.1651380001],[5.609582,43.165138],[5.609582,43.165417],[5.60924,43.165417],[5.60875,43.165417],[5.60875,43.165695],[5.608206,43.165695],[5.608194,43.165974],[5.607084,43.165974],[5.607084,43.16486],[5.607354,43.16486],[5.607638,43.16486],[5.607638,43.164585],[5.608194,43.164585],[5.608194,43.163979],[5.608194,43.1639234414],[5.6074004071,43.1633000557],[5.6041007615,43.1623475416],[5.6008948126,43.1625455132],[5.600416,43.1627414696],[5.600416,43.163193],[5.60014,43.163193],[5.60014,43.163471],[5.600416,43.163471],[5.600416,43.16375],[5.60014,43.16375],[5.60014,43.164017],[5.60014,43.164307],[5.599584,43.164307],[5.599584,43.164215],[5.599584,43.163471],[5.599862,43.163471],[5.599862,43.163193],[5.5993126639,43.1631930021],[5.598196,43.1636499705],[5.598196,43.16375],[5.5979515568,43.1637500007],[5.5940245444,43.1653568758],[5.588195,43.1674765915],[5.588195,43.167641],[5.587917,43.167641],[5.587903,43.167915],[5.587361,43.167915],[5.587361,43.168194],[5.587083,43.168194],[5.587083,43.167915],[5.5869891483,43.1679150002],[5.5857400764,43.1683691014],[5.585139,43.1685821945],[5.585139,43.168751],[5.5846628367,43.1687510002],[5.584582,43.1687796575],[5.584582,43.169029],[5.584029,43.169029],[5.584029,43.169304],[5.583751,43.169304],[5.583751,43.169582],[5.583472,43.169582],[5.583472,43.169861],[5.582916,43.169861],[5.582916,43.169582],[5.582638,43.169582],[5.582638,43.169468795],[5.5813320142,43.1699317312],[5.580972,43.1700635852],[5.580972,43.170418],[5.580138,43.170418],[5.580138,43.1703690279],[5.57625,43.1717928355],[5.57625,43.171806],[5.5762140489,43.171806],[5.575972,43.1718946327],[5.575972,43.172085],[5.5754521141,43.1720850001],[5.575416,43.1720982239],[5.575416,43.172359],[5.57514,43.172359],[5.57514,43.1721992855],[5.5733025165,43.1728720817],[5.5714983888,43.1735558805],[5.5698785585,43.1744584455],[5.569861,43.1744707253],[5.569861,43.174583],[5.569700462,43.1745830001],[5.569583,43.1746651485],[5.569583,43.174862],[5.569305,43.174862],[5.569305,43.17514],[5.5690353349,43.17514],[5.569027,43.17514887],[5.569027,43.175865],[5.569027,43.175972],[5.569305,43.175972],[5.569305,43.17625],[5.569027,43.17625],[5.569027,43.176807],[5.568473,43.176807],[5.568473,43.177361],[5.568195,43.177361],[5.568195,43.177639],[5.567639,43.177639],[5.567639,43.177917],[5.567083,43.177917],[5.567083,43.178196],[5.566805,43.178196],[5.566805,43.178471],[5.566249,43.178471],[5.566249,43.178749],[5.565973,43.178749],[5.565973,43.179028],[5.56562,43.179028],[5.565417,43.179028],[5.565417,43.179214],[5.565417,43.179306],[5.56532,43.179306],[5.565139,43.179306],[5.565139,43.179474],[5.565139,43.179585],[5.56502,43.179585],[5.5648580576,43.1795850002],[5.564583,43.1798776572],[5.564583,43.179989],[5.564583,43.180416],[5.564125,43.180416],[5.5640702758,43.180416],[5.564027,43.180452887],[5.564027,43.180508],[5.564027,43.180973],[5.563749,43.180973],[5.563749,43.181252],[5.563225,43.181252],[5.5630894632,43.1812520001],[5.562917,43.1813989966],[5.562917,43.181538],[5.562917,43.181805],[5.562629,43.181805],[5.5624414127,43.1818050003],[5.562083,43.1821212367],[5.562083,43.182312],[5.562029,43.182362],[5.5618101227,43.182362],[5.561805,43.1823665198],[5.561805,43.182571],[5.561805,43.183472],[5.561251,43.183472],[5.561251,43.18375],[5.560973,43.18375],[5.560973,43.184029],[5.560234,43.184029],[5.560139,43.184029],[5.560139,43.184116],[5.560139,43.184307],[5.559934,43.184307],[5.559861,43.184376],[5.559861,43.184582],[5.559638,43.184582],[5.559583,43.184631],[5.559583,43.185417],[5.559307,43.185417],[5.559307,43.185696],[5.559029,43.185696],[5.559029,43.186249],[5.558473,43.186249],[5.558473,43.186527],[5.558195,43.186527],[5.558195,43.186249],[5.557843,43.186249],[5.557638,43.186249],[5.557638,43.18644],[5.557638,43.186527],[5.557543,43.186527],[5.5571373918,43.1865270001],[5.557082,43.1865872101],[5.557082,43.186954],[5.557082,43.187084],[5.556943,43.187084],[5.556807,43.187084],[5.556807,43.18721],[5.556807,43.187363],[5.556643,43.187363],[5.556529,43.187363],[5.556529,43.187469],[5.556529,43.187637],[5.556347,43.187637],[5.55625,43.187637],[5.55625,43.187729],[5.55625,43.188194],[5.555972,43.188194],[5.555972,43.188473],[5.5556860448,43.1884730001],[5.5559919528,43.1886792222],[5.5568961414,43.1894614582],[5.5580045868,43.1906060286],[5.5586611818,43.1913509248],[5.5591865295,43.191964837],[5.5606530106,43.1939972547],[5.5620650477,43.1961587464],[5.5623465228,43.1970133297],[5.5626886499,43.1978484732],[5.5635354931,43.1986914249],[5.5653733497,43.2004917804],[5.5667200254,43.2012859269],[5.5726037057,43.2039834237],[5.5741634808,43.20450331],[5.5748312398,43.204634974],[5.5761842326,43.2047106775],[5.5823544833,43.208625703],[5.5916255852,43.2180612298],[5.5924648568,43.218801568],[5.5928174937,43.218789497],[5.5935532842,43.2188420179],[5.5954531311,43.218892647],[5.5960905208,43.2187819178],[5.5979748033,43.2183225793],[5.6013902202,43.2173790148],[5.6023981992,43.2170820154],[5.6035682324,43.2166676977],[5.6041768151,43.2163011159],[5.6080539126,43.2125346076],[5.6147728589,43.2098583297],[5.623115306,43.2086181667],[5.6293942698,43.2074897523],[5.6298348041,43.2066267175],[5.6328743314,43.2041027986],[5.6368054384,43.2012537086],[5.63788624,43.2009986907],[5.6386233528,43.2016223659],[5.6401596574,43.2034729847],[5.6415095792,43.2052813495],[5.64568617,43.207501937],[5.650077776,43.2079125777],[5.6536920496,43.2058113365],[5.6562255044,43.2046383912],[5.6566156417,43.2046143863],[5.6585094748,43.2045155417],[5.6614405989,43.2047933877],[5.6633648963,43.2051149114],[5.664189412,43.2052790589],[5.6677868436,43.2062359909],[5.6686234328,43.2065276089],[5.6696601182,43.2072615776],[5.6739768838,43.2120561906],[5.6769301294,43.2151627508],[5.6783826197,43.2167239116],[5.67701542,43.202029476]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000030531","CODE_COM":"258","INSEE_COM":"30258","NOM_COM":"SAINT-GILLES","STATUT":"Commune simple","X_CHF_LIEU":815435.0,"Y_CHF_LIEU":6287559.0,"X_CENTROID":813706.0,"Y_CENTROID":6287159.0,"Z_MOYEN":25.0,"SUPERFICIE":"15220","POPULATION":"13641","CODE_ARR":"2","CODE_DEPT":"30","NOM_DEPT":"GARD","CODE_REG":"76","NOM_REG":"LANGUEDOC-ROUSSILLON-MIDI-PYRENEES"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.353650094,43.547393799],[4.372169972,43.549457551],[4.3868962063,43.5593380298],[4.3859254465,43.5570064419],[4.3848812471,43.5556267606],[4.3841271787,43.5547832967],[4.3825742558,43.5535459622],[4.3816554206,43.5529997395],[4.3806768784,43.5525424563],[4.3794380894,43.552066875],[4.3687323715,43.5480269994],[4.3672515519,43.547665918],[4.3651362956,43.5471571208],[4.3636746794,43.5470297147],[4.3619444568,43.5469479532],[4.3594119351,43.5469958968],[4.356923496,43.5471818092],[4.3536462416,43.5473899776],[4.353650094,43.547393799]]],[[[4.389386654,43.561008454],[4.3894919226,43.5610100679],[4.3893382649,43.5609759993],[4.389386654,43.561008454]]],[[[4.408153533,43.561294556],[4.414553643,43.569942475],[4.4093607422,43.5727398209],[4.4120450555,43.5729604905],[4.4138938228,43.5728950401],[4.4144297087,43.572843067],[4.4153195296,43.5725381088],[4.4160361365,43.5719852324],[4.4165883371,43.5713409075],[4.4167763636,43.5700831074],[4.4167554217,43.5691843908],[4.4164633571,43.5679310561],[4.4157987589,43.5666762808],[4.4149581151,43.5656586676],[4.4138689883,43.5646001906],[4.4106828183,43.5620004719],[4.4093533628,43.5611268529],[4.4064011063,43.5598261112],[4.4055746137,43.5595272552],[4.4038328651,43.5592456308],[4.4020451112,43.5593596203],[4.4006531173,43.5595665622],[4.396705155,43.5607629699],[4.3952343823,43.5610979511],[4.408153533,43.561294556]]],[[[4.448892594,43.583438873],[4.460868358,43.589458465],[4.4618769683,43.5905584596],[4.4617753203,43.5904085704],[4.4606813332,43.5892606012],[4.4581419737,43.5875038981],[4.4554851372,43.5858926995],[4.452269018,43.5842376246],[4.4502525333,43.5835581424],[4.4488888726,43.5834332573],[4.447018021,43.5830280441],[4.4445447015,43.5830312709],[4.4433120956,43.5831448473],[4.4397727752,43.5839578972],[4.448892594,43.583438873]]],[[[4.474191665,43.603984833],[4.473624228,43.610813141],[4.466132165,43.615215302],[4.4590517282,43.6132826839],[4.4607599802,43.614335784],[4.462215891,43.6148912567],[4.4638988525,43.6152177702],[4.4643976033,43.6152983434],[4.4668068635,43.615205555],[4.4678487913,43.6149242074],[4.4696132001,43.6141255217],[4.4710757465,43.6131977047],[4.4725176148,43.6120451662],[4.4732320195,43.611311941],[4.4742492134,43.6100238482],[4.4747160008,43.6092957728],[4.4752352404,43.6082961057],[4.4753260075,43.6073949476],[4.4752917547,43.6064963874],[4.4747364906,43.6048894612],[4.4741415574,43.6038581232],[4.4738117133,43.6035706951],[4.474191665,43.603984833]]],[[[4.4373268831,43.6421193021],[4.4363593973,43.6393218092],[4.4357290286,43.637356576],[4.4343018585,43.6335533951],[4.4336410607,43.6323975995],[4.4323388569,43.6306608002],[4.4318250938,43.6301312103],[4.428455879,43.6277232332],[4.42781577,43.6271421909],[4.4275613382,43.62683792],[4.4373268831,43.6421193021]]],[[[4.477648259,43.672801971],[4.4770175041,43.6802646467],[4.4780969777,43.6780310767],[4.4784371776,43.6768465947],[4.4785019407,43.6752716705],[4.4784009255,43.6742398811],[4.4779293615,43.6732149277],[4.4774684111,43.6725048169],[4.4767641975,43.6718808043],[4.4754954502,43.6710961538],[4.4734904243,43.6704618604],[4.4704891362,43.6697024102],[4.4684327692,43.6693828063],[4.4667798791,43.6692786662],[4.477648259,43.672801971]]],[[[4.476469994,43.686740876],[4.4764703052,43.6867412548],[4.4764700179,43.6867405935],[4.476469994,43.686740876]]],[[[4.486351537,43.69876846],[4.4863488233,43.6987648085],[4.4863483435,43.6987645739],[4.486351537,43.69876846]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000030664","CODE_COM":"110","INSEE_COM":"13110","NOM_COM":"TRETS","STATUT":"Commune simple","X_CHF_LIEU":917463.0,"Y_CHF_LIEU":6264556.0,"X_CENTROID":919384.0,"Y_CENTROID":6262385.0,"Z_MOYEN":386.0,"SUPERFICIE":"7015","POPULATION":"10719","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.710261346,43.478996277],[5.7145914556,43.4759540245],[5.7142304481,43.4748190297],[5.7249014508,43.4687084534],[5.72721386,43.467082978],[5.7355356852,43.4558805248],[5.7373667994,43.4528236831],[5.7445096264,43.4434131237],[5.748126118,43.4389225316],[5.751574039,43.434276581],[5.7661118767,43.4260403498],[5.7681439508,43.4245896985],[5.770391658,43.4233043405],[5.774740261,43.4211270313],[5.7771662906,43.420420292],[5.7794911702,43.4198961347],[5.7808356254,43.419682475],[5.7833587361,43.4198363994],[5.7862628575,43.4204620739],[5.7865129181,43.4204997495],[5.7878099906,43.4204145353],[5.7878623,43.420410156],[5.788349153,43.420265197],[5.7863221615,43.4143691919],[5.7856380257,43.4137554093],[5.7804052993,43.4109057443],[5.7783311255,43.409899482],[5.7500127012,43.401517179],[5.7499918755,43.4015140198],[5.7499352426,43.4015275104],[5.7484566092,43.4019032216],[5.740073254,43.4045209819],[5.7321039241,43.4070745617],[5.7244316233,43.4088747218],[5.7211967176,43.4084843861],[5.7171018497,43.4083339101],[5.7037208447,43.4080009294],[5.7012799529,43.4080694816],[5.6981458173,43.4075850317],[5.6964739844,43.4071090895],[5.6892201585,43.4020064768],[5.684464436,43.3998888359],[5.6827879612,43.3991661361],[5.6813736928,43.4012721519],[5.6811050853,43.4015218466],[5.6803406111,43.4017541141],[5.6792956821,43.4019024022],[5.6775787627,43.4016973402],[5.6712893525,43.4002468525],[5.6704121632,43.4000191536],[5.6690692771,43.4004771428],[5.6668828112,43.4007137605],[5.6654022865,43.4008663433],[5.6641482581,43.400764891],[5.6566198362,43.4004629285],[5.648468311,43.4002729062],[5.6441757719,43.4005641699],[5.6436557149,43.4007181934],[5.6393658752,43.4038959454],[5.639070183,43.4040975842],[5.6397520139,43.4048856866],[5.641788248,43.4072610013],[5.6423867342,43.4080070174],[5.6474984474,43.4152309494],[5.6492102074,43.4184827403],[5.6506801216,43.4243616946],[5.6506385541,43.4254699069],[5.6497393032,43.4276387925],[5.649159052,43.4310501946],[5.6486407512,43.436479155],[5.6483828178,43.4419305725],[5.6483672645,43.4456171493],[5.6484928451,43.448719674],[5.6488269604,43.4496161803],[5.6519926958,43.4588915884],[5.6532376934,43.463510558],[5.6530708847,43.4638594129],[5.6531359173,43.46390283],[5.6579037928,43.4707444559],[5.6580241035,43.4814196184],[5.6560827618,43.4880980771],[5.654724652,43.4902540195],[5.654311754,43.49071063],[5.657997072,43.4911271554],[5.6714620368,43.4876418701],[5.6730482906,43.4869501185],[5.6796767721,43.4849410449],[5.6852802556,43.4836006039],[5.6864437467,43.4833917339],[5.6883469978,43.483166308],[5.6924287254,43.4830758062],[5.697961359,43.4824215228],[5.6988051887,43.4821727629],[5.6988255765,43.4821714539],[5.710261346,43.478996277]]],[[[5.6827924944,43.3991594602],[5.6827924547,43.3991594444],[5.6827907744,43.3991619467],[5.6827924944,43.3991594602]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000030827","CODE_COM":"031","INSEE_COM":"13031","NOM_COM":"LA DESTROUSSE","STATUT":"Commune simple","X_CHF_LIEU":911311.0,"Y_CHF_LIEU":6256502.0,"X_CENTROID":910760.0,"Y_CENTROID":6256225.0,"Z_MOYEN":224.0,"SUPERFICIE":"299","POPULATION":"3101","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5951810103,43.3914110428],[5.5965608303,43.3911898264],[5.600374715,43.3881836912],[5.6035152692,43.3854159468],[5.6044354385,43.3837132947],[5.6051928925,43.3818795359],[5.6057087173,43.3796159377],[5.6064682918,43.3776948116],[5.6066697515,43.3772930105],[5.607849984,43.3765966924],[5.6083094176,43.3764965084],[5.6083980265,43.3763278522],[5.6072832354,43.3709207691],[5.6081222927,43.3686061791],[5.6093545102,43.3664747258],[5.6095881876,43.3662134604],[5.6075987894,43.3662002192],[5.6062885784,43.3667187447],[5.6029707223,43.3682135782],[5.6008019285,43.3682180277],[5.5971639248,43.3682001045],[5.5954869761,43.3681674372],[5.5892605051,43.3672437074],[5.587573269,43.3666243022],[5.5871536452,43.3703832391],[5.5881444582,43.372168742],[5.5909548147,43.3762734556],[5.5931810463,43.3815379538],[5.59391604,43.3836905012],[5.593527095,43.3854667382],[5.5929681682,43.3864837539],[5.5943531354,43.3901311243],[5.5951810103,43.3914110428]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000030916","CODE_COM":"214","INSEE_COM":"13214","NOM_COM":"MARSEILLE-14E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":893047.0,"Y_CHF_LIEU":6252491.0,"X_CENTROID":894137.0,"Y_CENTROID":6252471.0,"Z_MOYEN":141.0,"SUPERFICIE":"1637","POPULATION":"61186","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3715768681,43.3200849312],[5.371420397,43.3215247419],[5.3686342033,43.3270649438],[5.3673375028,43.3312710989],[5.3674751319,43.3361514538],[5.3697861797,43.3379008308],[5.3733597728,43.3395243649],[5.375528768,43.3400338455],[5.3773432898,43.3410064772],[5.3778705578,43.342428591],[5.3782749001,43.344516711],[5.3782646799,43.3466589499],[5.3778160211,43.3503993464],[5.376371601,43.3519782039],[5.3769965399,43.354450303],[5.3783395495,43.3563288115],[5.3800182398,43.3584483278],[5.3806910521,43.3590590352],[5.3864034466,43.3637662847],[5.3891691391,43.3654611917],[5.3923369829,43.3666764296],[5.3926028321,43.3665724485],[5.3947977933,43.3666093916],[5.3951917929,43.3667095735],[5.3980100154,43.3679377898],[5.3984059086,43.3681423218],[5.3982895796,43.3686372159],[5.3979100409,43.3691514437],[5.3960700465,43.3708878585],[5.3955949951,43.3713015899],[5.3945695705,43.372157714],[5.394181556,43.3722617029],[5.3927198742,43.3723588355],[5.39219731,43.3722830863],[5.3916295889,43.3720706283],[5.391721736,43.3723286999],[5.3920851775,43.3728210825],[5.3923801932,43.3731511715],[5.3943938329,43.3741623702],[5.3945444824,43.374195038],[5.3955684695,43.3742821781],[5.3984910744,43.3742453403],[5.4017634299,43.3744886722],[5.40347611,43.3748466613],[5.4147780721,43.3784670192],[5.4153866211,43.378766653],[5.4147469088,43.3777827836],[5.413547214,43.375978866],[5.4135288333,43.3708598647],[5.4139054277,43.3683358672],[5.4139056803,43.3660461775],[5.413820604,43.3637808963],[5.41355022,43.3628040952],[5.4126077008,43.3600638289],[5.4147381053,43.355888775],[5.4160607474,43.3528108587],[5.4136568012,43.3475390976],[5.4106926141,43.3415399909],[5.4088829598,43.3367166465],[5.4072708492,43.3333388104],[5.4061004676,43.3311166418],[5.4015223603,43.3263151984],[5.3969000168,43.3207279806],[5.3935634697,43.3184790159],[5.3936400283,43.3164640391],[5.3931841692,43.3164093319],[5.3927073758,43.3162956868],[5.3879397835,43.3149566178],[5.3822410265,43.3167581213],[5.3785004532,43.3192443466],[5.3769559452,43.3205886967],[5.3760939461,43.3209982392],[5.3755437064,43.3211363287],[5.3715768681,43.3200849312]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000031111","CODE_COM":"026","INSEE_COM":"84026","NOM_COM":"CADENET","STATUT":"Commune simple","X_CHF_LIEU":891209.0,"Y_CHF_LIEU":6295756.0,"X_CENTROID":892527.0,"Y_CENTROID":6295598.0,"Z_MOYEN":214.0,"SUPERFICIE":"2584","POPULATION":"4132","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.370534897,43.709190368],[5.3705412965,43.7091878209],[5.370534661,43.7091892343],[5.3668464565,43.7102723764],[5.3546082677,43.7145799046],[5.3478676555,43.7170904408],[5.3440094367,43.7185905687],[5.3436965564,43.7187701511],[5.3436990223,43.7187728726],[5.370534897,43.709190368]]],[[[5.388125896,43.702186585],[5.388129437,43.7021852501],[5.3881280263,43.7021823974],[5.3873199645,43.7023846786],[5.3785960586,43.7059814115],[5.388125896,43.702186585]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000031319","CODE_COM":"060","INSEE_COM":"13060","NOM_COM":"MEYREUIL","STATUT":"Commune simple","X_CHF_LIEU":901940.0,"Y_CHF_LIEU":6268419.0,"X_CENTROID":902449.0,"Y_CENTROID":6268904.0,"Z_MOYEN":234.0,"SUPERFICIE":"2016","POPULATION":"5291","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4691492221,43.4890096286],[5.4690384389,43.4897403597],[5.4653555942,43.4970936573],[5.4637929415,43.4998394897],[5.4637503041,43.5009215253],[5.4638065996,43.5022344502],[5.4644583758,43.5033610183],[5.468958961,43.5099062151],[5.4733433172,43.5112285528],[5.4788415388,43.5123335353],[5.4795040648,43.512553331],[5.4807794293,43.5126438877],[5.4816760315,43.5122408112],[5.4881265989,43.509083807],[5.5007054066,43.5079987556],[5.512860159,43.5071525034],[5.5197525622,43.506196837],[5.5286771325,43.5051681573],[5.5302793148,43.5054080376],[5.5315746232,43.5055875462],[5.5316897445,43.5054777389],[5.5319415892,43.5052432169],[5.5320134091,43.5052172355],[5.5325086409,43.50508955],[5.5353739714,43.5045833164],[5.5369328353,43.5044019325],[5.5361984902,43.5014656623],[5.5356499738,43.4990399434],[5.5337372247,43.4898184042],[5.5329294246,43.4837207259],[5.5326975628,43.4829196063],[5.5320697841,43.4828964651],[5.5295675969,43.4826695332],[5.5285550762,43.481375335],[5.5269194089,43.479430448],[5.5262627705,43.4786653252],[5.5231985847,43.476246892],[5.5224704289,43.4757372554],[5.5208080182,43.4748370804],[5.5161237079,43.473374275],[5.5132037118,43.4725130771],[5.5124876686,43.4723622522],[5.5057537693,43.4693208612],[5.5003009954,43.4658831735],[5.4966066929,43.4634830891],[5.4961443102,43.4632507062],[5.4961121296,43.4633918671],[5.4891979343,43.4665591195],[5.4846035716,43.4690867826],[5.4821250758,43.470534267],[5.4816044137,43.4724733605],[5.4820332529,43.4734743844],[5.4825753617,43.4782713624],[5.4826642794,43.4805304577],[5.4825739926,43.4808727756],[5.4813640474,43.4824532079],[5.4772123012,43.4867400822],[5.4719039314,43.4881808425],[5.4693383422,43.4888937048],[5.4691492221,43.4890096286]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000031435","CODE_COM":"016","INSEE_COM":"13016","NOM_COM":"LA BOUILLADISSE","STATUT":"Commune simple","X_CHF_LIEU":910330.0,"Y_CHF_LIEU":6258577.0,"X_CENTROID":912579.0,"Y_CENTROID":6258701.0,"Z_MOYEN":307.0,"SUPERFICIE":"1274","POPULATION":"6046","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.639070183,43.4040975842],[5.6393658752,43.4038959454],[5.6436557149,43.4007181934],[5.6441757719,43.4005641699],[5.648468311,43.4002729062],[5.6566198362,43.4004629285],[5.6641482581,43.400764891],[5.6654022865,43.4008663433],[5.6668828112,43.4007137605],[5.6690692771,43.4004771428],[5.6704121632,43.4000191536],[5.6697219006,43.3994564833],[5.6652306093,43.3984653769],[5.6595487311,43.3936912448],[5.6533172621,43.3876035305],[5.651533734,43.3868785261],[5.6488681504,43.3867511704],[5.6447410189,43.3867791921],[5.6385129674,43.3870428216],[5.6368540478,43.3876863375],[5.6335022839,43.3891784458],[5.6291255224,43.3914730608],[5.628695304,43.3916743372],[5.6275165499,43.3921341195],[5.62668417,43.3923946566],[5.6251759085,43.3927480926],[5.6248090635,43.3927425872],[5.6224734087,43.3920854017],[5.6213915272,43.3916921505],[5.6201815637,43.3910607563],[5.6193709102,43.3904970973],[5.6187719687,43.3895133541],[5.6185003797,43.3879384107],[5.6185665815,43.3870060837],[5.6189621688,43.3865590532],[5.6173040779,43.383234519],[5.6100604218,43.3775038173],[5.6090307634,43.3767572527],[5.6083094176,43.3764965084],[5.607849984,43.3765966924],[5.6066697515,43.3772930105],[5.6064682918,43.3776948116],[5.6057087173,43.3796159377],[5.6051928925,43.3818795359],[5.6044354385,43.3837132947],[5.6035152692,43.3854159468],[5.600374715,43.3881836912],[5.5965608303,43.3911898264],[5.5951810103,43.3914110428],[5.5947055686,43.3915151531],[5.5905270626,43.3921904128],[5.585425113,43.3965735356],[5.5821928915,43.4026409568],[5.5819917432,43.403770902],[5.5819252299,43.4041595393],[5.5817840228,43.4050297213],[5.5817396879,43.4053899261],[5.5862401732,43.4055651482],[5.5885731656,43.4056669131],[5.5936188299,43.4062131462],[5.6016393379,43.4078641689],[5.6084714339,43.4105522973],[5.61046238,43.4118995212],[5.6111515266,43.4117127784],[5.6270538024,43.4099868985],[5.6277849679,43.4098296335],[5.6295407415,43.4092361197],[5.6313043308,43.4085982801],[5.6373638039,43.405979054],[5.639070183,43.4040975842]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000031759","CODE_COM":"076","INSEE_COM":"84076","NOM_COM":"MIRABEAU","STATUT":"Commune simple","X_CHF_LIEU":914100.0,"Y_CHF_LIEU":6293061.0,"X_CENTROID":913184.0,"Y_CENTROID":6293417.0,"Z_MOYEN":368.0,"SUPERFICIE":"3152","POPULATION":"1212","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.623852252,43.666149139],[5.6398130049,43.6714546835],[5.6374544383,43.6703157128],[5.6275457062,43.6669093575],[5.6238507967,43.6661450942],[5.623849142,43.666147767],[5.623852252,43.666149139]]],[[[5.657154083,43.685443878],[5.67311287,43.693508148],[5.6738802656,43.6934542061],[5.6703914989,43.6918282756],[5.6617688277,43.6874137122],[5.6518102803,43.679732313],[5.6477480084,43.6757960631],[5.6442819355,43.6736125039],[5.642072542,43.6725457425],[5.657154083,43.685443878]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000031957","CODE_COM":"105","INSEE_COM":"83105","NOM_COM":"RIBOUX","STATUT":"Commune simple","X_CHF_LIEU":923743.0,"Y_CHF_LIEU":6248811.0,"X_CENTROID":923581.0,"Y_CENTROID":6249536.0,"Z_MOYEN":641.0,"SUPERFICIE":"1354","POPULATION":"36","CODE_ARR":"2","CODE_DEPT":"83","NOM_DEPT":"VAR","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7330599764,43.307758139],[5.7289585063,43.3135153816],[5.7265973172,43.3173590442],[5.7266035508,43.3173601316],[5.7330599764,43.307758139]]],[[[5.751394749,43.288238525],[5.7623353329,43.282592999],[5.7594143058,43.2833084495],[5.7580191185,43.2836843141],[5.7560077074,43.284881474],[5.7498397694,43.2892709179],[5.7491790443,43.2899628095],[5.7474681498,43.2919652616],[5.751394749,43.288238525]]],[[[5.762794018,43.282356262],[5.7627938966,43.2823552849],[5.7627617557,43.2823729134],[5.762794018,43.282356262]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000032228","CODE_COM":"040","INSEE_COM":"13040","NOM_COM":"FUVEAU","STATUT":"Commune simple","X_CHF_LIEU":907395.0,"Y_CHF_LIEU":6264830.0,"X_CENTROID":906697.0,"Y_CENTROID":6265699.0,"Z_MOYEN":263.0,"SUPERFICIE":"3010","POPULATION":"9519","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5326975628,43.4829196063],[5.53454331,43.4829214754],[5.5378906237,43.4826055215],[5.5464634424,43.4815664342],[5.5553071001,43.4804806715],[5.5630775302,43.4807545025],[5.5688751395,43.4802824038],[5.5713577983,43.4798220669],[5.5760821921,43.4785756852],[5.5764936527,43.4784614866],[5.5766359317,43.4782987753],[5.5833082995,43.4760092661],[5.5837166615,43.4760193364],[5.5841348393,43.476055276],[5.5847259162,43.4758953555],[5.5848866712,43.475649377],[5.5849554812,43.4755028091],[5.5851403122,43.4746378416],[5.5852741013,43.4735175443],[5.5852851621,43.4733237448],[5.5853691511,43.4722505447],[5.5854941615,43.4712375779],[5.5863193592,43.4705958757],[5.5883683588,43.4690805925],[5.5930250717,43.4659222196],[5.5947422887,43.4674960139],[5.5948338455,43.469332861],[5.5947852526,43.4705564512],[5.5951112289,43.4706314618],[5.5959535571,43.4705905856],[5.5968316557,43.4704660303],[5.5981802573,43.4699224133],[5.6020217137,43.4681217329],[5.6038563392,43.4672324108],[5.6064376449,43.465939829],[5.6078508108,43.4652163024],[5.6112530358,43.4635536794],[5.611024207,43.4631955249],[5.6040747473,43.4583569291],[5.598974766,43.4560840455],[5.5911731233,43.4525820562],[5.5900928895,43.4511208314],[5.5900232906,43.4506454143],[5.5897937206,43.4472213254],[5.5893361353,43.4463330132],[5.5874655971,43.4427069024],[5.5838908405,43.440433848],[5.5795757752,43.4385590777],[5.5696564621,43.4354895384],[5.568004556,43.4350372411],[5.5643171712,43.4340327387],[5.5595500615,43.4341310904],[5.5587187501,43.4339914085],[5.5583309886,43.4343543188],[5.5529128305,43.4400449579],[5.5494823979,43.4408530534],[5.5445950247,43.4400048281],[5.5434810008,43.4397861558],[5.5402941225,43.4393424629],[5.5391585009,43.4392214671],[5.5380341723,43.4392163111],[5.537346993,43.4392360098],[5.5329849391,43.4393975037],[5.5297610124,43.4401029267],[5.5294763799,43.4401473784],[5.5292095961,43.4405415607],[5.5282759706,43.4416435027],[5.5258380796,43.4444709534],[5.5226713639,43.4466861347],[5.5201462394,43.4482670132],[5.508458481,43.4556240215],[5.4970258476,43.462720026],[5.4963173339,43.4629379774],[5.4961443102,43.4632507062],[5.4966066929,43.4634830891],[5.5003009954,43.4658831735],[5.5057537693,43.4693208612],[5.5124876686,43.4723622522],[5.5132037118,43.4725130771],[5.5161237079,43.473374275],[5.5208080182,43.4748370804],[5.5224704289,43.4757372554],[5.5231985847,43.476246892],[5.5262627705,43.4786653252],[5.5269194089,43.479430448],[5.5285550762,43.481375335],[5.5295675969,43.4826695332],[5.5320697841,43.4828964651],[5.5326975628,43.4829196063]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000032232","CODE_COM":"079","INSEE_COM":"13079","NOM_COM":"PUYLOUBIER","STATUT":"Commune simple","X_CHF_LIEU":916465.0,"Y_CHF_LIEU":6273224.0,"X_CENTROID":916173.0,"Y_CENTROID":6271096.0,"Z_MOYEN":373.0,"SUPERFICIE":"4094","POPULATION":"1873","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.706691741,43.556232453],[5.716864108,43.551200867],[5.7250591555,43.5512732171],[5.7250711407,43.551267674],[5.7246167567,43.5509000697],[5.7228183963,43.5481624789],[5.7203611839,43.5440279736],[5.7178587079,43.538171472],[5.7174687938,43.5343254384],[5.7175547025,43.5324380954],[5.7160003816,43.5176331139],[5.7153898449,43.5159007818],[5.7128740369,43.5121350142],[5.7137705054,43.5082532624],[5.7148308852,43.5064886604],[5.714278222,43.501220703],[5.703217506,43.49534607],[5.698802949,43.482177735],[5.6988068624,43.4821766487],[5.6988051887,43.4821727629],[5.697961359,43.4824215228],[5.6924287254,43.4830758062],[5.6883469978,43.483166308],[5.6864437467,43.4833917339],[5.6852802556,43.4836006039],[5.6796767721,43.4849410449],[5.6730482906,43.4869501185],[5.6714620368,43.4876418701],[5.657997072,43.4911271554],[5.654311754,43.49071063],[5.6539819812,43.4910931877],[5.6506405255,43.4939223529],[5.6394427011,43.5026979458],[5.6323505349,43.5076162178],[5.6291651918,43.509332763],[5.6282393704,43.5103724361],[5.6287176527,43.5106885193],[5.6299127704,43.5111546586],[5.6319918401,43.5122591895],[5.6340955853,43.5135224214],[5.636582517,43.5159096686],[5.6378603733,43.5194128386],[5.6380302315,43.5203908429],[5.63780665,43.5210714424],[5.6374829285,43.5217535763],[5.6367842812,43.5224880343],[5.6362494008,43.5228287138],[5.6355536166,43.5231408924],[5.6349547843,43.5233552884],[5.6342085179,43.5235111464],[5.6314646343,43.5240530579],[5.6279647882,43.5242432273],[5.6269031354,43.5241852218],[5.6261658273,43.5242129766],[5.6256448213,43.5242363912],[5.6248389568,43.5243612188],[5.623246337,43.5248669546],[5.6220499783,43.5258420027],[5.6199216488,43.5278135803],[5.6187254448,43.5311552518],[5.6185373887,43.5316711135],[5.6187476526,43.5322934889],[5.6199312675,43.533638644],[5.6220024369,43.5349632433],[5.6233017754,43.5355340818],[5.6287482237,43.5364411146],[5.6451133306,43.5390258391],[5.6483937293,43.5393176148],[5.6540431506,43.53916337],[5.6614639536,43.5388609669],[5.6635406889,43.5385993509],[5.6654500788,43.538678495],[5.66892148,43.5396959548],[5.6806222406,43.5433568905],[5.6856838525,43.5451267554],[5.6898904639,43.5473173037],[5.6905888246,43.5482218503],[5.6912378254,43.5489970808],[5.6924520347,43.5500265629],[5.6929916508,43.5503687746],[5.693793127,43.550857528],[5.7038789167,43.5555464441],[5.7060394138,43.5562119088],[5.7066868152,43.556234788],[5.706691741,43.556232453]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000032477","CODE_COM":"077","INSEE_COM":"13077","NOM_COM":"PORT-DE-BOUC","STATUT":"Commune simple","X_CHF_LIEU":861147.0,"Y_CHF_LIEU":6258229.0,"X_CENTROID":861203.0,"Y_CENTROID":6260277.0,"Z_MOYEN":25.0,"SUPERFICIE":"1179","POPULATION":"17208","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.99597311,43.4034729],[4.995505333,43.403484345],[4.991806985,43.4034729],[4.991806985,43.403751373],[4.990706921,43.403751373],[4.9901127382,43.4037513752],[4.9866509493,43.4044532625],[4.9846977913,43.4036863508],[4.9831679598,43.4025948805],[4.9829208752,43.40097046],[4.982917786,43.40097046],[4.982917786,43.40095015],[4.9828367433,43.4004173271],[4.98263979,43.400417327],[4.98263979,43.400138856],[4.982852829,43.4001388561],[4.982917786,43.3999274507],[4.982917786,43.39958191],[4.9830239568,43.3995819101],[4.983193874,43.3990288938],[4.983193874,43.398750306],[4.9832794703,43.398750306],[4.983300919,43.3986804974],[4.9843701946,43.3976565964],[4.9846756881,43.397604201],[4.9852458225,43.3966011394],[4.9851869636,43.3965263371],[4.98513794,43.396526337],[4.98513794,43.3964640339],[4.9849708481,43.3962516791],[4.984859944,43.396251679],[4.984859944,43.3961107315],[4.9847517334,43.3959732064],[4.984027863,43.395973206],[4.984027863,43.3958171457],[4.9834870514,43.3958801462],[4.9828807266,43.3961198317],[4.9821008696,43.3965885697],[4.9807245117,43.3974758789],[4.978470802,43.3992010952],[4.978470802,43.399307252],[4.9783321192,43.3993072521],[4.978192807,43.3994138903],[4.978192807,43.399860383],[4.977918149,43.399860383],[4.97789526,43.400417327],[4.977639198,43.400417327],[4.977639198,43.400543213],[4.977639198,43.4006958],[4.977481841,43.4006958],[4.977324009,43.4006958],[4.9767106741,43.4006958037],[4.9758866077,43.4022546448],[4.9765676042,43.4041509429],[4.9766820315,43.4043045044],[4.97680521,43.404304504],[4.97680521,43.4044698091],[4.9770942276,43.4048576644],[4.9774330871,43.405523717],[4.9775826305,43.4061041346],[4.9776893394,43.4070902993],[4.9776421775,43.4074061333],[4.9757571032,43.4109232454],[4.9754675797,43.411335293],[4.973896217,43.4122728699],[4.9730528873,43.4142833711],[4.9725947686,43.4164407394],[4.9731561601,43.4170837402],[4.973473073,43.41708374],[4.973473073,43.4174467151],[4.9738322377,43.4178580764],[4.9730488082,43.4209339089],[4.9722177805,43.4218669729],[4.973860323,43.422384209],[4.9745539637,43.4229529213],[4.9750777691,43.4235013286],[4.9778230695,43.4298047725],[4.980090316,43.4349389027],[4.9811926627,43.44478754],[4.981205659,43.4450572867],[4.9808248838,43.445298235],[4.9828011102,43.4453691825],[4.9847950667,43.4450230927],[4.9876050077,43.4444145143],[4.9974079467,43.4421625536],[5.0059654752,43.4400596551],[5.0148035142,43.4380138528],[5.0178244137,43.4365366031],[5.0207191551,43.4334057092],[5.021424457,43.4328831779],[5.0228269754,43.4309419012],[5.0203636388,43.4305612967],[5.0140298145,43.431294809],[5.0100922279,43.4313418481],[5.0082107826,43.4296578469],[5.0067166283,43.428206028],[5.0050539079,43.425139216],[5.0042592084,43.4226358904],[5.0039833573,43.4202102599],[5.0039978407,43.4184281158],[5.0041821392,43.4169137122],[5.0053667827,43.4143476656],[5.0059725633,43.4089539477],[5.0047270825,43.4034613489],[5.0042931747,43.4034063869],[4.9975363428,43.4034286607],[4.99597311,43.4034671799],[4.99597311,43.4034729]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000032891","CODE_COM":"034","INSEE_COM":"84034","NOM_COM":"CAUMONT-SUR-DURANCE","STATUT":"Commune simple","X_CHF_LIEU":856381.0,"Y_CHF_LIEU":6312556.0,"X_CENTROID":857073.0,"Y_CENTROID":6311577.0,"Z_MOYEN":60.0,"SUPERFICIE":"1824","POPULATION":"4691","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.930503367,43.884368897],[4.9305338375,43.8843575222],[4.9304982868,43.8843636558],[4.9304847826,43.8843741222],[4.930503367,43.884368897]]],[[[4.9549399247,43.8752424092],[4.9486898908,43.8772150717],[4.9458230474,43.8780682989],[4.9438121855,43.8788801024],[4.93599121,43.8821346969],[4.9319883629,43.8838145233],[4.9549399247,43.8752424092]]],[[[4.9914914098,43.8507268503],[4.9914935206,43.8507154706],[4.9907756318,43.8513182029],[4.9904791279,43.851608704],[4.9914914098,43.8507268503]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000033006","CODE_COM":"093","INSEE_COM":"84093","NOM_COM":"PUGET","STATUT":"Commune simple","X_CHF_LIEU":882751.0,"Y_CHF_LIEU":6297747.0,"X_CENTROID":881700.0,"Y_CENTROID":6299775.0,"Z_MOYEN":289.0,"SUPERFICIE":"1961","POPULATION":"712","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2372689542,43.7474382869],[5.2363786823,43.7474662521],[5.2363784158,43.7474708314],[5.2372689542,43.7474382869]]],[[[5.264102937,43.744232178],[5.2863871956,43.7401394919],[5.2863884463,43.7401351069],[5.2817585075,43.7405752189],[5.2752691891,43.74128266],[5.2721938485,43.7420400516],[5.2647796255,43.7440759797],[5.2641052004,43.7442286391],[5.264085184,43.7442349581],[5.264102937,43.744232178]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000033725","CODE_COM":"216","INSEE_COM":"13216","NOM_COM":"MARSEILLE-16E-ARRONDISSEMENT","STATUT":"Commune simple","X_CHF_LIEU":891876.0,"Y_CHF_LIEU":6251113.0,"X_CENTROID":887738.0,"Y_CENTROID":6254330.0,"Z_MOYEN":104.0,"SUPERFICIE":"1428","POPULATION":"16883","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.329862,43.345417001],[5.3300266134,43.3454170011],[5.33014,43.3453834666],[5.33014,43.345138999],[5.3309665765,43.345138999],[5.330972001,43.3451373946],[5.330972001,43.34486],[5.3319098712,43.3448600008],[5.3319121945,43.3448593136],[5.332083999,43.3447761457],[5.332083999,43.344582],[5.332485052,43.3445820003],[5.332638,43.3445079591],[5.332638,43.344307],[5.3330531182,43.3443070008],[5.333472001,43.3441042171],[5.333472001,43.344028001],[5.3336294352,43.3440280015],[5.3342004412,43.3437515676],[5.335138,43.3432105399],[5.335138,43.343193],[5.3351683947,43.3431930001],[5.335971999,43.3427292573],[5.335971999,43.342640001],[5.3361266655,43.3426400011],[5.336250001,43.3425688252],[5.336250001,43.342360999],[5.3366101245,43.3423609993],[5.336806,43.3422479592],[5.336806,43.341805],[5.337916,43.341805],[5.337916,43.341526001],[5.338471999,43.341526001],[5.338471999,43.341251001],[5.339859999,43.341251001],[5.339859999,43.340972999],[5.340138001,43.340972999],[5.340138001,43.340694],[5.340694,43.340694],[5.340693976,43.340450285],[5.341249942,43.340415955],[5.341249942,43.340694428],[5.341440678,43.340694428],[5.341804028,43.340694428],[5.341804,43.340813],[5.341804,43.341805],[5.34125,43.341805],[5.34125,43.342083],[5.340694,43.342083],[5.340694,43.342361],[5.340138,43.342361],[5.340138,43.3425454295],[5.3410208878,43.3447831499],[5.3319223811,43.3500160451],[5.327918,43.3511744303],[5.327918,43.35125],[5.3276567402,43.3512500007],[5.3274449354,43.3513112654],[5.327083,43.3514156822],[5.327083,43.351528],[5.326693669,43.3515280008],[5.326249,43.3516562817],[5.326249,43.351807],[5.325971,43.351807],[5.325971,43.352085],[5.325695,43.352085],[5.325695,43.35236],[5.325417,43.35236],[5.325417,43.352966],[5.325417,43.353474],[5.325695,43.353474],[5.325695,43.354027],[5.325971,43.354027],[5.325971,43.354584],[5.326249,43.354584],[5.326249,43.3547836553],[5.3265372948,43.3547939653],[5.3267305628,43.3549680076],[5.3265886637,43.355790955],[5.324861,43.3565173401],[5.324861,43.356529],[5.3248332667,43.3565290001],[5.324305,43.3567510971],[5.324305,43.356804],[5.3241791663,43.3568040003],[5.3238634729,43.3569367233],[5.323749,43.3568663612],[5.323749,43.357082],[5.323195,43.357082],[5.323195,43.356804],[5.322917,43.356804],[5.322917,43.3563549537],[5.3222888578,43.3559688419],[5.3222506884,43.3555421642],[5.3220024862,43.3555042921],[5.320973,43.3559539925],[5.320973,43.355972],[5.321251,43.355972],[5.321251,43.356251],[5.320973,43.356251],[5.320973,43.356529],[5.320695,43.356529],[5.320695,43.356804],[5.319277412,43.3568040016],[5.319029,43.3570765843],[5.319029,43.357082],[5.3190240645,43.357082],[5.3173317282,43.3589389195],[5.315973,43.3594154168],[5.315973,43.359585],[5.315695,43.359585],[5.315695,43.359859],[5.315138,43.359859],[5.315138,43.360138],[5.314582,43.360138],[5.314582,43.360416],[5.31375,43.360416],[5.31375,43.360695],[5.3119597761,43.3606950082],[5.3110302222,43.3608799974],[5.310972,43.3608736901],[5.310972,43.360973],[5.309028,43.360973],[5.309028,43.361252],[5.30764,43.361252],[5.30764,43.361526],[5.305972,43.361526],[5.305972,43.361252],[5.304306,43.361252],[5.304306,43.360973],[5.303472,43.360973],[5.303472,43.360695],[5.301527,43.360695],[5.301527,43.360416],[5.299861,43.360416],[5.299861,43.360138],[5.297083,43.360138],[5.297083,43.359859],[5.293749,43.359859],[5.293749,43.359585],[5.293473,43.359585],[5.293473,43.359306],[5.293195,43.359306],[5.293195,43.359028],[5.292917,43.359028],[5.292917,43.358749],[5.292361,43.358749],[5.292361,43.358471],[5.292083,43.358471],[5.292083,43.358196],[5.291251,43.358196],[5.291251,43.3579567761],[5.2910722153,43.3579180001],[5.290973,43.357918],[5.290973,43.3578964814],[5.2891396861,43.3574988376],[5.2885149097,43.357326659],[5.2880609354,43.3568898695],[5.2878371684,43.3561314163],[5.2873071831,43.3554262371],[5.2869280778,43.3551410003],[5.285972,43.355141],[5.285972,43.354862],[5.284028,43.354862],[5.284028,43.354584],[5.283472,43.354584],[5.283472,43.354038],[5.283472,43.3539363823],[5.2830971311,43.3538241061],[5.2822491901,43.3536521027],[5.2822802425,43.3538755424],[5.2817710611,43.3567446205],[5.279723982,43.3608979943],[5.2780521632,43.3642856485],[5.2788367594,43.3675918763],[5.2826249697,43.3715700836],[5.283977027,43.3750830276],[5.2808062272,43.378042484],[5.2789955808,43.379897719],[5.2787911926,43.3804699203],[5.280931752,43.3802457289],[5.2810995417,43.3802763924],[5.2897269162,43.3850550159],[5.2948814924,43.3878456655],[5.2969987954,43.3889815642],[5.2975666776,43.388893911],[5.2979569545,43.3887470249],[5.3022277638,43.386979555],[5.3031140729,43.38593739],[5.3040291319,43.3848127053],[5.311469822,43.3790263059],[5.31831174,43.3744924246],[5.3245941273,43.3713435324],[5.3252089847,43.3716606242],[5.3269489743,43.3723126265],[5.3271640792,43.372353901],[5.3312344469,43.3717811838],[5.3322755103,43.3714410477],[5.3330605576,43.3699283117],[5.3335138244,43.369697136],[5.3395649423,43.3668700471],[5.3429191403,43.3654438574],[5.3452896579,43.363433184],[5.3470927555,43.3609118657],[5.3492094747,43.3568600018],[5.3511253192,43.3539977712],[5.3518754717,43.3511950595],[5.3487984435,43.3501981166],[5.3464554552,43.3492652685],[5.3459981176,43.3488764895],[5.345235814,43.3474791254],[5.3452214724,43.3466118405],[5.3455143537,43.3460816926],[5.347007124,43.3440081233],[5.3481008921,43.3420709966],[5.3434025451,43.3398824197],[5.3408762374,43.3400091282],[5.3395486917,43.3399595546],[5.3380513573,43.3397975369],[5.3375478729,43.339514124],[5.3282922131,43.3447510002],[5.3292898068,43.3456349103],[5.329862,43.3454656858],[5.329862,43.345417001]]],[[[5.320695,43.354862],[5.3209973273,43.3548620004],[5.321251,43.354756497],[5.321251,43.354584],[5.321805,43.354584],[5.321805,43.354305],[5.322995,43.354305],[5.323195,43.354305],[5.323195,43.354195],[5.323195,43.354027],[5.323499,43.354027],[5.323749,43.354027],[5.323749,43.353889],[5.323749,43.353748],[5.324003,43.353748],[5.324027,43.353474],[5.324305,43.353474],[5.324305,43.353195],[5.324583,43.353195],[5.324583,43.35236],[5.324305,43.35236],[5.324305,43.3522170708],[5.3225063203,43.3527358985],[5.3218793942,43.3527565565],[5.3173099513,43.3550865155],[5.3166323632,43.3543081354],[5.3170887273,43.3540634639],[5.3211934372,43.3518631865],[5.3208606307,43.3515310308],[5.3166040617,43.3538497462],[5.3159405732,43.3532987586],[5.318521124,43.3518385964],[5.3198383269,43.3509710011],[5.3191011519,43.3509710003],[5.3185187611,43.3513202529],[5.316804,43.3523281231],[5.316804,43.35236],[5.3167497638,43.3523600001],[5.316529,43.3524897517],[5.316529,43.352638],[5.3162767628,43.3526380004],[5.315973,43.3528165306],[5.315973,43.352917],[5.3158020529,43.3529170003],[5.3157091232,43.3529716171],[5.315416,43.3531542005],[5.315416,43.353195],[5.3153504989,43.3531950001],[5.3140147467,43.354027],[5.314028,43.354027],[5.314028,43.354305],[5.314304,43.354305],[5.314307,43.354584],[5.314582,43.354584],[5.314582,43.354862],[5.315416,43.354862],[5.315416,43.355141],[5.315695,43.355141],[5.315695,43.3555682059],[5.317917,43.3560080606],[5.317917,43.355972],[5.3183282923,43.3559720019],[5.320695,43.354987738],[5.320695,43.354862]]],[[[5.320139,43.350693],[5.320139,43.3507729525],[5.3202603801,43.3506930007],[5.320139,43.350693]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000033780","CODE_COM":"094","INSEE_COM":"13094","NOM_COM":"SAINT-ETIENNE-DU-GRES","STATUT":"Commune simple","X_CHF_LIEU":838908.0,"Y_CHF_LIEU":6299462.0,"X_CENTROID":839500.0,"Y_CENTROID":6300631.0,"Z_MOYEN":49.0,"SUPERFICIE":"2923","POPULATION":"2379","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7728549781,43.7823735306],[4.7728613423,43.7816569481],[4.7720682548,43.7780325536],[4.7716677471,43.7761713672],[4.7712699597,43.7737151754],[4.7707404686,43.7700928078],[4.7704536263,43.7674061977],[4.7702854405,43.7621713153],[4.7703215272,43.76020674],[4.7691310695,43.7607049266],[4.7626236042,43.7611083482],[4.7501447317,43.7599189306],[4.7389596687,43.7582556069],[4.735715151,43.7560976709],[4.7346774677,43.7553338374],[4.7333911877,43.754150917],[4.7329163996,43.7543411869],[4.7310003424,43.7547496854],[4.7263346653,43.7555167901],[4.7173470995,43.7570566761],[4.7125241435,43.757849966],[4.7070298656,43.7588308769],[4.7065633051,43.7589263943],[4.7071109241,43.7650445975],[4.7057580479,43.7699891938],[4.7054178102,43.7710755111],[4.7052235398,43.7716419995],[4.7042060436,43.773260956],[4.7033262641,43.7738750648],[4.7022177695,43.77460975],[4.7013469557,43.7749419784],[4.7011040403,43.7781770514],[4.701732405,43.7815524408],[4.7053977787,43.7861125653],[4.7085524961,43.7896553957],[4.7119435288,43.7960153224],[4.7119740992,43.8009383522],[4.7122928143,43.8033230994],[4.713026699,43.808778763],[4.7133644539,43.8134134745],[4.7155711587,43.8157865499],[4.7188278933,43.817354547],[4.7288602954,43.8178260094],[4.7306559993,43.8185455125],[4.7317189855,43.8195340579],[4.7320308482,43.8198567446],[4.7323917049,43.8193757538],[4.73322147,43.818493061],[4.73446283,43.8180250668],[4.7418669408,43.8168449042],[4.749515695,43.8173723241],[4.7501612896,43.8174672765],[4.7511748624,43.8175221114],[4.7524832179,43.8166495826],[4.7541950405,43.8132898363],[4.7556652182,43.8104461216],[4.7573542747,43.8075304534],[4.7581077944,43.8063283591],[4.7591226942,43.8050185299],[4.7600086872,43.8039637033],[4.7641765806,43.799032147],[4.7645058859,43.7984678505],[4.7646220299,43.7982850489],[4.7658151811,43.7974853337],[4.767335847,43.7964678702],[4.7675471047,43.7962268165],[4.7647093048,43.7953546926],[4.7615516824,43.7940610172],[4.7553360232,43.7911819661],[4.7548065182,43.79089256],[4.7544905451,43.7904755005],[4.7544606285,43.7899863282],[4.7548130198,43.7891606646],[4.7554641305,43.7878666382],[4.756653119,43.7859230702],[4.7580731131,43.7832115819],[4.7590544087,43.7812263364],[4.7612441892,43.7810505499],[4.7653786797,43.7814138915],[4.7668879321,43.7816090535],[4.7693868985,43.7819906507],[4.7728549781,43.7823735306]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000034053","CODE_COM":"017","INSEE_COM":"13017","NOM_COM":"BOULBON","STATUT":"Commune simple","X_CHF_LIEU":836146.0,"Y_CHF_LIEU":6308503.0,"X_CENTROID":836407.0,"Y_CENTROID":6309922.0,"Z_MOYEN":55.0,"SUPERFICIE":"1930","POPULATION":"1497","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.667886734,43.876392366],[4.6819900845,43.8812334837],[4.6852480796,43.8822468919],[4.6868270854,43.8827013733],[4.6887814437,43.8833066493],[4.690546281,43.883898624],[4.6933272856,43.8849716879],[4.694330209,43.8855943228],[4.696042334,43.8867118103],[4.6972271723,43.8875485272],[4.6989903975,43.8889154161],[4.7074943865,43.895550919],[4.7081716203,43.8960939154],[4.7088027061,43.8967582499],[4.7092758837,43.8975114676],[4.7093257818,43.898013869],[4.711184166,43.8990046275],[4.7118022496,43.898693389],[4.7126191906,43.8963383919],[4.7131222789,43.8941458418],[4.7133271575,43.8932163761],[4.7141055106,43.8905343262],[4.7153269806,43.8871098947],[4.7156033252,43.8864484475],[4.7198855369,43.8820117699],[4.7226580818,43.8814270634],[4.7242073239,43.8811334594],[4.7262367054,43.8809150541],[4.7278491773,43.8808202298],[4.7288437586,43.8749499596],[4.7283753568,43.8662980546],[4.7286979598,43.8659400915],[4.7281692664,43.8657369339],[4.7267750066,43.8650929062],[4.7256254956,43.8643540779],[4.7237026856,43.863013566],[4.7227492834,43.8621743973],[4.7216784656,43.8611534472],[4.7209222116,43.8603318565],[4.7207692426,43.8589705725],[4.7211432913,43.8535071975],[4.7165751964,43.8519571417],[4.7041680303,43.8478778818],[4.6981609965,43.8453774184],[4.6968626821,43.8451716926],[4.694096516,43.8448717421],[4.6916274996,43.844777741],[4.6872507899,43.8449400362],[4.6867134484,43.84497985],[4.6726312186,43.8468501857],[4.6703988765,43.8471103182],[4.6688330681,43.8473674113],[4.6681081813,43.8475450183],[4.6686710006,43.8488874768],[4.670532897,43.8528428796],[4.6719271581,43.8557297927],[4.6692950107,43.8608377505],[4.6660447967,43.8635823776],[4.663226076,43.8685517293],[4.6630806404,43.8688554862],[4.6624214384,43.8708295941],[4.6637647465,43.8709414413],[4.6649341141,43.8716167022],[4.665501412,43.8719977994],[4.6653370033,43.8737965064],[4.667886734,43.876392366]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000034186","CODE_COM":"065","INSEE_COM":"84065","NOM_COM":"LAURIS","STATUT":"Commune simple","X_CHF_LIEU":886337.0,"Y_CHF_LIEU":6296955.0,"X_CENTROID":885389.0,"Y_CENTROID":6298910.0,"Z_MOYEN":277.0,"SUPERFICIE":"2248","POPULATION":"3785","CODE_ARR":"1","CODE_DEPT":"84","NOM_DEPT":"VAUCLUSE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.286389829,43.740139008],[5.2865176291,43.740123225],[5.2863884463,43.7401351069],[5.2863871956,43.7401394919],[5.286389829,43.740139008]]],[[[5.315299988,43.736564636],[5.3161509233,43.7359773471],[5.3144503706,43.7366697961],[5.315299988,43.736564636]]],[[[5.3259140626,43.7292378115],[5.3258537914,43.7292399747],[5.3247024522,43.7299910552],[5.324013139,43.7305502177],[5.3259140626,43.7292378115]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000034305","CODE_COM":"042","INSEE_COM":"13042","NOM_COM":"GEMENOS","STATUT":"Commune simple","X_CHF_LIEU":913252.0,"Y_CHF_LIEU":6247655.0,"X_CENTROID":914675.0,"Y_CENTROID":6248209.0,"Z_MOYEN":374.0,"SUPERFICIE":"3296","POPULATION":"6232","CODE_ARR":"3","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6691717559,43.3194098415],[5.6697605258,43.3196003366],[5.6702027969,43.3195923503],[5.6691717559,43.3194098415]]],[[[5.6796226171,43.3190971416],[5.6826590156,43.3184232618],[5.691038382,43.3129629698],[5.6910426285,43.3129582843],[5.6917082771,43.3124835608],[5.6934676713,43.311490131],[5.6953927075,43.3104817402],[5.6957588255,43.3058704168],[5.6951101553,43.3034635416],[5.6946508104,43.3031284596],[5.6888008977,43.3016854973],[5.683774947,43.3004899946],[5.6789809543,43.2992957154],[5.6780969451,43.2980665104],[5.6779807046,43.2972089124],[5.6779067931,43.292487123],[5.6749065955,43.2886407012],[5.6713003444,43.2856921729],[5.6705472674,43.2852868558],[5.668360014,43.2834417498],[5.6673623064,43.2823278003],[5.6636641544,43.2779592199],[5.6570689438,43.2682066033],[5.6569997764,43.2676943744],[5.6569539247,43.2670465642],[5.655843757,43.2673042802],[5.6554739972,43.2673520735],[5.6386005023,43.2689437421],[5.629805146,43.2701338808],[5.628393576,43.2702411407],[5.6175014986,43.270292313],[5.6167428773,43.270267491],[5.615342134,43.2701250067],[5.6127681093,43.2769547011],[5.6089328052,43.2847841692],[5.6078092877,43.2906157048],[5.6080099784,43.2995474942],[5.6083401691,43.3009895181],[5.6096552079,43.3071447887],[5.6102826913,43.3129998606],[5.6102791918,43.3137118984],[5.6100574658,43.3167909862],[5.6098001573,43.3197926331],[5.6096421736,43.3226469763],[5.6096354923,43.323833435],[5.6112395977,43.3237830033],[5.615551838,43.3233160363],[5.6189072977,43.3227937701],[5.6285732316,43.3247256896],[5.6362214013,43.3267077806],[5.6457006164,43.3235509512],[5.6468365051,43.3231577129],[5.6473715933,43.3232121182],[5.657924499,43.318875784],[5.6621037965,43.3184273147],[5.6670605237,43.3185301636],[5.6691660469,43.3194079944],[5.6691670433,43.3194083167],[5.6796226171,43.3190971416]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000034616","CODE_COM":"064","INSEE_COM":"13064","NOM_COM":"MOLLEGES","STATUT":"Commune simple","X_CHF_LIEU":856884.0,"Y_CHF_LIEU":6302680.0,"X_CENTROID":856579.0,"Y_CENTROID":6302699.0,"Z_MOYEN":55.0,"SUPERFICIE":"1423","POPULATION":"2527","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9727178681,43.8199894812],[4.9728852657,43.8195804736],[4.9765111408,43.8144558267],[4.9838876731,43.8026646261],[4.9844574957,43.8015713514],[4.9837523797,43.8010935953],[4.9810159324,43.7996670912],[4.9777078149,43.7979493419],[4.9714034626,43.7945313216],[4.9668174758,43.7920253238],[4.96681314,43.7919353864],[4.9654800911,43.7912933199],[4.9625524842,43.7897366025],[4.958783725,43.7887935351],[4.9538163828,43.7878241281],[4.9455832642,43.786873247],[4.9398000234,43.791472585],[4.934165992,43.7955504786],[4.9247627865,43.7991042033],[4.9241761188,43.7991757718],[4.9226402366,43.7996619507],[4.9100353931,43.8029206563],[4.9097291683,43.8030178368],[4.909614981,43.8032457743],[4.9085078796,43.8120047178],[4.9161031325,43.812418785],[4.9207308554,43.8128567422],[4.9234231935,43.813332267],[4.9312965278,43.8154920863],[4.93350689,43.8163026619],[4.9359219122,43.8170609516],[4.9396552414,43.8179793782],[4.9467443325,43.8187577003],[4.9497284981,43.818989731],[4.9624980315,43.8195086792],[4.9727178681,43.8199894812]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000034736","CODE_COM":"054","INSEE_COM":"13054","NOM_COM":"MARIGNANE","STATUT":"Commune simple","X_CHF_LIEU":879437.0,"Y_CHF_LIEU":6260051.0,"X_CENTROID":879656.0,"Y_CENTROID":6259309.0,"Z_MOYEN":13.0,"SUPERFICIE":"2356","POPULATION":"33986","CODE_ARR":"4","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1719195253,43.4186393572],[5.1721184358,43.4189044643],[5.173397365,43.4198147937],[5.1756161341,43.4210239303],[5.1767642833,43.4218036518],[5.1808026219,43.4248534888],[5.182863333,43.4266065685],[5.1853965242,43.4291564807],[5.1883208435,43.4321457429],[5.1903956426,43.4341585151],[5.1912661781,43.4349005127],[5.1939910088,43.4369504741],[5.1947410818,43.4371548823],[5.2044310714,43.4421404017],[5.2084471016,43.4454336711],[5.2203482061,43.4491622296],[5.2204716076,43.4491588008],[5.2205920387,43.4491104316],[5.2222392379,43.4474926202],[5.2232945783,43.4461605372],[5.2267808778,43.4413197269],[5.2292975425,43.437447387],[5.2322250431,43.4328726147],[5.2387082956,43.4235298637],[5.2390144051,43.42308253],[5.2382296668,43.4231293506],[5.2369911296,43.4230964384],[5.2354606122,43.4229534376],[5.2338312026,43.4225847526],[5.2288109186,43.4211581688],[5.2264871434,43.420169159],[5.228047589,43.4175162512],[5.2293860755,43.4162124985],[5.2338007131,43.4131164105],[5.241609545,43.4116941363],[5.2446609937,43.4114320234],[5.2486062557,43.4103808611],[5.2550234762,43.4084950936],[5.259709477,43.405065572],[5.2633385632,43.4024580502],[5.2639060481,43.4020105824],[5.2624543413,43.4017250268],[5.259730861,43.4011771028],[5.2436895359,43.3986424372],[5.2287626106,43.3980111733],[5.2175021231,43.3968771262],[5.2070105287,43.3955048497],[5.1987714333,43.3939292442],[5.1968974735,43.393106911],[5.1960848491,43.3925420138],[5.1958350457,43.3928197746],[5.1951738563,43.3935072679],[5.1938384564,43.3934407415],[5.1933900563,43.3932356332],[5.1916635416,43.3932364026],[5.1912366886,43.3933377413],[5.1908208564,43.3936638495],[5.1895174081,43.3949564882],[5.1887583379,43.3958313164],[5.1877740522,43.3973406756],[5.1871221298,43.3991205063],[5.1865960671,43.4009328919],[5.1858102466,43.4052344721],[5.1855775384,43.4055100645],[5.172041167,43.4185910183],[5.1719195253,43.4186393572]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000034866","CODE_COM":"106","INSEE_COM":"13106","NOM_COM":"SEPTEMES-LES-VALLONS","STATUT":"Commune simple","X_CHF_LIEU":891735.0,"Y_CHF_LIEU":6258355.0,"X_CENTROID":892512.0,"Y_CENTROID":6258139.0,"Z_MOYEN":277.0,"SUPERFICIE":"1775","POPULATION":"10713","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3927216809,43.4164969587],[5.3933062567,43.4115823274],[5.3945448025,43.405119558],[5.3948666131,43.404012577],[5.3959246955,43.4024743808],[5.3970805871,43.4008260032],[5.4069245795,43.3942379303],[5.4177131525,43.3876260494],[5.424287931,43.3847698372],[5.4250197598,43.3843898227],[5.4252513458,43.3841749222],[5.4245750667,43.3834124328],[5.4237347897,43.3829749298],[5.4169923415,43.3795696421],[5.4158288666,43.3789844921],[5.4153866211,43.378766653],[5.4147780721,43.3784670192],[5.40347611,43.3748466613],[5.4017634299,43.3744886722],[5.3984910744,43.3742453403],[5.3955684695,43.3742821781],[5.3945444824,43.374195038],[5.3943938329,43.3741623702],[5.3923801932,43.3731511715],[5.3920851775,43.3728210825],[5.391721736,43.3723286999],[5.3916295889,43.3720706283],[5.391432294,43.3719840858],[5.3814518243,43.3702097403],[5.3756948228,43.3720823336],[5.3769013412,43.3786260265],[5.3783811851,43.3843114074],[5.3783478331,43.3845794499],[5.3779349315,43.3853085486],[5.3776077758,43.3856937497],[5.3751789622,43.3880817625],[5.3729019961,43.3888589311],[5.3709792696,43.3894887869],[5.3701066822,43.389667203],[5.3685198095,43.3896425361],[5.3546107586,43.3845926408],[5.3513191219,43.3831899631],[5.3504271988,43.382772826],[5.3503727418,43.382496802],[5.3498541783,43.3825197625],[5.3490999777,43.3832093509],[5.3485831001,43.3849981119],[5.3466381089,43.3898077245],[5.3450943697,43.3929318695],[5.3443786082,43.3951155393],[5.3429893746,43.400798702],[5.343693599,43.4026636264],[5.3449638841,43.4058168417],[5.3459972798,43.4078798398],[5.3465735291,43.4081760654],[5.3478175906,43.4088034244],[5.3542884182,43.4087286231],[5.3606334663,43.4090485958],[5.3647948033,43.4099424394],[5.3741986265,43.4125493036],[5.3768573009,43.4135485369],[5.3783591654,43.4141887993],[5.3792888519,43.4146364034],[5.380003703,43.4148448074],[5.3810848201,43.4150127518],[5.3833379674,43.4147111692],[5.3861965494,43.4146293138],[5.3900563835,43.415675561],[5.3921996127,43.416264577],[5.3927216809,43.4164969587]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000034939","CODE_COM":"011","INSEE_COM":"13011","NOM_COM":"LES BAUX-DE-PROVENCE","STATUT":"Commune simple","X_CHF_LIEU":844616.0,"Y_CHF_LIEU":6295517.0,"X_CENTROID":845594.0,"Y_CENTROID":6295198.0,"Z_MOYEN":169.0,"SUPERFICIE":"1807","POPULATION":"450","CODE_ARR":"2","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.797425459,43.7301969062],[4.7898361205,43.7329618547],[4.7803860121,43.732876474],[4.7769821426,43.7327079632],[4.7764703633,43.7322959813],[4.7747197237,43.7302795715],[4.7712838813,43.7289917218],[4.7670315776,43.7290734225],[4.7668237714,43.7290965966],[4.7672561964,43.7310022218],[4.7676465869,43.7323495876],[4.770779559,43.7379277252],[4.7724794575,43.7425120512],[4.773897521,43.74800914],[4.7718079218,43.7518603969],[4.7707041937,43.7572023364],[4.7704020164,43.7595168662],[4.7703215272,43.76020674],[4.7798329729,43.7612020564],[4.783165721,43.7631781548],[4.7851861785,43.7645654077],[4.7866434648,43.7657332398],[4.8007225602,43.7646202306],[4.8017149592,43.7637937349],[4.8023669011,43.7633572047],[4.8028686939,43.7631220769],[4.8041438979,43.7625618069],[4.8059425594,43.761864131],[4.8081522891,43.7610497906],[4.8116377987,43.7598172514],[4.8152539548,43.7585581195],[4.8264121894,43.7550610306],[4.830452353,43.7537222687],[4.8316905793,43.7533792167],[4.8325357622,43.7532488867],[4.83246956,43.7526550359],[4.8321361691,43.7523258084],[4.8317997934,43.7490713171],[4.8325283956,43.7462327618],[4.8346284284,43.7444665226],[4.8366187139,43.7436174888],[4.838485423,43.7432133505],[4.8406995638,43.741645787],[4.8423556746,43.7399472065],[4.8425705864,43.7356321305],[4.8425241356,43.7351531684],[4.8423266531,43.7342627208],[4.8413384673,43.7332182321],[4.8406117812,43.7326616635],[4.8397126007,43.7320287977],[4.8320003741,43.7292326651],[4.8269266161,43.7290496999],[4.8178415,43.7290685638],[4.8127246552,43.7292078856],[4.8069564431,43.7291597622],[4.7986302405,43.7305379397],[4.7983336274,43.7305788425],[4.797425459,43.7301969062]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000035238","CODE_COM":"082","INSEE_COM":"13082","NOM_COM":"ROGNES","STATUT":"Commune simple","X_CHF_LIEU":889340.0,"Y_CHF_LIEU":6287869.0,"X_CENTROID":889510.0,"Y_CENTROID":6288851.0,"Z_MOYEN":309.0,"SUPERFICIE":"5830","POPULATION":"4686","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4112618042,43.6226723542],[5.410783479,43.6226721651],[5.4089874316,43.6226012734],[5.4086256516,43.622543579],[5.3904521286,43.6246822653],[5.3892612476,43.6250091198],[5.3872369446,43.6252903596],[5.3849698076,43.6255732904],[5.3783905526,43.6256562754],[5.3703082264,43.6252918589],[5.3662789638,43.6248863717],[5.3653357241,43.6248510958],[5.3639587043,43.6246038042],[5.3607133715,43.6243349871],[5.3548134529,43.6254766013],[5.3493915173,43.6265544479],[5.3478928756,43.6270585307],[5.341916871,43.6291714704],[5.3319248276,43.6327412892],[5.3196813041,43.6377940259],[5.3174665523,43.6381041212],[5.3170392045,43.6398280659],[5.3133180929,43.6461518487],[5.3108520023,43.6490920724],[5.3088990396,43.6524354274],[5.307629327,43.6548631682],[5.3058849587,43.6634006139],[5.304249879,43.6695493495],[5.3034630925,43.6754280616],[5.3034480133,43.6796187843],[5.3021573682,43.6857134353],[5.2996080059,43.6892007168],[5.2981902202,43.6900705641],[5.2979692872,43.6905316325],[5.2998458164,43.6909834875],[5.3097928398,43.6956896713],[5.3146768135,43.7005550336],[5.3219119171,43.7063387003],[5.3233673083,43.7068837753],[5.3284846675,43.7085244225],[5.3323399053,43.7089387846],[5.3423630979,43.7098712859],[5.3462228991,43.7094226444],[5.3501010046,43.7085746684],[5.3506390343,43.7077447402],[5.3538904226,43.7065680759],[5.35462612,43.7064126235],[5.3555075597,43.7062405079],[5.3672118088,43.7067418138],[5.3679335861,43.7065505643],[5.368339149,43.7059448836],[5.368549626,43.7046430672],[5.3682758449,43.7004233427],[5.3687817399,43.6975946135],[5.3700004097,43.6936124749],[5.3708351265,43.6916579019],[5.3714655096,43.6914515139],[5.3761512939,43.6906119822],[5.3815516804,43.6878364196],[5.3918565573,43.680605652],[5.3934227808,43.6795269365],[5.3938726156,43.6791605474],[5.3949045058,43.678000846],[5.3956207955,43.6771847709],[5.3963251423,43.6761132904],[5.3966210217,43.6753883916],[5.3966833013,43.6751871694],[5.3961814942,43.6727379159],[5.3958738829,43.6663009139],[5.3979636285,43.662600865],[5.3984150184,43.65943115],[5.3963775214,43.6560741676],[5.3927978672,43.6503097469],[5.393396984,43.648803114],[5.3939247729,43.6477265477],[5.3986686782,43.640547255],[5.4006488212,43.6391109232],[5.4059681431,43.6279010144],[5.4068696289,43.6267918114],[5.4112618042,43.6226723542]]]]}},{"type":"Feature","properties":{"ID_GEOFLA":"COMMUNE00000000000035241","CODE_COM":"069","INSEE_COM":"13069","NOM_COM":"PELISSANNE","STATUT":"Commune simple","X_CHF_LIEU":873575.0,"Y_CHF_LIEU":6283734.0,"X_CENTROID":873894.0,"Y_CENTROID":6284070.0,"Z_MOYEN":112.0,"SUPERFICIE":"1915","POPULATION":"9763","CODE_ARR":"1","CODE_DEPT":"13","NOM_DEPT":"BOUCHES-DU-RHONE","CODE_REG":"93","NOM_REG":"PROVENCE-ALPES-COTE D'AZUR"},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1811287842,43.6576175511],[5.1812358186,43.6567161619],[5.1818242686,43.6522423575],[5.1830479018,43.6444316059],[5.1835016504,43.6417977009],[5.1827009749,43.6414402257],[5.182237692,43.6411218789],[5.1815260969,43.6378281787],[5.1813849246,43.6345086339],[5.181121526,43.6341979749],[5.180767792,43.6339233328],[5.1803236275,43.6336496037],[5.1789561342,43.6331459526],[5.1777057683,43.6327236499],[5.1765279079,43.6323826929],[5.1732193894,43.6319007227],[5.1709102403,43.6313986958],[5.1657024307,43.6283008647],[5.1657785801,43.6254612722],[5.1658840211,43.6246769684],[5.1757712151,43.6213245422],[5.1820861172,43.6192617594],[5.1863437281,43.6179736161],[5.1911847074,43.6158427294],[5.1939858914,43.613478295],[5.194656338,43.6128688754],[5.1958131802,43.611406211],[5.1971091562,43.608629249],[5.1973071557,43.6049050631],[5.1968417263,43.602293343],[5.19635102,43.6010908132],[5.1952520076,43.6014370691],[5.1856366712,43.6046868321],[5.1728670609,43.6084759202],[5.1638423085,43.6107289899],[5.1603413807,43.6109894819],[5.1470626335,43.6120456956],[5.1462081274,43.612119285],[5.1428822572,43.6124270593],[5.1423294594,43.6125189698],[5.139012304,43.613460125],[5.1387459926,43.6135940821],[5.1392985055,43.6151880885],[5.1398579048,43.6161356839],[5.1399887239,43.6184796814],[5.1400172323,43.6190776904],[5.1374637825,43.6209407618],[5.1349454528,43.6220541937],[5.133026193,43.6225869418],[5.1317994413,43.6224840994],[5.1299710135,43.6221275072],[5.1296658691,43.6235529538],[5.1311519144,43.6268317148],[5.131672559,43.6301708106],[5.1301960276,43.6337894036],[5.1288329834,43.6377658048],[5.1278080946,43.6412072091],[5.1285224431,43.6440564959],[5.1291013687,43.6444925177],[5.1307119381,43.6455384048],[5.1361066558,43.6507018532],[5.138805459,43.6535616018],[5.1392195558,43.6539279079],[5.1409625962,43.6531644957],[5.1433572068,43.6525214309],[5.1445600392,43.652232174],[5.1512312107,43.6511867484],[5.1543349961,43.6509470644],[5.1587395347,43.6517049208],[5.1640427588,43.6527525634],[5.1670935233,43.6540275987],[5.180601238,43.6577640538],[5.1811287842,43.6576175511]]]]}}]}
\ No newline at end of file
@@ -1 +0,0 @@
-var json_Point_counts_1 = {"type":"FeatureCollection","name":"Point_counts_1","crs":{"type":"name","properties":{"name":"urn:ogc:def:crs:OGC:1.3:CRS84"}},"features":[{"type":"Feature","properties":{"NOM":"HD42G5","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2118860043,43.455812712],[4.2124745228,43.4737813121],[4.2371478205,43.4733497417],[4.2365515805,43.4553812899],[4.2118860043,43.455812712]]]]}},{"type":"Feature","properties":{"NOM":"HD42G6","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2124745228,43.4737813121],[4.2130634101,43.4917501688],[4.237744434,43.49131845],[4.2371478205,43.4733497417],[4.2124745228,43.4737813121]]]]}},{"type":"Feature","properties":{"NOM":"HD42G7","NUMPOINTS":9.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2130634101,43.4917501688],[4.2136527258,43.5097192149],[4.2383414648,43.5092873658],[4.237744434,43.49131845],[4.2130634101,43.4917501688]]]]}},{"type":"Feature","properties":{"NOM":"HD42H5","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2365515805,43.4553812899],[4.2371478205,43.4733497417],[4.2618207446,43.4729125312],[4.2612167835,43.4549442296],[4.2365515805,43.4553812899]]]]}},{"type":"Feature","properties":{"NOM":"HD42H6","NUMPOINTS":21.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2371478205,43.4733497417],[4.237744434,43.49131845],[4.2624250841,43.4908810893],[4.2618207446,43.4729125312],[4.2371478205,43.4733497417]]]]}},{"type":"Feature","properties":{"NOM":"HD42H7","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.237744434,43.49131845],[4.2383414648,43.5092873658],[4.2630298307,43.5088498715],[4.2624250841,43.4908810893],[4.237744434,43.49131845]]]]}},{"type":"Feature","properties":{"NOM":"HD42K5","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2612167835,43.4549442296],[4.2618207446,43.4729125312],[4.2864932902,43.4724696807],[4.2858816084,43.4545015312],[4.2612167835,43.4549442296]]]]}},{"type":"Feature","properties":{"NOM":"HD42K6","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2618207446,43.4729125312],[4.2624250841,43.4908810893],[4.2871053553,43.4904380867],[4.2864932902,43.4724696807],[4.2618207446,43.4729125312]]]]}},{"type":"Feature","properties":{"NOM":"HD42K7","NUMPOINTS":19.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2624250841,43.4908810893],[4.2630298307,43.5088498715],[4.2877178188,43.5084067322],[4.2871053553,43.4904380867],[4.2624250841,43.4908810893]]]]}},{"type":"Feature","properties":{"NOM":"HD42K8","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2630298307,43.5088498715],[4.2636349848,43.5268188766],[4.2883306822,43.5263756146],[4.2877178188,43.5084067322],[4.2630298307,43.5088498715]]]]}},{"type":"Feature","properties":{"NOM":"HD42L5","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2858816084,43.4545015312],[4.2864932902,43.4724696807],[4.3111655075,43.4720211946],[4.3105460974,43.4540531962],[4.2858816084,43.4545015312]]]]}},{"type":"Feature","properties":{"NOM":"HD42L6","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2864932902,43.4724696807],[4.2871053553,43.4904380867],[4.3117853063,43.4899894496],[4.3111655075,43.4720211946],[4.2864932902,43.4724696807]]]]}},{"type":"Feature","properties":{"NOM":"HD42L7","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2871053553,43.4904380867],[4.2877178188,43.5084067322],[4.3124055014,43.5079579545],[4.3117853063,43.4899894496],[4.2871053553,43.4904380867]]]]}},{"type":"Feature","properties":{"NOM":"HD42L8","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2877178188,43.5084067322],[4.2883306822,43.5263756146],[4.3130260949,43.5259267067],[4.3124055014,43.5079579545],[4.2877178188,43.5084067322]]]]}},{"type":"Feature","properties":{"NOM":"HD42L9","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2883306822,43.5263756146],[4.2889439287,43.5443447499],[4.3136470779,43.5438957112],[4.3130260949,43.5259267067],[4.2883306822,43.5263756146]]]]}},{"type":"Feature","properties":{"NOM":"HD44L0","NUMPOINTS":21.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.2889439287,43.5443447499],[4.2895575585,43.5623141364],[4.3142684508,43.5618649663],[4.3136470779,43.5438957112],[4.2889439287,43.5443447499]]]]}},{"type":"Feature","properties":{"NOM":"HD62A5","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3105460974,43.4540531962],[4.3111655075,43.4720211946],[4.3358374028,43.4715670735],[4.3352102611,43.4535992251],[4.3105460974,43.4540531962]]]]}},{"type":"Feature","properties":{"NOM":"HD62A6","NUMPOINTS":19.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3111655075,43.4720211946],[4.3117853063,43.4899894496],[4.3364649379,43.4895351786],[4.3358374028,43.4715670735],[4.3111655075,43.4720211946]]]]}},{"type":"Feature","properties":{"NOM":"HD62A7","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3117853063,43.4899894496],[4.3124055014,43.5079579545],[4.3370928718,43.5075035389],[4.3364649379,43.4895351786],[4.3117853063,43.4899894496]]]]}},{"type":"Feature","properties":{"NOM":"HD62A8","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3124055014,43.5079579545],[4.3130260949,43.5259267067],[4.3377212067,43.5254721533],[4.3370928718,43.5075035389],[4.3124055014,43.5079579545]]]]}},{"type":"Feature","properties":{"NOM":"HD62A9","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3130260949,43.5259267067],[4.3136470779,43.5438957112],[4.338349936,43.54344102],[4.3377212067,43.5254721533],[4.3130260949,43.5259267067]]]]}},{"type":"Feature","properties":{"NOM":"HD64A0","NUMPOINTS":40.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3136470779,43.5438957112],[4.3142684508,43.5618649663],[4.33897906,43.5614101373],[4.338349936,43.54344102],[4.3136470779,43.5438957112]]]]}},{"type":"Feature","properties":{"NOM":"HD62B5","NUMPOINTS":30.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3352102611,43.4535992251],[4.3358374028,43.4715670735],[4.3605089045,43.4711073126],[4.3598740318,43.4531396159],[4.3352102611,43.4535992251]]]]}},{"type":"Feature","properties":{"NOM":"HD62B6","NUMPOINTS":26.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3358374028,43.4715670735],[4.3364649379,43.4895351786],[4.3611441756,43.4890752658],[4.3605089045,43.4711073126],[4.3358374028,43.4715670735]]]]}},{"type":"Feature","properties":{"NOM":"HD62B7","NUMPOINTS":31.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3364649379,43.4895351786],[4.3370928718,43.5075035389],[4.3617798482,43.507043479],[4.3611441756,43.4890752658],[4.3364649379,43.4895351786]]]]}},{"type":"Feature","properties":{"NOM":"HD62B8","NUMPOINTS":74.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3370928718,43.5075035389],[4.3377212067,43.5254721533],[4.3624159242,43.5250119538],[4.3617798482,43.507043479],[4.3370928718,43.5075035389]]]]}},{"type":"Feature","properties":{"NOM":"HD62B9","NUMPOINTS":55.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3377212067,43.5254721533],[4.338349936,43.54344102],[4.3630523993,43.5429806809],[4.3624159242,43.5250119538],[4.3377212067,43.5254721533]]]]}},{"type":"Feature","properties":{"NOM":"HD64B0","NUMPOINTS":35.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.338349936,43.54344102],[4.33897906,43.5614101373],[4.3636892741,43.5609496585],[4.3630523993,43.5429806809],[4.338349936,43.54344102]]]]}},{"type":"Feature","properties":{"NOM":"HD62C4","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.359239557,43.4351721775],[4.3598740318,43.4531396159],[4.3845374044,43.4526743689],[4.3838952038,43.4347070841],[4.359239557,43.4351721775]]]]}},{"type":"Feature","properties":{"NOM":"HD62C5","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3598740318,43.4531396159],[4.3605089045,43.4711073126],[4.3851800079,43.4706419119],[4.3845374044,43.4526743689],[4.3598740318,43.4531396159]]]]}},{"type":"Feature","properties":{"NOM":"HD62C6","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3605089045,43.4711073126],[4.3611441756,43.4890752658],[4.3858230146,43.4886097114],[4.3851800079,43.4706419119],[4.3605089045,43.4711073126]]]]}},{"type":"Feature","properties":{"NOM":"HD62C7","NUMPOINTS":57.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3611441756,43.4890752658],[4.3617798482,43.507043479],[4.3864664258,43.5065777751],[4.3858230146,43.4886097114],[4.3611441756,43.4890752658]]]]}},{"type":"Feature","properties":{"NOM":"HD62C8","NUMPOINTS":107.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3617798482,43.507043479],[4.3624159242,43.5250119538],[4.3871102424,43.5245461085],[4.3864664258,43.5065777751],[4.3617798482,43.507043479]]]]}},{"type":"Feature","properties":{"NOM":"HD62C9","NUMPOINTS":63.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3624159242,43.5250119538],[4.3630523993,43.5429806809],[4.387754463,43.542514694],[4.3871102424,43.5245461085],[4.3624159242,43.5250119538]]]]}},{"type":"Feature","properties":{"NOM":"HD64C0","NUMPOINTS":42.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3630523993,43.5429806809],[4.3636892741,43.5609496585],[4.3883990882,43.5604835301],[4.387754463,43.542514694],[4.3630523993,43.5429806809]]]]}},{"type":"Feature","properties":{"NOM":"HD62D4","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3838952038,43.4347070841],[4.3845374044,43.4526743689],[4.4092003999,43.4522034909],[4.4085504672,43.4342363625],[4.3838952038,43.4347070841]]]]}},{"type":"Feature","properties":{"NOM":"HD62D5","NUMPOINTS":26.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3845374044,43.4526743689],[4.3851800079,43.4706419119],[4.4098507409,43.4701708772],[4.4092003999,43.4522034909],[4.3845374044,43.4526743689]]]]}},{"type":"Feature","properties":{"NOM":"HD62D6","NUMPOINTS":98.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3851800079,43.4706419119],[4.3858230146,43.4886097114],[4.4105014906,43.4881385198],[4.4098507409,43.4701708772],[4.3851800079,43.4706419119]]]]}},{"type":"Feature","properties":{"NOM":"HD62D7","NUMPOINTS":56.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3858230146,43.4886097114],[4.3864664258,43.5065777751],[4.4111526481,43.5061064283],[4.4105014906,43.4881385198],[4.3858230146,43.4886097114]]]]}},{"type":"Feature","properties":{"NOM":"HD62D8","NUMPOINTS":98.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3864664258,43.5065777751],[4.3871102424,43.5245461085],[4.4118042121,43.5240746119],[4.4111526481,43.5061064283],[4.3864664258,43.5065777751]]]]}},{"type":"Feature","properties":{"NOM":"HD62D9","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3871102424,43.5245461085],[4.387754463,43.542514694],[4.4124561855,43.5420430469],[4.4118042121,43.5240746119],[4.3871102424,43.5245461085]]]]}},{"type":"Feature","properties":{"NOM":"HD64D0","NUMPOINTS":51.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.387754463,43.542514694],[4.3883990882,43.5604835301],[4.4131085687,43.5600117317],[4.4124561855,43.5420430469],[4.387754463,43.542514694]]]]}},{"type":"Feature","properties":{"NOM":"HD64D1","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3883990882,43.5604835301],[4.3890441182,43.578452615],[4.4137613621,43.5779806645],[4.4131085687,43.5600117317],[4.3883990882,43.5604835301]]]]}},{"type":"Feature","properties":{"NOM":"HD64D2","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.3890441182,43.578452615],[4.3896895534,43.5964219471],[4.4144145661,43.5959498438],[4.4137613621,43.5779806645],[4.3890441182,43.578452615]]]]}},{"type":"Feature","properties":{"NOM":"HD62E4","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4085504672,43.4342363625],[4.4092003999,43.4522034909],[4.4338630302,43.4517269868],[4.433205359,43.4337600199],[4.4085504672,43.4342363625]]]]}},{"type":"Feature","properties":{"NOM":"HD62E5","NUMPOINTS":73.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4092003999,43.4522034909],[4.4098507409,43.4701708772],[4.4345211146,43.4696942116],[4.4338630302,43.4517269868],[4.4092003999,43.4522034909]]]]}},{"type":"Feature","properties":{"NOM":"HD62E6","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4098507409,43.4701708772],[4.4105014906,43.4881385198],[4.4351796126,43.4876616926],[4.4345211146,43.4696942116],[4.4098507409,43.4701708772]]]]}},{"type":"Feature","properties":{"NOM":"HD62E7","NUMPOINTS":9.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4105014906,43.4881385198],[4.4111526481,43.5061064283],[4.4358385205,43.5056294394],[4.4351796126,43.4876616926],[4.4105014906,43.4881385198]]]]}},{"type":"Feature","properties":{"NOM":"HD62E8","NUMPOINTS":36.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4111526481,43.5061064283],[4.4118042121,43.5240746119],[4.4364978334,43.5235974642],[4.4358385205,43.5056294394],[4.4111526481,43.5061064283]]]]}},{"type":"Feature","properties":{"NOM":"HD62E9","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4118042121,43.5240746119],[4.4124561855,43.5420430469],[4.4371575605,43.5415657404],[4.4364978334,43.5235974642],[4.4118042121,43.5240746119]]]]}},{"type":"Feature","properties":{"NOM":"HD64E0","NUMPOINTS":45.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4124561855,43.5420430469],[4.4131085687,43.5600117317],[4.4378177024,43.5595342662],[4.4371575605,43.5415657404],[4.4124561855,43.5420430469]]]]}},{"type":"Feature","properties":{"NOM":"HD64E1","NUMPOINTS":35.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4131085687,43.5600117317],[4.4137613621,43.5779806645],[4.4384782593,43.5775030401],[4.4378177024,43.5595342662],[4.4131085687,43.5600117317]]]]}},{"type":"Feature","properties":{"NOM":"HD64E2","NUMPOINTS":52.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4137613621,43.5779806645],[4.4144145661,43.5959498438],[4.4391392316,43.5954720603],[4.4384782593,43.5775030401],[4.4137613621,43.5779806645]]]]}},{"type":"Feature","properties":{"NOM":"HD64E3","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4144145661,43.5959498438],[4.4150682371,43.6139193151],[4.439800656,43.6134413742],[4.4391392316,43.5954720603],[4.4144145661,43.5959498438]]]]}},{"type":"Feature","properties":{"NOM":"HD64E4","NUMPOINTS":58.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4150682371,43.6139193151],[4.4157223347,43.6318890434],[4.4404625077,43.6314109477],[4.439800656,43.6134413742],[4.4150682371,43.6139193151]]]]}},{"type":"Feature","properties":{"NOM":"HD64E5","NUMPOINTS":91.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4157223347,43.6318890434],[4.4163768427,43.6498590133],[4.4411247748,43.6493807628],[4.4404625077,43.6314109477],[4.4157223347,43.6318890434]]]]}},{"type":"Feature","properties":{"NOM":"HD62F4","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.433205359,43.4337600199],[4.4338630302,43.4517269868],[4.4585252473,43.4512448455],[4.4578598379,43.4332780419],[4.433205359,43.4337600199]]]]}},{"type":"Feature","properties":{"NOM":"HD62F5","NUMPOINTS":45.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4338630302,43.4517269868],[4.4345211146,43.4696942116],[4.4591910747,43.4692119069],[4.4585252473,43.4512448455],[4.4338630302,43.4517269868]]]]}},{"type":"Feature","properties":{"NOM":"HD62F6","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4345211146,43.4696942116],[4.4351796126,43.4876616926],[4.4598573206,43.4871792244],[4.4591910747,43.4692119069],[4.4345211146,43.4696942116]]]]}},{"type":"Feature","properties":{"NOM":"HD62F7","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4351796126,43.4876616926],[4.4358385205,43.5056294394],[4.460523979,43.5051468077],[4.4598573206,43.4871792244],[4.4351796126,43.4876616926]]]]}},{"type":"Feature","properties":{"NOM":"HD62F8","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4358385205,43.5056294394],[4.4364978334,43.5235974642],[4.4611910404,43.5231146718],[4.460523979,43.5051468077],[4.4358385205,43.5056294394]]]]}},{"type":"Feature","properties":{"NOM":"HD62F9","NUMPOINTS":9.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4364978334,43.5235974642],[4.4371575605,43.5415657404],[4.4618585209,43.5410827872],[4.4611910404,43.5231146718],[4.4364978334,43.5235974642]]]]}},{"type":"Feature","properties":{"NOM":"HD64F0","NUMPOINTS":17.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4371575605,43.5415657404],[4.4378177024,43.5595342662],[4.4625264209,43.5590511523],[4.4618585209,43.5410827872],[4.4371575605,43.5415657404]]]]}},{"type":"Feature","properties":{"NOM":"HD64F1","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4378177024,43.5595342662],[4.4384782593,43.5775030401],[4.4631947409,43.5770197653],[4.4625264209,43.5590511523],[4.4378177024,43.5595342662]]]]}},{"type":"Feature","properties":{"NOM":"HD64F2","NUMPOINTS":61.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4384782593,43.5775030401],[4.4391392316,43.5954720603],[4.4638634813,43.5949886247],[4.4631947409,43.5770197653],[4.4384782593,43.5775030401]]]]}},{"type":"Feature","properties":{"NOM":"HD64F3","NUMPOINTS":35.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4391392316,43.5954720603],[4.439800656,43.6134413742],[4.4645326599,43.6129577789],[4.4638634813,43.5949886247],[4.4391392316,43.5954720603]]]]}},{"type":"Feature","properties":{"NOM":"HD64F4","NUMPOINTS":24.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.439800656,43.6134413742],[4.4404625077,43.6314109477],[4.4652022654,43.6309271958],[4.4645326599,43.6129577789],[4.439800656,43.6134413742]]]]}},{"type":"Feature","properties":{"NOM":"HD64F5","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4404625077,43.6314109477],[4.4411247748,43.6493807628],[4.4658722911,43.6488968542],[4.4652022654,43.6309271958],[4.4404625077,43.6314109477]]]]}},{"type":"Feature","properties":{"NOM":"HD64F6","NUMPOINTS":69.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4411247748,43.6493807628],[4.4417874577,43.6673508178],[4.4665427375,43.6668667525],[4.4658722911,43.6488968542],[4.4411247748,43.6493807628]]]]}},{"type":"Feature","properties":{"NOM":"HD64F7","NUMPOINTS":81.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4417874577,43.6673508178],[4.4424505567,43.685321111],[4.4672136049,43.6848368889],[4.4665427375,43.6668667525],[4.4417874577,43.6673508178]]]]}},{"type":"Feature","properties":{"NOM":"HD62G5","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4585252473,43.4512448455],[4.4591910747,43.4692119069],[4.4838606164,43.4687239632],[4.4831870463,43.4507570671],[4.4585252473,43.4512448455]]]]}},{"type":"Feature","properties":{"NOM":"HD62G6","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4591910747,43.4692119069],[4.4598573206,43.4871792244],[4.4845346097,43.4866911155],[4.4838606164,43.4687239632],[4.4591910747,43.4692119069]]]]}},{"type":"Feature","properties":{"NOM":"HD62G7","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4598573206,43.4871792244],[4.460523979,43.5051468077],[4.4852090187,43.504658533],[4.4845346097,43.4866911155],[4.4598573206,43.4871792244]]]]}},{"type":"Feature","properties":{"NOM":"HD62G8","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.460523979,43.5051468077],[4.4611910404,43.5231146718],[4.4858838282,43.5226262347],[4.4852090187,43.504658533],[4.460523979,43.5051468077]]]]}},{"type":"Feature","properties":{"NOM":"HD62G9","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4611910404,43.5231146718],[4.4618585209,43.5410827872],[4.4865590616,43.5405941875],[4.4858838282,43.5226262347],[4.4611910404,43.5231146718]]]]}},{"type":"Feature","properties":{"NOM":"HD64G0","NUMPOINTS":20.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4618585209,43.5410827872],[4.4625264209,43.5590511523],[4.4872347195,43.55856239],[4.4865590616,43.5405941875],[4.4618585209,43.5410827872]]]]}},{"type":"Feature","properties":{"NOM":"HD64G1","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4625264209,43.5590511523],[4.4631947409,43.5770197653],[4.4879108022,43.5765308403],[4.4872347195,43.55856239],[4.4625264209,43.5590511523]]]]}},{"type":"Feature","properties":{"NOM":"HD64G2","NUMPOINTS":42.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4631947409,43.5770197653],[4.4638634813,43.5949886247],[4.4885873101,43.5944995369],[4.4879108022,43.5765308403],[4.4631947409,43.5770197653]]]]}},{"type":"Feature","properties":{"NOM":"HD64G3","NUMPOINTS":64.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4638634813,43.5949886247],[4.4645326599,43.6129577789],[4.489264244,43.6124685295],[4.4885873101,43.5944995369],[4.4638634813,43.5949886247]]]]}},{"type":"Feature","properties":{"NOM":"HD64G4","NUMPOINTS":39.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4645326599,43.6129577789],[4.4652022654,43.6309271958],[4.4899416028,43.6304377879],[4.489264244,43.6124685295],[4.4645326599,43.6129577789]]]]}},{"type":"Feature","properties":{"NOM":"HD64G5","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4652022654,43.6309271958],[4.4658722911,43.6488968542],[4.4906193868,43.6484072878],[4.4899416028,43.6304377879],[4.4652022654,43.6309271958]]]]}},{"type":"Feature","properties":{"NOM":"HD64G6","NUMPOINTS":84.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4658722911,43.6488968542],[4.4665427375,43.6668667525],[4.4912975963,43.6663770274],[4.4906193868,43.6484072878],[4.4658722911,43.6488968542]]]]}},{"type":"Feature","properties":{"NOM":"HD64G7","NUMPOINTS":128.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4665427375,43.6668667525],[4.4672136049,43.6848368889],[4.4919762317,43.6843470052],[4.4912975963,43.6663770274],[4.4665427375,43.6668667525]]]]}},{"type":"Feature","properties":{"NOM":"HD64G8","NUMPOINTS":59.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4672136049,43.6848368889],[4.4678849046,43.7028072613],[4.4926553028,43.70231722],[4.4919762317,43.6843470052],[4.4672136049,43.6848368889]]]]}},{"type":"Feature","properties":{"NOM":"HD62H5","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4831870463,43.4507570671],[4.4838606164,43.4687239632],[4.50852972,43.4682303913],[4.5078484096,43.4502636617],[4.4831870463,43.4507570671]]]]}},{"type":"Feature","properties":{"NOM":"HD62H6","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4838606164,43.4687239632],[4.4845346097,43.4866911155],[4.5092114584,43.4861973768],[4.50852972,43.4682303913],[4.4838606164,43.4687239632]]]]}},{"type":"Feature","properties":{"NOM":"HD62H7","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4845346097,43.4866911155],[4.4852090187,43.504658533],[4.5098936162,43.5041646265],[4.5092114584,43.4861973768],[4.4845346097,43.4866911155]]]]}},{"type":"Feature","properties":{"NOM":"HD62H8","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4852090187,43.504658533],[4.4858838282,43.5226262347],[4.5105761728,43.5221321613],[4.5098936162,43.5041646265],[4.4852090187,43.504658533]]]]}},{"type":"Feature","properties":{"NOM":"HD62H9","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4858838282,43.5226262347],[4.4865590616,43.5405941875],[4.5112591584,43.5400999469],[4.5105761728,43.5221321613],[4.4858838282,43.5226262347]]]]}},{"type":"Feature","properties":{"NOM":"HD64H0","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4865590616,43.5405941875],[4.4872347195,43.55856239],[4.5119425733,43.5580679816],[4.5112591584,43.5400999469],[4.4865590616,43.5405941875]]]]}},{"type":"Feature","properties":{"NOM":"HD64H1","NUMPOINTS":33.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4872347195,43.55856239],[4.4879108022,43.5765308403],[4.512626418,43.5760362638],[4.5119425733,43.5580679816],[4.4872347195,43.55856239]]]]}},{"type":"Feature","properties":{"NOM":"HD64H2","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4879108022,43.5765308403],[4.4885873101,43.5944995369],[4.5133106929,43.5940047917],[4.512626418,43.5760362638],[4.4879108022,43.5765308403]]]]}},{"type":"Feature","properties":{"NOM":"HD64H3","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4885873101,43.5944995369],[4.489264244,43.6124685295],[4.5139953864,43.6119736159],[4.5133106929,43.5940047917],[4.4885873101,43.5944995369]]]]}},{"type":"Feature","properties":{"NOM":"HD64H4","NUMPOINTS":36.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.489264244,43.6124685295],[4.4899416028,43.6304377879],[4.5146805043,43.6299427088],[4.5139953864,43.6119736159],[4.489264244,43.6124685295]]]]}},{"type":"Feature","properties":{"NOM":"HD64H5","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4899416028,43.6304377879],[4.4906193868,43.6484072878],[4.5153660528,43.6479120427],[4.5146805043,43.6299427088],[4.4899416028,43.6304377879]]]]}},{"type":"Feature","properties":{"NOM":"HD64H6","NUMPOINTS":34.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4906193868,43.6484072878],[4.4912975963,43.6663770274],[4.5160520323,43.6658816159],[4.5153660528,43.6479120427],[4.4906193868,43.6484072878]]]]}},{"type":"Feature","properties":{"NOM":"HD64H7","NUMPOINTS":49.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4912975963,43.6663770274],[4.4919762317,43.6843470052],[4.5167384432,43.6838514268],[4.5160520323,43.6658816159],[4.4912975963,43.6663770274]]]]}},{"type":"Feature","properties":{"NOM":"HD64H8","NUMPOINTS":68.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4919762317,43.6843470052],[4.4926553028,43.70231722],[4.5174252936,43.7018214746],[4.5167384432,43.6838514268],[4.4919762317,43.6843470052]]]]}},{"type":"Feature","properties":{"NOM":"HD64H9","NUMPOINTS":44.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.4926553028,43.70231722],[4.4933348646,43.7202876731],[4.518112644,43.7197917654],[4.5174252936,43.7018214746],[4.4926553028,43.70231722]]]]}},{"type":"Feature","properties":{"NOM":"HD62K5","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5078484096,43.4502636617],[4.50852972,43.4682303913],[4.5331983675,43.4677312006],[4.5325093177,43.449764641],[4.5078484096,43.4502636617]]]]}},{"type":"Feature","properties":{"NOM":"HD62K6","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.50852972,43.4682303913],[4.5092114584,43.4861973768],[4.5338878503,43.4856980161],[4.5331983675,43.4677312006],[4.50852972,43.4682303913]]]]}},{"type":"Feature","properties":{"NOM":"HD62K7","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5092114584,43.4861973768],[4.5098936162,43.5041646265],[4.5345777575,43.5036650938],[4.5338878503,43.4856980161],[4.5092114584,43.4861973768]]]]}},{"type":"Feature","properties":{"NOM":"HD62K8","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5098936162,43.5041646265],[4.5105761728,43.5221321613],[4.535268063,43.521632455],[4.5345777575,43.5036650938],[4.5098936162,43.5041646265]]]]}},{"type":"Feature","properties":{"NOM":"HD62K9","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5105761728,43.5221321613],[4.5112591584,43.5400999469],[4.5359588023,43.5396000669],[4.535268063,43.521632455],[4.5105761728,43.5221321613]]]]}},{"type":"Feature","properties":{"NOM":"HD64K0","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5112591584,43.5400999469],[4.5119425733,43.5580679816],[4.5366499759,43.5575679279],[4.5359588023,43.5396000669],[4.5112591584,43.5400999469]]]]}},{"type":"Feature","properties":{"NOM":"HD64K1","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5119425733,43.5580679816],[4.512626418,43.5760362638],[4.5373415841,43.5755360362],[4.5366499759,43.5575679279],[4.5119425733,43.5580679816]]]]}},{"type":"Feature","properties":{"NOM":"HD64K2","NUMPOINTS":17.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.512626418,43.5760362638],[4.5133106929,43.5940047917],[4.5380336274,43.5935043903],[4.5373415841,43.5755360362],[4.512626418,43.5760362638]]]]}},{"type":"Feature","properties":{"NOM":"HD64K3","NUMPOINTS":17.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5133106929,43.5940047917],[4.5139953864,43.6119736159],[4.5387260858,43.6114730409],[4.5380336274,43.5935043903],[4.5133106929,43.5940047917]]]]}},{"type":"Feature","properties":{"NOM":"HD64K4","NUMPOINTS":37.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5139953864,43.6119736159],[4.5146805043,43.6299427088],[4.5394189678,43.6294419638],[4.5387260858,43.6114730409],[4.5139953864,43.6119736159]]]]}},{"type":"Feature","properties":{"NOM":"HD64K5","NUMPOINTS":19.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5146805043,43.6299427088],[4.5153660528,43.6479120427],[4.5401122852,43.6474111277],[4.5394189678,43.6294419638],[4.5146805043,43.6299427088]]]]}},{"type":"Feature","properties":{"NOM":"HD64K6","NUMPOINTS":38.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5153660528,43.6479120427],[4.5160520323,43.6658816159],[4.5408060386,43.6653805308],[4.5401122852,43.6474111277],[4.5153660528,43.6479120427]]]]}},{"type":"Feature","properties":{"NOM":"HD64K7","NUMPOINTS":27.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5160520323,43.6658816159],[4.5167384432,43.6838514268],[4.5415002283,43.6833501715],[4.5408060386,43.6653805308],[4.5160520323,43.6658816159]]]]}},{"type":"Feature","properties":{"NOM":"HD64K8","NUMPOINTS":81.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5167384432,43.6838514268],[4.5174252936,43.7018214746],[4.5421948603,43.7013200491],[4.5415002283,43.6833501715],[4.5167384432,43.6838514268]]]]}},{"type":"Feature","properties":{"NOM":"HD64K9","NUMPOINTS":107.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5174252936,43.7018214746],[4.518112644,43.7197917654],[4.5428900007,43.7192901743],[4.5421948603,43.7013200491],[4.5174252936,43.7018214746]]]]}},{"type":"Feature","properties":{"NOM":"HD62L1","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5297574191,43.3779009483],[4.5304447577,43.3958665055],[4.5550820444,43.3953623597],[4.5543869853,43.3773969639],[4.5297574191,43.3779009483]]]]}},{"type":"Feature","properties":{"NOM":"HD62L4","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5318207003,43.431798339],[4.5325093177,43.449764641],[4.5571697933,43.4492599838],[4.5564734417,43.4312938535],[4.5318207003,43.431798339]]]]}},{"type":"Feature","properties":{"NOM":"HD62L5","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5325093177,43.449764641],[4.5331983675,43.4677312006],[4.5578665823,43.4672263716],[4.5571697933,43.4492599838],[4.5325093177,43.449764641]]]]}},{"type":"Feature","properties":{"NOM":"HD62L6","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5331983675,43.4677312006],[4.5338878503,43.4856980161],[4.558563809,43.4851930152],[4.5578665823,43.4672263716],[4.5331983675,43.4677312006]]]]}},{"type":"Feature","properties":{"NOM":"HD62L7","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5338878503,43.4856980161],[4.5345777575,43.5036650938],[4.5592614653,43.5031599192],[4.558563809,43.4851930152],[4.5338878503,43.4856980161]]]]}},{"type":"Feature","properties":{"NOM":"HD62L8","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5345777575,43.5036650938],[4.535268063,43.521632455],[4.5599595193,43.521127105],[4.5592614653,43.5031599192],[4.5345777575,43.5036650938]]]]}},{"type":"Feature","properties":{"NOM":"HD62L9","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.535268063,43.521632455],[4.5359588023,43.5396000669],[4.560658012,43.5390945413],[4.5599595193,43.521127105],[4.535268063,43.521632455]]]]}},{"type":"Feature","properties":{"NOM":"HD64L0","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5359588023,43.5396000669],[4.5366499759,43.5575679279],[4.5613569439,43.5570622267],[4.560658012,43.5390945413],[4.5359588023,43.5396000669]]]]}},{"type":"Feature","properties":{"NOM":"HD64L1","NUMPOINTS":21.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5366499759,43.5575679279],[4.5373415841,43.5755360362],[4.5620563152,43.5750301594],[4.5613569439,43.5570622267],[4.5366499759,43.5575679279]]]]}},{"type":"Feature","properties":{"NOM":"HD64L2","NUMPOINTS":53.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5373415841,43.5755360362],[4.5380336274,43.5935043903],[4.5627561265,43.5929983377],[4.5620563152,43.5750301594],[4.5373415841,43.5755360362]]]]}},{"type":"Feature","properties":{"NOM":"HD64L3","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5380336274,43.5935043903],[4.5387260858,43.6114730409],[4.56345635,43.6109668127],[4.5627561265,43.5929983377],[4.5380336274,43.5935043903]]]]}},{"type":"Feature","properties":{"NOM":"HD64L4","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5387260858,43.6114730409],[4.5394189678,43.6294419638],[4.5641569957,43.6289355637],[4.56345635,43.6109668127],[4.5387260858,43.6114730409]]]]}},{"type":"Feature","properties":{"NOM":"HD64L5","NUMPOINTS":20.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5394189678,43.6294419638],[4.5401122852,43.6474111277],[4.5648580817,43.6469045557],[4.5641569957,43.6289355637],[4.5394189678,43.6294419638]]]]}},{"type":"Feature","properties":{"NOM":"HD64L6","NUMPOINTS":41.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5401122852,43.6474111277],[4.5408060386,43.6653805308],[4.5655596086,43.6648737868],[4.5648580817,43.6469045557],[4.5401122852,43.6474111277]]]]}},{"type":"Feature","properties":{"NOM":"HD64L7","NUMPOINTS":75.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5408060386,43.6653805308],[4.5415002283,43.6833501715],[4.5662615765,43.6828432555],[4.5655596086,43.6648737868],[4.5408060386,43.6653805308]]]]}},{"type":"Feature","properties":{"NOM":"HD64L8","NUMPOINTS":105.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5415002283,43.6833501715],[4.5421948603,43.7013200491],[4.5669639897,43.7008129608],[4.5662615765,43.6828432555],[4.5415002283,43.6833501715]]]]}},{"type":"Feature","properties":{"NOM":"HD64L9","NUMPOINTS":35.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5421948603,43.7013200491],[4.5428900007,43.7192901743],[4.5676669197,43.7187829186],[4.5669639897,43.7008129608],[4.5421948603,43.7013200491]]]]}},{"type":"Feature","properties":{"NOM":"HD82A0","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.553692362,43.359431833],[4.5543869853,43.3773969639],[4.5790161158,43.3768873501],[4.5783137772,43.3589223823],[4.553692362,43.359431833]]]]}},{"type":"Feature","properties":{"NOM":"HD82A1","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5543869853,43.3773969639],[4.5550820444,43.3953623597],[4.579718895,43.3948525824],[4.5790161158,43.3768873501],[4.5543869853,43.3773969639]]]]}},{"type":"Feature","properties":{"NOM":"HD82A2","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5550820444,43.3953623597],[4.555777527,43.4133279824],[4.5804221025,43.412818036],[4.579718895,43.3948525824],[4.5550820444,43.3953623597]]]]}},{"type":"Feature","properties":{"NOM":"HD82A4","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5564734417,43.4312938535],[4.5571697933,43.4492599838],[4.5818298316,43.4487496902],[4.5811257461,43.4307837335],[4.5564734417,43.4312938535]]]]}},{"type":"Feature","properties":{"NOM":"HD82A5","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5571697933,43.4492599838],[4.5578665823,43.4672263716],[4.5825343593,43.4667159043],[4.5818298316,43.4487496902],[4.5571697933,43.4492599838]]]]}},{"type":"Feature","properties":{"NOM":"HD82A6","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5578665823,43.4672263716],[4.558563809,43.4851930152],[4.5832393295,43.4846823742],[4.5825343593,43.4667159043],[4.5578665823,43.4672263716]]]]}},{"type":"Feature","properties":{"NOM":"HD82A7","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.558563809,43.4851930152],[4.5592614653,43.5031599192],[4.5839447348,43.5026491029],[4.5832393295,43.4846823742],[4.558563809,43.4851930152]]]]}},{"type":"Feature","properties":{"NOM":"HD82A8","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5592614653,43.5031599192],[4.5599595193,43.521127105],[4.584650537,43.5206161113],[4.5839447348,43.5026491029],[4.5592614653,43.5031599192]]]]}},{"type":"Feature","properties":{"NOM":"HD82A9","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5599595193,43.521127105],[4.560658012,43.5390945413],[4.5853567827,43.5385833703],[4.584650537,43.5206161113],[4.5599595193,43.521127105]]]]}},{"type":"Feature","properties":{"NOM":"HD84A0","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.560658012,43.5390945413],[4.5613569439,43.5570622267],[4.5860634723,43.5565508782],[4.5853567827,43.5385833703],[4.560658012,43.5390945413]]]]}},{"type":"Feature","properties":{"NOM":"HD84A1","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5613569439,43.5570622267],[4.5620563152,43.5750301594],[4.5867706063,43.5745186334],[4.5860634723,43.5565508782],[4.5613569439,43.5570622267]]]]}},{"type":"Feature","properties":{"NOM":"HD84A2","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5620563152,43.5750301594],[4.5627561265,43.5929983377],[4.5874781852,43.5924866341],[4.5867706063,43.5745186334],[4.5620563152,43.5750301594]]]]}},{"type":"Feature","properties":{"NOM":"HD84A3","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5627561265,43.5929983377],[4.56345635,43.6109668127],[4.5881861743,43.6104549313],[4.5874781852,43.5924866341],[4.5627561265,43.5929983377]]]]}},{"type":"Feature","properties":{"NOM":"HD84A4","NUMPOINTS":60.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.56345635,43.6109668127],[4.5641569957,43.6289355637],[4.5888945833,43.6284235087],[4.5881861743,43.6104549313],[4.56345635,43.6109668127]]]]}},{"type":"Feature","properties":{"NOM":"HD84A5","NUMPOINTS":135.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5641569957,43.6289355637],[4.5648580817,43.6469045557],[4.5896034374,43.6463923269],[4.5888945833,43.6284235087],[4.5641569957,43.6289355637]]]]}},{"type":"Feature","properties":{"NOM":"HD84A6","NUMPOINTS":223.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5648580817,43.6469045557],[4.5655596086,43.6648737868],[4.5903127373,43.6643613842],[4.5896034374,43.6463923269],[4.5648580817,43.6469045557]]]]}},{"type":"Feature","properties":{"NOM":"HD84A7","NUMPOINTS":197.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5655596086,43.6648737868],[4.5662615765,43.6828432555],[4.5910224832,43.6823306789],[4.5903127373,43.6643613842],[4.5655596086,43.6648737868]]]]}},{"type":"Feature","properties":{"NOM":"HD84A8","NUMPOINTS":97.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5662615765,43.6828432555],[4.5669639897,43.7008129608],[4.5917326769,43.7003002099],[4.5910224832,43.6823306789],[4.5662615765,43.6828432555]]]]}},{"type":"Feature","properties":{"NOM":"HD80B9","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5776118788,43.340957681],[4.5783137772,43.3589223823],[4.6029347418,43.358407301],[4.6022251366,43.3404427651],[4.5776118788,43.340957681]]]]}},{"type":"Feature","properties":{"NOM":"HD82B0","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5783137772,43.3589223823],[4.5790161158,43.3768873501],[4.6036447915,43.3763721033],[4.6029347418,43.358407301],[4.5783137772,43.3589223823]]]]}},{"type":"Feature","properties":{"NOM":"HD82B1","NUMPOINTS":34.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5790161158,43.3768873501],[4.579718895,43.3948525824],[4.6043552861,43.3943371704],[4.6036447915,43.3763721033],[4.5790161158,43.3768873501]]]]}},{"type":"Feature","properties":{"NOM":"HD82B2","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.579718895,43.3948525824],[4.5804221025,43.412818036],[4.6050662127,43.4123024544],[4.6043552861,43.3943371704],[4.579718895,43.3948525824]]]]}},{"type":"Feature","properties":{"NOM":"HD82B3","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5804221025,43.412818036],[4.5811257461,43.4307837335],[4.6057775786,43.4302679785],[4.6050662127,43.4123024544],[4.5804221025,43.412818036]]]]}},{"type":"Feature","properties":{"NOM":"HD82B4","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5811257461,43.4307837335],[4.5818298316,43.4487496902],[4.6064893905,43.4482337621],[4.6057775786,43.4302679785],[4.5811257461,43.4307837335]]]]}},{"type":"Feature","properties":{"NOM":"HD82B5","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5818298316,43.4487496902],[4.5825343593,43.4667159043],[4.6072016486,43.4661998036],[4.6064893905,43.4482337621],[4.5818298316,43.4487496902]]]]}},{"type":"Feature","properties":{"NOM":"HD82B6","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5825343593,43.4667159043],[4.5832393295,43.4846823742],[4.6079143536,43.4841661015],[4.6072016486,43.4661998036],[4.5825343593,43.4667159043]]]]}},{"type":"Feature","properties":{"NOM":"HD82B7","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5832393295,43.4846823742],[4.5839447348,43.5026491029],[4.6086274991,43.5021326573],[4.6079143536,43.4841661015],[4.5832393295,43.4846823742]]]]}},{"type":"Feature","properties":{"NOM":"HD82B8","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5839447348,43.5026491029],[4.584650537,43.5206161113],[4.6093410433,43.5200994908],[4.6086274991,43.5021326573],[4.5839447348,43.5026491029]]]]}},{"type":"Feature","properties":{"NOM":"HD82B9","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.584650537,43.5206161113],[4.5853567827,43.5385833703],[4.6100550359,43.5380665755],[4.6093410433,43.5200994908],[4.584650537,43.5206161113]]]]}},{"type":"Feature","properties":{"NOM":"HD84B0","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5853567827,43.5385833703],[4.5860634723,43.5565508782],[4.6107694773,43.5560339095],[4.6100550359,43.5380665755],[4.5853567827,43.5385833703]]]]}},{"type":"Feature","properties":{"NOM":"HD84B1","NUMPOINTS":34.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5860634723,43.5565508782],[4.5867706063,43.5745186334],[4.6114843678,43.5740014911],[4.6107694773,43.5560339095],[4.5860634723,43.5565508782]]]]}},{"type":"Feature","properties":{"NOM":"HD84B2","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5867706063,43.5745186334],[4.5874781852,43.5924866341],[4.612199708,43.5919693189],[4.6114843678,43.5740014911],[4.5867706063,43.5745186334]]]]}},{"type":"Feature","properties":{"NOM":"HD84B3","NUMPOINTS":33.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5874781852,43.5924866341],[4.5881861743,43.6104549313],[4.6129154641,43.6099374389],[4.612199708,43.5919693189],[4.5874781852,43.5924866341]]]]}},{"type":"Feature","properties":{"NOM":"HD84B4","NUMPOINTS":78.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5881861743,43.6104549313],[4.5888945833,43.6284235087],[4.6136316434,43.6279058398],[4.6129154641,43.6099374389],[4.5881861743,43.6104549313]]]]}},{"type":"Feature","properties":{"NOM":"HD84B5","NUMPOINTS":80.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5888945833,43.6284235087],[4.5896034374,43.6463923269],[4.6143482742,43.6458744812],[4.6136316434,43.6279058398],[4.5888945833,43.6284235087]]]]}},{"type":"Feature","properties":{"NOM":"HD84B6","NUMPOINTS":169.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5896034374,43.6463923269],[4.5903127373,43.6643613842],[4.6150653568,43.6638433613],[4.6143482742,43.6458744812],[4.5896034374,43.6463923269]]]]}},{"type":"Feature","properties":{"NOM":"HD84B7","NUMPOINTS":300.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5903127373,43.6643613842],[4.5910224832,43.6823306789],[4.6157828917,43.6818124785],[4.6150653568,43.6638433613],[4.5903127373,43.6643613842]]]]}},{"type":"Feature","properties":{"NOM":"HD84B8","NUMPOINTS":233.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5910224832,43.6823306789],[4.5917326769,43.7003002099],[4.6165008793,43.699781831],[4.6157828917,43.6818124785],[4.5910224832,43.6823306789]]]]}},{"type":"Feature","properties":{"NOM":"HD84B9","NUMPOINTS":137.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5917326769,43.7003002099],[4.592443396,43.7182699984],[4.6172193866,43.7177514448],[4.6165008793,43.699781831],[4.5917326769,43.7003002099]]]]}},{"type":"Feature","properties":{"NOM":"HD86B0","NUMPOINTS":100.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.592443396,43.7182699984],[4.5931545626,43.7362400196],[4.6179383473,43.7357212911],[4.6172193866,43.7177514448],[4.592443396,43.7182699984]]]]}},{"type":"Feature","properties":{"NOM":"HD86B1","NUMPOINTS":90.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.5931545626,43.7362400196],[4.5938661771,43.7542102719],[4.6186577608,43.753691368],[4.6179383473,43.7357212911],[4.5931545626,43.7362400196]]]]}},{"type":"Feature","properties":{"NOM":"HD80C9","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6022251366,43.3404427651],[4.6029347418,43.358407301],[4.6275551838,43.3578865682],[4.6268378776,43.3399221958],[4.6022251366,43.3404427651]]]]}},{"type":"Feature","properties":{"NOM":"HD82C0","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6029347418,43.358407301],[4.6036447915,43.3763721033],[4.6282729393,43.375851207],[4.6275551838,43.3578865682],[4.6029347418,43.358407301]]]]}},{"type":"Feature","properties":{"NOM":"HD82C1","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6036447915,43.3763721033],[4.6043552861,43.3943371704],[4.6289911447,43.3938161106],[4.6282729393,43.375851207],[4.6036447915,43.3763721033]]]]}},{"type":"Feature","properties":{"NOM":"HD82C2","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6043552861,43.3943371704],[4.6050662127,43.4123024544],[4.6297097842,43.4117812304],[4.6289911447,43.3938161106],[4.6043552861,43.3943371704]]]]}},{"type":"Feature","properties":{"NOM":"HD82C3","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6050662127,43.4123024544],[4.6057775786,43.4302679785],[4.6304288658,43.4297465867],[4.6297097842,43.4117812304],[4.6050662127,43.4123024544]]]]}},{"type":"Feature","properties":{"NOM":"HD82C4","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6057775786,43.4302679785],[4.6064893905,43.4482337621],[4.6311483982,43.4477122025],[4.6304288658,43.4297465867],[4.6057775786,43.4302679785]]]]}},{"type":"Feature","properties":{"NOM":"HD82C5","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6064893905,43.4482337621],[4.6072016486,43.4661998036],[4.6318683817,43.4656780762],[4.6311483982,43.4477122025],[4.6064893905,43.4482337621]]]]}},{"type":"Feature","properties":{"NOM":"HD82C6","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6072016486,43.4661998036],[4.6079143536,43.4841661015],[4.6325888168,43.4836442062],[4.6318683817,43.4656780762],[4.6072016486,43.4661998036]]]]}},{"type":"Feature","properties":{"NOM":"HD82C7","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6079143536,43.4841661015],[4.6086274991,43.5021326573],[4.6333096995,43.5016105928],[4.6325888168,43.4836442062],[4.6079143536,43.4841661015]]]]}},{"type":"Feature","properties":{"NOM":"HD82C8","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6086274991,43.5021326573],[4.6093410433,43.5200994908],[4.6340309899,43.5195772542],[4.6333096995,43.5016105928],[4.6086274991,43.5021326573]]]]}},{"type":"Feature","properties":{"NOM":"HD82C9","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6093410433,43.5200994908],[4.6100550359,43.5380665755],[4.6347527334,43.5375441666],[4.6340309899,43.5195772542],[4.6093410433,43.5200994908]]]]}},{"type":"Feature","properties":{"NOM":"HD84C0","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6100550359,43.5380665755],[4.6107694773,43.5560339095],[4.6354749306,43.5555113283],[4.6347527334,43.5375441666],[4.6100550359,43.5380665755]]]]}},{"type":"Feature","properties":{"NOM":"HD84C1","NUMPOINTS":73.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6107694773,43.5560339095],[4.6114843678,43.5740014911],[4.6361975819,43.5734787376],[4.6354749306,43.5555113283],[4.6107694773,43.5560339095]]]]}},{"type":"Feature","properties":{"NOM":"HD84C2","NUMPOINTS":55.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6114843678,43.5740014911],[4.612199708,43.5919693189],[4.6369206876,43.5914463928],[4.6361975819,43.5734787376],[4.6114843678,43.5740014911]]]]}},{"type":"Feature","properties":{"NOM":"HD84C3","NUMPOINTS":57.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.612199708,43.5919693189],[4.6129154641,43.6099374389],[4.637644221,43.6094143323],[4.6369206876,43.5914463928],[4.612199708,43.5919693189]]]]}},{"type":"Feature","properties":{"NOM":"HD84C4","NUMPOINTS":86.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6129154641,43.6099374389],[4.6136316434,43.6279058398],[4.6383681855,43.6273825501],[4.637644221,43.6094143323],[4.6129154641,43.6099374389]]]]}},{"type":"Feature","properties":{"NOM":"HD84C5","NUMPOINTS":98.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6136316434,43.6279058398],[4.6143482742,43.6458744812],[4.6390926063,43.6453510082],[4.6383681855,43.6273825501],[4.6136316434,43.6279058398]]]]}},{"type":"Feature","properties":{"NOM":"HD84C6","NUMPOINTS":186.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6143482742,43.6458744812],[4.6150653568,43.6638433613],[4.6398174838,43.6633197051],[4.6390926063,43.6453510082],[4.6143482742,43.6458744812]]]]}},{"type":"Feature","properties":{"NOM":"HD84C7","NUMPOINTS":364.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6150653568,43.6638433613],[4.6157828917,43.6818124785],[4.6405428185,43.6812886389],[4.6398174838,43.6633197051],[4.6150653568,43.6638433613]]]]}},{"type":"Feature","properties":{"NOM":"HD84C8","NUMPOINTS":290.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6157828917,43.6818124785],[4.6165008793,43.699781831],[4.6412686108,43.699257808],[4.6405428185,43.6812886389],[4.6157828917,43.6818124785]]]]}},{"type":"Feature","properties":{"NOM":"HD84C9","NUMPOINTS":159.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6165008793,43.699781831],[4.6172193866,43.7177514448],[4.6419949079,43.7172272409],[4.6412686108,43.699257808],[4.6165008793,43.699781831]]]]}},{"type":"Feature","properties":{"NOM":"HD86C0","NUMPOINTS":135.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6172193866,43.7177514448],[4.6179383473,43.7357212911],[4.6427216645,43.7351969073],[4.6419949079,43.7172272409],[4.6172193866,43.7177514448]]]]}},{"type":"Feature","properties":{"NOM":"HD86C1","NUMPOINTS":119.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6179383473,43.7357212911],[4.6186577608,43.753691368],[4.643448879,43.7531668042],[4.6427216645,43.7351969073],[4.6179383473,43.7357212911]]]]}},{"type":"Feature","properties":{"NOM":"HD86C2","NUMPOINTS":109.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6186577608,43.753691368],[4.6193776278,43.7716616739],[4.6441765517,43.7711369299],[4.643448879,43.7531668042],[4.6186577608,43.753691368]]]]}},{"type":"Feature","properties":{"NOM":"HD86C3","NUMPOINTS":157.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6193776278,43.7716616739],[4.6200979485,43.7896322069],[4.6449046831,43.7891072829],[4.6441765517,43.7711369299],[4.6193776278,43.7716616739]]]]}},{"type":"Feature","properties":{"NOM":"HD86C6","NUMPOINTS":82.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6215401701,43.8255739962],[4.6222620078,43.8435452379],[4.6470922133,43.843019879],[4.6463625444,43.8250487729],[4.6215401701,43.8255739962]]]]}},{"type":"Feature","properties":{"NOM":"HD86C7","NUMPOINTS":130.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6222620078,43.8435452379],[4.6229843015,43.8615167028],[4.647822343,43.8609912081],[4.6470922133,43.843019879],[4.6222620078,43.8435452379]]]]}},{"type":"Feature","properties":{"NOM":"HD86C8","NUMPOINTS":102.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6229843015,43.8615167028],[4.6237070515,43.8794883891],[4.6485529341,43.8789627586],[4.647822343,43.8609912081],[4.6229843015,43.8615167028]]]]}},{"type":"Feature","properties":{"NOM":"HD80D9","NUMPOINTS":26.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6268378776,43.3399221958],[4.6275551838,43.3578865682],[4.6521751765,43.3573602081],[4.6514501696,43.339396001],[4.6268378776,43.3399221958]]]]}},{"type":"Feature","properties":{"NOM":"HD82D0","NUMPOINTS":17.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6275551838,43.3578865682],[4.6282729393,43.375851207],[4.6529006375,43.3753246816],[4.6521751765,43.3573602081],[4.6275551838,43.3578865682]]]]}},{"type":"Feature","properties":{"NOM":"HD82D1","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6282729393,43.375851207],[4.6289911447,43.3938161106],[4.6536265531,43.3932894198],[4.6529006375,43.3753246816],[4.6282729393,43.375851207]]]]}},{"type":"Feature","properties":{"NOM":"HD82D2","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6289911447,43.3938161106],[4.6297097842,43.4117812304],[4.6543529056,43.4112543736],[4.6536265531,43.3932894198],[4.6289911447,43.3938161106]]]]}},{"type":"Feature","properties":{"NOM":"HD82D3","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6297097842,43.4117812304],[4.6304288658,43.4297465867],[4.6550797024,43.4292195603],[4.6543529056,43.4112543736],[4.6297097842,43.4117812304]]]]}},{"type":"Feature","properties":{"NOM":"HD82D4","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6304288658,43.4297465867],[4.6311483982,43.4477122025],[4.6558069548,43.4471850066],[4.6550797024,43.4292195603],[4.6304288658,43.4297465867]]]]}},{"type":"Feature","properties":{"NOM":"HD82D5","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6311483982,43.4477122025],[4.6318683817,43.4656780762],[4.6565346632,43.4651507106],[4.6558069548,43.4471850066],[4.6311483982,43.4477122025]]]]}},{"type":"Feature","properties":{"NOM":"HD82D6","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6318683817,43.4656780762],[4.6325888168,43.4836442062],[4.6572628281,43.4831166708],[4.6565346632,43.4651507106],[4.6318683817,43.4656780762]]]]}},{"type":"Feature","properties":{"NOM":"HD82D7","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6325888168,43.4836442062],[4.6333096995,43.5016105928],[4.6579914472,43.5010828867],[4.6572628281,43.4831166708],[4.6325888168,43.4836442062]]]]}},{"type":"Feature","properties":{"NOM":"HD82D8","NUMPOINTS":25.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6333096995,43.5016105928],[4.6340309899,43.5195772542],[4.6587204832,43.5190493741],[4.6579914472,43.5010828867],[4.6333096995,43.5016105928]]]]}},{"type":"Feature","properties":{"NOM":"HD82D9","NUMPOINTS":19.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6340309899,43.5195772542],[4.6347527334,43.5375441666],[4.6594499773,43.5370161123],[4.6587204832,43.5190493741],[4.6340309899,43.5195772542]]]]}},{"type":"Feature","properties":{"NOM":"HD84D0","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6347527334,43.5375441666],[4.6354749306,43.5555113283],[4.6601799299,43.5549830998],[4.6594499773,43.5370161123],[4.6347527334,43.5375441666]]]]}},{"type":"Feature","properties":{"NOM":"HD84D1","NUMPOINTS":50.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6354749306,43.5555113283],[4.6361975819,43.5734787376],[4.6609103415,43.5729503349],[4.6601799299,43.5549830998],[4.6354749306,43.5555113283]]]]}},{"type":"Feature","properties":{"NOM":"HD84D2","NUMPOINTS":72.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6361975819,43.5734787376],[4.6369206876,43.5914463928],[4.6616412124,43.5909178159],[4.6609103415,43.5729503349],[4.6361975819,43.5734787376]]]]}},{"type":"Feature","properties":{"NOM":"HD84D3","NUMPOINTS":67.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6369206876,43.5914463928],[4.637644221,43.6094143323],[4.6623725222,43.6088855735],[4.6616412124,43.5909178159],[4.6369206876,43.5914463928]]]]}},{"type":"Feature","properties":{"NOM":"HD84D4","NUMPOINTS":62.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.637644221,43.6094143323],[4.6383681855,43.6273825501],[4.6631042713,43.6268536063],[4.6623725222,43.6088855735],[4.637644221,43.6094143323]]]]}},{"type":"Feature","properties":{"NOM":"HD84D5","NUMPOINTS":92.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6383681855,43.6273825501],[4.6390926063,43.6453510082],[4.6638364816,43.6448218794],[4.6631042713,43.6268536063],[4.6383681855,43.6273825501]]]]}},{"type":"Feature","properties":{"NOM":"HD84D6","NUMPOINTS":274.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6390926063,43.6453510082],[4.6398174838,43.6633197051],[4.6645691535,43.662790391],[4.6638364816,43.6448218794],[4.6390926063,43.6453510082]]]]}},{"type":"Feature","properties":{"NOM":"HD84D7","NUMPOINTS":181.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6398174838,43.6633197051],[4.6405428185,43.6812886389],[4.6653022876,43.6807591396],[4.6645691535,43.662790391],[4.6398174838,43.6633197051]]]]}},{"type":"Feature","properties":{"NOM":"HD84D8","NUMPOINTS":127.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6405428185,43.6812886389],[4.6412686108,43.699257808],[4.6660358842,43.6987281235],[4.6653022876,43.6807591396],[4.6405428185,43.6812886389]]]]}},{"type":"Feature","properties":{"NOM":"HD84D9","NUMPOINTS":159.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6412686108,43.699257808],[4.6419949079,43.7172272409],[4.6667699718,43.7166973735],[4.6660358842,43.6987281235],[4.6412686108,43.699257808]]]]}},{"type":"Feature","properties":{"NOM":"HD86D0","NUMPOINTS":50.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6419949079,43.7172272409],[4.6427216645,43.7351969073],[4.6675045239,43.734666858],[4.6667699718,43.7166973735],[4.6419949079,43.7172272409]]]]}},{"type":"Feature","properties":{"NOM":"HD86D1","NUMPOINTS":90.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6427216645,43.7351969073],[4.643448879,43.7531668042],[4.6682395388,43.7526365731],[4.6675045239,43.734666858],[4.6427216645,43.7351969073]]]]}},{"type":"Feature","properties":{"NOM":"HD86D2","NUMPOINTS":118.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.643448879,43.7531668042],[4.6441765517,43.7711369299],[4.6689750169,43.7706065169],[4.6682395388,43.7526365731],[4.643448879,43.7531668042]]]]}},{"type":"Feature","properties":{"NOM":"HD86D3","NUMPOINTS":182.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6441765517,43.7711369299],[4.6449046831,43.7891072829],[4.6697109585,43.7885766878],[4.6689750169,43.7706065169],[4.6441765517,43.7711369299]]]]}},{"type":"Feature","properties":{"NOM":"HD86D4","NUMPOINTS":379.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6449046831,43.7891072829],[4.645633336,43.8070778917],[4.670447424,43.8065471285],[4.6697109585,43.7885766878],[4.6449046831,43.7891072829]]]]}},{"type":"Feature","properties":{"NOM":"HD86D5","NUMPOINTS":432.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.645633336,43.8070778917],[4.6463625444,43.8250487729],[4.6711844582,43.8245178723],[4.670447424,43.8065471285],[4.645633336,43.8070778917]]]]}},{"type":"Feature","properties":{"NOM":"HD86D6","NUMPOINTS":235.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6463625444,43.8250487729],[4.6470922133,43.843019879],[4.6719219579,43.8424888407],[4.6711844582,43.8245178723],[4.6463625444,43.8250487729]]]]}},{"type":"Feature","properties":{"NOM":"HD86D7","NUMPOINTS":178.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6470922133,43.843019879],[4.647822343,43.8609912081],[4.6726599234,43.8604600323],[4.6719219579,43.8424888407],[4.6470922133,43.843019879]]]]}},{"type":"Feature","properties":{"NOM":"HD86D8","NUMPOINTS":231.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.647822343,43.8609912081],[4.6485529341,43.8789627586],[4.6733983551,43.8784314452],[4.6726599234,43.8604600323],[4.647822343,43.8609912081]]]]}},{"type":"Feature","properties":{"NOM":"HD80E9","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6514501696,43.339396001],[4.6521751765,43.3573602081],[4.6767947151,43.3568282207],[4.676062008,43.3388641807],[4.6514501696,43.339396001]]]]}},{"type":"Feature","properties":{"NOM":"HD82E0","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6521751765,43.3573602081],[4.6529006375,43.3753246816],[4.6775278811,43.374792527],[4.6767947151,43.3568282207],[4.6521751765,43.3573602081]]]]}},{"type":"Feature","properties":{"NOM":"HD82E1","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6529006375,43.3753246816],[4.6536265531,43.3932894198],[4.6782615066,43.3927570979],[4.6775278811,43.374792527],[4.6529006375,43.3753246816]]]]}},{"type":"Feature","properties":{"NOM":"HD82E2","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6536265531,43.3932894198],[4.6543529056,43.4112543736],[4.6789955718,43.4107218843],[4.6782615066,43.3927570979],[4.6536265531,43.3932894198]]]]}},{"type":"Feature","properties":{"NOM":"HD82E3","NUMPOINTS":9.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6543529056,43.4112543736],[4.6550797024,43.4292195603],[4.6797300834,43.4286868996],[4.6789955718,43.4107218843],[4.6543529056,43.4112543736]]]]}},{"type":"Feature","properties":{"NOM":"HD82E4","NUMPOINTS":32.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6550797024,43.4292195603],[4.6558069548,43.4471850066],[4.6804650555,43.4466521744],[4.6797300834,43.4286868996],[4.6550797024,43.4292195603]]]]}},{"type":"Feature","properties":{"NOM":"HD82E5","NUMPOINTS":31.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6558069548,43.4471850066],[4.6565346632,43.4651507106],[4.6812004884,43.4646177069],[4.6804650555,43.4466521744],[4.6558069548,43.4471850066]]]]}},{"type":"Feature","properties":{"NOM":"HD82E6","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6565346632,43.4651507106],[4.6572628281,43.4831166708],[4.6819363825,43.4825834955],[4.6812004884,43.4646177069],[4.6565346632,43.4651507106]]]]}},{"type":"Feature","properties":{"NOM":"HD82E7","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6572628281,43.4831166708],[4.6579914472,43.5010828867],[4.6826727373,43.5005495391],[4.6819363825,43.4825834955],[4.6572628281,43.4831166708]]]]}},{"type":"Feature","properties":{"NOM":"HD82E8","NUMPOINTS":31.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6579914472,43.5010828867],[4.6587204832,43.5190493741],[4.6834095186,43.5185158505],[4.6826727373,43.5005495391],[4.6579914472,43.5010828867]]]]}},{"type":"Feature","properties":{"NOM":"HD82E9","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6587204832,43.5190493741],[4.6594499773,43.5370161123],[4.6841467628,43.5364824128],[4.6834095186,43.5185158505],[4.6587204832,43.5190493741]]]]}},{"type":"Feature","properties":{"NOM":"HD84E0","NUMPOINTS":34.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6594499773,43.5370161123],[4.6601799299,43.5549830998],[4.6848844704,43.5544492243],[4.6841467628,43.5364824128],[4.6594499773,43.5370161123]]]]}},{"type":"Feature","properties":{"NOM":"HD84E1","NUMPOINTS":77.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6601799299,43.5549830998],[4.6609103415,43.5729503349],[4.6856226418,43.5724162833],[4.6848844704,43.5544492243],[4.6601799299,43.5549830998]]]]}},{"type":"Feature","properties":{"NOM":"HD84E2","NUMPOINTS":61.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6609103415,43.5729503349],[4.6616412124,43.5909178159],[4.6863612774,43.5903835881],[4.6856226418,43.5724162833],[4.6609103415,43.5729503349]]]]}},{"type":"Feature","properties":{"NOM":"HD84E3","NUMPOINTS":125.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6616412124,43.5909178159],[4.6623725222,43.6088855735],[4.6871003625,43.6083511627],[4.6863612774,43.5903835881],[4.6616412124,43.5909178159]]]]}},{"type":"Feature","properties":{"NOM":"HD84E4","NUMPOINTS":51.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6623725222,43.6088855735],[4.6631042713,43.6268536063],[4.6878398958,43.6263190086],[4.6871003625,43.6083511627],[4.6623725222,43.6088855735]]]]}},{"type":"Feature","properties":{"NOM":"HD84E5","NUMPOINTS":110.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6631042713,43.6268536063],[4.6638364816,43.6448218794],[4.6885798953,43.6442870947],[4.6878398958,43.6263190086],[4.6631042713,43.6268536063]]]]}},{"type":"Feature","properties":{"NOM":"HD84E6","NUMPOINTS":225.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6638364816,43.6448218794],[4.6645691535,43.662790391],[4.6893203612,43.6622554194],[4.6885798953,43.6442870947],[4.6638364816,43.6448218794]]]]}},{"type":"Feature","properties":{"NOM":"HD84E7","NUMPOINTS":267.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6645691535,43.662790391],[4.6653022876,43.6807591396],[4.6900612942,43.6802239809],[4.6893203612,43.6622554194],[4.6645691535,43.662790391]]]]}},{"type":"Feature","properties":{"NOM":"HD84E8","NUMPOINTS":65.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6653022876,43.6807591396],[4.6660358842,43.6987281235],[4.6908026946,43.6981927776],[4.6900612942,43.6802239809],[4.6653022876,43.6807591396]]]]}},{"type":"Feature","properties":{"NOM":"HD84E9","NUMPOINTS":96.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6660358842,43.6987281235],[4.6667699718,43.7166973735],[4.6915445733,43.7161618426],[4.6908026946,43.6981927776],[4.6660358842,43.6987281235]]]]}},{"type":"Feature","properties":{"NOM":"HD86E0","NUMPOINTS":64.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6667699718,43.7166973735],[4.6675045239,43.734666858],[4.6922869205,43.7341311435],[4.6915445733,43.7161618426],[4.6667699718,43.7166973735]]]]}},{"type":"Feature","properties":{"NOM":"HD86E1","NUMPOINTS":118.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6675045239,43.734666858],[4.6682395388,43.7526365731],[4.6930297354,43.7521006748],[4.6922869205,43.7341311435],[4.6675045239,43.734666858]]]]}},{"type":"Feature","properties":{"NOM":"HD86E2","NUMPOINTS":184.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6682395388,43.7526365731],[4.6689750169,43.7706065169],[4.6937730184,43.7700704348],[4.6930297354,43.7521006748],[4.6682395388,43.7526365731]]]]}},{"type":"Feature","properties":{"NOM":"HD86E3","NUMPOINTS":146.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6689750169,43.7706065169],[4.6697109585,43.7885766878],[4.6945167698,43.7880404219],[4.6937730184,43.7700704348],[4.6689750169,43.7706065169]]]]}},{"type":"Feature","properties":{"NOM":"HD86E4","NUMPOINTS":254.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6697109585,43.7885766878],[4.670447424,43.8065471285],[4.695261047,43.80601069],[4.6945167698,43.7880404219],[4.6697109585,43.7885766878]]]]}},{"type":"Feature","properties":{"NOM":"HD86E5","NUMPOINTS":305.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.670447424,43.8065471285],[4.6711844582,43.8245178723],[4.6960059067,43.8239812944],[4.695261047,43.80601069],[4.670447424,43.8065471285]]]]}},{"type":"Feature","properties":{"NOM":"HD86E6","NUMPOINTS":172.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6711844582,43.8245178723],[4.6719219579,43.8424888407],[4.6967512368,43.8419521234],[4.6960059067,43.8239812944],[4.6711844582,43.8245178723]]]]}},{"type":"Feature","properties":{"NOM":"HD86E7","NUMPOINTS":201.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6719219579,43.8424888407],[4.6726599234,43.8604600323],[4.6974970376,43.8599231755],[4.6967512368,43.8419521234],[4.6719219579,43.8424888407]]]]}},{"type":"Feature","properties":{"NOM":"HD86E8","NUMPOINTS":361.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6726599234,43.8604600323],[4.6733983551,43.8784314452],[4.6982433096,43.8778944489],[4.6974970376,43.8599231755],[4.6726599234,43.8604600323]]]]}},{"type":"Feature","properties":{"NOM":"HD86E9","NUMPOINTS":178.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6733983551,43.8784314452],[4.6741372536,43.8964030778],[4.6989900532,43.895865942],[4.6982433096,43.8778944489],[4.6733983551,43.8784314452]]]]}},{"type":"Feature","properties":{"NOM":"HD80F9","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.676062008,43.3388641807],[4.6767947151,43.3568282207],[4.7014137895,43.3562906007],[4.7006733856,43.3383267328],[4.676062008,43.3388641807]]]]}},{"type":"Feature","properties":{"NOM":"HD82F0","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6767947151,43.3568282207],[4.6775278811,43.374792527],[4.7021546569,43.3742547341],[4.7014137895,43.3562906007],[4.6767947151,43.3568282207]]]]}},{"type":"Feature","properties":{"NOM":"HD82F1","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6775278811,43.374792527],[4.6782615066,43.3927570979],[4.7028959881,43.3922191316],[4.7021546569,43.3742547341],[4.6775278811,43.374792527]]]]}},{"type":"Feature","properties":{"NOM":"HD82F2","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6782615066,43.3927570979],[4.6789955718,43.4107218843],[4.7036377625,43.4101837455],[4.7028959881,43.3922191316],[4.6782615066,43.3927570979]]]]}},{"type":"Feature","properties":{"NOM":"HD82F3","NUMPOINTS":25.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6789955718,43.4107218843],[4.6797300834,43.4286868996],[4.7043799857,43.4281485859],[4.7036377625,43.4101837455],[4.6789955718,43.4107218843]]]]}},{"type":"Feature","properties":{"NOM":"HD82F4","NUMPOINTS":36.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6797300834,43.4286868996],[4.6804650555,43.4466521744],[4.7051226742,43.4461136862],[4.7043799857,43.4281485859],[4.6797300834,43.4286868996]]]]}},{"type":"Feature","properties":{"NOM":"HD82F5","NUMPOINTS":67.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6804650555,43.4466521744],[4.6812004884,43.4646177069],[4.7058658285,43.4640790448],[4.7051226742,43.4461136862],[4.6804650555,43.4466521744]]]]}},{"type":"Feature","properties":{"NOM":"HD82F6","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6812004884,43.4646177069],[4.6819363825,43.4825834955],[4.706609449,43.48204466],[4.7058658285,43.4640790448],[4.6812004884,43.4646177069]]]]}},{"type":"Feature","properties":{"NOM":"HD82F7","NUMPOINTS":21.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6819363825,43.4825834955],[4.6826727373,43.5005495391],[4.7073535361,43.5000105302],[4.706609449,43.48204466],[4.6819363825,43.4825834955]]]]}},{"type":"Feature","properties":{"NOM":"HD82F8","NUMPOINTS":27.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6826727373,43.5005495391],[4.6834095186,43.5185158505],[4.7080980602,43.5179766662],[4.7073535361,43.5000105302],[4.6826727373,43.5005495391]]]]}},{"type":"Feature","properties":{"NOM":"HD82F9","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6834095186,43.5185158505],[4.6841467628,43.5364824128],[4.7088430522,43.5359430538],[4.7080980602,43.5179766662],[4.6834095186,43.5185158505]]]]}},{"type":"Feature","properties":{"NOM":"HD84F0","NUMPOINTS":29.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6841467628,43.5364824128],[4.6848844704,43.5544492243],[4.7095885126,43.5539096913],[4.7088430522,43.5359430538],[4.6841467628,43.5364824128]]]]}},{"type":"Feature","properties":{"NOM":"HD84F1","NUMPOINTS":53.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6848844704,43.5544492243],[4.6856226418,43.5724162833],[4.7103344418,43.571876577],[4.7095885126,43.5539096913],[4.6848844704,43.5544492243]]]]}},{"type":"Feature","properties":{"NOM":"HD84F2","NUMPOINTS":83.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6856226418,43.5724162833],[4.6863612774,43.5903835881],[4.7110808403,43.5898437094],[4.7103344418,43.571876577],[4.6856226418,43.5724162833]]]]}},{"type":"Feature","properties":{"NOM":"HD84F3","NUMPOINTS":36.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6863612774,43.5903835881],[4.6871003625,43.6083511627],[4.7118277,43.6078111066],[4.7110808403,43.5898437094],[4.6863612774,43.5903835881]]]]}},{"type":"Feature","properties":{"NOM":"HD84F4","NUMPOINTS":87.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6871003625,43.6083511627],[4.6878398958,43.6263190086],[4.7125750195,43.6257787726],[4.7118277,43.6078111066],[4.6871003625,43.6083511627]]]]}},{"type":"Feature","properties":{"NOM":"HD84F5","NUMPOINTS":132.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6878398958,43.6263190086],[4.6885798953,43.6442870947],[4.7133228106,43.6437466798],[4.7125750195,43.6257787726],[4.6878398958,43.6263190086]]]]}},{"type":"Feature","properties":{"NOM":"HD84F6","NUMPOINTS":214.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6885798953,43.6442870947],[4.6893203612,43.6622554194],[4.7140710738,43.6617148265],[4.7133228106,43.6437466798],[4.6885798953,43.6442870947]]]]}},{"type":"Feature","properties":{"NOM":"HD84F7","NUMPOINTS":160.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6893203612,43.6622554194],[4.6900612942,43.6802239809],[4.7148198094,43.6796832109],[4.7140710738,43.6617148265],[4.6893203612,43.6622554194]]]]}},{"type":"Feature","properties":{"NOM":"HD84F8","NUMPOINTS":154.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6900612942,43.6802239809],[4.6908026946,43.6981927776],[4.715569018,43.6976518315],[4.7148198094,43.6796832109],[4.6900612942,43.6802239809]]]]}},{"type":"Feature","properties":{"NOM":"HD84F9","NUMPOINTS":153.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6908026946,43.6981927776],[4.6915445733,43.7161618426],[4.7163187132,43.7156207262],[4.715569018,43.6976518315],[4.6908026946,43.6981927776]]]]}},{"type":"Feature","properties":{"NOM":"HD86F0","NUMPOINTS":402.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6915445733,43.7161618426],[4.6922869205,43.7341311435],[4.7170688851,43.7335898602],[4.7163187132,43.7156207262],[4.6915445733,43.7161618426]]]]}},{"type":"Feature","properties":{"NOM":"HD86F1","NUMPOINTS":243.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6922869205,43.7341311435],[4.6930297354,43.7521006748],[4.7178195323,43.7515592258],[4.7170688851,43.7335898602],[4.6922869205,43.7341311435]]]]}},{"type":"Feature","properties":{"NOM":"HD86F2","NUMPOINTS":50.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6930297354,43.7521006748],[4.6937730184,43.7700704348],[4.718570655,43.7695288213],[4.7178195323,43.7515592258],[4.6930297354,43.7521006748]]]]}},{"type":"Feature","properties":{"NOM":"HD86F3","NUMPOINTS":214.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6937730184,43.7700704348],[4.6945167698,43.7880404219],[4.7193222539,43.7874986452],[4.718570655,43.7695288213],[4.6937730184,43.7700704348]]]]}},{"type":"Feature","properties":{"NOM":"HD86F4","NUMPOINTS":156.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6945167698,43.7880404219],[4.695261047,43.80601069],[4.7200743752,43.8054687478],[4.7193222539,43.7874986452],[4.6945167698,43.7880404219]]]]}},{"type":"Feature","properties":{"NOM":"HD86F5","NUMPOINTS":98.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.695261047,43.80601069],[4.6960059067,43.8239812944],[4.7208270773,43.8234391945],[4.7200743752,43.8054687478],[4.695261047,43.80601069]]]]}},{"type":"Feature","properties":{"NOM":"HD86F6","NUMPOINTS":139.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6960059067,43.8239812944],[4.6967512368,43.8419521234],[4.7215802555,43.8414098642],[4.7208270773,43.8234391945],[4.6960059067,43.8239812944]]]]}},{"type":"Feature","properties":{"NOM":"HD86F7","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6967512368,43.8419521234],[4.6974970376,43.8599231755],[4.7223339102,43.8593807552],[4.7215802555,43.8414098642],[4.6967512368,43.8419521234]]]]}},{"type":"Feature","properties":{"NOM":"HD86F8","NUMPOINTS":46.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6974970376,43.8599231755],[4.6982433096,43.8778944489],[4.7230880419,43.8773518659],[4.7223339102,43.8593807552],[4.6974970376,43.8599231755]]]]}},{"type":"Feature","properties":{"NOM":"HD86F9","NUMPOINTS":148.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6982433096,43.8778944489],[4.6989900532,43.895865942],[4.7238426509,43.8953231945],[4.7230880419,43.8773518659],[4.6982433096,43.8778944489]]]]}},{"type":"Feature","properties":{"NOM":"HD88F0","NUMPOINTS":116.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.6989900532,43.895865942],[4.6997373606,43.9138376544],[4.7245977973,43.9132947352],[4.7238426509,43.8953231945],[4.6989900532,43.895865942]]]]}},{"type":"Feature","properties":{"NOM":"HD80G9","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7006733856,43.3383267328],[4.7014137895,43.3562906007],[4.7260323153,43.3557472631],[4.7252842188,43.3377835763],[4.7006733856,43.3383267328]]]]}},{"type":"Feature","properties":{"NOM":"HD82G0","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7014137895,43.3562906007],[4.7021546569,43.3742547341],[4.72678088,43.3737112155],[4.7260323153,43.3557472631],[4.7014137895,43.3562906007]]]]}},{"type":"Feature","properties":{"NOM":"HD82G1","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7021546569,43.3742547341],[4.7028959881,43.3922191316],[4.7275299134,43.3916754319],[4.72678088,43.3737112155],[4.7021546569,43.3742547341]]]]}},{"type":"Feature","properties":{"NOM":"HD82G2","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7028959881,43.3922191316],[4.7036377625,43.4101837455],[4.728279398,43.4096398756],[4.7275299134,43.3916754319],[4.7028959881,43.3922191316]]]]}},{"type":"Feature","properties":{"NOM":"HD82G3","NUMPOINTS":25.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7036377625,43.4101837455],[4.7043799857,43.4281485859],[4.7290293369,43.4276045506],[4.728279398,43.4096398756],[4.7036377625,43.4101837455]]]]}},{"type":"Feature","properties":{"NOM":"HD82G4","NUMPOINTS":66.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7043799857,43.4281485859],[4.7051226742,43.4461136862],[4.729779746,43.4455694855],[4.7290293369,43.4276045506],[4.7043799857,43.4281485859]]]]}},{"type":"Feature","properties":{"NOM":"HD82G5","NUMPOINTS":34.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7051226742,43.4461136862],[4.7058658285,43.4640790448],[4.7305306257,43.4635346787],[4.729779746,43.4455694855],[4.7051226742,43.4461136862]]]]}},{"type":"Feature","properties":{"NOM":"HD82G6","NUMPOINTS":80.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7058658285,43.4640790448],[4.706609449,43.48204466],[4.7312819764,43.4815001284],[4.7305306257,43.4635346787],[4.7058658285,43.4640790448]]]]}},{"type":"Feature","properties":{"NOM":"HD82G7","NUMPOINTS":62.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.706609449,43.48204466],[4.7073535361,43.5000105302],[4.7320337986,43.499465833],[4.7312819764,43.4815001284],[4.706609449,43.48204466]]]]}},{"type":"Feature","properties":{"NOM":"HD82G8","NUMPOINTS":101.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7073535361,43.5000105302],[4.7080980602,43.5179766662],[4.7327860704,43.5174318023],[4.7320337986,43.499465833],[4.7073535361,43.5000105302]]]]}},{"type":"Feature","properties":{"NOM":"HD82G9","NUMPOINTS":64.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7080980602,43.5179766662],[4.7088430522,43.5359430538],[4.7335388144,43.5353980233],[4.7327860704,43.5174318023],[4.7080980602,43.5179766662]]]]}},{"type":"Feature","properties":{"NOM":"HD84G0","NUMPOINTS":121.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7088430522,43.5359430538],[4.7095885126,43.5539096913],[4.7342920315,43.5533644943],[4.7335388144,43.5353980233],[4.7088430522,43.5359430538]]]]}},{"type":"Feature","properties":{"NOM":"HD84G1","NUMPOINTS":112.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7095885126,43.5539096913],[4.7103344418,43.571876577],[4.7350457224,43.5713312134],[4.7342920315,43.5533644943],[4.7095885126,43.5539096913]]]]}},{"type":"Feature","properties":{"NOM":"HD84G2","NUMPOINTS":77.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7103344418,43.571876577],[4.7110808403,43.5898437094],[4.7357998874,43.5892981791],[4.7350457224,43.5713312134],[4.7103344418,43.571876577]]]]}},{"type":"Feature","properties":{"NOM":"HD84G3","NUMPOINTS":56.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7110808403,43.5898437094],[4.7118277,43.6078111066],[4.7365545258,43.6072654053],[4.7357998874,43.5892981791],[4.7110808403,43.5898437094]]]]}},{"type":"Feature","properties":{"NOM":"HD84G4","NUMPOINTS":53.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7118277,43.6078111066],[4.7125750195,43.6257787726],[4.7373096381,43.6252328973],[4.7365545258,43.6072654053],[4.7118277,43.6078111066]]]]}},{"type":"Feature","properties":{"NOM":"HD84G5","NUMPOINTS":72.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7125750195,43.6257787726],[4.7133228106,43.6437466798],[4.7380652269,43.6432006305],[4.7373096381,43.6252328973],[4.7125750195,43.6257787726]]]]}},{"type":"Feature","properties":{"NOM":"HD84G6","NUMPOINTS":181.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7133228106,43.6437466798],[4.7140710738,43.6617148265],[4.7388212927,43.661168603],[4.7380652269,43.6432006305],[4.7133228106,43.6437466798]]]]}},{"type":"Feature","properties":{"NOM":"HD84G7","NUMPOINTS":112.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7140710738,43.6617148265],[4.7148198094,43.6796832109],[4.7395778359,43.6791368133],[4.7388212927,43.661168603],[4.7140710738,43.6617148265]]]]}},{"type":"Feature","properties":{"NOM":"HD84G8","NUMPOINTS":125.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7148198094,43.6796832109],[4.715569018,43.6976518315],[4.7403348569,43.6971052597],[4.7395778359,43.6791368133],[4.7148198094,43.6796832109]]]]}},{"type":"Feature","properties":{"NOM":"HD84G9","NUMPOINTS":87.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.715569018,43.6976518315],[4.7163187132,43.7156207262],[4.7410923818,43.715073986],[4.7403348569,43.6971052597],[4.715569018,43.6976518315]]]]}},{"type":"Feature","properties":{"NOM":"HD86G0","NUMPOINTS":143.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7163187132,43.7156207262],[4.7170688851,43.7335898602],[4.7418503912,43.7330429543],[4.7410923818,43.715073986],[4.7163187132,43.7156207262]]]]}},{"type":"Feature","properties":{"NOM":"HD86G1","NUMPOINTS":203.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7170688851,43.7335898602],[4.7178195323,43.7515592258],[4.7426088807,43.7510121542],[4.7418503912,43.7330429543],[4.7170688851,43.7335898602]]]]}},{"type":"Feature","properties":{"NOM":"HD86G2","NUMPOINTS":30.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7178195323,43.7515592258],[4.718570655,43.7695288213],[4.7433678509,43.768981584],[4.7426088807,43.7510121542],[4.7178195323,43.7515592258]]]]}},{"type":"Feature","properties":{"NOM":"HD86G3","NUMPOINTS":233.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.718570655,43.7695288213],[4.7193222539,43.7874986452],[4.7441273021,43.7869512421],[4.7433678509,43.768981584],[4.718570655,43.7695288213]]]]}},{"type":"Feature","properties":{"NOM":"HD86G4","NUMPOINTS":177.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7193222539,43.7874986452],[4.7200743752,43.8054687478],[4.7448872693,43.8049211725],[4.7441273021,43.7869512421],[4.7193222539,43.7874986452]]]]}},{"type":"Feature","properties":{"NOM":"HD86G5","NUMPOINTS":183.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7200743752,43.8054687478],[4.7208270773,43.8234391945],[4.745647809,43.8228914489],[4.7448872693,43.8049211725],[4.7200743752,43.8054687478]]]]}},{"type":"Feature","properties":{"NOM":"HD86G6","NUMPOINTS":175.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7208270773,43.8234391945],[4.7215802555,43.8414098642],[4.7464088298,43.8408619482],[4.745647809,43.8228914489],[4.7208270773,43.8234391945]]]]}},{"type":"Feature","properties":{"NOM":"HD86G7","NUMPOINTS":73.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7215802555,43.8414098642],[4.7223339102,43.8593807552],[4.7471703319,43.8588326688],[4.7464088298,43.8408619482],[4.7215802555,43.8414098642]]]]}},{"type":"Feature","properties":{"NOM":"HD86G8","NUMPOINTS":73.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7223339102,43.8593807552],[4.7230880419,43.8773518659],[4.747932316,43.8768036091],[4.7471703319,43.8588326688],[4.7223339102,43.8593807552]]]]}},{"type":"Feature","properties":{"NOM":"HD86G9","NUMPOINTS":141.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7230880419,43.8773518659],[4.7238426509,43.8953231945],[4.7486947824,43.8947747672],[4.747932316,43.8768036091],[4.7230880419,43.8773518659]]]]}},{"type":"Feature","properties":{"NOM":"HD88G0","NUMPOINTS":311.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7238426509,43.8953231945],[4.7245977973,43.9132947352],[4.749457761,43.9127461319],[4.7486947824,43.8947747672],[4.7238426509,43.8953231945]]]]}},{"type":"Feature","properties":{"NOM":"HD88G1","NUMPOINTS":105.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7245977973,43.9132947352],[4.7253534409,43.9312664885],[4.7502212328,43.9307177069],[4.749457761,43.9127461319],[4.7245977973,43.9132947352]]]]}},{"type":"Feature","properties":{"NOM":"HD80H9","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7252842188,43.3377835763],[4.7260323153,43.3557472631],[4.7506503729,43.3551982995],[4.7498945843,43.3372347955],[4.7252842188,43.3377835763]]]]}},{"type":"Feature","properties":{"NOM":"HD82H0","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7260323153,43.3557472631],[4.72678088,43.3737112155],[4.7514066345,43.373162069],[4.7506503729,43.3551982995],[4.7260323153,43.3557472631]]]]}},{"type":"Feature","properties":{"NOM":"HD82H1","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.72678088,43.3737112155],[4.7275299134,43.3916754319],[4.7521633695,43.3911261023],[4.7514066345,43.373162069],[4.72678088,43.3737112155]]]]}},{"type":"Feature","properties":{"NOM":"HD82H2","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7275299134,43.3916754319],[4.728279398,43.4096398756],[4.7529205637,43.4090903731],[4.7521633695,43.3911261023],[4.7275299134,43.3916754319]]]]}},{"type":"Feature","properties":{"NOM":"HD82H3","NUMPOINTS":109.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.728279398,43.4096398756],[4.7290293369,43.4276045506],[4.7536782179,43.4270548809],[4.7529205637,43.4090903731],[4.728279398,43.4096398756]]]]}},{"type":"Feature","properties":{"NOM":"HD82H4","NUMPOINTS":49.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7290293369,43.4276045506],[4.729779746,43.4455694855],[4.7544363471,43.4450196486],[4.7536782179,43.4270548809],[4.7290293369,43.4276045506]]]]}},{"type":"Feature","properties":{"NOM":"HD82H5","NUMPOINTS":77.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.729779746,43.4455694855],[4.7305306257,43.4635346787],[4.7551949518,43.4629846745],[4.7544363471,43.4450196486],[4.729779746,43.4455694855]]]]}},{"type":"Feature","properties":{"NOM":"HD82H6","NUMPOINTS":60.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7305306257,43.4635346787],[4.7312819764,43.4815001284],[4.7559540324,43.4809499569],[4.7551949518,43.4629846745],[4.7305306257,43.4635346787]]]]}},{"type":"Feature","properties":{"NOM":"HD82H7","NUMPOINTS":73.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7312819764,43.4815001284],[4.7320337986,43.499465833],[4.7567135893,43.4989154941],[4.7559540324,43.4809499569],[4.7312819764,43.4815001284]]]]}},{"type":"Feature","properties":{"NOM":"HD82H8","NUMPOINTS":102.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7320337986,43.499465833],[4.7327860704,43.5174318023],[4.7574736079,43.5168812947],[4.7567135893,43.4989154941],[4.7320337986,43.499465833]]]]}},{"type":"Feature","properties":{"NOM":"HD82H9","NUMPOINTS":61.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7327860704,43.5174318023],[4.7335388144,43.5353980233],[4.7582341033,43.5348473474],[4.7574736079,43.5168812947],[4.7327860704,43.5174318023]]]]}},{"type":"Feature","properties":{"NOM":"HD84H0","NUMPOINTS":44.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7335388144,43.5353980233],[4.7342920315,43.5533644943],[4.7589950768,43.5528136499],[4.7582341033,43.5348473474],[4.7335388144,43.5353980233]]]]}},{"type":"Feature","properties":{"NOM":"HD84H1","NUMPOINTS":111.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7342920315,43.5533644943],[4.7350457224,43.5713312134],[4.7597565289,43.5707802006],[4.7589950768,43.5528136499],[4.7342920315,43.5533644943]]]]}},{"type":"Feature","properties":{"NOM":"HD84H2","NUMPOINTS":106.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7350457224,43.5713312134],[4.7357998874,43.5892981791],[4.76051846,43.5887469978],[4.7597565289,43.5707802006],[4.7350457224,43.5713312134]]]]}},{"type":"Feature","properties":{"NOM":"HD84H3","NUMPOINTS":97.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7357998874,43.5892981791],[4.7365545258,43.6072654053],[4.7612808755,43.6067140515],[4.76051846,43.5887469978],[4.7357998874,43.5892981791]]]]}},{"type":"Feature","properties":{"NOM":"HD84H4","NUMPOINTS":119.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7365545258,43.6072654053],[4.7373096381,43.6252328973],[4.7620437802,43.6246813677],[4.7612808755,43.6067140515],[4.7365545258,43.6072654053]]]]}},{"type":"Feature","properties":{"NOM":"HD84H5","NUMPOINTS":170.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7373096381,43.6252328973],[4.7380652269,43.6432006305],[4.7628071663,43.6426489249],[4.7620437802,43.6246813677],[4.7373096381,43.6252328973]]]]}},{"type":"Feature","properties":{"NOM":"HD84H6","NUMPOINTS":176.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7380652269,43.6432006305],[4.7388212927,43.661168603],[4.7635710343,43.6606167215],[4.7628071663,43.6426489249],[4.7380652269,43.6432006305]]]]}},{"type":"Feature","properties":{"NOM":"HD84H7","NUMPOINTS":121.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7388212927,43.661168603],[4.7395778359,43.6791368133],[4.7643353845,43.6785847557],[4.7635710343,43.6606167215],[4.7388212927,43.661168603]]]]}},{"type":"Feature","properties":{"NOM":"HD84H8","NUMPOINTS":79.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7395778359,43.6791368133],[4.7403348569,43.6971052597],[4.7651002176,43.696553026],[4.7643353845,43.6785847557],[4.7395778359,43.6791368133]]]]}},{"type":"Feature","properties":{"NOM":"HD84H9","NUMPOINTS":131.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7403348569,43.6971052597],[4.7410923818,43.715073986],[4.7658655707,43.7145215815],[4.7651002176,43.696553026],[4.7403348569,43.6971052597]]]]}},{"type":"Feature","properties":{"NOM":"HD86H0","NUMPOINTS":112.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7410923818,43.715073986],[4.7418503912,43.7330429543],[4.7666314171,43.7324903824],[4.7658655707,43.7145215815],[4.7410923818,43.715073986]]]]}},{"type":"Feature","properties":{"NOM":"HD86H1","NUMPOINTS":89.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7418503912,43.7330429543],[4.7426088807,43.7510121542],[4.7673977486,43.7504594147],[4.7666314171,43.7324903824],[4.7418503912,43.7330429543]]]]}},{"type":"Feature","properties":{"NOM":"HD86H2","NUMPOINTS":37.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7426088807,43.7510121542],[4.7433678509,43.768981584],[4.7681645658,43.7684286769],[4.7673977486,43.7504594147],[4.7426088807,43.7510121542]]]]}},{"type":"Feature","properties":{"NOM":"HD86H3","NUMPOINTS":167.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7433678509,43.768981584],[4.7441273021,43.7869512421],[4.7689318689,43.7863981673],[4.7681645658,43.7684286769],[4.7433678509,43.768981584]]]]}},{"type":"Feature","properties":{"NOM":"HD86H4","NUMPOINTS":193.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7441273021,43.7869512421],[4.7448872693,43.8049211725],[4.7696996831,43.8043679238],[4.7689318689,43.7863981673],[4.7441273021,43.7869512421]]]]}},{"type":"Feature","properties":{"NOM":"HD86H5","NUMPOINTS":159.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7448872693,43.8049211725],[4.745647809,43.8228914489],[4.77046806,43.822338028],[4.7696996831,43.8043679238],[4.7448872693,43.8049211725]]]]}},{"type":"Feature","properties":{"NOM":"HD86H6","NUMPOINTS":269.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.745647809,43.8228914489],[4.7464088298,43.8408619482],[4.7712369227,43.8403083551],[4.77046806,43.822338028],[4.745647809,43.8228914489]]]]}},{"type":"Feature","properties":{"NOM":"HD86H7","NUMPOINTS":368.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7464088298,43.8408619482],[4.7471703319,43.8588326688],[4.7720062719,43.8582789035],[4.7712369227,43.8403083551],[4.7464088298,43.8408619482]]]]}},{"type":"Feature","properties":{"NOM":"HD86H8","NUMPOINTS":153.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7471703319,43.8588326688],[4.747932316,43.8768036091],[4.772776108,43.8762496714],[4.7720062719,43.8582789035],[4.7471703319,43.8588326688]]]]}},{"type":"Feature","properties":{"NOM":"HD86H9","NUMPOINTS":176.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.747932316,43.8768036091],[4.7486947824,43.8947747672],[4.7735464314,43.8942206571],[4.772776108,43.8762496714],[4.747932316,43.8768036091]]]]}},{"type":"Feature","properties":{"NOM":"HD88H0","NUMPOINTS":496.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7486947824,43.8947747672],[4.749457761,43.9127461319],[4.774317244,43.9121918446],[4.7735464314,43.8942206571],[4.7486947824,43.8947747672]]]]}},{"type":"Feature","properties":{"NOM":"HD88H1","NUMPOINTS":210.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.749457761,43.9127461319],[4.7502212328,43.9307177069],[4.7750885436,43.9301632393],[4.774317244,43.9121918446],[4.749457761,43.9127461319]]]]}},{"type":"Feature","properties":{"NOM":"HD80K9","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7498945843,43.3372347955],[4.7506503729,43.3551982995],[4.7752679574,43.3546437099],[4.7745044771,43.3366803906],[4.7498945843,43.3372347955]]]]}},{"type":"Feature","properties":{"NOM":"HD82K0","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7506503729,43.3551982995],[4.7514066345,43.373162069],[4.7760319155,43.3726072946],[4.7752679574,43.3546437099],[4.7506503729,43.3551982995]]]]}},{"type":"Feature","properties":{"NOM":"HD82K1","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7514066345,43.373162069],[4.7521633695,43.3911261023],[4.7767963518,43.3905711432],[4.7760319155,43.3726072946],[4.7514066345,43.373162069]]]]}},{"type":"Feature","properties":{"NOM":"HD82K2","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7521633695,43.3911261023],[4.7529205637,43.4090903731],[4.7775612548,43.4085352381],[4.7767963518,43.3905711432],[4.7521633695,43.3911261023]]]]}},{"type":"Feature","properties":{"NOM":"HD82K3","NUMPOINTS":21.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7529205637,43.4090903731],[4.7536782179,43.4270548809],[4.7783266239,43.4264995769],[4.7775612548,43.4085352381],[4.7529205637,43.4090903731]]]]}},{"type":"Feature","properties":{"NOM":"HD82K4","NUMPOINTS":27.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7536782179,43.4270548809],[4.7544363471,43.4450196486],[4.7790924728,43.4444641755],[4.7783266239,43.4264995769],[4.7536782179,43.4270548809]]]]}},{"type":"Feature","properties":{"NOM":"HD82K5","NUMPOINTS":72.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7544363471,43.4450196486],[4.7551949518,43.4629846745],[4.779858802,43.4624290323],[4.7790924728,43.4444641755],[4.7544363471,43.4450196486]]]]}},{"type":"Feature","properties":{"NOM":"HD82K6","NUMPOINTS":102.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7551949518,43.4629846745],[4.7559540324,43.4809499569],[4.780625612,43.4803941455],[4.779858802,43.4624290323],[4.7551949518,43.4629846745]]]]}},{"type":"Feature","properties":{"NOM":"HD82K7","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7559540324,43.4809499569],[4.7567135893,43.4989154941],[4.7813929031,43.4983595134],[4.780625612,43.4803941455],[4.7559540324,43.4809499569]]]]}},{"type":"Feature","properties":{"NOM":"HD82K8","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7567135893,43.4989154941],[4.7574736079,43.5168812947],[4.7821606678,43.5163251436],[4.7813929031,43.4983595134],[4.7567135893,43.4989154941]]]]}},{"type":"Feature","properties":{"NOM":"HD82K9","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7574736079,43.5168812947],[4.7582341033,43.5348473474],[4.7829289142,43.5342910261],[4.7821606678,43.5163251436],[4.7574736079,43.5168812947]]]]}},{"type":"Feature","properties":{"NOM":"HD84K0","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7582341033,43.5348473474],[4.7589950768,43.5528136499],[4.7836976436,43.5522571584],[4.7829289142,43.5342910261],[4.7582341033,43.5348473474]]]]}},{"type":"Feature","properties":{"NOM":"HD84K1","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7589950768,43.5528136499],[4.7597565289,43.5707802006],[4.7844668564,43.5702235388],[4.7836976436,43.5522571584],[4.7589950768,43.5528136499]]]]}},{"type":"Feature","properties":{"NOM":"HD84K2","NUMPOINTS":40.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7597565289,43.5707802006],[4.76051846,43.5887469978],[4.7852365531,43.5881901655],[4.7844668564,43.5702235388],[4.7597565289,43.5707802006]]]]}},{"type":"Feature","properties":{"NOM":"HD84K3","NUMPOINTS":111.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.76051846,43.5887469978],[4.7612808755,43.6067140515],[4.7860067445,43.6061570453],[4.7852365531,43.5881901655],[4.76051846,43.5887469978]]]]}},{"type":"Feature","properties":{"NOM":"HD84K4","NUMPOINTS":60.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7612808755,43.6067140515],[4.7620437802,43.6246813677],[4.786777441,43.6241241838],[4.7860067445,43.6061570453],[4.7612808755,43.6067140515]]]]}},{"type":"Feature","properties":{"NOM":"HD84K5","NUMPOINTS":71.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7620437802,43.6246813677],[4.7628071663,43.6426489249],[4.7875486239,43.6420915633],[4.786777441,43.6241241838],[4.7620437802,43.6246813677]]]]}},{"type":"Feature","properties":{"NOM":"HD84K6","NUMPOINTS":127.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7628071663,43.6426489249],[4.7635710343,43.6606167215],[4.7883202936,43.660059182],[4.7875486239,43.6420915633],[4.7628071663,43.6426489249]]]]}},{"type":"Feature","properties":{"NOM":"HD84K7","NUMPOINTS":141.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7635710343,43.6606167215],[4.7643353845,43.6785847557],[4.7890924505,43.6780270383],[4.7883202936,43.660059182],[4.7635710343,43.6606167215]]]]}},{"type":"Feature","properties":{"NOM":"HD84K8","NUMPOINTS":75.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7643353845,43.6785847557],[4.7651002176,43.696553026],[4.7898650951,43.6959951306],[4.7890924505,43.6780270383],[4.7643353845,43.6785847557]]]]}},{"type":"Feature","properties":{"NOM":"HD84K9","NUMPOINTS":180.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7651002176,43.696553026],[4.7658655707,43.7145215815],[4.7906382751,43.713963513],[4.7898650951,43.6959951306],[4.7651002176,43.696553026]]]]}},{"type":"Feature","properties":{"NOM":"HD86K0","NUMPOINTS":255.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7658655707,43.7145215815],[4.7666314171,43.7324903824],[4.7914119581,43.7319321444],[4.7906382751,43.713963513],[4.7658655707,43.7145215815]]]]}},{"type":"Feature","properties":{"NOM":"HD86K1","NUMPOINTS":119.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7666314171,43.7324903824],[4.7673977486,43.7504594147],[4.7921861312,43.7499010074],[4.7914119581,43.7319321444],[4.7666314171,43.7324903824]]]]}},{"type":"Feature","properties":{"NOM":"HD86K2","NUMPOINTS":69.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7673977486,43.7504594147],[4.7681645658,43.7684286769],[4.7929607948,43.7678701001],[4.7921861312,43.7499010074],[4.7673977486,43.7504594147]]]]}},{"type":"Feature","properties":{"NOM":"HD86K3","NUMPOINTS":197.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7681645658,43.7684286769],[4.7689318689,43.7863981673],[4.7937359494,43.7858394209],[4.7929607948,43.7678701001],[4.7681645658,43.7684286769]]]]}},{"type":"Feature","properties":{"NOM":"HD86K4","NUMPOINTS":336.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7689318689,43.7863981673],[4.7696996831,43.8043679238],[4.7945116116,43.8038090018],[4.7937359494,43.7858394209],[4.7689318689,43.7863981673]]]]}},{"type":"Feature","properties":{"NOM":"HD86K5","NUMPOINTS":197.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7696996831,43.8043679238],[4.77046806,43.822338028],[4.7952878251,43.821778932],[4.7945116116,43.8038090018],[4.7696996831,43.8043679238]]]]}},{"type":"Feature","properties":{"NOM":"HD86K6","NUMPOINTS":390.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.77046806,43.822338028],[4.7712369227,43.8403083551],[4.7960645295,43.8397490851],[4.7952878251,43.821778932],[4.77046806,43.822338028]]]]}},{"type":"Feature","properties":{"NOM":"HD86K7","NUMPOINTS":510.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7712369227,43.8403083551],[4.7720062719,43.8582789035],[4.7968417253,43.8577194593],[4.7960645295,43.8397490851],[4.7712369227,43.8403083551]]]]}},{"type":"Feature","properties":{"NOM":"HD86K8","NUMPOINTS":294.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7720062719,43.8582789035],[4.772776108,43.8762496714],[4.7976194129,43.875690053],[4.7968417253,43.8577194593],[4.7720062719,43.8582789035]]]]}},{"type":"Feature","properties":{"NOM":"HD86K9","NUMPOINTS":429.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.772776108,43.8762496714],[4.7735464314,43.8942206571],[4.7983975928,43.8936608645],[4.7976194129,43.875690053],[4.772776108,43.8762496714]]]]}},{"type":"Feature","properties":{"NOM":"HD88K0","NUMPOINTS":524.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7735464314,43.8942206571],[4.774317244,43.9121918446],[4.7991762415,43.9116318733],[4.7983975928,43.8936608645],[4.7735464314,43.8942206571]]]]}},{"type":"Feature","properties":{"NOM":"HD88K1","NUMPOINTS":254.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.774317244,43.9121918446],[4.7750885436,43.9301632393],[4.7999553683,43.9296030859],[4.7991762415,43.9116318733],[4.774317244,43.9121918446]]]]}},{"type":"Feature","properties":{"NOM":"HD80L9","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7745044771,43.3366803906],[4.7752679574,43.3546437099],[4.7998850641,43.3540834945],[4.7991138926,43.3361203617],[4.7745044771,43.3366803906]]]]}},{"type":"Feature","properties":{"NOM":"HD82L0","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7752679574,43.3546437099],[4.7760319155,43.3726072946],[4.8006567175,43.3720468924],[4.7998850641,43.3540834945],[4.7752679574,43.3546437099]]]]}},{"type":"Feature","properties":{"NOM":"HD82L1","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7760319155,43.3726072946],[4.7767963518,43.3905711432],[4.801428854,43.3900105541],[4.8006567175,43.3720468924],[4.7760319155,43.3726072946]]]]}},{"type":"Feature","properties":{"NOM":"HD82L2","NUMPOINTS":64.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7767963518,43.3905711432],[4.7775612548,43.4085352381],[4.8022014646,43.4079744702],[4.801428854,43.3900105541],[4.7767963518,43.3905711432]]]]}},{"type":"Feature","properties":{"NOM":"HD82L3","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7775612548,43.4085352381],[4.7783266239,43.4264995769],[4.8029745477,43.4259386374],[4.8022014646,43.4079744702],[4.7775612548,43.4085352381]]]]}},{"type":"Feature","properties":{"NOM":"HD82L4","NUMPOINTS":9.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7783266239,43.4264995769],[4.7790924728,43.4444641755],[4.8037481156,43.4439030643],[4.8029745477,43.4259386374],[4.7783266239,43.4264995769]]]]}},{"type":"Feature","properties":{"NOM":"HD82L5","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7790924728,43.4444641755],[4.779858802,43.4624290323],[4.8045221687,43.461867749],[4.8037481156,43.4439030643],[4.7790924728,43.4444641755]]]]}},{"type":"Feature","properties":{"NOM":"HD82L6","NUMPOINTS":65.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.779858802,43.4624290323],[4.780625612,43.4803941455],[4.8052967075,43.4798326899],[4.8045221687,43.461867749],[4.779858802,43.4624290323]]]]}},{"type":"Feature","properties":{"NOM":"HD82L7","NUMPOINTS":29.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.780625612,43.4803941455],[4.7813929031,43.4983595134],[4.8060717325,43.4977978853],[4.8052967075,43.4798326899],[4.780625612,43.4803941455]]]]}},{"type":"Feature","properties":{"NOM":"HD82L8","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7813929031,43.4983595134],[4.7821606678,43.5163251436],[4.8068472419,43.515763343],[4.8060717325,43.4977978853],[4.7813929031,43.4983595134]]]]}},{"type":"Feature","properties":{"NOM":"HD82L9","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7821606678,43.5163251436],[4.7829289142,43.5342910261],[4.8076232384,43.5337290534],[4.8068472419,43.515763343],[4.7821606678,43.5163251436]]]]}},{"type":"Feature","properties":{"NOM":"HD84L0","NUMPOINTS":44.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7829289142,43.5342910261],[4.7836976436,43.5522571584],[4.8083997227,43.5516950137],[4.8076232384,43.5337290534],[4.7829289142,43.5342910261]]]]}},{"type":"Feature","properties":{"NOM":"HD84L1","NUMPOINTS":157.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7836976436,43.5522571584],[4.7844668564,43.5702235388],[4.8091766953,43.5696612221],[4.8083997227,43.5516950137],[4.7836976436,43.5522571584]]]]}},{"type":"Feature","properties":{"NOM":"HD84L2","NUMPOINTS":122.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7844668564,43.5702235388],[4.7852365531,43.5881901655],[4.8099541567,43.5876276771],[4.8091766953,43.5696612221],[4.7844668564,43.5702235388]]]]}},{"type":"Feature","properties":{"NOM":"HD84L3","NUMPOINTS":93.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7852365531,43.5881901655],[4.7860067445,43.6061570453],[4.8107321205,43.6055943819],[4.8099541567,43.5876276771],[4.7852365531,43.5881901655]]]]}},{"type":"Feature","properties":{"NOM":"HD84L4","NUMPOINTS":149.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7860067445,43.6061570453],[4.786777441,43.6241241838],[4.8115106037,43.6235613408],[4.8107321205,43.6055943819],[4.7860067445,43.6061570453]]]]}},{"type":"Feature","properties":{"NOM":"HD84L5","NUMPOINTS":191.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.786777441,43.6241241838],[4.7875486239,43.6420915633],[4.8122895775,43.6415285406],[4.8115106037,43.6235613408],[4.786777441,43.6241241838]]]]}},{"type":"Feature","properties":{"NOM":"HD84L6","NUMPOINTS":311.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7875486239,43.6420915633],[4.7883202936,43.660059182],[4.8130690424,43.6594959796],[4.8122895775,43.6415285406],[4.7875486239,43.6420915633]]]]}},{"type":"Feature","properties":{"NOM":"HD84L7","NUMPOINTS":136.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7883202936,43.660059182],[4.7890924505,43.6780270383],[4.8138489989,43.6774636563],[4.8130690424,43.6594959796],[4.7883202936,43.660059182]]]]}},{"type":"Feature","properties":{"NOM":"HD84L8","NUMPOINTS":45.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7890924505,43.6780270383],[4.7898650951,43.6959951306],[4.8146294474,43.6954315689],[4.8138489989,43.6774636563],[4.7890924505,43.6780270383]]]]}},{"type":"Feature","properties":{"NOM":"HD84L9","NUMPOINTS":221.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7898650951,43.6959951306],[4.7906382751,43.713963513],[4.8154104404,43.7133997641],[4.8146294474,43.6954315689],[4.7898650951,43.6959951306]]]]}},{"type":"Feature","properties":{"NOM":"HD86L0","NUMPOINTS":362.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7906382751,43.713963513],[4.7914119581,43.7319321444],[4.8161919445,43.7313682075],[4.8154104404,43.7133997641],[4.7906382751,43.713963513]]]]}},{"type":"Feature","properties":{"NOM":"HD86L1","NUMPOINTS":224.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7914119581,43.7319321444],[4.7921861312,43.7499010074],[4.8169739424,43.7493368807],[4.8161919445,43.7313682075],[4.7914119581,43.7319321444]]]]}},{"type":"Feature","properties":{"NOM":"HD86L2","NUMPOINTS":45.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7921861312,43.7499010074],[4.7929607948,43.7678701001],[4.8177564346,43.7673057822],[4.8169739424,43.7493368807],[4.7921861312,43.7499010074]]]]}},{"type":"Feature","properties":{"NOM":"HD86L3","NUMPOINTS":257.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7929607948,43.7678701001],[4.7937359494,43.7858394209],[4.8185394215,43.7852749102],[4.8177564346,43.7673057822],[4.7929607948,43.7678701001]]]]}},{"type":"Feature","properties":{"NOM":"HD86L4","NUMPOINTS":407.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7937359494,43.7858394209],[4.7945116116,43.8038090018],[4.819322915,43.8032442878],[4.8185394215,43.7852749102],[4.7937359494,43.7858394209]]]]}},{"type":"Feature","properties":{"NOM":"HD86L5","NUMPOINTS":291.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7945116116,43.8038090018],[4.7952878251,43.821778932],[4.8201069558,43.8212140002],[4.819322915,43.8032442878],[4.7945116116,43.8038090018]]]]}},{"type":"Feature","properties":{"NOM":"HD86L6","NUMPOINTS":238.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7952878251,43.821778932],[4.7960645295,43.8397490851],[4.8208914921,43.8391839324],[4.8201069558,43.8212140002],[4.7952878251,43.821778932]]]]}},{"type":"Feature","properties":{"NOM":"HD86L7","NUMPOINTS":272.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7960645295,43.8397490851],[4.7968417253,43.8577194593],[4.8216765244,43.8571540828],[4.8208914921,43.8391839324],[4.7960645295,43.8397490851]]]]}},{"type":"Feature","properties":{"NOM":"HD86L8","NUMPOINTS":409.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7968417253,43.8577194593],[4.7976194129,43.875690053],[4.8224620532,43.8751244498],[4.8216765244,43.8571540828],[4.7968417253,43.8577194593]]]]}},{"type":"Feature","properties":{"NOM":"HD86L9","NUMPOINTS":446.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7976194129,43.875690053],[4.7983975928,43.8936608645],[4.823248079,43.8930950315],[4.8224620532,43.8751244498],[4.7976194129,43.875690053]]]]}},{"type":"Feature","properties":{"NOM":"HD88L0","NUMPOINTS":568.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7983975928,43.8936608645],[4.7991762415,43.9116318733],[4.8240345502,43.9110658129],[4.823248079,43.8930950315],[4.7983975928,43.8936608645]]]]}},{"type":"Feature","properties":{"NOM":"HD88L1","NUMPOINTS":391.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7991762415,43.9116318733],[4.7999553683,43.9296030859],[4.8248214842,43.9290367976],[4.8240345502,43.9110658129],[4.7991762415,43.9116318733]]]]}},{"type":"Feature","properties":{"NOM":"KD00A9","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7991138926,43.3361203617],[4.7998850641,43.3540834945],[4.8245016633,43.3535176439],[4.8237228007,43.3355546988],[4.7991138926,43.3361203617]]]]}},{"type":"Feature","properties":{"NOM":"KD02A0","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.7998850641,43.3540834945],[4.8006567175,43.3720468924],[4.8252810133,43.3714808544],[4.8245016633,43.3535176439],[4.7998850641,43.3540834945]]]]}},{"type":"Feature","properties":{"NOM":"KD02A1","NUMPOINTS":76.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8006567175,43.3720468924],[4.801428854,43.3900105541],[4.8260608513,43.3894443287],[4.8252810133,43.3714808544],[4.8006567175,43.3720468924]]]]}},{"type":"Feature","properties":{"NOM":"KD02A2","NUMPOINTS":47.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.801428854,43.3900105541],[4.8022014646,43.4079744702],[4.8268411709,43.4074080626],[4.8260608513,43.3894443287],[4.801428854,43.3900105541]]]]}},{"type":"Feature","properties":{"NOM":"KD02A3","NUMPOINTS":26.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8022014646,43.4079744702],[4.8029745477,43.4259386374],[4.8276219699,43.425372054],[4.8268411709,43.4074080626],[4.8022014646,43.4079744702]]]]}},{"type":"Feature","properties":{"NOM":"KD02A4","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8029745477,43.4259386374],[4.8037481156,43.4439030643],[4.8284032585,43.4433363049],[4.8276219699,43.425372054],[4.8029745477,43.4259386374]]]]}},{"type":"Feature","properties":{"NOM":"KD02A5","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8037481156,43.4439030643],[4.8045221687,43.461867749],[4.8291850372,43.4613008135],[4.8284032585,43.4433363049],[4.8037481156,43.4439030643]]]]}},{"type":"Feature","properties":{"NOM":"KD02A6","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8045221687,43.461867749],[4.8052967075,43.4798326899],[4.8299673065,43.4792655784],[4.8291850372,43.4613008135],[4.8045221687,43.461867749]]]]}},{"type":"Feature","properties":{"NOM":"KD02A7","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8052967075,43.4798326899],[4.8060717325,43.4977978853],[4.8307500667,43.4972305977],[4.8299673065,43.4792655784],[4.8052967075,43.4798326899]]]]}},{"type":"Feature","properties":{"NOM":"KD02A8","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8060717325,43.4977978853],[4.8068472419,43.515763343],[4.8315333203,43.5151958827],[4.8307500667,43.4972305977],[4.8060717325,43.4977978853]]]]}},{"type":"Feature","properties":{"NOM":"KD02A9","NUMPOINTS":20.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8068472419,43.515763343],[4.8076232384,43.5337290534],[4.8323170666,43.5331614215],[4.8315333203,43.5151958827],[4.8068472419,43.515763343]]]]}},{"type":"Feature","properties":{"NOM":"KD04A0","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8076232384,43.5337290534],[4.8083997227,43.5516950137],[4.8331013055,43.55112721],[4.8323170666,43.5331614215],[4.8076232384,43.5337290534]]]]}},{"type":"Feature","properties":{"NOM":"KD04A1","NUMPOINTS":44.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8083997227,43.5516950137],[4.8091766953,43.5696612221],[4.8338860375,43.5690932467],[4.8331013055,43.55112721],[4.8083997227,43.5516950137]]]]}},{"type":"Feature","properties":{"NOM":"KD04A2","NUMPOINTS":59.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8091766953,43.5696612221],[4.8099541567,43.5876276771],[4.8346712631,43.5870595299],[4.8338860375,43.5690932467],[4.8091766953,43.5696612221]]]]}},{"type":"Feature","properties":{"NOM":"KD04A3","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8099541567,43.5876276771],[4.8107321205,43.6055943819],[4.8354569969,43.6050260598],[4.8346712631,43.5870595299],[4.8099541567,43.5876276771]]]]}},{"type":"Feature","properties":{"NOM":"KD04A4","NUMPOINTS":121.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8107321205,43.6055943819],[4.8115106037,43.6235613408],[4.8362432618,43.6229928379],[4.8354569969,43.6050260598],[4.8107321205,43.6055943819]]]]}},{"type":"Feature","properties":{"NOM":"KD04A5","NUMPOINTS":240.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8115106037,43.6235613408],[4.8122895775,43.6415285406],[4.8370300223,43.6409598569],[4.8362432618,43.6229928379],[4.8115106037,43.6235613408]]]]}},{"type":"Feature","properties":{"NOM":"KD04A6","NUMPOINTS":138.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8122895775,43.6415285406],[4.8130690424,43.6594959796],[4.8378172787,43.658927115],[4.8370300223,43.6409598569],[4.8122895775,43.6415285406]]]]}},{"type":"Feature","properties":{"NOM":"KD04A7","NUMPOINTS":71.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8130690424,43.6594959796],[4.8138489989,43.6774636563],[4.8386050316,43.6768946108],[4.8378172787,43.658927115],[4.8130690424,43.6594959796]]]]}},{"type":"Feature","properties":{"NOM":"KD04A8","NUMPOINTS":38.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8138489989,43.6774636563],[4.8146294474,43.6954315689],[4.8393932814,43.6948623423],[4.8386050316,43.6768946108],[4.8138489989,43.6774636563]]]]}},{"type":"Feature","properties":{"NOM":"KD04A9","NUMPOINTS":225.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8146294474,43.6954315689],[4.8154104404,43.7133997641],[4.8401820822,43.7128303427],[4.8393932814,43.6948623423],[4.8146294474,43.6954315689]]]]}},{"type":"Feature","properties":{"NOM":"KD06A0","NUMPOINTS":184.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8154104404,43.7133997641],[4.8161919445,43.7313682075],[4.8409714028,43.7307985885],[4.8401820822,43.7128303427],[4.8154104404,43.7133997641]]]]}},{"type":"Feature","properties":{"NOM":"KD06A1","NUMPOINTS":128.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8161919445,43.7313682075],[4.8169739424,43.7493368807],[4.8417612221,43.7487670642],[4.8409714028,43.7307985885],[4.8161919445,43.7313682075]]]]}},{"type":"Feature","properties":{"NOM":"KD06A2","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8169739424,43.7493368807],[4.8177564346,43.7673057822],[4.8425515406,43.7667357679],[4.8417612221,43.7487670642],[4.8169739424,43.7493368807]]]]}},{"type":"Feature","properties":{"NOM":"KD06A3","NUMPOINTS":321.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8177564346,43.7673057822],[4.8185394215,43.7852749102],[4.8433423588,43.7847046982],[4.8425515406,43.7667357679],[4.8177564346,43.7673057822]]]]}},{"type":"Feature","properties":{"NOM":"KD06A4","NUMPOINTS":563.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8185394215,43.7852749102],[4.819322915,43.8032442878],[4.844133685,43.8026738698],[4.8433423588,43.7847046982],[4.8185394215,43.7852749102]]]]}},{"type":"Feature","properties":{"NOM":"KD06A5","NUMPOINTS":360.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.819322915,43.8032442878],[4.8201069558,43.8212140002],[4.8449255571,43.8206433585],[4.844133685,43.8026738698],[4.819322915,43.8032442878]]]]}},{"type":"Feature","properties":{"NOM":"KD06A6","NUMPOINTS":395.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8201069558,43.8212140002],[4.8208914921,43.8391839324],[4.8457179297,43.838613067],[4.8449255571,43.8206433585],[4.8201069558,43.8212140002]]]]}},{"type":"Feature","properties":{"NOM":"KD06A7","NUMPOINTS":405.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8208914921,43.8391839324],[4.8216765244,43.8571540828],[4.8465108032,43.8565829937],[4.8457179297,43.838613067],[4.8208914921,43.8391839324]]]]}},{"type":"Feature","properties":{"NOM":"KD06A8","NUMPOINTS":523.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8216765244,43.8571540828],[4.8224620532,43.8751244498],[4.8473041782,43.8745531367],[4.8465108032,43.8565829937],[4.8216765244,43.8571540828]]]]}},{"type":"Feature","properties":{"NOM":"KD06A9","NUMPOINTS":508.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8224620532,43.8751244498],[4.823248079,43.8930950315],[4.8480980551,43.8925234945],[4.8473041782,43.8745531367],[4.8224620532,43.8751244498]]]]}},{"type":"Feature","properties":{"NOM":"KD08A0","NUMPOINTS":407.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.823248079,43.8930950315],[4.8240345502,43.9110658129],[4.848892357,43.9104940568],[4.8480980551,43.8925234945],[4.823248079,43.8930950315]]]]}},{"type":"Feature","properties":{"NOM":"KD08A1","NUMPOINTS":397.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8240345502,43.9110658129],[4.8248214842,43.9290367976],[4.8496871042,43.9284648249],[4.848892357,43.9104940568],[4.8240345502,43.9110658129]]]]}},{"type":"Feature","properties":{"NOM":"KD00B8","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8229444252,43.3175920207],[4.8237228007,43.3355546988],[4.8483312208,43.3349834118],[4.8475451586,43.3170209228],[4.8229444252,43.3175920207]]]]}},{"type":"Feature","properties":{"NOM":"KD00B9","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8237228007,43.3355546988],[4.8245016633,43.3535176439],[4.8491177748,43.3529461678],[4.8483312208,43.3349834118],[4.8237228007,43.3355546988]]]]}},{"type":"Feature","properties":{"NOM":"KD02B0","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8245016633,43.3535176439],[4.8252810133,43.3714808544],[4.8499048211,43.3709091891],[4.8491177748,43.3529461678],[4.8245016633,43.3535176439]]]]}},{"type":"Feature","properties":{"NOM":"KD02B1","NUMPOINTS":33.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8252810133,43.3714808544],[4.8260608513,43.3894443287],[4.8506923601,43.3888724741],[4.8499048211,43.3709091891],[4.8252810133,43.3714808544]]]]}},{"type":"Feature","properties":{"NOM":"KD02B2","NUMPOINTS":22.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8260608513,43.3894443287],[4.8268411709,43.4074080626],[4.8514803879,43.4068360233],[4.8506923601,43.3888724741],[4.8260608513,43.3894443287]]]]}},{"type":"Feature","properties":{"NOM":"KD02B3","NUMPOINTS":17.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8268411709,43.4074080626],[4.8276219699,43.425372054],[4.8522689024,43.4247998369],[4.8514803879,43.4068360233],[4.8268411709,43.4074080626]]]]}},{"type":"Feature","properties":{"NOM":"KD02B4","NUMPOINTS":44.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8276219699,43.425372054],[4.8284032585,43.4433363049],[4.8530579114,43.44276391],[4.8522689024,43.4247998369],[4.8276219699,43.425372054]]]]}},{"type":"Feature","properties":{"NOM":"KD02B5","NUMPOINTS":36.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8284032585,43.4433363049],[4.8291850372,43.4613008135],[4.8538474152,43.4607282408],[4.8530579114,43.44276391],[4.8284032585,43.4433363049]]]]}},{"type":"Feature","properties":{"NOM":"KD02B6","NUMPOINTS":19.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8291850372,43.4613008135],[4.8299673065,43.4792655784],[4.8546374144,43.4786928277],[4.8538474152,43.4607282408],[4.8291850372,43.4613008135]]]]}},{"type":"Feature","properties":{"NOM":"KD02B7","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8299673065,43.4792655784],[4.8307500667,43.4972305977],[4.8554279094,43.496657669],[4.8546374144,43.4786928277],[4.8299673065,43.4792655784]]]]}},{"type":"Feature","properties":{"NOM":"KD02B8","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8307500667,43.4972305977],[4.8315333203,43.5151958827],[4.8562189065,43.5146227793],[4.8554279094,43.496657669],[4.8307500667,43.4972305977]]]]}},{"type":"Feature","properties":{"NOM":"KD02B9","NUMPOINTS":73.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8315333203,43.5151958827],[4.8323170666,43.5331614215],[4.857010402,43.5325881445],[4.8562189065,43.5146227793],[4.8315333203,43.5151958827]]]]}},{"type":"Feature","properties":{"NOM":"KD04B0","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8323170666,43.5331614215],[4.8331013055,43.55112721],[4.857802395,43.5505537595],[4.857010402,43.5325881445],[4.8323170666,43.5331614215]]]]}},{"type":"Feature","properties":{"NOM":"KD04B1","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8331013055,43.55112721],[4.8338860375,43.5690932467],[4.8585948861,43.5685196226],[4.857802395,43.5505537595],[4.8331013055,43.55112721]]]]}},{"type":"Feature","properties":{"NOM":"KD04B2","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8338860375,43.5690932467],[4.8346712631,43.5870595299],[4.8593878756,43.5864857321],[4.8585948861,43.5685196226],[4.8338860375,43.5690932467]]]]}},{"type":"Feature","properties":{"NOM":"KD04B3","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8346712631,43.5870595299],[4.8354569969,43.6050260598],[4.8601813784,43.6044520859],[4.8593878756,43.5864857321],[4.8346712631,43.5870595299]]]]}},{"type":"Feature","properties":{"NOM":"KD04B4","NUMPOINTS":122.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8354569969,43.6050260598],[4.8362432618,43.6229928379],[4.8609754246,43.6224186813],[4.8601813784,43.6044520859],[4.8354569969,43.6050260598]]]]}},{"type":"Feature","properties":{"NOM":"KD04B5","NUMPOINTS":138.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8362432618,43.6229928379],[4.8370300223,43.6409598569],[4.8617699711,43.6403855176],[4.8609754246,43.6224186813],[4.8362432618,43.6229928379]]]]}},{"type":"Feature","properties":{"NOM":"KD04B6","NUMPOINTS":143.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8370300223,43.6409598569],[4.8378172787,43.658927115],[4.8625650186,43.658352593],[4.8617699711,43.6403855176],[4.8370300223,43.6409598569]]]]}},{"type":"Feature","properties":{"NOM":"KD04B7","NUMPOINTS":61.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8378172787,43.658927115],[4.8386050316,43.6768946108],[4.8633605674,43.676319906],[4.8625650186,43.658352593],[4.8378172787,43.658927115]]]]}},{"type":"Feature","properties":{"NOM":"KD04B8","NUMPOINTS":236.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8386050316,43.6768946108],[4.8393932814,43.6948623423],[4.864156618,43.6942874547],[4.8633605674,43.676319906],[4.8386050316,43.6768946108]]]]}},{"type":"Feature","properties":{"NOM":"KD04B9","NUMPOINTS":139.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8393932814,43.6948623423],[4.8401820822,43.7128303427],[4.8649532259,43.7122552593],[4.864156618,43.6942874547],[4.8393932814,43.6948623423]]]]}},{"type":"Feature","properties":{"NOM":"KD06B0","NUMPOINTS":45.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8401820822,43.7128303427],[4.8409714028,43.7307985885],[4.8657503624,43.7302233058],[4.8649532259,43.7122552593],[4.8401820822,43.7128303427]]]]}},{"type":"Feature","properties":{"NOM":"KD06B1","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8409714028,43.7307985885],[4.8417612221,43.7487670642],[4.8665480026,43.7481915819],[4.8657503624,43.7302233058],[4.8409714028,43.7307985885]]]]}},{"type":"Feature","properties":{"NOM":"KD06B2","NUMPOINTS":27.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8417612221,43.7487670642],[4.8425515406,43.7667357679],[4.867346147,43.7661600861],[4.8665480026,43.7481915819],[4.8417612221,43.7487670642]]]]}},{"type":"Feature","properties":{"NOM":"KD06B3","NUMPOINTS":228.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8425515406,43.7667357679],[4.8433423588,43.7847046982],[4.8681447959,43.7841288167],[4.867346147,43.7661600861],[4.8425515406,43.7667357679]]]]}},{"type":"Feature","properties":{"NOM":"KD06B4","NUMPOINTS":391.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8433423588,43.7847046982],[4.844133685,43.8026738698],[4.8689439551,43.802097782],[4.8681447959,43.7841288167],[4.8433423588,43.7847046982]]]]}},{"type":"Feature","properties":{"NOM":"KD06B5","NUMPOINTS":136.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.844133685,43.8026738698],[4.8449255571,43.8206433585],[4.869743658,43.8200670453],[4.8689439551,43.802097782],[4.844133685,43.8026738698]]]]}},{"type":"Feature","properties":{"NOM":"KD06B6","NUMPOINTS":213.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8449255571,43.8206433585],[4.8457179297,43.838613067],[4.8705438663,43.8380365282],[4.869743658,43.8200670453],[4.8449255571,43.8206433585]]]]}},{"type":"Feature","properties":{"NOM":"KD06B7","NUMPOINTS":374.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8457179297,43.838613067],[4.8465108032,43.8565829937],[4.8713445806,43.8560062292],[4.8705438663,43.8380365282],[4.8457179297,43.838613067]]]]}},{"type":"Feature","properties":{"NOM":"KD06B8","NUMPOINTS":486.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8465108032,43.8565829937],[4.8473041782,43.8745531367],[4.8721458012,43.8739761465],[4.8713445806,43.8560062292],[4.8465108032,43.8565829937]]]]}},{"type":"Feature","properties":{"NOM":"KD06B9","NUMPOINTS":535.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8473041782,43.8745531367],[4.8480980551,43.8925234945],[4.8729475288,43.8919462784],[4.8721458012,43.8739761465],[4.8473041782,43.8745531367]]]]}},{"type":"Feature","properties":{"NOM":"KD08B0","NUMPOINTS":304.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8480980551,43.8925234945],[4.848892357,43.9104940568],[4.873749664,43.9099166195],[4.8729475288,43.8919462784],[4.8480980551,43.8925234945]]]]}},{"type":"Feature","properties":{"NOM":"KD08B1","NUMPOINTS":298.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.848892357,43.9104940568],[4.8496871042,43.9284648249],[4.8745522238,43.927887169],[4.873749664,43.9099166195],[4.848892357,43.9104940568]]]]}},{"type":"Feature","properties":{"NOM":"KD00C8","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8475451586,43.3170209228],[4.8483312208,43.3349834118],[4.872939149,43.3344065014],[4.8721454006,43.3164442033],[4.8475451586,43.3170209228]]]]}},{"type":"Feature","properties":{"NOM":"KD00C9","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8483312208,43.3349834118],[4.8491177748,43.3529461678],[4.873733394,43.3523690664],[4.872939149,43.3344065014],[4.8483312208,43.3349834118]]]]}},{"type":"Feature","properties":{"NOM":"KD02C0","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8491177748,43.3529461678],[4.8499048211,43.3709091891],[4.874528136,43.3703318967],[4.873733394,43.3523690664],[4.8491177748,43.3529461678]]]]}},{"type":"Feature","properties":{"NOM":"KD02C1","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8499048211,43.3709091891],[4.8506923601,43.3888724741],[4.8753233757,43.3882949906],[4.874528136,43.3703318967],[4.8499048211,43.3709091891]]]]}},{"type":"Feature","properties":{"NOM":"KD02C2","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8506923601,43.3888724741],[4.8514803879,43.4068360233],[4.8761191109,43.4062583524],[4.8753233757,43.3882949906],[4.8506923601,43.3888724741]]]]}},{"type":"Feature","properties":{"NOM":"KD02C3","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8514803879,43.4068360233],[4.8522689024,43.4247998369],[4.8769153404,43.4242219865],[4.8761191109,43.4062583524],[4.8514803879,43.4068360233]]]]}},{"type":"Feature","properties":{"NOM":"KD02C4","NUMPOINTS":21.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8522689024,43.4247998369],[4.8530579114,43.44276391],[4.8777120692,43.4421858799],[4.8769153404,43.4242219865],[4.8522689024,43.4247998369]]]]}},{"type":"Feature","properties":{"NOM":"KD02C5","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8530579114,43.44276391],[4.8538474152,43.4607282408],[4.8785092977,43.460150031],[4.8777120692,43.4421858799],[4.8530579114,43.44276391]]]]}},{"type":"Feature","properties":{"NOM":"KD02C6","NUMPOINTS":17.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8538474152,43.4607282408],[4.8546374144,43.4786928277],[4.8793070265,43.4781144381],[4.8785092977,43.460150031],[4.8538474152,43.4607282408]]]]}},{"type":"Feature","properties":{"NOM":"KD02C7","NUMPOINTS":53.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8546374144,43.4786928277],[4.8554279094,43.496657669],[4.8801052558,43.4960790996],[4.8793070265,43.4781144381],[4.8546374144,43.4786928277]]]]}},{"type":"Feature","properties":{"NOM":"KD02C8","NUMPOINTS":117.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8554279094,43.496657669],[4.8562189065,43.5146227793],[4.8809039956,43.5140440329],[4.8801052558,43.4960790996],[4.8554279094,43.496657669]]]]}},{"type":"Feature","properties":{"NOM":"KD02C9","NUMPOINTS":74.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8562189065,43.5146227793],[4.857010402,43.5325881445],[4.8817032399,43.5320092228],[4.8809039956,43.5140440329],[4.8562189065,43.5146227793]]]]}},{"type":"Feature","properties":{"NOM":"KD04C0","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.857010402,43.5325881445],[4.857802395,43.5505537595],[4.8825029866,43.5499746624],[4.8817032399,43.5320092228],[4.857010402,43.5325881445]]]]}},{"type":"Feature","properties":{"NOM":"KD04C1","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.857802395,43.5505537595],[4.8585948861,43.5685196226],[4.8833032362,43.56794035],[4.8825029866,43.5499746624],[4.857802395,43.5505537595]]]]}},{"type":"Feature","properties":{"NOM":"KD04C2","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8585948861,43.5685196226],[4.8593878756,43.5864857321],[4.8841039891,43.5859062839],[4.8833032362,43.56794035],[4.8585948861,43.5685196226]]]]}},{"type":"Feature","properties":{"NOM":"KD04C3","NUMPOINTS":39.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8593878756,43.5864857321],[4.8601813784,43.6044520859],[4.88490526,43.6038724603],[4.8841039891,43.5859062839],[4.8593878756,43.5864857321]]]]}},{"type":"Feature","properties":{"NOM":"KD04C4","NUMPOINTS":123.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8601813784,43.6044520859],[4.8609754246,43.6224186813],[4.8857070869,43.6218388712],[4.88490526,43.6038724603],[4.8601813784,43.6044520859]]]]}},{"type":"Feature","properties":{"NOM":"KD04C5","NUMPOINTS":150.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8609754246,43.6224186813],[4.8617699711,43.6403855176],[4.8865094191,43.639805523],[4.8857070869,43.6218388712],[4.8609754246,43.6224186813]]]]}},{"type":"Feature","properties":{"NOM":"KD04C6","NUMPOINTS":129.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8617699711,43.6403855176],[4.8625650186,43.658352593],[4.8873122572,43.6577724138],[4.8865094191,43.639805523],[4.8617699711,43.6403855176]]]]}},{"type":"Feature","properties":{"NOM":"KD04C7","NUMPOINTS":36.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8625650186,43.658352593],[4.8633605674,43.676319906],[4.8881156014,43.675739542],[4.8873122572,43.6577724138],[4.8625650186,43.658352593]]]]}},{"type":"Feature","properties":{"NOM":"KD04C8","NUMPOINTS":410.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8633605674,43.676319906],[4.864156618,43.6942874547],[4.8889194525,43.693706906],[4.8881156014,43.675739542],[4.8633605674,43.676319906]]]]}},{"type":"Feature","properties":{"NOM":"KD04C9","NUMPOINTS":169.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.864156618,43.6942874547],[4.8649532259,43.7122552593],[4.8897238665,43.7116745142],[4.8889194525,43.693706906],[4.864156618,43.6942874547]]]]}},{"type":"Feature","properties":{"NOM":"KD06C0","NUMPOINTS":109.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8649532259,43.7122552593],[4.8657503624,43.7302233058],[4.8905288185,43.7296423593],[4.8897238665,43.7116745142],[4.8649532259,43.7122552593]]]]}},{"type":"Feature","properties":{"NOM":"KD06C1","NUMPOINTS":53.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8657503624,43.7302233058],[4.8665480026,43.7481915819],[4.8913342792,43.7476104341],[4.8905288185,43.7296423593],[4.8657503624,43.7302233058]]]]}},{"type":"Feature","properties":{"NOM":"KD06C2","NUMPOINTS":44.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8665480026,43.7481915819],[4.867346147,43.7661600861],[4.8921402489,43.7655787369],[4.8913342792,43.7476104341],[4.8665480026,43.7481915819]]]]}},{"type":"Feature","properties":{"NOM":"KD06C3","NUMPOINTS":250.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.867346147,43.7661600861],[4.8681447959,43.7841288167],[4.8929467281,43.783547266],[4.8921402489,43.7655787369],[4.867346147,43.7661600861]]]]}},{"type":"Feature","properties":{"NOM":"KD06C4","NUMPOINTS":250.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8681447959,43.7841288167],[4.8689439551,43.802097782],[4.8937537202,43.8015160248],[4.8929467281,43.783547266],[4.8681447959,43.7841288167]]]]}},{"type":"Feature","properties":{"NOM":"KD06C5","NUMPOINTS":253.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8689439551,43.802097782],[4.869743658,43.8200670453],[4.8945612535,43.8194850607],[4.8937537202,43.8015160248],[4.8689439551,43.802097782]]]]}},{"type":"Feature","properties":{"NOM":"KD06C6","NUMPOINTS":210.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.869743658,43.8200670453],[4.8705438663,43.8380365282],[4.8953692971,43.8374543162],[4.8945612535,43.8194850607],[4.869743658,43.8200670453]]]]}},{"type":"Feature","properties":{"NOM":"KD06C7","NUMPOINTS":333.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8705438663,43.8380365282],[4.8713445806,43.8560062292],[4.8961778515,43.8554237897],[4.8953692971,43.8374543162],[4.8705438663,43.8380365282]]]]}},{"type":"Feature","properties":{"NOM":"KD06C8","NUMPOINTS":378.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8713445806,43.8560062292],[4.8721458012,43.8739761465],[4.8969869173,43.8733934793],[4.8961778515,43.8554237897],[4.8713445806,43.8560062292]]]]}},{"type":"Feature","properties":{"NOM":"KD06C9","NUMPOINTS":359.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8721458012,43.8739761465],[4.8729475288,43.8919462784],[4.8977964949,43.8913633836],[4.8969869173,43.8733934793],[4.8721458012,43.8739761465]]]]}},{"type":"Feature","properties":{"NOM":"KD08C0","NUMPOINTS":225.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8729475288,43.8919462784],[4.873749664,43.9099166195],[4.8986064662,43.909333501],[4.8977964949,43.8913633836],[4.8729475288,43.8919462784]]]]}},{"type":"Feature","properties":{"NOM":"KD00D9","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.872939149,43.3344065014],[4.873733394,43.3523690664],[4.898348516,43.3517863399],[4.8975465805,43.3338239677],[4.872939149,43.3344065014]]]]}},{"type":"Feature","properties":{"NOM":"KD02D0","NUMPOINTS":9.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.873733394,43.3523690664],[4.874528136,43.3703318967],[4.8991509534,43.3697489773],[4.898348516,43.3517863399],[4.873733394,43.3523690664]]]]}},{"type":"Feature","properties":{"NOM":"KD02D2","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8753233757,43.3882949906],[4.8761191109,43.4062583524],[4.900757336,43.4056750525],[4.8999538931,43.3877118782],[4.8753233757,43.3882949906]]]]}},{"type":"Feature","properties":{"NOM":"KD02D3","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8761191109,43.4062583524],[4.8769153404,43.4242219865],[4.9015612815,43.423638507],[4.900757336,43.4056750525],[4.8761191109,43.4062583524]]]]}},{"type":"Feature","properties":{"NOM":"KD02D4","NUMPOINTS":30.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8769153404,43.4242219865],[4.8777120692,43.4421858799],[4.9023657313,43.4416022202],[4.9015612815,43.423638507],[4.8769153404,43.4242219865]]]]}},{"type":"Feature","properties":{"NOM":"KD02D5","NUMPOINTS":82.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8777120692,43.4421858799],[4.8785092977,43.460150031],[4.903170686,43.4595661904],[4.9023657313,43.4416022202],[4.8777120692,43.4421858799]]]]}},{"type":"Feature","properties":{"NOM":"KD02D6","NUMPOINTS":85.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8785092977,43.460150031],[4.8793070265,43.4781144381],[4.9039761461,43.4775304161],[4.903170686,43.4595661904],[4.8785092977,43.460150031]]]]}},{"type":"Feature","properties":{"NOM":"KD02D7","NUMPOINTS":100.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8793070265,43.4781144381],[4.8801052558,43.4960790996],[4.904782112,43.4954948955],[4.9039761461,43.4775304161],[4.8793070265,43.4781144381]]]]}},{"type":"Feature","properties":{"NOM":"KD02D8","NUMPOINTS":102.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8801052558,43.4960790996],[4.8809039956,43.5140440329],[4.9055885962,43.5134596466],[4.904782112,43.4954948955],[4.8801052558,43.4960790996]]]]}},{"type":"Feature","properties":{"NOM":"KD02D9","NUMPOINTS":31.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8809039956,43.5140440329],[4.8817032399,43.5320092228],[4.9063955913,43.5314246543],[4.9055885962,43.5134596466],[4.8809039956,43.5140440329]]]]}},{"type":"Feature","properties":{"NOM":"KD04D0","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8817032399,43.5320092228],[4.8825029866,43.5499746624],[4.9072030938,43.5493899103],[4.9063955913,43.5314246543],[4.8817032399,43.5320092228]]]]}},{"type":"Feature","properties":{"NOM":"KD04D1","NUMPOINTS":45.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8825029866,43.5499746624],[4.8833032362,43.56794035],[4.9080111043,43.5673554128],[4.9072030938,43.5493899103],[4.8825029866,43.5499746624]]]]}},{"type":"Feature","properties":{"NOM":"KD04D2","NUMPOINTS":93.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8833032362,43.56794035],[4.8841039891,43.5859062839],[4.9088196231,43.5853211602],[4.9080111043,43.5673554128],[4.8833032362,43.56794035]]]]}},{"type":"Feature","properties":{"NOM":"KD04D3","NUMPOINTS":153.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8841039891,43.5859062839],[4.88490526,43.6038724603],[4.9096286631,43.6032871484],[4.9088196231,43.5853211602],[4.8841039891,43.5859062839]]]]}},{"type":"Feature","properties":{"NOM":"KD04D4","NUMPOINTS":151.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.88490526,43.6038724603],[4.8857070869,43.6218388712],[4.9104382677,43.6212533676],[4.9096286631,43.6032871484],[4.88490526,43.6038724603]]]]}},{"type":"Feature","properties":{"NOM":"KD04D5","NUMPOINTS":110.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8857070869,43.6218388712],[4.8865094191,43.639805523],[4.9112483817,43.639219827],[4.9104382677,43.6212533676],[4.8857070869,43.6218388712]]]]}},{"type":"Feature","properties":{"NOM":"KD04D6","NUMPOINTS":162.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8865094191,43.639805523],[4.8873122572,43.6577724138],[4.9120590056,43.6571865252],[4.9112483817,43.639219827],[4.8865094191,43.639805523]]]]}},{"type":"Feature","properties":{"NOM":"KD04D7","NUMPOINTS":236.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8873122572,43.6577724138],[4.8881156014,43.675739542],[4.9128701399,43.6751534602],[4.9120590056,43.6571865252],[4.8873122572,43.6577724138]]]]}},{"type":"Feature","properties":{"NOM":"KD04D8","NUMPOINTS":220.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8881156014,43.675739542],[4.8889194525,43.693706906],[4.9136817852,43.6931206306],[4.9128701399,43.6751534602],[4.8881156014,43.675739542]]]]}},{"type":"Feature","properties":{"NOM":"KD04D9","NUMPOINTS":148.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8889194525,43.693706906],[4.8897238665,43.7116745142],[4.9144939893,43.7110880383],[4.9136817852,43.6931206306],[4.8889194525,43.693706906]]]]}},{"type":"Feature","properties":{"NOM":"KD06D0","NUMPOINTS":72.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8897238665,43.7116745142],[4.8905288185,43.7296423593],[4.9153067339,43.72905568],[4.9144939893,43.7110880383],[4.8897238665,43.7116745142]]]]}},{"type":"Feature","properties":{"NOM":"KD06D1","NUMPOINTS":27.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8905288185,43.7296423593],[4.8913342792,43.7476104341],[4.9161199896,43.7470235517],[4.9153067339,43.72905568],[4.8905288185,43.7296423593]]]]}},{"type":"Feature","properties":{"NOM":"KD06D2","NUMPOINTS":48.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8913342792,43.7476104341],[4.8921402489,43.7655787369],[4.916933757,43.7649916516],[4.9161199896,43.7470235517],[4.8913342792,43.7476104341]]]]}},{"type":"Feature","properties":{"NOM":"KD06D3","NUMPOINTS":140.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8921402489,43.7655787369],[4.8929467281,43.783547266],[4.9177480365,43.7829599782],[4.916933757,43.7649916516],[4.8921402489,43.7655787369]]]]}},{"type":"Feature","properties":{"NOM":"KD06D4","NUMPOINTS":152.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8929467281,43.783547266],[4.8937537202,43.8015160248],[4.918562829,43.8009285314],[4.9177480365,43.7829599782],[4.8929467281,43.783547266]]]]}},{"type":"Feature","properties":{"NOM":"KD06D5","NUMPOINTS":318.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8937537202,43.8015160248],[4.8945612535,43.8194850607],[4.9193781401,43.8188973369],[4.918562829,43.8009285314],[4.8937537202,43.8015160248]]]]}},{"type":"Feature","properties":{"NOM":"KD06D6","NUMPOINTS":435.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8945612535,43.8194850607],[4.8953692971,43.8374543162],[4.9201939626,43.8368663621],[4.9193781401,43.8188973369],[4.8945612535,43.8194850607]]]]}},{"type":"Feature","properties":{"NOM":"KD06D7","NUMPOINTS":434.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8953692971,43.8374543162],[4.8961778515,43.8554237897],[4.9210102971,43.8548356053],[4.9201939626,43.8368663621],[4.8953692971,43.8374543162]]]]}},{"type":"Feature","properties":{"NOM":"KD06D8","NUMPOINTS":491.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8961778515,43.8554237897],[4.8969869173,43.8733934793],[4.9218271439,43.8728050648],[4.9210102971,43.8548356053],[4.8961778515,43.8554237897]]]]}},{"type":"Feature","properties":{"NOM":"KD06D9","NUMPOINTS":403.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8969869173,43.8733934793],[4.8977964949,43.8913633836],[4.9226445037,43.8907747389],[4.9218271439,43.8728050648],[4.8969869173,43.8733934793]]]]}},{"type":"Feature","properties":{"NOM":"KD02E0","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.898348516,43.3517863399],[4.8991509534,43.3697489773],[4.9237732895,43.3691604915],[4.9229631518,43.351198038],[4.898348516,43.3517863399]]]]}},{"type":"Feature","properties":{"NOM":"KD02E1","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.8991509534,43.3697489773],[4.8999538931,43.3877118782],[4.9245839347,43.3871232091],[4.9237732895,43.3691604915],[4.8991509534,43.3697489773]]]]}},{"type":"Feature","properties":{"NOM":"KD02E3","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.900757336,43.4056750525],[4.9015612815,43.423638507],[4.9262067529,43.4230494575],[4.9253950886,43.4050861952],[4.900757336,43.4056750525]]]]}},{"type":"Feature","properties":{"NOM":"KD02E4","NUMPOINTS":33.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9015612815,43.423638507],[4.9023657313,43.4416022202],[4.9270189264,43.4410129784],[4.9262067529,43.4230494575],[4.9015612815,43.423638507]]]]}},{"type":"Feature","properties":{"NOM":"KD02E5","NUMPOINTS":57.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9023657313,43.4416022202],[4.903170686,43.4595661904],[4.9278316096,43.4589767563],[4.9270189264,43.4410129784],[4.9023657313,43.4416022202]]]]}},{"type":"Feature","properties":{"NOM":"KD02E6","NUMPOINTS":56.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.903170686,43.4595661904],[4.9039761461,43.4775304161],[4.9286448031,43.4769407896],[4.9278316096,43.4589767563],[4.903170686,43.4595661904]]]]}},{"type":"Feature","properties":{"NOM":"KD02E7","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9039761461,43.4775304161],[4.904782112,43.4954948955],[4.9294585071,43.4949050765],[4.9286448031,43.4769407896],[4.9039761461,43.4775304161]]]]}},{"type":"Feature","properties":{"NOM":"KD02E8","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.904782112,43.4954948955],[4.9055885962,43.5134596466],[4.9302727354,43.5128696288],[4.9294585071,43.4949050765],[4.904782112,43.4954948955]]]]}},{"type":"Feature","properties":{"NOM":"KD02E9","NUMPOINTS":9.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9055885962,43.5134596466],[4.9063955913,43.5314246543],[4.9310874807,43.5308344365],[4.9302727354,43.5128696288],[4.9055885962,43.5134596466]]]]}},{"type":"Feature","properties":{"NOM":"KD04E0","NUMPOINTS":42.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9063955913,43.5314246543],[4.9072030938,43.5493899103],[4.9319027382,43.5487994923],[4.9310874807,43.5308344365],[4.9063955913,43.5314246543]]]]}},{"type":"Feature","properties":{"NOM":"KD04E1","NUMPOINTS":67.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9072030938,43.5493899103],[4.9080111043,43.5673554128],[4.9327185084,43.5667647946],[4.9319027382,43.5487994923],[4.9072030938,43.5493899103]]]]}},{"type":"Feature","properties":{"NOM":"KD04E2","NUMPOINTS":75.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9080111043,43.5673554128],[4.9088196231,43.5853211602],[4.9335347919,43.5847303417],[4.9327185084,43.5667647946],[4.9080111043,43.5673554128]]]]}},{"type":"Feature","properties":{"NOM":"KD04E3","NUMPOINTS":186.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9088196231,43.5853211602],[4.9096286631,43.6032871484],[4.9343515984,43.6026961309],[4.9335347919,43.5847303417],[4.9088196231,43.5853211602]]]]}},{"type":"Feature","properties":{"NOM":"KD04E4","NUMPOINTS":112.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9096286631,43.6032871484],[4.9104382677,43.6212533676],[4.9351689712,43.6206621559],[4.9343515984,43.6026961309],[4.9096286631,43.6032871484]]]]}},{"type":"Feature","properties":{"NOM":"KD04E5","NUMPOINTS":154.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9104382677,43.6212533676],[4.9112483817,43.639219827],[4.9359868584,43.6386284211],[4.9351689712,43.6206621559],[4.9104382677,43.6212533676]]]]}},{"type":"Feature","properties":{"NOM":"KD04E6","NUMPOINTS":124.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9112483817,43.639219827],[4.9120590056,43.6571865252],[4.9368052604,43.6565949248],[4.9359868584,43.6386284211],[4.9112483817,43.639219827]]]]}},{"type":"Feature","properties":{"NOM":"KD04E7","NUMPOINTS":152.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9120590056,43.6571865252],[4.9128701399,43.6751534602],[4.9376241777,43.6745616654],[4.9368052604,43.6565949248],[4.9120590056,43.6571865252]]]]}},{"type":"Feature","properties":{"NOM":"KD04E8","NUMPOINTS":199.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9128701399,43.6751534602],[4.9136817852,43.6931206306],[4.9384436107,43.6925286413],[4.9376241777,43.6745616654],[4.9128701399,43.6751534602]]]]}},{"type":"Feature","properties":{"NOM":"KD04E9","NUMPOINTS":178.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9136817852,43.6931206306],[4.9144939893,43.7110880383],[4.9392635942,43.7104958516],[4.9384436107,43.6925286413],[4.9136817852,43.6931206306]]]]}},{"type":"Feature","properties":{"NOM":"KD06E0","NUMPOINTS":34.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9144939893,43.7110880383],[4.9153067339,43.72905568],[4.9400841177,43.7284632941],[4.9392635942,43.7104958516],[4.9144939893,43.7110880383]]]]}},{"type":"Feature","properties":{"NOM":"KD06E1","NUMPOINTS":51.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9153067339,43.72905568],[4.9161199896,43.7470235517],[4.9409051573,43.7464309665],[4.9400841177,43.7284632941],[4.9153067339,43.72905568]]]]}},{"type":"Feature","properties":{"NOM":"KD06E2","NUMPOINTS":139.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9161199896,43.7470235517],[4.916933757,43.7649916516],[4.9417267135,43.7643988671],[4.9409051573,43.7464309665],[4.9161199896,43.7470235517]]]]}},{"type":"Feature","properties":{"NOM":"KD06E3","NUMPOINTS":336.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.916933757,43.7649916516],[4.9177480365,43.7829599782],[4.9425487866,43.7823669942],[4.9417267135,43.7643988671],[4.916933757,43.7649916516]]]]}},{"type":"Feature","properties":{"NOM":"KD06E4","NUMPOINTS":270.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9177480365,43.7829599782],[4.918562829,43.8009285314],[4.9433713768,43.8003353463],[4.9425487866,43.7823669942],[4.9177480365,43.7829599782]]]]}},{"type":"Feature","properties":{"NOM":"KD06E5","NUMPOINTS":332.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.918562829,43.8009285314],[4.9193781401,43.8188973369],[4.9441944589,43.8183039231],[4.9433713768,43.8003353463],[4.918562829,43.8009285314]]]]}},{"type":"Feature","properties":{"NOM":"KD06E6","NUMPOINTS":362.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9193781401,43.8188973369],[4.9201939626,43.8368663621],[4.9450180574,43.8362727194],[4.9441944589,43.8183039231],[4.9193781401,43.8188973369]]]]}},{"type":"Feature","properties":{"NOM":"KD06E7","NUMPOINTS":392.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9201939626,43.8368663621],[4.9210102971,43.8548356053],[4.9458421726,43.8542417336],[4.9450180574,43.8362727194],[4.9201939626,43.8368663621]]]]}},{"type":"Feature","properties":{"NOM":"KD06E8","NUMPOINTS":347.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9210102971,43.8548356053],[4.9218271439,43.8728050648],[4.9466668051,43.872210964],[4.9458421726,43.8542417336],[4.9210102971,43.8548356053]]]]}},{"type":"Feature","properties":{"NOM":"KD06E9","NUMPOINTS":267.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9218271439,43.8728050648],[4.9226445037,43.8907747389],[4.9474919553,43.8901804089],[4.9466668051,43.872210964],[4.9218271439,43.8728050648]]]]}},{"type":"Feature","properties":{"NOM":"KD02F4","NUMPOINTS":63.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9262067529,43.4230494575],[4.9270189264,43.4410129784],[4.9516716118,43.4404181025],[4.9508517151,43.4224547757],[4.9262067529,43.4230494575]]]]}},{"type":"Feature","properties":{"NOM":"KD02F5","NUMPOINTS":237.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9270189264,43.4410129784],[4.9278316096,43.4589767563],[4.9524920231,43.4583816862],[4.9516716118,43.4404181025],[4.9270189264,43.4410129784]]]]}},{"type":"Feature","properties":{"NOM":"KD02F6","NUMPOINTS":195.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9278316096,43.4589767563],[4.9286448031,43.4769407896],[4.9533129494,43.4763455251],[4.9524920231,43.4583816862],[4.9278316096,43.4589767563]]]]}},{"type":"Feature","properties":{"NOM":"KD02F7","NUMPOINTS":19.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9286448031,43.4769407896],[4.9294585071,43.4949050765],[4.9541343912,43.4943096177],[4.9533129494,43.4763455251],[4.9286448031,43.4769407896]]]]}},{"type":"Feature","properties":{"NOM":"KD02F8","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9294585071,43.4949050765],[4.9302727354,43.5128696288],[4.9549563629,43.5122739699],[4.9541343912,43.4943096177],[4.9294585071,43.4949050765]]]]}},{"type":"Feature","properties":{"NOM":"KD02F9","NUMPOINTS":40.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9302727354,43.5128696288],[4.9310874807,43.5308344365],[4.9557788578,43.5302385756],[4.9549563629,43.5122739699],[4.9302727354,43.5128696288]]]]}},{"type":"Feature","properties":{"NOM":"KD04F0","NUMPOINTS":42.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9310874807,43.5308344365],[4.9319027382,43.5487994923],[4.9566018697,43.5482034295],[4.9557788578,43.5302385756],[4.9310874807,43.5308344365]]]]}},{"type":"Feature","properties":{"NOM":"KD04F1","NUMPOINTS":52.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9319027382,43.5487994923],[4.9327185084,43.5667647946],[4.9574253993,43.5661685297],[4.9566018697,43.5482034295],[4.9319027382,43.5487994923]]]]}},{"type":"Feature","properties":{"NOM":"KD04F2","NUMPOINTS":36.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9327185084,43.5667647946],[4.9335347919,43.5847303417],[4.958249447,43.5841338747],[4.9574253993,43.5661685297],[4.9327185084,43.5667647946]]]]}},{"type":"Feature","properties":{"NOM":"KD04F3","NUMPOINTS":217.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9335347919,43.5847303417],[4.9343515984,43.6026961309],[4.9590740198,43.6020994626],[4.958249447,43.5841338747],[4.9335347919,43.5847303417]]]]}},{"type":"Feature","properties":{"NOM":"KD04F4","NUMPOINTS":106.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9343515984,43.6026961309],[4.9351689712,43.6206621559],[4.9598991605,43.6200652915],[4.9590740198,43.6020994626],[4.9343515984,43.6026961309]]]]}},{"type":"Feature","properties":{"NOM":"KD04F5","NUMPOINTS":163.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9351689712,43.6206621559],[4.9359868584,43.6386284211],[4.9607248203,43.6380313606],[4.9598991605,43.6200652915],[4.9351689712,43.6206621559]]]]}},{"type":"Feature","properties":{"NOM":"KD04F6","NUMPOINTS":83.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9359868584,43.6386284211],[4.9368052604,43.6565949248],[4.9615509998,43.6559976681],[4.9607248203,43.6380313606],[4.9359868584,43.6386284211]]]]}},{"type":"Feature","properties":{"NOM":"KD04F7","NUMPOINTS":122.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9368052604,43.6565949248],[4.9376241777,43.6745616654],[4.9623776996,43.6739642125],[4.9615509998,43.6559976681],[4.9368052604,43.6565949248]]]]}},{"type":"Feature","properties":{"NOM":"KD04F8","NUMPOINTS":197.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9376241777,43.6745616654],[4.9384436107,43.6925286413],[4.96320492,43.691930992],[4.9623776996,43.6739642125],[4.9376241777,43.6745616654]]]]}},{"type":"Feature","properties":{"NOM":"KD04F9","NUMPOINTS":187.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9384436107,43.6925286413],[4.9392635942,43.7104958516],[4.9640326835,43.7098980033],[4.96320492,43.691930992],[4.9384436107,43.6925286413]]]]}},{"type":"Feature","properties":{"NOM":"KD06F0","NUMPOINTS":47.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9392635942,43.7104958516],[4.9400841177,43.7284632941],[4.9648609855,43.7278652447],[4.9640326835,43.7098980033],[4.9392635942,43.7104958516]]]]}},{"type":"Feature","properties":{"NOM":"KD06F1","NUMPOINTS":25.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9400841177,43.7284632941],[4.9409051573,43.7464309665],[4.9656898085,43.745832716],[4.9648609855,43.7278652447],[4.9400841177,43.7284632941]]]]}},{"type":"Feature","properties":{"NOM":"KD06F2","NUMPOINTS":335.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9409051573,43.7464309665],[4.9417267135,43.7643988671],[4.966519153,43.7638004154],[4.9656898085,43.745832716],[4.9409051573,43.7464309665]]]]}},{"type":"Feature","properties":{"NOM":"KD06F3","NUMPOINTS":356.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9417267135,43.7643988671],[4.9425487866,43.7823669942],[4.9673490193,43.7817683413],[4.966519153,43.7638004154],[4.9417267135,43.7643988671]]]]}},{"type":"Feature","properties":{"NOM":"KD06F4","NUMPOINTS":362.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9425487866,43.7823669942],[4.9433713768,43.8003353463],[4.968179408,43.799736492],[4.9673490193,43.7817683413],[4.9425487866,43.7823669942]]]]}},{"type":"Feature","properties":{"NOM":"KD06F5","NUMPOINTS":434.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9433713768,43.8003353463],[4.9441944589,43.8183039231],[4.9690102615,43.8177048385],[4.968179408,43.799736492],[4.9433713768,43.8003353463]]]]}},{"type":"Feature","properties":{"NOM":"KD06F6","NUMPOINTS":302.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9441944589,43.8183039231],[4.9450180574,43.8362727194],[4.9698416352,43.835673404],[4.9690102615,43.8177048385],[4.9441944589,43.8183039231]]]]}},{"type":"Feature","properties":{"NOM":"KD06F7","NUMPOINTS":438.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9450180574,43.8362727194],[4.9458421726,43.8542417336],[4.9706735307,43.8536421874],[4.9698416352,43.835673404],[4.9450180574,43.8362727194]]]]}},{"type":"Feature","properties":{"NOM":"KD06F8","NUMPOINTS":441.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9458421726,43.8542417336],[4.9466668051,43.872210964],[4.9715059483,43.8716111869],[4.9706735307,43.8536421874],[4.9458421726,43.8542417336]]]]}},{"type":"Feature","properties":{"NOM":"KD06F9","NUMPOINTS":300.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9466668051,43.872210964],[4.9474919553,43.8901804089],[4.9723388885,43.8895804009],[4.9715059483,43.8716111869],[4.9466668051,43.872210964]]]]}},{"type":"Feature","properties":{"NOM":"KD02G2","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9492134684,43.386528911],[4.9500323324,43.4044917075],[4.9746690627,43.4038915894],[4.9738424893,43.3859289841],[4.9492134684,43.386528911]]]]}},{"type":"Feature","properties":{"NOM":"KD02G3","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9500323324,43.4044917075],[4.9508517151,43.4224547757],[4.9754961632,43.4218544617],[4.9746690627,43.4038915894],[4.9500323324,43.4044917075]]]]}},{"type":"Feature","properties":{"NOM":"KD02G4","NUMPOINTS":46.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9508517151,43.4224547757],[4.9516716118,43.4404181025],[4.9763237826,43.4398175925],[4.9754961632,43.4218544617],[4.9508517151,43.4224547757]]]]}},{"type":"Feature","properties":{"NOM":"KD02G5","NUMPOINTS":21.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9516716118,43.4404181025],[4.9524920231,43.4583816862],[4.9771519215,43.4577809801],[4.9763237826,43.4398175925],[4.9516716118,43.4404181025]]]]}},{"type":"Feature","properties":{"NOM":"KD02G6","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9524920231,43.4583816862],[4.9533129494,43.4763455251],[4.9779805802,43.475744623],[4.9771519215,43.4577809801],[4.9524920231,43.4583816862]]]]}},{"type":"Feature","properties":{"NOM":"KD02G7","NUMPOINTS":90.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9533129494,43.4763455251],[4.9541343912,43.4943096177],[4.9788097592,43.4937085194],[4.9779805802,43.475744623],[4.9533129494,43.4763455251]]]]}},{"type":"Feature","properties":{"NOM":"KD02G8","NUMPOINTS":219.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9541343912,43.4943096177],[4.9549563629,43.5122739699],[4.9796394738,43.5116726701],[4.9788097592,43.4937085194],[4.9541343912,43.4943096177]]]]}},{"type":"Feature","properties":{"NOM":"KD02G9","NUMPOINTS":214.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9549563629,43.5122739699],[4.9557788578,43.5302385756],[4.9804697177,43.5296370721],[4.9796394738,43.5116726701],[4.9549563629,43.5122739699]]]]}},{"type":"Feature","properties":{"NOM":"KD04G0","NUMPOINTS":222.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9557788578,43.5302385756],[4.9566018697,43.5482034295],[4.9813004837,43.547601722],[4.9804697177,43.5296370721],[4.9557788578,43.5302385756]]]]}},{"type":"Feature","properties":{"NOM":"KD04G1","NUMPOINTS":166.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9566018697,43.5482034295],[4.9574253993,43.5661685297],[4.9821317721,43.5655666183],[4.9813004837,43.547601722],[4.9566018697,43.5482034295]]]]}},{"type":"Feature","properties":{"NOM":"KD04G2","NUMPOINTS":59.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9574253993,43.5661685297],[4.958249447,43.5841338747],[4.9829635835,43.5835317593],[4.9821317721,43.5655666183],[4.9574253993,43.5661685297]]]]}},{"type":"Feature","properties":{"NOM":"KD04G3","NUMPOINTS":41.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.958249447,43.5841338747],[4.9590740198,43.6020994626],[4.9837959225,43.6014971438],[4.9829635835,43.5835317593],[4.958249447,43.5841338747]]]]}},{"type":"Feature","properties":{"NOM":"KD04G4","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9590740198,43.6020994626],[4.9598991605,43.6200652915],[4.9846288305,43.6194627748],[4.9837959225,43.6014971438],[4.9590740198,43.6020994626]]]]}},{"type":"Feature","properties":{"NOM":"KD04G5","NUMPOINTS":77.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9598991605,43.6200652915],[4.9607248203,43.6380313606],[4.9854622625,43.6374286458],[4.9846288305,43.6194627748],[4.9598991605,43.6200652915]]]]}},{"type":"Feature","properties":{"NOM":"KD04G6","NUMPOINTS":151.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9607248203,43.6380313606],[4.9615509998,43.6559976681],[4.9862962191,43.6553947553],[4.9854622625,43.6374286458],[4.9607248203,43.6380313606]]]]}},{"type":"Feature","properties":{"NOM":"KD04G7","NUMPOINTS":74.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9615509998,43.6559976681],[4.9623776996,43.6739642125],[4.9871307008,43.6733611015],[4.9862962191,43.6553947553],[4.9615509998,43.6559976681]]]]}},{"type":"Feature","properties":{"NOM":"KD04G8","NUMPOINTS":151.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9623776996,43.6739642125],[4.96320492,43.691930992],[4.987965708,43.6913276828],[4.9871307008,43.6733611015],[4.9623776996,43.6739642125]]]]}},{"type":"Feature","properties":{"NOM":"KD04G9","NUMPOINTS":66.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.96320492,43.691930992],[4.9640326835,43.7098980033],[4.9888012523,43.7092944936],[4.987965708,43.6913276828],[4.96320492,43.691930992]]]]}},{"type":"Feature","properties":{"NOM":"KD06G0","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9640326835,43.7098980033],[4.9648609855,43.7278652447],[4.9896373324,43.7272615321],[4.9888012523,43.7092944936],[4.9640326835,43.7098980033]]]]}},{"type":"Feature","properties":{"NOM":"KD06G1","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9648609855,43.7278652447],[4.9656898085,43.745832716],[4.9904739383,43.7452288004],[4.9896373324,43.7272615321],[4.9648609855,43.7278652447]]]]}},{"type":"Feature","properties":{"NOM":"KD06G2","NUMPOINTS":95.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9656898085,43.745832716],[4.966519153,43.7638004154],[4.9913110705,43.7631962968],[4.9904739383,43.7452288004],[4.9656898085,43.745832716]]]]}},{"type":"Feature","properties":{"NOM":"KD06G3","NUMPOINTS":129.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.966519153,43.7638004154],[4.9673490193,43.7817683413],[4.9921487295,43.7811640195],[4.9913110705,43.7631962968],[4.966519153,43.7638004154]]]]}},{"type":"Feature","properties":{"NOM":"KD06G4","NUMPOINTS":301.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9673490193,43.7817683413],[4.968179408,43.799736492],[4.9929869158,43.799131967],[4.9921487295,43.7811640195],[4.9673490193,43.7817683413]]]]}},{"type":"Feature","properties":{"NOM":"KD06G5","NUMPOINTS":390.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.968179408,43.799736492],[4.9690102615,43.8177048385],[4.9938255428,43.8171000833],[4.9929869158,43.799131967],[4.968179408,43.799736492]]]]}},{"type":"Feature","properties":{"NOM":"KD06G6","NUMPOINTS":285.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9690102615,43.8177048385],[4.9698416352,43.835673404],[4.9946646914,43.8350684164],[4.9938255428,43.8171000833],[4.9690102615,43.8177048385]]]]}},{"type":"Feature","properties":{"NOM":"KD06G7","NUMPOINTS":332.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9698416352,43.835673404],[4.9706735307,43.8536421874],[4.9955043665,43.8530369671],[4.9946646914,43.8350684164],[4.9698416352,43.835673404]]]]}},{"type":"Feature","properties":{"NOM":"KD06G8","NUMPOINTS":193.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9706735307,43.8536421874],[4.9715059483,43.8716111869],[4.9963445687,43.8710057339],[4.9955043665,43.8530369671],[4.9706735307,43.8536421874]]]]}},{"type":"Feature","properties":{"NOM":"KD02H1","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9730164359,43.3679666428],[4.9738424893,43.3859289841],[4.9984709925,43.3853234284],[4.9976372358,43.3673612781],[4.9730164359,43.3679666428]]]]}},{"type":"Feature","properties":{"NOM":"KD02H2","NUMPOINTS":27.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9738424893,43.3859289841],[4.9746690627,43.4038915894],[4.9993052745,43.4032858412],[4.9984709925,43.3853234284],[4.9738424893,43.3859289841]]]]}},{"type":"Feature","properties":{"NOM":"KD02H3","NUMPOINTS":210.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9746690627,43.4038915894],[4.9754961632,43.4218544617],[5.0001400928,43.421248516],[4.9993052745,43.4032858412],[4.9746690627,43.4038915894]]]]}},{"type":"Feature","properties":{"NOM":"KD02H4","NUMPOINTS":116.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9754961632,43.4218544617],[4.9763237826,43.4398175925],[5.0009754366,43.4392114505],[5.0001400928,43.421248516],[4.9754961632,43.4218544617]]]]}},{"type":"Feature","properties":{"NOM":"KD02H5","NUMPOINTS":29.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9763237826,43.4398175925],[4.9771519215,43.4577809801],[5.0018113047,43.4571746419],[5.0009754366,43.4392114505],[4.9763237826,43.4398175925]]]]}},{"type":"Feature","properties":{"NOM":"KD02H6","NUMPOINTS":125.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9771519215,43.4577809801],[4.9779805802,43.475744623],[5.0026476976,43.4751380885],[5.0018113047,43.4571746419],[4.9771519215,43.4577809801]]]]}},{"type":"Feature","properties":{"NOM":"KD02H7","NUMPOINTS":251.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9779805802,43.475744623],[4.9788097592,43.4937085194],[5.0034846156,43.4931017887],[5.0026476976,43.4751380885],[4.9779805802,43.475744623]]]]}},{"type":"Feature","properties":{"NOM":"KD02H8","NUMPOINTS":373.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9788097592,43.4937085194],[4.9796394738,43.5116726701],[5.0043220739,43.5110657364],[5.0034846156,43.4931017887],[4.9788097592,43.4937085194]]]]}},{"type":"Feature","properties":{"NOM":"KD02H9","NUMPOINTS":209.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9796394738,43.5116726701],[4.9804697177,43.5296370721],[5.0051600673,43.52902993],[5.0043220739,43.5110657364],[4.9796394738,43.5116726701]]]]}},{"type":"Feature","properties":{"NOM":"KD04H0","NUMPOINTS":165.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9804697177,43.5296370721],[4.9813004837,43.547601722],[5.0059985872,43.5469943702],[5.0051600673,43.52902993],[4.9804697177,43.5296370721]]]]}},{"type":"Feature","properties":{"NOM":"KD04H1","NUMPOINTS":58.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9813004837,43.547601722],[4.9821317721,43.5655666183],[5.006837634,43.5649590555],[5.0059985872,43.5469943702],[4.9813004837,43.547601722]]]]}},{"type":"Feature","properties":{"NOM":"KD04H2","NUMPOINTS":144.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9821317721,43.5655666183],[4.9829635835,43.5835317593],[5.0076772082,43.582923984],[5.006837634,43.5649590555],[4.9821317721,43.5655666183]]]]}},{"type":"Feature","properties":{"NOM":"KD04H3","NUMPOINTS":204.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9829635835,43.5835317593],[4.9837959225,43.6014971438],[5.0085173126,43.6008891551],[5.0076772082,43.582923984],[4.9829635835,43.5835317593]]]]}},{"type":"Feature","properties":{"NOM":"KD04H4","NUMPOINTS":134.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9837959225,43.6014971438],[4.9846288305,43.6194627748],[5.0093579868,43.6188545846],[5.0085173126,43.6008891551],[4.9837959225,43.6014971438]]]]}},{"type":"Feature","properties":{"NOM":"KD04H5","NUMPOINTS":73.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9846288305,43.6194627748],[4.9854622625,43.6374286458],[5.0101991897,43.6368202542],[5.0093579868,43.6188545846],[4.9846288305,43.6194627748]]]]}},{"type":"Feature","properties":{"NOM":"KD04H6","NUMPOINTS":68.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9854622625,43.6374286458],[4.9862962191,43.6553947553],[5.0110409217,43.6547861623],[5.0101991897,43.6368202542],[4.9854622625,43.6374286458]]]]}},{"type":"Feature","properties":{"NOM":"KD04H7","NUMPOINTS":88.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9862962191,43.6553947553],[4.9871307008,43.6733611015],[5.0118831834,43.672752307],[5.0110409217,43.6547861623],[4.9862962191,43.6553947553]]]]}},{"type":"Feature","properties":{"NOM":"KD04H8","NUMPOINTS":187.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9871307008,43.6733611015],[4.987965708,43.6913276828],[5.0127259753,43.6907186869],[5.0118831834,43.672752307],[4.9871307008,43.6733611015]]]]}},{"type":"Feature","properties":{"NOM":"KD04H9","NUMPOINTS":176.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.987965708,43.6913276828],[4.9888012523,43.7092944936],[5.0135693044,43.7086853009],[5.0127259753,43.6907186869],[4.987965708,43.6913276828]]]]}},{"type":"Feature","properties":{"NOM":"KD06H0","NUMPOINTS":88.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9888012523,43.7092944936],[4.9896373324,43.7272615321],[5.0144131719,43.7266521486],[5.0135693044,43.7086853009],[4.9888012523,43.7092944936]]]]}},{"type":"Feature","properties":{"NOM":"KD06H1","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9896373324,43.7272615321],[4.9904739383,43.7452288004],[5.0152575712,43.7446192277],[5.0144131719,43.7266521486],[4.9896373324,43.7272615321]]]]}},{"type":"Feature","properties":{"NOM":"KD06H2","NUMPOINTS":17.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9904739383,43.7452288004],[4.9913110705,43.7631962968],[5.0161025027,43.7625865367],[5.0152575712,43.7446192277],[4.9904739383,43.7452288004]]]]}},{"type":"Feature","properties":{"NOM":"KD06H3","NUMPOINTS":85.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9913110705,43.7631962968],[4.9921487295,43.7811640195],[5.016947967,43.7805540738],[5.0161025027,43.7625865367],[4.9913110705,43.7631962968]]]]}},{"type":"Feature","properties":{"NOM":"KD06H4","NUMPOINTS":213.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9921487295,43.7811640195],[4.9929869158,43.799131967],[5.0177939647,43.7985218373],[5.016947967,43.7805540738],[4.9921487295,43.7811640195]]]]}},{"type":"Feature","properties":{"NOM":"KD06H5","NUMPOINTS":439.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9929869158,43.799131967],[4.9938255428,43.8171000833],[5.0186404225,43.8164897372],[5.0177939647,43.7985218373],[4.9929869158,43.799131967]]]]}},{"type":"Feature","properties":{"NOM":"KD06H6","NUMPOINTS":428.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9938255428,43.8171000833],[4.9946646914,43.8350684164],[5.0194874097,43.8344578496],[5.0186404225,43.8164897372],[4.9938255428,43.8171000833]]]]}},{"type":"Feature","properties":{"NOM":"KD06H7","NUMPOINTS":188.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9946646914,43.8350684164],[4.9955043665,43.8530369671],[5.0203349334,43.8524261804],[5.0194874097,43.8344578496],[4.9946646914,43.8350684164]]]]}},{"type":"Feature","properties":{"NOM":"KD00K9","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9959712878,43.3314377708],[4.9968040011,43.3493993917],[5.0214166259,43.3487886102],[5.0205762138,43.3308271752],[4.9959712878,43.3314377708]]]]}},{"type":"Feature","properties":{"NOM":"KD02K0","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9968040011,43.3493993917],[4.9976372358,43.3673612781],[5.0222575645,43.3667503113],[5.0214166259,43.3487886102],[4.9968040011,43.3493993917]]]]}},{"type":"Feature","properties":{"NOM":"KD02K1","NUMPOINTS":35.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9976372358,43.3673612781],[4.9984709925,43.3853234284],[5.0230990302,43.3847122767],[5.0222575645,43.3667503113],[4.9976372358,43.3673612781]]]]}},{"type":"Feature","properties":{"NOM":"KD02K2","NUMPOINTS":75.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9984709925,43.3853234284],[4.9993052745,43.4032858412],[5.0239410258,43.4026745031],[5.0230990302,43.3847122767],[4.9984709925,43.3853234284]]]]}},{"type":"Feature","properties":{"NOM":"KD02K3","NUMPOINTS":250.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[4.9993052745,43.4032858412],[5.0001400928,43.421248516],[5.0247835631,43.4206369812],[5.0239410258,43.4026745031],[4.9993052745,43.4032858412]]]]}},{"type":"Feature","properties":{"NOM":"KD02K4","NUMPOINTS":152.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0001400928,43.421248516],[5.0009754366,43.4392114505],[5.0256266288,43.4385997177],[5.0247835631,43.4206369812],[5.0001400928,43.421248516]]]]}},{"type":"Feature","properties":{"NOM":"KD02K5","NUMPOINTS":344.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0009754366,43.4392114505],[5.0018113047,43.4571746419],[5.0264702237,43.4565627111],[5.0256266288,43.4385997177],[5.0009754366,43.4392114505]]]]}},{"type":"Feature","properties":{"NOM":"KD02K6","NUMPOINTS":283.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0018113047,43.4571746419],[5.0026476976,43.4751380885],[5.0273143481,43.4745259596],[5.0264702237,43.4565627111],[5.0018113047,43.4571746419]]]]}},{"type":"Feature","properties":{"NOM":"KD02K7","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0026476976,43.4751380885],[5.0034846156,43.4931017887],[5.0281590026,43.4924894616],[5.0273143481,43.4745259596],[5.0026476976,43.4751380885]]]]}},{"type":"Feature","properties":{"NOM":"KD02K8","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0034846156,43.4931017887],[5.0043220739,43.5110657364],[5.0290041991,43.5104531948],[5.0281590026,43.4924894616],[5.0034846156,43.4931017887]]]]}},{"type":"Feature","properties":{"NOM":"KD02K9","NUMPOINTS":41.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0043220739,43.5110657364],[5.0051600673,43.52902993],[5.0298499346,43.5284171617],[5.0290041991,43.5104531948],[5.0043220739,43.5110657364]]]]}},{"type":"Feature","properties":{"NOM":"KD04K0","NUMPOINTS":60.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0051600673,43.52902993],[5.0059985872,43.5469943702],[5.0306962014,43.5463813752],[5.0298499346,43.5284171617],[5.0051600673,43.52902993]]]]}},{"type":"Feature","properties":{"NOM":"KD04K1","NUMPOINTS":180.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0059985872,43.5469943702],[5.006837634,43.5649590555],[5.031543,43.5643458336],[5.0306962014,43.5463813752],[5.0059985872,43.5469943702]]]]}},{"type":"Feature","properties":{"NOM":"KD04K2","NUMPOINTS":431.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.006837634,43.5649590555],[5.0076772082,43.582923984],[5.0323903309,43.5823105352],[5.031543,43.5643458336],[5.006837634,43.5649590555]]]]}},{"type":"Feature","properties":{"NOM":"KD04K3","NUMPOINTS":244.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0076772082,43.582923984],[5.0085173126,43.6008891551],[5.0332381952,43.600275479],[5.0323903309,43.5823105352],[5.0076772082,43.582923984]]]]}},{"type":"Feature","properties":{"NOM":"KD04K4","NUMPOINTS":163.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0085173126,43.6008891551],[5.0093579868,43.6188545846],[5.0340866314,43.6182407077],[5.0332381952,43.600275479],[5.0085173126,43.6008891551]]]]}},{"type":"Feature","properties":{"NOM":"KD04K5","NUMPOINTS":177.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0093579868,43.6188545846],[5.0101991897,43.6368202542],[5.0349356012,43.6362061763],[5.0340866314,43.6182407077],[5.0093579868,43.6188545846]]]]}},{"type":"Feature","properties":{"NOM":"KD04K6","NUMPOINTS":173.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0101991897,43.6368202542],[5.0110409217,43.6547861623],[5.035785105,43.6541718833],[5.0349356012,43.6362061763],[5.0101991897,43.6368202542]]]]}},{"type":"Feature","properties":{"NOM":"KD04K7","NUMPOINTS":168.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0110409217,43.6547861623],[5.0118831834,43.672752307],[5.0366351434,43.672137827],[5.035785105,43.6541718833],[5.0110409217,43.6547861623]]]]}},{"type":"Feature","properties":{"NOM":"KD04K8","NUMPOINTS":356.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0118831834,43.672752307],[5.0127259753,43.6907186869],[5.0374857167,43.6901040056],[5.0366351434,43.672137827],[5.0118831834,43.672752307]]]]}},{"type":"Feature","properties":{"NOM":"KD04K9","NUMPOINTS":248.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0127259753,43.6907186869],[5.0135693044,43.7086853009],[5.0383368326,43.7080704278],[5.0374857167,43.6901040056],[5.0127259753,43.6907186869]]]]}},{"type":"Feature","properties":{"NOM":"KD06K0","NUMPOINTS":62.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0135693044,43.7086853009],[5.0144131719,43.7266521486],[5.0391884931,43.7260370951],[5.0383368326,43.7080704278],[5.0135693044,43.7086853009]]]]}},{"type":"Feature","properties":{"NOM":"KD06K1","NUMPOINTS":20.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0144131719,43.7266521486],[5.0152575712,43.7446192277],[5.0400406903,43.7440039938],[5.0391884931,43.7260370951],[5.0144131719,43.7266521486]]]]}},{"type":"Feature","properties":{"NOM":"KD06K2","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0152575712,43.7446192277],[5.0161025027,43.7625865367],[5.0408934247,43.7619711222],[5.0400406903,43.7440039938],[5.0152575712,43.7446192277]]]]}},{"type":"Feature","properties":{"NOM":"KD06K3","NUMPOINTS":33.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0161025027,43.7625865367],[5.016947967,43.7805540738],[5.0417466968,43.7799384787],[5.0408934247,43.7619711222],[5.0161025027,43.7625865367]]]]}},{"type":"Feature","properties":{"NOM":"KD06K4","NUMPOINTS":307.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.016947967,43.7805540738],[5.0177939647,43.7985218373],[5.0426005071,43.7979060616],[5.0417466968,43.7799384787],[5.016947967,43.7805540738]]]]}},{"type":"Feature","properties":{"NOM":"KD06K5","NUMPOINTS":255.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0177939647,43.7985218373],[5.0186404225,43.8164897372],[5.0434548081,43.8158737465],[5.0426005071,43.7979060616],[5.0177939647,43.7985218373]]]]}},{"type":"Feature","properties":{"NOM":"KD06K6","NUMPOINTS":177.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0186404225,43.8164897372],[5.0194874097,43.8344578496],[5.0443096437,43.8338416355],[5.0434548081,43.8158737465],[5.0186404225,43.8164897372]]]]}},{"type":"Feature","properties":{"NOM":"KD00L8","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0197363278,43.3128660078],[5.0205762138,43.3308271752],[5.0451806214,43.3302109583],[5.044333043,43.3122499779],[5.0197363278,43.3128660078]]]]}},{"type":"Feature","properties":{"NOM":"KD00L9","NUMPOINTS":71.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0205762138,43.3308271752],[5.0214166259,43.3487886102],[5.0460287308,43.3481722062],[5.0451806214,43.3302109583],[5.0205762138,43.3308271752]]]]}},{"type":"Feature","properties":{"NOM":"KD02L0","NUMPOINTS":65.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0214166259,43.3487886102],[5.0222575645,43.3667503113],[5.0468773715,43.3661337201],[5.0460287308,43.3481722062],[5.0214166259,43.3487886102]]]]}},{"type":"Feature","properties":{"NOM":"KD02L1","NUMPOINTS":108.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0222575645,43.3667503113],[5.0230990302,43.3847122767],[5.0477265441,43.3840954982],[5.0468773715,43.3661337201],[5.0222575645,43.3667503113]]]]}},{"type":"Feature","properties":{"NOM":"KD02L2","NUMPOINTS":141.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0230990302,43.3847122767],[5.0239410258,43.4026745031],[5.048576251,43.4020575363],[5.0477265441,43.3840954982],[5.0230990302,43.3847122767]]]]}},{"type":"Feature","properties":{"NOM":"KD02L3","NUMPOINTS":275.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0239410258,43.4026745031],[5.0247835631,43.4206369812],[5.0494265048,43.4200198146],[5.048576251,43.4020575363],[5.0239410258,43.4026745031]]]]}},{"type":"Feature","properties":{"NOM":"KD02L4","NUMPOINTS":172.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0247835631,43.4206369812],[5.0256266288,43.4385997177],[5.050277292,43.4379823513],[5.0494265048,43.4200198146],[5.0247835631,43.4206369812]]]]}},{"type":"Feature","properties":{"NOM":"KD02L5","NUMPOINTS":106.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0256266288,43.4385997177],[5.0264702237,43.4565627111],[5.0511286131,43.4559451448],[5.050277292,43.4379823513],[5.0256266288,43.4385997177]]]]}},{"type":"Feature","properties":{"NOM":"KD02L6","NUMPOINTS":91.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0264702237,43.4565627111],[5.0273143481,43.4745259596],[5.0519804687,43.4739081934],[5.0511286131,43.4559451448],[5.0264702237,43.4565627111]]]]}},{"type":"Feature","properties":{"NOM":"KD02L7","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0273143481,43.4745259596],[5.0281590026,43.4924894616],[5.0528328591,43.4918714954],[5.0519804687,43.4739081934],[5.0273143481,43.4745259596]]]]}},{"type":"Feature","properties":{"NOM":"KD02L8","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0281590026,43.4924894616],[5.0290041991,43.5104531948],[5.0536857935,43.5098350142],[5.0528328591,43.4918714954],[5.0281590026,43.4924894616]]]]}},{"type":"Feature","properties":{"NOM":"KD02L9","NUMPOINTS":9.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0290041991,43.5104531948],[5.0298499346,43.5284171617],[5.0545392705,43.5277987526],[5.0536857935,43.5098350142],[5.0290041991,43.5104531948]]]]}},{"type":"Feature","properties":{"NOM":"KD04L0","NUMPOINTS":136.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0298499346,43.5284171617],[5.0306962014,43.5463813752],[5.0553932838,43.5457627375],[5.0545392705,43.5277987526],[5.0298499346,43.5284171617]]]]}},{"type":"Feature","properties":{"NOM":"KD04L1","NUMPOINTS":423.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0306962014,43.5463813752],[5.031543,43.5643458336],[5.0562478337,43.5637269671],[5.0553932838,43.5457627375],[5.0306962014,43.5463813752]]]]}},{"type":"Feature","properties":{"NOM":"KD04L2","NUMPOINTS":124.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.031543,43.5643458336],[5.0323903309,43.5823105352],[5.0571029207,43.58169144],[5.0562478337,43.5637269671],[5.031543,43.5643458336]]]]}},{"type":"Feature","properties":{"NOM":"KD04L3","NUMPOINTS":142.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0323903309,43.5823105352],[5.0332381952,43.600275479],[5.0579585454,43.5996561542],[5.0571029207,43.58169144],[5.0323903309,43.5823105352]]]]}},{"type":"Feature","properties":{"NOM":"KD04L4","NUMPOINTS":144.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0332381952,43.600275479],[5.0340866314,43.6182407077],[5.0588147425,43.6176211788],[5.0579585454,43.5996561542],[5.0332381952,43.600275479]]]]}},{"type":"Feature","properties":{"NOM":"KD04L5","NUMPOINTS":235.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0340866314,43.6182407077],[5.0349356012,43.6362061763],[5.0596714786,43.6355864446],[5.0588147425,43.6176211788],[5.0340866314,43.6182407077]]]]}},{"type":"Feature","properties":{"NOM":"KD04L6","NUMPOINTS":153.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0349356012,43.6362061763],[5.035785105,43.6541718833],[5.0605287537,43.6535519487],[5.0596714786,43.6355864446],[5.0349356012,43.6362061763]]]]}},{"type":"Feature","properties":{"NOM":"KD04L7","NUMPOINTS":200.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.035785105,43.6541718833],[5.0366351434,43.672137827],[5.0613865682,43.6715176894],[5.0605287537,43.6535519487],[5.035785105,43.6541718833]]]]}},{"type":"Feature","properties":{"NOM":"KD04L8","NUMPOINTS":248.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0366351434,43.672137827],[5.0374857167,43.6901040056],[5.0622449226,43.6894836651],[5.0613865682,43.6715176894],[5.0366351434,43.672137827]]]]}},{"type":"Feature","properties":{"NOM":"KD04L9","NUMPOINTS":105.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0374857167,43.6901040056],[5.0383368326,43.7080704278],[5.0631038245,43.707449892],[5.0622449226,43.6894836651],[5.0374857167,43.6901040056]]]]}},{"type":"Feature","properties":{"NOM":"KD06L0","NUMPOINTS":120.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0383368326,43.7080704278],[5.0391884931,43.7260370951],[5.0639632776,43.725416377],[5.0631038245,43.707449892],[5.0383368326,43.7080704278]]]]}},{"type":"Feature","properties":{"NOM":"KD06L1","NUMPOINTS":128.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0391884931,43.7260370951],[5.0400406903,43.7440039938],[5.0648232723,43.7433830934],[5.0639632776,43.725416377],[5.0391884931,43.7260370951]]]]}},{"type":"Feature","properties":{"NOM":"KD06L2","NUMPOINTS":225.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0400406903,43.7440039938],[5.0408934247,43.7619711222],[5.065683809,43.7613500395],[5.0648232723,43.7433830934],[5.0400406903,43.7440039938]]]]}},{"type":"Feature","properties":{"NOM":"KD06L3","NUMPOINTS":314.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0408934247,43.7619711222],[5.0417466968,43.7799384787],[5.0665448884,43.7793172136],[5.065683809,43.7613500395],[5.0408934247,43.7619711222]]]]}},{"type":"Feature","properties":{"NOM":"KD06L4","NUMPOINTS":221.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0417466968,43.7799384787],[5.0426005071,43.7979060616],[5.0674065109,43.7972846141],[5.0665448884,43.7793172136],[5.0417466968,43.7799384787]]]]}},{"type":"Feature","properties":{"NOM":"KD06L5","NUMPOINTS":276.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0426005071,43.7979060616],[5.0434548081,43.8158737465],[5.0682686528,43.815252085],[5.0674065109,43.7972846141],[5.0426005071,43.7979060616]]]]}},{"type":"Feature","properties":{"NOM":"KD20A8","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.044333043,43.3122499779],[5.0451806214,43.3302109583],[5.0697844981,43.3295891182],[5.0689292277,43.3116283268],[5.044333043,43.3122499779]]]]}},{"type":"Feature","properties":{"NOM":"KD20A9","NUMPOINTS":165.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0451806214,43.3302109583],[5.0460287308,43.3481722062],[5.0706403043,43.3475501772],[5.0697844981,43.3295891182],[5.0451806214,43.3302109583]]]]}},{"type":"Feature","properties":{"NOM":"KD22A0","NUMPOINTS":51.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0460287308,43.3481722062],[5.0468773715,43.3661337201],[5.0714966466,43.365511502],[5.0706403043,43.3475501772],[5.0460287308,43.3481722062]]]]}},{"type":"Feature","properties":{"NOM":"KD22A1","NUMPOINTS":152.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0468773715,43.3661337201],[5.0477265441,43.3840954982],[5.0723535257,43.3834730911],[5.0714966466,43.365511502],[5.0468773715,43.3661337201]]]]}},{"type":"Feature","properties":{"NOM":"KD22A2","NUMPOINTS":160.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0477265441,43.3840954982],[5.048576251,43.4020575363],[5.0732109432,43.4014349398],[5.0723535257,43.3834730911],[5.0477265441,43.3840954982]]]]}},{"type":"Feature","properties":{"NOM":"KD22A3","NUMPOINTS":144.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.048576251,43.4020575363],[5.0494265048,43.4200198146],[5.0740689132,43.4193970165],[5.0732109432,43.4014349398],[5.048576251,43.4020575363]]]]}},{"type":"Feature","properties":{"NOM":"KD22A4","NUMPOINTS":92.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0494265048,43.4200198146],[5.050277292,43.4379823513],[5.0749274213,43.4373593516],[5.0740689132,43.4193970165],[5.0494265048,43.4200198146]]]]}},{"type":"Feature","properties":{"NOM":"KD22A5","NUMPOINTS":22.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.050277292,43.4379823513],[5.0511286131,43.4559451448],[5.0757864682,43.4553219433],[5.0749274213,43.4373593516],[5.050277292,43.4379823513]]]]}},{"type":"Feature","properties":{"NOM":"KD22A6","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0511286131,43.4559451448],[5.0519804687,43.4739081934],[5.0766460543,43.4732847901],[5.0757864682,43.4553219433],[5.0511286131,43.4559451448]]]]}},{"type":"Feature","properties":{"NOM":"KD22A7","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0519804687,43.4739081934],[5.0528328591,43.4918714954],[5.0775061802,43.4912478902],[5.0766460543,43.4732847901],[5.0519804687,43.4739081934]]]]}},{"type":"Feature","properties":{"NOM":"KD22A8","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0528328591,43.4918714954],[5.0536857935,43.5098350142],[5.0783668522,43.5092111947],[5.0775061802,43.4912478902],[5.0528328591,43.4918714954]]]]}},{"type":"Feature","properties":{"NOM":"KD22A9","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0536857935,43.5098350142],[5.0545392705,43.5277987526],[5.0792280704,43.5271747028],[5.0783668522,43.5092111947],[5.0536857935,43.5098350142]]]]}},{"type":"Feature","properties":{"NOM":"KD24A0","NUMPOINTS":96.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0545392705,43.5277987526],[5.0553932838,43.5457627375],[5.0800898295,43.5451384572],[5.0792280704,43.5271747028],[5.0545392705,43.5277987526]]]]}},{"type":"Feature","properties":{"NOM":"KD24A1","NUMPOINTS":264.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0553932838,43.5457627375],[5.0562478337,43.5637269671],[5.0809521301,43.5631024563],[5.0800898295,43.5451384572],[5.0553932838,43.5457627375]]]]}},{"type":"Feature","properties":{"NOM":"KD24A2","NUMPOINTS":219.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0562478337,43.5637269671],[5.0571029207,43.58169144],[5.0818149728,43.5810666985],[5.0809521301,43.5631024563],[5.0562478337,43.5637269671]]]]}},{"type":"Feature","properties":{"NOM":"KD24A3","NUMPOINTS":125.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0571029207,43.58169144],[5.0579585454,43.5996561542],[5.082678358,43.5990311821],[5.0818149728,43.5810666985],[5.0571029207,43.58169144]]]]}},{"type":"Feature","properties":{"NOM":"KD24A4","NUMPOINTS":338.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0579585454,43.5996561542],[5.0588147425,43.6176211788],[5.0835423151,43.6169959981],[5.082678358,43.5990311821],[5.0579585454,43.5996561542]]]]}},{"type":"Feature","properties":{"NOM":"KD24A5","NUMPOINTS":354.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0588147425,43.6176211788],[5.0596714786,43.6355864446],[5.0844068171,43.6349610593],[5.0835423151,43.6169959981],[5.0588147425,43.6176211788]]]]}},{"type":"Feature","properties":{"NOM":"KD24A6","NUMPOINTS":369.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0596714786,43.6355864446],[5.0605287537,43.6535519487],[5.0852718629,43.6529263587],[5.0844068171,43.6349610593],[5.0596714786,43.6355864446]]]]}},{"type":"Feature","properties":{"NOM":"KD24A7","NUMPOINTS":264.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0605287537,43.6535519487],[5.0613865682,43.6715176894],[5.086137453,43.6708918946],[5.0852718629,43.6529263587],[5.0605287537,43.6535519487]]]]}},{"type":"Feature","properties":{"NOM":"KD24A8","NUMPOINTS":216.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0613865682,43.6715176894],[5.0622449226,43.6894836651],[5.0870035879,43.6888576653],[5.086137453,43.6708918946],[5.0613865682,43.6715176894]]]]}},{"type":"Feature","properties":{"NOM":"KD24A9","NUMPOINTS":97.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0622449226,43.6894836651],[5.0631038245,43.707449892],[5.0878702753,43.7068236938],[5.0870035879,43.6888576653],[5.0622449226,43.6894836651]]]]}},{"type":"Feature","properties":{"NOM":"KD26A0","NUMPOINTS":111.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0631038245,43.707449892],[5.0639632776,43.725416377],[5.0887375205,43.7247899947],[5.0878702753,43.7068236938],[5.0631038245,43.707449892]]]]}},{"type":"Feature","properties":{"NOM":"KD26A1","NUMPOINTS":374.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0639632776,43.725416377],[5.0648232723,43.7433830934],[5.0896053121,43.7427565269],[5.0887375205,43.7247899947],[5.0639632776,43.725416377]]]]}},{"type":"Feature","properties":{"NOM":"KD26A2","NUMPOINTS":480.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0648232723,43.7433830934],[5.065683809,43.7613500395],[5.0904736507,43.7607232888],[5.0896053121,43.7427565269],[5.0648232723,43.7433830934]]]]}},{"type":"Feature","properties":{"NOM":"KD26A3","NUMPOINTS":351.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.065683809,43.7613500395],[5.0665448884,43.7793172136],[5.0913425369,43.7786902786],[5.0904736507,43.7607232888],[5.065683809,43.7613500395]]]]}},{"type":"Feature","properties":{"NOM":"KD26A4","NUMPOINTS":241.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0665448884,43.7793172136],[5.0674065109,43.7972846141],[5.0922119711,43.7966574947],[5.0913425369,43.7786902786],[5.0665448884,43.7793172136]]]]}},{"type":"Feature","properties":{"NOM":"KD20B8","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0689292277,43.3116283268],[5.0697844981,43.3295891182],[5.0943878391,43.3289616551],[5.0935248771,43.3110010544],[5.0689292277,43.3116283268]]]]}},{"type":"Feature","properties":{"NOM":"KD20B9","NUMPOINTS":93.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0697844981,43.3295891182],[5.0706403043,43.3475501772],[5.0952513416,43.3469225233],[5.0943878391,43.3289616551],[5.0697844981,43.3295891182]]]]}},{"type":"Feature","properties":{"NOM":"KD22B0","NUMPOINTS":75.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0706403043,43.3475501772],[5.0714966466,43.365511502],[5.096115385,43.3648836572],[5.0952513416,43.3469225233],[5.0706403043,43.3475501772]]]]}},{"type":"Feature","properties":{"NOM":"KD22B1","NUMPOINTS":102.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0714966466,43.365511502],[5.0723535257,43.3834730911],[5.0969799701,43.3828450554],[5.096115385,43.3648836572],[5.0714966466,43.365511502]]]]}},{"type":"Feature","properties":{"NOM":"KD22B2","NUMPOINTS":51.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0723535257,43.3834730911],[5.0732109432,43.4014349398],[5.0978450978,43.4008067138],[5.0969799701,43.3828450554],[5.0723535257,43.3834730911]]]]}},{"type":"Feature","properties":{"NOM":"KD22B3","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0732109432,43.4014349398],[5.0740689132,43.4193970165],[5.0987107833,43.4187685871],[5.0978450978,43.4008067138],[5.0732109432,43.4014349398]]]]}},{"type":"Feature","properties":{"NOM":"KD22B4","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0740689132,43.4193970165],[5.0749274213,43.4373593516],[5.0995770119,43.4367307186],[5.0987107833,43.4187685871],[5.0740689132,43.4193970165]]]]}},{"type":"Feature","properties":{"NOM":"KD22B5","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0749274213,43.4373593516],[5.0757864682,43.4553219433],[5.1004437854,43.4546931055],[5.0995770119,43.4367307186],[5.0749274213,43.4373593516]]]]}},{"type":"Feature","properties":{"NOM":"KD22B6","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0757864682,43.4553219433],[5.0766460543,43.4732847901],[5.1013111037,43.4726557468],[5.1004437854,43.4546931055],[5.0757864682,43.4553219433]]]]}},{"type":"Feature","properties":{"NOM":"KD22B7","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0766460543,43.4732847901],[5.0775061802,43.4912478902],[5.1021789659,43.4906186421],[5.1013111037,43.4726557468],[5.0766460543,43.4732847901]]]]}},{"type":"Feature","properties":{"NOM":"KD22B8","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0775061802,43.4912478902],[5.0783668522,43.5092111947],[5.103047376,43.5085817335],[5.1021789659,43.4906186421],[5.0775061802,43.4912478902]]]]}},{"type":"Feature","properties":{"NOM":"KD22B9","NUMPOINTS":29.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0783668522,43.5092111947],[5.0792280704,43.5271747028],[5.103916335,43.5265450138],[5.103047376,43.5085817335],[5.0783668522,43.5092111947]]]]}},{"type":"Feature","properties":{"NOM":"KD24B0","NUMPOINTS":44.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0792280704,43.5271747028],[5.0800898295,43.5451384572],[5.1047858392,43.5445085428],[5.103916335,43.5265450138],[5.0792280704,43.5271747028]]]]}},{"type":"Feature","properties":{"NOM":"KD24B1","NUMPOINTS":39.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0800898295,43.5451384572],[5.0809521301,43.5631024563],[5.1056558892,43.5624723187],[5.1047858392,43.5445085428],[5.0800898295,43.5451384572]]]]}},{"type":"Feature","properties":{"NOM":"KD24B2","NUMPOINTS":167.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0809521301,43.5631024563],[5.0818149728,43.5810666985],[5.1065264855,43.58043634],[5.1056558892,43.5624723187],[5.0809521301,43.5631024563]]]]}},{"type":"Feature","properties":{"NOM":"KD24B3","NUMPOINTS":276.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0818149728,43.5810666985],[5.082678358,43.5990311821],[5.1073976287,43.5984006049],[5.1065264855,43.58043634],[5.0818149728,43.5810666985]]]]}},{"type":"Feature","properties":{"NOM":"KD24B4","NUMPOINTS":199.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.082678358,43.5990311821],[5.0835423151,43.6169959981],[5.1082693466,43.6163652162],[5.1073976287,43.5984006049],[5.082678358,43.5990311821]]]]}},{"type":"Feature","properties":{"NOM":"KD24B5","NUMPOINTS":424.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0835423151,43.6169959981],[5.0844068171,43.6349610593],[5.1091416156,43.6343300778],[5.1082693466,43.6163652162],[5.0835423151,43.6169959981]]]]}},{"type":"Feature","properties":{"NOM":"KD24B6","NUMPOINTS":384.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0844068171,43.6349610593],[5.0852718629,43.6529263587],[5.1100144335,43.6522951778],[5.1091416156,43.6343300778],[5.0844068171,43.6349610593]]]]}},{"type":"Feature","properties":{"NOM":"KD24B7","NUMPOINTS":262.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0852718629,43.6529263587],[5.086137453,43.6708918946],[5.1108878008,43.6702605146],[5.1100144335,43.6522951778],[5.0852718629,43.6529263587]]]]}},{"type":"Feature","properties":{"NOM":"KD24B8","NUMPOINTS":154.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.086137453,43.6708918946],[5.0870035879,43.6888576653],[5.1117617181,43.6882260865],[5.1108878008,43.6702605146],[5.086137453,43.6708918946]]]]}},{"type":"Feature","properties":{"NOM":"KD24B9","NUMPOINTS":182.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0870035879,43.6888576653],[5.0878702753,43.7068236938],[5.1126361951,43.7061919171],[5.1117617181,43.6882260865],[5.0870035879,43.6888576653]]]]}},{"type":"Feature","properties":{"NOM":"KD26B0","NUMPOINTS":255.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0878702753,43.7068236938],[5.0887375205,43.7247899947],[5.1135112413,43.7241580272],[5.1126361951,43.7061919171],[5.0878702753,43.7068236938]]]]}},{"type":"Feature","properties":{"NOM":"KD26B1","NUMPOINTS":262.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0887375205,43.7247899947],[5.0896053121,43.7427565269],[5.11438684,43.7421243673],[5.1135112413,43.7241580272],[5.0887375205,43.7247899947]]]]}},{"type":"Feature","properties":{"NOM":"KD26B2","NUMPOINTS":398.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0896053121,43.7427565269],[5.0904736507,43.7607232888],[5.1152629917,43.7600909355],[5.11438684,43.7421243673],[5.0896053121,43.7427565269]]]]}},{"type":"Feature","properties":{"NOM":"KD26B3","NUMPOINTS":193.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0904736507,43.7607232888],[5.0913425369,43.7786902786],[5.116139697,43.7780577303],[5.1152629917,43.7600909355],[5.0904736507,43.7607232888]]]]}},{"type":"Feature","properties":{"NOM":"KD20C8","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0935248771,43.3110010544],[5.0943878391,43.3289616551],[5.1189907017,43.3283285133],[5.1181200415,43.3103681129],[5.0935248771,43.3110010544]]]]}},{"type":"Feature","properties":{"NOM":"KD20C9","NUMPOINTS":215.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0943878391,43.3289616551],[5.0952513416,43.3469225233],[5.1198619076,43.3462891806],[5.1189907017,43.3283285133],[5.0943878391,43.3289616551]]]]}},{"type":"Feature","properties":{"NOM":"KD22C0","NUMPOINTS":62.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0952513416,43.3469225233],[5.096115385,43.3648836572],[5.1207336598,43.3642501131],[5.1198619076,43.3462891806],[5.0952513416,43.3469225233]]]]}},{"type":"Feature","properties":{"NOM":"KD22C1","NUMPOINTS":58.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.096115385,43.3648836572],[5.0969799701,43.3828450554],[5.1216059588,43.3822113092],[5.1207336598,43.3642501131],[5.096115385,43.3648836572]]]]}},{"type":"Feature","properties":{"NOM":"KD22C2","NUMPOINTS":60.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0969799701,43.3828450554],[5.0978450978,43.4008067138],[5.1224788051,43.4001727668],[5.1216059588,43.3822113092],[5.0969799701,43.3828450554]]]]}},{"type":"Feature","properties":{"NOM":"KD22C3","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0978450978,43.4008067138],[5.0987107833,43.4187685871],[5.1233521998,43.4181344412],[5.1224788051,43.4001727668],[5.0978450978,43.4008067138]]]]}},{"type":"Feature","properties":{"NOM":"KD22C4","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0987107833,43.4187685871],[5.0995770119,43.4367307186],[5.1242261418,43.4360963747],[5.1233521998,43.4181344412],[5.0987107833,43.4187685871]]]]}},{"type":"Feature","properties":{"NOM":"KD22C5","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.0995770119,43.4367307186],[5.1004437854,43.4546931055],[5.1251006314,43.4540585654],[5.1242261418,43.4360963747],[5.0995770119,43.4367307186]]]]}},{"type":"Feature","properties":{"NOM":"KD22C6","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1004437854,43.4546931055],[5.1013111037,43.4726557468],[5.1259756692,43.4720210118],[5.1251006314,43.4540585654],[5.1004437854,43.4546931055]]]]}},{"type":"Feature","properties":{"NOM":"KD22C7","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1013111037,43.4726557468],[5.1021789659,43.4906186421],[5.1268512557,43.4899837122],[5.1259756692,43.4720210118],[5.1013111037,43.4726557468]]]]}},{"type":"Feature","properties":{"NOM":"KD22C8","NUMPOINTS":25.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1021789659,43.4906186421],[5.103047376,43.5085817335],[5.1277273939,43.5079466104],[5.1268512557,43.4899837122],[5.1021789659,43.4906186421]]]]}},{"type":"Feature","properties":{"NOM":"KD22C9","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.103047376,43.5085817335],[5.103916335,43.5265450138],[5.1286040848,43.5259096902],[5.1277273939,43.5079466104],[5.103047376,43.5085817335]]]]}},{"type":"Feature","properties":{"NOM":"KD24C0","NUMPOINTS":65.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.103916335,43.5265450138],[5.1047858392,43.5445085428],[5.1294813258,43.5438730187],[5.1286040848,43.5259096902],[5.103916335,43.5265450138]]]]}},{"type":"Feature","properties":{"NOM":"KD24C1","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1047858392,43.5445085428],[5.1056558892,43.5624723187],[5.1303591175,43.5618365942],[5.1294813258,43.5438730187],[5.1047858392,43.5445085428]]]]}},{"type":"Feature","properties":{"NOM":"KD24C2","NUMPOINTS":55.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1056558892,43.5624723187],[5.1065264855,43.58043634],[5.1312374603,43.5798004148],[5.1303591175,43.5618365942],[5.1056558892,43.5624723187]]]]}},{"type":"Feature","properties":{"NOM":"KD24C3","NUMPOINTS":359.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1065264855,43.58043634],[5.1073976287,43.5984006049],[5.1321163547,43.5977644791],[5.1312374603,43.5798004148],[5.1065264855,43.58043634]]]]}},{"type":"Feature","properties":{"NOM":"KD24C4","NUMPOINTS":196.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1073976287,43.5984006049],[5.1082693466,43.6163652162],[5.1329958343,43.6157288829],[5.1321163547,43.5977644791],[5.1073976287,43.5984006049]]]]}},{"type":"Feature","properties":{"NOM":"KD24C5","NUMPOINTS":330.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1082693466,43.6163652162],[5.1091416156,43.6343300778],[5.1338758718,43.6336935405],[5.1329958343,43.6157288829],[5.1082693466,43.6163652162]]]]}},{"type":"Feature","properties":{"NOM":"KD24C6","NUMPOINTS":216.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1091416156,43.6343300778],[5.1100144335,43.6522951778],[5.1347564631,43.6516584365],[5.1338758718,43.6336935405],[5.1091416156,43.6343300778]]]]}},{"type":"Feature","properties":{"NOM":"KD24C7","NUMPOINTS":86.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1100144335,43.6522951778],[5.1108878008,43.6702605146],[5.1356376088,43.6696235693],[5.1347564631,43.6516584365],[5.1100144335,43.6522951778]]]]}},{"type":"Feature","properties":{"NOM":"KD24C8","NUMPOINTS":52.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1108878008,43.6702605146],[5.1117617181,43.6882260865],[5.1365193092,43.687588937],[5.1356376088,43.6696235693],[5.1108878008,43.6702605146]]]]}},{"type":"Feature","properties":{"NOM":"KD24C9","NUMPOINTS":90.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1117617181,43.6882260865],[5.1126361951,43.7061919171],[5.1374015775,43.7055545598],[5.1365193092,43.687588937],[5.1117617181,43.6882260865]]]]}},{"type":"Feature","properties":{"NOM":"KD26C0","NUMPOINTS":261.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1126361951,43.7061919171],[5.1135112413,43.7241580272],[5.1382844303,43.7235204628],[5.1374015775,43.7055545598],[5.1126361951,43.7061919171]]]]}},{"type":"Feature","properties":{"NOM":"KD26C1","NUMPOINTS":316.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1135112413,43.7241580272],[5.11438684,43.7421243673],[5.1391678405,43.7414865956],[5.1382844303,43.7235204628],[5.1135112413,43.7241580272]]]]}},{"type":"Feature","properties":{"NOM":"KD26C2","NUMPOINTS":219.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.11438684,43.7421243673],[5.1152629917,43.7600909355],[5.1400518087,43.7594529565],[5.1391678405,43.7414865956],[5.11438684,43.7421243673]]]]}},{"type":"Feature","properties":{"NOM":"KD26C3","NUMPOINTS":128.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1152629917,43.7600909355],[5.116139697,43.7780577303],[5.1409363353,43.7774195438],[5.1400518087,43.7594529565],[5.1152629917,43.7600909355]]]]}},{"type":"Feature","properties":{"NOM":"KD20D8","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1181200415,43.3103681129],[5.1189907017,43.3283285133],[5.1435930369,43.3276897326],[5.1427146802,43.3097295338],[5.1181200415,43.3103681129]]]]}},{"type":"Feature","properties":{"NOM":"KD20D9","NUMPOINTS":120.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1189907017,43.3283285133],[5.1198619076,43.3462891806],[5.1444719442,43.3456501984],[5.1435930369,43.3276897326],[5.1189907017,43.3283285133]]]]}},{"type":"Feature","properties":{"NOM":"KD22D0","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1198619076,43.3462891806],[5.1207336598,43.3642501131],[5.1453514025,43.3636109293],[5.1444719442,43.3456501984],[5.1198619076,43.3462891806]]]]}},{"type":"Feature","properties":{"NOM":"KD22D1","NUMPOINTS":31.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1207336598,43.3642501131],[5.1216059588,43.3822113092],[5.1462314124,43.3815719237],[5.1453514025,43.3636109293],[5.1207336598,43.3642501131]]]]}},{"type":"Feature","properties":{"NOM":"KD22D2","NUMPOINTS":104.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1216059588,43.3822113092],[5.1224788051,43.4001727668],[5.1471119744,43.39953318],[5.1462314124,43.3815719237],[5.1216059588,43.3822113092]]]]}},{"type":"Feature","properties":{"NOM":"KD22D3","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1224788051,43.4001727668],[5.1233521998,43.4181344412],[5.1479930741,43.417494659],[5.1471119744,43.39953318],[5.1224788051,43.4001727668]]]]}},{"type":"Feature","properties":{"NOM":"KD22D4","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1233521998,43.4181344412],[5.1242261418,43.4360963747],[5.1488747254,43.4354563958],[5.1479930741,43.417494659],[5.1233521998,43.4181344412]]]]}},{"type":"Feature","properties":{"NOM":"KD22D5","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1242261418,43.4360963747],[5.1251006314,43.4540585654],[5.1497569292,43.4534183898],[5.1488747254,43.4354563958],[5.1242261418,43.4360963747]]]]}},{"type":"Feature","properties":{"NOM":"KD22D6","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1251006314,43.4540585654],[5.1259756692,43.4720210118],[5.150639686,43.4713806395],[5.1497569292,43.4534183898],[5.1251006314,43.4540585654]]]]}},{"type":"Feature","properties":{"NOM":"KD22D7","NUMPOINTS":46.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1259756692,43.4720210118],[5.1268512557,43.4899837122],[5.1515229964,43.489343143],[5.150639686,43.4713806395],[5.1259756692,43.4720210118]]]]}},{"type":"Feature","properties":{"NOM":"KD22D8","NUMPOINTS":173.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1268512557,43.4899837122],[5.1277273939,43.5079466104],[5.1524068622,43.5073058466],[5.1515229964,43.489343143],[5.1268512557,43.4899837122]]]]}},{"type":"Feature","properties":{"NOM":"KD22D9","NUMPOINTS":240.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1277273939,43.5079466104],[5.1286040848,43.5259096902],[5.1532912845,43.5252687242],[5.1524068622,43.5073058466],[5.1277273939,43.5079466104]]]]}},{"type":"Feature","properties":{"NOM":"KD24D0","NUMPOINTS":112.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1286040848,43.5259096902],[5.1294813258,43.5438730187],[5.1541762618,43.5432318504],[5.1532912845,43.5252687242],[5.1286040848,43.5259096902]]]]}},{"type":"Feature","properties":{"NOM":"KD24D1","NUMPOINTS":79.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1294813258,43.5438730187],[5.1303591175,43.5618365942],[5.1550617946,43.5611952235],[5.1541762618,43.5432318504],[5.1294813258,43.5438730187]]]]}},{"type":"Feature","properties":{"NOM":"KD24D2","NUMPOINTS":46.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1303591175,43.5618365942],[5.1312374603,43.5798004148],[5.1559478833,43.5791588417],[5.1550617946,43.5611952235],[5.1303591175,43.5618365942]]]]}},{"type":"Feature","properties":{"NOM":"KD24D3","NUMPOINTS":162.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1312374603,43.5798004148],[5.1321163547,43.5977644791],[5.1568345286,43.5971227035],[5.1559478833,43.5791588417],[5.1312374603,43.5798004148]]]]}},{"type":"Feature","properties":{"NOM":"KD24D4","NUMPOINTS":192.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1321163547,43.5977644791],[5.1329958343,43.6157288829],[5.1577217689,43.6150868981],[5.1568345286,43.5971227035],[5.1321163547,43.5977644791]]]]}},{"type":"Feature","properties":{"NOM":"KD24D5","NUMPOINTS":302.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1329958343,43.6157288829],[5.1338758718,43.6336935405],[5.1586095744,43.6330513499],[5.1577217689,43.6150868981],[5.1329958343,43.6157288829]]]]}},{"type":"Feature","properties":{"NOM":"KD24D6","NUMPOINTS":203.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1338758718,43.6336935405],[5.1347564631,43.6516584365],[5.1594979386,43.6510160401],[5.1586095744,43.6330513499],[5.1338758718,43.6336935405]]]]}},{"type":"Feature","properties":{"NOM":"KD24D7","NUMPOINTS":93.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1347564631,43.6516584365],[5.1356376088,43.6696235693],[5.1603868619,43.6689809668],[5.1594979386,43.6510160401],[5.1347564631,43.6516584365]]]]}},{"type":"Feature","properties":{"NOM":"KD24D8","NUMPOINTS":103.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1356376088,43.6696235693],[5.1365193092,43.687588937],[5.1612763451,43.6869461286],[5.1603868619,43.6689809668],[5.1356376088,43.6696235693]]]]}},{"type":"Feature","properties":{"NOM":"KD24D9","NUMPOINTS":155.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1365193092,43.687588937],[5.1374015775,43.7055545598],[5.1621664032,43.704911542],[5.1612763451,43.6869461286],[5.1365193092,43.687588937]]]]}},{"type":"Feature","properties":{"NOM":"KD26D0","NUMPOINTS":317.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1374015775,43.7055545598],[5.1382844303,43.7235204628],[5.163057062,43.7228772359],[5.1621664032,43.704911542],[5.1374015775,43.7055545598]]]]}},{"type":"Feature","properties":{"NOM":"KD26D1","NUMPOINTS":325.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1382844303,43.7235204628],[5.1391678405,43.7414865956],[5.1639482832,43.7408431596],[5.163057062,43.7228772359],[5.1382844303,43.7235204628]]]]}},{"type":"Feature","properties":{"NOM":"KD26D2","NUMPOINTS":128.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1391678405,43.7414865956],[5.1400518087,43.7594529565],[5.1648400673,43.7588093113],[5.1639482832,43.7408431596],[5.1391678405,43.7414865956]]]]}},{"type":"Feature","properties":{"NOM":"KD20E8","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1427146802,43.3097295338],[5.1435930369,43.3276897326],[5.1681948215,43.32704533],[5.1673087689,43.3090853344],[5.1427146802,43.3097295338]]]]}},{"type":"Feature","properties":{"NOM":"KD20E9","NUMPOINTS":161.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1435930369,43.3276897326],[5.1444719442,43.3456501984],[5.1690814296,43.3450055924],[5.1681948215,43.32704533],[5.1435930369,43.3276897326]]]]}},{"type":"Feature","properties":{"NOM":"KD22E0","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1444719442,43.3456501984],[5.1453514025,43.3636109293],[5.1699685935,43.3629661198],[5.1690814296,43.3450055924],[5.1444719442,43.3456501984]]]]}},{"type":"Feature","properties":{"NOM":"KD22E1","NUMPOINTS":38.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1453514025,43.3636109293],[5.1462314124,43.3815719237],[5.1708563138,43.3809269108],[5.1699685935,43.3629661198],[5.1453514025,43.3636109293]]]]}},{"type":"Feature","properties":{"NOM":"KD22E2","NUMPOINTS":272.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1462314124,43.3815719237],[5.1471119744,43.39953318],[5.171744591,43.3988879635],[5.1708563138,43.3809269108],[5.1462314124,43.3815719237]]]]}},{"type":"Feature","properties":{"NOM":"KD22E3","NUMPOINTS":9.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1471119744,43.39953318],[5.1479930741,43.417494659],[5.1726333963,43.4168492451],[5.171744591,43.3988879635],[5.1471119744,43.39953318]]]]}},{"type":"Feature","properties":{"NOM":"KD22E4","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1479930741,43.417494659],[5.1488747254,43.4354563958],[5.1735227564,43.4348107834],[5.1726333963,43.4168492451],[5.1479930741,43.417494659]]]]}},{"type":"Feature","properties":{"NOM":"KD22E5","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1488747254,43.4354563958],[5.1497569292,43.4534183898],[5.1744126739,43.4527725789],[5.1735227564,43.4348107834],[5.1488747254,43.4354563958]]]]}},{"type":"Feature","properties":{"NOM":"KD22E6","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1497569292,43.4534183898],[5.150639686,43.4713806395],[5.1753031493,43.47073463],[5.1744126739,43.4527725789],[5.1497569292,43.4534183898]]]]}},{"type":"Feature","properties":{"NOM":"KD22E7","NUMPOINTS":160.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.150639686,43.4713806395],[5.1515229964,43.489343143],[5.176194183,43.4886969349],[5.1753031493,43.47073463],[5.150639686,43.4713806395]]]]}},{"type":"Feature","properties":{"NOM":"KD22E8","NUMPOINTS":266.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1515229964,43.489343143],[5.1524068622,43.5073058466],[5.1770857761,43.5066594424],[5.176194183,43.4886969349],[5.1515229964,43.489343143]]]]}},{"type":"Feature","properties":{"NOM":"KD22E9","NUMPOINTS":194.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1524068622,43.5073058466],[5.1532912845,43.5252687242],[5.1779779293,43.524622116],[5.1770857761,43.5066594424],[5.1524068622,43.5073058466]]]]}},{"type":"Feature","properties":{"NOM":"KD24E0","NUMPOINTS":200.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1532912845,43.5252687242],[5.1541762618,43.5432318504],[5.1788706423,43.542585038],[5.1779779293,43.524622116],[5.1532912845,43.5252687242]]]]}},{"type":"Feature","properties":{"NOM":"KD24E1","NUMPOINTS":100.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1541762618,43.5432318504],[5.1550617946,43.5611952235],[5.1797639157,43.5605482068],[5.1788706423,43.542585038],[5.1541762618,43.5432318504]]]]}},{"type":"Feature","properties":{"NOM":"KD24E2","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1550617946,43.5611952235],[5.1559478833,43.5791588417],[5.1806577499,43.5785116208],[5.1797639157,43.5605482068],[5.1550617946,43.5611952235]]]]}},{"type":"Feature","properties":{"NOM":"KD24E3","NUMPOINTS":132.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1559478833,43.5791588417],[5.1568345286,43.5971227035],[5.1815521455,43.5964752783],[5.1806577499,43.5785116208],[5.1559478833,43.5791588417]]]]}},{"type":"Feature","properties":{"NOM":"KD24E4","NUMPOINTS":113.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1568345286,43.5971227035],[5.1577217689,43.6150868981],[5.1824471453,43.6144392619],[5.1815521455,43.5964752783],[5.1568345286,43.5971227035]]]]}},{"type":"Feature","properties":{"NOM":"KD24E5","NUMPOINTS":200.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1577217689,43.6150868981],[5.1586095744,43.6330513499],[5.1833427183,43.6324035062],[5.1824471453,43.6144392619],[5.1577217689,43.6150868981]]]]}},{"type":"Feature","properties":{"NOM":"KD24E6","NUMPOINTS":200.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1586095744,43.6330513499],[5.1594979386,43.6510160401],[5.1842388549,43.6503679886],[5.1833427183,43.6324035062],[5.1586095744,43.6330513499]]]]}},{"type":"Feature","properties":{"NOM":"KD24E7","NUMPOINTS":107.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1594979386,43.6510160401],[5.1603868619,43.6689809668],[5.1851355555,43.6683327076],[5.1842388549,43.6503679886],[5.1594979386,43.6510160401]]]]}},{"type":"Feature","properties":{"NOM":"KD24E8","NUMPOINTS":143.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1603868619,43.6689809668],[5.1612763451,43.6869461286],[5.1860328207,43.6862976615],[5.1851355555,43.6683327076],[5.1603868619,43.6689809668]]]]}},{"type":"Feature","properties":{"NOM":"KD24E9","NUMPOINTS":184.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1612763451,43.6869461286],[5.1621664032,43.704911542],[5.1869306672,43.7042628638],[5.1860328207,43.6862976615],[5.1612763451,43.6869461286]]]]}},{"type":"Feature","properties":{"NOM":"KD26E0","NUMPOINTS":327.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1621664032,43.704911542],[5.163057062,43.7228772359],[5.1878291315,43.7222283468],[5.1869306672,43.7042628638],[5.1621664032,43.704911542]]]]}},{"type":"Feature","properties":{"NOM":"KD26E1","NUMPOINTS":335.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.163057062,43.7228772359],[5.1639482832,43.7408431596],[5.1887281632,43.7401940595],[5.1878291315,43.7222283468],[5.163057062,43.7228772359]]]]}},{"type":"Feature","properties":{"NOM":"KD26E2","NUMPOINTS":220.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1639482832,43.7408431596],[5.1648400673,43.7588093113],[5.1896277625,43.7581600001],[5.1887281632,43.7401940595],[5.1639482832,43.7408431596]]]]}},{"type":"Feature","properties":{"NOM":"KD20F9","NUMPOINTS":95.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1681948215,43.32704533],[5.1690814296,43.3450055924],[5.193690359,43.3443553627],[5.1927960507,43.3263953056],[5.1681948215,43.32704533]]]]}},{"type":"Feature","properties":{"NOM":"KD22F0","NUMPOINTS":67.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1690814296,43.3450055924],[5.1699685935,43.3629661198],[5.194585228,43.3623156849],[5.193690359,43.3443553627],[5.1690814296,43.3450055924]]]]}},{"type":"Feature","properties":{"NOM":"KD22F1","NUMPOINTS":158.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1699685935,43.3629661198],[5.1708563138,43.3809269108],[5.1954806582,43.3802762704],[5.194585228,43.3623156849],[5.1699685935,43.3629661198]]]]}},{"type":"Feature","properties":{"NOM":"KD22F2","NUMPOINTS":322.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1708563138,43.3809269108],[5.171744591,43.3988879635],[5.1963766502,43.3982371177],[5.1954806582,43.3802762704],[5.1708563138,43.3809269108]]]]}},{"type":"Feature","properties":{"NOM":"KD22F3","NUMPOINTS":34.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.171744591,43.3988879635],[5.1726333963,43.4168492451],[5.1972731617,43.4161981998],[5.1963766502,43.3982371177],[5.171744591,43.3988879635]]]]}},{"type":"Feature","properties":{"NOM":"KD22F4","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1726333963,43.4168492451],[5.1735227564,43.4348107834],[5.1981702302,43.4341595378],[5.1972731617,43.4161981998],[5.1726333963,43.4168492451]]]]}},{"type":"Feature","properties":{"NOM":"KD22F5","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1735227564,43.4348107834],[5.1744126739,43.4527725789],[5.1990678608,43.452121133],[5.1981702302,43.4341595378],[5.1735227564,43.4348107834]]]]}},{"type":"Feature","properties":{"NOM":"KD22F6","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1744126739,43.4527725789],[5.1753031493,43.47073463],[5.1999660541,43.4700829836],[5.1990678608,43.452121133],[5.1744126739,43.4527725789]]]]}},{"type":"Feature","properties":{"NOM":"KD22F7","NUMPOINTS":81.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1753031493,43.47073463],[5.176194183,43.4886969349],[5.2008648098,43.4880450833],[5.1999660541,43.4700829836],[5.1753031493,43.47073463]]]]}},{"type":"Feature","properties":{"NOM":"KD22F8","NUMPOINTS":105.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.176194183,43.4886969349],[5.1770857761,43.5066594424],[5.2017641275,43.5060073888],[5.2008648098,43.4880450833],[5.176194183,43.4886969349]]]]}},{"type":"Feature","properties":{"NOM":"KD22F9","NUMPOINTS":118.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1770857761,43.5066594424],[5.1779779293,43.524622116],[5.20266401,43.5239698542],[5.2017641275,43.5060073888],[5.1770857761,43.5066594424]]]]}},{"type":"Feature","properties":{"NOM":"KD24F0","NUMPOINTS":213.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1779779293,43.524622116],[5.1788706423,43.542585038],[5.2035644574,43.5419325696],[5.20266401,43.5239698542],[5.1779779293,43.524622116]]]]}},{"type":"Feature","properties":{"NOM":"KD24F1","NUMPOINTS":214.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1788706423,43.542585038],[5.1797639157,43.5605482068],[5.2044654703,43.5598955333],[5.2035644574,43.5419325696],[5.1788706423,43.542585038]]]]}},{"type":"Feature","properties":{"NOM":"KD24F2","NUMPOINTS":29.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1797639157,43.5605482068],[5.1806577499,43.5785116208],[5.2053670492,43.5778587438],[5.2044654703,43.5598955333],[5.1797639157,43.5605482068]]]]}},{"type":"Feature","properties":{"NOM":"KD24F3","NUMPOINTS":138.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1806577499,43.5785116208],[5.1815521455,43.5964752783],[5.2062691946,43.5958221993],[5.2053670492,43.5778587438],[5.1806577499,43.5785116208]]]]}},{"type":"Feature","properties":{"NOM":"KD24F4","NUMPOINTS":68.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1815521455,43.5964752783],[5.1824471453,43.6144392619],[5.2071719541,43.6137859704],[5.2062691946,43.5958221993],[5.1815521455,43.5964752783]]]]}},{"type":"Feature","properties":{"NOM":"KD24F5","NUMPOINTS":116.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1824471453,43.6144392619],[5.1833427183,43.6324035062],[5.2080752962,43.6317500032],[5.2071719541,43.6137859704],[5.1824471453,43.6144392619]]]]}},{"type":"Feature","properties":{"NOM":"KD24F6","NUMPOINTS":122.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1833427183,43.6324035062],[5.1842388549,43.6503679886],[5.2089792074,43.6497142737],[5.2080752962,43.6317500032],[5.1833427183,43.6324035062]]]]}},{"type":"Feature","properties":{"NOM":"KD24F7","NUMPOINTS":180.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1842388549,43.6503679886],[5.1851355555,43.6683327076],[5.2098836881,43.6676787805],[5.2089792074,43.6497142737],[5.1842388549,43.6503679886]]]]}},{"type":"Feature","properties":{"NOM":"KD24F8","NUMPOINTS":126.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1851355555,43.6683327076],[5.1860328207,43.6862976615],[5.210788739,43.6856435217],[5.2098836881,43.6676787805],[5.1851355555,43.6683327076]]]]}},{"type":"Feature","properties":{"NOM":"KD24F9","NUMPOINTS":235.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1860328207,43.6862976615],[5.1869306672,43.7042628638],[5.211694376,43.7036085057],[5.210788739,43.6856435217],[5.1860328207,43.6862976615]]]]}},{"type":"Feature","properties":{"NOM":"KD26F0","NUMPOINTS":306.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1869306672,43.7042628638],[5.1878291315,43.7222283468],[5.2126006461,43.7215737591],[5.211694376,43.7036085057],[5.1869306672,43.7042628638]]]]}},{"type":"Feature","properties":{"NOM":"KD26F1","NUMPOINTS":278.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1878291315,43.7222283468],[5.1887281632,43.7401940595],[5.2135074883,43.7395392398],[5.2126006461,43.7215737591],[5.1878291315,43.7222283468]]]]}},{"type":"Feature","properties":{"NOM":"KD26F2","NUMPOINTS":228.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1887281632,43.7401940595],[5.1896277625,43.7581600001],[5.2144149032,43.7575049463],[5.2135074883,43.7395392398],[5.1887281632,43.7401940595]]]]}},{"type":"Feature","properties":{"NOM":"KD20G9","NUMPOINTS":71.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1927960507,43.3263953056],[5.193690359,43.3443553627],[5.218298851,43.343699448],[5.2173968458,43.3257396105],[5.1927960507,43.3263953056]]]]}},{"type":"Feature","properties":{"NOM":"KD22G0","NUMPOINTS":129.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.193690359,43.3443553627],[5.194585228,43.3623156849],[5.2192014208,43.3616595494],[5.218298851,43.343699448],[5.193690359,43.3443553627]]]]}},{"type":"Feature","properties":{"NOM":"KD22G1","NUMPOINTS":33.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.194585228,43.3623156849],[5.1954806582,43.3802762704],[5.2201045558,43.3796199132],[5.2192014208,43.3616595494],[5.194585228,43.3623156849]]]]}},{"type":"Feature","properties":{"NOM":"KD22G2","NUMPOINTS":298.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1954806582,43.3802762704],[5.1963766502,43.3982371177],[5.2210082563,43.3975805376],[5.2201045558,43.3796199132],[5.1954806582,43.3802762704]]]]}},{"type":"Feature","properties":{"NOM":"KD22G3","NUMPOINTS":251.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1963766502,43.3982371177],[5.1972731617,43.4161981998],[5.2219124542,43.4155414102],[5.2210082563,43.3975805376],[5.1963766502,43.3982371177]]]]}},{"type":"Feature","properties":{"NOM":"KD22G4","NUMPOINTS":189.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1972731617,43.4161981998],[5.1981702302,43.4341595378],[5.2228172056,43.4335025397],[5.2219124542,43.4155414102],[5.1972731617,43.4161981998]]]]}},{"type":"Feature","properties":{"NOM":"KD22G5","NUMPOINTS":27.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1981702302,43.4341595378],[5.1990678608,43.452121133],[5.2237225218,43.451463926],[5.2228172056,43.4335025397],[5.1981702302,43.4341595378]]]]}},{"type":"Feature","properties":{"NOM":"KD22G6","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1990678608,43.452121133],[5.1999660541,43.4700829836],[5.2246284031,43.4694255676],[5.2237225218,43.451463926],[5.1990678608,43.452121133]]]]}},{"type":"Feature","properties":{"NOM":"KD22G7","NUMPOINTS":33.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.1999660541,43.4700829836],[5.2008648098,43.4880450833],[5.2255348502,43.4873874627],[5.2246284031,43.4694255676],[5.1999660541,43.4700829836]]]]}},{"type":"Feature","properties":{"NOM":"KD22G8","NUMPOINTS":258.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2008648098,43.4880450833],[5.2017641275,43.5060073888],[5.2264418738,43.5053495746],[5.2255348502,43.4873874627],[5.2008648098,43.4880450833]]]]}},{"type":"Feature","properties":{"NOM":"KD22G9","NUMPOINTS":249.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2017641275,43.5060073888],[5.20266401,43.5239698542],[5.2273494902,43.5233118546],[5.2264418738,43.5053495746],[5.2017641275,43.5060073888]]]]}},{"type":"Feature","properties":{"NOM":"KD24G0","NUMPOINTS":150.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.20266401,43.5239698542],[5.2035644574,43.5419325696],[5.2282576764,43.5412743845],[5.2273494902,43.5233118546],[5.20266401,43.5239698542]]]]}},{"type":"Feature","properties":{"NOM":"KD24G1","NUMPOINTS":323.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2035644574,43.5419325696],[5.2044654703,43.5598955333],[5.2291664329,43.5592371628],[5.2282576764,43.5412743845],[5.2035644574,43.5419325696]]]]}},{"type":"Feature","properties":{"NOM":"KD24G2","NUMPOINTS":51.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2044654703,43.5598955333],[5.2053670492,43.5778587438],[5.2300757602,43.5772001877],[5.2291664329,43.5592371628],[5.2044654703,43.5598955333]]]]}},{"type":"Feature","properties":{"NOM":"KD24G3","NUMPOINTS":104.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2053670492,43.5778587438],[5.2062691946,43.5958221993],[5.230985659,43.5951634576],[5.2300757602,43.5772001877],[5.2053670492,43.5778587438]]]]}},{"type":"Feature","properties":{"NOM":"KD24G4","NUMPOINTS":48.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2062691946,43.5958221993],[5.2071719541,43.6137859704],[5.2318961831,43.6131270177],[5.230985659,43.5951634576],[5.2062691946,43.5958221993]]]]}},{"type":"Feature","properties":{"NOM":"KD24G5","NUMPOINTS":49.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2071719541,43.6137859704],[5.2080752962,43.6317500032],[5.2328073001,43.6310908347],[5.2318961831,43.6131270177],[5.2071719541,43.6137859704]]]]}},{"type":"Feature","properties":{"NOM":"KD24G6","NUMPOINTS":84.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2080752962,43.6317500032],[5.2089792074,43.6497142737],[5.233718991,43.6490548895],[5.2328073001,43.6310908347],[5.2080752962,43.6317500032]]]]}},{"type":"Feature","properties":{"NOM":"KD24G7","NUMPOINTS":175.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2089792074,43.6497142737],[5.2098836881,43.6676787805],[5.2346312564,43.6670191803],[5.233718991,43.6490548895],[5.2089792074,43.6497142737]]]]}},{"type":"Feature","properties":{"NOM":"KD24G8","NUMPOINTS":168.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2098836881,43.6676787805],[5.210788739,43.6856435217],[5.2355440968,43.6849837056],[5.2346312564,43.6670191803],[5.2098836881,43.6676787805]]]]}},{"type":"Feature","properties":{"NOM":"KD24G9","NUMPOINTS":81.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.210788739,43.6856435217],[5.211694376,43.7036085057],[5.2364575263,43.702948467],[5.2355440968,43.6849837056],[5.210788739,43.6856435217]]]]}},{"type":"Feature","properties":{"NOM":"KD26G0","NUMPOINTS":181.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.211694376,43.7036085057],[5.2126006461,43.7215737591],[5.2373716004,43.7209134757],[5.2364575263,43.702948467],[5.211694376,43.7036085057]]]]}},{"type":"Feature","properties":{"NOM":"KD26G1","NUMPOINTS":295.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2126006461,43.7215737591],[5.2135074883,43.7395392398],[5.2382862516,43.7388787117],[5.2373716004,43.7209134757],[5.2126006461,43.7215737591]]]]}},{"type":"Feature","properties":{"NOM":"KD26G2","NUMPOINTS":181.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2135074883,43.7395392398],[5.2144149032,43.7575049463],[5.2392014804,43.7568441733],[5.2382862516,43.7388787117],[5.2135074883,43.7395392398]]]]}},{"type":"Feature","properties":{"NOM":"KD20H9","NUMPOINTS":19.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2173968458,43.3257396105],[5.218298851,43.343699448],[5.2429068208,43.3430378895],[5.2419971289,43.3250782745],[5.2173968458,43.3257396105]]]]}},{"type":"Feature","properties":{"NOM":"KD22H0","NUMPOINTS":30.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.218298851,43.343699448],[5.2192014208,43.3616595494],[5.2438170821,43.3609977684],[5.2429068208,43.3430378895],[5.218298851,43.343699448]]]]}},{"type":"Feature","properties":{"NOM":"KD22H1","NUMPOINTS":40.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2192014208,43.3616595494],[5.2201045558,43.3796199132],[5.2447279133,43.3789579096],[5.2438170821,43.3609977684],[5.2192014208,43.3616595494]]]]}},{"type":"Feature","properties":{"NOM":"KD22H2","NUMPOINTS":208.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2201045558,43.3796199132],[5.2210082563,43.3975805376],[5.245639315,43.3969183113],[5.2447279133,43.3789579096],[5.2201045558,43.3796199132]]]]}},{"type":"Feature","properties":{"NOM":"KD22H3","NUMPOINTS":208.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2210082563,43.3975805376],[5.2219124542,43.4155414102],[5.2465511934,43.4148789756],[5.245639315,43.3969183113],[5.2210082563,43.3975805376]]]]}},{"type":"Feature","properties":{"NOM":"KD22H4","NUMPOINTS":103.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2219124542,43.4155414102],[5.2228172056,43.4335025397],[5.2474636213,43.4328398991],[5.2465511934,43.4148789756],[5.2219124542,43.4155414102]]]]}},{"type":"Feature","properties":{"NOM":"KD22H5","NUMPOINTS":311.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2228172056,43.4335025397],[5.2237225218,43.451463926],[5.2483766188,43.4508010794],[5.2474636213,43.4328398991],[5.2228172056,43.4335025397]]]]}},{"type":"Feature","properties":{"NOM":"KD22H6","NUMPOINTS":321.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2237225218,43.451463926],[5.2246284031,43.4694255676],[5.2492901862,43.4687625149],[5.2483766188,43.4508010794],[5.2237225218,43.451463926]]]]}},{"type":"Feature","properties":{"NOM":"KD22H7","NUMPOINTS":227.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2246284031,43.4694255676],[5.2255348502,43.4873874627],[5.2502043241,43.4867242039],[5.2492901862,43.4687625149],[5.2246284031,43.4694255676]]]]}},{"type":"Feature","properties":{"NOM":"KD22H8","NUMPOINTS":223.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2255348502,43.4873874627],[5.2264418738,43.5053495746],[5.2511190508,43.5046861189],[5.2502043241,43.4867242039],[5.2255348502,43.4873874627]]]]}},{"type":"Feature","properties":{"NOM":"KD22H9","NUMPOINTS":236.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2264418738,43.5053495746],[5.2273494902,43.5233118546],[5.2520344006,43.5226482116],[5.2511190508,43.5046861189],[5.2264418738,43.5053495746]]]]}},{"type":"Feature","properties":{"NOM":"KD24H0","NUMPOINTS":222.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2273494902,43.5233118546],[5.2282576764,43.5412743845],[5.252950325,43.5406105543],[5.2520344006,43.5226482116],[5.2273494902,43.5233118546]]]]}},{"type":"Feature","properties":{"NOM":"KD24H1","NUMPOINTS":169.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2282576764,43.5412743845],[5.2291664329,43.5592371628],[5.2538668246,43.5585731453],[5.252950325,43.5406105543],[5.2282576764,43.5412743845]]]]}},{"type":"Feature","properties":{"NOM":"KD24H2","NUMPOINTS":30.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2291664329,43.5592371628],[5.2300757602,43.5772001877],[5.2547838999,43.5765359828],[5.2538668246,43.5585731453],[5.2291664329,43.5592371628]]]]}},{"type":"Feature","properties":{"NOM":"KD24H3","NUMPOINTS":43.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2300757602,43.5772001877],[5.230985659,43.5951634576],[5.2557015515,43.5944990652],[5.2547838999,43.5765359828],[5.2300757602,43.5772001877]]]]}},{"type":"Feature","properties":{"NOM":"KD24H4","NUMPOINTS":24.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.230985659,43.5951634576],[5.2318961831,43.6131270177],[5.2566198387,43.6124624146],[5.2557015515,43.5944990652],[5.230985659,43.5951634576]]]]}},{"type":"Feature","properties":{"NOM":"KD24H5","NUMPOINTS":91.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2318961831,43.6131270177],[5.2328073001,43.6310908347],[5.2575387301,43.630426014],[5.2566198387,43.6124624146],[5.2318961831,43.6131270177]]]]}},{"type":"Feature","properties":{"NOM":"KD24H6","NUMPOINTS":135.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2328073001,43.6310908347],[5.233718991,43.6490548895],[5.2584582002,43.6483898511],[5.2575387301,43.630426014],[5.2328073001,43.6310908347]]]]}},{"type":"Feature","properties":{"NOM":"KD24H7","NUMPOINTS":356.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.233718991,43.6490548895],[5.2346312564,43.6670191803],[5.2593782497,43.6663539242],[5.2584582002,43.6483898511],[5.233718991,43.6490548895]]]]}},{"type":"Feature","properties":{"NOM":"KD24H8","NUMPOINTS":288.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2346312564,43.6670191803],[5.2355440968,43.6849837056],[5.2602988792,43.6843182317],[5.2593782497,43.6663539242],[5.2346312564,43.6670191803]]]]}},{"type":"Feature","properties":{"NOM":"KD24H9","NUMPOINTS":27.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2355440968,43.6849837056],[5.2364575263,43.702948467],[5.2612201,43.7022827709],[5.2602988792,43.6843182317],[5.2355440968,43.6849837056]]]]}},{"type":"Feature","properties":{"NOM":"KD26H0","NUMPOINTS":195.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2364575263,43.702948467],[5.2373716004,43.7209134757],[5.2621419777,43.720247533],[5.2612201,43.7022827709],[5.2364575263,43.702948467]]]]}},{"type":"Feature","properties":{"NOM":"KD26H1","NUMPOINTS":227.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2373716004,43.7209134757],[5.2382862516,43.7388787117],[5.2630644374,43.7382125223],[5.2621419777,43.720247533],[5.2373716004,43.7209134757]]]]}},{"type":"Feature","properties":{"NOM":"KD26H2","NUMPOINTS":121.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2382862516,43.7388787117],[5.2392014804,43.7568441733],[5.2639874795,43.7561777371],[5.2630644374,43.7382125223],[5.2382862516,43.7388787117]]]]}},{"type":"Feature","properties":{"NOM":"KD20K9","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2419971289,43.3250782745],[5.2429068208,43.3430378895],[5.2675142211,43.3423707089],[5.266596843,43.3244113181],[5.2419971289,43.3250782745]]]]}},{"type":"Feature","properties":{"NOM":"KD22K0","NUMPOINTS":22.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2429068208,43.3430378895],[5.2438170821,43.3609977684],[5.2684321733,43.3603303634],[5.2675142211,43.3423707089],[5.2429068208,43.3430378895]]]]}},{"type":"Feature","properties":{"NOM":"KD22K1","NUMPOINTS":150.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2438170821,43.3609977684],[5.2447279133,43.3789579096],[5.2693507003,43.3782902802],[5.2684321733,43.3603303634],[5.2438170821,43.3609977684]]]]}},{"type":"Feature","properties":{"NOM":"KD22K2","NUMPOINTS":135.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2447279133,43.3789579096],[5.245639315,43.3969183113],[5.2702698025,43.3962504574],[5.2693507003,43.3782902802],[5.2447279133,43.3789579096]]]]}},{"type":"Feature","properties":{"NOM":"KD22K3","NUMPOINTS":443.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.245639315,43.3969183113],[5.2465511934,43.4148789756],[5.2711893634,43.4142109103],[5.2702698025,43.3962504574],[5.245639315,43.3969183113]]]]}},{"type":"Feature","properties":{"NOM":"KD22K4","NUMPOINTS":158.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2465511934,43.4148789756],[5.2474636213,43.4328398991],[5.2721094674,43.432171626],[5.2711893634,43.4142109103],[5.2465511934,43.4148789756]]]]}},{"type":"Feature","properties":{"NOM":"KD22K5","NUMPOINTS":189.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2474636213,43.4328398991],[5.2483766188,43.4508010794],[5.2730301456,43.4501325985],[5.2721094674,43.432171626],[5.2474636213,43.4328398991]]]]}},{"type":"Feature","properties":{"NOM":"KD22K6","NUMPOINTS":110.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2483766188,43.4508010794],[5.2492901862,43.4687625149],[5.2739513986,43.4680938261],[5.2730301456,43.4501325985],[5.2483766188,43.4508010794]]]]}},{"type":"Feature","properties":{"NOM":"KD22K7","NUMPOINTS":30.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2492901862,43.4687625149],[5.2502043241,43.4867242039],[5.2748732269,43.4860553071],[5.2739513986,43.4680938261],[5.2492901862,43.4687625149]]]]}},{"type":"Feature","properties":{"NOM":"KD22K8","NUMPOINTS":59.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2502043241,43.4867242039],[5.2511190508,43.5046861189],[5.2757956535,43.5040170219],[5.2748732269,43.4860553071],[5.2502043241,43.4867242039]]]]}},{"type":"Feature","properties":{"NOM":"KD22K9","NUMPOINTS":134.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2511190508,43.5046861189],[5.2520344006,43.5226482116],[5.2767187362,43.5219789256],[5.2757956535,43.5040170219],[5.2511190508,43.5046861189]]]]}},{"type":"Feature","properties":{"NOM":"KD24K0","NUMPOINTS":155.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2520344006,43.5226482116],[5.252950325,43.5406105543],[5.2776423984,43.5399410791],[5.2767187362,43.5219789256],[5.2520344006,43.5226482116]]]]}},{"type":"Feature","properties":{"NOM":"KD24K1","NUMPOINTS":232.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.252950325,43.5406105543],[5.2538668246,43.5585731453],[5.2785666406,43.5579034809],[5.2776423984,43.5399410791],[5.252950325,43.5406105543]]]]}},{"type":"Feature","properties":{"NOM":"KD24K2","NUMPOINTS":80.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2538668246,43.5585731453],[5.2547838999,43.5765359828],[5.2794914633,43.5758661292],[5.2785666406,43.5579034809],[5.2538668246,43.5585731453]]]]}},{"type":"Feature","properties":{"NOM":"KD24K3","NUMPOINTS":46.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2547838999,43.5765359828],[5.2557015515,43.5944990652],[5.2804168672,43.5938290223],[5.2794914633,43.5758661292],[5.2547838999,43.5765359828]]]]}},{"type":"Feature","properties":{"NOM":"KD24K4","NUMPOINTS":55.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2557015515,43.5944990652],[5.2566198387,43.6124624146],[5.2813429162,43.6117921613],[5.2804168672,43.5938290223],[5.2557015515,43.5944990652]]]]}},{"type":"Feature","properties":{"NOM":"KD24K5","NUMPOINTS":112.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2566198387,43.6124624146],[5.2575387301,43.630426014],[5.2822695813,43.6297555413],[5.2813429162,43.6117921613],[5.2566198387,43.6124624146]]]]}},{"type":"Feature","properties":{"NOM":"KD24K6","NUMPOINTS":255.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2575387301,43.630426014],[5.2584582002,43.6483898511],[5.2831968301,43.6477191589],[5.2822695813,43.6297555413],[5.2575387301,43.630426014]]]]}},{"type":"Feature","properties":{"NOM":"KD24K7","NUMPOINTS":455.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2584582002,43.6483898511],[5.2593782497,43.6663539242],[5.2841246632,43.6656830124],[5.2831968301,43.6477191589],[5.2584582002,43.6483898511]]]]}},{"type":"Feature","properties":{"NOM":"KD24K8","NUMPOINTS":313.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2593782497,43.6663539242],[5.2602988792,43.6843182317],[5.2850530811,43.6836471002],[5.2841246632,43.6656830124],[5.2593782497,43.6663539242]]]]}},{"type":"Feature","properties":{"NOM":"KD24K9","NUMPOINTS":43.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2602988792,43.6843182317],[5.2612201,43.7022827709],[5.2859820925,43.7016114174],[5.2850530811,43.6836471002],[5.2602988792,43.6843182317]]]]}},{"type":"Feature","properties":{"NOM":"KD26K0","NUMPOINTS":43.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2612201,43.7022827709],[5.2621419777,43.720247533],[5.2869117731,43.7195759311],[5.2859820925,43.7016114174],[5.2612201,43.7022827709]]]]}},{"type":"Feature","properties":{"NOM":"KD26K1","NUMPOINTS":130.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2621419777,43.720247533],[5.2630644374,43.7382125223],[5.2878420406,43.7375406719],[5.2869117731,43.7195759311],[5.2621419777,43.720247533]]]]}},{"type":"Feature","properties":{"NOM":"KD26K2","NUMPOINTS":121.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2630644374,43.7382125223],[5.2639874795,43.7561777371],[5.2887728956,43.7555056381],[5.2878420406,43.7375406719],[5.2630644374,43.7382125223]]]]}},{"type":"Feature","properties":{"NOM":"KD20L5","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2629329255,43.2525765742],[5.2638480613,43.2705348375],[5.2884241017,43.2698629486],[5.2875012579,43.2519049157],[5.2629329255,43.2525765742]]]]}},{"type":"Feature","properties":{"NOM":"KD22L0","NUMPOINTS":20.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2675142211,43.3423707089],[5.2684321733,43.3603303634],[5.2930466897,43.3596573347],[5.292121047,43.3416979063],[5.2675142211,43.3423707089]]]]}},{"type":"Feature","properties":{"NOM":"KD22L1","NUMPOINTS":34.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2684321733,43.3603303634],[5.2693507003,43.3782902802],[5.2939729119,43.3776170252],[5.2930466897,43.3596573347],[5.2684321733,43.3603303634]]]]}},{"type":"Feature","properties":{"NOM":"KD22L2","NUMPOINTS":92.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2693507003,43.3782902802],[5.2702698025,43.3962504574],[5.2948997141,43.395576976],[5.2939729119,43.3776170252],[5.2693507003,43.3782902802]]]]}},{"type":"Feature","properties":{"NOM":"KD22L3","NUMPOINTS":307.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2702698025,43.3962504574],[5.2711893634,43.4142109103],[5.2958269596,43.4135372145],[5.2948997141,43.395576976],[5.2702698025,43.3962504574]]]]}},{"type":"Feature","properties":{"NOM":"KD22L4","NUMPOINTS":384.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2711893634,43.4142109103],[5.2721094674,43.432171626],[5.2967547391,43.4314977206],[5.2958269596,43.4135372145],[5.2711893634,43.4142109103]]]]}},{"type":"Feature","properties":{"NOM":"KD22L5","NUMPOINTS":146.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2721094674,43.432171626],[5.2730301456,43.4501325985],[5.2976830975,43.4494584833],[5.2967547391,43.4314977206],[5.2721094674,43.432171626]]]]}},{"type":"Feature","properties":{"NOM":"KD22L6","NUMPOINTS":38.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2730301456,43.4501325985],[5.2739513986,43.4680938261],[5.2986120355,43.4674195011],[5.2976830975,43.4494584833],[5.2730301456,43.4501325985]]]]}},{"type":"Feature","properties":{"NOM":"KD22L7","NUMPOINTS":43.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2739513986,43.4680938261],[5.2748732269,43.4860553071],[5.2995415536,43.4853807723],[5.2986120355,43.4674195011],[5.2739513986,43.4680938261]]]]}},{"type":"Feature","properties":{"NOM":"KD22L8","NUMPOINTS":21.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2748732269,43.4860553071],[5.2757956535,43.5040170219],[5.300471673,43.5033422848],[5.2995415536,43.4853807723],[5.2748732269,43.4860553071]]]]}},{"type":"Feature","properties":{"NOM":"KD22L9","NUMPOINTS":68.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2757956535,43.5040170219],[5.2767187362,43.5219789256],[5.3014024821,43.5213039983],[5.300471673,43.5033422848],[5.2757956535,43.5040170219]]]]}},{"type":"Feature","properties":{"NOM":"KD24L0","NUMPOINTS":169.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2767187362,43.5219789256],[5.2776423984,43.5399410791],[5.3023338786,43.53926596],[5.3014024821,43.5213039983],[5.2767187362,43.5219789256]]]]}},{"type":"Feature","properties":{"NOM":"KD24L1","NUMPOINTS":384.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2776423984,43.5399410791],[5.2785666406,43.5579034809],[5.3032658632,43.5572281682],[5.3023338786,43.53926596],[5.2776423984,43.5399410791]]]]}},{"type":"Feature","properties":{"NOM":"KD24L2","NUMPOINTS":86.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2785666406,43.5579034809],[5.2794914633,43.5758661292],[5.3041984364,43.5751906213],[5.3032658632,43.5572281682],[5.2785666406,43.5579034809]]]]}},{"type":"Feature","properties":{"NOM":"KD24L3","NUMPOINTS":107.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2794914633,43.5758661292],[5.2804168672,43.5938290223],[5.3051315987,43.5931533176],[5.3041984364,43.5751906213],[5.2794914633,43.5758661292]]]]}},{"type":"Feature","properties":{"NOM":"KD24L4","NUMPOINTS":133.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2804168672,43.5938290223],[5.2813429162,43.6117921613],[5.3060654108,43.611116243],[5.3051315987,43.5931533176],[5.2804168672,43.5938290223]]]]}},{"type":"Feature","properties":{"NOM":"KD24L5","NUMPOINTS":366.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2813429162,43.6117921613],[5.2822695813,43.6297555413],[5.306999848,43.6290794001],[5.3060654108,43.611116243],[5.2813429162,43.6117921613]]]]}},{"type":"Feature","properties":{"NOM":"KD24L6","NUMPOINTS":217.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2822695813,43.6297555413],[5.2831968301,43.6477191589],[5.3079348735,43.647042795],[5.306999848,43.6290794001],[5.2822695813,43.6297555413]]]]}},{"type":"Feature","properties":{"NOM":"KD24L7","NUMPOINTS":211.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2831968301,43.6477191589],[5.2841246632,43.6656830124],[5.3088704879,43.665006426],[5.3079348735,43.647042795],[5.2831968301,43.6477191589]]]]}},{"type":"Feature","properties":{"NOM":"KD24L8","NUMPOINTS":200.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2841246632,43.6656830124],[5.2850530811,43.6836471002],[5.3098066916,43.6829702913],[5.3088704879,43.665006426],[5.2841246632,43.6656830124]]]]}},{"type":"Feature","properties":{"NOM":"KD24L9","NUMPOINTS":54.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2850530811,43.6836471002],[5.2859820925,43.7016114174],[5.3107434896,43.7009343866],[5.3098066916,43.6829702913],[5.2850530811,43.6836471002]]]]}},{"type":"Feature","properties":{"NOM":"KD26L0","NUMPOINTS":152.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2859820925,43.7016114174],[5.2869117731,43.7195759311],[5.3116809584,43.7188986617],[5.3107434896,43.7009343866],[5.2859820925,43.7016114174]]]]}},{"type":"Feature","properties":{"NOM":"KD26L1","NUMPOINTS":193.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2869117731,43.7195759311],[5.2878420406,43.7375406719],[5.3126190167,43.7368631661],[5.3116809584,43.7188986617],[5.2869117731,43.7195759311]]]]}},{"type":"Feature","properties":{"NOM":"KD26L2","NUMPOINTS":151.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2878420406,43.7375406719],[5.2887728956,43.7555056381],[5.3135576652,43.7548278979],[5.3126190167,43.7368631661],[5.2878420406,43.7375406719]]]]}},{"type":"Feature","properties":{"NOM":"KD40A5","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2875012579,43.2519049157],[5.2884241017,43.2698629486],[5.3129992941,43.2691854984],[5.3120688038,43.2512276883],[5.2875012579,43.2519049157]]]]}},{"type":"Feature","properties":{"NOM":"KD40A6","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2884241017,43.2698629486],[5.2893475254,43.2878212516],[5.3139303627,43.2871435793],[5.3129992941,43.2691854984],[5.2884241017,43.2698629486]]]]}},{"type":"Feature","properties":{"NOM":"KD40A7","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2893475254,43.2878212516],[5.2902714981,43.3057798425],[5.31486198,43.3051019467],[5.3139303627,43.2871435793],[5.2893475254,43.2878212516]]]]}},{"type":"Feature","properties":{"NOM":"KD42A0","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.292121047,43.3416979063],[5.2930466897,43.3596573347],[5.3176600857,43.3589787767],[5.3167268025,43.3410195688],[5.292121047,43.3416979063]]]]}},{"type":"Feature","properties":{"NOM":"KD42A1","NUMPOINTS":109.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2930466897,43.3596573347],[5.2939729119,43.3776170252],[5.3185939508,43.3769382468],[5.3176600857,43.3589787767],[5.2930466897,43.3596573347]]]]}},{"type":"Feature","properties":{"NOM":"KD42A2","NUMPOINTS":61.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2939729119,43.3776170252],[5.2948997141,43.395576976],[5.3195283985,43.3948979776],[5.3185939508,43.3769382468],[5.2939729119,43.3776170252]]]]}},{"type":"Feature","properties":{"NOM":"KD42A3","NUMPOINTS":210.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2948997141,43.395576976],[5.2958269596,43.4135372145],[5.3204633558,43.4128579955],[5.3195283985,43.3948979776],[5.2948997141,43.395576976]]]]}},{"type":"Feature","properties":{"NOM":"KD42A4","NUMPOINTS":178.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2958269596,43.4135372145],[5.2967547391,43.4314977206],[5.3213988743,43.4308182818],[5.3204633558,43.4128579955],[5.2958269596,43.4135372145]]]]}},{"type":"Feature","properties":{"NOM":"KD42A5","NUMPOINTS":37.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2967547391,43.4314977206],[5.2976830975,43.4494584833],[5.3223349847,43.4487788235],[5.3213988743,43.4308182818],[5.2967547391,43.4314977206]]]]}},{"type":"Feature","properties":{"NOM":"KD42A6","NUMPOINTS":77.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2976830975,43.4494584833],[5.2986120355,43.4674195011],[5.3232716876,43.4667396191],[5.3223349847,43.4487788235],[5.2976830975,43.4494584833]]]]}},{"type":"Feature","properties":{"NOM":"KD42A7","NUMPOINTS":58.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2986120355,43.4674195011],[5.2995415536,43.4853807723],[5.3242089836,43.4847006668],[5.3232716876,43.4667396191],[5.2986120355,43.4674195011]]]]}},{"type":"Feature","properties":{"NOM":"KD42A8","NUMPOINTS":62.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.2995415536,43.4853807723],[5.300471673,43.5033422848],[5.325146888,43.5026619578],[5.3242089836,43.4847006668],[5.2995415536,43.4853807723]]]]}},{"type":"Feature","properties":{"NOM":"KD42A9","NUMPOINTS":110.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.300471673,43.5033422848],[5.3014024821,43.5213039983],[5.3260854709,43.5206234573],[5.325146888,43.5026619578],[5.300471673,43.5033422848]]]]}},{"type":"Feature","properties":{"NOM":"KD44A0","NUMPOINTS":65.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3014024821,43.5213039983],[5.3023338786,43.53926596],[5.3270246462,43.538585205],[5.3260854709,43.5206234573],[5.3014024821,43.5213039983]]]]}},{"type":"Feature","properties":{"NOM":"KD44A1","NUMPOINTS":270.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3023338786,43.53926596],[5.3032658632,43.5572281682],[5.3279644144,43.5565471991],[5.3270246462,43.538585205],[5.3023338786,43.53926596]]]]}},{"type":"Feature","properties":{"NOM":"KD44A2","NUMPOINTS":74.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3032658632,43.5572281682],[5.3041984364,43.5751906213],[5.3289047762,43.574509438],[5.3279644144,43.5565471991],[5.3032658632,43.5572281682]]]]}},{"type":"Feature","properties":{"NOM":"KD44A3","NUMPOINTS":124.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3041984364,43.5751906213],[5.3051315987,43.5931533176],[5.329845732,43.59247192],[5.3289047762,43.574509438],[5.3041984364,43.5751906213]]]]}},{"type":"Feature","properties":{"NOM":"KD44A4","NUMPOINTS":186.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3051315987,43.5931533176],[5.3060654108,43.611116243],[5.3307873185,43.6104346283],[5.329845732,43.59247192],[5.3051315987,43.5931533176]]]]}},{"type":"Feature","properties":{"NOM":"KD44A5","NUMPOINTS":301.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3060654108,43.611116243],[5.306999848,43.6290794001],[5.3317295243,43.628397565],[5.3307873185,43.6104346283],[5.3060654108,43.611116243]]]]}},{"type":"Feature","properties":{"NOM":"KD44A6","NUMPOINTS":146.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.306999848,43.6290794001],[5.3079348735,43.647042795],[5.3326723232,43.6463607394],[5.3317295243,43.628397565],[5.306999848,43.6290794001]]]]}},{"type":"Feature","properties":{"NOM":"KD44A7","NUMPOINTS":171.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3079348735,43.647042795],[5.3088704879,43.665006426],[5.3336157158,43.6643241498],[5.3326723232,43.6463607394],[5.3079348735,43.647042795]]]]}},{"type":"Feature","properties":{"NOM":"KD44A8","NUMPOINTS":258.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3088704879,43.665006426],[5.3098066916,43.6829702913],[5.3345597026,43.6822877945],[5.3336157158,43.6643241498],[5.3088704879,43.665006426]]]]}},{"type":"Feature","properties":{"NOM":"KD44A9","NUMPOINTS":123.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3098066916,43.6829702913],[5.3107434896,43.7009343866],[5.3355042852,43.700251671],[5.3345597026,43.6822877945],[5.3098066916,43.6829702913]]]]}},{"type":"Feature","properties":{"NOM":"KD46A0","NUMPOINTS":97.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3107434896,43.7009343866],[5.3116809584,43.7188986617],[5.3364495273,43.7182157226],[5.3355042852,43.700251671],[5.3107434896,43.7009343866]]]]}},{"type":"Feature","properties":{"NOM":"KD46A1","NUMPOINTS":162.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3116809584,43.7188986617],[5.3126190167,43.7368631661],[5.3373953638,43.7361800033],[5.3364495273,43.7182157226],[5.3116809584,43.7188986617]]]]}},{"type":"Feature","properties":{"NOM":"KD46A2","NUMPOINTS":163.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3126190167,43.7368631661],[5.3135576652,43.7548278979],[5.3383417954,43.7541445114],[5.3373953638,43.7361800033],[5.3126190167,43.7368631661]]]]}},{"type":"Feature","properties":{"NOM":"KD40B2","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3092808073,43.197355903],[5.3102095561,43.2153128873],[5.3347610778,43.2146305373],[5.333824718,43.1966737766],[5.3092808073,43.197355903]]]]}},{"type":"Feature","properties":{"NOM":"KD40B3","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3102095561,43.2153128873],[5.3111388913,43.2332701507],[5.3356980255,43.2325875783],[5.3347610778,43.2146305373],[5.3102095561,43.2153128873]]]]}},{"type":"Feature","properties":{"NOM":"KD40B6","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3129992941,43.2691854984],[5.3139303627,43.2871435793],[5.338512363,43.2864603391],[5.3375736676,43.2685024809],[5.3129992941,43.2691854984]]]]}},{"type":"Feature","properties":{"NOM":"KD40B7","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3139303627,43.2871435793],[5.31486198,43.3051019467],[5.3394516189,43.3044184806],[5.338512363,43.2864603391],[5.3139303627,43.2871435793]]]]}},{"type":"Feature","properties":{"NOM":"KD40B9","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3157941008,43.323060625],[5.3167268025,43.3410195688],[5.3413317443,43.3403356508],[5.3403913888,43.322376933],[5.3157941008,43.323060625]]]]}},{"type":"Feature","properties":{"NOM":"KD42B0","NUMPOINTS":126.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3167268025,43.3410195688],[5.3176600857,43.3589787767],[5.3422726861,43.3582946326],[5.3413317443,43.3403356508],[5.3167268025,43.3410195688]]]]}},{"type":"Feature","properties":{"NOM":"KD42B1","NUMPOINTS":259.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3176600857,43.3589787767],[5.3185939508,43.3769382468],[5.3432142145,43.3762538765],[5.3422726861,43.3582946326],[5.3176600857,43.3589787767]]]]}},{"type":"Feature","properties":{"NOM":"KD42B2","NUMPOINTS":335.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3185939508,43.3769382468],[5.3195283985,43.3948979776],[5.3441563303,43.394213381],[5.3432142145,43.3762538765],[5.3185939508,43.3769382468]]]]}},{"type":"Feature","properties":{"NOM":"KD42B3","NUMPOINTS":316.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3195283985,43.3948979776],[5.3204633558,43.4128579955],[5.3450990342,43.4121731697],[5.3441563303,43.394213381],[5.3195283985,43.3948979776]]]]}},{"type":"Feature","properties":{"NOM":"KD42B4","NUMPOINTS":161.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3204633558,43.4128579955],[5.3213988743,43.4308182818],[5.3460423333,43.4301332274],[5.3450990342,43.4121731697],[5.3204633558,43.4128579955]]]]}},{"type":"Feature","properties":{"NOM":"KD42B5","NUMPOINTS":133.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3213988743,43.4308182818],[5.3223349847,43.4487788235],[5.3469862292,43.4480935406],[5.3460423333,43.4301332274],[5.3213988743,43.4308182818]]]]}},{"type":"Feature","properties":{"NOM":"KD42B6","NUMPOINTS":263.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3223349847,43.4487788235],[5.3232716876,43.4667396191],[5.3479307225,43.4660541075],[5.3469862292,43.4480935406],[5.3223349847,43.4487788235]]]]}},{"type":"Feature","properties":{"NOM":"KD42B7","NUMPOINTS":119.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3232716876,43.4667396191],[5.3242089836,43.4847006668],[5.3488758138,43.4840149264],[5.3479307225,43.4660541075],[5.3232716876,43.4667396191]]]]}},{"type":"Feature","properties":{"NOM":"KD42B8","NUMPOINTS":86.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3242089836,43.4847006668],[5.325146888,43.5026619578],[5.3498215111,43.5019759919],[5.3488758138,43.4840149264],[5.3242089836,43.4847006668]]]]}},{"type":"Feature","properties":{"NOM":"KD42B9","NUMPOINTS":201.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.325146888,43.5026619578],[5.3260854709,43.5206234573],[5.3507678673,43.5199372755],[5.3498215111,43.5019759919],[5.325146888,43.5026619578]]]]}},{"type":"Feature","properties":{"NOM":"KD44B0","NUMPOINTS":149.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3260854709,43.5206234573],[5.3270246462,43.538585205],[5.3517148208,43.5378988072],[5.3507678673,43.5199372755],[5.3260854709,43.5206234573]]]]}},{"type":"Feature","properties":{"NOM":"KD44B1","NUMPOINTS":241.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3270246462,43.538585205],[5.3279644144,43.5565471991],[5.3526623722,43.5558605853],[5.3517148208,43.5378988072],[5.3270246462,43.538585205]]]]}},{"type":"Feature","properties":{"NOM":"KD44B2","NUMPOINTS":377.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3279644144,43.5565471991],[5.3289047762,43.574509438],[5.3536105219,43.5738226081],[5.3526623722,43.5558605853],[5.3279644144,43.5565471991]]]]}},{"type":"Feature","properties":{"NOM":"KD44B3","NUMPOINTS":294.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3289047762,43.574509438],[5.329845732,43.59247192],[5.3545592706,43.591784874],[5.3536105219,43.5738226081],[5.3289047762,43.574509438]]]]}},{"type":"Feature","properties":{"NOM":"KD44B4","NUMPOINTS":112.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.329845732,43.59247192],[5.3307873185,43.6104346283],[5.3555086337,43.6097473638],[5.3545592706,43.591784874],[5.329845732,43.59247192]]]]}},{"type":"Feature","properties":{"NOM":"KD44B5","NUMPOINTS":187.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3307873185,43.6104346283],[5.3317295243,43.628397565],[5.3564586074,43.6277100783],[5.3555086337,43.6097473638],[5.3307873185,43.6104346283]]]]}},{"type":"Feature","properties":{"NOM":"KD44B6","NUMPOINTS":115.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3317295243,43.628397565],[5.3326723232,43.6463607394],[5.3574091791,43.6456730303],[5.3564586074,43.6277100783],[5.3317295243,43.628397565]]]]}},{"type":"Feature","properties":{"NOM":"KD44B7","NUMPOINTS":313.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3326723232,43.6463607394],[5.3336157158,43.6643241498],[5.3583603494,43.6636362183],[5.3574091791,43.6456730303],[5.3326723232,43.6463607394]]]]}},{"type":"Feature","properties":{"NOM":"KD44B8","NUMPOINTS":208.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3336157158,43.6643241498],[5.3345597026,43.6822877945],[5.3593121189,43.6815996405],[5.3583603494,43.6636362183],[5.3336157158,43.6643241498]]]]}},{"type":"Feature","properties":{"NOM":"KD44B9","NUMPOINTS":192.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3345597026,43.6822877945],[5.3355042852,43.700251671],[5.360264488,43.6995632952],[5.3593121189,43.6815996405],[5.3345597026,43.6822877945]]]]}},{"type":"Feature","properties":{"NOM":"KD46B0","NUMPOINTS":106.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3355042852,43.700251671],[5.3364495273,43.7182157226],[5.3612175017,43.7175271228],[5.360264488,43.6995632952],[5.3355042852,43.700251671]]]]}},{"type":"Feature","properties":{"NOM":"KD46B1","NUMPOINTS":159.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3364495273,43.7182157226],[5.3373953638,43.7361800033],[5.3621711158,43.7354911781],[5.3612175017,43.7175271228],[5.3364495273,43.7182157226]]]]}},{"type":"Feature","properties":{"NOM":"KD40C2","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.333824718,43.1966737766],[5.3347610778,43.2146305373],[5.359312018,43.2139425786],[5.3583680455,43.1959860434],[5.333824718,43.1966737766]]]]}},{"type":"Feature","properties":{"NOM":"KD40C3","NUMPOINTS":22.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3347610778,43.2146305373],[5.3356980255,43.2325875783],[5.3602565778,43.2318993953],[5.359312018,43.2139425786],[5.3347610778,43.2146305373]]]]}},{"type":"Feature","properties":{"NOM":"KD40C4","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3356980255,43.2325875783],[5.3366355553,43.2505448934],[5.3612017243,43.2498564861],[5.3602565778,43.2318993953],[5.3356980255,43.2325875783]]]]}},{"type":"Feature","properties":{"NOM":"KD40C6","NUMPOINTS":83.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3375736676,43.2685024809],[5.338512363,43.2864603391],[5.3630937796,43.2857714829],[5.362147458,43.2678138491],[5.3375736676,43.2685024809]]]]}},{"type":"Feature","properties":{"NOM":"KD40C7","NUMPOINTS":49.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.338512363,43.2864603391],[5.3394516189,43.3044184806],[5.3640406727,43.303729397],[5.3630937796,43.2857714829],[5.338512363,43.2864603391]]]]}},{"type":"Feature","properties":{"NOM":"KD40C8","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3394516189,43.3044184806],[5.3403913888,43.322376933],[5.3649880911,43.3216876215],[5.3640406727,43.303729397],[5.3394516189,43.3044184806]]]]}},{"type":"Feature","properties":{"NOM":"KD40C9","NUMPOINTS":105.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3403913888,43.322376933],[5.3413317443,43.3403356508],[5.3659360999,43.3396461116],[5.3649880911,43.3216876215],[5.3403913888,43.322376933]]]]}},{"type":"Feature","properties":{"NOM":"KD42C0","NUMPOINTS":326.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3413317443,43.3403356508],[5.3422726861,43.3582946326],[5.3668846996,43.3576048654],[5.3659360999,43.3396461116],[5.3413317443,43.3403356508]]]]}},{"type":"Feature","properties":{"NOM":"KD42C1","NUMPOINTS":395.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3422726861,43.3582946326],[5.3432142145,43.3762538765],[5.3678338909,43.3755638813],[5.3668846996,43.3576048654],[5.3422726861,43.3582946326]]]]}},{"type":"Feature","properties":{"NOM":"KD42C2","NUMPOINTS":521.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3432142145,43.3762538765],[5.3441563303,43.394213381],[5.3687836742,43.3935231577],[5.3678338909,43.3755638813],[5.3432142145,43.3762538765]]]]}},{"type":"Feature","properties":{"NOM":"KD42C3","NUMPOINTS":359.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3441563303,43.394213381],[5.3450990342,43.4121731697],[5.3697341162,43.4114827154],[5.3687836742,43.3935231577],[5.3441563303,43.394213381]]]]}},{"type":"Feature","properties":{"NOM":"KD42C4","NUMPOINTS":219.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3450990342,43.4121731697],[5.3460423333,43.4301332274],[5.3706851953,43.4294425428],[5.3697341162,43.4114827154],[5.3450990342,43.4121731697]]]]}},{"type":"Feature","properties":{"NOM":"KD42C5","NUMPOINTS":193.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3460423333,43.4301332274],[5.3469862292,43.4480935406],[5.3716368762,43.4474026254],[5.3706851953,43.4294425428],[5.3460423333,43.4301332274]]]]}},{"type":"Feature","properties":{"NOM":"KD42C6","NUMPOINTS":276.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3469862292,43.4480935406],[5.3479307225,43.4660541075],[5.3725891593,43.4653629617],[5.3716368762,43.4474026254],[5.3469862292,43.4480935406]]]]}},{"type":"Feature","properties":{"NOM":"KD42C7","NUMPOINTS":258.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3479307225,43.4660541075],[5.3488758138,43.4840149264],[5.3735420453,43.48332355],[5.3725891593,43.4653629617],[5.3479307225,43.4660541075]]]]}},{"type":"Feature","properties":{"NOM":"KD42C8","NUMPOINTS":341.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3488758138,43.4840149264],[5.3498215111,43.5019759919],[5.3744955375,43.501284387],[5.3735420453,43.48332355],[5.3488758138,43.4840149264]]]]}},{"type":"Feature","properties":{"NOM":"KD42C9","NUMPOINTS":274.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3498215111,43.5019759919],[5.3507678673,43.5199372755],[5.3754496664,43.519245453],[5.3744955375,43.501284387],[5.3498215111,43.5019759919]]]]}},{"type":"Feature","properties":{"NOM":"KD44C0","NUMPOINTS":218.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3507678673,43.5199372755],[5.3517148208,43.5378988072],[5.3764043976,43.5372067669],[5.3754496664,43.519245453],[5.3507678673,43.5199372755]]]]}},{"type":"Feature","properties":{"NOM":"KD44C1","NUMPOINTS":287.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3517148208,43.5378988072],[5.3526623722,43.5558605853],[5.3773597314,43.5551683272],[5.3764043976,43.5372067669],[5.3517148208,43.5378988072]]]]}},{"type":"Feature","properties":{"NOM":"KD44C2","NUMPOINTS":482.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3526623722,43.5558605853],[5.3536105219,43.5738226081],[5.3783156686,43.573130132],[5.3773597314,43.5551683272],[5.3526623722,43.5558605853]]]]}},{"type":"Feature","properties":{"NOM":"KD44C3","NUMPOINTS":400.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3536105219,43.5738226081],[5.3545592706,43.591784874],[5.3792722096,43.5910921799],[5.3783156686,43.573130132],[5.3536105219,43.5738226081]]]]}},{"type":"Feature","properties":{"NOM":"KD44C4","NUMPOINTS":195.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3545592706,43.591784874],[5.3555086337,43.6097473638],[5.3802293514,43.6090544499],[5.3792722096,43.5910921799],[5.3545592706,43.591784874]]]]}},{"type":"Feature","properties":{"NOM":"KD44C5","NUMPOINTS":97.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3555086337,43.6097473638],[5.3564586074,43.6277100783],[5.3811870925,43.6270169402],[5.3802293514,43.6090544499],[5.3555086337,43.6097473638]]]]}},{"type":"Feature","properties":{"NOM":"KD44C6","NUMPOINTS":131.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3564586074,43.6277100783],[5.3574091791,43.6456730303],[5.3821454365,43.644979668],[5.3811870925,43.6270169402],[5.3564586074,43.6277100783]]]]}},{"type":"Feature","properties":{"NOM":"KD44C7","NUMPOINTS":221.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3574091791,43.6456730303],[5.3583603494,43.6636362183],[5.383104384,43.6629426317],[5.3821454365,43.644979668],[5.3574091791,43.6456730303]]]]}},{"type":"Feature","properties":{"NOM":"KD44C8","NUMPOINTS":79.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3583603494,43.6636362183],[5.3593121189,43.6815996405],[5.3840639354,43.6809058295],[5.383104384,43.6629426317],[5.3583603494,43.6636362183]]]]}},{"type":"Feature","properties":{"NOM":"KD44C9","NUMPOINTS":50.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3593121189,43.6815996405],[5.360264488,43.6995632952],[5.3850240915,43.6988692598],[5.3840639354,43.6809058295],[5.3593121189,43.6815996405]]]]}},{"type":"Feature","properties":{"NOM":"KD46C0","NUMPOINTS":149.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.360264488,43.6995632952],[5.3612175017,43.7175271228],[5.3859848768,43.7168328627],[5.3850240915,43.6988692598],[5.360264488,43.6995632952]]]]}},{"type":"Feature","properties":{"NOM":"KD40D0","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.35648187,43.1600738472],[5.3574246641,43.1780298059],[5.3819597713,43.1773366942],[5.3810093497,43.1593809634],[5.35648187,43.1600738472]]]]}},{"type":"Feature","properties":{"NOM":"KD40D1","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3574246641,43.1780298059],[5.3583680455,43.1959860434],[5.382910785,43.1952927037],[5.3819597713,43.1773366942],[5.3574246641,43.1780298059]]]]}},{"type":"Feature","properties":{"NOM":"KD40D2","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3583680455,43.1959860434],[5.359312018,43.2139425786],[5.383862372,43.2132490114],[5.382910785,43.1952927037],[5.3583680455,43.1959860434]]]]}},{"type":"Feature","properties":{"NOM":"KD40D3","NUMPOINTS":44.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.359312018,43.2139425786],[5.3602565778,43.2318993953],[5.3848145433,43.231205602],[5.383862372,43.2132490114],[5.359312018,43.2139425786]]]]}},{"type":"Feature","properties":{"NOM":"KD40D4","NUMPOINTS":384.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3602565778,43.2318993953],[5.3612017243,43.2498564861],[5.3857673059,43.2491624666],[5.3848145433,43.231205602],[5.3602565778,43.2318993953]]]]}},{"type":"Feature","properties":{"NOM":"KD40D5","NUMPOINTS":244.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3612017243,43.2498564861],[5.362147458,43.2678138491],[5.3867206606,43.2671196034],[5.3857673059,43.2491624666],[5.3612017243,43.2498564861]]]]}},{"type":"Feature","properties":{"NOM":"KD40D6","NUMPOINTS":378.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.362147458,43.2678138491],[5.3630937796,43.2857714829],[5.3876746078,43.2850770109],[5.3867206606,43.2671196034],[5.362147458,43.2678138491]]]]}},{"type":"Feature","properties":{"NOM":"KD40D7","NUMPOINTS":240.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3630937796,43.2857714829],[5.3640406727,43.303729397],[5.3886291365,43.3030346959],[5.3876746078,43.2850770109],[5.3630937796,43.2857714829]]]]}},{"type":"Feature","properties":{"NOM":"KD40D8","NUMPOINTS":228.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3640406727,43.303729397],[5.3649880911,43.3216876215],[5.3895842029,43.3209926909],[5.3886291365,43.3030346959],[5.3640406727,43.303729397]]]]}},{"type":"Feature","properties":{"NOM":"KD40D9","NUMPOINTS":288.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3649880911,43.3216876215],[5.3659360999,43.3396461116],[5.3905398644,43.3389509512],[5.3895842029,43.3209926909],[5.3649880911,43.3216876215]]]]}},{"type":"Feature","properties":{"NOM":"KD42D0","NUMPOINTS":297.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3659360999,43.3396461116],[5.3668846996,43.3576048654],[5.3914961216,43.3569094753],[5.3905398644,43.3389509512],[5.3659360999,43.3396461116]]]]}},{"type":"Feature","properties":{"NOM":"KD42D1","NUMPOINTS":144.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3668846996,43.3576048654],[5.3678338909,43.3755638813],[5.3924529751,43.3748682614],[5.3914961216,43.3569094753],[5.3668846996,43.3576048654]]]]}},{"type":"Feature","properties":{"NOM":"KD42D2","NUMPOINTS":144.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3678338909,43.3755638813],[5.3687836742,43.3935231577],[5.3934104254,43.3928273079],[5.3924529751,43.3748682614],[5.3678338909,43.3755638813]]]]}},{"type":"Feature","properties":{"NOM":"KD42D3","NUMPOINTS":103.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3687836742,43.3935231577],[5.3697341162,43.4114827154],[5.3943685971,43.4107866329],[5.3934104254,43.3928273079],[5.3687836742,43.3935231577]]]]}},{"type":"Feature","properties":{"NOM":"KD42D4","NUMPOINTS":292.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3697341162,43.4114827154],[5.3706851953,43.4294425428],[5.3953274556,43.428746228],[5.3943685971,43.4107866329],[5.3697341162,43.4114827154]]]]}},{"type":"Feature","properties":{"NOM":"KD42D5","NUMPOINTS":295.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3706851953,43.4294425428],[5.3716368762,43.4474026254],[5.3962869208,43.4467060783],[5.3953274556,43.428746228],[5.3706851953,43.4294425428]]]]}},{"type":"Feature","properties":{"NOM":"KD42D6","NUMPOINTS":301.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3716368762,43.4474026254],[5.3725891593,43.4653629617],[5.3972469932,43.4646661822],[5.3962869208,43.4467060783],[5.3716368762,43.4474026254]]]]}},{"type":"Feature","properties":{"NOM":"KD42D7","NUMPOINTS":275.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3725891593,43.4653629617],[5.3735420453,43.48332355],[5.3982076734,43.4826265379],[5.3972469932,43.4646661822],[5.3725891593,43.4653629617]]]]}},{"type":"Feature","properties":{"NOM":"KD42D8","NUMPOINTS":406.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3735420453,43.48332355],[5.3744955375,43.501284387],[5.3991689622,43.5005871436],[5.3982076734,43.4826265379],[5.3735420453,43.48332355]]]]}},{"type":"Feature","properties":{"NOM":"KD42D9","NUMPOINTS":386.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3744955375,43.501284387],[5.3754496664,43.519245453],[5.4001308636,43.5185479901],[5.3991689622,43.5005871436],[5.3744955375,43.501284387]]]]}},{"type":"Feature","properties":{"NOM":"KD44D0","NUMPOINTS":370.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3754496664,43.519245453],[5.3764043976,43.5372067669],[5.4010933733,43.536509085],[5.4001308636,43.5185479901],[5.3754496664,43.519245453]]]]}},{"type":"Feature","properties":{"NOM":"KD44D1","NUMPOINTS":424.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3764043976,43.5372067669],[5.3773597314,43.5551683272],[5.4020564898,43.5544704254],[5.4010933733,43.536509085],[5.3764043976,43.5372067669]]]]}},{"type":"Feature","properties":{"NOM":"KD44D2","NUMPOINTS":363.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3773597314,43.5551683272],[5.3783156686,43.573130132],[5.4030202136,43.5724320097],[5.4020564898,43.5544704254],[5.3773597314,43.5551683272]]]]}},{"type":"Feature","properties":{"NOM":"KD44D3","NUMPOINTS":380.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3783156686,43.573130132],[5.3792722096,43.5910921799],[5.4039845454,43.5903938361],[5.4030202136,43.5724320097],[5.3783156686,43.573130132]]]]}},{"type":"Feature","properties":{"NOM":"KD44D4","NUMPOINTS":180.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3792722096,43.5910921799],[5.3802293514,43.6090544499],[5.4049494659,43.6083558837],[5.4039845454,43.5903938361],[5.3792722096,43.5910921799]]]]}},{"type":"Feature","properties":{"NOM":"KD44D5","NUMPOINTS":77.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3802293514,43.6090544499],[5.3811870925,43.6270169402],[5.4059149704,43.6263181482],[5.4049494659,43.6083558837],[5.3802293514,43.6090544499]]]]}},{"type":"Feature","properties":{"NOM":"KD44D6","NUMPOINTS":180.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3811870925,43.6270169402],[5.3821454365,43.644979668],[5.4068810816,43.6442806503],[5.4059149704,43.6263181482],[5.3811870925,43.6270169402]]]]}},{"type":"Feature","properties":{"NOM":"KD44D7","NUMPOINTS":146.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3821454365,43.644979668],[5.383104384,43.6629426317],[5.4078478001,43.6622433884],[5.4068810816,43.6442806503],[5.3821454365,43.644979668]]]]}},{"type":"Feature","properties":{"NOM":"KD44D8","NUMPOINTS":57.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.383104384,43.6629426317],[5.3840639354,43.6809058295],[5.4088151264,43.6802063608],[5.4078478001,43.6622433884],[5.383104384,43.6629426317]]]]}},{"type":"Feature","properties":{"NOM":"KD44D9","NUMPOINTS":126.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3840639354,43.6809058295],[5.3850240915,43.6988692598],[5.4097830612,43.6981695659],[5.4088151264,43.6802063608],[5.3840639354,43.6809058295]]]]}},{"type":"Feature","properties":{"NOM":"KD46D0","NUMPOINTS":76.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3850240915,43.6988692598],[5.3859848768,43.7168328627],[5.4107516089,43.7161329473],[5.4097830612,43.6981695659],[5.3850240915,43.6988692598]]]]}},{"type":"Feature","properties":{"NOM":"KD40E0","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3810093497,43.1593809634],[5.3819597713,43.1773366942],[5.4064942755,43.1766379897],[5.4055362285,43.1586824863],[5.3810093497,43.1593809634]]]]}},{"type":"Feature","properties":{"NOM":"KD40E1","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3819597713,43.1773366942],[5.382910785,43.1952927037],[5.4074529193,43.1945937719],[5.4064942755,43.1766379897],[5.3819597713,43.1773366942]]]]}},{"type":"Feature","properties":{"NOM":"KD40E2","NUMPOINTS":3.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.382910785,43.1952927037],[5.383862372,43.2132490114],[5.4084121269,43.2125498521],[5.4074529193,43.1945937719],[5.382910785,43.1952927037]]]]}},{"type":"Feature","properties":{"NOM":"KD40E3","NUMPOINTS":60.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.383862372,43.2132490114],[5.3848145433,43.231205602],[5.4093719177,43.2305062168],[5.4084121269,43.2125498521],[5.383862372,43.2132490114]]]]}},{"type":"Feature","properties":{"NOM":"KD40E4","NUMPOINTS":482.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3848145433,43.231205602],[5.3857673059,43.2491624666],[5.4103323067,43.2484628554],[5.4093719177,43.2305062168],[5.3848145433,43.231205602]]]]}},{"type":"Feature","properties":{"NOM":"KD40E5","NUMPOINTS":508.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3857673059,43.2491624666],[5.3867206606,43.2671196034],[5.4112932943,43.2664197661],[5.4103323067,43.2484628554],[5.3857673059,43.2491624666]]]]}},{"type":"Feature","properties":{"NOM":"KD40E6","NUMPOINTS":279.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3867206606,43.2671196034],[5.3876746078,43.2850770109],[5.4122548811,43.2843769474],[5.4112932943,43.2664197661],[5.3867206606,43.2671196034]]]]}},{"type":"Feature","properties":{"NOM":"KD40E7","NUMPOINTS":334.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3876746078,43.2850770109],[5.3886291365,43.3030346959],[5.4132170614,43.3023344037],[5.4122548811,43.2843769474],[5.3876746078,43.2850770109]]]]}},{"type":"Feature","properties":{"NOM":"KD40E8","NUMPOINTS":375.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3886291365,43.3030346959],[5.3895842029,43.3209926909],[5.4141798012,43.3202921682],[5.4132170614,43.3023344037],[5.3886291365,43.3030346959]]]]}},{"type":"Feature","properties":{"NOM":"KD40E9","NUMPOINTS":394.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3895842029,43.3209926909],[5.3905398644,43.3389509512],[5.415143144,43.3382501979],[5.4141798012,43.3202921682],[5.3895842029,43.3209926909]]]]}},{"type":"Feature","properties":{"NOM":"KD42E0","NUMPOINTS":304.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3905398644,43.3389509512],[5.3914961216,43.3569094753],[5.4161070902,43.3562084911],[5.415143144,43.3382501979],[5.3905398644,43.3389509512]]]]}},{"type":"Feature","properties":{"NOM":"KD42E1","NUMPOINTS":51.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3914961216,43.3569094753],[5.3924529751,43.3748682614],[5.4170716404,43.3741670462],[5.4161070902,43.3562084911],[5.3914961216,43.3569094753]]]]}},{"type":"Feature","properties":{"NOM":"KD42E2","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3924529751,43.3748682614],[5.3934104254,43.3928273079],[5.4180367953,43.3921258615],[5.4170716404,43.3741670462],[5.3924529751,43.3748682614]]]]}},{"type":"Feature","properties":{"NOM":"KD42E3","NUMPOINTS":20.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3934104254,43.3928273079],[5.3943685971,43.4107866329],[5.419002693,43.4100849529],[5.4180367953,43.3921258615],[5.3934104254,43.3928273079]]]]}},{"type":"Feature","properties":{"NOM":"KD42E4","NUMPOINTS":88.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3943685971,43.4107866329],[5.3953274556,43.428746228],[5.4199693052,43.4280443148],[5.419002693,43.4100849529],[5.3943685971,43.4107866329]]]]}},{"type":"Feature","properties":{"NOM":"KD42E5","NUMPOINTS":485.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3953274556,43.428746228],[5.3962869208,43.4467060783],[5.4209365254,43.4460039319],[5.4199693052,43.4280443148],[5.3953274556,43.428746228]]]]}},{"type":"Feature","properties":{"NOM":"KD42E6","NUMPOINTS":386.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3962869208,43.4467060783],[5.3972469932,43.4646661822],[5.4219043542,43.4639638024],[5.4209365254,43.4460039319],[5.3962869208,43.4467060783]]]]}},{"type":"Feature","properties":{"NOM":"KD42E7","NUMPOINTS":263.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3972469932,43.4646661822],[5.3982076734,43.4826265379],[5.4228727921,43.4819239246],[5.4219043542,43.4639638024],[5.3972469932,43.4646661822]]]]}},{"type":"Feature","properties":{"NOM":"KD42E8","NUMPOINTS":391.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3982076734,43.4826265379],[5.3991689622,43.5005871436],[5.4238418398,43.499884297],[5.4228727921,43.4819239246],[5.3982076734,43.4826265379]]]]}},{"type":"Feature","properties":{"NOM":"KD42E9","NUMPOINTS":352.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.3991689622,43.5005871436],[5.4001308636,43.5185479901],[5.4248115042,43.5178449139],[5.4238418398,43.499884297],[5.3991689622,43.5005871436]]]]}},{"type":"Feature","properties":{"NOM":"KD44E0","NUMPOINTS":350.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4001308636,43.5185479901],[5.4010933733,43.536509085],[5.4257817797,43.535805778],[5.4248115042,43.5178449139],[5.4001308636,43.5185479901]]]]}},{"type":"Feature","properties":{"NOM":"KD44E1","NUMPOINTS":346.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4010933733,43.536509085],[5.4020564898,43.5544704254],[5.4267526669,43.5537668874],[5.4257817797,43.535805778],[5.4010933733,43.536509085]]]]}},{"type":"Feature","properties":{"NOM":"KD44E2","NUMPOINTS":467.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4020564898,43.5544704254],[5.4030202136,43.5724320097],[5.4277241663,43.5717282406],[5.4267526669,43.5537668874],[5.4020564898,43.5544704254]]]]}},{"type":"Feature","properties":{"NOM":"KD44E3","NUMPOINTS":379.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4030202136,43.5724320097],[5.4039845454,43.5903938361],[5.4286962785,43.589689836],[5.4277241663,43.5717282406],[5.4030202136,43.5724320097]]]]}},{"type":"Feature","properties":{"NOM":"KD44E4","NUMPOINTS":244.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4039845454,43.5903938361],[5.4049494659,43.6083558837],[5.42966897,43.6076516567],[5.4286962785,43.589689836],[5.4039845454,43.5903938361]]]]}},{"type":"Feature","properties":{"NOM":"KD44E5","NUMPOINTS":81.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4049494659,43.6083558837],[5.4059149704,43.6263181482],[5.4306422273,43.6256136962],[5.42966897,43.6076516567],[5.4049494659,43.6083558837]]]]}},{"type":"Feature","properties":{"NOM":"KD44E6","NUMPOINTS":127.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4059149704,43.6263181482],[5.4068810816,43.6442806503],[5.4316160961,43.6435759734],[5.4306422273,43.6256136962],[5.4059149704,43.6263181482]]]]}},{"type":"Feature","properties":{"NOM":"KD44E7","NUMPOINTS":234.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4068810816,43.6442806503],[5.4078478001,43.6622433884],[5.432590577,43.6615384864],[5.4316160961,43.6435759734],[5.4068810816,43.6442806503]]]]}},{"type":"Feature","properties":{"NOM":"KD44E8","NUMPOINTS":191.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4078478001,43.6622433884],[5.4088151264,43.6802063608],[5.4335656707,43.6795012337],[5.432590577,43.6615384864],[5.4078478001,43.6622433884]]]]}},{"type":"Feature","properties":{"NOM":"KD44E9","NUMPOINTS":77.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4088151264,43.6802063608],[5.4097830612,43.6981695659],[5.4345413776,43.6974642136],[5.4335656707,43.6795012337],[5.4088151264,43.6802063608]]]]}},{"type":"Feature","properties":{"NOM":"KD40F2","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4074529193,43.1945937719],[5.4084121269,43.2125498521],[5.4329612692,43.2118451161],[5.4319944273,43.1938892664],[5.4074529193,43.1945937719]]]]}},{"type":"Feature","properties":{"NOM":"KD40F3","NUMPOINTS":45.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4084121269,43.2125498521],[5.4093719177,43.2305062168],[5.4339286954,43.2298012513],[5.4329612692,43.2118451161],[5.4084121269,43.2125498521]]]]}},{"type":"Feature","properties":{"NOM":"KD40F4","NUMPOINTS":181.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4093719177,43.2305062168],[5.4103323067,43.2484628554],[5.4348967245,43.2477576602],[5.4339286954,43.2298012513],[5.4093719177,43.2305062168]]]]}},{"type":"Feature","properties":{"NOM":"KD40F5","NUMPOINTS":328.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4103323067,43.2484628554],[5.4112932943,43.2664197661],[5.435865357,43.2657143413],[5.4348967245,43.2477576602],[5.4103323067,43.2484628554]]]]}},{"type":"Feature","properties":{"NOM":"KD40F6","NUMPOINTS":395.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4112932943,43.2664197661],[5.4122548811,43.2843769474],[5.4368345935,43.2836712928],[5.435865357,43.2657143413],[5.4112932943,43.2664197661]]]]}},{"type":"Feature","properties":{"NOM":"KD40F7","NUMPOINTS":347.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4122548811,43.2843769474],[5.4132170614,43.3023344037],[5.4378044326,43.301628517],[5.4368345935,43.2836712928],[5.4122548811,43.2843769474]]]]}},{"type":"Feature","properties":{"NOM":"KD40F8","NUMPOINTS":382.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4132170614,43.3023344037],[5.4141798012,43.3202921682],[5.4387748574,43.3195860467],[5.4378044326,43.301628517],[5.4132170614,43.3023344037]]]]}},{"type":"Feature","properties":{"NOM":"KD40F9","NUMPOINTS":398.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4141798012,43.3202921682],[5.415143144,43.3382501979],[5.4397458899,43.3375438414],[5.4387748574,43.3195860467],[5.4141798012,43.3202921682]]]]}},{"type":"Feature","properties":{"NOM":"KD42F0","NUMPOINTS":323.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.415143144,43.3382501979],[5.4161070902,43.3562084911],[5.4407175307,43.3555018997],[5.4397458899,43.3375438414],[5.415143144,43.3382501979]]]]}},{"type":"Feature","properties":{"NOM":"KD42F1","NUMPOINTS":113.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4161070902,43.3562084911],[5.4170716404,43.3741670462],[5.4416897803,43.3734602197],[5.4407175307,43.3555018997],[5.4161070902,43.3562084911]]]]}},{"type":"Feature","properties":{"NOM":"KD42F2","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4170716404,43.3741670462],[5.4180367953,43.3921258615],[5.4426626394,43.3914187998],[5.4416897803,43.3734602197],[5.4170716404,43.3741670462]]]]}},{"type":"Feature","properties":{"NOM":"KD42F3","NUMPOINTS":19.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4180367953,43.3921258615],[5.419002693,43.4100849529],[5.4436362467,43.409377654],[5.4426626394,43.3914187998],[5.4180367953,43.3921258615]]]]}},{"type":"Feature","properties":{"NOM":"KD42F4","NUMPOINTS":69.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.419002693,43.4100849529],[5.4199693052,43.4280443148],[5.4446105924,43.4273367794],[5.4436362467,43.409377654],[5.419002693,43.4100849529]]]]}},{"type":"Feature","properties":{"NOM":"KD42F5","NUMPOINTS":495.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4199693052,43.4280443148],[5.4209365254,43.4460039319],[5.4455855509,43.4452961597],[5.4446105924,43.4273367794],[5.4199693052,43.4280443148]]]]}},{"type":"Feature","properties":{"NOM":"KD42F6","NUMPOINTS":231.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4209365254,43.4460039319],[5.4219043542,43.4639638024],[5.4465611228,43.4632557934],[5.4455855509,43.4452961597],[5.4209365254,43.4460039319]]]]}},{"type":"Feature","properties":{"NOM":"KD42F7","NUMPOINTS":133.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4219043542,43.4639638024],[5.4228727921,43.4819239246],[5.4475373088,43.4812156788],[5.4465611228,43.4632557934],[5.4219043542,43.4639638024]]]]}},{"type":"Feature","properties":{"NOM":"KD42F8","NUMPOINTS":266.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4228727921,43.4819239246],[5.4238418398,43.499884297],[5.4485141094,43.4991758141],[5.4475373088,43.4812156788],[5.4228727921,43.4819239246]]]]}},{"type":"Feature","properties":{"NOM":"KD42F9","NUMPOINTS":384.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4238418398,43.499884297],[5.4248115042,43.5178449139],[5.4494915337,43.5171361984],[5.4485141094,43.4991758141],[5.4238418398,43.499884297]]]]}},{"type":"Feature","properties":{"NOM":"KD44F0","NUMPOINTS":419.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4248115042,43.5178449139],[5.4257817797,43.535805778],[5.4504695745,43.5350968297],[5.4494915337,43.5171361984],[5.4248115042,43.5178449139]]]]}},{"type":"Feature","properties":{"NOM":"KD44F1","NUMPOINTS":370.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4257817797,43.535805778],[5.4267526669,43.5537668874],[5.4514482317,43.5530577063],[5.4504695745,43.5350968297],[5.4257817797,43.535805778]]]]}},{"type":"Feature","properties":{"NOM":"KD44F2","NUMPOINTS":407.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4267526669,43.5537668874],[5.4277241663,43.5717282406],[5.4524275061,43.5710188267],[5.4514482317,43.5530577063],[5.4267526669,43.5537668874]]]]}},{"type":"Feature","properties":{"NOM":"KD44F3","NUMPOINTS":352.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4277241663,43.5717282406],[5.4286962785,43.589689836],[5.4534073982,43.588980189],[5.4524275061,43.5710188267],[5.4277241663,43.5717282406]]]]}},{"type":"Feature","properties":{"NOM":"KD44F4","NUMPOINTS":334.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4286962785,43.589689836],[5.42966897,43.6076516567],[5.4543878631,43.6069417805],[5.4534073982,43.588980189],[5.4286962785,43.589689836]]]]}},{"type":"Feature","properties":{"NOM":"KD44F5","NUMPOINTS":124.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.42966897,43.6076516567],[5.4306422273,43.6256136962],[5.4553688726,43.6249035933],[5.4543878631,43.6069417805],[5.42966897,43.6076516567]]]]}},{"type":"Feature","properties":{"NOM":"KD44F6","NUMPOINTS":183.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4306422273,43.6256136962],[5.4316160961,43.6435759734],[5.4563504984,43.6428656436],[5.4553688726,43.6249035933],[5.4306422273,43.6256136962]]]]}},{"type":"Feature","properties":{"NOM":"KD44F7","NUMPOINTS":157.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4316160961,43.6435759734],[5.432590577,43.6615384864],[5.4573327412,43.6608279298],[5.4563504984,43.6428656436],[5.4316160961,43.6435759734]]]]}},{"type":"Feature","properties":{"NOM":"KD44F8","NUMPOINTS":248.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.432590577,43.6615384864],[5.4335656707,43.6795012337],[5.4583156016,43.6787904501],[5.4573327412,43.6608279298],[5.432590577,43.6615384864]]]]}},{"type":"Feature","properties":{"NOM":"KD44F9","NUMPOINTS":101.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4335656707,43.6795012337],[5.4345413776,43.6974642136],[5.4592990802,43.6967532029],[5.4583156016,43.6787904501],[5.4335656707,43.6795012337]]]]}},{"type":"Feature","properties":{"NOM":"KD40G2","NUMPOINTS":2.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4319944273,43.1938892664],[5.4329612692,43.2118451161],[5.4575098091,43.2111347723],[5.4565353332,43.1931791549],[5.4319944273,43.1938892664]]]]}},{"type":"Feature","properties":{"NOM":"KD40G3","NUMPOINTS":47.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4329612692,43.2118451161],[5.4339286954,43.2298012513],[5.4584848702,43.2290906761],[5.4575098091,43.2111347723],[5.4329612692,43.2118451161]]]]}},{"type":"Feature","properties":{"NOM":"KD40G4","NUMPOINTS":101.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4339286954,43.2298012513],[5.4348967245,43.2477576602],[5.459460539,43.2470468535],[5.4584848702,43.2290906761],[5.4339286954,43.2298012513]]]]}},{"type":"Feature","properties":{"NOM":"KD40G5","NUMPOINTS":61.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4348967245,43.2477576602],[5.435865357,43.2657143413],[5.4604368158,43.2650033031],[5.459460539,43.2470468535],[5.4348967245,43.2477576602]]]]}},{"type":"Feature","properties":{"NOM":"KD40G6","NUMPOINTS":112.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.435865357,43.2657143413],[5.4368345935,43.2836712928],[5.4614137014,43.282960023],[5.4604368158,43.2650033031],[5.435865357,43.2657143413]]]]}},{"type":"Feature","properties":{"NOM":"KD40G7","NUMPOINTS":402.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4368345935,43.2836712928],[5.4378044326,43.301628517],[5.4623911965,43.3009170136],[5.4614137014,43.282960023],[5.4368345935,43.2836712928]]]]}},{"type":"Feature","properties":{"NOM":"KD40G8","NUMPOINTS":413.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4378044326,43.301628517],[5.4387748574,43.3195860467],[5.4633693058,43.3188743066],[5.4623911965,43.3009170136],[5.4378044326,43.301628517]]]]}},{"type":"Feature","properties":{"NOM":"KD40G9","NUMPOINTS":343.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4387748574,43.3195860467],[5.4397458899,43.3375438414],[5.4643480275,43.3368318646],[5.4633693058,43.3188743066],[5.4387748574,43.3195860467]]]]}},{"type":"Feature","properties":{"NOM":"KD42G0","NUMPOINTS":277.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4397458899,43.3375438414],[5.4407175307,43.3555018997],[5.4653273623,43.354789686],[5.4643480275,43.3368318646],[5.4397458899,43.3375438414]]]]}},{"type":"Feature","properties":{"NOM":"KD42G1","NUMPOINTS":155.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4407175307,43.3555018997],[5.4416897803,43.3734602197],[5.4663073108,43.3727477691],[5.4653273623,43.354789686],[5.4407175307,43.3555018997]]]]}},{"type":"Feature","properties":{"NOM":"KD42G2","NUMPOINTS":8.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4416897803,43.3734602197],[5.4426626394,43.3914187998],[5.4672878735,43.3907061122],[5.4663073108,43.3727477691],[5.4416897803,43.3734602197]]]]}},{"type":"Feature","properties":{"NOM":"KD42G3","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4426626394,43.3914187998],[5.4436362467,43.409377654],[5.4682691882,43.4086647275],[5.4672878735,43.3907061122],[5.4426626394,43.3914187998]]]]}},{"type":"Feature","properties":{"NOM":"KD42G4","NUMPOINTS":99.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4436362467,43.409377654],[5.4446105924,43.4273367794],[5.4692512667,43.4266236144],[5.4682691882,43.4086647275],[5.4436362467,43.409377654]]]]}},{"type":"Feature","properties":{"NOM":"KD42G5","NUMPOINTS":377.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4446105924,43.4273367794],[5.4455855509,43.4452961597],[5.470233963,43.4445827562],[5.4692512667,43.4266236144],[5.4446105924,43.4273367794]]]]}},{"type":"Feature","properties":{"NOM":"KD42G6","NUMPOINTS":468.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4455855509,43.4452961597],[5.4465611228,43.4632557934],[5.4712172775,43.4625421512],[5.470233963,43.4445827562],[5.4455855509,43.4452961597]]]]}},{"type":"Feature","properties":{"NOM":"KD42G7","NUMPOINTS":215.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4465611228,43.4632557934],[5.4475373088,43.4812156788],[5.4722012109,43.4805017978],[5.4712172775,43.4625421512],[5.4465611228,43.4632557934]]]]}},{"type":"Feature","properties":{"NOM":"KD42G8","NUMPOINTS":63.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4475373088,43.4812156788],[5.4485141094,43.4991758141],[5.4731857638,43.4984616944],[5.4722012109,43.4805017978],[5.4475373088,43.4812156788]]]]}},{"type":"Feature","properties":{"NOM":"KD42G9","NUMPOINTS":297.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4485141094,43.4991758141],[5.4494915337,43.5171361984],[5.4741709473,43.5164218437],[5.4731857638,43.4984616944],[5.4485141094,43.4991758141]]]]}},{"type":"Feature","properties":{"NOM":"KD44G0","NUMPOINTS":434.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4494915337,43.5171361984],[5.4504695745,43.5350968297],[5.4751567527,43.5343822404],[5.4741709473,43.5164218437],[5.4494915337,43.5171361984]]]]}},{"type":"Feature","properties":{"NOM":"KD44G1","NUMPOINTS":421.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4504695745,43.5350968297],[5.4514482317,43.5530577063],[5.4761431794,43.5523428824],[5.4751567527,43.5343822404],[5.4504695745,43.5350968297]]]]}},{"type":"Feature","properties":{"NOM":"KD44G2","NUMPOINTS":421.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4514482317,43.5530577063],[5.4524275061,43.5710188267],[5.4771302282,43.570303768],[5.4761431794,43.5523428824],[5.4514482317,43.5530577063]]]]}},{"type":"Feature","properties":{"NOM":"KD44G3","NUMPOINTS":350.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4524275061,43.5710188267],[5.4534073982,43.588980189],[5.4781178996,43.5882648955],[5.4771302282,43.570303768],[5.4524275061,43.5710188267]]]]}},{"type":"Feature","properties":{"NOM":"KD44G4","NUMPOINTS":349.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4534073982,43.588980189],[5.4543878631,43.6069417805],[5.4791061404,43.6062262555],[5.4781178996,43.5882648955],[5.4534073982,43.588980189]]]]}},{"type":"Feature","properties":{"NOM":"KD44G5","NUMPOINTS":128.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4543878631,43.6069417805],[5.4553688726,43.6249035933],[5.4800949014,43.6241878397],[5.4791061404,43.6062262555],[5.4543878631,43.6069417805]]]]}},{"type":"Feature","properties":{"NOM":"KD44G6","NUMPOINTS":237.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4553688726,43.6249035933],[5.4563504984,43.6428656436],[5.4810842837,43.6421496613],[5.4800949014,43.6241878397],[5.4553688726,43.6249035933]]]]}},{"type":"Feature","properties":{"NOM":"KD44G7","NUMPOINTS":199.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4563504984,43.6428656436],[5.4573327412,43.6608279298],[5.4820742879,43.6601117187],[5.4810842837,43.6421496613],[5.4563504984,43.6428656436]]]]}},{"type":"Feature","properties":{"NOM":"KD44G8","NUMPOINTS":131.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4573327412,43.6608279298],[5.4583156016,43.6787904501],[5.4830649145,43.6780740101],[5.4820742879,43.6601117187],[5.4573327412,43.6608279298]]]]}},{"type":"Feature","properties":{"NOM":"KD40H2","NUMPOINTS":4.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4565353332,43.1931791549],[5.4575098091,43.2111347723],[5.482057742,43.2104188207],[5.4810756321,43.1924634375],[5.4565353332,43.1931791549]]]]}},{"type":"Feature","properties":{"NOM":"KD40H3","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4575098091,43.2111347723],[5.4584848702,43.2290906761],[5.4830404374,43.2283744913],[5.482057742,43.2104188207],[5.4575098091,43.2111347723]]]]}},{"type":"Feature","properties":{"NOM":"KD40H4","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4584848702,43.2290906761],[5.459460539,43.2470468535],[5.4840237452,43.2463304355],[5.4830404374,43.2283744913],[5.4584848702,43.2290906761]]]]}},{"type":"Feature","properties":{"NOM":"KD40H5","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.459460539,43.2470468535],[5.4604368158,43.2650033031],[5.4850076658,43.2642866517],[5.4840237452,43.2463304355],[5.459460539,43.2470468535]]]]}},{"type":"Feature","properties":{"NOM":"KD40H6","NUMPOINTS":24.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4604368158,43.2650033031],[5.4614137014,43.282960023],[5.4859922,43.2822431382],[5.4850076658,43.2642866517],[5.4604368158,43.2650033031]]]]}},{"type":"Feature","properties":{"NOM":"KD40H7","NUMPOINTS":303.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4614137014,43.282960023],[5.4623911965,43.3009170136],[5.4869773485,43.3001998937],[5.4859922,43.2822431382],[5.4614137014,43.282960023]]]]}},{"type":"Feature","properties":{"NOM":"KD40H8","NUMPOINTS":286.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4623911965,43.3009170136],[5.4633693058,43.3188743066],[5.4879631416,43.3181569482],[5.4869773485,43.3001998937],[5.4623911965,43.3009170136]]]]}},{"type":"Feature","properties":{"NOM":"KD40H9","NUMPOINTS":387.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4633693058,43.3188743066],[5.4643480275,43.3368318646],[5.488949552,43.3361142677],[5.4879631416,43.3181569482],[5.4633693058,43.3188743066]]]]}},{"type":"Feature","properties":{"NOM":"KD42H0","NUMPOINTS":339.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4643480275,43.3368318646],[5.4653273623,43.354789686],[5.4899365802,43.3540718504],[5.488949552,43.3361142677],[5.4643480275,43.3368318646]]]]}},{"type":"Feature","properties":{"NOM":"KD42H1","NUMPOINTS":151.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4653273623,43.354789686],[5.4663073108,43.3727477691],[5.4909242269,43.3720296947],[5.4899365802,43.3540718504],[5.4653273623,43.354789686]]]]}},{"type":"Feature","properties":{"NOM":"KD42H2","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4663073108,43.3727477691],[5.4672878735,43.3907061122],[5.4919124927,43.389987799],[5.4909242269,43.3720296947],[5.4663073108,43.3727477691]]]]}},{"type":"Feature","properties":{"NOM":"KD42H3","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4672878735,43.3907061122],[5.4682691882,43.4086647275],[5.4929015126,43.4079461737],[5.4919124927,43.389987799],[5.4672878735,43.3907061122]]]]}},{"type":"Feature","properties":{"NOM":"KD42H4","NUMPOINTS":106.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4682691882,43.4086647275],[5.4692512667,43.4266236144],[5.4938913234,43.4259048202],[5.4929015126,43.4079461737],[5.4682691882,43.4086647275]]]]}},{"type":"Feature","properties":{"NOM":"KD42H5","NUMPOINTS":276.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4692512667,43.4266236144],[5.470233963,43.4445827562],[5.4948817568,43.4438637215],[5.4938913234,43.4259048202],[5.4692512667,43.4266236144]]]]}},{"type":"Feature","properties":{"NOM":"KD42H6","NUMPOINTS":502.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.470233963,43.4445827562],[5.4712172775,43.4625421512],[5.4958728133,43.4618228761],[5.4948817568,43.4438637215],[5.470233963,43.4445827562]]]]}},{"type":"Feature","properties":{"NOM":"KD42H7","NUMPOINTS":401.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4712172775,43.4625421512],[5.4722012109,43.4805017978],[5.4968644936,43.4797822821],[5.4958728133,43.4618228761],[5.4712172775,43.4625421512]]]]}},{"type":"Feature","properties":{"NOM":"KD42H8","NUMPOINTS":235.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4722012109,43.4805017978],[5.4731857638,43.4984616944],[5.4978567982,43.497741938],[5.4968644936,43.4797822821],[5.4722012109,43.4805017978]]]]}},{"type":"Feature","properties":{"NOM":"KD42H9","NUMPOINTS":185.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4731857638,43.4984616944],[5.4741709473,43.5164218437],[5.4988497401,43.5157018502],[5.4978567982,43.497741938],[5.4731857638,43.4984616944]]]]}},{"type":"Feature","properties":{"NOM":"KD44H0","NUMPOINTS":128.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4741709473,43.5164218437],[5.4751567527,43.5343822404],[5.4998433095,43.5336620105],[5.4988497401,43.5157018502],[5.4741709473,43.5164218437]]]]}},{"type":"Feature","properties":{"NOM":"KD44H1","NUMPOINTS":146.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4751567527,43.5343822404],[5.4761431794,43.5523428824],[5.5008375045,43.5516224164],[5.4998433095,43.5336620105],[5.4751567527,43.5343822404]]]]}},{"type":"Feature","properties":{"NOM":"KD44H2","NUMPOINTS":171.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4761431794,43.5523428824],[5.4771302282,43.570303768],[5.5018323233,43.5695830658],[5.5008375045,43.5516224164],[5.4761431794,43.5523428824]]]]}},{"type":"Feature","properties":{"NOM":"KD44H3","NUMPOINTS":283.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4771302282,43.570303768],[5.4781178996,43.5882648955],[5.5028277664,43.5875439569],[5.5018323233,43.5695830658],[5.4771302282,43.570303768]]]]}},{"type":"Feature","properties":{"NOM":"KD44H4","NUMPOINTS":263.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4781178996,43.5882648955],[5.4791061404,43.6062262555],[5.5038237773,43.6055050831],[5.5028277664,43.5875439569],[5.4781178996,43.5882648955]]]]}},{"type":"Feature","properties":{"NOM":"KD44H5","NUMPOINTS":180.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4791061404,43.6062262555],[5.4800949014,43.6241878397],[5.5048202848,43.6234664366],[5.5038237773,43.6055050831],[5.4791061404,43.6062262555]]]]}},{"type":"Feature","properties":{"NOM":"KD44H6","NUMPOINTS":203.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4800949014,43.6241878397],[5.4810842837,43.6421496613],[5.5058174186,43.6414280272],[5.5048202848,43.6234664366],[5.4800949014,43.6241878397]]]]}},{"type":"Feature","properties":{"NOM":"KD44H7","NUMPOINTS":128.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4810842837,43.6421496613],[5.4820742879,43.6601117187],[5.5068151794,43.6593898532],[5.5058174186,43.6414280272],[5.4810842837,43.6421496613]]]]}},{"type":"Feature","properties":{"NOM":"KD44H8","NUMPOINTS":199.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4820742879,43.6601117187],[5.4830649145,43.6780740101],[5.5078135678,43.6773519131],[5.5068151794,43.6593898532],[5.4820742879,43.6601117187]]]]}},{"type":"Feature","properties":{"NOM":"KD40K2","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4810756321,43.1924634375],[5.482057742,43.2104188207],[5.5066050881,43.2096972707],[5.5056153352,43.1917421221],[5.4810756321,43.1924634375]]]]}},{"type":"Feature","properties":{"NOM":"KD40K3","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.482057742,43.2104188207],[5.4830404374,43.2283744913],[5.5075954307,43.2276527074],[5.5066050881,43.2096972707],[5.482057742,43.2104188207]]]]}},{"type":"Feature","properties":{"NOM":"KD40K4","NUMPOINTS":22.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4830404374,43.2283744913],[5.4840237452,43.2463304355],[5.508586393,43.2456084176],[5.5075954307,43.2276527074],[5.4830404374,43.2283744913]]]]}},{"type":"Feature","properties":{"NOM":"KD40K5","NUMPOINTS":32.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4840237452,43.2463304355],[5.4850076658,43.2642866517],[5.5095779755,43.2635643996],[5.508586393,43.2456084176],[5.4840237452,43.2463304355]]]]}},{"type":"Feature","properties":{"NOM":"KD40K6","NUMPOINTS":120.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4850076658,43.2642866517],[5.4859922,43.2822431382],[5.5105701788,43.2815206518],[5.5095779755,43.2635643996],[5.4850076658,43.2642866517]]]]}},{"type":"Feature","properties":{"NOM":"KD40K7","NUMPOINTS":323.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4859922,43.2822431382],[5.4869773485,43.3001998937],[5.5115630035,43.2994771725],[5.5105701788,43.2815206518],[5.4859922,43.2822431382]]]]}},{"type":"Feature","properties":{"NOM":"KD40K8","NUMPOINTS":271.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4869773485,43.3001998937],[5.4879631416,43.3181569482],[5.5125564956,43.3174339859],[5.5115630035,43.2994771725],[5.4869773485,43.3001998937]]]]}},{"type":"Feature","properties":{"NOM":"KD40K9","NUMPOINTS":170.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4879631416,43.3181569482],[5.488949552,43.3361142677],[5.5135506122,43.3353910647],[5.5125564956,43.3174339859],[5.4879631416,43.3181569482]]]]}},{"type":"Feature","properties":{"NOM":"KD42K0","NUMPOINTS":36.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.488949552,43.3361142677],[5.4899365802,43.3540718504],[5.5145453526,43.3533484065],[5.5135506122,43.3353910647],[5.488949552,43.3361142677]]]]}},{"type":"Feature","properties":{"NOM":"KD42K1","NUMPOINTS":71.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4899365802,43.3540718504],[5.4909242269,43.3720296947],[5.5155407173,43.3713060096],[5.5145453526,43.3533484065],[5.4899365802,43.3540718504]]]]}},{"type":"Feature","properties":{"NOM":"KD42K2","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4909242269,43.3720296947],[5.4919124927,43.389987799],[5.5165367071,43.3892638724],[5.5155407173,43.3713060096],[5.4909242269,43.3720296947]]]]}},{"type":"Feature","properties":{"NOM":"KD42K3","NUMPOINTS":18.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4919124927,43.389987799],[5.4929015126,43.4079461737],[5.5175334365,43.4072220045],[5.5165367071,43.3892638724],[5.4919124927,43.389987799]]]]}},{"type":"Feature","properties":{"NOM":"KD42K4","NUMPOINTS":137.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4929015126,43.4079461737],[5.4938913234,43.4259048202],[5.51853096,43.4251804099],[5.5175334365,43.4072220045],[5.4929015126,43.4079461737]]]]}},{"type":"Feature","properties":{"NOM":"KD42K5","NUMPOINTS":74.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4938913234,43.4259048202],[5.4948817568,43.4438637215],[5.5195291075,43.44313907],[5.51853096,43.4251804099],[5.4938913234,43.4259048202]]]]}},{"type":"Feature","properties":{"NOM":"KD42K6","NUMPOINTS":107.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4948817568,43.4438637215],[5.4958728133,43.4618228761],[5.5205278795,43.4610979832],[5.5195291075,43.44313907],[5.4948817568,43.4438637215]]]]}},{"type":"Feature","properties":{"NOM":"KD42K7","NUMPOINTS":320.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4958728133,43.4618228761],[5.4968644936,43.4797822821],[5.5215272767,43.4790571479],[5.5205278795,43.4610979832],[5.4958728133,43.4618228761]]]]}},{"type":"Feature","properties":{"NOM":"KD42K8","NUMPOINTS":158.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4968644936,43.4797822821],[5.4978567982,43.497741938],[5.5225272996,43.4970165623],[5.5215272767,43.4790571479],[5.4968644936,43.4797822821]]]]}},{"type":"Feature","properties":{"NOM":"KD42K9","NUMPOINTS":192.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4978567982,43.497741938],[5.4988497401,43.5157018502],[5.5235279649,43.5149762347],[5.5225272996,43.4970165623],[5.4978567982,43.497741938]]]]}},{"type":"Feature","properties":{"NOM":"KD44K0","NUMPOINTS":179.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4988497401,43.5157018502],[5.4998433095,43.5336620105],[5.5245292607,43.5329361557],[5.5235279649,43.5149762347],[5.4988497401,43.5157018502]]]]}},{"type":"Feature","properties":{"NOM":"KD44K1","NUMPOINTS":115.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.4998433095,43.5336620105],[5.5008375045,43.5516224164],[5.5255311843,43.5508963217],[5.5245292607,43.5329361557],[5.4998433095,43.5336620105]]]]}},{"type":"Feature","properties":{"NOM":"KD44K2","NUMPOINTS":32.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5008375045,43.5516224164],[5.5018323233,43.5695830658],[5.5265337366,43.5688567309],[5.5255311843,43.5508963217],[5.5008375045,43.5516224164]]]]}},{"type":"Feature","properties":{"NOM":"KD44K3","NUMPOINTS":58.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5018323233,43.5695830658],[5.5028277664,43.5875439569],[5.5275369179,43.5868173818],[5.5265337366,43.5688567309],[5.5018323233,43.5695830658]]]]}},{"type":"Feature","properties":{"NOM":"KD44K4","NUMPOINTS":42.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5028277664,43.5875439569],[5.5038237773,43.6055050831],[5.5285406809,43.6047782696],[5.5275369179,43.5868173818],[5.5028277664,43.5875439569]]]]}},{"type":"Feature","properties":{"NOM":"KD44K5","NUMPOINTS":66.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5038237773,43.6055050831],[5.5048202848,43.6234664366],[5.5295449417,43.6227393879],[5.5285406809,43.6047782696],[5.5038237773,43.6055050831]]]]}},{"type":"Feature","properties":{"NOM":"KD44K6","NUMPOINTS":209.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5048202848,43.6234664366],[5.5058174186,43.6414280272],[5.5305498338,43.6407007431],[5.5295449417,43.6227393879],[5.5048202848,43.6234664366]]]]}},{"type":"Feature","properties":{"NOM":"KD44K7","NUMPOINTS":139.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5058174186,43.6414280272],[5.5068151794,43.6593898532],[5.5315553576,43.6586623337],[5.5305498338,43.6407007431],[5.5058174186,43.6414280272]]]]}},{"type":"Feature","properties":{"NOM":"KD44K8","NUMPOINTS":145.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5068151794,43.6593898532],[5.5078135678,43.6773519131],[5.5325615139,43.676624158],[5.5315553576,43.6586623337],[5.5068151794,43.6593898532]]]]}},{"type":"Feature","properties":{"NOM":"KD40L2","NUMPOINTS":20.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5056153352,43.1917421221],[5.5066050881,43.2096972707],[5.5311518839,43.2089701378],[5.5301544742,43.191015227],[5.5056153352,43.1917421221]]]]}},{"type":"Feature","properties":{"NOM":"KD40L3","NUMPOINTS":57.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5066050881,43.2096972707],[5.5075954307,43.2276527074],[5.5321498912,43.226925337],[5.5311518839,43.2089701378],[5.5066050881,43.2096972707]]]]}},{"type":"Feature","properties":{"NOM":"KD40L4","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5075954307,43.2276527074],[5.508586393,43.2456084176],[5.533148523,43.2448808095],[5.5321498912,43.226925337],[5.5075954307,43.2276527074]]]]}},{"type":"Feature","properties":{"NOM":"KD40L5","NUMPOINTS":108.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.508586393,43.2456084176],[5.5095779755,43.2635643996],[5.5341477798,43.2628365538],[5.533148523,43.2448808095],[5.508586393,43.2456084176]]]]}},{"type":"Feature","properties":{"NOM":"KD40L6","NUMPOINTS":178.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5095779755,43.2635643996],[5.5105701788,43.2815206518],[5.5351476622,43.2807925682],[5.5341477798,43.2628365538],[5.5095779755,43.2635643996]]]]}},{"type":"Feature","properties":{"NOM":"KD40L7","NUMPOINTS":282.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5105701788,43.2815206518],[5.5115630035,43.2994771725],[5.5361481707,43.298748851],[5.5351476622,43.2807925682],[5.5105701788,43.2815206518]]]]}},{"type":"Feature","properties":{"NOM":"KD40L8","NUMPOINTS":175.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5115630035,43.2994771725],[5.5125564956,43.3174339859],[5.5371493566,43.3167054192],[5.5361481707,43.298748851],[5.5115630035,43.2994771725]]]]}},{"type":"Feature","properties":{"NOM":"KD40L9","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5125564956,43.3174339859],[5.5135506122,43.3353910647],[5.5381511742,43.3346622534],[5.5371493566,43.3167054192],[5.5125564956,43.3174339859]]]]}},{"type":"Feature","properties":{"NOM":"KD42L0","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5135506122,43.3353910647],[5.5145453526,43.3533484065],[5.5391536205,43.3526193505],[5.5381511742,43.3346622534],[5.5135506122,43.3353910647]]]]}},{"type":"Feature","properties":{"NOM":"KD42L1","NUMPOINTS":24.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5145453526,43.3533484065],[5.5155407173,43.3713060096],[5.540156696,43.3705767088],[5.5391536205,43.3526193505],[5.5145453526,43.3533484065]]]]}},{"type":"Feature","properties":{"NOM":"KD42L2","NUMPOINTS":17.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5155407173,43.3713060096],[5.5165367071,43.3892638724],[5.5411604012,43.3885343267],[5.540156696,43.3705767088],[5.5155407173,43.3713060096]]]]}},{"type":"Feature","properties":{"NOM":"KD42L3","NUMPOINTS":116.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5165367071,43.3892638724],[5.5175334365,43.4072220045],[5.5421648265,43.4064922132],[5.5411604012,43.3885343267],[5.5165367071,43.3892638724]]]]}},{"type":"Feature","properties":{"NOM":"KD42L4","NUMPOINTS":358.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5175334365,43.4072220045],[5.51853096,43.4251804099],[5.5431700391,43.4244503749],[5.5421648265,43.4064922132],[5.5175334365,43.4072220045]]]]}},{"type":"Feature","properties":{"NOM":"KD42L5","NUMPOINTS":462.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.51853096,43.4251804099],[5.5195291075,43.44313907],[5.5441758806,43.4424087913],[5.5431700391,43.4244503749],[5.51853096,43.4251804099]]]]}},{"type":"Feature","properties":{"NOM":"KD42L6","NUMPOINTS":232.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5195291075,43.44313907],[5.5205278795,43.4610979832],[5.5451823514,43.4603674607],[5.5441758806,43.4424087913],[5.5195291075,43.44313907]]]]}},{"type":"Feature","properties":{"NOM":"KD42L7","NUMPOINTS":181.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5205278795,43.4610979832],[5.5215272767,43.4790571479],[5.5461894521,43.4783263815],[5.5451823514,43.4603674607],[5.5205278795,43.4610979832]]]]}},{"type":"Feature","properties":{"NOM":"KD42L8","NUMPOINTS":232.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5215272767,43.4790571479],[5.5225272996,43.4970165623],[5.5471971834,43.496285552],[5.5461894521,43.4783263815],[5.5215272767,43.4790571479]]]]}},{"type":"Feature","properties":{"NOM":"KD42L9","NUMPOINTS":173.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5225272996,43.4970165623],[5.5235279649,43.5149762347],[5.5482055652,43.5142449817],[5.5471971834,43.496285552],[5.5225272996,43.4970165623]]]]}},{"type":"Feature","properties":{"NOM":"KD44L0","NUMPOINTS":90.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5235279649,43.5149762347],[5.5245292607,43.5329361557],[5.5492145841,43.5322046609],[5.5482055652,43.5142449817],[5.5235279649,43.5149762347]]]]}},{"type":"Feature","properties":{"NOM":"KD44L1","NUMPOINTS":50.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5245292607,43.5329361557],[5.5255311843,43.5508963217],[5.5502242357,43.5501645849],[5.5492145841,43.5322046609],[5.5245292607,43.5329361557]]]]}},{"type":"Feature","properties":{"NOM":"KD44L2","NUMPOINTS":60.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5255311843,43.5508963217],[5.5265337366,43.5688567309],[5.5512345207,43.5681247522],[5.5502242357,43.5501645849],[5.5255311843,43.5508963217]]]]}},{"type":"Feature","properties":{"NOM":"KD44L3","NUMPOINTS":26.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5265337366,43.5688567309],[5.5275369179,43.5868173818],[5.5522454397,43.5860851609],[5.5512345207,43.5681247522],[5.5265337366,43.5688567309]]]]}},{"type":"Feature","properties":{"NOM":"KD44L4","NUMPOINTS":31.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5275369179,43.5868173818],[5.5285406809,43.6047782696],[5.5532569537,43.6040458082],[5.5522454397,43.5860851609],[5.5275369179,43.5868173818]]]]}},{"type":"Feature","properties":{"NOM":"KD44L5","NUMPOINTS":7.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5285406809,43.6047782696],[5.5295449417,43.6227393879],[5.5542689673,43.6220066893],[5.5532569537,43.6040458082],[5.5285406809,43.6047782696]]]]}},{"type":"Feature","properties":{"NOM":"KD44L6","NUMPOINTS":44.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5295449417,43.6227393879],[5.5305498338,43.6407007431],[5.555281617,43.6399678074],[5.5542689673,43.6220066893],[5.5295449417,43.6227393879]]]]}},{"type":"Feature","properties":{"NOM":"KD44L7","NUMPOINTS":160.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5305498338,43.6407007431],[5.5315553576,43.6586623337],[5.5562949034,43.6579291607],[5.555281617,43.6399678074],[5.5305498338,43.6407007431]]]]}},{"type":"Feature","properties":{"NOM":"KD44L8","NUMPOINTS":138.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5315553576,43.6586623337],[5.5325615139,43.676624158],[5.5573088271,43.6758907476],[5.5562949034,43.6579291607],[5.5315553576,43.6586623337]]]]}},{"type":"Feature","properties":{"NOM":"KD60A1","NUMPOINTS":1.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5291576609,43.1730606061],[5.5301544742,43.191015227],[5.5546929908,43.1902827266],[5.5536885342,43.1723283433],[5.5291576609,43.1730606061]]]]}},{"type":"Feature","properties":{"NOM":"KD60A2","NUMPOINTS":29.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5301544742,43.191015227],[5.5311518839,43.2089701378],[5.5556980559,43.208237398],[5.5546929908,43.1902827266],[5.5301544742,43.191015227]]]]}},{"type":"Feature","properties":{"NOM":"KD60A3","NUMPOINTS":441.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5311518839,43.2089701378],[5.5321498912,43.226925337],[5.5567037274,43.2261923577],[5.5556980559,43.208237398],[5.5311518839,43.2089701378]]]]}},{"type":"Feature","properties":{"NOM":"KD60A4","NUMPOINTS":194.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5321498912,43.226925337],[5.533148523,43.2448808095],[5.557710028,43.2441475908],[5.5567037274,43.2261923577],[5.5321498912,43.226925337]]]]}},{"type":"Feature","properties":{"NOM":"KD60A5","NUMPOINTS":181.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.533148523,43.2448808095],[5.5341477798,43.2628365538],[5.5587169585,43.2621030955],[5.557710028,43.2441475908],[5.533148523,43.2448808095]]]]}},{"type":"Feature","properties":{"NOM":"KD60A6","NUMPOINTS":203.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5341477798,43.2628365538],[5.5351476622,43.2807925682],[5.5597245193,43.2800588703],[5.5587169585,43.2621030955],[5.5341477798,43.2628365538]]]]}},{"type":"Feature","properties":{"NOM":"KD60A7","NUMPOINTS":351.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5351476622,43.2807925682],[5.5361481707,43.298748851],[5.5607327111,43.2980149134],[5.5597245193,43.2800588703],[5.5351476622,43.2807925682]]]]}},{"type":"Feature","properties":{"NOM":"KD60A8","NUMPOINTS":228.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5361481707,43.298748851],[5.5371493566,43.3167054192],[5.5617415896,43.3159712351],[5.5607327111,43.2980149134],[5.5361481707,43.298748851]]]]}},{"type":"Feature","properties":{"NOM":"KD60A9","NUMPOINTS":47.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5371493566,43.3167054192],[5.5381511742,43.3346622534],[5.5627511077,43.3339278227],[5.5617415896,43.3159712351],[5.5371493566,43.3167054192]]]]}},{"type":"Feature","properties":{"NOM":"KD62A0","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5381511742,43.3346622534],[5.5391536205,43.3526193505],[5.5637612592,43.3518846732],[5.5627511077,43.3339278227],[5.5381511742,43.3346622534]]]]}},{"type":"Feature","properties":{"NOM":"KD62A1","NUMPOINTS":51.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5391536205,43.3526193505],[5.540156696,43.3705767088],[5.5647720448,43.3698417849],[5.5637612592,43.3518846732],[5.5391536205,43.3526193505]]]]}},{"type":"Feature","properties":{"NOM":"KD62A2","NUMPOINTS":82.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.540156696,43.3705767088],[5.5411604012,43.3885343267],[5.5657834649,43.387799156],[5.5647720448,43.3698417849],[5.540156696,43.3705767088]]]]}},{"type":"Feature","properties":{"NOM":"KD62A3","NUMPOINTS":359.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5411604012,43.3885343267],[5.5421648265,43.4064922132],[5.5667955882,43.4057567949],[5.5657834649,43.387799156],[5.5411604012,43.3885343267]]]]}},{"type":"Feature","properties":{"NOM":"KD62A4","NUMPOINTS":69.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5421648265,43.4064922132],[5.5431700391,43.4244503749],[5.5678084895,43.4237147112],[5.5667955882,43.4057567949],[5.5421648265,43.4064922132]]]]}},{"type":"Feature","properties":{"NOM":"KD62A5","NUMPOINTS":120.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5431700391,43.4244503749],[5.5441758806,43.4424087913],[5.5688220243,43.441672882],[5.5678084895,43.4237147112],[5.5431700391,43.4244503749]]]]}},{"type":"Feature","properties":{"NOM":"KD62A6","NUMPOINTS":335.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5441758806,43.4424087913],[5.5451823514,43.4603674607],[5.5698361933,43.4596313059],[5.5688220243,43.441672882],[5.5441758806,43.4424087913]]]]}},{"type":"Feature","properties":{"NOM":"KD62A7","NUMPOINTS":272.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5451823514,43.4603674607],[5.5461894521,43.4783263815],[5.570850997,43.477589981],[5.5698361933,43.4596313059],[5.5451823514,43.4603674607]]]]}},{"type":"Feature","properties":{"NOM":"KD62A8","NUMPOINTS":215.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5461894521,43.4783263815],[5.5471971834,43.496285552],[5.5718664361,43.4955489057],[5.570850997,43.477589981],[5.5461894521,43.4783263815]]]]}},{"type":"Feature","properties":{"NOM":"KD62A9","NUMPOINTS":51.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5471971834,43.496285552],[5.5482055652,43.5142449817],[5.5728825333,43.5135080907],[5.5718664361,43.4955489057],[5.5471971834,43.496285552]]]]}},{"type":"Feature","properties":{"NOM":"KD64A0","NUMPOINTS":52.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5482055652,43.5142449817],[5.5492145841,43.5322046609],[5.5738992748,43.5314675261],[5.5728825333,43.5135080907],[5.5482055652,43.5142449817]]]]}},{"type":"Feature","properties":{"NOM":"KD64A1","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5492145841,43.5322046609],[5.5502242357,43.5501645849],[5.5749166538,43.5494272064],[5.5738992748,43.5314675261],[5.5492145841,43.5322046609]]]]}},{"type":"Feature","properties":{"NOM":"KD64A2","NUMPOINTS":103.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5502242357,43.5501645849],[5.5512345207,43.5681247522],[5.575934671,43.5673871298],[5.5749166538,43.5494272064],[5.5502242357,43.5501645849]]]]}},{"type":"Feature","properties":{"NOM":"KD64A3","NUMPOINTS":10.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5512345207,43.5681247522],[5.5522454397,43.5860851609],[5.576953327,43.5853472946],[5.575934671,43.5673871298],[5.5512345207,43.5681247522]]]]}},{"type":"Feature","properties":{"NOM":"KD64A4","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5522454397,43.5860851609],[5.5532569537,43.6040458082],[5.5779725911,43.6033076991],[5.576953327,43.5853472946],[5.5522454397,43.5860851609]]]]}},{"type":"Feature","properties":{"NOM":"KD64A5","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5532569537,43.6040458082],[5.5542689673,43.6220066893],[5.5789923569,43.6212683412],[5.5779725911,43.6033076991],[5.5532569537,43.6040458082]]]]}},{"type":"Feature","properties":{"NOM":"KD64A6","NUMPOINTS":76.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5542689673,43.6220066893],[5.555281617,43.6399678074],[5.5800127636,43.6392292202],[5.5789923569,43.6212683412],[5.5542689673,43.6220066893]]]]}},{"type":"Feature","properties":{"NOM":"KD64A7","NUMPOINTS":124.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.555281617,43.6399678074],[5.5562949034,43.6579291607],[5.5810338119,43.6571903344],[5.5800127636,43.6392292202],[5.555281617,43.6399678074]]]]}},{"type":"Feature","properties":{"NOM":"KD64A8","NUMPOINTS":66.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5562949034,43.6579291607],[5.5573088271,43.6758907476],[5.5820555023,43.6751516821],[5.5810338119,43.6571903344],[5.5562949034,43.6579291607]]]]}},{"type":"Feature","properties":{"NOM":"KD60B0","NUMPOINTS":0.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5526847041,43.1543742385],[5.5536885342,43.1723283433],[5.578218781,43.1715904773],[5.5772073129,43.1536366118],[5.5526847041,43.1543742385]]]]}},{"type":"Feature","properties":{"NOM":"KD60B1","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5536885342,43.1723283433],[5.5546929908,43.1902827266],[5.5792308803,43.1895446212],[5.578218781,43.1715904773],[5.5536885342,43.1723283433]]]]}},{"type":"Feature","properties":{"NOM":"KD60B2","NUMPOINTS":37.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5546929908,43.1902827266],[5.5556980559,43.208237398],[5.5802435993,43.2074990513],[5.5792308803,43.1895446212],[5.5546929908,43.1902827266]]]]}},{"type":"Feature","properties":{"NOM":"KD60B3","NUMPOINTS":174.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5556980559,43.208237398],[5.5567037274,43.2261923577],[5.5812569342,43.2254537699],[5.5802435993,43.2074990513],[5.5556980559,43.208237398]]]]}},{"type":"Feature","properties":{"NOM":"KD60B4","NUMPOINTS":114.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5567037274,43.2261923577],[5.557710028,43.2441475908],[5.5822709032,43.2434087616],[5.5812569342,43.2254537699],[5.5567037274,43.2261923577]]]]}},{"type":"Feature","properties":{"NOM":"KD60B5","NUMPOINTS":241.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.557710028,43.2441475908],[5.5587169585,43.2621030955],[5.5832855067,43.2613640249],[5.5822709032,43.2434087616],[5.557710028,43.2441475908]]]]}},{"type":"Feature","properties":{"NOM":"KD60B6","NUMPOINTS":170.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5587169585,43.2621030955],[5.5597245193,43.2800588703],[5.5843007455,43.2793195582],[5.5832855067,43.2613640249],[5.5587169585,43.2621030955]]]]}},{"type":"Feature","properties":{"NOM":"KD60B7","NUMPOINTS":375.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5597245193,43.2800588703],[5.5607327111,43.2980149134],[5.5853166199,43.2972753597],[5.5843007455,43.2793195582],[5.5597245193,43.2800588703]]]]}},{"type":"Feature","properties":{"NOM":"KD60B8","NUMPOINTS":374.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5607327111,43.2980149134],[5.5617415896,43.3159712351],[5.5863331898,43.3152314336],[5.5853166199,43.2972753597],[5.5607327111,43.2980149134]]]]}},{"type":"Feature","properties":{"NOM":"KD60B9","NUMPOINTS":314.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5617415896,43.3159712351],[5.5627511077,43.3339278227],[5.5873504077,43.3331877729],[5.5863331898,43.3152314336],[5.5617415896,43.3159712351]]]]}},{"type":"Feature","properties":{"NOM":"KD62B0","NUMPOINTS":244.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5627511077,43.3339278227],[5.5637612592,43.3518846732],[5.5883682639,43.351144375],[5.5873504077,43.3331877729],[5.5627511077,43.3339278227]]]]}},{"type":"Feature","properties":{"NOM":"KD62B1","NUMPOINTS":51.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5637612592,43.3518846732],[5.5647720448,43.3698417849],[5.589386759,43.3691012381],[5.5883682639,43.351144375],[5.5637612592,43.3518846732]]]]}},{"type":"Feature","properties":{"NOM":"KD62B2","NUMPOINTS":218.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5647720448,43.3698417849],[5.5657834649,43.387799156],[5.5904058935,43.3870583606],[5.589386759,43.3691012381],[5.5647720448,43.3698417849]]]]}},{"type":"Feature","properties":{"NOM":"KD62B3","NUMPOINTS":295.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5657834649,43.387799156],[5.5667955882,43.4057567949],[5.5914257171,43.40501575],[5.5904058935,43.3870583606],[5.5657834649,43.387799156]]]]}},{"type":"Feature","properties":{"NOM":"KD62B4","NUMPOINTS":161.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5667955882,43.4057567949],[5.5678084895,43.4237147112],[5.5924463063,43.422973419],[5.5914257171,43.40501575],[5.5667955882,43.4057567949]]]]}},{"type":"Feature","properties":{"NOM":"KD62B5","NUMPOINTS":117.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5678084895,43.4237147112],[5.5688220243,43.441672882],[5.5934675339,43.4409313425],[5.5924463063,43.422973419],[5.5678084895,43.4237147112]]]]}},{"type":"Feature","properties":{"NOM":"KD62B6","NUMPOINTS":139.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5688220243,43.441672882],[5.5698361933,43.4596313059],[5.5944894005,43.4588895188],[5.5934675339,43.4409313425],[5.5688220243,43.441672882]]]]}},{"type":"Feature","properties":{"NOM":"KD62B7","NUMPOINTS":244.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5698361933,43.4596313059],[5.570850997,43.477589981],[5.5955119066,43.4768479464],[5.5944894005,43.4588895188],[5.5698361933,43.4596313059]]]]}},{"type":"Feature","properties":{"NOM":"KD62B8","NUMPOINTS":173.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.570850997,43.477589981],[5.5718664361,43.4955489057],[5.5965350529,43.4948066235],[5.5955119066,43.4768479464],[5.570850997,43.477589981]]]]}},{"type":"Feature","properties":{"NOM":"KD62B9","NUMPOINTS":55.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5718664361,43.4955489057],[5.5728825333,43.5135080907],[5.5975588645,43.5127655617],[5.5965350529,43.4948066235],[5.5718664361,43.4955489057]]]]}},{"type":"Feature","properties":{"NOM":"KD64B0","NUMPOINTS":35.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5728825333,43.5135080907],[5.5738992748,43.5314675261],[5.5985833279,43.5307247516],[5.5975588645,43.5127655617],[5.5728825333,43.5135080907]]]]}},{"type":"Feature","properties":{"NOM":"KD64B1","NUMPOINTS":26.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5738992748,43.5314675261],[5.5749166538,43.5494272064],[5.5996084337,43.5486841863],[5.5985833279,43.5307247516],[5.5738992748,43.5314675261]]]]}},{"type":"Feature","properties":{"NOM":"KD64B2","NUMPOINTS":71.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5749166538,43.5494272064],[5.575934671,43.5673871298],[5.600634181,43.5666438644],[5.5996084337,43.5486841863],[5.5749166538,43.5494272064]]]]}},{"type":"Feature","properties":{"NOM":"KD64B3","NUMPOINTS":11.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.575934671,43.5673871298],[5.576953327,43.5853472946],[5.6016605702,43.5846037838],[5.600634181,43.5666438644],[5.575934671,43.5673871298]]]]}},{"type":"Feature","properties":{"NOM":"KD64B4","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.576953327,43.5853472946],[5.5779725911,43.6033076991],[5.6026875797,43.6025639433],[5.6016605702,43.5846037838],[5.576953327,43.5853472946]]]]}},{"type":"Feature","properties":{"NOM":"KD64B5","NUMPOINTS":27.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5779725911,43.6033076991],[5.5789923569,43.6212683412],[5.6037150951,43.6205243441],[5.6026875797,43.6025639433],[5.5779725911,43.6033076991]]]]}},{"type":"Feature","properties":{"NOM":"KD64B6","NUMPOINTS":128.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5789923569,43.6212683412],[5.5800127636,43.6392292202],[5.6047432571,43.6384849812],[5.6037150951,43.6205243441],[5.5789923569,43.6212683412]]]]}},{"type":"Feature","properties":{"NOM":"KD64B7","NUMPOINTS":265.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5800127636,43.6392292202],[5.5810338119,43.6571903344],[5.6057720662,43.656445853],[5.6047432571,43.6384849812],[5.5800127636,43.6392292202]]]]}},{"type":"Feature","properties":{"NOM":"KD64B8","NUMPOINTS":57.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5810338119,43.6571903344],[5.5820555023,43.6751516821],[5.6068015231,43.6744069578],[5.6057720662,43.656445853],[5.5810338119,43.6571903344]]]]}},{"type":"Feature","properties":{"NOM":"KD60C0","NUMPOINTS":66.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5772073129,43.1536366118],[5.578218781,43.1715904773],[5.6027484001,43.1708470101],[5.6017292928,43.152893385],[5.5772073129,43.1536366118]]]]}},{"type":"Feature","properties":{"NOM":"KD60C1","NUMPOINTS":202.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.578218781,43.1715904773],[5.5792308803,43.1895446212],[5.603768144,43.1888009134],[5.6027484001,43.1708470101],[5.578218781,43.1715904773]]]]}},{"type":"Feature","properties":{"NOM":"KD60C2","NUMPOINTS":226.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5792308803,43.1895446212],[5.5802435993,43.2074990513],[5.6047885179,43.2067551015],[5.603768144,43.1888009134],[5.5792308803,43.1895446212]]]]}},{"type":"Feature","properties":{"NOM":"KD60C3","NUMPOINTS":54.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5802435993,43.2074990513],[5.5812569342,43.2254537699],[5.6058095183,43.2247095781],[5.6047885179,43.2067551015],[5.5802435993,43.2074990513]]]]}},{"type":"Feature","properties":{"NOM":"KD60C4","NUMPOINTS":56.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5812569342,43.2254537699],[5.5822709032,43.2434087616],[5.6068311576,43.242664328],[5.6058095183,43.2247095781],[5.5812569342,43.2254537699]]]]}},{"type":"Feature","properties":{"NOM":"KD60C5","NUMPOINTS":229.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5822709032,43.2434087616],[5.5832855067,43.2613640249],[5.6078534364,43.2606193496],[5.6068311576,43.242664328],[5.5822709032,43.2434087616]]]]}},{"type":"Feature","properties":{"NOM":"KD60C6","NUMPOINTS":50.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5832855067,43.2613640249],[5.5843007455,43.2793195582],[5.6088763555,43.2785746411],[5.6078534364,43.2606193496],[5.5832855067,43.2613640249]]]]}},{"type":"Feature","properties":{"NOM":"KD60C7","NUMPOINTS":265.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5843007455,43.2793195582],[5.5853166199,43.2972753597],[5.6098999152,43.296530201],[5.6088763555,43.2785746411],[5.5843007455,43.2793195582]]]]}},{"type":"Feature","properties":{"NOM":"KD60C8","NUMPOINTS":412.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5853166199,43.2972753597],[5.5863331898,43.3152314336],[5.610924173,43.3144860271],[5.6098999152,43.296530201],[5.5853166199,43.2972753597]]]]}},{"type":"Feature","properties":{"NOM":"KD60C9","NUMPOINTS":355.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5863331898,43.3152314336],[5.5873504077,43.3331877729],[5.6119490859,43.3324421174],[5.610924173,43.3144860271],[5.5863331898,43.3152314336]]]]}},{"type":"Feature","properties":{"NOM":"KD62C0","NUMPOINTS":438.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5873504077,43.3331877729],[5.5883682639,43.351144375],[5.6129746406,43.3503984704],[5.6119490859,43.3324421174],[5.5873504077,43.3331877729]]]]}},{"type":"Feature","properties":{"NOM":"KD62C1","NUMPOINTS":113.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5883682639,43.351144375],[5.589386759,43.3691012381],[5.6140008379,43.3683550843],[5.6129746406,43.3503984704],[5.5883682639,43.351144375]]]]}},{"type":"Feature","properties":{"NOM":"KD62C2","NUMPOINTS":419.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.589386759,43.3691012381],[5.5904058935,43.3870583606],[5.6150276784,43.3863119576],[5.6140008379,43.3683550843],[5.589386759,43.3691012381]]]]}},{"type":"Feature","properties":{"NOM":"KD62C3","NUMPOINTS":487.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5904058935,43.3870583606],[5.5914257171,43.40501575],[5.6160551978,43.4042690966],[5.6150276784,43.3863119576],[5.5904058935,43.3870583606]]]]}},{"type":"Feature","properties":{"NOM":"KD62C4","NUMPOINTS":128.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5914257171,43.40501575],[5.5924463063,43.422973419],[5.6170834734,43.4222265172],[5.6160551978,43.4042690966],[5.5914257171,43.40501575]]]]}},{"type":"Feature","properties":{"NOM":"KD62C5","NUMPOINTS":32.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5924463063,43.422973419],[5.5934675339,43.4409313425],[5.618112392,43.4401841922],[5.6170834734,43.4222265172],[5.5924463063,43.422973419]]]]}},{"type":"Feature","properties":{"NOM":"KD62C6","NUMPOINTS":162.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5934675339,43.4409313425],[5.5944894005,43.4588895188],[5.6191419543,43.4581421199],[5.618112392,43.4401841922],[5.5934675339,43.4409313425]]]]}},{"type":"Feature","properties":{"NOM":"KD62C7","NUMPOINTS":285.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5944894005,43.4588895188],[5.5955119066,43.4768479464],[5.6201721609,43.4761002988],[5.6191419543,43.4581421199],[5.5944894005,43.4588895188]]]]}},{"type":"Feature","properties":{"NOM":"KD62C8","NUMPOINTS":259.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5955119066,43.4768479464],[5.5965350529,43.4948066235],[5.6212030124,43.494058727],[5.6201721609,43.4761002988],[5.5955119066,43.4768479464]]]]}},{"type":"Feature","properties":{"NOM":"KD62C9","NUMPOINTS":81.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5965350529,43.4948066235],[5.5975588645,43.5127655617],[5.62223453,43.5120174155],[5.6212030124,43.494058727],[5.5965350529,43.4948066235]]]]}},{"type":"Feature","properties":{"NOM":"KD64C0","NUMPOINTS":32.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5975588645,43.5127655617],[5.5985833279,43.5307247516],[5.6232667035,43.5299763564],[5.62223453,43.5120174155],[5.5975588645,43.5127655617]]]]}},{"type":"Feature","properties":{"NOM":"KD64C1","NUMPOINTS":32.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5985833279,43.5307247516],[5.5996084337,43.5486841863],[5.6242995233,43.5479355416],[5.6232667035,43.5299763564],[5.5985833279,43.5307247516]]]]}},{"type":"Feature","properties":{"NOM":"KD64C2","NUMPOINTS":91.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.5996084337,43.5486841863],[5.600634181,43.5666438644],[5.6253329901,43.5658949696],[5.6242995233,43.5479355416],[5.5996084337,43.5486841863]]]]}},{"type":"Feature","properties":{"NOM":"KD64C3","NUMPOINTS":32.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.600634181,43.5666438644],[5.6016605702,43.5846037838],[5.6263671045,43.5838546386],[5.6253329901,43.5658949696],[5.600634181,43.5666438644]]]]}},{"type":"Feature","properties":{"NOM":"KD64C4","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6016605702,43.5846037838],[5.6026875797,43.6025639433],[5.6274018531,43.6018145476],[5.6263671045,43.5838546386],[5.6016605702,43.5846037838]]]]}},{"type":"Feature","properties":{"NOM":"KD64C5","NUMPOINTS":63.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6026875797,43.6025639433],[5.6037150951,43.6205243441],[5.6284371283,43.6197747002],[5.6274018531,43.6018145476],[5.6026875797,43.6025639433]]]]}},{"type":"Feature","properties":{"NOM":"KD64C6","NUMPOINTS":180.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6037150951,43.6205243441],[5.6047432571,43.6384849812],[5.629473055,43.637735089],[5.6284371283,43.6197747002],[5.6037150951,43.6205243441]]]]}},{"type":"Feature","properties":{"NOM":"KD64C7","NUMPOINTS":196.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6047432571,43.6384849812],[5.6057720662,43.656445853],[5.6305096336,43.6556957124],[5.629473055,43.637735089],[5.6047432571,43.6384849812]]]]}},{"type":"Feature","properties":{"NOM":"KD64C8","NUMPOINTS":69.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6057720662,43.656445853],[5.6068015231,43.6744069578],[5.6315468649,43.6736565687],[5.6305096336,43.6556957124],[5.6057720662,43.656445853]]]]}},{"type":"Feature","properties":{"NOM":"KD60D0","NUMPOINTS":37.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6017292928,43.152893385],[5.6027484001,43.1708470101],[5.6272774115,43.170097955],[5.6262506604,43.152144573],[5.6017292928,43.152893385]]]]}},{"type":"Feature","properties":{"NOM":"KD60D1","NUMPOINTS":219.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6027484001,43.1708470101],[5.603768144,43.1888009134],[5.628304804,43.1880516152],[5.6272774115,43.170097955],[5.6027484001,43.1708470101]]]]}},{"type":"Feature","properties":{"NOM":"KD60D2","NUMPOINTS":431.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.603768144,43.1888009134],[5.6047885179,43.2067551015],[5.6293328344,43.2060055593],[5.628304804,43.1880516152],[5.603768144,43.1888009134]]]]}},{"type":"Feature","properties":{"NOM":"KD60D3","NUMPOINTS":215.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6047885179,43.2067551015],[5.6058095183,43.2247095781],[5.6303614994,43.2239597928],[5.6293328344,43.2060055593],[5.6047885179,43.2067551015]]]]}},{"type":"Feature","properties":{"NOM":"KD60D4","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6058095183,43.2247095781],[5.6068311576,43.242664328],[5.6313908083,43.2419142995],[5.6303614994,43.2239597928],[5.6058095183,43.2247095781]]]]}},{"type":"Feature","properties":{"NOM":"KD60D5","NUMPOINTS":110.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6068311576,43.242664328],[5.6078534364,43.2606193496],[5.6324207614,43.2598690778],[5.6313908083,43.2419142995],[5.6068311576,43.242664328]]]]}},{"type":"Feature","properties":{"NOM":"KD60D6","NUMPOINTS":64.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6078534364,43.2606193496],[5.6088763555,43.2785746411],[5.6334513595,43.277824126],[5.6324207614,43.2598690778],[5.6078534364,43.2606193496]]]]}},{"type":"Feature","properties":{"NOM":"KD60D7","NUMPOINTS":373.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6088763555,43.2785746411],[5.6098999152,43.296530201],[5.6344826032,43.2957794425],[5.6334513595,43.277824126],[5.6088763555,43.2785746411]]]]}},{"type":"Feature","properties":{"NOM":"KD60D8","NUMPOINTS":264.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6098999152,43.296530201],[5.610924173,43.3144860271],[5.6355145407,43.3137350187],[5.6344826032,43.2957794425],[5.6098999152,43.296530201]]]]}},{"type":"Feature","properties":{"NOM":"KD60D9","NUMPOINTS":124.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.610924173,43.3144860271],[5.6119490859,43.3324421174],[5.6365471391,43.3316908571],[5.6355145407,43.3137350187],[5.610924173,43.3144860271]]]]}},{"type":"Feature","properties":{"NOM":"KD62D0","NUMPOINTS":184.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6119490859,43.3324421174],[5.6129746406,43.3503984704],[5.6375803842,43.3496469581],[5.6365471391,43.3316908571],[5.6119490859,43.3324421174]]]]}},{"type":"Feature","properties":{"NOM":"KD62D1","NUMPOINTS":281.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6129746406,43.3503984704],[5.6140008379,43.3683550843],[5.6386142767,43.36760332],[5.6375803842,43.3496469581],[5.6129746406,43.3503984704]]]]}},{"type":"Feature","properties":{"NOM":"KD62D2","NUMPOINTS":187.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6140008379,43.3683550843],[5.6150276784,43.3863119576],[5.6396488172,43.3855599411],[5.6386142767,43.36760332],[5.6140008379,43.3683550843]]]]}},{"type":"Feature","properties":{"NOM":"KD62D3","NUMPOINTS":140.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6150276784,43.3863119576],[5.6160551978,43.4042690966],[5.6406840306,43.4035168265],[5.6396488172,43.3855599411],[5.6150276784,43.3863119576]]]]}},{"type":"Feature","properties":{"NOM":"KD62D4","NUMPOINTS":26.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6160551978,43.4042690966],[5.6170834734,43.4222265172],[5.6417199922,43.4214739956],[5.6406840306,43.4035168265],[5.6160551978,43.4042690966]]]]}},{"type":"Feature","properties":{"NOM":"KD62D5","NUMPOINTS":50.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6170834734,43.4222265172],[5.618112392,43.4401841922],[5.6427566017,43.4394314191],[5.6417199922,43.4214739956],[5.6170834734,43.4222265172]]]]}},{"type":"Feature","properties":{"NOM":"KD62D6","NUMPOINTS":295.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.618112392,43.4401841922],[5.6191419543,43.4581421199],[5.6437938598,43.4573890952],[5.6427566017,43.4394314191],[5.618112392,43.4401841922]]]]}},{"type":"Feature","properties":{"NOM":"KD62D7","NUMPOINTS":224.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6191419543,43.4581421199],[5.6201721609,43.4761002988],[5.6448317669,43.4753470223],[5.6437938598,43.4573890952],[5.6191419543,43.4581421199]]]]}},{"type":"Feature","properties":{"NOM":"KD62D8","NUMPOINTS":311.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6201721609,43.4761002988],[5.6212030124,43.494058727],[5.6458703237,43.4933051986],[5.6448317669,43.4753470223],[5.6201721609,43.4761002988]]]]}},{"type":"Feature","properties":{"NOM":"KD62D9","NUMPOINTS":167.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6212030124,43.494058727],[5.62223453,43.5120174155],[5.646909547,43.5112636345],[5.6458703237,43.4933051986],[5.6212030124,43.494058727]]]]}},{"type":"Feature","properties":{"NOM":"KD64D0","NUMPOINTS":75.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.62223453,43.5120174155],[5.6232667035,43.5299763564],[5.6479494306,43.5292223233],[5.646909547,43.5112636345],[5.62223453,43.5120174155]]]]}},{"type":"Feature","properties":{"NOM":"KD64D1","NUMPOINTS":24.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6232667035,43.5299763564],[5.6242995233,43.5479355416],[5.6489899653,43.5471812564],[5.6479494306,43.5292223233],[5.6232667035,43.5299763564]]]]}},{"type":"Feature","properties":{"NOM":"KD64D2","NUMPOINTS":49.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6242995233,43.5479355416],[5.6253329901,43.5658949696],[5.6500311517,43.5651404321],[5.6489899653,43.5471812564],[5.6242995233,43.5479355416]]]]}},{"type":"Feature","properties":{"NOM":"KD64D3","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6253329901,43.5658949696],[5.6263671045,43.5838546386],[5.6510729905,43.5830998488],[5.6500311517,43.5651404321],[5.6253329901,43.5658949696]]]]}},{"type":"Feature","properties":{"NOM":"KD64D4","NUMPOINTS":82.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6263671045,43.5838546386],[5.6274018531,43.6018145476],[5.6521154757,43.6010595053],[5.6510729905,43.5830998488],[5.6263671045,43.5838546386]]]]}},{"type":"Feature","properties":{"NOM":"KD64D5","NUMPOINTS":156.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6274018531,43.6018145476],[5.6284371283,43.6197747002],[5.6531585101,43.6190194079],[5.6521154757,43.6010595053],[5.6274018531,43.6018145476]]]]}},{"type":"Feature","properties":{"NOM":"KD64D6","NUMPOINTS":212.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6284371283,43.6197747002],[5.629473055,43.637735089],[5.6542022008,43.6369795466],[5.6531585101,43.6190194079],[5.6284371283,43.6197747002]]]]}},{"type":"Feature","properties":{"NOM":"KD64D7","NUMPOINTS":59.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.629473055,43.637735089],[5.6305096336,43.6556957124],[5.6552465483,43.6549399198],[5.6542022008,43.6369795466],[5.629473055,43.637735089]]]]}},{"type":"Feature","properties":{"NOM":"KD64D8","NUMPOINTS":70.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6305096336,43.6556957124],[5.6315468649,43.6736565687],[5.6562915534,43.6729005258],[5.6552465483,43.6549399198],[5.6305096336,43.6556957124]]]]}},{"type":"Feature","properties":{"NOM":"KD64D9","NUMPOINTS":39.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6315468649,43.6736565687],[5.6325847494,43.6916176563],[5.6573372165,43.6908613629],[5.6562915534,43.6729005258],[5.6315468649,43.6736565687]]]]}},{"type":"Feature","properties":{"NOM":"KD60E1","NUMPOINTS":6.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6272774115,43.170097955],[5.628304804,43.1880516152],[5.6528408221,43.1872967126],[5.6518057815,43.1693432974],[5.6272774115,43.170097955]]]]}},{"type":"Feature","properties":{"NOM":"KD60E2","NUMPOINTS":401.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.628304804,43.1880516152],[5.6293328344,43.2060055593],[5.6538765077,43.2052504107],[5.6528408221,43.1872967126],[5.628304804,43.1880516152]]]]}},{"type":"Feature","properties":{"NOM":"KD60E3","NUMPOINTS":254.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6293328344,43.2060055593],[5.6303614994,43.2239597928],[5.6549128369,43.2232043993],[5.6538765077,43.2052504107],[5.6293328344,43.2060055593]]]]}},{"type":"Feature","properties":{"NOM":"KD60E4","NUMPOINTS":24.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6303614994,43.2239597928],[5.6313908083,43.2419142995],[5.6559498146,43.241158661],[5.6549128369,43.2232043993],[5.6303614994,43.2239597928]]]]}},{"type":"Feature","properties":{"NOM":"KD60E5","NUMPOINTS":72.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6313908083,43.2419142995],[5.6324207614,43.2598690778],[5.6569874414,43.2591131942],[5.6559498146,43.241158661],[5.6313908083,43.2419142995]]]]}},{"type":"Feature","properties":{"NOM":"KD60E6","NUMPOINTS":95.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6324207614,43.2598690778],[5.6334513595,43.277824126],[5.658025718,43.2770679973],[5.6569874414,43.2591131942],[5.6324207614,43.2598690778]]]]}},{"type":"Feature","properties":{"NOM":"KD60E7","NUMPOINTS":37.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6334513595,43.277824126],[5.6344826032,43.2957794425],[5.6590646449,43.2950230685],[5.658025718,43.2770679973],[5.6334513595,43.277824126]]]]}},{"type":"Feature","properties":{"NOM":"KD60E8","NUMPOINTS":20.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6344826032,43.2957794425],[5.6355145407,43.3137350187],[5.6601042622,43.3129783937],[5.6590646449,43.2950230685],[5.6344826032,43.2957794425]]]]}},{"type":"Feature","properties":{"NOM":"KD60E9","NUMPOINTS":26.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6355145407,43.3137350187],[5.6365471391,43.3316908571],[5.6611445456,43.3309339784],[5.6601042622,43.3129783937],[5.6355145407,43.3137350187]]]]}},{"type":"Feature","properties":{"NOM":"KD62E0","NUMPOINTS":61.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6365471391,43.3316908571],[5.6375803842,43.3496469581],[5.6621854805,43.3488898255],[5.6611445456,43.3309339784],[5.6365471391,43.3316908571]]]]}},{"type":"Feature","properties":{"NOM":"KD62E1","NUMPOINTS":259.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6375803842,43.3496469581],[5.6386142767,43.36760332],[5.6632270675,43.3668459335],[5.6621854805,43.3488898255],[5.6375803842,43.3496469581]]]]}},{"type":"Feature","properties":{"NOM":"KD62E2","NUMPOINTS":386.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6386142767,43.36760332],[5.6396488172,43.3855599411],[5.6642693074,43.3848023006],[5.6632270675,43.3668459335],[5.6386142767,43.36760332]]]]}},{"type":"Feature","properties":{"NOM":"KD62E3","NUMPOINTS":80.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6396488172,43.3855599411],[5.6406840306,43.4035168265],[5.6653122161,43.4027589306],[5.6642693074,43.3848023006],[5.6396488172,43.3855599411]]]]}},{"type":"Feature","properties":{"NOM":"KD62E4","NUMPOINTS":50.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6406840306,43.4035168265],[5.6417199922,43.4214739956],[5.6663558633,43.4207158464],[5.6653122161,43.4027589306],[5.6406840306,43.4035168265]]]]}},{"type":"Feature","properties":{"NOM":"KD62E5","NUMPOINTS":43.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6417199922,43.4214739956],[5.6427566017,43.4394314191],[5.6674001631,43.4386730164],[5.6663558633,43.4207158464],[5.6417199922,43.4214739956]]]]}},{"type":"Feature","properties":{"NOM":"KD62E6","NUMPOINTS":389.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6427566017,43.4394314191],[5.6437938598,43.4573890952],[5.6684451162,43.456630439],[5.6674001631,43.4386730164],[5.6427566017,43.4394314191]]]]}},{"type":"Feature","properties":{"NOM":"KD62E7","NUMPOINTS":190.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6437938598,43.4573890952],[5.6448317669,43.4753470223],[5.6694907232,43.4745881125],[5.6684451162,43.456630439],[5.6437938598,43.4573890952]]]]}},{"type":"Feature","properties":{"NOM":"KD62E8","NUMPOINTS":221.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6448317669,43.4753470223],[5.6458703237,43.4933051986],[5.6705369847,43.4925460352],[5.6694907232,43.4745881125],[5.6448317669,43.4753470223]]]]}},{"type":"Feature","properties":{"NOM":"KD62E9","NUMPOINTS":157.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6458703237,43.4933051986],[5.646909547,43.5112636345],[5.6715839136,43.5105042165],[5.6705369847,43.4925460352],[5.6458703237,43.4933051986]]]]}},{"type":"Feature","properties":{"NOM":"KD64E0","NUMPOINTS":250.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.646909547,43.5112636345],[5.6479494306,43.5292223233],[5.6726315066,43.5284626514],[5.6715839136,43.5105042165],[5.646909547,43.5112636345]]]]}},{"type":"Feature","properties":{"NOM":"KD64E1","NUMPOINTS":22.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6479494306,43.5292223233],[5.6489899653,43.5471812564],[5.6736797555,43.5464213305],[5.6726315066,43.5284626514],[5.6479494306,43.5292223233]]]]}},{"type":"Feature","properties":{"NOM":"KD64E2","NUMPOINTS":46.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6489899653,43.5471812564],[5.6500311517,43.5651404321],[5.674728661,43.5643802522],[5.6736797555,43.5464213305],[5.6489899653,43.5471812564]]]]}},{"type":"Feature","properties":{"NOM":"KD64E3","NUMPOINTS":56.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6500311517,43.5651404321],[5.6510729905,43.5830998488],[5.6757782236,43.5823394148],[5.674728661,43.5643802522],[5.6500311517,43.5651404321]]]]}},{"type":"Feature","properties":{"NOM":"KD64E4","NUMPOINTS":114.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6510729905,43.5830998488],[5.6521154757,43.6010595053],[5.6768284427,43.6002988167],[5.6757782236,43.5823394148],[5.6510729905,43.5830998488]]]]}},{"type":"Feature","properties":{"NOM":"KD64E5","NUMPOINTS":125.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6521154757,43.6010595053],[5.6531585101,43.6190194079],[5.6778792356,43.6182584674],[5.6768284427,43.6002988167],[5.6521154757,43.6010595053]]]]}},{"type":"Feature","properties":{"NOM":"KD64E6","NUMPOINTS":96.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6531585101,43.6190194079],[5.6542022008,43.6369795466],[5.6789306897,43.6362183541],[5.6778792356,43.6182584674],[5.6531585101,43.6190194079]]]]}},{"type":"Feature","properties":{"NOM":"KD64E7","NUMPOINTS":173.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6542022008,43.6369795466],[5.6552465483,43.6549399198],[5.6799828055,43.6541784752],[5.6789306897,43.6362183541],[5.6542022008,43.6369795466]]]]}},{"type":"Feature","properties":{"NOM":"KD64E8","NUMPOINTS":88.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6552465483,43.6549399198],[5.6562915534,43.6729005258],[5.6810355837,43.672138829],[5.6799828055,43.6541784752],[5.6552465483,43.6549399198]]]]}},{"type":"Feature","properties":{"NOM":"KD64E9","NUMPOINTS":97.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6562915534,43.6729005258],[5.6573372165,43.6908613629],[5.6820890249,43.6900994139],[5.6810355837,43.672138829],[5.6562915534,43.6729005258]]]]}},{"type":"Feature","properties":{"NOM":"KD66E0","NUMPOINTS":172.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6573372165,43.6908613629],[5.6583835015,43.7088224271],[5.6831431011,43.7080602271],[5.6820890249,43.6900994139],[5.6573372165,43.6908613629]]]]}},{"type":"Feature","properties":{"NOM":"KD60F1","NUMPOINTS":161.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6518057815,43.1693432974],[5.6528408221,43.1872967126],[5.6773761934,43.1865362058],[5.6763335055,43.1685830374],[5.6518057815,43.1693432974]]]]}},{"type":"Feature","properties":{"NOM":"KD60F2","NUMPOINTS":213.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6528408221,43.1872967126],[5.6538765077,43.2052504107],[5.6784195331,43.2044896561],[5.6773761934,43.1865362058],[5.6528408221,43.1872967126]]]]}},{"type":"Feature","properties":{"NOM":"KD60F3","NUMPOINTS":48.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6538765077,43.2052504107],[5.6549128369,43.2232043993],[5.6794635258,43.2224433979],[5.6784195331,43.2044896561],[5.6538765077,43.2052504107]]]]}},{"type":"Feature","properties":{"NOM":"KD60F4","NUMPOINTS":41.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6549128369,43.2232043993],[5.6559498146,43.241158661],[5.6805081718,43.2403974128],[5.6794635258,43.2224433979],[5.6549128369,43.2232043993]]]]}},{"type":"Feature","properties":{"NOM":"KD60F5","NUMPOINTS":46.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6559498146,43.241158661],[5.6569874414,43.2591131942],[5.6815534717,43.2583516991],[5.6805081718,43.2403974128],[5.6559498146,43.241158661]]]]}},{"type":"Feature","properties":{"NOM":"KD60F6","NUMPOINTS":61.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6569874414,43.2591131942],[5.658025718,43.2770679973],[5.6825994262,43.2763062552],[5.6815534717,43.2583516991],[5.6569874414,43.2591131942]]]]}},{"type":"Feature","properties":{"NOM":"KD60F7","NUMPOINTS":32.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.658025718,43.2770679973],[5.6590646449,43.2950230685],[5.6836460358,43.2942610793],[5.6825994262,43.2763062552],[5.658025718,43.2770679973]]]]}},{"type":"Feature","properties":{"NOM":"KD60F8","NUMPOINTS":38.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6590646449,43.2950230685],[5.6601042622,43.3129783937],[5.6846933328,43.3122161524],[5.6836460358,43.2942610793],[5.6590646449,43.2950230685]]]]}},{"type":"Feature","properties":{"NOM":"KD60F9","NUMPOINTS":66.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6601042622,43.3129783937],[5.6611445456,43.3309339784],[5.6857413005,43.3301714814],[5.6846933328,43.3122161524],[5.6601042622,43.3129783937]]]]}},{"type":"Feature","properties":{"NOM":"KD62F0","NUMPOINTS":20.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6611445456,43.3309339784],[5.6621854805,43.3488898255],[5.6867899246,43.3481270729],[5.6857413005,43.3301714814],[5.6611445456,43.3309339784]]]]}},{"type":"Feature","properties":{"NOM":"KD62F1","NUMPOINTS":87.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6621854805,43.3488898255],[5.6632270675,43.3668459335],[5.6878392056,43.3660829251],[5.6867899246,43.3481270729],[5.6621854805,43.3488898255]]]]}},{"type":"Feature","properties":{"NOM":"KD62F2","NUMPOINTS":381.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6632270675,43.3668459335],[5.6642693074,43.3848023006],[5.6888891442,43.3840390363],[5.6878392056,43.3660829251],[5.6632270675,43.3668459335]]]]}},{"type":"Feature","properties":{"NOM":"KD62F3","NUMPOINTS":102.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6642693074,43.3848023006],[5.6653122161,43.4027589306],[5.6899397496,43.4019954089],[5.6888891442,43.3840390363],[5.6642693074,43.3848023006]]]]}},{"type":"Feature","properties":{"NOM":"KD62F4","NUMPOINTS":82.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6653122161,43.4027589306],[5.6663558633,43.4207158464],[5.6909910816,43.4199520696],[5.6899397496,43.4019954089],[5.6653122161,43.4027589306]]]]}},{"type":"Feature","properties":{"NOM":"KD62F5","NUMPOINTS":177.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6663558633,43.4207158464],[5.6674001631,43.4386730164],[5.6920430711,43.4379089844],[5.6909910816,43.4199520696],[5.6663558633,43.4207158464]]]]}},{"type":"Feature","properties":{"NOM":"KD62F6","NUMPOINTS":516.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6674001631,43.4386730164],[5.6684451162,43.456630439],[5.6930957187,43.4558661517],[5.6920430711,43.4379089844],[5.6674001631,43.4386730164]]]]}},{"type":"Feature","properties":{"NOM":"KD62F7","NUMPOINTS":197.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6684451162,43.456630439],[5.6694907232,43.4745881125],[5.694149025,43.4738235697],[5.6930957187,43.4558661517],[5.6684451162,43.456630439]]]]}},{"type":"Feature","properties":{"NOM":"KD62F8","NUMPOINTS":151.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6694907232,43.4745881125],[5.6705369847,43.4925460352],[5.6952029906,43.4917812369],[5.694149025,43.4738235697],[5.6694907232,43.4745881125]]]]}},{"type":"Feature","properties":{"NOM":"KD62F9","NUMPOINTS":133.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6705369847,43.4925460352],[5.6715839136,43.5105042165],[5.6962576248,43.5097391618],[5.6952029906,43.4917812369],[5.6705369847,43.4925460352]]]]}},{"type":"Feature","properties":{"NOM":"KD64F0","NUMPOINTS":309.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6715839136,43.5105042165],[5.6726315066,43.5284626514],[5.6973129266,43.527697341],[5.6962576248,43.5097391618],[5.6715839136,43.5105042165]]]]}},{"type":"Feature","properties":{"NOM":"KD64F1","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6726315066,43.5284626514],[5.6736797555,43.5464213305],[5.6983688891,43.5456557643],[5.6973129266,43.527697341],[5.6726315066,43.5284626514]]]]}},{"type":"Feature","properties":{"NOM":"KD64F2","NUMPOINTS":42.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6736797555,43.5464213305],[5.674728661,43.5643802522],[5.699425513,43.5636144301],[5.6983688891,43.5456557643],[5.6736797555,43.5464213305]]]]}},{"type":"Feature","properties":{"NOM":"KD64F3","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.674728661,43.5643802522],[5.6757782236,43.5823394148],[5.7004827998,43.581573337],[5.699425513,43.5636144301],[5.674728661,43.5643802522]]]]}},{"type":"Feature","properties":{"NOM":"KD64F4","NUMPOINTS":24.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6757782236,43.5823394148],[5.6768284427,43.6002988167],[5.7015407512,43.5995324832],[5.7004827998,43.581573337],[5.6757782236,43.5823394148]]]]}},{"type":"Feature","properties":{"NOM":"KD64F5","NUMPOINTS":125.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6768284427,43.6002988167],[5.6778792356,43.6182584674],[5.7025993063,43.6174918796],[5.7015407512,43.5995324832],[5.6768284427,43.6002988167]]]]}},{"type":"Feature","properties":{"NOM":"KD64F6","NUMPOINTS":93.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6778792356,43.6182584674],[5.6789306897,43.6362183541],[5.7036585258,43.6354515117],[5.7025993063,43.6174918796],[5.6778792356,43.6182584674]]]]}},{"type":"Feature","properties":{"NOM":"KD64F7","NUMPOINTS":39.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6789306897,43.6362183541],[5.6799828055,43.6541784752],[5.704718412,43.6534113776],[5.7036585258,43.6354515117],[5.6789306897,43.6362183541]]]]}},{"type":"Feature","properties":{"NOM":"KD64F8","NUMPOINTS":122.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6799828055,43.6541784752],[5.6810355837,43.672138829],[5.7057789654,43.6713714755],[5.704718412,43.6534113776],[5.6799828055,43.6541784752]]]]}},{"type":"Feature","properties":{"NOM":"KD64F9","NUMPOINTS":79.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6810355837,43.672138829],[5.6820890249,43.6900994139],[5.7068401868,43.6893318037],[5.7057789654,43.6713714755],[5.6810355837,43.672138829]]]]}},{"type":"Feature","properties":{"NOM":"KD66F0","NUMPOINTS":73.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6820890249,43.6900994139],[5.6831431011,43.7080602271],[5.7079020552,43.707292361],[5.7068401868,43.6893318037],[5.6820890249,43.6900994139]]]]}},{"type":"Feature","properties":{"NOM":"KD60G3","NUMPOINTS":52.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6784195331,43.2044896561],[5.6794635258,43.2224433979],[5.7040135507,43.2216767892],[5.7029618988,43.2037232965],[5.6784195331,43.2044896561]]]]}},{"type":"Feature","properties":{"NOM":"KD60G4","NUMPOINTS":62.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6794635258,43.2224433979],[5.6805081718,43.2403974128],[5.70506586,43.2396305543],[5.7040135507,43.2216767892],[5.6794635258,43.2224433979]]]]}},{"type":"Feature","properties":{"NOM":"KD60G5","NUMPOINTS":45.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6805081718,43.2403974128],[5.6815534717,43.2583516991],[5.7061188273,43.2575845904],[5.70506586,43.2396305543],[5.6805081718,43.2403974128]]]]}},{"type":"Feature","properties":{"NOM":"KD60G6","NUMPOINTS":200.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6815534717,43.2583516991],[5.6825994262,43.2763062552],[5.7071724533,43.2755388956],[5.7061188273,43.2575845904],[5.6815534717,43.2583516991]]]]}},{"type":"Feature","properties":{"NOM":"KD60G7","NUMPOINTS":88.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6825994262,43.2763062552],[5.6836460358,43.2942610793],[5.7082267386,43.2934934684],[5.7071724533,43.2755388956],[5.6825994262,43.2763062552]]]]}},{"type":"Feature","properties":{"NOM":"KD60G8","NUMPOINTS":16.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6836460358,43.2942610793],[5.6846933328,43.3122161524],[5.70928171,43.3114482889],[5.7082267386,43.2934934684],[5.6836460358,43.2942610793]]]]}},{"type":"Feature","properties":{"NOM":"KD60G9","NUMPOINTS":82.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6846933328,43.3122161524],[5.6857413005,43.3301714814],[5.7103373568,43.3294033635],[5.70928171,43.3114482889],[5.6846933328,43.3122161524]]]]}},{"type":"Feature","properties":{"NOM":"KD62G0","NUMPOINTS":42.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6857413005,43.3301714814],[5.6867899246,43.3481270729],[5.7113936647,43.3473587012],[5.7103373568,43.3294033635],[5.6857413005,43.3301714814]]]]}},{"type":"Feature","properties":{"NOM":"KD62G1","NUMPOINTS":17.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6867899246,43.3481270729],[5.6878392056,43.3660829251],[5.7124506342,43.3653143002],[5.7113936647,43.3473587012],[5.6867899246,43.3481270729]]]]}},{"type":"Feature","properties":{"NOM":"KD62G2","NUMPOINTS":219.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6878392056,43.3660829251],[5.6888891442,43.3840390363],[5.7135082661,43.383270159],[5.7124506342,43.3653143002],[5.6878392056,43.3660829251]]]]}},{"type":"Feature","properties":{"NOM":"KD62G3","NUMPOINTS":311.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6888891442,43.3840390363],[5.6899397496,43.4019954089],[5.7145665651,43.4012262781],[5.7135082661,43.383270159],[5.6888891442,43.3840390363]]]]}},{"type":"Feature","properties":{"NOM":"KD62G4","NUMPOINTS":77.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6899397496,43.4019954089],[5.6909910816,43.4199520696],[5.7156255857,43.4191826832],[5.7145665651,43.4012262781],[5.6899397496,43.4019954089]]]]}},{"type":"Feature","properties":{"NOM":"KD62G5","NUMPOINTS":96.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6909910816,43.4199520696],[5.6920430711,43.4379089844],[5.7166852698,43.4371393424],[5.7156255857,43.4191826832],[5.6909910816,43.4199520696]]]]}},{"type":"Feature","properties":{"NOM":"KD62G6","NUMPOINTS":414.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6920430711,43.4379089844],[5.6930957187,43.4558661517],[5.7177456179,43.455096254],[5.7166852698,43.4371393424],[5.6920430711,43.4379089844]]]]}},{"type":"Feature","properties":{"NOM":"KD62G7","NUMPOINTS":266.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6930957187,43.4558661517],[5.694149025,43.4738235697],[5.7188066307,43.4730534164],[5.7177456179,43.455096254],[5.6930957187,43.4558661517]]]]}},{"type":"Feature","properties":{"NOM":"KD62G8","NUMPOINTS":201.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.694149025,43.4738235697],[5.6952029906,43.4917812369],[5.7198683088,43.4910108279],[5.7188066307,43.4730534164],[5.694149025,43.4738235697]]]]}},{"type":"Feature","properties":{"NOM":"KD62G9","NUMPOINTS":137.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6952029906,43.4917812369],[5.6962576248,43.5097391618],[5.7209306592,43.5089684946],[5.7198683088,43.4910108279],[5.6952029906,43.4917812369]]]]}},{"type":"Feature","properties":{"NOM":"KD64G0","NUMPOINTS":228.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6962576248,43.5097391618],[5.6973129266,43.527697341],[5.7219936822,43.5269264147],[5.7209306592,43.5089684946],[5.6962576248,43.5097391618]]]]}},{"type":"Feature","properties":{"NOM":"KD64G1","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6973129266,43.527697341],[5.6983688891,43.5456557643],[5.7230573721,43.5448845786],[5.7219936822,43.5269264147],[5.6973129266,43.527697341]]]]}},{"type":"Feature","properties":{"NOM":"KD64G2","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.6983688891,43.5456557643],[5.699425513,43.5636144301],[5.7241217297,43.5628429846],[5.7230573721,43.5448845786],[5.6983688891,43.5456557643]]]]}},{"type":"Feature","properties":{"NOM":"KD64G7","NUMPOINTS":19.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7036585258,43.6354515117],[5.704718412,43.6534113776],[5.7294534006,43.6526386227],[5.7283857469,43.6346790194],[5.7036585258,43.6354515117]]]]}},{"type":"Feature","properties":{"NOM":"KD64G8","NUMPOINTS":12.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.704718412,43.6534113776],[5.7057789654,43.6713714755],[5.7305217264,43.6705984579],[5.7294534006,43.6526386227],[5.704718412,43.6534113776]]]]}},{"type":"Feature","properties":{"NOM":"KD64G9","NUMPOINTS":96.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7057789654,43.6713714755],[5.7068401868,43.6893318037],[5.731590725,43.6885585234],[5.7305217264,43.6705984579],[5.7057789654,43.6713714755]]]]}},{"type":"Feature","properties":{"NOM":"KD66G0","NUMPOINTS":99.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7068401868,43.6893318037],[5.7079020552,43.707292361],[5.7326603814,43.7065188191],[5.731590725,43.6885585234],[5.7068401868,43.6893318037]]]]}},{"type":"Feature","properties":{"NOM":"KD66G1","NUMPOINTS":45.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7079020552,43.707292361],[5.7089645619,43.7252531458],[5.7337306849,43.7244793447],[5.7326603814,43.7065188191],[5.7079020552,43.707292361]]]]}},{"type":"Feature","properties":{"NOM":"KD60H5","NUMPOINTS":52.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.70506586,43.2396305543],[5.7061188273,43.2575845904],[5.7306834629,43.256811864],[5.7296228313,43.2388580838],[5.70506586,43.2396305543]]]]}},{"type":"Feature","properties":{"NOM":"KD60H6","NUMPOINTS":110.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7061188273,43.2575845904],[5.7071724533,43.2755388956],[5.7317447579,43.2747659133],[5.7306834629,43.256811864],[5.7061188273,43.2575845904]]]]}},{"type":"Feature","properties":{"NOM":"KD60H7","NUMPOINTS":83.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7071724533,43.2755388956],[5.7082267386,43.2934934684],[5.7328067169,43.2927202301],[5.7317447579,43.2747659133],[5.7071724533,43.2755388956]]]]}},{"type":"Feature","properties":{"NOM":"KD60H8","NUMPOINTS":17.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7082267386,43.2934934684],[5.70928171,43.3114482889],[5.7338693644,43.310674799],[5.7328067169,43.2927202301],[5.7082267386,43.2934934684]]]]}},{"type":"Feature","properties":{"NOM":"KD60H9","NUMPOINTS":73.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.70928171,43.3114482889],[5.7103373568,43.3294033635],[5.7349326935,43.3286296231],[5.7338693644,43.310674799],[5.70928171,43.3114482889]]]]}},{"type":"Feature","properties":{"NOM":"KD62H4","NUMPOINTS":43.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7145665651,43.4012262781],[5.7156255857,43.4191826832],[5.7402593938,43.41840768],[5.7391926759,43.4004515332],[5.7145665651,43.4012262781]]]]}},{"type":"Feature","properties":{"NOM":"KD62H5","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7156255857,43.4191826832],[5.7166852698,43.4371393424],[5.7413267801,43.4363640807],[5.7402593938,43.41840768],[5.7156255857,43.4191826832]]]]}},{"type":"Feature","properties":{"NOM":"KD62H6","NUMPOINTS":100.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7166852698,43.4371393424],[5.7177456179,43.455096254],[5.7423948351,43.4543207337],[5.7413267801,43.4363640807],[5.7166852698,43.4371393424]]]]}},{"type":"Feature","properties":{"NOM":"KD62H7","NUMPOINTS":217.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7177456179,43.455096254],[5.7188066307,43.4730534164],[5.7434635597,43.4722776374],[5.7423948351,43.4543207337],[5.7177456179,43.455096254]]]]}},{"type":"Feature","properties":{"NOM":"KD64H2","NUMPOINTS":24.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7230573721,43.5448845786],[5.7241217297,43.5628429846],[5.7488172788,43.5620658981],[5.7477451884,43.5441077547],[5.7230573721,43.5448845786]]]]}},{"type":"Feature","properties":{"NOM":"KD64H7","NUMPOINTS":27.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7283857469,43.6346790194],[5.7294534006,43.6526386227],[5.754187717,43.6518602172],[5.7531122965,43.6339008784],[5.7283857469,43.6346790194]]]]}},{"type":"Feature","properties":{"NOM":"KD64H8","NUMPOINTS":52.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7294534006,43.6526386227],[5.7305217264,43.6705984579],[5.7552638146,43.6698197879],[5.754187717,43.6518602172],[5.7294534006,43.6526386227]]]]}},{"type":"Feature","properties":{"NOM":"KD64H9","NUMPOINTS":49.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7305217264,43.6705984579],[5.731590725,43.6885585234],[5.7563405898,43.6877795888],[5.7552638146,43.6698197879],[5.7305217264,43.6705984579]]]]}},{"type":"Feature","properties":{"NOM":"KD66H0","NUMPOINTS":116.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.731590725,43.6885585234],[5.7326603814,43.7065188191],[5.7574180326,43.7057396208],[5.7563405898,43.6877795888],[5.731590725,43.6885585234]]]]}},{"type":"Feature","properties":{"NOM":"KD66H1","NUMPOINTS":66.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7326603814,43.7065188191],[5.7337306849,43.7244793447],[5.7584961323,43.7236998853],[5.7574180326,43.7057396208],[5.7326603814,43.7065188191]]]]}},{"type":"Feature","properties":{"NOM":"KD66H2","NUMPOINTS":100.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7337306849,43.7244793447],[5.734801664,43.7424400959],[5.7595749125,43.7416603754],[5.7584961323,43.7236998853],[5.7337306849,43.7244793447]]]]}},{"type":"Feature","properties":{"NOM":"KD60K6","NUMPOINTS":61.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7306834629,43.256811864],[5.7317447579,43.2747659133],[5.7563163984,43.2739873188],[5.755247435,43.2560335272],[5.7306834629,43.256811864]]]]}},{"type":"Feature","properties":{"NOM":"KD60K7","NUMPOINTS":39.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7317447579,43.2747659133],[5.7328067169,43.2927202301],[5.7573860305,43.2919413777],[5.7563163984,43.2739873188],[5.7317447579,43.2747659133]]]]}},{"type":"Feature","properties":{"NOM":"KD60K8","NUMPOINTS":67.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7328067169,43.2927202301],[5.7338693644,43.310674799],[5.7584563537,43.3098956928],[5.7573860305,43.2919413777],[5.7328067169,43.2927202301]]]]}},{"type":"Feature","properties":{"NOM":"KD62K4","NUMPOINTS":23.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7391926759,43.4004515332],[5.7402593938,43.41840768],[5.7648925337,43.4176270499],[5.7638181199,43.3996711638],[5.7391926759,43.4004515332]]]]}},{"type":"Feature","properties":{"NOM":"KD62K5","NUMPOINTS":5.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7402593938,43.41840768],[5.7413267801,43.4363640807],[5.7659676215,43.4355831903],[5.7648925337,43.4176270499],[5.7402593938,43.41840768]]]]}},{"type":"Feature","properties":{"NOM":"KD62K6","NUMPOINTS":14.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7413267801,43.4363640807],[5.7423948351,43.4543207337],[5.7670433829,43.453539583],[5.7659676215,43.4355831903],[5.7413267801,43.4363640807]]]]}},{"type":"Feature","properties":{"NOM":"KD64K8","NUMPOINTS":35.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.754187717,43.6518602172],[5.7552638146,43.6698197879],[5.780005225,43.6690354657],[5.7789213564,43.6510761614],[5.754187717,43.6518602172]]]]}},{"type":"Feature","properties":{"NOM":"KD64K9","NUMPOINTS":45.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7552638146,43.6698197879],[5.7563405898,43.6877795888],[5.7810897761,43.6869950001],[5.780005225,43.6690354657],[5.7552638146,43.6698197879]]]]}},{"type":"Feature","properties":{"NOM":"KD66K0","NUMPOINTS":37.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7563405898,43.6877795888],[5.7574180326,43.7057396208],[5.782175004,43.7049547662],[5.7810897761,43.6869950001],[5.7563405898,43.6877795888]]]]}},{"type":"Feature","properties":{"NOM":"KD66K1","NUMPOINTS":73.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7574180326,43.7057396208],[5.7584961323,43.7236998853],[5.7832608993,43.7229147678],[5.782175004,43.7049547662],[5.7574180326,43.7057396208]]]]}},{"type":"Feature","properties":{"NOM":"KD66K2","NUMPOINTS":55.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7584961323,43.7236998853],[5.7595749125,43.7416603754],[5.7843474799,43.7408749949],[5.7832608993,43.7229147678],[5.7584961323,43.7236998853]]]]}},{"type":"Feature","properties":{"NOM":"KD60L6","NUMPOINTS":26.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.755247435,43.2560335272],[5.7563163984,43.2739873188],[5.7808873701,43.2732031123],[5.779810739,43.2552495803],[5.755247435,43.2560335272]]]]}},{"type":"Feature","properties":{"NOM":"KD60L7","NUMPOINTS":37.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7563163984,43.2739873188],[5.7573860305,43.2919413777],[5.7819646748,43.2911569115],[5.7808873701,43.2732031123],[5.7563163984,43.2739873188]]]]}},{"type":"Feature","properties":{"NOM":"KD62L4","NUMPOINTS":15.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7638181199,43.3996711638],[5.7648925337,43.4176270499],[5.7895250006,43.4168407934],[5.7884428921,43.3988851696],[5.7638181199,43.3996711638]]]]}},{"type":"Feature","properties":{"NOM":"KD62L5","NUMPOINTS":22.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7648925337,43.4176270499],[5.7659676215,43.4355831903],[5.7906077893,43.4347966716],[5.7895250006,43.4168407934],[5.7648925337,43.4176270499]]]]}},{"type":"Feature","properties":{"NOM":"KD64L8","NUMPOINTS":30.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7789213564,43.6510761614],[5.780005225,43.6690354657],[5.8047459652,43.6682454927],[5.8036543233,43.650286457],[5.7789213564,43.6510761614]]]]}},{"type":"Feature","properties":{"NOM":"KD64L9","NUMPOINTS":28.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.780005225,43.6690354657],[5.7810897761,43.6869950001],[5.8058382945,43.686204758],[5.8047459652,43.6682454927],[5.780005225,43.6690354657]]]]}},{"type":"Feature","properties":{"NOM":"KD66L0","NUMPOINTS":20.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.7810897761,43.6869950001],[5.782175004,43.7049547662],[5.8069313081,43.7041642549],[5.8058382945,43.686204758],[5.7810897761,43.6869950001]]]]}},{"type":"Feature","properties":{"NOM":"KD66L1","NUMPOINTS":47.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.782175004,43.7049547662],[5.7832608993,43.7229147678],[5.8080249976,43.7221239903],[5.8069313081,43.7041642549],[5.782175004,43.7049547662]]]]}},{"type":"Feature","properties":{"NOM":"KD84A9","NUMPOINTS":13.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.8047459652,43.6682454927],[5.8058382945,43.686204758],[5.8305861742,43.6854088637],[5.82948607,43.6674498728],[5.8047459652,43.6682454927]]]]}},{"type":"Feature","properties":{"NOM":"KD86A0","NUMPOINTS":32.0},"geometry":{"type":"MultiPolygon","coordinates":[[[[5.8058382945,43.686204758],[5.8069313081,43.7041642549],[5.8316869681,43.7033680861],[5.8305861742,43.6854088637],[5.8058382945,43.686204758]]]]}}]}
\ No newline at end of file
@@ -11,16 +11,16 @@ var wms_layers = [];
                 url: 'https://mt1.google.com/vt/lyrs=s&x={x}&y={y}&z={z}'
             })
         });
-var format_Point_counts_1 = new ol.format.GeoJSON();
-var features_Point_counts_1 = format_Point_counts_1.readFeatures(json_Point_counts_1, 
-            {dataProjection: 'EPSG:4326', featureProjection: 'EPSG:3857'});
-var jsonSource_Point_counts_1 = new ol.source.Vector({
-    attributions: ' ',
-});
-jsonSource_Point_counts_1.addFeatures(features_Point_counts_1);
-var lyr_Point_counts_1 = new ol.layer.Vector({
+// Both vector layers are Mapbox Vector Tiles served by the dashboard (/tiles/...),
+// so only the tiles in view are downloaded, simplified for the current zoom
+var lyr_Point_counts_1 = new ol.layer.VectorTile({
                 declutter: false,
-                source:jsonSource_Point_counts_1, 
+                source: new ol.source.VectorTile({
+                    attributions: ' ',
+                    format: new ol.format.MVT({featureClass: ol.Feature}),
+                    url: '/tiles/dfci/{z}/{x}/{y}.pbf',
+                    maxZoom: 14
+                }),
                 style: style_Point_counts_1,
                 popuplayertitle: "Point_counts",
                 interactive: true,
@@ -31,32 +31,43 @@ var lyr_Point_counts_1 = new ol.layer.Vector({
     <img src="styles/legend/Point_counts_1_3.png" /> 128 - 232<br />\
     <img src="styles/legend/Point_counts_1_4.png" /> 232 - 568<br />'
         });
-var format_COMMUNE_BR_unique_2 = new ol.format.GeoJSON();
-var features_COMMUNE_BR_unique_2 = format_COMMUNE_BR_unique_2.readFeatures(json_COMMUNE_BR_unique_2, 
-            {dataProjection: 'EPSG:4326', featureProjection: 'EPSG:3857'});
-var jsonSource_COMMUNE_BR_unique_2 = new ol.source.Vector({
-    attributions: ' ',
-});
-jsonSource_COMMUNE_BR_unique_2.addFeatures(features_COMMUNE_BR_unique_2);
-var lyr_COMMUNE_BR_unique_2 = new ol.layer.Vector({
+var lyr_COMMUNE_BR_unique_2 = new ol.layer.VectorTile({
                 declutter: false,
-                source:jsonSource_COMMUNE_BR_unique_2, 
+                source: new ol.source.VectorTile({
+                    attributions: ' ',
+                    format: new ol.format.MVT({featureClass: ol.Feature}),
+                    url: '/tiles/communes/{z}/{x}/{y}.pbf',
+                    maxZoom: 14
+                }),
                 style: style_COMMUNE_BR_unique_2,
                 popuplayertitle: "COMMUNE_BR_unique",
                 interactive: true,
                 title: '<img src="styles/legend/COMMUNE_BR_unique_2.png" /> COMMUNE_BR_unique'
             });
-var lyr_Typologiedesclimatsfranais_3 = new ol.layer.Image({
+// Feature search needs every commune at once: one point per commune is enough
+var jsonSource_COMMUNE_BR_search = new ol.source.Vector({
+    attributions: ' ',
+});
+fetch('/tiles/communes/search.json').then(function(response) {
+    return response.json();
+}).then(function(json) {
+    jsonSource_COMMUNE_BR_search.addFeatures(new ol.format.GeoJSON().readFeatures(json,
+            {dataProjection: 'EPSG:4326', featureProjection: 'EPSG:3857'}));
+});
+var lyr_COMMUNE_BR_search = new ol.layer.Vector({
+                source: jsonSource_COMMUNE_BR_search
+            });
+var lyr_Typologiedesclimatsfranais_3 = new ol.layer.Tile({
                             opacity: 1,
                             title: "Typologie des climats français",
                             
                             
-                            source: new ol.source.ImageStatic({
-                               url: "./layers/Typologiedesclimatsfranais_3.png",
+                            // XYZ pyramid built by raster_tiles.py: only the tiles in view are fetched
+                            extent: [-620985.841593, 5150243.688084, 960284.595006, 6644218.298817],
+                            source: new ol.source.XYZ({
+                                url: '/tiles/climate/{z}/{x}/{y}',
     attributions: ' ',
-                                projection: 'EPSG:3857',
-                                alwaysInRange: true,
-                                imageExtent: [-620985.841593, 5150243.688084, 960284.595006, 6644218.298817]
+                                maxZoom: 9
                             })
                         });
 
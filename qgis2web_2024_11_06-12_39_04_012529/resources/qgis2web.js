@@ -842,7 +842,7 @@ document.getElementsByClassName('gcd-gl-btn')[0].className += ' fa fa-search';
 //layer search
 
 var searchLayer = new SearchLayer({
-    layer: lyr_COMMUNE_BR_unique_2,
+    layer: lyr_COMMUNE_BR_search,
     colName: 'ID_GEOFLA',
     zoom: 10,
     collapsed: true,
@@ -0,0 +1,184 @@
+import argparse
+import functools
+import hashlib
+import io
+import json
+import math
+import os
+import shutil
+import threading
+import xml.etree.ElementTree as ET
+
+from atomic_files import replace_atomically
+from vector_tiles import WEB_MERCATOR_HALF_WORLD, tile_bounds
+
+# -------------------------------
+# Raster Tile Settings
+# -------------------------------
+# The climate typology overlay is cut into an XYZ pyramid once, so the map only
+# downloads the tiles in view at the resolution of the current zoom
+RASTER_TILE_DIR = os.environ.get('RASTER_TILE_DIR', 'raster_tiles')
+RASTER_TILE_FORMAT = os.environ.get('RASTER_TILE_FORMAT', 'webp')  # or 'png', for building and serving
+climate_raster_path = 'qgis2web_2024_11_06-12_39_04_012529/layers/Typologiedesclimatsfranais_3.png'
+
+TILE_SIZE = 256
+RASTER_MANIFEST = 'tiles.json'
+
+
+def read_geotransform(raster_path):
+    """Return the GDAL geotransform stored in the ``.aux.xml`` sidecar of a raster."""
+    root = ET.parse(raster_path + '.aux.xml').getroot()
+    return tuple(float(value) for value in root.find('GeoTransform').text.split(','))
+
+
+def native_zoom(pixel_size):
+    """Lowest zoom whose tiles are at least as detailed as the source pixels."""
+    return math.ceil(math.log2(2 * WEB_MERCATOR_HALF_WORLD / TILE_SIZE / pixel_size))
+
+
+def _tile_range(extent, z):
+    xmin, ymin, xmax, ymax = extent
+    size = 2 * WEB_MERCATOR_HALF_WORLD / 2 ** z
+    last = 2 ** z - 1
+    columns = range(max(int((xmin + WEB_MERCATOR_HALF_WORLD) // size), 0), min(int((xmax + WEB_MERCATOR_HALF_WORLD) // size), last) + 1)
+    rows = range(max(int((WEB_MERCATOR_HALF_WORLD - ymax) // size), 0), min(int((WEB_MERCATOR_HALF_WORLD - ymin) // size), last) + 1)
+    return columns, rows
+
+
+def _encode(tile, target, image_format):
+    if image_format == 'webp':
+        tile.save(target, 'WEBP', lossless=True, method=4)
+    else:
+        tile.save(target, 'PNG', optimize=True)
+
+
+def _save(tile, path, image_format):
+    if tile.getbbox() is None:  # fully transparent: the tile is left out
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    replace_atomically(lambda p: _encode(tile, p, image_format), path)
+    return True
+
+
+def _cut(source, geotransform, z, x, y):
+    # Resample the source pixels covered by one tile
+    from PIL import Image
+
+    x0, dx, _, y0, _, dy = geotransform
+    xmin, ymin, xmax, ymax = tile_bounds(z, x, y)
+    box = ((xmin - x0) / dx, (ymax - y0) / dy, (xmax - x0) / dx, (ymin - y0) / dy)
+    return source.transform((TILE_SIZE, TILE_SIZE), Image.Transform.EXTENT, box, Image.Resampling.BILINEAR)
+
+
+def build_raster_tiles(raster_path=climate_raster_path, directory=os.path.join(RASTER_TILE_DIR, 'climate'),
+                       image_format=RASTER_TILE_FORMAT, max_zoom=None):
+    """Cut an EPSG:3857 raster into ``<z>/<x>/<y>.<format>`` tiles and return the manifest.
+
+    The deepest level is resampled from the source; every lower level is
+    built from the four tiles below it. Nothing is rebuilt when the raster,
+    format and zoom range match the existing manifest.
+    """
+    with open(raster_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    geotransform = read_geotransform(raster_path)
+    x0, dx, _, y0, _, dy = geotransform
+    max_zoom = native_zoom(dx) if max_zoom is None else max_zoom
+
+    manifest_path = os.path.join(directory, RASTER_MANIFEST)
+    try:
+        with open(manifest_path) as f:
+            previous = json.load(f)
+        if (previous['sha256'], previous['format'], previous['max_zoom']) == (digest, image_format, max_zoom):
+            return previous
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+    shutil.rmtree(directory, ignore_errors=True)
+
+    from PIL import Image  # only building or cutting tiles needs Pillow
+
+    source = Image.open(raster_path).convert('RGBA')
+    extent = (x0, y0 + dy * source.height, x0 + dx * source.width, y0)
+
+    # Deepest level: resample the source pixels covered by each tile
+    level = {}
+    columns, rows = _tile_range(extent, max_zoom)
+    for x in columns:
+        for y in rows:
+            tile = _cut(source, geotransform, max_zoom, x, y)
+            if _save(tile, os.path.join(directory, str(max_zoom), str(x), f'{y}.{image_format}'), image_format):
+                level[(x, y)] = tile
+
+    # Lower levels: each tile is its four children halved
+    for z in range(max_zoom - 1, -1, -1):
+        parents = {}
+        for x, y in {(x // 2, y // 2) for x, y in level}:
+            mosaic = Image.new('RGBA', (2 * TILE_SIZE, 2 * TILE_SIZE))
+            for dx_child in (0, 1):
+                for dy_child in (0, 1):
+                    child = level.get((2 * x + dx_child, 2 * y + dy_child))
+                    if child is not None:
+                        mosaic.paste(child, (dx_child * TILE_SIZE, dy_child * TILE_SIZE))
+            tile = mosaic.resize((TILE_SIZE, TILE_SIZE), Image.Resampling.LANCZOS)
+            if _save(tile, os.path.join(directory, str(z), str(x), f'{y}.{image_format}'), image_format):
+                parents[(x, y)] = tile
+        level = parents
+
+    manifest = {'sha256': digest, 'format': image_format, 'min_zoom': 0, 'max_zoom': max_zoom, 'extent': extent}
+
+    def write(p):
+        with open(p, 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+    # Written last and atomically: a manifest only ever describes a complete pyramid
+    replace_atomically(write, manifest_path)
+    return manifest
+
+
+def pyramid_ready(directory=os.path.join(RASTER_TILE_DIR, 'climate')):
+    """Whether ``build_raster_tiles`` has completed a pyramid in ``directory``."""
+    return os.path.exists(os.path.join(directory, RASTER_MANIFEST))
+
+
+# -------------------------------
+# Tiles Before the Pyramid
+# -------------------------------
+# Cutting the pyramid takes about a minute: until it is done, the tiles in view
+# are cut from the source raster on request, so the overlay never goes missing
+_source_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _source(raster_path):
+    from PIL import Image
+
+    return Image.open(raster_path).convert('RGBA'), read_geotransform(raster_path)
+
+
+@functools.lru_cache(maxsize=256)
+def render_raster_tile(z, x, y, raster_path=climate_raster_path, image_format=RASTER_TILE_FORMAT):
+    """Return the encoded tile (z, x, y) cut from the source raster, or None when it is empty or too deep."""
+    with _source_lock:
+        source, geotransform = _source(raster_path)
+        if z > native_zoom(geotransform[1]):
+            return None
+        tile = _cut(source, geotransform, z, x, y)
+    if tile.getbbox() is None:
+        return None
+    buffer = io.BytesIO()
+    _encode(tile, buffer, image_format)
+    return buffer.getvalue()
+
+
+# -------------------------------
+# Command Line
+# -------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the XYZ tile pyramid of the climate typology overlay.")
+    parser.add_argument('--max-zoom', type=int, help="deepest zoom level (default: the raster's native resolution)")
+    args = parser.parse_args()
+
+    manifest = build_raster_tiles(max_zoom=args.max_zoom)
+    tiles = [os.path.join(root, name) for root, _, names in os.walk(os.path.join(RASTER_TILE_DIR, 'climate'))
+             for name in names if name.endswith('.' + manifest['format'])]
+    print(f"{RASTER_TILE_DIR}/climate: zoom 0-{manifest['max_zoom']}, {len(tiles)} tiles, "
+          f"{sum(map(os.path.getsize, tiles)) / 1024:.0f} KB")
@@ -0,0 +1,200 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+try:
+    import brotli
+except ImportError:  # brotli is optional: gzip is served instead
+    brotli = None
+
+from atomic_files import replace_atomically
+
+# -------------------------------
+# Static Asset Settings
+# -------------------------------
+# The qgis2web bundle is served with content-hash ETags, precompressed
+# gzip / brotli variants and a per-worker LRU of the hottest files
+STATIC_CACHE_DIR = os.environ.get('STATIC_CACHE_DIR', 'static_cache')
+STATIC_MEMORY_MB = float(os.environ.get('STATIC_MEMORY_MB', 64))
+STATIC_MAX_AGE = int(os.environ.get('STATIC_MAX_AGE', 86400))
+
+# Images, fonts and the like are already compressed
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'application/xml', 'image/svg+xml')
+MIN_COMPRESS_BYTES = 1024
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+Asset = namedtuple('Asset', ['etag', 'mimetype', 'variants'])  # variants: {encoding or 'identity': path}
+
+
+def _compressible(mimetype, size):
+    return size >= MIN_COMPRESS_BYTES and mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+def _compress(encoding, data):
+    if encoding == 'br':
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def preferred_encoding(accept_encoding, variants):
+    """Return the best encoding of ``variants`` accepted by the client, or 'identity'."""
+    accepted = {}
+    for part in (accept_encoding or '').split(','):
+        name, _, params = part.strip().partition(';')
+        quality = params.strip()[2:] if params.strip().startswith('q=') else '1'
+        try:
+            accepted[name.strip().lower()] = float(quality)
+        except ValueError:
+            continue
+    for encoding in ENCODINGS:
+        if encoding in variants and accepted.get(encoding, accepted.get('*', 0)) > 0:
+            return encoding
+    return 'identity'
+
+
+class StaticAssets:
+    """Files of one directory with their ETag and compressed variants.
+
+    Compressed variants are written once to ``cache_directory``, named by the
+    content hash, so every gunicorn worker and every restart reuses them.
+    ``precompress()`` also saves the ETags there, so the other workers do not
+    hash the files again. File bodies are then kept in an LRU bounded by
+    ``memory_bytes``.
+    """
+
+    def __init__(self, directory, cache_directory=STATIC_CACHE_DIR, memory_bytes=STATIC_MEMORY_MB * 2 ** 20):
+        self.directory = os.path.abspath(directory)
+        self.cache_directory = cache_directory
+        self.memory_bytes = memory_bytes
+        self._assets = {}  # path -> ((size, mtime), Asset)
+        self._bodies = OrderedDict()  # (etag, encoding) -> bytes
+        self._body_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_directory, exist_ok=True)
+        digest = hashlib.sha256(self.directory.encode('utf-8')).hexdigest()[:16]
+        self._index_path = os.path.join(cache_directory, f'{digest}.index.json')
+        self._index = {}  # relative path -> [size, mtime, etag], saved by precompress()
+
+    def _resolve(self, path):
+        full_path = os.path.abspath(os.path.join(self.directory, path))
+        if not full_path.startswith(self.directory + os.sep) or not os.path.isfile(full_path):
+            return None
+        return full_path
+
+    def asset(self, path):
+        """Return the Asset of a file below the directory, or None if there is no such file."""
+        full_path = self._resolve(path)
+        if full_path is None:
+            return None
+        stat = os.stat(full_path)
+        version = (stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._assets.get(full_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        indexed = self._index.get(os.path.relpath(full_path, self.directory))
+        if indexed is not None and tuple(indexed[:2]) == version:
+            etag, data = indexed[2], None  # hashed by the worker that ran precompress()
+        else:
+            with open(full_path, 'rb') as f:
+                data = f.read()
+            etag = hashlib.sha256(data).hexdigest()[:32]
+        mimetype = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+        variants = {'identity': full_path}
+        if _compressible(mimetype, stat.st_size):
+            for encoding in ENCODINGS:
+                variant_path = os.path.join(self.cache_directory, f'{etag}.{encoding}')
+                if not os.path.exists(variant_path):
+                    if data is None:
+                        with open(full_path, 'rb') as f:
+                            data = f.read()
+                    compressed = _compress(encoding, data)
+
+                    def write(p):
+                        with open(p, 'wb') as f:
+                            f.write(compressed)
+
+                    replace_atomically(write, variant_path)
+                # Keep a variant only when it is actually smaller
+                if os.path.getsize(variant_path) < stat.st_size:
+                    variants[encoding] = variant_path
+
+        asset = Asset(etag, mimetype, variants)
+        with self._lock:
+            self._assets[full_path] = (version, asset)
+        return asset
+
+    def precompress(self):
+        """Build the ETag and compressed variants of every file, e.g. at startup, and save the ETags.
+
+        Meant to run under a lock shared by the workers (app.py takes the
+        snapshot lock): the first one hashes and compresses the files, the
+        next ones read its index and only check that the variants exist.
+        """
+        try:
+            with open(self._index_path, encoding='utf-8') as f:
+                self._index = json.load(f)
+        except (OSError, ValueError):
+            self._index = {}
+        index = {}
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                relative = os.path.relpath(os.path.join(root, name), self.directory)
+                asset = self.asset(relative)
+                if asset is not None:
+                    version, _ = self._assets[os.path.join(self.directory, relative)]
+                    index[relative] = [*version, asset.etag]
+        if index != self._index:
+            def write(p):
+                with open(p, 'w', encoding='utf-8') as f:
+                    json.dump(index, f)
+
+            replace_atomically(write, self._index_path)
+            self._index = index
+
+    def body(self, asset, encoding):
+        key = (asset.etag, encoding)
+        with self._lock:
+            data = self._bodies.get(key)
+            if data is not None:
+                self._bodies.move_to_end(key)
+                return data
+        with open(asset.variants[encoding], 'rb') as f:
+            data = f.read()
+        with self._lock:
+            if key not in self._bodies and len(data) <= self.memory_bytes:
+                self._bodies[key] = data
+                self._body_bytes += len(data)
+                while self._body_bytes > self.memory_bytes:
+                    _, evicted = self._bodies.popitem(last=False)
+                    self._body_bytes -= len(evicted)
+        return data
+
+    def response(self, path, request):
+        """Build the Flask response for ``path``: 304, 206 and content negotiation included."""
+        from flask import Response
+
+        asset = self.asset(path)
+        if asset is None:
+            return Response(status=404)
+        encoding = preferred_encoding(request.headers.get('Accept-Encoding'), asset.variants)
+
+        data = self.body(asset, encoding)
+        response = Response(data, mimetype=asset.mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        if len(asset.variants) > 1:
+            response.vary.add('Accept-Encoding')
+        # Each encoding is a different representation, so it gets its own ETag
+        response.set_etag(asset.etag if encoding == 'identity' else f'{asset.etag}-{encoding}')
+        response.cache_control.public = True
+        if asset.mimetype == 'text/html':
+            response.cache_control.no_cache = True  # the entry page is always revalidated (a cheap 304)
+        else:
+            response.cache_control.max_age = STATIC_MAX_AGE
+        return response.make_conditional(request, accept_ranges=True, complete_length=len(data))
@@ -0,0 +1,193 @@
+import numpy as np
+import pandas as pd
+
+from aggregates import EMPTY_CELL, SURFACE, CellStats
+
+# -------------------------------
+# Cumulative Daily Time Index
+# -------------------------------
+# The fires are summed per (commune, alert day) and laid out commune by commune
+# in day order, next to running totals of their counts and surfaces. The fires
+# of a commune between two days are the difference of two running totals found
+# with np.searchsorted, so any period costs a few lookups per commune instead
+# of a scan of the rows. Only the days with fires are stored.
+ALL_MONTHS = (1, 12)
+
+
+def _days(values):
+    # Days since 1970-01-01
+    return values.astype('datetime64[D]').astype('int64')
+
+
+def season_intervals(years, months=None):
+    """Return the ``[start, end)`` days of the months ``months`` (first, last) of every year of ``years`` (first, last).
+
+    A season spanning whole years is a single interval.
+    """
+    first_year, last_year = (int(year) for year in years)
+    first_month, last_month = (int(month) for month in (months or ALL_MONTHS))
+    if (first_month, last_month) == ALL_MONTHS:
+        starts = np.array([(first_year - 1970) * 12])
+        ends = np.array([(last_year + 1 - 1970) * 12])
+    else:
+        year = np.arange(first_year, last_year + 1)
+        starts = (year - 1970) * 12 + first_month - 1
+        ends = starts + last_month - first_month + 1
+    return _days(starts.astype('datetime64[M]')), _days(ends.astype('datetime64[M]'))
+
+
+def _month_intervals(years, months):
+    # One interval per month of the season, with its (year, month)
+    first_month, last_month = (int(month) for month in (months or ALL_MONTHS))
+    year, month = np.meshgrid(np.arange(int(years[0]), int(years[1]) + 1),
+                              np.arange(first_month, last_month + 1), indexing='ij')
+    year, month = year.ravel(), month.ravel()
+    starts = ((year - 1970) * 12 + month - 1).astype('datetime64[M]')
+    return year, month, _days(starts), _days(starts + 1)
+
+
+class _Runs:
+    """Per-row (commune or hour) day totals with their running sums, in (row, day) order."""
+
+    def __init__(self, rows, days, stride, **columns):
+        self.key = rows * stride + days
+        self.cumulative = {name: np.concatenate([[0], np.cumsum(values)]) for name, values in columns.items()}
+
+    def spans(self, rows, starts, ends, stride):
+        """Entry positions ``[low, high)`` of every (row, interval) pair, shape (rows, intervals)."""
+        base = np.asarray(rows)[:, None] * stride
+        return (np.searchsorted(self.key, base + starts[None, :], side='left'),
+                np.searchsorted(self.key, base + ends[None, :], side='left'))
+
+    def sums(self, name, low, high):
+        values = self.cumulative[name]
+        return values[high] - values[low]
+
+
+class TimeIndex:
+    """Period aggregates of the fires: counts and surfaces between any two days, per commune.
+
+    Periods are given as a (first, last) year range and a (first, last)
+    month range repeated every year; None means "all". ``communes`` is a
+    list of commune names, empty or None for the whole department. Distinct
+    alerts are counted per commune, so an alert timestamp shared by two
+    selected communes counts once for each.
+    """
+
+    def __init__(self, df):
+        surface = df[SURFACE].to_numpy(dtype='float64')
+        alerts = df['Alerte'].to_numpy()
+        days = _days(alerts)
+        codes = df['Commune'].cat.codes.to_numpy(dtype='int64')
+        present = np.unique(codes)
+        self.communes = pd.Index(df['Commune'].cat.categories[present].astype(str))
+        self._positions = {commune: i for i, commune in enumerate(self.communes)}
+        self._years = (int(df['Year'].min()), int(df['Year'].max())) if len(df) else None
+        self._year_dtype, self._month_dtype, self._hour_dtype = df['Year'].dtype, df['Month'].dtype, df['Hour'].dtype
+
+        # Days are stored from the first alert day; the whole department is one more row after the communes
+        self._first_day = int(days.min()) if len(df) else 0
+        self._stride = (int(days.max()) - self._first_day + 2) if len(df) else 1
+        self._department = len(self.communes)
+        frame = pd.DataFrame({
+            'row': np.searchsorted(present, codes),
+            'day': days - self._first_day,
+            'alert': alerts,
+            'surface': surface,
+            'hour': df['Hour'].to_numpy(dtype='int64'),
+        })
+        by_commune = self._day_totals(frame, ['row', 'day'])
+        by_department = self._day_totals(frame, ['day'])
+        by_department.insert(0, 'row', self._department)
+        totals = pd.concat([by_commune, by_department], ignore_index=True)
+        self._runs = _Runs(totals['row'].to_numpy(), totals['day'].to_numpy(), self._stride,
+                           count=totals['count'].to_numpy(), alerts=totals['alerts'].to_numpy(),
+                           total=totals['total'].to_numpy())
+        self._max = totals['max'].to_numpy()
+        self._min = totals['min'].to_numpy()
+
+        # Department-wide fire counts per (hour of the day, day), for the hourly trend
+        by_hour = frame.groupby(['hour', 'day'], sort=True).size().reset_index(name='count')
+        self._hours = _Runs(by_hour['hour'].to_numpy(), by_hour['day'].to_numpy(), self._stride,
+                            count=by_hour['count'].to_numpy())
+
+    @staticmethod
+    def _day_totals(frame, keys):
+        grouped = frame.groupby(keys, sort=True)
+        totals = grouped['surface'].agg(['size', 'sum', 'max', 'min'])
+        totals.columns = ['count', 'total', 'max', 'min']
+        totals['alerts'] = grouped['alert'].nunique()
+        return totals.reset_index()
+
+    # --- Selections ---
+    def _intervals(self, years, months):
+        years = years or self._years
+        if years is None:
+            return np.zeros(0, dtype='int64'), np.zeros(0, dtype='int64')
+        starts, ends = season_intervals(years, months)
+        # Clipped to the stored days, so an interval never reaches into the next row
+        return (np.clip(starts - self._first_day, 0, self._stride - 1),
+                np.clip(ends - self._first_day, 0, self._stride - 1))
+
+    def _rows(self, communes):
+        if not communes:
+            return np.array([self._department])
+        if isinstance(communes, str):
+            communes = [communes]
+        return np.array(sorted({self._positions[c] for c in communes if c in self._positions}), dtype='int64')
+
+    # --- Aggregates ---
+    def summary(self, years=None, months=None, communes=None):
+        """Return the CellStats of the fires of a period and communes."""
+        rows = self._rows(communes)
+        starts, ends = self._intervals(years, months)
+        low, high = self._runs.spans(rows, starts, ends, self._stride)
+        count = int(self._runs.sums('count', low, high).sum())
+        if not count:
+            return EMPTY_CELL
+        total = float(self._runs.sums('total', low, high).sum())
+
+        # Extremes do not sum: they are read from the stored days of the period
+        low, high = low[low < high], high[low < high]
+        lengths = high - low
+        positions = np.repeat(low - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        return CellStats(count, int(self._runs.sums('alerts', low, high).sum()), total,
+                         float(self._min[positions].min()), float(self._max[positions].max()), total / count)
+
+    def area_by_commune(self, years=None, months=None, communes=None):
+        """Return the burned surface (m²) of a period per commune with fires in it, in commune order."""
+        rows = self._rows(communes)
+        if len(rows) == 1 and rows[0] == self._department:
+            rows = np.arange(self._department)
+        starts, ends = self._intervals(years, months)
+        low, high = self._runs.spans(rows, starts, ends, self._stride)
+        counts = self._runs.sums('count', low, high).sum(axis=1)
+        totals = self._runs.sums('total', low, high).sum(axis=1)
+        return pd.Series(totals[counts > 0], index=self.communes[rows[counts > 0]], name='sum')
+
+    def monthly(self, years=None, months=None):
+        """Return the department's fire count of every month of a period that has fires, by (Year, Month)."""
+        year, month, starts, ends = _month_intervals(years or self._years or (0, -1), months)
+        counts = self._department_counts(starts, ends)
+        index = pd.MultiIndex.from_arrays([year.astype(self._year_dtype), month.astype(self._month_dtype)],
+                                          names=['Year', 'Month'])
+        return pd.Series(counts, index=index)[counts > 0]
+
+    def yearly(self, years=None, months=None):
+        """Return the department's fire count of every year of a period that has fires, by Year."""
+        monthly = self.monthly(years, months)
+        return monthly.groupby(level='Year').sum()
+
+    def hourly(self, years=None, months=None):
+        """Return the department's fire count of a period per hour of the day that has fires, by Hour."""
+        starts, ends = self._intervals(years, months)
+        low, high = self._hours.spans(np.arange(24), starts, ends, self._stride)
+        counts = self._hours.sums('count', low, high).sum(axis=1)
+        index = pd.Index(np.arange(24, dtype=self._hour_dtype), name='Hour')
+        return pd.Series(counts, index=index)[counts > 0]
+
+    def _department_counts(self, starts, ends):
+        starts = np.clip(starts - self._first_day, 0, self._stride - 1)
+        ends = np.clip(ends - self._first_day, 0, self._stride - 1)
+        low, high = self._runs.spans([self._department], starts, ends, self._stride)
+        return self._runs.sums('count', low, high)[0]
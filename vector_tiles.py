@@ -0,0 +1,299 @@
+import math
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import shapely
+
+from atomic_files import replace_atomically
+
+# -------------------------------
+# Vector Tile Settings
+# -------------------------------
+# Mapbox Vector Tiles (MVT 2.1) for the QGIS Mapping page: the browser only
+# fetches the tiles in view, each with geometry simplified for its zoom level
+VECTOR_TILE_DIR = os.environ.get('VECTOR_TILE_DIR', 'vector_tiles')
+VECTOR_TILE_MAX_ZOOM = int(os.environ.get('VECTOR_TILE_MAX_ZOOM', 14))
+VECTOR_TILE_MEMORY_ENTRIES = int(os.environ.get('VECTOR_TILE_MEMORY_ENTRIES', 1024))
+# Tiles of an older data version are removed once no worker has read or
+# written them for this long (seconds), well after every worker reloaded
+VECTOR_TILE_PRUNE_AFTER = float(os.environ.get('VECTOR_TILE_PRUNE_AFTER_S', 3600))
+# Bump whenever the encoder changes the tiles it writes
+VECTOR_TILE_FORMAT = 1
+
+EXTENT = 4096  # tile coordinates per tile side
+BUFFER = 64  # tile coordinates kept around each tile, so strokes are not cut at the edges
+WEB_MERCATOR_HALF_WORLD = 20037508.342789244
+
+
+def tile_bounds(z, x, y):
+    """Return the (xmin, ymin, xmax, ymax) EPSG:3857 bounds of an XYZ tile."""
+    size = 2 * WEB_MERCATOR_HALF_WORLD / 2 ** z
+    xmin = -WEB_MERCATOR_HALF_WORLD + x * size
+    ymax = WEB_MERCATOR_HALF_WORLD - y * size
+    return xmin, ymax - size, xmin + size, ymax
+
+
+# -------------------------------
+# Protocol Buffers Encoding
+# -------------------------------
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def _key(field, wire_type):
+    return _varint((field << 3) | wire_type)
+
+
+def _uint_field(field, value):
+    return _key(field, 0) + _varint(value)
+
+
+def _bytes_field(field, payload):
+    return _key(field, 2) + _varint(len(payload)) + payload
+
+
+def _packed_field(field, values):
+    return _bytes_field(field, b''.join(_varint(value) for value in values))
+
+
+def _value_message(value):
+    # Value message of the MVT spec: string = 1, double = 3, sint64 = 6, bool = 7
+    if isinstance(value, (bool, np.bool_)):
+        return _uint_field(7, int(value))
+    if isinstance(value, (int, np.integer)):
+        return _uint_field(6, _zigzag(int(value)))
+    if isinstance(value, (float, np.floating)):
+        return _key(3, 1) + np.float64(value).tobytes()
+    return _bytes_field(1, str(value).encode('utf-8'))
+
+
+# -------------------------------
+# Geometry Encoding
+# -------------------------------
+def _command(command_id, count):
+    return (command_id & 0x7) | (count << 3)
+
+
+def _ring_commands(ring, cursor, exterior):
+    # Closed rings repeat their first point; duplicates appear after rounding
+    points = ring[:-1]
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.any(points[1:] != points[:-1], axis=1)
+    points = points[keep]
+    if len(points) < 3:
+        return []
+
+    # Exterior rings have a positive area in tile coordinates (y pointing down)
+    area = np.sum(points[:, 0] * np.roll(points[:, 1], -1) - np.roll(points[:, 0], -1) * points[:, 1])
+    if area == 0:
+        return []
+    if (area > 0) != exterior:
+        points = points[::-1]
+
+    deltas = np.diff(np.vstack([cursor, points]), axis=0)
+    cursor[:] = points[-1]
+    commands = [_command(1, 1), _zigzag(int(deltas[0, 0])), _zigzag(int(deltas[0, 1])), _command(2, len(points) - 1)]
+    for dx, dy in deltas[1:]:
+        commands += [_zigzag(int(dx)), _zigzag(int(dy))]
+    commands.append(_command(7, 1))
+    return commands
+
+
+def _polygon_commands(geometry, cursor):
+    commands = []
+    for polygon in shapely.get_parts(geometry):
+        if shapely.get_type_id(polygon) != 3:  # clipping may leave lines or points behind
+            continue
+        exterior = _ring_commands(np.rint(shapely.get_coordinates(polygon.exterior)).astype('int64'), cursor, True)
+        if not exterior:
+            continue
+        commands += exterior
+        for interior in polygon.interiors:
+            commands += _ring_commands(np.rint(shapely.get_coordinates(interior)).astype('int64'), cursor, False)
+    return commands
+
+
+def _point_commands(geometry, cursor):
+    points = np.rint(shapely.get_coordinates(geometry)).astype('int64')
+    if not len(points):
+        return []
+    deltas = np.diff(np.vstack([cursor, points]), axis=0)
+    cursor[:] = points[-1]
+    return [_command(1, len(points))] + [_zigzag(int(d)) for d in deltas.ravel()]
+
+
+# -------------------------------
+# Tile Layers
+# -------------------------------
+class TileLayer:
+    """Polygon or point features, reprojected once and encoded into MVT layers on demand.
+
+    ``gdf`` may be in any CRS; every non-geometry column becomes a feature
+    property (missing values are left out).
+    """
+
+    def __init__(self, name, gdf):
+        self.name = name
+        gdf = gdf.to_crs(3857)
+        self.geometry = np.asarray(gdf.geometry.values, dtype=object)
+        self.geometry_type = 1 if shapely.get_type_id(self.geometry[0]) in (0, 4) else 3
+        self._tree = shapely.STRtree(self.geometry)
+        self.properties = [
+            {key: value for key, value in row.items() if not (isinstance(value, float) and math.isnan(value))}
+            for row in gdf.drop(columns='geometry').to_dict('records')
+        ]
+        self._levels = {}
+        self._lock = threading.Lock()
+
+    def simplified(self, z):
+        """Geometries simplified to half a tile coordinate at zoom ``z``."""
+        with self._lock:
+            geometry = self._levels.get(z)
+        if geometry is None:
+            tolerance = 2 * WEB_MERCATOR_HALF_WORLD / 2 ** z / EXTENT / 2
+            geometry = shapely.simplify(self.geometry, tolerance, preserve_topology=True)
+            with self._lock:
+                self._levels[z] = geometry
+        return geometry
+
+    def encode(self, z, x, y):
+        """Return the MVT layer message of one tile, or b'' when no feature reaches it."""
+        xmin, ymin, xmax, ymax = tile_bounds(z, x, y)
+        scale = EXTENT / (xmax - xmin)
+        margin = BUFFER / scale
+        positions = np.sort(self._tree.query(shapely.box(xmin - margin, ymin - margin, xmax + margin, ymax + margin)))
+        if not len(positions):
+            return b''
+
+        geometry = self.simplified(z)[positions] if self.geometry_type == 3 else self.geometry[positions]
+        if self.geometry_type == 3:
+            geometry = shapely.clip_by_rect(geometry, xmin - margin, ymin - margin, xmax + margin, ymax + margin)
+        geometry = shapely.transform(geometry, lambda c: np.column_stack([(c[:, 0] - xmin) * scale, (ymax - c[:, 1]) * scale]))
+
+        keys, values, features = {}, {}, []
+        for position, shape in zip(positions, geometry):
+            cursor = np.zeros(2, dtype='int64')
+            commands = _point_commands(shape, cursor) if self.geometry_type == 1 else _polygon_commands(shape, cursor)
+            if not commands:
+                continue
+            tags = []
+            for key, value in self.properties[position].items():
+                tags += [keys.setdefault(key, len(keys)), values.setdefault((type(value).__name__, value), len(values))]
+            features.append(_bytes_field(2, _uint_field(1, int(position) + 1) + _packed_field(2, tags)
+                                         + _uint_field(3, self.geometry_type) + _packed_field(4, commands)))
+        if not features:
+            return b''
+
+        return b''.join([
+            _uint_field(15, 2),
+            _bytes_field(1, self.name.encode('utf-8')),
+            *features,
+            *(_bytes_field(3, str(key).encode('utf-8')) for key in keys),
+            *(_bytes_field(4, _value_message(value)) for _, value in values),
+            _uint_field(5, EXTENT),
+        ])
+
+
+# -------------------------------
+# Tile Cache
+# -------------------------------
+def _namespace_directory(namespace):
+    return f"mvt{VECTOR_TILE_FORMAT}-{namespace}"
+
+
+def prune_namespaces(current, directory=VECTOR_TILE_DIR, grace=VECTOR_TILE_PRUNE_AFTER):
+    """Remove the tiles of every namespace but ``current`` that were not used for ``grace`` seconds.
+
+    Call it under the snapshot lock, so one worker prunes at a time. Returns
+    the names of the removed directories.
+    """
+    keep = {_namespace_directory(namespace) for namespace in current}
+    if not os.path.isdir(directory):
+        return []
+    cutoff = time.time() - grace
+    removed = []
+    for entry in os.scandir(directory):
+        if entry.name not in keep and entry.is_dir() and entry.stat().st_mtime < cutoff:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed.append(entry.name)
+    return removed
+
+
+class VectorTileCache:
+    """Encoded tiles of named layers, kept in a small LRU and on disk under ``namespace``.
+
+    ``layers`` maps a layer name to a function returning its TileLayer, only
+    called the first time a tile of that layer is asked for. The directory
+    of a namespace also carries VECTOR_TILE_FORMAT, and its mtime is bumped
+    by every disk read or write, for ``prune_namespaces``.
+    """
+
+    def __init__(self, namespace, layers, directory=VECTOR_TILE_DIR, max_zoom=VECTOR_TILE_MAX_ZOOM,
+                 memory_entries=VECTOR_TILE_MEMORY_ENTRIES):
+        self.namespace = namespace
+        self.directory = os.path.join(directory, _namespace_directory(namespace))
+        self.max_zoom = max_zoom
+        self.memory_entries = memory_entries
+        self._factories = layers
+        self._layers = {}
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def layer(self, name):
+        with self._lock:
+            layer = self._layers.get(name)
+        if layer is None:
+            layer = self._factories[name]()
+            with self._lock:
+                layer = self._layers.setdefault(name, layer)
+        return layer
+
+    def tile(self, name, z, x, y):
+        """Return the MVT bytes of one tile, or None for an unknown layer or tile."""
+        if name not in self._factories or not 0 <= z <= self.max_zoom or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+            return None
+        key = (name, z, x, y)
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                return payload
+
+        path = os.path.join(self.directory, name, str(z), str(x), f'{y}.pbf')
+        os.makedirs(self.directory, exist_ok=True)
+        os.utime(self.directory)  # still in use: not pruned
+        try:
+            with open(path, 'rb') as f:
+                payload = f.read()
+        except FileNotFoundError:
+            message = self.layer(name).encode(z, x, y)
+            payload = _bytes_field(3, message) if message else b''  # a tile without features is empty
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            def write(p):
+                with open(p, 'wb') as f:
+                    f.write(payload)
+
+            replace_atomically(write, path)
+
+        with self._lock:
+            self._memory[key] = payload
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+        return payload